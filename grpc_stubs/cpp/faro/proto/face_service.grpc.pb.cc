@@ -24,17 +24,24 @@ static const char* FaceRecognition_method_names[] = {
   "/FaceRecognition/detect",
   "/FaceRecognition/extract",
   "/FaceRecognition/score",
+  "/FaceRecognition/scoreStream",
   "/FaceRecognition/enroll",
+  "/FaceRecognition/bulkEnroll",
   "/FaceRecognition/search",
   "/FaceRecognition/detectExtract",
   "/FaceRecognition/detectExtractEnroll",
   "/FaceRecognition/detectExtractSearch",
   "/FaceRecognition/galleryList",
   "/FaceRecognition/galleryDelete",
+  "/FaceRecognition/galleryConfigure",
+  "/FaceRecognition/galleryCompact",
+  "/FaceRecognition/galleryExport",
+  "/FaceRecognition/galleryImport",
   "/FaceRecognition/enrollmentList",
-  "/FaceRecognition/enrollmentDelete",
-  "/FaceRecognition/enrollmentDeleteConditional",
-  "/FaceRecognition/enrollmentTransfer",
+  "/FaceRecognition/trainFromGallery",
+  "/FaceRecognition/subjectDelete",
+  "/FaceRecognition/generateMatchDistribution",
+  "/FaceRecognition/matchDistribution",
   "/FaceRecognition/echo",
 };
 
@@ -49,18 +56,25 @@ FaceRecognition::Stub::Stub(const std::shared_ptr< ::grpc::ChannelInterface>& ch
   , rpcmethod_detect_(FaceRecognition_method_names[1], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   , rpcmethod_extract_(FaceRecognition_method_names[2], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   , rpcmethod_score_(FaceRecognition_method_names[3], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_enroll_(FaceRecognition_method_names[4], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_search_(FaceRecognition_method_names[5], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_detectExtract_(FaceRecognition_method_names[6], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_detectExtractEnroll_(FaceRecognition_method_names[7], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_detectExtractSearch_(FaceRecognition_method_names[8], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_galleryList_(FaceRecognition_method_names[9], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_galleryDelete_(FaceRecognition_method_names[10], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_enrollmentList_(FaceRecognition_method_names[11], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_enrollmentDelete_(FaceRecognition_method_names[12], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_enrollmentDeleteConditional_(FaceRecognition_method_names[13], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_enrollmentTransfer_(FaceRecognition_method_names[14], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
-  , rpcmethod_echo_(FaceRecognition_method_names[15], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_scoreStream_(FaceRecognition_method_names[4], ::grpc::internal::RpcMethod::SERVER_STREAMING, channel)
+  , rpcmethod_enroll_(FaceRecognition_method_names[5], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_bulkEnroll_(FaceRecognition_method_names[6], ::grpc::internal::RpcMethod::CLIENT_STREAMING, channel)
+  , rpcmethod_search_(FaceRecognition_method_names[7], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_detectExtract_(FaceRecognition_method_names[8], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_detectExtractEnroll_(FaceRecognition_method_names[9], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_detectExtractSearch_(FaceRecognition_method_names[10], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_galleryList_(FaceRecognition_method_names[11], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_galleryDelete_(FaceRecognition_method_names[12], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_galleryConfigure_(FaceRecognition_method_names[13], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_galleryCompact_(FaceRecognition_method_names[14], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_galleryExport_(FaceRecognition_method_names[15], ::grpc::internal::RpcMethod::SERVER_STREAMING, channel)
+  , rpcmethod_galleryImport_(FaceRecognition_method_names[16], ::grpc::internal::RpcMethod::BIDI_STREAMING, channel)
+  , rpcmethod_enrollmentList_(FaceRecognition_method_names[17], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_trainFromGallery_(FaceRecognition_method_names[18], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_subjectDelete_(FaceRecognition_method_names[19], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_generateMatchDistribution_(FaceRecognition_method_names[20], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_matchDistribution_(FaceRecognition_method_names[21], ::grpc::internal::RpcMethod::SERVER_STREAMING, channel)
+  , rpcmethod_echo_(FaceRecognition_method_names[22], ::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   {}
 
 ::grpc::Status FaceRecognition::Stub::status(::grpc::ClientContext* context, const ::FaceStatusRequest& request, ::FaceServiceInfo* response) {
@@ -175,6 +189,22 @@ void FaceRecognition::Stub::experimental_async::score(::grpc::ClientContext* con
   return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Matrix>::Create(channel_.get(), cq, rpcmethod_score_, context, request, false);
 }
 
+::grpc::ClientReader< ::ScoreBlock>* FaceRecognition::Stub::scoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request) {
+  return ::grpc_impl::internal::ClientReaderFactory< ::ScoreBlock>::Create(channel_.get(), rpcmethod_scoreStream_, context, request);
+}
+
+void FaceRecognition::Stub::experimental_async::scoreStream(::grpc::ClientContext* context, ::ScoreRequest* request, ::grpc::experimental::ClientReadReactor< ::ScoreBlock>* reactor) {
+  ::grpc_impl::internal::ClientCallbackReaderFactory< ::ScoreBlock>::Create(stub_->channel_.get(), stub_->rpcmethod_scoreStream_, context, request, reactor);
+}
+
+::grpc::ClientAsyncReader< ::ScoreBlock>* FaceRecognition::Stub::AsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::ScoreBlock>::Create(channel_.get(), cq, rpcmethod_scoreStream_, context, request, true, tag);
+}
+
+::grpc::ClientAsyncReader< ::ScoreBlock>* FaceRecognition::Stub::PrepareAsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::ScoreBlock>::Create(channel_.get(), cq, rpcmethod_scoreStream_, context, request, false, nullptr);
+}
+
 ::grpc::Status FaceRecognition::Stub::enroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::FaceRecordList* response) {
   return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_enroll_, context, request, response);
 }
@@ -203,6 +233,22 @@ void FaceRecognition::Stub::experimental_async::enroll(::grpc::ClientContext* co
   return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enroll_, context, request, false);
 }
 
+::grpc::ClientWriter< ::EnrollRequest>* FaceRecognition::Stub::bulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response) {
+  return ::grpc_impl::internal::ClientWriterFactory< ::EnrollRequest>::Create(channel_.get(), rpcmethod_bulkEnroll_, context, response);
+}
+
+void FaceRecognition::Stub::experimental_async::bulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::experimental::ClientWriteReactor< ::EnrollRequest>* reactor) {
+  ::grpc_impl::internal::ClientCallbackWriterFactory< ::EnrollRequest>::Create(stub_->channel_.get(), stub_->rpcmethod_bulkEnroll_, context, response, reactor);
+}
+
+::grpc::ClientAsyncWriter< ::EnrollRequest>* FaceRecognition::Stub::AsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc_impl::internal::ClientAsyncWriterFactory< ::EnrollRequest>::Create(channel_.get(), cq, rpcmethod_bulkEnroll_, context, response, true, tag);
+}
+
+::grpc::ClientAsyncWriter< ::EnrollRequest>* FaceRecognition::Stub::PrepareAsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncWriterFactory< ::EnrollRequest>::Create(channel_.get(), cq, rpcmethod_bulkEnroll_, context, response, false, nullptr);
+}
+
 ::grpc::Status FaceRecognition::Stub::search(::grpc::ClientContext* context, const ::SearchRequest& request, ::FaceRecordList* response) {
   return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_search_, context, request, response);
 }
@@ -371,6 +417,94 @@ void FaceRecognition::Stub::experimental_async::galleryDelete(::grpc::ClientCont
   return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Empty>::Create(channel_.get(), cq, rpcmethod_galleryDelete_, context, request, false);
 }
 
+::grpc::Status FaceRecognition::Stub::galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::Empty* response) {
+  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_galleryConfigure_, context, request, response);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_galleryConfigure_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_galleryConfigure_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_galleryConfigure_, context, request, response, reactor);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_galleryConfigure_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::Empty>* FaceRecognition::Stub::AsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Empty>::Create(channel_.get(), cq, rpcmethod_galleryConfigure_, context, request, true);
+}
+
+::grpc::ClientAsyncResponseReader< ::Empty>* FaceRecognition::Stub::PrepareAsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Empty>::Create(channel_.get(), cq, rpcmethod_galleryConfigure_, context, request, false);
+}
+
+::grpc::Status FaceRecognition::Stub::galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::GalleryCompactResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_galleryCompact_, context, request, response);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_galleryCompact_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_galleryCompact_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_galleryCompact_, context, request, response, reactor);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_galleryCompact_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>* FaceRecognition::Stub::AsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::GalleryCompactResponse>::Create(channel_.get(), cq, rpcmethod_galleryCompact_, context, request, true);
+}
+
+::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>* FaceRecognition::Stub::PrepareAsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::GalleryCompactResponse>::Create(channel_.get(), cq, rpcmethod_galleryCompact_, context, request, false);
+}
+
+::grpc::ClientReader< ::GalleryChunk>* FaceRecognition::Stub::galleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request) {
+  return ::grpc_impl::internal::ClientReaderFactory< ::GalleryChunk>::Create(channel_.get(), rpcmethod_galleryExport_, context, request);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryExport(::grpc::ClientContext* context, ::GalleryExportRequest* request, ::grpc::experimental::ClientReadReactor< ::GalleryChunk>* reactor) {
+  ::grpc_impl::internal::ClientCallbackReaderFactory< ::GalleryChunk>::Create(stub_->channel_.get(), stub_->rpcmethod_galleryExport_, context, request, reactor);
+}
+
+::grpc::ClientAsyncReader< ::GalleryChunk>* FaceRecognition::Stub::AsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::GalleryChunk>::Create(channel_.get(), cq, rpcmethod_galleryExport_, context, request, true, tag);
+}
+
+::grpc::ClientAsyncReader< ::GalleryChunk>* FaceRecognition::Stub::PrepareAsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::GalleryChunk>::Create(channel_.get(), cq, rpcmethod_galleryExport_, context, request, false, nullptr);
+}
+
+::grpc::ClientReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* FaceRecognition::Stub::galleryImportRaw(::grpc::ClientContext* context) {
+  return ::grpc_impl::internal::ClientReaderWriterFactory< ::GalleryChunk, ::GalleryImportResponse>::Create(channel_.get(), rpcmethod_galleryImport_, context);
+}
+
+void FaceRecognition::Stub::experimental_async::galleryImport(::grpc::ClientContext* context, ::grpc::experimental::ClientBidiReactor< ::GalleryChunk,::GalleryImportResponse>* reactor) {
+  ::grpc_impl::internal::ClientCallbackReaderWriterFactory< ::GalleryChunk,::GalleryImportResponse>::Create(stub_->channel_.get(), stub_->rpcmethod_galleryImport_, context, reactor);
+}
+
+::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* FaceRecognition::Stub::AsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc_impl::internal::ClientAsyncReaderWriterFactory< ::GalleryChunk, ::GalleryImportResponse>::Create(channel_.get(), cq, rpcmethod_galleryImport_, context, true, tag);
+}
+
+::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* FaceRecognition::Stub::PrepareAsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncReaderWriterFactory< ::GalleryChunk, ::GalleryImportResponse>::Create(channel_.get(), cq, rpcmethod_galleryImport_, context, false, nullptr);
+}
+
 ::grpc::Status FaceRecognition::Stub::enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::FaceRecordList* response) {
   return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_enrollmentList_, context, request, response);
 }
@@ -399,88 +533,104 @@ void FaceRecognition::Stub::experimental_async::enrollmentList(::grpc::ClientCon
   return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentList_, context, request, false);
 }
 
-::grpc::Status FaceRecognition::Stub::enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) {
-  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_enrollmentDelete_, context, request, response);
+::grpc::Status FaceRecognition::Stub::trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Empty* response) {
+  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_trainFromGallery_, context, request, response);
+}
+
+void FaceRecognition::Stub::experimental_async::trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_trainFromGallery_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_trainFromGallery_, context, request, response, std::move(f));
+}
+
+void FaceRecognition::Stub::experimental_async::trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_trainFromGallery_, context, request, response, reactor);
+}
+
+void FaceRecognition::Stub::experimental_async::trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_trainFromGallery_, context, request, response, reactor);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentDelete_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::Empty>* FaceRecognition::Stub::AsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Empty>::Create(channel_.get(), cq, rpcmethod_trainFromGallery_, context, request, true);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentDelete_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::Empty>* FaceRecognition::Stub::PrepareAsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Empty>::Create(channel_.get(), cq, rpcmethod_trainFromGallery_, context, request, false);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentDelete_, context, request, response, reactor);
+::grpc::Status FaceRecognition::Stub::subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::EnrollmentDeleteResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_subjectDelete_, context, request, response);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentDelete_, context, request, response, reactor);
+void FaceRecognition::Stub::experimental_async::subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_subjectDelete_, context, request, response, std::move(f));
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::AsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentDelete_, context, request, true);
+void FaceRecognition::Stub::experimental_async::subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_subjectDelete_, context, request, response, std::move(f));
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::PrepareAsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentDelete_, context, request, false);
+void FaceRecognition::Stub::experimental_async::subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_subjectDelete_, context, request, response, reactor);
 }
 
-::grpc::Status FaceRecognition::Stub::enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) {
-  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_enrollmentDeleteConditional_, context, request, response);
+void FaceRecognition::Stub::experimental_async::subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_subjectDelete_, context, request, response, reactor);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentDeleteConditional_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>* FaceRecognition::Stub::AsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::EnrollmentDeleteResponse>::Create(channel_.get(), cq, rpcmethod_subjectDelete_, context, request, true);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentDeleteConditional_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>* FaceRecognition::Stub::PrepareAsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::EnrollmentDeleteResponse>::Create(channel_.get(), cq, rpcmethod_subjectDelete_, context, request, false);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentDeleteConditional_, context, request, response, reactor);
+::grpc::Status FaceRecognition::Stub::generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Matrix* response) {
+  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_generateMatchDistribution_, context, request, response);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentDeleteConditional_, context, request, response, reactor);
+void FaceRecognition::Stub::experimental_async::generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_generateMatchDistribution_, context, request, response, std::move(f));
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::AsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentDeleteConditional_, context, request, true);
+void FaceRecognition::Stub::experimental_async::generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)> f) {
+  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_generateMatchDistribution_, context, request, response, std::move(f));
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::PrepareAsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentDeleteConditional_, context, request, false);
+void FaceRecognition::Stub::experimental_async::generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_generateMatchDistribution_, context, request, response, reactor);
 }
 
-::grpc::Status FaceRecognition::Stub::enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) {
-  return ::grpc::internal::BlockingUnaryCall(channel_.get(), rpcmethod_enrollmentTransfer_, context, request, response);
+void FaceRecognition::Stub::experimental_async::generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
+  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_generateMatchDistribution_, context, request, response, reactor);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentTransfer_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::Matrix>* FaceRecognition::Stub::AsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Matrix>::Create(channel_.get(), cq, rpcmethod_generateMatchDistribution_, context, request, true);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)> f) {
-  ::grpc_impl::internal::CallbackUnaryCall(stub_->channel_.get(), stub_->rpcmethod_enrollmentTransfer_, context, request, response, std::move(f));
+::grpc::ClientAsyncResponseReader< ::Matrix>* FaceRecognition::Stub::PrepareAsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::Matrix>::Create(channel_.get(), cq, rpcmethod_generateMatchDistribution_, context, request, false);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentTransfer_, context, request, response, reactor);
+::grpc::ClientReader< ::MatchDistribution>* FaceRecognition::Stub::matchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request) {
+  return ::grpc_impl::internal::ClientReaderFactory< ::MatchDistribution>::Create(channel_.get(), rpcmethod_matchDistribution_, context, request);
 }
 
-void FaceRecognition::Stub::experimental_async::enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) {
-  ::grpc_impl::internal::ClientCallbackUnaryFactory::Create(stub_->channel_.get(), stub_->rpcmethod_enrollmentTransfer_, context, request, response, reactor);
+void FaceRecognition::Stub::experimental_async::matchDistribution(::grpc::ClientContext* context, ::MatchDistributionRequest* request, ::grpc::experimental::ClientReadReactor< ::MatchDistribution>* reactor) {
+  ::grpc_impl::internal::ClientCallbackReaderFactory< ::MatchDistribution>::Create(stub_->channel_.get(), stub_->rpcmethod_matchDistribution_, context, request, reactor);
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::AsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentTransfer_, context, request, true);
+::grpc::ClientAsyncReader< ::MatchDistribution>* FaceRecognition::Stub::AsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::MatchDistribution>::Create(channel_.get(), cq, rpcmethod_matchDistribution_, context, request, true, tag);
 }
 
-::grpc::ClientAsyncResponseReader< ::FaceRecordList>* FaceRecognition::Stub::PrepareAsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-  return ::grpc_impl::internal::ClientAsyncResponseReaderFactory< ::FaceRecordList>::Create(channel_.get(), cq, rpcmethod_enrollmentTransfer_, context, request, false);
+::grpc::ClientAsyncReader< ::MatchDistribution>* FaceRecognition::Stub::PrepareAsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc_impl::internal::ClientAsyncReaderFactory< ::MatchDistribution>::Create(channel_.get(), cq, rpcmethod_matchDistribution_, context, request, false, nullptr);
 }
 
 ::grpc::Status FaceRecognition::Stub::echo(::grpc::ClientContext* context, const ::Matrix& request, ::Matrix* response) {
@@ -534,61 +684,96 @@ FaceRecognition::Service::Service() {
           std::mem_fn(&FaceRecognition::Service::score), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
       FaceRecognition_method_names[4],
+      ::grpc::internal::RpcMethod::SERVER_STREAMING,
+      new ::grpc::internal::ServerStreamingHandler< FaceRecognition::Service, ::ScoreRequest, ::ScoreBlock>(
+          std::mem_fn(&FaceRecognition::Service::scoreStream), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[5],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::enroll), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[5],
+      FaceRecognition_method_names[6],
+      ::grpc::internal::RpcMethod::CLIENT_STREAMING,
+      new ::grpc::internal::ClientStreamingHandler< FaceRecognition::Service, ::EnrollRequest, ::BulkEnrollResponse>(
+          std::mem_fn(&FaceRecognition::Service::bulkEnroll), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[7],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::SearchRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::search), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[6],
+      FaceRecognition_method_names[8],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::DetectExtractRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::detectExtract), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[7],
+      FaceRecognition_method_names[9],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::DetectExtractEnrollRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::detectExtractEnroll), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[8],
+      FaceRecognition_method_names[10],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::DetectExtractSearchRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::detectExtractSearch), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[9],
+      FaceRecognition_method_names[11],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::GalleryListRequest, ::GalleryList>(
           std::mem_fn(&FaceRecognition::Service::galleryList), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[10],
+      FaceRecognition_method_names[12],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::GalleryDeleteRequest, ::Empty>(
           std::mem_fn(&FaceRecognition::Service::galleryDelete), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[11],
+      FaceRecognition_method_names[13],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::GalleryConfigureRequest, ::Empty>(
+          std::mem_fn(&FaceRecognition::Service::galleryConfigure), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[14],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::GalleryCompactRequest, ::GalleryCompactResponse>(
+          std::mem_fn(&FaceRecognition::Service::galleryCompact), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[15],
+      ::grpc::internal::RpcMethod::SERVER_STREAMING,
+      new ::grpc::internal::ServerStreamingHandler< FaceRecognition::Service, ::GalleryExportRequest, ::GalleryChunk>(
+          std::mem_fn(&FaceRecognition::Service::galleryExport), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[16],
+      ::grpc::internal::RpcMethod::BIDI_STREAMING,
+      new ::grpc::internal::BidiStreamingHandler< FaceRecognition::Service, ::GalleryChunk, ::GalleryImportResponse>(
+          std::mem_fn(&FaceRecognition::Service::galleryImport), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[17],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentListRequest, ::FaceRecordList>(
           std::mem_fn(&FaceRecognition::Service::enrollmentList), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[12],
+      FaceRecognition_method_names[18],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
-      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          std::mem_fn(&FaceRecognition::Service::enrollmentDelete), this)));
+      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentListRequest, ::Empty>(
+          std::mem_fn(&FaceRecognition::Service::trainFromGallery), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[13],
+      FaceRecognition_method_names[19],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
-      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          std::mem_fn(&FaceRecognition::Service::enrollmentDeleteConditional), this)));
+      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentDeleteRequest, ::EnrollmentDeleteResponse>(
+          std::mem_fn(&FaceRecognition::Service::subjectDelete), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[14],
+      FaceRecognition_method_names[20],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
-      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          std::mem_fn(&FaceRecognition::Service::enrollmentTransfer), this)));
+      new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::EnrollmentListRequest, ::Matrix>(
+          std::mem_fn(&FaceRecognition::Service::generateMatchDistribution), this)));
   AddMethod(new ::grpc::internal::RpcServiceMethod(
-      FaceRecognition_method_names[15],
+      FaceRecognition_method_names[21],
+      ::grpc::internal::RpcMethod::SERVER_STREAMING,
+      new ::grpc::internal::ServerStreamingHandler< FaceRecognition::Service, ::MatchDistributionRequest, ::MatchDistribution>(
+          std::mem_fn(&FaceRecognition::Service::matchDistribution), this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      FaceRecognition_method_names[22],
       ::grpc::internal::RpcMethod::NORMAL_RPC,
       new ::grpc::internal::RpcMethodHandler< FaceRecognition::Service, ::Matrix, ::Matrix>(
           std::mem_fn(&FaceRecognition::Service::echo), this)));
@@ -625,6 +810,13 @@ FaceRecognition::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status FaceRecognition::Service::scoreStream(::grpc::ServerContext* context, const ::ScoreRequest* request, ::grpc::ServerWriter< ::ScoreBlock>* writer) {
+  (void) context;
+  (void) request;
+  (void) writer;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 ::grpc::Status FaceRecognition::Service::enroll(::grpc::ServerContext* context, const ::EnrollRequest* request, ::FaceRecordList* response) {
   (void) context;
   (void) request;
@@ -632,6 +824,13 @@ FaceRecognition::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status FaceRecognition::Service::bulkEnroll(::grpc::ServerContext* context, ::grpc::ServerReader< ::EnrollRequest>* reader, ::BulkEnrollResponse* response) {
+  (void) context;
+  (void) reader;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 ::grpc::Status FaceRecognition::Service::search(::grpc::ServerContext* context, const ::SearchRequest* request, ::FaceRecordList* response) {
   (void) context;
   (void) request;
@@ -674,6 +873,33 @@ FaceRecognition::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status FaceRecognition::Service::galleryConfigure(::grpc::ServerContext* context, const ::GalleryConfigureRequest* request, ::Empty* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status FaceRecognition::Service::galleryCompact(::grpc::ServerContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status FaceRecognition::Service::galleryExport(::grpc::ServerContext* context, const ::GalleryExportRequest* request, ::grpc::ServerWriter< ::GalleryChunk>* writer) {
+  (void) context;
+  (void) request;
+  (void) writer;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status FaceRecognition::Service::galleryImport(::grpc::ServerContext* context, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* stream) {
+  (void) context;
+  (void) stream;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 ::grpc::Status FaceRecognition::Service::enrollmentList(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response) {
   (void) context;
   (void) request;
@@ -681,27 +907,34 @@ FaceRecognition::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
-::grpc::Status FaceRecognition::Service::enrollmentDelete(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) {
+::grpc::Status FaceRecognition::Service::trainFromGallery(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::Empty* response) {
   (void) context;
   (void) request;
   (void) response;
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
-::grpc::Status FaceRecognition::Service::enrollmentDeleteConditional(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) {
+::grpc::Status FaceRecognition::Service::subjectDelete(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response) {
   (void) context;
   (void) request;
   (void) response;
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
-::grpc::Status FaceRecognition::Service::enrollmentTransfer(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) {
+::grpc::Status FaceRecognition::Service::generateMatchDistribution(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::Matrix* response) {
   (void) context;
   (void) request;
   (void) response;
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status FaceRecognition::Service::matchDistribution(::grpc::ServerContext* context, const ::MatchDistributionRequest* request, ::grpc::ServerWriter< ::MatchDistribution>* writer) {
+  (void) context;
+  (void) request;
+  (void) writer;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 ::grpc::Status FaceRecognition::Service::echo(::grpc::ServerContext* context, const ::Matrix* request, ::Matrix* response) {
   (void) context;
   (void) request;
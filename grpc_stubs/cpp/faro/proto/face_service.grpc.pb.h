@@ -99,6 +99,15 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>> PrepareAsyncscore(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>>(PrepareAsyncscoreRaw(context, request, cq));
     }
+    std::unique_ptr< ::grpc::ClientReaderInterface< ::ScoreBlock>> scoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReaderInterface< ::ScoreBlock>>(scoreStreamRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>> AsyncscoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>>(AsyncscoreStreamRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>> PrepareAsyncscoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>>(PrepareAsyncscoreStreamRaw(context, request, cq));
+    }
     virtual ::grpc::Status enroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::FaceRecordList* response) = 0;
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> Asyncenroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncenrollRaw(context, request, cq));
@@ -106,6 +115,15 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> PrepareAsyncenroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(PrepareAsyncenrollRaw(context, request, cq));
     }
+    std::unique_ptr< ::grpc::ClientWriterInterface< ::EnrollRequest>> bulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response) {
+      return std::unique_ptr< ::grpc::ClientWriterInterface< ::EnrollRequest>>(bulkEnrollRaw(context, response));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>> AsyncbulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>>(AsyncbulkEnrollRaw(context, response, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>> PrepareAsyncbulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>>(PrepareAsyncbulkEnrollRaw(context, response, cq));
+    }
     virtual ::grpc::Status search(::grpc::ClientContext* context, const ::SearchRequest& request, ::FaceRecordList* response) = 0;
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> Asyncsearch(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncsearchRaw(context, request, cq));
@@ -150,6 +168,38 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>> PrepareAsyncgalleryDelete(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>>(PrepareAsyncgalleryDeleteRaw(context, request, cq));
     }
+    virtual ::grpc::Status galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::Empty* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>> AsyncgalleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>>(AsyncgalleryConfigureRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>> PrepareAsyncgalleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>>(PrepareAsyncgalleryConfigureRaw(context, request, cq));
+    }
+    virtual ::grpc::Status galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::GalleryCompactResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>> AsyncgalleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>>(AsyncgalleryCompactRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>> PrepareAsyncgalleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>>(PrepareAsyncgalleryCompactRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReaderInterface< ::GalleryChunk>> galleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReaderInterface< ::GalleryChunk>>(galleryExportRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>> AsyncgalleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>>(AsyncgalleryExportRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>> PrepareAsyncgalleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>>(PrepareAsyncgalleryExportRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>> galleryImport(::grpc::ClientContext* context) {
+      return std::unique_ptr< ::grpc::ClientReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>>(galleryImportRaw(context));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>> AsyncgalleryImport(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>>(AsyncgalleryImportRaw(context, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>> PrepareAsyncgalleryImport(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>>(PrepareAsyncgalleryImportRaw(context, cq));
+    }
     virtual ::grpc::Status enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::FaceRecordList* response) = 0;
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> AsyncenrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncenrollmentListRaw(context, request, cq));
@@ -157,27 +207,42 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> PrepareAsyncenrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(PrepareAsyncenrollmentListRaw(context, request, cq));
     }
-    virtual ::grpc::Status enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) = 0;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> AsyncenrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncenrollmentDeleteRaw(context, request, cq));
+    virtual ::grpc::Status trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Empty* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>> AsynctrainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>>(AsynctrainFromGalleryRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> PrepareAsyncenrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(PrepareAsyncenrollmentDeleteRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>> PrepareAsynctrainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Empty>>(PrepareAsynctrainFromGalleryRaw(context, request, cq));
     }
-    virtual ::grpc::Status enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) = 0;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> AsyncenrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncenrollmentDeleteConditionalRaw(context, request, cq));
+    virtual ::grpc::Status subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::EnrollmentDeleteResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>> AsyncsubjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>>(AsyncsubjectDeleteRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> PrepareAsyncenrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(PrepareAsyncenrollmentDeleteConditionalRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>> PrepareAsyncsubjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>>(PrepareAsyncsubjectDeleteRaw(context, request, cq));
     }
-    virtual ::grpc::Status enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) = 0;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> AsyncenrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(AsyncenrollmentTransferRaw(context, request, cq));
+    virtual ::grpc::Status generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Matrix* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>> AsyncgenerateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>>(AsyncgenerateMatchDistributionRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>> PrepareAsyncenrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>>(PrepareAsyncenrollmentTransferRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>> PrepareAsyncgenerateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>>(PrepareAsyncgenerateMatchDistributionRaw(context, request, cq));
     }
+    std::unique_ptr< ::grpc::ClientReaderInterface< ::MatchDistribution>> matchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReaderInterface< ::MatchDistribution>>(matchDistributionRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>> AsyncmatchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>>(AsyncmatchDistributionRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>> PrepareAsyncmatchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>>(PrepareAsyncmatchDistributionRaw(context, request, cq));
+    }
+    // Source Management
+    // rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+    //
+    // rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    // rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    //
     // Test
     virtual ::grpc::Status echo(::grpc::ClientContext* context, const ::Matrix& request, ::Matrix* response) = 0;
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>> Asyncecho(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) {
@@ -207,10 +272,12 @@ class FaceRecognition final {
       virtual void score(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) = 0;
       virtual void score(::grpc::ClientContext* context, const ::ScoreRequest* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
       virtual void score(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void scoreStream(::grpc::ClientContext* context, ::ScoreRequest* request, ::grpc::experimental::ClientReadReactor< ::ScoreBlock>* reactor) = 0;
       virtual void enroll(::grpc::ClientContext* context, const ::EnrollRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void enroll(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void enroll(::grpc::ClientContext* context, const ::EnrollRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
       virtual void enroll(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void bulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::experimental::ClientWriteReactor< ::EnrollRequest>* reactor) = 0;
       virtual void search(::grpc::ClientContext* context, const ::SearchRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void search(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void search(::grpc::ClientContext* context, const ::SearchRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
@@ -237,22 +304,39 @@ class FaceRecognition final {
       virtual void galleryDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) = 0;
       virtual void galleryDelete(::grpc::ClientContext* context, const ::GalleryDeleteRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
       virtual void galleryDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void galleryExport(::grpc::ClientContext* context, ::GalleryExportRequest* request, ::grpc::experimental::ClientReadReactor< ::GalleryChunk>* reactor) = 0;
+      virtual void galleryImport(::grpc::ClientContext* context, ::grpc::experimental::ClientBidiReactor< ::GalleryChunk,::GalleryImportResponse>* reactor) = 0;
       virtual void enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void enrollmentList(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
       virtual void enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
       virtual void enrollmentList(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) = 0;
-      virtual void enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
-      virtual void enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) = 0;
+      virtual void matchDistribution(::grpc::ClientContext* context, ::MatchDistributionRequest* request, ::grpc::experimental::ClientReadReactor< ::MatchDistribution>* reactor) = 0;
+      // Source Management
+      // rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+      //
+      // rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+      // rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+      //
       // Test
       virtual void echo(::grpc::ClientContext* context, const ::Matrix* request, ::Matrix* response, std::function<void(::grpc::Status)>) = 0;
       virtual void echo(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) = 0;
@@ -269,8 +353,14 @@ class FaceRecognition final {
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncextractRaw(::grpc::ClientContext* context, const ::ExtractRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* AsyncscoreRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* PrepareAsyncscoreRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderInterface< ::ScoreBlock>* scoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>* AsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::ScoreBlock>* PrepareAsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncenrollRaw(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncenrollRaw(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientWriterInterface< ::EnrollRequest>* bulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response) = 0;
+    virtual ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>* AsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncWriterInterface< ::EnrollRequest>* PrepareAsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncsearchRaw(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncsearchRaw(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncdetectExtractRaw(::grpc::ClientContext* context, const ::DetectExtractRequest& request, ::grpc::CompletionQueue* cq) = 0;
@@ -283,14 +373,27 @@ class FaceRecognition final {
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::GalleryList>* PrepareAsyncgalleryListRaw(::grpc::ClientContext* context, const ::GalleryListRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* AsyncgalleryDeleteRaw(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* PrepareAsyncgalleryDeleteRaw(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* AsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* PrepareAsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>* AsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::GalleryCompactResponse>* PrepareAsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderInterface< ::GalleryChunk>* galleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>* AsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::GalleryChunk>* PrepareAsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>* galleryImportRaw(::grpc::ClientContext* context) = 0;
+    virtual ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>* AsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderWriterInterface< ::GalleryChunk, ::GalleryImportResponse>* PrepareAsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncenrollmentListRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncenrollmentListRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* AsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
-    virtual ::grpc::ClientAsyncResponseReaderInterface< ::FaceRecordList>* PrepareAsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* AsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Empty>* PrepareAsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>* AsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::EnrollmentDeleteResponse>* PrepareAsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* AsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* PrepareAsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderInterface< ::MatchDistribution>* matchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>* AsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::MatchDistribution>* PrepareAsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* AsyncechoRaw(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::Matrix>* PrepareAsyncechoRaw(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) = 0;
   };
@@ -325,6 +428,15 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>> PrepareAsyncscore(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>>(PrepareAsyncscoreRaw(context, request, cq));
     }
+    std::unique_ptr< ::grpc::ClientReader< ::ScoreBlock>> scoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReader< ::ScoreBlock>>(scoreStreamRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::ScoreBlock>> AsyncscoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::ScoreBlock>>(AsyncscoreStreamRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::ScoreBlock>> PrepareAsyncscoreStream(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::ScoreBlock>>(PrepareAsyncscoreStreamRaw(context, request, cq));
+    }
     ::grpc::Status enroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::FaceRecordList* response) override;
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> Asyncenroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncenrollRaw(context, request, cq));
@@ -332,6 +444,15 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> PrepareAsyncenroll(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(PrepareAsyncenrollRaw(context, request, cq));
     }
+    std::unique_ptr< ::grpc::ClientWriter< ::EnrollRequest>> bulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response) {
+      return std::unique_ptr< ::grpc::ClientWriter< ::EnrollRequest>>(bulkEnrollRaw(context, response));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncWriter< ::EnrollRequest>> AsyncbulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncWriter< ::EnrollRequest>>(AsyncbulkEnrollRaw(context, response, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncWriter< ::EnrollRequest>> PrepareAsyncbulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncWriter< ::EnrollRequest>>(PrepareAsyncbulkEnrollRaw(context, response, cq));
+    }
     ::grpc::Status search(::grpc::ClientContext* context, const ::SearchRequest& request, ::FaceRecordList* response) override;
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> Asyncsearch(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncsearchRaw(context, request, cq));
@@ -374,6 +495,38 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>> PrepareAsyncgalleryDelete(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>>(PrepareAsyncgalleryDeleteRaw(context, request, cq));
     }
+    ::grpc::Status galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::Empty* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>> AsyncgalleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>>(AsyncgalleryConfigureRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>> PrepareAsyncgalleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>>(PrepareAsyncgalleryConfigureRaw(context, request, cq));
+    }
+    ::grpc::Status galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::GalleryCompactResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>> AsyncgalleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>>(AsyncgalleryCompactRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>> PrepareAsyncgalleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>>(PrepareAsyncgalleryCompactRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReader< ::GalleryChunk>> galleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReader< ::GalleryChunk>>(galleryExportRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::GalleryChunk>> AsyncgalleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::GalleryChunk>>(AsyncgalleryExportRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::GalleryChunk>> PrepareAsyncgalleryExport(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::GalleryChunk>>(PrepareAsyncgalleryExportRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReaderWriter< ::GalleryChunk, ::GalleryImportResponse>> galleryImport(::grpc::ClientContext* context) {
+      return std::unique_ptr< ::grpc::ClientReaderWriter< ::GalleryChunk, ::GalleryImportResponse>>(galleryImportRaw(context));
+    }
+    std::unique_ptr<  ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>> AsyncgalleryImport(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>>(AsyncgalleryImportRaw(context, cq, tag));
+    }
+    std::unique_ptr<  ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>> PrepareAsyncgalleryImport(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>>(PrepareAsyncgalleryImportRaw(context, cq));
+    }
     ::grpc::Status enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::FaceRecordList* response) override;
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> AsyncenrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncenrollmentListRaw(context, request, cq));
@@ -381,26 +534,35 @@ class FaceRecognition final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> PrepareAsyncenrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(PrepareAsyncenrollmentListRaw(context, request, cq));
     }
-    ::grpc::Status enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) override;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> AsyncenrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncenrollmentDeleteRaw(context, request, cq));
+    ::grpc::Status trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Empty* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>> AsynctrainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>>(AsynctrainFromGalleryRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>> PrepareAsynctrainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Empty>>(PrepareAsynctrainFromGalleryRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> PrepareAsyncenrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(PrepareAsyncenrollmentDeleteRaw(context, request, cq));
+    ::grpc::Status subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::EnrollmentDeleteResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>> AsyncsubjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>>(AsyncsubjectDeleteRaw(context, request, cq));
     }
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) override;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> AsyncenrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncenrollmentDeleteConditionalRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>> PrepareAsyncsubjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>>(PrepareAsyncsubjectDeleteRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> PrepareAsyncenrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(PrepareAsyncenrollmentDeleteConditionalRaw(context, request, cq));
+    ::grpc::Status generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::Matrix* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>> AsyncgenerateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>>(AsyncgenerateMatchDistributionRaw(context, request, cq));
     }
-    ::grpc::Status enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::FaceRecordList* response) override;
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> AsyncenrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(AsyncenrollmentTransferRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>> PrepareAsyncgenerateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>>(PrepareAsyncgenerateMatchDistributionRaw(context, request, cq));
     }
-    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>> PrepareAsyncenrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) {
-      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::FaceRecordList>>(PrepareAsyncenrollmentTransferRaw(context, request, cq));
+    std::unique_ptr< ::grpc::ClientReader< ::MatchDistribution>> matchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReader< ::MatchDistribution>>(matchDistributionRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::MatchDistribution>> AsyncmatchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::MatchDistribution>>(AsyncmatchDistributionRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::MatchDistribution>> PrepareAsyncmatchDistribution(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::MatchDistribution>>(PrepareAsyncmatchDistributionRaw(context, request, cq));
     }
     ::grpc::Status echo(::grpc::ClientContext* context, const ::Matrix& request, ::Matrix* response) override;
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::Matrix>> Asyncecho(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) {
@@ -428,10 +590,12 @@ class FaceRecognition final {
       void score(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) override;
       void score(::grpc::ClientContext* context, const ::ScoreRequest* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
       void score(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void scoreStream(::grpc::ClientContext* context, ::ScoreRequest* request, ::grpc::experimental::ClientReadReactor< ::ScoreBlock>* reactor) override;
       void enroll(::grpc::ClientContext* context, const ::EnrollRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void enroll(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void enroll(::grpc::ClientContext* context, const ::EnrollRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
       void enroll(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void bulkEnroll(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::experimental::ClientWriteReactor< ::EnrollRequest>* reactor) override;
       void search(::grpc::ClientContext* context, const ::SearchRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void search(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void search(::grpc::ClientContext* context, const ::SearchRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
@@ -456,22 +620,33 @@ class FaceRecognition final {
       void galleryDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) override;
       void galleryDelete(::grpc::ClientContext* context, const ::GalleryDeleteRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
       void galleryDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, std::function<void(::grpc::Status)>) override;
+      void galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) override;
+      void galleryConfigure(::grpc::ClientContext* context, const ::GalleryConfigureRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void galleryConfigure(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)>) override;
+      void galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, std::function<void(::grpc::Status)>) override;
+      void galleryCompact(::grpc::ClientContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void galleryCompact(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::GalleryCompactResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void galleryExport(::grpc::ClientContext* context, ::GalleryExportRequest* request, ::grpc::experimental::ClientReadReactor< ::GalleryChunk>* reactor) override;
+      void galleryImport(::grpc::ClientContext* context, ::grpc::experimental::ClientBidiReactor< ::GalleryChunk,::GalleryImportResponse>* reactor) override;
       void enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void enrollmentList(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
       void enrollmentList(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
       void enrollmentList(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentDeleteConditional(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, std::function<void(::grpc::Status)>) override;
-      void enrollmentTransfer(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
-      void enrollmentTransfer(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::FaceRecordList* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, std::function<void(::grpc::Status)>) override;
+      void trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, std::function<void(::grpc::Status)>) override;
+      void trainFromGallery(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void trainFromGallery(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Empty* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)>) override;
+      void subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, std::function<void(::grpc::Status)>) override;
+      void subjectDelete(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void subjectDelete(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::EnrollmentDeleteResponse* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, std::function<void(::grpc::Status)>) override;
+      void generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) override;
+      void generateMatchDistribution(::grpc::ClientContext* context, const ::EnrollmentListRequest* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void generateMatchDistribution(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
+      void matchDistribution(::grpc::ClientContext* context, ::MatchDistributionRequest* request, ::grpc::experimental::ClientReadReactor< ::MatchDistribution>* reactor) override;
       void echo(::grpc::ClientContext* context, const ::Matrix* request, ::Matrix* response, std::function<void(::grpc::Status)>) override;
       void echo(::grpc::ClientContext* context, const ::grpc::ByteBuffer* request, ::Matrix* response, std::function<void(::grpc::Status)>) override;
       void echo(::grpc::ClientContext* context, const ::Matrix* request, ::Matrix* response, ::grpc::experimental::ClientUnaryReactor* reactor) override;
@@ -495,8 +670,14 @@ class FaceRecognition final {
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncextractRaw(::grpc::ClientContext* context, const ::ExtractRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Matrix>* AsyncscoreRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Matrix>* PrepareAsyncscoreRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReader< ::ScoreBlock>* scoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request) override;
+    ::grpc::ClientAsyncReader< ::ScoreBlock>* AsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReader< ::ScoreBlock>* PrepareAsyncscoreStreamRaw(::grpc::ClientContext* context, const ::ScoreRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncenrollRaw(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncenrollRaw(::grpc::ClientContext* context, const ::EnrollRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientWriter< ::EnrollRequest>* bulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response) override;
+    ::grpc::ClientAsyncWriter< ::EnrollRequest>* AsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncWriter< ::EnrollRequest>* PrepareAsyncbulkEnrollRaw(::grpc::ClientContext* context, ::BulkEnrollResponse* response, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncsearchRaw(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncsearchRaw(::grpc::ClientContext* context, const ::SearchRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncdetectExtractRaw(::grpc::ClientContext* context, const ::DetectExtractRequest& request, ::grpc::CompletionQueue* cq) override;
@@ -509,31 +690,51 @@ class FaceRecognition final {
     ::grpc::ClientAsyncResponseReader< ::GalleryList>* PrepareAsyncgalleryListRaw(::grpc::ClientContext* context, const ::GalleryListRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Empty>* AsyncgalleryDeleteRaw(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Empty>* PrepareAsyncgalleryDeleteRaw(::grpc::ClientContext* context, const ::GalleryDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Empty>* AsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Empty>* PrepareAsyncgalleryConfigureRaw(::grpc::ClientContext* context, const ::GalleryConfigureRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>* AsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::GalleryCompactResponse>* PrepareAsyncgalleryCompactRaw(::grpc::ClientContext* context, const ::GalleryCompactRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReader< ::GalleryChunk>* galleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request) override;
+    ::grpc::ClientAsyncReader< ::GalleryChunk>* AsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReader< ::GalleryChunk>* PrepareAsyncgalleryExportRaw(::grpc::ClientContext* context, const ::GalleryExportRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* galleryImportRaw(::grpc::ClientContext* context) override;
+    ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* AsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReaderWriter< ::GalleryChunk, ::GalleryImportResponse>* PrepareAsyncgalleryImportRaw(::grpc::ClientContext* context, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncenrollmentListRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncenrollmentListRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncenrollmentDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncenrollmentDeleteConditionalRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* AsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
-    ::grpc::ClientAsyncResponseReader< ::FaceRecordList>* PrepareAsyncenrollmentTransferRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Empty>* AsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Empty>* PrepareAsynctrainFromGalleryRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>* AsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::EnrollmentDeleteResponse>* PrepareAsyncsubjectDeleteRaw(::grpc::ClientContext* context, const ::EnrollmentDeleteRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Matrix>* AsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::Matrix>* PrepareAsyncgenerateMatchDistributionRaw(::grpc::ClientContext* context, const ::EnrollmentListRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReader< ::MatchDistribution>* matchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request) override;
+    ::grpc::ClientAsyncReader< ::MatchDistribution>* AsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReader< ::MatchDistribution>* PrepareAsyncmatchDistributionRaw(::grpc::ClientContext* context, const ::MatchDistributionRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Matrix>* AsyncechoRaw(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::Matrix>* PrepareAsyncechoRaw(::grpc::ClientContext* context, const ::Matrix& request, ::grpc::CompletionQueue* cq) override;
     const ::grpc::internal::RpcMethod rpcmethod_status_;
     const ::grpc::internal::RpcMethod rpcmethod_detect_;
     const ::grpc::internal::RpcMethod rpcmethod_extract_;
     const ::grpc::internal::RpcMethod rpcmethod_score_;
+    const ::grpc::internal::RpcMethod rpcmethod_scoreStream_;
     const ::grpc::internal::RpcMethod rpcmethod_enroll_;
+    const ::grpc::internal::RpcMethod rpcmethod_bulkEnroll_;
     const ::grpc::internal::RpcMethod rpcmethod_search_;
     const ::grpc::internal::RpcMethod rpcmethod_detectExtract_;
     const ::grpc::internal::RpcMethod rpcmethod_detectExtractEnroll_;
     const ::grpc::internal::RpcMethod rpcmethod_detectExtractSearch_;
     const ::grpc::internal::RpcMethod rpcmethod_galleryList_;
     const ::grpc::internal::RpcMethod rpcmethod_galleryDelete_;
+    const ::grpc::internal::RpcMethod rpcmethod_galleryConfigure_;
+    const ::grpc::internal::RpcMethod rpcmethod_galleryCompact_;
+    const ::grpc::internal::RpcMethod rpcmethod_galleryExport_;
+    const ::grpc::internal::RpcMethod rpcmethod_galleryImport_;
     const ::grpc::internal::RpcMethod rpcmethod_enrollmentList_;
-    const ::grpc::internal::RpcMethod rpcmethod_enrollmentDelete_;
-    const ::grpc::internal::RpcMethod rpcmethod_enrollmentDeleteConditional_;
-    const ::grpc::internal::RpcMethod rpcmethod_enrollmentTransfer_;
+    const ::grpc::internal::RpcMethod rpcmethod_trainFromGallery_;
+    const ::grpc::internal::RpcMethod rpcmethod_subjectDelete_;
+    const ::grpc::internal::RpcMethod rpcmethod_generateMatchDistribution_;
+    const ::grpc::internal::RpcMethod rpcmethod_matchDistribution_;
     const ::grpc::internal::RpcMethod rpcmethod_echo_;
   };
   static std::unique_ptr<Stub> NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options = ::grpc::StubOptions());
@@ -548,7 +749,9 @@ class FaceRecognition final {
     virtual ::grpc::Status detect(::grpc::ServerContext* context, const ::DetectRequest* request, ::FaceRecordList* response);
     virtual ::grpc::Status extract(::grpc::ServerContext* context, const ::ExtractRequest* request, ::FaceRecordList* response);
     virtual ::grpc::Status score(::grpc::ServerContext* context, const ::ScoreRequest* request, ::Matrix* response);
+    virtual ::grpc::Status scoreStream(::grpc::ServerContext* context, const ::ScoreRequest* request, ::grpc::ServerWriter< ::ScoreBlock>* writer);
     virtual ::grpc::Status enroll(::grpc::ServerContext* context, const ::EnrollRequest* request, ::FaceRecordList* response);
+    virtual ::grpc::Status bulkEnroll(::grpc::ServerContext* context, ::grpc::ServerReader< ::EnrollRequest>* reader, ::BulkEnrollResponse* response);
     virtual ::grpc::Status search(::grpc::ServerContext* context, const ::SearchRequest* request, ::FaceRecordList* response);
     // Combined opperations
     virtual ::grpc::Status detectExtract(::grpc::ServerContext* context, const ::DetectExtractRequest* request, ::FaceRecordList* response);
@@ -557,10 +760,21 @@ class FaceRecognition final {
     // Gallery Management
     virtual ::grpc::Status galleryList(::grpc::ServerContext* context, const ::GalleryListRequest* request, ::GalleryList* response);
     virtual ::grpc::Status galleryDelete(::grpc::ServerContext* context, const ::GalleryDeleteRequest* request, ::Empty* response);
+    virtual ::grpc::Status galleryConfigure(::grpc::ServerContext* context, const ::GalleryConfigureRequest* request, ::Empty* response);
+    virtual ::grpc::Status galleryCompact(::grpc::ServerContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response);
+    virtual ::grpc::Status galleryExport(::grpc::ServerContext* context, const ::GalleryExportRequest* request, ::grpc::ServerWriter< ::GalleryChunk>* writer);
+    virtual ::grpc::Status galleryImport(::grpc::ServerContext* context, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* stream);
     virtual ::grpc::Status enrollmentList(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response);
-    virtual ::grpc::Status enrollmentDelete(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response);
-    virtual ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response);
-    virtual ::grpc::Status enrollmentTransfer(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response);
+    virtual ::grpc::Status trainFromGallery(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::Empty* response);
+    virtual ::grpc::Status subjectDelete(::grpc::ServerContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response);
+    virtual ::grpc::Status generateMatchDistribution(::grpc::ServerContext* context, const ::EnrollmentListRequest* request, ::Matrix* response);
+    virtual ::grpc::Status matchDistribution(::grpc::ServerContext* context, const ::MatchDistributionRequest* request, ::grpc::ServerWriter< ::MatchDistribution>* writer);
+    // Source Management
+    // rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+    //
+    // rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    // rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    //
     // Test
     virtual ::grpc::Status echo(::grpc::ServerContext* context, const ::Matrix* request, ::Matrix* response);
   };
@@ -645,12 +859,32 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
+  class WithAsyncMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_scoreStream() {
+      ::grpc::Service::MarkMethodAsync(4);
+    }
+    ~WithAsyncMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestscoreStream(::grpc::ServerContext* context, ::ScoreRequest* request, ::grpc::ServerAsyncWriter< ::ScoreBlock>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(4, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
   class WithAsyncMethod_enroll : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_enroll() {
-      ::grpc::Service::MarkMethodAsync(4);
+      ::grpc::Service::MarkMethodAsync(5);
     }
     ~WithAsyncMethod_enroll() override {
       BaseClassMustBeDerivedFromService(this);
@@ -661,7 +895,27 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void Requestenroll(::grpc::ServerContext* context, ::EnrollRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(4, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_bulkEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_bulkEnroll() {
+      ::grpc::Service::MarkMethodAsync(6);
+    }
+    ~WithAsyncMethod_bulkEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status bulkEnroll(::grpc::ServerContext* /*context*/, ::grpc::ServerReader< ::EnrollRequest>* /*reader*/, ::BulkEnrollResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestbulkEnroll(::grpc::ServerContext* context, ::grpc::ServerAsyncReader< ::BulkEnrollResponse, ::EnrollRequest>* reader, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncClientStreaming(6, context, reader, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -670,7 +924,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_search() {
-      ::grpc::Service::MarkMethodAsync(5);
+      ::grpc::Service::MarkMethodAsync(7);
     }
     ~WithAsyncMethod_search() override {
       BaseClassMustBeDerivedFromService(this);
@@ -681,7 +935,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void Requestsearch(::grpc::ServerContext* context, ::SearchRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(7, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -690,7 +944,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_detectExtract() {
-      ::grpc::Service::MarkMethodAsync(6);
+      ::grpc::Service::MarkMethodAsync(8);
     }
     ~WithAsyncMethod_detectExtract() override {
       BaseClassMustBeDerivedFromService(this);
@@ -701,7 +955,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestdetectExtract(::grpc::ServerContext* context, ::DetectExtractRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(6, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(8, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -710,7 +964,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_detectExtractEnroll() {
-      ::grpc::Service::MarkMethodAsync(7);
+      ::grpc::Service::MarkMethodAsync(9);
     }
     ~WithAsyncMethod_detectExtractEnroll() override {
       BaseClassMustBeDerivedFromService(this);
@@ -721,7 +975,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestdetectExtractEnroll(::grpc::ServerContext* context, ::DetectExtractEnrollRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(7, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(9, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -730,7 +984,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_detectExtractSearch() {
-      ::grpc::Service::MarkMethodAsync(8);
+      ::grpc::Service::MarkMethodAsync(10);
     }
     ~WithAsyncMethod_detectExtractSearch() override {
       BaseClassMustBeDerivedFromService(this);
@@ -741,7 +995,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestdetectExtractSearch(::grpc::ServerContext* context, ::DetectExtractSearchRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(8, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(10, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -750,7 +1004,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_galleryList() {
-      ::grpc::Service::MarkMethodAsync(9);
+      ::grpc::Service::MarkMethodAsync(11);
     }
     ~WithAsyncMethod_galleryList() override {
       BaseClassMustBeDerivedFromService(this);
@@ -761,7 +1015,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestgalleryList(::grpc::ServerContext* context, ::GalleryListRequest* request, ::grpc::ServerAsyncResponseWriter< ::GalleryList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(9, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(11, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -770,7 +1024,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_galleryDelete() {
-      ::grpc::Service::MarkMethodAsync(10);
+      ::grpc::Service::MarkMethodAsync(12);
     }
     ~WithAsyncMethod_galleryDelete() override {
       BaseClassMustBeDerivedFromService(this);
@@ -781,7 +1035,87 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestgalleryDelete(::grpc::ServerContext* context, ::GalleryDeleteRequest* request, ::grpc::ServerAsyncResponseWriter< ::Empty>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(10, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(12, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_galleryConfigure : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_galleryConfigure() {
+      ::grpc::Service::MarkMethodAsync(13);
+    }
+    ~WithAsyncMethod_galleryConfigure() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryConfigure(::grpc::ServerContext* context, ::GalleryConfigureRequest* request, ::grpc::ServerAsyncResponseWriter< ::Empty>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(13, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_galleryCompact : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_galleryCompact() {
+      ::grpc::Service::MarkMethodAsync(14);
+    }
+    ~WithAsyncMethod_galleryCompact() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryCompact(::grpc::ServerContext* context, ::GalleryCompactRequest* request, ::grpc::ServerAsyncResponseWriter< ::GalleryCompactResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(14, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_galleryExport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_galleryExport() {
+      ::grpc::Service::MarkMethodAsync(15);
+    }
+    ~WithAsyncMethod_galleryExport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryExport(::grpc::ServerContext* context, ::GalleryExportRequest* request, ::grpc::ServerAsyncWriter< ::GalleryChunk>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(15, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_galleryImport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_galleryImport() {
+      ::grpc::Service::MarkMethodAsync(16);
+    }
+    ~WithAsyncMethod_galleryImport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryImport(::grpc::ServerContext* /*context*/, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* /*stream*/)  override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryImport(::grpc::ServerContext* context, ::grpc::ServerAsyncReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* stream, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncBidiStreaming(16, context, stream, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -790,7 +1124,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_enrollmentList() {
-      ::grpc::Service::MarkMethodAsync(11);
+      ::grpc::Service::MarkMethodAsync(17);
     }
     ~WithAsyncMethod_enrollmentList() override {
       BaseClassMustBeDerivedFromService(this);
@@ -801,67 +1135,87 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void RequestenrollmentList(::grpc::ServerContext* context, ::EnrollmentListRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(11, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(17, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithAsyncMethod_enrollmentDelete : public BaseClass {
+  class WithAsyncMethod_trainFromGallery : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithAsyncMethod_enrollmentDelete() {
-      ::grpc::Service::MarkMethodAsync(12);
+    WithAsyncMethod_trainFromGallery() {
+      ::grpc::Service::MarkMethodAsync(18);
     }
-    ~WithAsyncMethod_enrollmentDelete() override {
+    ~WithAsyncMethod_trainFromGallery() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentDelete(::grpc::ServerContext* context, ::EnrollmentDeleteRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(12, context, request, response, new_call_cq, notification_cq, tag);
+    void RequesttrainFromGallery(::grpc::ServerContext* context, ::EnrollmentListRequest* request, ::grpc::ServerAsyncResponseWriter< ::Empty>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(18, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithAsyncMethod_enrollmentDeleteConditional : public BaseClass {
+  class WithAsyncMethod_subjectDelete : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithAsyncMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::MarkMethodAsync(13);
+    WithAsyncMethod_subjectDelete() {
+      ::grpc::Service::MarkMethodAsync(19);
     }
-    ~WithAsyncMethod_enrollmentDeleteConditional() override {
+    ~WithAsyncMethod_subjectDelete() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentDeleteConditional(::grpc::ServerContext* context, ::EnrollmentDeleteRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(13, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestsubjectDelete(::grpc::ServerContext* context, ::EnrollmentDeleteRequest* request, ::grpc::ServerAsyncResponseWriter< ::EnrollmentDeleteResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(19, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithAsyncMethod_enrollmentTransfer : public BaseClass {
+  class WithAsyncMethod_generateMatchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithAsyncMethod_enrollmentTransfer() {
-      ::grpc::Service::MarkMethodAsync(14);
+    WithAsyncMethod_generateMatchDistribution() {
+      ::grpc::Service::MarkMethodAsync(20);
     }
-    ~WithAsyncMethod_enrollmentTransfer() override {
+    ~WithAsyncMethod_generateMatchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentTransfer(::grpc::ServerContext* context, ::EnrollmentDeleteRequest* request, ::grpc::ServerAsyncResponseWriter< ::FaceRecordList>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(14, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgenerateMatchDistribution(::grpc::ServerContext* context, ::EnrollmentListRequest* request, ::grpc::ServerAsyncResponseWriter< ::Matrix>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(20, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_matchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_matchDistribution() {
+      ::grpc::Service::MarkMethodAsync(21);
+    }
+    ~WithAsyncMethod_matchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestmatchDistribution(::grpc::ServerContext* context, ::MatchDistributionRequest* request, ::grpc::ServerAsyncWriter< ::MatchDistribution>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(21, context, request, writer, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -870,7 +1224,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithAsyncMethod_echo() {
-      ::grpc::Service::MarkMethodAsync(15);
+      ::grpc::Service::MarkMethodAsync(22);
     }
     ~WithAsyncMethod_echo() override {
       BaseClassMustBeDerivedFromService(this);
@@ -881,10 +1235,10 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void Requestecho(::grpc::ServerContext* context, ::Matrix* request, ::grpc::ServerAsyncResponseWriter< ::Matrix>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(15, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(22, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
-  typedef WithAsyncMethod_status<WithAsyncMethod_detect<WithAsyncMethod_extract<WithAsyncMethod_score<WithAsyncMethod_enroll<WithAsyncMethod_search<WithAsyncMethod_detectExtract<WithAsyncMethod_detectExtractEnroll<WithAsyncMethod_detectExtractSearch<WithAsyncMethod_galleryList<WithAsyncMethod_galleryDelete<WithAsyncMethod_enrollmentList<WithAsyncMethod_enrollmentDelete<WithAsyncMethod_enrollmentDeleteConditional<WithAsyncMethod_enrollmentTransfer<WithAsyncMethod_echo<Service > > > > > > > > > > > > > > > > AsyncService;
+  typedef WithAsyncMethod_status<WithAsyncMethod_detect<WithAsyncMethod_extract<WithAsyncMethod_score<WithAsyncMethod_scoreStream<WithAsyncMethod_enroll<WithAsyncMethod_bulkEnroll<WithAsyncMethod_search<WithAsyncMethod_detectExtract<WithAsyncMethod_detectExtractEnroll<WithAsyncMethod_detectExtractSearch<WithAsyncMethod_galleryList<WithAsyncMethod_galleryDelete<WithAsyncMethod_galleryConfigure<WithAsyncMethod_galleryCompact<WithAsyncMethod_galleryExport<WithAsyncMethod_galleryImport<WithAsyncMethod_enrollmentList<WithAsyncMethod_trainFromGallery<WithAsyncMethod_subjectDelete<WithAsyncMethod_generateMatchDistribution<WithAsyncMethod_matchDistribution<WithAsyncMethod_echo<Service > > > > > > > > > > > > > > > > > > > > > > > AsyncService;
   template <class BaseClass>
   class ExperimentalWithCallbackMethod_status : public BaseClass {
    private:
@@ -986,18 +1340,38 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* score(::grpc::experimental::CallbackServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::Matrix* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
+  class ExperimentalWithCallbackMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_scoreStream() {
+      ::grpc::Service::experimental().MarkMethodCallback(4,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::ScoreRequest, ::ScoreBlock>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::ScoreRequest* request) { return this->scoreStream(context, request); }));
+    }
+    ~ExperimentalWithCallbackMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerWriteReactor< ::ScoreBlock>* scoreStream(::grpc::experimental::CallbackServerContext* /*context*/, const ::ScoreRequest* /*request*/) { return nullptr; }
+  };
+  template <class BaseClass>
   class ExperimentalWithCallbackMethod_enroll : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_enroll() {
-      ::grpc::Service::experimental().MarkMethodCallback(4,
+      ::grpc::Service::experimental().MarkMethodCallback(5,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollRequest, ::FaceRecordList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollRequest* request, ::FaceRecordList* response) { return this->enroll(context, request, response); }));}
     void SetMessageAllocatorFor_enroll(
         ::grpc::experimental::MessageAllocator< ::EnrollRequest, ::FaceRecordList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(4))
+          ::grpc::Service::experimental().GetHandler(5))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_enroll() override {
@@ -1011,18 +1385,38 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* enroll(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
+  class ExperimentalWithCallbackMethod_bulkEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_bulkEnroll() {
+      ::grpc::Service::experimental().MarkMethodCallback(6,
+        new ::grpc_impl::internal::CallbackClientStreamingHandler< ::EnrollRequest, ::BulkEnrollResponse>(
+          [this](::grpc::experimental::CallbackServerContext* context, ::BulkEnrollResponse* response) { return this->bulkEnroll(context, response); }));
+    }
+    ~ExperimentalWithCallbackMethod_bulkEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status bulkEnroll(::grpc::ServerContext* /*context*/, ::grpc::ServerReader< ::EnrollRequest>* /*reader*/, ::BulkEnrollResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerReadReactor< ::EnrollRequest>* bulkEnroll(::grpc::experimental::CallbackServerContext* /*context*/, ::BulkEnrollResponse* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
   class ExperimentalWithCallbackMethod_search : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_search() {
-      ::grpc::Service::experimental().MarkMethodCallback(5,
+      ::grpc::Service::experimental().MarkMethodCallback(7,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::SearchRequest, ::FaceRecordList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::SearchRequest* request, ::FaceRecordList* response) { return this->search(context, request, response); }));}
     void SetMessageAllocatorFor_search(
         ::grpc::experimental::MessageAllocator< ::SearchRequest, ::FaceRecordList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::SearchRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(5))
+          ::grpc::Service::experimental().GetHandler(7))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_search() override {
@@ -1041,13 +1435,13 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_detectExtract() {
-      ::grpc::Service::experimental().MarkMethodCallback(6,
+      ::grpc::Service::experimental().MarkMethodCallback(8,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractRequest, ::FaceRecordList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::DetectExtractRequest* request, ::FaceRecordList* response) { return this->detectExtract(context, request, response); }));}
     void SetMessageAllocatorFor_detectExtract(
         ::grpc::experimental::MessageAllocator< ::DetectExtractRequest, ::FaceRecordList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(6))
+          ::grpc::Service::experimental().GetHandler(8))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_detectExtract() override {
@@ -1066,13 +1460,13 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_detectExtractEnroll() {
-      ::grpc::Service::experimental().MarkMethodCallback(7,
+      ::grpc::Service::experimental().MarkMethodCallback(9,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractEnrollRequest, ::FaceRecordList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::DetectExtractEnrollRequest* request, ::FaceRecordList* response) { return this->detectExtractEnroll(context, request, response); }));}
     void SetMessageAllocatorFor_detectExtractEnroll(
         ::grpc::experimental::MessageAllocator< ::DetectExtractEnrollRequest, ::FaceRecordList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractEnrollRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(7))
+          ::grpc::Service::experimental().GetHandler(9))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_detectExtractEnroll() override {
@@ -1091,13 +1485,13 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_detectExtractSearch() {
-      ::grpc::Service::experimental().MarkMethodCallback(8,
+      ::grpc::Service::experimental().MarkMethodCallback(10,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractSearchRequest, ::FaceRecordList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::DetectExtractSearchRequest* request, ::FaceRecordList* response) { return this->detectExtractSearch(context, request, response); }));}
     void SetMessageAllocatorFor_detectExtractSearch(
         ::grpc::experimental::MessageAllocator< ::DetectExtractSearchRequest, ::FaceRecordList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::DetectExtractSearchRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(8))
+          ::grpc::Service::experimental().GetHandler(10))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_detectExtractSearch() override {
@@ -1116,13 +1510,13 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_galleryList() {
-      ::grpc::Service::experimental().MarkMethodCallback(9,
+      ::grpc::Service::experimental().MarkMethodCallback(11,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::GalleryListRequest, ::GalleryList>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::GalleryListRequest* request, ::GalleryList* response) { return this->galleryList(context, request, response); }));}
     void SetMessageAllocatorFor_galleryList(
         ::grpc::experimental::MessageAllocator< ::GalleryListRequest, ::GalleryList>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::GalleryListRequest, ::GalleryList>*>(
-          ::grpc::Service::experimental().GetHandler(9))
+          ::grpc::Service::experimental().GetHandler(11))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_galleryList() override {
@@ -1141,13 +1535,13 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithCallbackMethod_galleryDelete() {
-      ::grpc::Service::experimental().MarkMethodCallback(10,
+      ::grpc::Service::experimental().MarkMethodCallback(12,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::GalleryDeleteRequest, ::Empty>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::GalleryDeleteRequest* request, ::Empty* response) { return this->galleryDelete(context, request, response); }));}
     void SetMessageAllocatorFor_galleryDelete(
         ::grpc::experimental::MessageAllocator< ::GalleryDeleteRequest, ::Empty>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::GalleryDeleteRequest, ::Empty>*>(
-          ::grpc::Service::experimental().GetHandler(10))
+          ::grpc::Service::experimental().GetHandler(12))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_galleryDelete() override {
@@ -1161,118 +1555,228 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* galleryDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::GalleryDeleteRequest* /*request*/, ::Empty* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithCallbackMethod_enrollmentList : public BaseClass {
+  class ExperimentalWithCallbackMethod_galleryConfigure : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithCallbackMethod_enrollmentList() {
-      ::grpc::Service::experimental().MarkMethodCallback(11,
-        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::FaceRecordList>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response) { return this->enrollmentList(context, request, response); }));}
-    void SetMessageAllocatorFor_enrollmentList(
-        ::grpc::experimental::MessageAllocator< ::EnrollmentListRequest, ::FaceRecordList>* allocator) {
-      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(11))
+    ExperimentalWithCallbackMethod_galleryConfigure() {
+      ::grpc::Service::experimental().MarkMethodCallback(13,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::GalleryConfigureRequest, ::Empty>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::GalleryConfigureRequest* request, ::Empty* response) { return this->galleryConfigure(context, request, response); }));}
+    void SetMessageAllocatorFor_galleryConfigure(
+        ::grpc::experimental::MessageAllocator< ::GalleryConfigureRequest, ::Empty>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::GalleryConfigureRequest, ::Empty>*>(
+          ::grpc::Service::experimental().GetHandler(13))
               ->SetMessageAllocator(allocator);
     }
-    ~ExperimentalWithCallbackMethod_enrollmentList() override {
+    ~ExperimentalWithCallbackMethod_galleryConfigure() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentList(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentList(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerUnaryReactor* galleryConfigure(::grpc::experimental::CallbackServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithCallbackMethod_enrollmentDelete : public BaseClass {
+  class ExperimentalWithCallbackMethod_galleryCompact : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithCallbackMethod_enrollmentDelete() {
-      ::grpc::Service::experimental().MarkMethodCallback(12,
-        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) { return this->enrollmentDelete(context, request, response); }));}
-    void SetMessageAllocatorFor_enrollmentDelete(
-        ::grpc::experimental::MessageAllocator< ::EnrollmentDeleteRequest, ::FaceRecordList>* allocator) {
-      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(12))
+    ExperimentalWithCallbackMethod_galleryCompact() {
+      ::grpc::Service::experimental().MarkMethodCallback(14,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::GalleryCompactRequest, ::GalleryCompactResponse>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::GalleryCompactRequest* request, ::GalleryCompactResponse* response) { return this->galleryCompact(context, request, response); }));}
+    void SetMessageAllocatorFor_galleryCompact(
+        ::grpc::experimental::MessageAllocator< ::GalleryCompactRequest, ::GalleryCompactResponse>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::GalleryCompactRequest, ::GalleryCompactResponse>*>(
+          ::grpc::Service::experimental().GetHandler(14))
               ->SetMessageAllocator(allocator);
     }
-    ~ExperimentalWithCallbackMethod_enrollmentDelete() override {
+    ~ExperimentalWithCallbackMethod_galleryCompact() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerUnaryReactor* galleryCompact(::grpc::experimental::CallbackServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithCallbackMethod_enrollmentDeleteConditional : public BaseClass {
+  class ExperimentalWithCallbackMethod_galleryExport : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithCallbackMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::experimental().MarkMethodCallback(13,
-        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) { return this->enrollmentDeleteConditional(context, request, response); }));}
-    void SetMessageAllocatorFor_enrollmentDeleteConditional(
-        ::grpc::experimental::MessageAllocator< ::EnrollmentDeleteRequest, ::FaceRecordList>* allocator) {
-      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(13))
-              ->SetMessageAllocator(allocator);
+    ExperimentalWithCallbackMethod_galleryExport() {
+      ::grpc::Service::experimental().MarkMethodCallback(15,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::GalleryExportRequest, ::GalleryChunk>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::GalleryExportRequest* request) { return this->galleryExport(context, request); }));
     }
-    ~ExperimentalWithCallbackMethod_enrollmentDeleteConditional() override {
+    ~ExperimentalWithCallbackMethod_galleryExport() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentDeleteConditional(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerWriteReactor< ::GalleryChunk>* galleryExport(::grpc::experimental::CallbackServerContext* /*context*/, const ::GalleryExportRequest* /*request*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithCallbackMethod_enrollmentTransfer : public BaseClass {
+  class ExperimentalWithCallbackMethod_galleryImport : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithCallbackMethod_enrollmentTransfer() {
-      ::grpc::Service::experimental().MarkMethodCallback(14,
-        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentDeleteRequest* request, ::FaceRecordList* response) { return this->enrollmentTransfer(context, request, response); }));}
-    void SetMessageAllocatorFor_enrollmentTransfer(
-        ::grpc::experimental::MessageAllocator< ::EnrollmentDeleteRequest, ::FaceRecordList>* allocator) {
-      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>*>(
-          ::grpc::Service::experimental().GetHandler(14))
-              ->SetMessageAllocator(allocator);
+    ExperimentalWithCallbackMethod_galleryImport() {
+      ::grpc::Service::experimental().MarkMethodCallback(16,
+        new ::grpc_impl::internal::CallbackBidiHandler< ::GalleryChunk, ::GalleryImportResponse>(
+          [this](::grpc::experimental::CallbackServerContext* context) { return this->galleryImport(context); }));
     }
-    ~ExperimentalWithCallbackMethod_enrollmentTransfer() override {
+    ~ExperimentalWithCallbackMethod_galleryImport() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryImport(::grpc::ServerContext* /*context*/, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* /*stream*/)  override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentTransfer(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerBidiReactor< ::GalleryChunk, ::GalleryImportResponse>* galleryImport(::grpc::experimental::CallbackServerContext* /*context*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithCallbackMethod_echo : public BaseClass {
+  class ExperimentalWithCallbackMethod_enrollmentList : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithCallbackMethod_echo() {
-      ::grpc::Service::experimental().MarkMethodCallback(15,
-        new ::grpc_impl::internal::CallbackUnaryHandler< ::Matrix, ::Matrix>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::Matrix* request, ::Matrix* response) { return this->echo(context, request, response); }));}
-    void SetMessageAllocatorFor_echo(
-        ::grpc::experimental::MessageAllocator< ::Matrix, ::Matrix>* allocator) {
+    ExperimentalWithCallbackMethod_enrollmentList() {
+      ::grpc::Service::experimental().MarkMethodCallback(17,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::FaceRecordList>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentListRequest* request, ::FaceRecordList* response) { return this->enrollmentList(context, request, response); }));}
+    void SetMessageAllocatorFor_enrollmentList(
+        ::grpc::experimental::MessageAllocator< ::EnrollmentListRequest, ::FaceRecordList>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::FaceRecordList>*>(
+          ::grpc::Service::experimental().GetHandler(17))
+              ->SetMessageAllocator(allocator);
+    }
+    ~ExperimentalWithCallbackMethod_enrollmentList() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status enrollmentList(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentList(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithCallbackMethod_trainFromGallery : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_trainFromGallery() {
+      ::grpc::Service::experimental().MarkMethodCallback(18,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::Empty>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentListRequest* request, ::Empty* response) { return this->trainFromGallery(context, request, response); }));}
+    void SetMessageAllocatorFor_trainFromGallery(
+        ::grpc::experimental::MessageAllocator< ::EnrollmentListRequest, ::Empty>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::Empty>*>(
+          ::grpc::Service::experimental().GetHandler(18))
+              ->SetMessageAllocator(allocator);
+    }
+    ~ExperimentalWithCallbackMethod_trainFromGallery() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* trainFromGallery(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithCallbackMethod_subjectDelete : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_subjectDelete() {
+      ::grpc::Service::experimental().MarkMethodCallback(19,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::EnrollmentDeleteResponse>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentDeleteRequest* request, ::EnrollmentDeleteResponse* response) { return this->subjectDelete(context, request, response); }));}
+    void SetMessageAllocatorFor_subjectDelete(
+        ::grpc::experimental::MessageAllocator< ::EnrollmentDeleteRequest, ::EnrollmentDeleteResponse>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentDeleteRequest, ::EnrollmentDeleteResponse>*>(
+          ::grpc::Service::experimental().GetHandler(19))
+              ->SetMessageAllocator(allocator);
+    }
+    ~ExperimentalWithCallbackMethod_subjectDelete() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* subjectDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithCallbackMethod_generateMatchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_generateMatchDistribution() {
+      ::grpc::Service::experimental().MarkMethodCallback(20,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::Matrix>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::EnrollmentListRequest* request, ::Matrix* response) { return this->generateMatchDistribution(context, request, response); }));}
+    void SetMessageAllocatorFor_generateMatchDistribution(
+        ::grpc::experimental::MessageAllocator< ::EnrollmentListRequest, ::Matrix>* allocator) {
+      static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::EnrollmentListRequest, ::Matrix>*>(
+          ::grpc::Service::experimental().GetHandler(20))
+              ->SetMessageAllocator(allocator);
+    }
+    ~ExperimentalWithCallbackMethod_generateMatchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* generateMatchDistribution(::grpc::experimental::CallbackServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithCallbackMethod_matchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_matchDistribution() {
+      ::grpc::Service::experimental().MarkMethodCallback(21,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::MatchDistributionRequest, ::MatchDistribution>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::MatchDistributionRequest* request) { return this->matchDistribution(context, request); }));
+    }
+    ~ExperimentalWithCallbackMethod_matchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerWriteReactor< ::MatchDistribution>* matchDistribution(::grpc::experimental::CallbackServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithCallbackMethod_echo : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithCallbackMethod_echo() {
+      ::grpc::Service::experimental().MarkMethodCallback(22,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::Matrix, ::Matrix>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::Matrix* request, ::Matrix* response) { return this->echo(context, request, response); }));}
+    void SetMessageAllocatorFor_echo(
+        ::grpc::experimental::MessageAllocator< ::Matrix, ::Matrix>* allocator) {
       static_cast<::grpc_impl::internal::CallbackUnaryHandler< ::Matrix, ::Matrix>*>(
-          ::grpc::Service::experimental().GetHandler(15))
+          ::grpc::Service::experimental().GetHandler(22))
               ->SetMessageAllocator(allocator);
     }
     ~ExperimentalWithCallbackMethod_echo() override {
@@ -1285,7 +1789,7 @@ class FaceRecognition final {
     }
     virtual ::grpc::experimental::ServerUnaryReactor* echo(::grpc::experimental::CallbackServerContext* /*context*/, const ::Matrix* /*request*/, ::Matrix* /*response*/) { return nullptr; }
   };
-  typedef ExperimentalWithCallbackMethod_status<ExperimentalWithCallbackMethod_detect<ExperimentalWithCallbackMethod_extract<ExperimentalWithCallbackMethod_score<ExperimentalWithCallbackMethod_enroll<ExperimentalWithCallbackMethod_search<ExperimentalWithCallbackMethod_detectExtract<ExperimentalWithCallbackMethod_detectExtractEnroll<ExperimentalWithCallbackMethod_detectExtractSearch<ExperimentalWithCallbackMethod_galleryList<ExperimentalWithCallbackMethod_galleryDelete<ExperimentalWithCallbackMethod_enrollmentList<ExperimentalWithCallbackMethod_enrollmentDelete<ExperimentalWithCallbackMethod_enrollmentDeleteConditional<ExperimentalWithCallbackMethod_enrollmentTransfer<ExperimentalWithCallbackMethod_echo<Service > > > > > > > > > > > > > > > > ExperimentalCallbackService;
+  typedef ExperimentalWithCallbackMethod_status<ExperimentalWithCallbackMethod_detect<ExperimentalWithCallbackMethod_extract<ExperimentalWithCallbackMethod_score<ExperimentalWithCallbackMethod_scoreStream<ExperimentalWithCallbackMethod_enroll<ExperimentalWithCallbackMethod_bulkEnroll<ExperimentalWithCallbackMethod_search<ExperimentalWithCallbackMethod_detectExtract<ExperimentalWithCallbackMethod_detectExtractEnroll<ExperimentalWithCallbackMethod_detectExtractSearch<ExperimentalWithCallbackMethod_galleryList<ExperimentalWithCallbackMethod_galleryDelete<ExperimentalWithCallbackMethod_galleryConfigure<ExperimentalWithCallbackMethod_galleryCompact<ExperimentalWithCallbackMethod_galleryExport<ExperimentalWithCallbackMethod_galleryImport<ExperimentalWithCallbackMethod_enrollmentList<ExperimentalWithCallbackMethod_trainFromGallery<ExperimentalWithCallbackMethod_subjectDelete<ExperimentalWithCallbackMethod_generateMatchDistribution<ExperimentalWithCallbackMethod_matchDistribution<ExperimentalWithCallbackMethod_echo<Service > > > > > > > > > > > > > > > > > > > > > > > ExperimentalCallbackService;
   template <class BaseClass>
   class WithGenericMethod_status : public BaseClass {
    private:
@@ -1355,12 +1859,29 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
+  class WithGenericMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_scoreStream() {
+      ::grpc::Service::MarkMethodGeneric(4);
+    }
+    ~WithGenericMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
   class WithGenericMethod_enroll : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_enroll() {
-      ::grpc::Service::MarkMethodGeneric(4);
+      ::grpc::Service::MarkMethodGeneric(5);
     }
     ~WithGenericMethod_enroll() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1372,12 +1893,29 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
+  class WithGenericMethod_bulkEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_bulkEnroll() {
+      ::grpc::Service::MarkMethodGeneric(6);
+    }
+    ~WithGenericMethod_bulkEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status bulkEnroll(::grpc::ServerContext* /*context*/, ::grpc::ServerReader< ::EnrollRequest>* /*reader*/, ::BulkEnrollResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
   class WithGenericMethod_search : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_search() {
-      ::grpc::Service::MarkMethodGeneric(5);
+      ::grpc::Service::MarkMethodGeneric(7);
     }
     ~WithGenericMethod_search() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1394,7 +1932,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_detectExtract() {
-      ::grpc::Service::MarkMethodGeneric(6);
+      ::grpc::Service::MarkMethodGeneric(8);
     }
     ~WithGenericMethod_detectExtract() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1411,7 +1949,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_detectExtractEnroll() {
-      ::grpc::Service::MarkMethodGeneric(7);
+      ::grpc::Service::MarkMethodGeneric(9);
     }
     ~WithGenericMethod_detectExtractEnroll() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1428,7 +1966,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_detectExtractSearch() {
-      ::grpc::Service::MarkMethodGeneric(8);
+      ::grpc::Service::MarkMethodGeneric(10);
     }
     ~WithGenericMethod_detectExtractSearch() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1445,7 +1983,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_galleryList() {
-      ::grpc::Service::MarkMethodGeneric(9);
+      ::grpc::Service::MarkMethodGeneric(11);
     }
     ~WithGenericMethod_galleryList() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1462,7 +2000,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_galleryDelete() {
-      ::grpc::Service::MarkMethodGeneric(10);
+      ::grpc::Service::MarkMethodGeneric(12);
     }
     ~WithGenericMethod_galleryDelete() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1474,12 +2012,80 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
+  class WithGenericMethod_galleryConfigure : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_galleryConfigure() {
+      ::grpc::Service::MarkMethodGeneric(13);
+    }
+    ~WithGenericMethod_galleryConfigure() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_galleryCompact : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_galleryCompact() {
+      ::grpc::Service::MarkMethodGeneric(14);
+    }
+    ~WithGenericMethod_galleryCompact() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_galleryExport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_galleryExport() {
+      ::grpc::Service::MarkMethodGeneric(15);
+    }
+    ~WithGenericMethod_galleryExport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_galleryImport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_galleryImport() {
+      ::grpc::Service::MarkMethodGeneric(16);
+    }
+    ~WithGenericMethod_galleryImport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryImport(::grpc::ServerContext* /*context*/, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* /*stream*/)  override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
   class WithGenericMethod_enrollmentList : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_enrollmentList() {
-      ::grpc::Service::MarkMethodGeneric(11);
+      ::grpc::Service::MarkMethodGeneric(17);
     }
     ~WithGenericMethod_enrollmentList() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1491,52 +2097,69 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
-  class WithGenericMethod_enrollmentDelete : public BaseClass {
+  class WithGenericMethod_trainFromGallery : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_enrollmentDelete() {
-      ::grpc::Service::MarkMethodGeneric(12);
+    WithGenericMethod_trainFromGallery() {
+      ::grpc::Service::MarkMethodGeneric(18);
     }
-    ~WithGenericMethod_enrollmentDelete() override {
+    ~WithGenericMethod_trainFromGallery() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
   };
   template <class BaseClass>
-  class WithGenericMethod_enrollmentDeleteConditional : public BaseClass {
+  class WithGenericMethod_subjectDelete : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::MarkMethodGeneric(13);
+    WithGenericMethod_subjectDelete() {
+      ::grpc::Service::MarkMethodGeneric(19);
     }
-    ~WithGenericMethod_enrollmentDeleteConditional() override {
+    ~WithGenericMethod_subjectDelete() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
   };
   template <class BaseClass>
-  class WithGenericMethod_enrollmentTransfer : public BaseClass {
+  class WithGenericMethod_generateMatchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_enrollmentTransfer() {
-      ::grpc::Service::MarkMethodGeneric(14);
+    WithGenericMethod_generateMatchDistribution() {
+      ::grpc::Service::MarkMethodGeneric(20);
+    }
+    ~WithGenericMethod_generateMatchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    ~WithGenericMethod_enrollmentTransfer() override {
+  };
+  template <class BaseClass>
+  class WithGenericMethod_matchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_matchDistribution() {
+      ::grpc::Service::MarkMethodGeneric(21);
+    }
+    ~WithGenericMethod_matchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
@@ -1547,7 +2170,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithGenericMethod_echo() {
-      ::grpc::Service::MarkMethodGeneric(15);
+      ::grpc::Service::MarkMethodGeneric(22);
     }
     ~WithGenericMethod_echo() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1639,12 +2262,32 @@ class FaceRecognition final {
     }
   };
   template <class BaseClass>
+  class WithRawMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_scoreStream() {
+      ::grpc::Service::MarkMethodRaw(4);
+    }
+    ~WithRawMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestscoreStream(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncWriter< ::grpc::ByteBuffer>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(4, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
   class WithRawMethod_enroll : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithRawMethod_enroll() {
-      ::grpc::Service::MarkMethodRaw(4);
+      ::grpc::Service::MarkMethodRaw(5);
     }
     ~WithRawMethod_enroll() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1655,7 +2298,27 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void Requestenroll(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(4, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_bulkEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_bulkEnroll() {
+      ::grpc::Service::MarkMethodRaw(6);
+    }
+    ~WithRawMethod_bulkEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status bulkEnroll(::grpc::ServerContext* /*context*/, ::grpc::ServerReader< ::EnrollRequest>* /*reader*/, ::BulkEnrollResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestbulkEnroll(::grpc::ServerContext* context, ::grpc::ServerAsyncReader< ::grpc::ByteBuffer, ::grpc::ByteBuffer>* reader, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncClientStreaming(6, context, reader, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -1664,7 +2327,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithRawMethod_search() {
-      ::grpc::Service::MarkMethodRaw(5);
+      ::grpc::Service::MarkMethodRaw(7);
     }
     ~WithRawMethod_search() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1674,188 +2337,288 @@ class FaceRecognition final {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void Requestsearch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+    void Requestsearch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(7, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_detectExtract : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_detectExtract() {
+      ::grpc::Service::MarkMethodRaw(8);
+    }
+    ~WithRawMethod_detectExtract() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status detectExtract(::grpc::ServerContext* /*context*/, const ::DetectExtractRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestdetectExtract(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(8, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_detectExtractEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_detectExtractEnroll() {
+      ::grpc::Service::MarkMethodRaw(9);
+    }
+    ~WithRawMethod_detectExtractEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status detectExtractEnroll(::grpc::ServerContext* /*context*/, const ::DetectExtractEnrollRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestdetectExtractEnroll(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(9, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_detectExtractSearch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_detectExtractSearch() {
+      ::grpc::Service::MarkMethodRaw(10);
+    }
+    ~WithRawMethod_detectExtractSearch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status detectExtractSearch(::grpc::ServerContext* /*context*/, const ::DetectExtractSearchRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestdetectExtractSearch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(10, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_galleryList : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_galleryList() {
+      ::grpc::Service::MarkMethodRaw(11);
+    }
+    ~WithRawMethod_galleryList() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryList(::grpc::ServerContext* /*context*/, const ::GalleryListRequest* /*request*/, ::GalleryList* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryList(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(11, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_galleryDelete : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_galleryDelete() {
+      ::grpc::Service::MarkMethodRaw(12);
+    }
+    ~WithRawMethod_galleryDelete() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryDelete(::grpc::ServerContext* /*context*/, const ::GalleryDeleteRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestgalleryDelete(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(12, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_detectExtract : public BaseClass {
+  class WithRawMethod_galleryConfigure : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_detectExtract() {
-      ::grpc::Service::MarkMethodRaw(6);
+    WithRawMethod_galleryConfigure() {
+      ::grpc::Service::MarkMethodRaw(13);
     }
-    ~WithRawMethod_detectExtract() override {
+    ~WithRawMethod_galleryConfigure() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status detectExtract(::grpc::ServerContext* /*context*/, const ::DetectExtractRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestdetectExtract(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(6, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgalleryConfigure(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(13, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_detectExtractEnroll : public BaseClass {
+  class WithRawMethod_galleryCompact : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_detectExtractEnroll() {
-      ::grpc::Service::MarkMethodRaw(7);
+    WithRawMethod_galleryCompact() {
+      ::grpc::Service::MarkMethodRaw(14);
     }
-    ~WithRawMethod_detectExtractEnroll() override {
+    ~WithRawMethod_galleryCompact() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status detectExtractEnroll(::grpc::ServerContext* /*context*/, const ::DetectExtractEnrollRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestdetectExtractEnroll(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(7, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgalleryCompact(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(14, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_detectExtractSearch : public BaseClass {
+  class WithRawMethod_galleryExport : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_detectExtractSearch() {
-      ::grpc::Service::MarkMethodRaw(8);
+    WithRawMethod_galleryExport() {
+      ::grpc::Service::MarkMethodRaw(15);
     }
-    ~WithRawMethod_detectExtractSearch() override {
+    ~WithRawMethod_galleryExport() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status detectExtractSearch(::grpc::ServerContext* /*context*/, const ::DetectExtractSearchRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestdetectExtractSearch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(8, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgalleryExport(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncWriter< ::grpc::ByteBuffer>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(15, context, request, writer, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_galleryList : public BaseClass {
+  class WithRawMethod_galleryImport : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_galleryList() {
-      ::grpc::Service::MarkMethodRaw(9);
+    WithRawMethod_galleryImport() {
+      ::grpc::Service::MarkMethodRaw(16);
     }
-    ~WithRawMethod_galleryList() override {
+    ~WithRawMethod_galleryImport() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status galleryList(::grpc::ServerContext* /*context*/, const ::GalleryListRequest* /*request*/, ::GalleryList* /*response*/) override {
+    ::grpc::Status galleryImport(::grpc::ServerContext* /*context*/, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* /*stream*/)  override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestgalleryList(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(9, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgalleryImport(::grpc::ServerContext* context, ::grpc::ServerAsyncReaderWriter< ::grpc::ByteBuffer, ::grpc::ByteBuffer>* stream, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncBidiStreaming(16, context, stream, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_galleryDelete : public BaseClass {
+  class WithRawMethod_enrollmentList : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_galleryDelete() {
-      ::grpc::Service::MarkMethodRaw(10);
+    WithRawMethod_enrollmentList() {
+      ::grpc::Service::MarkMethodRaw(17);
     }
-    ~WithRawMethod_galleryDelete() override {
+    ~WithRawMethod_enrollmentList() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status galleryDelete(::grpc::ServerContext* /*context*/, const ::GalleryDeleteRequest* /*request*/, ::Empty* /*response*/) override {
+    ::grpc::Status enrollmentList(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestgalleryDelete(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(10, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestenrollmentList(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(17, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_enrollmentList : public BaseClass {
+  class WithRawMethod_trainFromGallery : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_enrollmentList() {
-      ::grpc::Service::MarkMethodRaw(11);
+    WithRawMethod_trainFromGallery() {
+      ::grpc::Service::MarkMethodRaw(18);
     }
-    ~WithRawMethod_enrollmentList() override {
+    ~WithRawMethod_trainFromGallery() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentList(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentList(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(11, context, request, response, new_call_cq, notification_cq, tag);
+    void RequesttrainFromGallery(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(18, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_enrollmentDelete : public BaseClass {
+  class WithRawMethod_subjectDelete : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_enrollmentDelete() {
-      ::grpc::Service::MarkMethodRaw(12);
+    WithRawMethod_subjectDelete() {
+      ::grpc::Service::MarkMethodRaw(19);
     }
-    ~WithRawMethod_enrollmentDelete() override {
+    ~WithRawMethod_subjectDelete() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentDelete(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(12, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestsubjectDelete(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(19, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_enrollmentDeleteConditional : public BaseClass {
+  class WithRawMethod_generateMatchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::MarkMethodRaw(13);
+    WithRawMethod_generateMatchDistribution() {
+      ::grpc::Service::MarkMethodRaw(20);
     }
-    ~WithRawMethod_enrollmentDeleteConditional() override {
+    ~WithRawMethod_generateMatchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentDeleteConditional(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(13, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestgenerateMatchDistribution(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(20, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
-  class WithRawMethod_enrollmentTransfer : public BaseClass {
+  class WithRawMethod_matchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_enrollmentTransfer() {
-      ::grpc::Service::MarkMethodRaw(14);
+    WithRawMethod_matchDistribution() {
+      ::grpc::Service::MarkMethodRaw(21);
     }
-    ~WithRawMethod_enrollmentTransfer() override {
+    ~WithRawMethod_matchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestenrollmentTransfer(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(14, context, request, response, new_call_cq, notification_cq, tag);
+    void RequestmatchDistribution(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncWriter< ::grpc::ByteBuffer>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(21, context, request, writer, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -1864,7 +2627,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithRawMethod_echo() {
-      ::grpc::Service::MarkMethodRaw(15);
+      ::grpc::Service::MarkMethodRaw(22);
     }
     ~WithRawMethod_echo() override {
       BaseClassMustBeDerivedFromService(this);
@@ -1875,7 +2638,7 @@ class FaceRecognition final {
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     void Requestecho(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(15, context, request, response, new_call_cq, notification_cq, tag);
+      ::grpc::Service::RequestAsyncUnary(22, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
   template <class BaseClass>
@@ -1959,12 +2722,32 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* score(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_scoreStream() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(4,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, const::grpc::ByteBuffer* request) { return this->scoreStream(context, request); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerWriteReactor< ::grpc::ByteBuffer>* scoreStream(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/) { return nullptr; }
+  };
+  template <class BaseClass>
   class ExperimentalWithRawCallbackMethod_enroll : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_enroll() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(4,
+      ::grpc::Service::experimental().MarkMethodRawCallback(5,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->enroll(context, request, response); }));
     }
@@ -1979,12 +2762,32 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* enroll(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_bulkEnroll : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_bulkEnroll() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(6,
+        new ::grpc_impl::internal::CallbackClientStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, ::grpc::ByteBuffer* response) { return this->bulkEnroll(context, response); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_bulkEnroll() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status bulkEnroll(::grpc::ServerContext* /*context*/, ::grpc::ServerReader< ::EnrollRequest>* /*reader*/, ::BulkEnrollResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerReadReactor< ::grpc::ByteBuffer>* bulkEnroll(::grpc::experimental::CallbackServerContext* /*context*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
   class ExperimentalWithRawCallbackMethod_search : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_search() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(5,
+      ::grpc::Service::experimental().MarkMethodRawCallback(7,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->search(context, request, response); }));
     }
@@ -2004,7 +2807,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_detectExtract() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(6,
+      ::grpc::Service::experimental().MarkMethodRawCallback(8,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->detectExtract(context, request, response); }));
     }
@@ -2024,7 +2827,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_detectExtractEnroll() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(7,
+      ::grpc::Service::experimental().MarkMethodRawCallback(9,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->detectExtractEnroll(context, request, response); }));
     }
@@ -2044,7 +2847,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_detectExtractSearch() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(8,
+      ::grpc::Service::experimental().MarkMethodRawCallback(10,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->detectExtractSearch(context, request, response); }));
     }
@@ -2064,7 +2867,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_galleryList() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(9,
+      ::grpc::Service::experimental().MarkMethodRawCallback(11,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->galleryList(context, request, response); }));
     }
@@ -2084,7 +2887,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_galleryDelete() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(10,
+      ::grpc::Service::experimental().MarkMethodRawCallback(12,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->galleryDelete(context, request, response); }));
     }
@@ -2099,12 +2902,92 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* galleryDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_galleryConfigure : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_galleryConfigure() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(13,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->galleryConfigure(context, request, response); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_galleryConfigure() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* galleryConfigure(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_galleryCompact : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_galleryCompact() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(14,
+        new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->galleryCompact(context, request, response); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_galleryCompact() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* galleryCompact(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_galleryExport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_galleryExport() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(15,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, const::grpc::ByteBuffer* request) { return this->galleryExport(context, request); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_galleryExport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerWriteReactor< ::grpc::ByteBuffer>* galleryExport(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_galleryImport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_galleryImport() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(16,
+        new ::grpc_impl::internal::CallbackBidiHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context) { return this->galleryImport(context); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_galleryImport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status galleryImport(::grpc::ServerContext* /*context*/, ::grpc::ServerReaderWriter< ::GalleryImportResponse, ::GalleryChunk>* /*stream*/)  override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerBidiReactor< ::grpc::ByteBuffer, ::grpc::ByteBuffer>* galleryImport(::grpc::experimental::CallbackServerContext* /*context*/) { return nullptr; }
+  };
+  template <class BaseClass>
   class ExperimentalWithRawCallbackMethod_enrollmentList : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_enrollmentList() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(11,
+      ::grpc::Service::experimental().MarkMethodRawCallback(17,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->enrollmentList(context, request, response); }));
     }
@@ -2119,64 +3002,84 @@ class FaceRecognition final {
     virtual ::grpc::experimental::ServerUnaryReactor* enrollmentList(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithRawCallbackMethod_enrollmentDelete : public BaseClass {
+  class ExperimentalWithRawCallbackMethod_trainFromGallery : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithRawCallbackMethod_enrollmentDelete() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(12,
+    ExperimentalWithRawCallbackMethod_trainFromGallery() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(18,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->enrollmentDelete(context, request, response); }));
+          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->trainFromGallery(context, request, response); }));
     }
-    ~ExperimentalWithRawCallbackMethod_enrollmentDelete() override {
+    ~ExperimentalWithRawCallbackMethod_trainFromGallery() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerUnaryReactor* trainFromGallery(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithRawCallbackMethod_enrollmentDeleteConditional : public BaseClass {
+  class ExperimentalWithRawCallbackMethod_subjectDelete : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithRawCallbackMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(13,
+    ExperimentalWithRawCallbackMethod_subjectDelete() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(19,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->enrollmentDeleteConditional(context, request, response); }));
+          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->subjectDelete(context, request, response); }));
     }
-    ~ExperimentalWithRawCallbackMethod_enrollmentDeleteConditional() override {
+    ~ExperimentalWithRawCallbackMethod_subjectDelete() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentDeleteConditional(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerUnaryReactor* subjectDelete(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
   };
   template <class BaseClass>
-  class ExperimentalWithRawCallbackMethod_enrollmentTransfer : public BaseClass {
+  class ExperimentalWithRawCallbackMethod_generateMatchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    ExperimentalWithRawCallbackMethod_enrollmentTransfer() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(14,
+    ExperimentalWithRawCallbackMethod_generateMatchDistribution() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(20,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
-          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->enrollmentTransfer(context, request, response); }));
+          [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->generateMatchDistribution(context, request, response); }));
+    }
+    ~ExperimentalWithRawCallbackMethod_generateMatchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::experimental::ServerUnaryReactor* generateMatchDistribution(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+  };
+  template <class BaseClass>
+  class ExperimentalWithRawCallbackMethod_matchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    ExperimentalWithRawCallbackMethod_matchDistribution() {
+      ::grpc::Service::experimental().MarkMethodRawCallback(21,
+        new ::grpc_impl::internal::CallbackServerStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+          [this](::grpc::experimental::CallbackServerContext* context, const::grpc::ByteBuffer* request) { return this->matchDistribution(context, request); }));
     }
-    ~ExperimentalWithRawCallbackMethod_enrollmentTransfer() override {
+    ~ExperimentalWithRawCallbackMethod_matchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    virtual ::grpc::experimental::ServerUnaryReactor* enrollmentTransfer(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/) { return nullptr; }
+    virtual ::grpc::experimental::ServerWriteReactor< ::grpc::ByteBuffer>* matchDistribution(::grpc::experimental::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/) { return nullptr; }
   };
   template <class BaseClass>
   class ExperimentalWithRawCallbackMethod_echo : public BaseClass {
@@ -2184,7 +3087,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     ExperimentalWithRawCallbackMethod_echo() {
-      ::grpc::Service::experimental().MarkMethodRawCallback(15,
+      ::grpc::Service::experimental().MarkMethodRawCallback(22,
         new ::grpc_impl::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
           [this](::grpc::experimental::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->echo(context, request, response); }));
     }
@@ -2284,7 +3187,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_enroll() {
-      ::grpc::Service::MarkMethodStreamed(4,
+      ::grpc::Service::MarkMethodStreamed(5,
         new ::grpc::internal::StreamedUnaryHandler< ::EnrollRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_enroll<BaseClass>::Streamedenroll, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_enroll() override {
@@ -2304,7 +3207,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_search() {
-      ::grpc::Service::MarkMethodStreamed(5,
+      ::grpc::Service::MarkMethodStreamed(7,
         new ::grpc::internal::StreamedUnaryHandler< ::SearchRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_search<BaseClass>::Streamedsearch, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_search() override {
@@ -2324,7 +3227,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_detectExtract() {
-      ::grpc::Service::MarkMethodStreamed(6,
+      ::grpc::Service::MarkMethodStreamed(8,
         new ::grpc::internal::StreamedUnaryHandler< ::DetectExtractRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_detectExtract<BaseClass>::StreameddetectExtract, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_detectExtract() override {
@@ -2344,7 +3247,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_detectExtractEnroll() {
-      ::grpc::Service::MarkMethodStreamed(7,
+      ::grpc::Service::MarkMethodStreamed(9,
         new ::grpc::internal::StreamedUnaryHandler< ::DetectExtractEnrollRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_detectExtractEnroll<BaseClass>::StreameddetectExtractEnroll, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_detectExtractEnroll() override {
@@ -2364,7 +3267,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_detectExtractSearch() {
-      ::grpc::Service::MarkMethodStreamed(8,
+      ::grpc::Service::MarkMethodStreamed(10,
         new ::grpc::internal::StreamedUnaryHandler< ::DetectExtractSearchRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_detectExtractSearch<BaseClass>::StreameddetectExtractSearch, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_detectExtractSearch() override {
@@ -2384,7 +3287,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_galleryList() {
-      ::grpc::Service::MarkMethodStreamed(9,
+      ::grpc::Service::MarkMethodStreamed(11,
         new ::grpc::internal::StreamedUnaryHandler< ::GalleryListRequest, ::GalleryList>(std::bind(&WithStreamedUnaryMethod_galleryList<BaseClass>::StreamedgalleryList, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_galleryList() override {
@@ -2404,7 +3307,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_galleryDelete() {
-      ::grpc::Service::MarkMethodStreamed(10,
+      ::grpc::Service::MarkMethodStreamed(12,
         new ::grpc::internal::StreamedUnaryHandler< ::GalleryDeleteRequest, ::Empty>(std::bind(&WithStreamedUnaryMethod_galleryDelete<BaseClass>::StreamedgalleryDelete, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_galleryDelete() override {
@@ -2419,12 +3322,52 @@ class FaceRecognition final {
     virtual ::grpc::Status StreamedgalleryDelete(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::GalleryDeleteRequest,::Empty>* server_unary_streamer) = 0;
   };
   template <class BaseClass>
+  class WithStreamedUnaryMethod_galleryConfigure : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_galleryConfigure() {
+      ::grpc::Service::MarkMethodStreamed(13,
+        new ::grpc::internal::StreamedUnaryHandler< ::GalleryConfigureRequest, ::Empty>(std::bind(&WithStreamedUnaryMethod_galleryConfigure<BaseClass>::StreamedgalleryConfigure, this, std::placeholders::_1, std::placeholders::_2)));
+    }
+    ~WithStreamedUnaryMethod_galleryConfigure() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status galleryConfigure(::grpc::ServerContext* /*context*/, const ::GalleryConfigureRequest* /*request*/, ::Empty* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedgalleryConfigure(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::GalleryConfigureRequest,::Empty>* server_unary_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_galleryCompact : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_galleryCompact() {
+      ::grpc::Service::MarkMethodStreamed(14,
+        new ::grpc::internal::StreamedUnaryHandler< ::GalleryCompactRequest, ::GalleryCompactResponse>(std::bind(&WithStreamedUnaryMethod_galleryCompact<BaseClass>::StreamedgalleryCompact, this, std::placeholders::_1, std::placeholders::_2)));
+    }
+    ~WithStreamedUnaryMethod_galleryCompact() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status galleryCompact(::grpc::ServerContext* /*context*/, const ::GalleryCompactRequest* /*request*/, ::GalleryCompactResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedgalleryCompact(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::GalleryCompactRequest,::GalleryCompactResponse>* server_unary_streamer) = 0;
+  };
+  template <class BaseClass>
   class WithStreamedUnaryMethod_enrollmentList : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_enrollmentList() {
-      ::grpc::Service::MarkMethodStreamed(11,
+      ::grpc::Service::MarkMethodStreamed(17,
         new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentListRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_enrollmentList<BaseClass>::StreamedenrollmentList, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_enrollmentList() override {
@@ -2439,64 +3382,64 @@ class FaceRecognition final {
     virtual ::grpc::Status StreamedenrollmentList(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentListRequest,::FaceRecordList>* server_unary_streamer) = 0;
   };
   template <class BaseClass>
-  class WithStreamedUnaryMethod_enrollmentDelete : public BaseClass {
+  class WithStreamedUnaryMethod_trainFromGallery : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithStreamedUnaryMethod_enrollmentDelete() {
-      ::grpc::Service::MarkMethodStreamed(12,
-        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_enrollmentDelete<BaseClass>::StreamedenrollmentDelete, this, std::placeholders::_1, std::placeholders::_2)));
+    WithStreamedUnaryMethod_trainFromGallery() {
+      ::grpc::Service::MarkMethodStreamed(18,
+        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentListRequest, ::Empty>(std::bind(&WithStreamedUnaryMethod_trainFromGallery<BaseClass>::StreamedtrainFromGallery, this, std::placeholders::_1, std::placeholders::_2)));
     }
-    ~WithStreamedUnaryMethod_enrollmentDelete() override {
+    ~WithStreamedUnaryMethod_trainFromGallery() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable regular version of this method
-    ::grpc::Status enrollmentDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status trainFromGallery(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Empty* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     // replace default version of method with streamed unary
-    virtual ::grpc::Status StreamedenrollmentDelete(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentDeleteRequest,::FaceRecordList>* server_unary_streamer) = 0;
+    virtual ::grpc::Status StreamedtrainFromGallery(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentListRequest,::Empty>* server_unary_streamer) = 0;
   };
   template <class BaseClass>
-  class WithStreamedUnaryMethod_enrollmentDeleteConditional : public BaseClass {
+  class WithStreamedUnaryMethod_subjectDelete : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithStreamedUnaryMethod_enrollmentDeleteConditional() {
-      ::grpc::Service::MarkMethodStreamed(13,
-        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_enrollmentDeleteConditional<BaseClass>::StreamedenrollmentDeleteConditional, this, std::placeholders::_1, std::placeholders::_2)));
+    WithStreamedUnaryMethod_subjectDelete() {
+      ::grpc::Service::MarkMethodStreamed(19,
+        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentDeleteRequest, ::EnrollmentDeleteResponse>(std::bind(&WithStreamedUnaryMethod_subjectDelete<BaseClass>::StreamedsubjectDelete, this, std::placeholders::_1, std::placeholders::_2)));
     }
-    ~WithStreamedUnaryMethod_enrollmentDeleteConditional() override {
+    ~WithStreamedUnaryMethod_subjectDelete() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable regular version of this method
-    ::grpc::Status enrollmentDeleteConditional(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status subjectDelete(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::EnrollmentDeleteResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     // replace default version of method with streamed unary
-    virtual ::grpc::Status StreamedenrollmentDeleteConditional(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentDeleteRequest,::FaceRecordList>* server_unary_streamer) = 0;
+    virtual ::grpc::Status StreamedsubjectDelete(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentDeleteRequest,::EnrollmentDeleteResponse>* server_unary_streamer) = 0;
   };
   template <class BaseClass>
-  class WithStreamedUnaryMethod_enrollmentTransfer : public BaseClass {
+  class WithStreamedUnaryMethod_generateMatchDistribution : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithStreamedUnaryMethod_enrollmentTransfer() {
-      ::grpc::Service::MarkMethodStreamed(14,
-        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentDeleteRequest, ::FaceRecordList>(std::bind(&WithStreamedUnaryMethod_enrollmentTransfer<BaseClass>::StreamedenrollmentTransfer, this, std::placeholders::_1, std::placeholders::_2)));
+    WithStreamedUnaryMethod_generateMatchDistribution() {
+      ::grpc::Service::MarkMethodStreamed(20,
+        new ::grpc::internal::StreamedUnaryHandler< ::EnrollmentListRequest, ::Matrix>(std::bind(&WithStreamedUnaryMethod_generateMatchDistribution<BaseClass>::StreamedgenerateMatchDistribution, this, std::placeholders::_1, std::placeholders::_2)));
     }
-    ~WithStreamedUnaryMethod_enrollmentTransfer() override {
+    ~WithStreamedUnaryMethod_generateMatchDistribution() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable regular version of this method
-    ::grpc::Status enrollmentTransfer(::grpc::ServerContext* /*context*/, const ::EnrollmentDeleteRequest* /*request*/, ::FaceRecordList* /*response*/) override {
+    ::grpc::Status generateMatchDistribution(::grpc::ServerContext* /*context*/, const ::EnrollmentListRequest* /*request*/, ::Matrix* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
     // replace default version of method with streamed unary
-    virtual ::grpc::Status StreamedenrollmentTransfer(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentDeleteRequest,::FaceRecordList>* server_unary_streamer) = 0;
+    virtual ::grpc::Status StreamedgenerateMatchDistribution(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::EnrollmentListRequest,::Matrix>* server_unary_streamer) = 0;
   };
   template <class BaseClass>
   class WithStreamedUnaryMethod_echo : public BaseClass {
@@ -2504,7 +3447,7 @@ class FaceRecognition final {
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
     WithStreamedUnaryMethod_echo() {
-      ::grpc::Service::MarkMethodStreamed(15,
+      ::grpc::Service::MarkMethodStreamed(22,
         new ::grpc::internal::StreamedUnaryHandler< ::Matrix, ::Matrix>(std::bind(&WithStreamedUnaryMethod_echo<BaseClass>::Streamedecho, this, std::placeholders::_1, std::placeholders::_2)));
     }
     ~WithStreamedUnaryMethod_echo() override {
@@ -2518,9 +3461,69 @@ class FaceRecognition final {
     // replace default version of method with streamed unary
     virtual ::grpc::Status Streamedecho(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::Matrix,::Matrix>* server_unary_streamer) = 0;
   };
-  typedef WithStreamedUnaryMethod_status<WithStreamedUnaryMethod_detect<WithStreamedUnaryMethod_extract<WithStreamedUnaryMethod_score<WithStreamedUnaryMethod_enroll<WithStreamedUnaryMethod_search<WithStreamedUnaryMethod_detectExtract<WithStreamedUnaryMethod_detectExtractEnroll<WithStreamedUnaryMethod_detectExtractSearch<WithStreamedUnaryMethod_galleryList<WithStreamedUnaryMethod_galleryDelete<WithStreamedUnaryMethod_enrollmentList<WithStreamedUnaryMethod_enrollmentDelete<WithStreamedUnaryMethod_enrollmentDeleteConditional<WithStreamedUnaryMethod_enrollmentTransfer<WithStreamedUnaryMethod_echo<Service > > > > > > > > > > > > > > > > StreamedUnaryService;
-  typedef Service SplitStreamedService;
-  typedef WithStreamedUnaryMethod_status<WithStreamedUnaryMethod_detect<WithStreamedUnaryMethod_extract<WithStreamedUnaryMethod_score<WithStreamedUnaryMethod_enroll<WithStreamedUnaryMethod_search<WithStreamedUnaryMethod_detectExtract<WithStreamedUnaryMethod_detectExtractEnroll<WithStreamedUnaryMethod_detectExtractSearch<WithStreamedUnaryMethod_galleryList<WithStreamedUnaryMethod_galleryDelete<WithStreamedUnaryMethod_enrollmentList<WithStreamedUnaryMethod_enrollmentDelete<WithStreamedUnaryMethod_enrollmentDeleteConditional<WithStreamedUnaryMethod_enrollmentTransfer<WithStreamedUnaryMethod_echo<Service > > > > > > > > > > > > > > > > StreamedService;
+  typedef WithStreamedUnaryMethod_status<WithStreamedUnaryMethod_detect<WithStreamedUnaryMethod_extract<WithStreamedUnaryMethod_score<WithStreamedUnaryMethod_enroll<WithStreamedUnaryMethod_search<WithStreamedUnaryMethod_detectExtract<WithStreamedUnaryMethod_detectExtractEnroll<WithStreamedUnaryMethod_detectExtractSearch<WithStreamedUnaryMethod_galleryList<WithStreamedUnaryMethod_galleryDelete<WithStreamedUnaryMethod_galleryConfigure<WithStreamedUnaryMethod_galleryCompact<WithStreamedUnaryMethod_enrollmentList<WithStreamedUnaryMethod_trainFromGallery<WithStreamedUnaryMethod_subjectDelete<WithStreamedUnaryMethod_generateMatchDistribution<WithStreamedUnaryMethod_echo<Service > > > > > > > > > > > > > > > > > > StreamedUnaryService;
+  template <class BaseClass>
+  class WithSplitStreamingMethod_scoreStream : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithSplitStreamingMethod_scoreStream() {
+      ::grpc::Service::MarkMethodStreamed(4,
+        new ::grpc::internal::SplitServerStreamingHandler< ::ScoreRequest, ::ScoreBlock>(std::bind(&WithSplitStreamingMethod_scoreStream<BaseClass>::StreamedscoreStream, this, std::placeholders::_1, std::placeholders::_2)));
+    }
+    ~WithSplitStreamingMethod_scoreStream() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status scoreStream(::grpc::ServerContext* /*context*/, const ::ScoreRequest* /*request*/, ::grpc::ServerWriter< ::ScoreBlock>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with split streamed
+    virtual ::grpc::Status StreamedscoreStream(::grpc::ServerContext* context, ::grpc::ServerSplitStreamer< ::ScoreRequest,::ScoreBlock>* server_split_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithSplitStreamingMethod_galleryExport : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithSplitStreamingMethod_galleryExport() {
+      ::grpc::Service::MarkMethodStreamed(15,
+        new ::grpc::internal::SplitServerStreamingHandler< ::GalleryExportRequest, ::GalleryChunk>(std::bind(&WithSplitStreamingMethod_galleryExport<BaseClass>::StreamedgalleryExport, this, std::placeholders::_1, std::placeholders::_2)));
+    }
+    ~WithSplitStreamingMethod_galleryExport() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status galleryExport(::grpc::ServerContext* /*context*/, const ::GalleryExportRequest* /*request*/, ::grpc::ServerWriter< ::GalleryChunk>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with split streamed
+    virtual ::grpc::Status StreamedgalleryExport(::grpc::ServerContext* context, ::grpc::ServerSplitStreamer< ::GalleryExportRequest,::GalleryChunk>* server_split_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithSplitStreamingMethod_matchDistribution : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithSplitStreamingMethod_matchDistribution() {
+      ::grpc::Service::MarkMethodStreamed(21,
+        new ::grpc::internal::SplitServerStreamingHandler< ::MatchDistributionRequest, ::MatchDistribution>(std::bind(&WithSplitStreamingMethod_matchDistribution<BaseClass>::StreamedmatchDistribution, this, std::placeholders::_1, std::placeholders::_2)));
+    }
+    ~WithSplitStreamingMethod_matchDistribution() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status matchDistribution(::grpc::ServerContext* /*context*/, const ::MatchDistributionRequest* /*request*/, ::grpc::ServerWriter< ::MatchDistribution>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with split streamed
+    virtual ::grpc::Status StreamedmatchDistribution(::grpc::ServerContext* context, ::grpc::ServerSplitStreamer< ::MatchDistributionRequest,::MatchDistribution>* server_split_streamer) = 0;
+  };
+  typedef WithSplitStreamingMethod_scoreStream<WithSplitStreamingMethod_galleryExport<WithSplitStreamingMethod_matchDistribution<Service > > > SplitStreamedService;
+  typedef WithStreamedUnaryMethod_status<WithStreamedUnaryMethod_detect<WithStreamedUnaryMethod_extract<WithStreamedUnaryMethod_score<WithSplitStreamingMethod_scoreStream<WithStreamedUnaryMethod_enroll<WithStreamedUnaryMethod_search<WithStreamedUnaryMethod_detectExtract<WithStreamedUnaryMethod_detectExtractEnroll<WithStreamedUnaryMethod_detectExtractSearch<WithStreamedUnaryMethod_galleryList<WithStreamedUnaryMethod_galleryDelete<WithStreamedUnaryMethod_galleryConfigure<WithStreamedUnaryMethod_galleryCompact<WithSplitStreamingMethod_galleryExport<WithStreamedUnaryMethod_enrollmentList<WithStreamedUnaryMethod_trainFromGallery<WithStreamedUnaryMethod_subjectDelete<WithStreamedUnaryMethod_generateMatchDistribution<WithSplitStreamingMethod_matchDistribution<WithStreamedUnaryMethod_echo<Service > > > > > > > > > > > > > > > > > > > > > StreamedService;
 };
 
 
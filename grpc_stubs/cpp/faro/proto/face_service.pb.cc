@@ -17,17 +17,20 @@
 #include <google/protobuf/port_def.inc>
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_AccessRecord_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<5> scc_info_Attribute_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<2> scc_info_DetectRequest_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<2> scc_info_Detection_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_DetectionOptions_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_EnrollOptions_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<2> scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_ErrorMessage_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_ExtractOptions_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<3> scc_info_ExtractRequest_faro_2fproto_2fface_5fservice_2eproto;
-extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<6> scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<7> scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryInfo_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fimage_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_Image_faro_2fproto_2fimage_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_Landmark_faro_2fproto_2fface_5fservice_2eproto;
@@ -35,7 +38,9 @@ extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fgeometry_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_Matrix_faro_2fproto_2fgeometry_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fgeometry_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_Point2D_faro_2fproto_2fgeometry_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fgeometry_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_Rect_faro_2fproto_2fgeometry_2eproto;
-extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto;
+extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<2> scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fface_5fservice_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_TemplateList_faro_2fproto_2fface_5fservice_2eproto;
 extern PROTOBUF_INTERNAL_EXPORT_faro_2fproto_2fgeometry_2eproto ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_Vector_faro_2fproto_2fgeometry_2eproto;
 class AttributeDefaultTypeInternal {
@@ -102,6 +107,10 @@ class FaceRecordListDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<FaceRecordList> _instance;
 } _FaceRecordList_default_instance_;
+class EnrollStatsDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<EnrollStats> _instance;
+} _EnrollStats_default_instance_;
 class VerificationRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<VerificationRequest> _instance;
@@ -114,6 +123,14 @@ class SearchRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<SearchRequest> _instance;
 } _SearchRequest_default_instance_;
+class AttributeFilterDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<AttributeFilter> _instance;
+} _AttributeFilter_default_instance_;
+class SearchFilterDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<SearchFilter> _instance;
+} _SearchFilter_default_instance_;
 class SearchResponseDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<SearchResponse> _instance;
@@ -122,6 +139,10 @@ class EnrollRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<EnrollRequest> _instance;
 } _EnrollRequest_default_instance_;
+class BulkEnrollResponseDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<BulkEnrollResponse> _instance;
+} _BulkEnrollResponse_default_instance_;
 class DetectRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<DetectRequest> _instance;
@@ -134,6 +155,18 @@ class ScoreRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<ScoreRequest> _instance;
 } _ScoreRequest_default_instance_;
+class ScoreBlockDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<ScoreBlock> _instance;
+} _ScoreBlock_default_instance_;
+class MatchDistributionRequestDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<MatchDistributionRequest> _instance;
+} _MatchDistributionRequest_default_instance_;
+class MatchDistributionDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<MatchDistribution> _instance;
+} _MatchDistribution_default_instance_;
 class DetectExtractRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<DetectExtractRequest> _instance;
@@ -154,6 +187,10 @@ class FaceServiceInfoDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<FaceServiceInfo> _instance;
 } _FaceServiceInfo_default_instance_;
+class GalleryCacheStatsDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryCacheStats> _instance;
+} _GalleryCacheStats_default_instance_;
 class GalleryListRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryListRequest> _instance;
@@ -162,6 +199,30 @@ class GalleryDeleteRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryDeleteRequest> _instance;
 } _GalleryDeleteRequest_default_instance_;
+class GalleryConfigureRequestDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryConfigureRequest> _instance;
+} _GalleryConfigureRequest_default_instance_;
+class GalleryCompactRequestDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryCompactRequest> _instance;
+} _GalleryCompactRequest_default_instance_;
+class GalleryCompactResponseDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryCompactResponse> _instance;
+} _GalleryCompactResponse_default_instance_;
+class GalleryExportRequestDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryExportRequest> _instance;
+} _GalleryExportRequest_default_instance_;
+class GalleryChunkDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryChunk> _instance;
+} _GalleryChunk_default_instance_;
+class GalleryImportResponseDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryImportResponse> _instance;
+} _GalleryImportResponse_default_instance_;
 class EnrollmentListRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<EnrollmentListRequest> _instance;
@@ -178,6 +239,10 @@ class EnrollmentDeleteRequestDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<EnrollmentDeleteRequest> _instance;
 } _EnrollmentDeleteRequest_default_instance_;
+class EnrollmentDeleteResponseDefaultTypeInternal {
+ public:
+  ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<EnrollmentDeleteResponse> _instance;
+} _EnrollmentDeleteResponse_default_instance_;
 class GalleryInfoDefaultTypeInternal {
  public:
   ::PROTOBUF_NAMESPACE_ID::internal::ExplicitlyConstructed<GalleryInfo> _instance;
@@ -224,6 +289,34 @@ static void InitDefaultsscc_info_Attribute_faro_2fproto_2fface_5fservice_2eproto
       &scc_info_Point2D_faro_2fproto_2fgeometry_2eproto.base,
       &scc_info_Rect_faro_2fproto_2fgeometry_2eproto.base,}};
 
+static void InitDefaultsscc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_AttributeFilter_default_instance_;
+    new (ptr) ::AttributeFilter();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::AttributeFilter::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
+static void InitDefaultsscc_info_BulkEnrollResponse_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_BulkEnrollResponse_default_instance_;
+    new (ptr) ::BulkEnrollResponse();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::BulkEnrollResponse::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_BulkEnrollResponse_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_BulkEnrollResponse_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -382,6 +475,20 @@ static void InitDefaultsscc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2ep
       &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,
       &scc_info_EnrollOptions_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
+static void InitDefaultsscc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_EnrollStats_default_instance_;
+    new (ptr) ::EnrollStats();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::EnrollStats::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -396,6 +503,20 @@ static void InitDefaultsscc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fs
 ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto =
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
 
+static void InitDefaultsscc_info_EnrollmentDeleteResponse_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_EnrollmentDeleteResponse_default_instance_;
+    new (ptr) ::EnrollmentDeleteResponse();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::EnrollmentDeleteResponse::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_EnrollmentDeleteResponse_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_EnrollmentDeleteResponse_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -502,14 +623,15 @@ static void InitDefaultsscc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eprot
   ::FaceRecordList::InitAsDefaultInstance();
 }
 
-::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<6> scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto =
-    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 6, InitDefaultsscc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto}, {
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<7> scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 7, InitDefaultsscc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto}, {
       &scc_info_Attribute_faro_2fproto_2fface_5fservice_2eproto.base,
       &scc_info_AccessRecord_faro_2fproto_2fface_5fservice_2eproto.base,
       &scc_info_Image_faro_2fproto_2fimage_2eproto.base,
       &scc_info_Detection_faro_2fproto_2fface_5fservice_2eproto.base,
       &scc_info_Landmark_faro_2fproto_2fface_5fservice_2eproto.base,
-      &scc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto.base,}};
+      &scc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto.base,
+      &scc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
 static void InitDefaultsscc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
@@ -522,8 +644,9 @@ static void InitDefaultsscc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2
   ::FaceServiceInfo::InitAsDefaultInstance();
 }
 
-::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto =
-    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto}, {}};
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto}, {
+      &scc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
 static void InitDefaultsscc_info_FaceStatusRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
@@ -554,6 +677,77 @@ static void InitDefaultsscc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2epr
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto}, {
       &scc_info_Vector_faro_2fproto_2fgeometry_2eproto.base,}};
 
+static void InitDefaultsscc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryCacheStats_default_instance_;
+    new (ptr) ::GalleryCacheStats();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryCacheStats::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
+static void InitDefaultsscc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryChunk_default_instance_;
+    new (ptr) ::GalleryChunk();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryChunk::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto}, {
+      &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,}};
+
+static void InitDefaultsscc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryCompactRequest_default_instance_;
+    new (ptr) ::GalleryCompactRequest();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryCompactRequest::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
+static void InitDefaultsscc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryCompactResponse_default_instance_;
+    new (ptr) ::GalleryCompactResponse();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryCompactResponse::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
+static void InitDefaultsscc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryConfigureRequest_default_instance_;
+    new (ptr) ::GalleryConfigureRequest();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryConfigureRequest::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -568,6 +762,34 @@ static void InitDefaultsscc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fserv
 ::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto =
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
 
+static void InitDefaultsscc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryExportRequest_default_instance_;
+    new (ptr) ::GalleryExportRequest();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryExportRequest::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
+static void InitDefaultsscc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_GalleryImportResponse_default_instance_;
+    new (ptr) ::GalleryImportResponse();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::GalleryImportResponse::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_GalleryInfo_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -626,6 +848,35 @@ static void InitDefaultsscc_info_Landmark_faro_2fproto_2fface_5fservice_2eproto(
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_Landmark_faro_2fproto_2fface_5fservice_2eproto}, {
       &scc_info_Point2D_faro_2fproto_2fgeometry_2eproto.base,}};
 
+static void InitDefaultsscc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_MatchDistribution_default_instance_;
+    new (ptr) ::MatchDistribution();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::MatchDistribution::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto}, {
+      &scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto.base,}};
+
+static void InitDefaultsscc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_MatchDistributionRequest_default_instance_;
+    new (ptr) ::MatchDistributionRequest();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::MatchDistributionRequest::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_MatchInfo_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -656,6 +907,20 @@ static void InitDefaultsscc_info_MatchList_faro_2fproto_2fface_5fservice_2eproto
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_MatchList_faro_2fproto_2fface_5fservice_2eproto}, {
       &scc_info_MatchInfo_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
+static void InitDefaultsscc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_ScoreBlock_default_instance_;
+    new (ptr) ::ScoreBlock();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::ScoreBlock::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<0> scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 0, InitDefaultsscc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto}, {}};
+
 static void InitDefaultsscc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -672,6 +937,21 @@ static void InitDefaultsscc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2epr
       &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,
       &scc_info_TemplateList_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
+static void InitDefaultsscc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto() {
+  GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+  {
+    void* ptr = &::_SearchFilter_default_instance_;
+    new (ptr) ::SearchFilter();
+    ::PROTOBUF_NAMESPACE_ID::internal::OnShutdownDestroyMessage(ptr);
+  }
+  ::SearchFilter::InitAsDefaultInstance();
+}
+
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto}, {
+      &scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto.base,}};
+
 static void InitDefaultsscc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
@@ -683,9 +963,10 @@ static void InitDefaultsscc_info_SearchRequest_faro_2fproto_2fface_5fservice_2ep
   ::SearchRequest::InitAsDefaultInstance();
 }
 
-::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<1> scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto =
-    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto}, {
-      &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,}};
+::PROTOBUF_NAMESPACE_ID::internal::SCCInfo<2> scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto =
+    {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 2, InitDefaultsscc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto}, {
+      &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,
+      &scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
 static void InitDefaultsscc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
@@ -764,7 +1045,7 @@ static void InitDefaultsscc_info_VerificationResponse_faro_2fproto_2fface_5fserv
     {{ATOMIC_VAR_INIT(::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase::kUninitialized), 1, InitDefaultsscc_info_VerificationResponse_faro_2fproto_2fface_5fservice_2eproto}, {
       &scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base,}};
 
-static ::PROTOBUF_NAMESPACE_ID::Metadata file_level_metadata_faro_2fproto_2fface_5fservice_2eproto[38];
+static ::PROTOBUF_NAMESPACE_ID::Metadata file_level_metadata_faro_2fproto_2fface_5fservice_2eproto[53];
 static const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* file_level_enum_descriptors_faro_2fproto_2fface_5fservice_2eproto[3];
 static constexpr ::PROTOBUF_NAMESPACE_ID::ServiceDescriptor const** file_level_service_descriptors_faro_2fproto_2fface_5fservice_2eproto = nullptr;
 
@@ -826,6 +1107,7 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::DetectionOptions, min_size_),
   PROTOBUF_FIELD_OFFSET(::DetectionOptions, save_request_),
   PROTOBUF_FIELD_OFFSET(::DetectionOptions, debug_),
+  PROTOBUF_FIELD_OFFSET(::DetectionOptions, downsample_),
   PROTOBUF_FIELD_OFFSET(::DetectionOptions, attributes_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::ExtractOptions, _internal_metadata_),
@@ -844,6 +1126,8 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::EnrollOptions, save_request_),
   PROTOBUF_FIELD_OFFSET(::EnrollOptions, debug_),
   PROTOBUF_FIELD_OFFSET(::EnrollOptions, attributes_),
+  PROTOBUF_FIELD_OFFSET(::EnrollOptions, dedup_distance_),
+  PROTOBUF_FIELD_OFFSET(::EnrollOptions, dedup_merge_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::DetectionList, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -886,6 +1170,7 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   ~0u,  // no _weak_field_map_
   PROTOBUF_FIELD_OFFSET(::FaceTemplate, data_),
   PROTOBUF_FIELD_OFFSET(::FaceTemplate, buffer_),
+  PROTOBUF_FIELD_OFFSET(::FaceTemplate, algorithm_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::TemplateList, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -910,6 +1195,7 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::FaceRecord, name_),
   PROTOBUF_FIELD_OFFSET(::FaceRecord, source_),
   PROTOBUF_FIELD_OFFSET(::FaceRecord, frame_),
+  PROTOBUF_FIELD_OFFSET(::FaceRecord, algorithm_),
   PROTOBUF_FIELD_OFFSET(::FaceRecord, notes_),
   PROTOBUF_FIELD_OFFSET(::FaceRecord, gallery_key_),
   PROTOBUF_FIELD_OFFSET(::FaceRecord, collection_date_),
@@ -931,6 +1217,16 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   ~0u,  // no _oneof_case_
   ~0u,  // no _weak_field_map_
   PROTOBUF_FIELD_OFFSET(::FaceRecordList, face_records_),
+  PROTOBUF_FIELD_OFFSET(::FaceRecordList, enroll_stats_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::EnrollStats, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::EnrollStats, enroll_count_),
+  PROTOBUF_FIELD_OFFSET(::EnrollStats, replace_count_),
+  PROTOBUF_FIELD_OFFSET(::EnrollStats, skip_count_),
+  PROTOBUF_FIELD_OFFSET(::EnrollStats, merge_count_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::VerificationRequest, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -958,6 +1254,29 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::SearchRequest, probes_),
   PROTOBUF_FIELD_OFFSET(::SearchRequest, max_results_),
   PROTOBUF_FIELD_OFFSET(::SearchRequest, threshold_),
+  PROTOBUF_FIELD_OFFSET(::SearchRequest, nprobe_),
+  PROTOBUF_FIELD_OFFSET(::SearchRequest, filter_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::AttributeFilter, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::AttributeFilter, key_),
+  PROTOBUF_FIELD_OFFSET(::AttributeFilter, values_),
+  PROTOBUF_FIELD_OFFSET(::AttributeFilter, min_value_),
+  PROTOBUF_FIELD_OFFSET(::AttributeFilter, max_value_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, subject_ids_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, sources_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, min_collection_date_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, max_collection_date_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, min_enrollment_date_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, max_enrollment_date_),
+  PROTOBUF_FIELD_OFFSET(::SearchFilter, attributes_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::SearchResponse, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -974,6 +1293,14 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::EnrollRequest, records_),
   PROTOBUF_FIELD_OFFSET(::EnrollRequest, enroll_options_),
   ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::BulkEnrollResponse, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::BulkEnrollResponse, request_count_),
+  PROTOBUF_FIELD_OFFSET(::BulkEnrollResponse, enroll_count_),
+  PROTOBUF_FIELD_OFFSET(::BulkEnrollResponse, replace_count_),
+  ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::DetectRequest, _internal_metadata_),
   ~0u,  // no _extensions_
   ~0u,  // no _oneof_case_
@@ -1002,6 +1329,41 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::ScoreRequest, template_probes_),
   PROTOBUF_FIELD_OFFSET(::ScoreRequest, template_gallery_),
   ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, probe_start_),
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, gallery_start_),
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, probe_count_),
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, gallery_count_),
+  PROTOBUF_FIELD_OFFSET(::ScoreBlock, scores_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, bins_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, min_score_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, max_score_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistributionRequest, include_scores_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, block_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, face_count_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, genuine_count_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, impostor_count_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, bin_edges_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, genuine_histogram_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, impostor_histogram_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, thresholds_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, far_),
+  PROTOBUF_FIELD_OFFSET(::MatchDistribution, frr_),
+  ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::DetectExtractRequest, _internal_metadata_),
   ~0u,  // no _extensions_
   ~0u,  // no _oneof_case_
@@ -1045,6 +1407,22 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, match_threshold_),
   PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, algorithm_),
   PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, notes_),
+  PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, faro_version_),
+  PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, instance_name_),
+  PROTOBUF_FIELD_OFFSET(::FaceServiceInfo, gallery_cache_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, open_galleries_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, pinned_galleries_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, open_bytes_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, max_open_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, max_bytes_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, hits_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, misses_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCacheStats, evictions_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::GalleryListRequest, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -1057,6 +1435,64 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   ~0u,  // no _weak_field_map_
   PROTOBUF_FIELD_OFFSET(::GalleryDeleteRequest, gallery_name_),
   ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryConfigureRequest, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryConfigureRequest, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::GalleryConfigureRequest, index_quantization_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactRequest, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactRequest, gallery_name_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, face_count_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, rows_removed_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, bytes_before_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, bytes_after_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, bytes_reclaimed_),
+  PROTOBUF_FIELD_OFFSET(::GalleryCompactResponse, compact_time_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, start_row_),
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, file_id_),
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, chunk_size_),
+  PROTOBUF_FIELD_OFFSET(::GalleryExportRequest, include_views_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, file_id_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, start_row_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, next_row_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, row_count_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, dim_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, templates_),
+  PROTOBUF_FIELD_OFFSET(::GalleryChunk, records_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, gallery_name_),
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, file_id_),
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, next_row_),
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, enroll_count_),
+  PROTOBUF_FIELD_OFFSET(::GalleryImportResponse, replace_count_),
+  ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::EnrollmentListRequest, _internal_metadata_),
   ~0u,  // no _extensions_
   ~0u,  // no _oneof_case_
@@ -1084,6 +1520,13 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   ~0u,  // no _weak_field_map_
   PROTOBUF_FIELD_OFFSET(::EnrollmentDeleteRequest, gallery_name_),
   PROTOBUF_FIELD_OFFSET(::EnrollmentDeleteRequest, subject_id_),
+  PROTOBUF_FIELD_OFFSET(::EnrollmentDeleteRequest, gallery_key_),
+  ~0u,  // no _has_bits_
+  PROTOBUF_FIELD_OFFSET(::EnrollmentDeleteResponse, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  PROTOBUF_FIELD_OFFSET(::EnrollmentDeleteResponse, delete_count_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::GalleryInfo, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -1091,6 +1534,11 @@ const ::PROTOBUF_NAMESPACE_ID::uint32 TableStruct_faro_2fproto_2fface_5fservice_
   ~0u,  // no _weak_field_map_
   PROTOBUF_FIELD_OFFSET(::GalleryInfo, gallery_name_),
   PROTOBUF_FIELD_OFFSET(::GalleryInfo, face_count_),
+  PROTOBUF_FIELD_OFFSET(::GalleryInfo, subject_count_),
+  PROTOBUF_FIELD_OFFSET(::GalleryInfo, template_dim_),
+  PROTOBUF_FIELD_OFFSET(::GalleryInfo, file_bytes_),
+  PROTOBUF_FIELD_OFFSET(::GalleryInfo, index_state_),
+  PROTOBUF_FIELD_OFFSET(::GalleryInfo, modified_),
   ~0u,  // no _has_bits_
   PROTOBUF_FIELD_OFFSET(::GalleryList, _internal_metadata_),
   ~0u,  // no _extensions_
@@ -1109,39 +1557,54 @@ static const ::PROTOBUF_NAMESPACE_ID::internal::MigrationSchema schemas[] PROTOB
   { 26, -1, sizeof(::Detection)},
   { 36, -1, sizeof(::Landmark)},
   { 43, -1, sizeof(::DetectionOptions)},
-  { 58, -1, sizeof(::ExtractOptions)},
-  { 67, -1, sizeof(::EnrollOptions)},
-  { 75, -1, sizeof(::DetectionList)},
-  { 86, -1, sizeof(::MatchList)},
-  { 92, -1, sizeof(::MatchInfo)},
-  { 103, -1, sizeof(::TemplateInput)},
-  { 110, -1, sizeof(::FaceTemplate)},
-  { 117, -1, sizeof(::TemplateList)},
-  { 123, -1, sizeof(::AccessRecord)},
-  { 132, -1, sizeof(::FaceRecord)},
-  { 156, -1, sizeof(::FaceRecordList)},
-  { 162, -1, sizeof(::VerificationRequest)},
-  { 170, -1, sizeof(::VerificationResponse)},
-  { 180, -1, sizeof(::SearchRequest)},
-  { 189, -1, sizeof(::SearchResponse)},
-  { 196, -1, sizeof(::EnrollRequest)},
-  { 204, -1, sizeof(::DetectRequest)},
-  { 215, -1, sizeof(::ExtractRequest)},
-  { 223, -1, sizeof(::ScoreRequest)},
-  { 232, -1, sizeof(::DetectExtractRequest)},
-  { 239, -1, sizeof(::DetectExtractEnrollRequest)},
-  { 247, -1, sizeof(::DetectExtractSearchRequest)},
-  { 255, -1, sizeof(::FaceStatusRequest)},
-  { 260, -1, sizeof(::FaceServiceInfo)},
-  { 276, -1, sizeof(::GalleryListRequest)},
-  { 281, -1, sizeof(::GalleryDeleteRequest)},
-  { 287, -1, sizeof(::EnrollmentListRequest)},
-  { 293, -1, sizeof(::EnrollmentInfo)},
-  { 301, -1, sizeof(::EnrollmentListResponse)},
-  { 308, -1, sizeof(::EnrollmentDeleteRequest)},
-  { 315, -1, sizeof(::GalleryInfo)},
-  { 322, -1, sizeof(::GalleryList)},
-  { 328, -1, sizeof(::Empty)},
+  { 59, -1, sizeof(::ExtractOptions)},
+  { 68, -1, sizeof(::EnrollOptions)},
+  { 78, -1, sizeof(::DetectionList)},
+  { 89, -1, sizeof(::MatchList)},
+  { 95, -1, sizeof(::MatchInfo)},
+  { 106, -1, sizeof(::TemplateInput)},
+  { 113, -1, sizeof(::FaceTemplate)},
+  { 121, -1, sizeof(::TemplateList)},
+  { 127, -1, sizeof(::AccessRecord)},
+  { 136, -1, sizeof(::FaceRecord)},
+  { 161, -1, sizeof(::FaceRecordList)},
+  { 168, -1, sizeof(::EnrollStats)},
+  { 177, -1, sizeof(::VerificationRequest)},
+  { 185, -1, sizeof(::VerificationResponse)},
+  { 195, -1, sizeof(::SearchRequest)},
+  { 206, -1, sizeof(::AttributeFilter)},
+  { 215, -1, sizeof(::SearchFilter)},
+  { 227, -1, sizeof(::SearchResponse)},
+  { 234, -1, sizeof(::EnrollRequest)},
+  { 242, -1, sizeof(::BulkEnrollResponse)},
+  { 250, -1, sizeof(::DetectRequest)},
+  { 261, -1, sizeof(::ExtractRequest)},
+  { 269, -1, sizeof(::ScoreRequest)},
+  { 278, -1, sizeof(::ScoreBlock)},
+  { 288, -1, sizeof(::MatchDistributionRequest)},
+  { 298, -1, sizeof(::MatchDistribution)},
+  { 313, -1, sizeof(::DetectExtractRequest)},
+  { 320, -1, sizeof(::DetectExtractEnrollRequest)},
+  { 328, -1, sizeof(::DetectExtractSearchRequest)},
+  { 336, -1, sizeof(::FaceStatusRequest)},
+  { 341, -1, sizeof(::FaceServiceInfo)},
+  { 360, -1, sizeof(::GalleryCacheStats)},
+  { 373, -1, sizeof(::GalleryListRequest)},
+  { 378, -1, sizeof(::GalleryDeleteRequest)},
+  { 384, -1, sizeof(::GalleryConfigureRequest)},
+  { 391, -1, sizeof(::GalleryCompactRequest)},
+  { 397, -1, sizeof(::GalleryCompactResponse)},
+  { 409, -1, sizeof(::GalleryExportRequest)},
+  { 419, -1, sizeof(::GalleryChunk)},
+  { 432, -1, sizeof(::GalleryImportResponse)},
+  { 442, -1, sizeof(::EnrollmentListRequest)},
+  { 448, -1, sizeof(::EnrollmentInfo)},
+  { 456, -1, sizeof(::EnrollmentListResponse)},
+  { 463, -1, sizeof(::EnrollmentDeleteRequest)},
+  { 471, -1, sizeof(::EnrollmentDeleteResponse)},
+  { 477, -1, sizeof(::GalleryInfo)},
+  { 489, -1, sizeof(::GalleryList)},
+  { 495, -1, sizeof(::Empty)},
 };
 
 static ::PROTOBUF_NAMESPACE_ID::Message const * const file_default_instances[] = {
@@ -1161,25 +1624,40 @@ static ::PROTOBUF_NAMESPACE_ID::Message const * const file_default_instances[] =
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_AccessRecord_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_FaceRecord_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_FaceRecordList_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollStats_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_VerificationRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_VerificationResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_SearchRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_AttributeFilter_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_SearchFilter_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_SearchResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_BulkEnrollResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_DetectRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_ExtractRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_ScoreRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_ScoreBlock_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_MatchDistributionRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_MatchDistribution_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_DetectExtractRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_DetectExtractEnrollRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_DetectExtractSearchRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_FaceStatusRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_FaceServiceInfo_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryCacheStats_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryListRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryDeleteRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryConfigureRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryCompactRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryCompactResponse_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryExportRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryChunk_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryImportResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollmentListRequest_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollmentInfo_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollmentListResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollmentDeleteRequest_default_instance_),
+  reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_EnrollmentDeleteResponse_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryInfo_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_GalleryList_default_instance_),
   reinterpret_cast<const ::PROTOBUF_NAMESPACE_ID::Message*>(&::_Empty_default_instance_),
@@ -1201,137 +1679,208 @@ const char descriptor_table_protodef_faro_2fproto_2fface_5fservice_2eproto[] =
   "_id\030\003 \001(\005\022\027\n\017detection_class\030\004 \001(\t\022\036\n\nat"
   "tributes\030\005 \003(\0132\n.Attribute\";\n\010Landmark\022\023"
   "\n\013landmark_id\030\001 \001(\t\022\032\n\010location\030\002 \001(\0132\010."
-  "Point2D\"\341\001\n\020DetectionOptions\022\024\n\014algorith"
+  "Point2D\"\365\001\n\020DetectionOptions\022\024\n\014algorith"
   "m_id\030\001 \001(\t\022\014\n\004best\030\002 \001(\010\022\021\n\tthreshold\030\003 "
   "\001(\002\022\024\n\014scale_levels\030\004 \001(\005\022\023\n\013scan_levels"
   "\030\005 \001(\005\022\024\n\014scan_overlap\030\006 \001(\002\022\020\n\010min_size"
   "\030\007 \001(\005\022\024\n\014save_request\030\t \001(\010\022\r\n\005debug\030\n "
-  "\001(\010\022\036\n\nattributes\030\010 \003(\0132\n.Attribute\"k\n\016E"
-  "xtractOptions\022\024\n\014algorithm_id\030\001 \001(\t\022\024\n\014s"
-  "ave_request\030\002 \001(\010\022\r\n\005debug\030\003 \001(\010\022\036\n\nattr"
-  "ibutes\030\010 \003(\0132\n.Attribute\"T\n\rEnrollOption"
-  "s\022\024\n\014save_request\030\002 \001(\010\022\r\n\005debug\030\003 \001(\010\022\036"
-  "\n\nattributes\030\010 \003(\0132\n.Attribute\"\257\001\n\rDetec"
-  "tionList\022\036\n\ndetections\030\001 \003(\0132\n.Detection"
-  "\022\026\n\016detection_time\030\002 \001(\002\022\023\n\013image_width\030"
-  "\003 \001(\005\022\024\n\014image_height\030\004 \001(\005\022\027\n\017detection"
-  "_count\030\005 \001(\005\022\"\n\007options\030\006 \001(\0132\021.Detectio"
-  "nOptions\"+\n\tMatchList\022\036\n\nmatch_list\030\001 \003("
-  "\0132\n.MatchInfo\"\202\001\n\tMatchInfo\022\r\n\005score\030\001 \001"
-  "(\002\022\020\n\010image_id\030\002 \001(\t\022\024\n\014detection_id\030\003 \001"
-  "(\t\022\022\n\nsubject_id\030\004 \001(\t\022\024\n\014subject_name\030\005"
-  " \001(\t\022\024\n\004face\030\006 \001(\0132\006.Image\">\n\rTemplateIn"
-  "put\022\022\n\002im\030\001 \001(\0132\006.Image\022\031\n\ndetections\030\002 "
-  "\003(\0132\005.Rect\"5\n\014FaceTemplate\022\025\n\004data\030\001 \001(\013"
-  "2\007.Vector\022\016\n\006buffer\030\002 \001(\014\"0\n\014TemplateLis"
-  "t\022 \n\ttemplates\030\001 \003(\0132\r.FaceTemplate\"a\n\014A"
-  "ccessRecord\022\020\n\010datetime\030\001 \001(\002\022\r\n\005notes\030\002"
-  " \001(\t\022\022\n\ncredential\030\003 \001(\t\022\034\n\010metadata\030\004 \003"
-  "(\0132\n.Attribute\"\360\003\n\nFaceRecord\022\022\n\nsubject"
-  "_id\030\001 \001(\t\022\014\n\004name\030\005 \001(\t\022\016\n\006source\030\004 \001(\t\022"
-  "\r\n\005frame\030\016 \001(\003\022\r\n\005notes\030\006 \001(\t\022\023\n\013gallery"
-  "_key\030\017 \001(\t\022\027\n\017collection_date\030\020 \001(\002\022\027\n\017e"
-  "nrollment_date\030\021 \001(\002\022\034\n\010metadata\030\022 \003(\0132\n"
-  ".Attribute\022%\n\016access_records\030\023 \003(\0132\r.Acc"
-  "essRecord\022\024\n\004view\030\007 \001(\0132\006.Image\022\027\n\007align"
-  "ed\030\t \001(\0132\006.Image\022\035\n\tdetection\030\002 \001(\0132\n.De"
-  "tection\022\034\n\tlandmarks\030\010 \003(\0132\t.Landmark\022\036\n"
-  "\nattributes\030\n \003(\0132\n.Attribute\022!\n\rinterna"
-  "l_data\030\013 \003(\0132\n.Attribute\022\037\n\010template\030\003 \001"
-  "(\0132\r.FaceTemplate\022\r\n\005score\030\014 \001(\002\022\'\n\016sear"
-  "ch_results\030\r \001(\0132\017.FaceRecordList\"3\n\016Fac"
-  "eRecordList\022!\n\014face_records\030\001 \003(\0132\013.Face"
-  "Record\"\\\n\023VerificationRequest\022\017\n\007gallery"
-  "\030\001 \001(\t\022\022\n\nsubject_id\030\002 \001(\t\022 \n\013face_recor"
-  "d\030\003 \003(\0132\013.FaceRecord\"\204\001\n\024VerificationRes"
-  "ponse\022\022\n\nerror_code\030\004 \001(\005\022\025\n\rerror_messa"
-  "ge\030\005 \001(\t\022\017\n\007success\030\001 \001(\010\022\022\n\nconfidence\030"
-  "\002 \001(\002\022\034\n\007matches\030\003 \003(\0132\013.FaceRecord\"p\n\rS"
-  "earchRequest\022\026\n\016search_gallery\030\001 \001(\t\022\037\n\006"
-  "probes\030\003 \001(\0132\017.FaceRecordList\022\023\n\013max_res"
-  "ults\030\004 \001(\005\022\021\n\tthreshold\030\005 \001(\002\"Q\n\016SearchR"
-  "esponse\022\036\n\007message\030\001 \001(\0132\r.ErrorMessage\022"
-  "\037\n\006probes\030\002 \001(\0132\017.FaceRecordList\"q\n\rEnro"
-  "llRequest\022\026\n\016enroll_gallery\030\001 \001(\t\022 \n\007rec"
-  "ords\030\002 \001(\0132\017.FaceRecordList\022&\n\016enroll_op"
-  "tions\030\n \001(\0132\016.EnrollOptions\"\232\001\n\rDetectRe"
-  "quest\022\025\n\005image\030\001 \001(\0132\006.Image\022\016\n\006source\030\002"
-  " \001(\t\022\r\n\005frame\030\003 \001(\003\022\022\n\nsubject_id\030\004 \001(\t\022"
-  "\024\n\014subject_name\030\005 \001(\t\022)\n\016detect_options\030"
-  "\010 \001(\0132\021.DetectionOptions\"s\n\016ExtractReque"
-  "st\022\025\n\005image\030\001 \001(\0132\006.Image\022 \n\007records\030\004 \001"
-  "(\0132\017.FaceRecordList\022(\n\017extract_options\030\t"
-  " \001(\0132\017.ExtractOptions\"\254\001\n\014ScoreRequest\022$"
-  "\n\013face_probes\030\001 \001(\0132\017.FaceRecordList\022%\n\014"
-  "face_gallery\030\002 \001(\0132\017.FaceRecordList\022&\n\017t"
-  "emplate_probes\030\003 \001(\0132\r.TemplateList\022\'\n\020t"
-  "emplate_gallery\030\004 \001(\0132\r.TemplateList\"h\n\024"
-  "DetectExtractRequest\022&\n\016detect_request\030\001"
-  " \001(\0132\016.DetectRequest\022(\n\017extract_request\030"
-  "\002 \001(\0132\017.ExtractRequest\"\226\001\n\032DetectExtract"
-  "EnrollRequest\022&\n\016detect_request\030\001 \001(\0132\016."
-  "DetectRequest\022(\n\017extract_request\030\002 \001(\0132\017"
-  ".ExtractRequest\022&\n\016enroll_request\030\003 \001(\0132"
-  "\016.EnrollRequest\"\226\001\n\032DetectExtractSearchR"
-  "equest\022&\n\016detect_request\030\001 \001(\0132\016.DetectR"
-  "equest\022(\n\017extract_request\030\002 \001(\0132\017.Extrac"
-  "tRequest\022&\n\016search_request\030\003 \001(\0132\016.Searc"
-  "hRequest\"\023\n\021FaceStatusRequest\"\245\002\n\017FaceSe"
-  "rviceInfo\022\036\n\006status\030\001 \001(\0162\016.ServiceStatu"
-  "s\022\024\n\014worker_count\030\002 \001(\005\022\031\n\021detection_sup"
-  "port\030\003 \001(\010\022\027\n\017extract_support\030\004 \001(\010\022\025\n\rs"
-  "core_support\030\005 \001(\010\022\031\n\021attribute_support\030"
-  "\006 \001(\010\022\036\n\nscore_type\030\007 \001(\0162\n.ScoreType\022\033\n"
-  "\023detection_threshold\030\010 \001(\002\022\027\n\017match_thre"
-  "shold\030\t \001(\002\022\021\n\talgorithm\030\n \001(\t\022\r\n\005notes\030"
-  "\013 \001(\t\"\024\n\022GalleryListRequest\",\n\024GalleryDe"
-  "leteRequest\022\024\n\014gallery_name\030\001 \001(\t\"-\n\025Enr"
-  "ollmentListRequest\022\024\n\014gallery_name\030\001 \001(\t"
-  "\"F\n\016EnrollmentInfo\022\022\n\nsubject_id\030\001 \001(\t\022\014"
-  "\n\004name\030\002 \001(\t\022\022\n\nface_count\030\003 \001(\005\"T\n\026Enro"
-  "llmentListResponse\022\024\n\014gallery_name\030\001 \001(\t"
-  "\022$\n\013enrollments\030\002 \003(\0132\017.EnrollmentInfo\"C"
-  "\n\027EnrollmentDeleteRequest\022\024\n\014gallery_nam"
-  "e\030\001 \001(\t\022\022\n\nsubject_id\030\002 \001(\t\"7\n\013GalleryIn"
-  "fo\022\024\n\014gallery_name\030\001 \001(\t\022\022\n\nface_count\030\002"
-  " \001(\003\".\n\013GalleryList\022\037\n\tgalleries\030\001 \003(\0132\014"
-  ".GalleryInfo\"\007\n\005Empty*<\n\rServiceStatus\022\013"
-  "\n\007UNKNOWN\020\000\022\t\n\005READY\020\001\022\t\n\005ERROR\020\002\022\010\n\004BUS"
-  "Y\020\003*k\n\010DataType\022\t\n\005EMPTY\020\000\022\n\n\006STRING\020\001\022\007"
-  "\n\003INT\020\002\022\t\n\005FLOAT\020\003\022\t\n\005BYTES\020\004\022\n\n\006VECTOR\020"
-  "\005\022\n\n\006PICKLE\020\006\022\007\n\003XML\020\007\022\010\n\004JSON\020\010*4\n\tScor"
-  "eType\022\n\n\006SERVER\020\000\022\006\n\002L1\020\001\022\006\n\002L2\020\002\022\013\n\007NEG"
-  "_DOT\020\0032\364\006\n\017FaceRecognition\0220\n\006status\022\022.F"
-  "aceStatusRequest\032\020.FaceServiceInfo\"\000\022+\n\006"
-  "detect\022\016.DetectRequest\032\017.FaceRecordList\""
-  "\000\022-\n\007extract\022\017.ExtractRequest\032\017.FaceReco"
-  "rdList\"\000\022!\n\005score\022\r.ScoreRequest\032\007.Matri"
-  "x\"\000\022+\n\006enroll\022\016.EnrollRequest\032\017.FaceReco"
-  "rdList\"\000\022+\n\006search\022\016.SearchRequest\032\017.Fac"
-  "eRecordList\"\000\0229\n\rdetectExtract\022\025.DetectE"
-  "xtractRequest\032\017.FaceRecordList\"\000\022E\n\023dete"
-  "ctExtractEnroll\022\033.DetectExtractEnrollReq"
-  "uest\032\017.FaceRecordList\"\000\022E\n\023detectExtract"
-  "Search\022\033.DetectExtractSearchRequest\032\017.Fa"
-  "ceRecordList\"\000\0222\n\013galleryList\022\023.GalleryL"
-  "istRequest\032\014.GalleryList\"\000\0220\n\rgalleryDel"
-  "ete\022\025.GalleryDeleteRequest\032\006.Empty\"\000\022;\n\016"
+  "\001(\010\022\022\n\ndownsample\030\013 \001(\005\022\036\n\nattributes\030\010 "
+  "\003(\0132\n.Attribute\"k\n\016ExtractOptions\022\024\n\014alg"
+  "orithm_id\030\001 \001(\t\022\024\n\014save_request\030\002 \001(\010\022\r\n"
+  "\005debug\030\003 \001(\010\022\036\n\nattributes\030\010 \003(\0132\n.Attri"
+  "bute\"\201\001\n\rEnrollOptions\022\024\n\014save_request\030\002"
+  " \001(\010\022\r\n\005debug\030\003 \001(\010\022\036\n\nattributes\030\010 \003(\0132"
+  "\n.Attribute\022\026\n\016dedup_distance\030\t \001(\002\022\023\n\013d"
+  "edup_merge\030\n \001(\010\"\257\001\n\rDetectionList\022\036\n\nde"
+  "tections\030\001 \003(\0132\n.Detection\022\026\n\016detection_"
+  "time\030\002 \001(\002\022\023\n\013image_width\030\003 \001(\005\022\024\n\014image"
+  "_height\030\004 \001(\005\022\027\n\017detection_count\030\005 \001(\005\022\""
+  "\n\007options\030\006 \001(\0132\021.DetectionOptions\"+\n\tMa"
+  "tchList\022\036\n\nmatch_list\030\001 \003(\0132\n.MatchInfo\""
+  "\202\001\n\tMatchInfo\022\r\n\005score\030\001 \001(\002\022\020\n\010image_id"
+  "\030\002 \001(\t\022\024\n\014detection_id\030\003 \001(\t\022\022\n\nsubject_"
+  "id\030\004 \001(\t\022\024\n\014subject_name\030\005 \001(\t\022\024\n\004face\030\006"
+  " \001(\0132\006.Image\">\n\rTemplateInput\022\022\n\002im\030\001 \001("
+  "\0132\006.Image\022\031\n\ndetections\030\002 \003(\0132\005.Rect\"H\n\014"
+  "FaceTemplate\022\025\n\004data\030\001 \001(\0132\007.Vector\022\016\n\006b"
+  "uffer\030\002 \001(\014\022\021\n\talgorithm\030\003 \001(\t\"0\n\014Templa"
+  "teList\022 \n\ttemplates\030\001 \003(\0132\r.FaceTemplate"
+  "\"a\n\014AccessRecord\022\020\n\010datetime\030\001 \001(\002\022\r\n\005no"
+  "tes\030\002 \001(\t\022\022\n\ncredential\030\003 \001(\t\022\034\n\010metadat"
+  "a\030\004 \003(\0132\n.Attribute\"\203\004\n\nFaceRecord\022\022\n\nsu"
+  "bject_id\030\001 \001(\t\022\014\n\004name\030\005 \001(\t\022\016\n\006source\030\004"
+  " \001(\t\022\r\n\005frame\030\016 \001(\003\022\021\n\talgorithm\030\024 \001(\t\022\r"
+  "\n\005notes\030\006 \001(\t\022\023\n\013gallery_key\030\017 \001(\t\022\027\n\017co"
+  "llection_date\030\020 \001(\002\022\027\n\017enrollment_date\030\021"
+  " \001(\002\022\034\n\010metadata\030\022 \003(\0132\n.Attribute\022%\n\016ac"
+  "cess_records\030\023 \003(\0132\r.AccessRecord\022\024\n\004vie"
+  "w\030\007 \001(\0132\006.Image\022\027\n\007aligned\030\t \001(\0132\006.Image"
+  "\022\035\n\tdetection\030\002 \001(\0132\n.Detection\022\034\n\tlandm"
+  "arks\030\010 \003(\0132\t.Landmark\022\036\n\nattributes\030\n \003("
+  "\0132\n.Attribute\022!\n\rinternal_data\030\013 \003(\0132\n.A"
+  "ttribute\022\037\n\010template\030\003 \001(\0132\r.FaceTemplat"
+  "e\022\r\n\005score\030\014 \001(\002\022\'\n\016search_results\030\r \001(\013"
+  "2\017.FaceRecordList\"W\n\016FaceRecordList\022!\n\014f"
+  "ace_records\030\001 \003(\0132\013.FaceRecord\022\"\n\014enroll"
+  "_stats\030\003 \001(\0132\014.EnrollStats\"c\n\013EnrollStat"
+  "s\022\024\n\014enroll_count\030\001 \001(\003\022\025\n\rreplace_count"
+  "\030\002 \001(\003\022\022\n\nskip_count\030\003 \001(\003\022\023\n\013merge_coun"
+  "t\030\004 \001(\003\"\\\n\023VerificationRequest\022\017\n\007galler"
+  "y\030\001 \001(\t\022\022\n\nsubject_id\030\002 \001(\t\022 \n\013face_reco"
+  "rd\030\003 \003(\0132\013.FaceRecord\"\204\001\n\024VerificationRe"
+  "sponse\022\022\n\nerror_code\030\004 \001(\005\022\025\n\rerror_mess"
+  "age\030\005 \001(\t\022\017\n\007success\030\001 \001(\010\022\022\n\nconfidence"
+  "\030\002 \001(\002\022\034\n\007matches\030\003 \003(\0132\013.FaceRecord\"\237\001\n"
+  "\rSearchRequest\022\026\n\016search_gallery\030\001 \001(\t\022\037"
+  "\n\006probes\030\003 \001(\0132\017.FaceRecordList\022\023\n\013max_r"
+  "esults\030\004 \001(\005\022\021\n\tthreshold\030\005 \001(\002\022\016\n\006nprob"
+  "e\030\006 \001(\005\022\035\n\006filter\030\007 \001(\0132\r.SearchFilter\"T"
+  "\n\017AttributeFilter\022\013\n\003key\030\001 \001(\t\022\016\n\006values"
+  "\030\002 \003(\t\022\021\n\tmin_value\030\003 \001(\002\022\021\n\tmax_value\030\004"
+  " \001(\002\"\316\001\n\014SearchFilter\022\023\n\013subject_ids\030\001 \003"
+  "(\t\022\017\n\007sources\030\002 \003(\t\022\033\n\023min_collection_da"
+  "te\030\003 \001(\002\022\033\n\023max_collection_date\030\004 \001(\002\022\033\n"
+  "\023min_enrollment_date\030\005 \001(\002\022\033\n\023max_enroll"
+  "ment_date\030\006 \001(\002\022$\n\nattributes\030\007 \003(\0132\020.At"
+  "tributeFilter\"Q\n\016SearchResponse\022\036\n\007messa"
+  "ge\030\001 \001(\0132\r.ErrorMessage\022\037\n\006probes\030\002 \001(\0132"
+  "\017.FaceRecordList\"q\n\rEnrollRequest\022\026\n\016enr"
+  "oll_gallery\030\001 \001(\t\022 \n\007records\030\002 \001(\0132\017.Fac"
+  "eRecordList\022&\n\016enroll_options\030\n \001(\0132\016.En"
+  "rollOptions\"X\n\022BulkEnrollResponse\022\025\n\rreq"
+  "uest_count\030\001 \001(\003\022\024\n\014enroll_count\030\002 \001(\003\022\025"
+  "\n\rreplace_count\030\003 \001(\003\"\232\001\n\rDetectRequest\022"
+  "\025\n\005image\030\001 \001(\0132\006.Image\022\016\n\006source\030\002 \001(\t\022\r"
+  "\n\005frame\030\003 \001(\003\022\022\n\nsubject_id\030\004 \001(\t\022\024\n\014sub"
+  "ject_name\030\005 \001(\t\022)\n\016detect_options\030\010 \001(\0132"
+  "\021.DetectionOptions\"s\n\016ExtractRequest\022\025\n\005"
+  "image\030\001 \001(\0132\006.Image\022 \n\007records\030\004 \001(\0132\017.F"
+  "aceRecordList\022(\n\017extract_options\030\t \001(\0132\017"
+  ".ExtractOptions\"\254\001\n\014ScoreRequest\022$\n\013face"
+  "_probes\030\001 \001(\0132\017.FaceRecordList\022%\n\014face_g"
+  "allery\030\002 \001(\0132\017.FaceRecordList\022&\n\017templat"
+  "e_probes\030\003 \001(\0132\r.TemplateList\022\'\n\020templat"
+  "e_gallery\030\004 \001(\0132\r.TemplateList\"t\n\nScoreB"
+  "lock\022\023\n\013probe_start\030\001 \001(\003\022\025\n\rgallery_sta"
+  "rt\030\002 \001(\003\022\023\n\013probe_count\030\003 \001(\005\022\025\n\rgallery"
+  "_count\030\004 \001(\005\022\016\n\006scores\030\005 \001(\014\"|\n\030MatchDis"
+  "tributionRequest\022\024\n\014gallery_name\030\001 \001(\t\022\014"
+  "\n\004bins\030\002 \001(\005\022\021\n\tmin_score\030\003 \001(\002\022\021\n\tmax_s"
+  "core\030\004 \001(\002\022\026\n\016include_scores\030\005 \001(\010\"\352\001\n\021M"
+  "atchDistribution\022\032\n\005block\030\001 \001(\0132\013.ScoreB"
+  "lock\022\022\n\nface_count\030\002 \001(\003\022\025\n\rgenuine_coun"
+  "t\030\003 \001(\003\022\026\n\016impostor_count\030\004 \001(\003\022\021\n\tbin_e"
+  "dges\030\005 \003(\002\022\031\n\021genuine_histogram\030\006 \003(\003\022\032\n"
+  "\022impostor_histogram\030\007 \003(\003\022\022\n\nthresholds\030"
+  "\010 \003(\002\022\013\n\003far\030\t \003(\002\022\013\n\003frr\030\n \003(\002\"h\n\024Detec"
+  "tExtractRequest\022&\n\016detect_request\030\001 \001(\0132"
+  "\016.DetectRequest\022(\n\017extract_request\030\002 \001(\013"
+  "2\017.ExtractRequest\"\226\001\n\032DetectExtractEnrol"
+  "lRequest\022&\n\016detect_request\030\001 \001(\0132\016.Detec"
+  "tRequest\022(\n\017extract_request\030\002 \001(\0132\017.Extr"
+  "actRequest\022&\n\016enroll_request\030\003 \001(\0132\016.Enr"
+  "ollRequest\"\226\001\n\032DetectExtractSearchReques"
+  "t\022&\n\016detect_request\030\001 \001(\0132\016.DetectReques"
+  "t\022(\n\017extract_request\030\002 \001(\0132\017.ExtractRequ"
+  "est\022&\n\016search_request\030\003 \001(\0132\016.SearchRequ"
+  "est\"\023\n\021FaceStatusRequest\"\375\002\n\017FaceService"
+  "Info\022\036\n\006status\030\001 \001(\0162\016.ServiceStatus\022\024\n\014"
+  "worker_count\030\002 \001(\005\022\031\n\021detection_support\030"
+  "\003 \001(\010\022\027\n\017extract_support\030\004 \001(\010\022\025\n\rscore_"
+  "support\030\005 \001(\010\022\031\n\021attribute_support\030\006 \001(\010"
+  "\022\036\n\nscore_type\030\007 \001(\0162\n.ScoreType\022\033\n\023dete"
+  "ction_threshold\030\010 \001(\002\022\027\n\017match_threshold"
+  "\030\t \001(\002\022\021\n\talgorithm\030\n \001(\t\022\r\n\005notes\030\013 \001(\t"
+  "\022\024\n\014faro_version\030\014 \001(\t\022\025\n\rinstance_name\030"
+  "\r \001(\t\022)\n\rgallery_cache\030\016 \001(\0132\022.GalleryCa"
+  "cheStats\"\257\001\n\021GalleryCacheStats\022\026\n\016open_g"
+  "alleries\030\001 \001(\003\022\030\n\020pinned_galleries\030\002 \001(\003"
+  "\022\022\n\nopen_bytes\030\003 \001(\003\022\020\n\010max_open\030\004 \001(\003\022\021"
+  "\n\tmax_bytes\030\005 \001(\003\022\014\n\004hits\030\006 \001(\003\022\016\n\006misse"
+  "s\030\007 \001(\003\022\021\n\tevictions\030\010 \001(\003\"\024\n\022GalleryLis"
+  "tRequest\",\n\024GalleryDeleteRequest\022\024\n\014gall"
+  "ery_name\030\001 \001(\t\"K\n\027GalleryConfigureReques"
+  "t\022\024\n\014gallery_name\030\001 \001(\t\022\032\n\022index_quantiz"
+  "ation\030\002 \001(\t\"-\n\025GalleryCompactRequest\022\024\n\014"
+  "gallery_name\030\001 \001(\t\"\262\001\n\026GalleryCompactRes"
+  "ponse\022\024\n\014gallery_name\030\001 \001(\t\022\022\n\nface_coun"
+  "t\030\002 \001(\003\022\024\n\014rows_removed\030\003 \001(\003\022\024\n\014bytes_b"
+  "efore\030\004 \001(\003\022\023\n\013bytes_after\030\005 \001(\003\022\027\n\017byte"
+  "s_reclaimed\030\006 \001(\003\022\024\n\014compact_time\030\007 \001(\002\""
+  "{\n\024GalleryExportRequest\022\024\n\014gallery_name\030"
+  "\001 \001(\t\022\021\n\tstart_row\030\002 \001(\003\022\017\n\007file_id\030\003 \001("
+  "\t\022\022\n\nchunk_size\030\004 \001(\005\022\025\n\rinclude_views\030\005"
+  " \001(\010\"\257\001\n\014GalleryChunk\022\024\n\014gallery_name\030\001 "
+  "\001(\t\022\017\n\007file_id\030\002 \001(\t\022\021\n\tstart_row\030\003 \001(\003\022"
+  "\020\n\010next_row\030\004 \001(\003\022\021\n\trow_count\030\005 \001(\003\022\013\n\003"
+  "dim\030\006 \001(\005\022\021\n\ttemplates\030\007 \001(\014\022 \n\007records\030"
+  "\010 \001(\0132\017.FaceRecordList\"}\n\025GalleryImportR"
+  "esponse\022\024\n\014gallery_name\030\001 \001(\t\022\017\n\007file_id"
+  "\030\002 \001(\t\022\020\n\010next_row\030\003 \001(\003\022\024\n\014enroll_count"
+  "\030\004 \001(\003\022\025\n\rreplace_count\030\005 \001(\003\"-\n\025Enrollm"
+  "entListRequest\022\024\n\014gallery_name\030\001 \001(\t\"F\n\016"
+  "EnrollmentInfo\022\022\n\nsubject_id\030\001 \001(\t\022\014\n\004na"
+  "me\030\002 \001(\t\022\022\n\nface_count\030\003 \001(\005\"T\n\026Enrollme"
+  "ntListResponse\022\024\n\014gallery_name\030\001 \001(\t\022$\n\013"
+  "enrollments\030\002 \003(\0132\017.EnrollmentInfo\"X\n\027En"
+  "rollmentDeleteRequest\022\024\n\014gallery_name\030\001 "
+  "\001(\t\022\022\n\nsubject_id\030\002 \001(\t\022\023\n\013gallery_key\030\003"
+  " \001(\t\"0\n\030EnrollmentDeleteResponse\022\024\n\014dele"
+  "te_count\030\001 \001(\003\"\237\001\n\013GalleryInfo\022\024\n\014galler"
+  "y_name\030\001 \001(\t\022\022\n\nface_count\030\002 \001(\003\022\025\n\rsubj"
+  "ect_count\030\003 \001(\003\022\024\n\014template_dim\030\004 \001(\005\022\022\n"
+  "\nfile_bytes\030\005 \001(\003\022\023\n\013index_state\030\006 \001(\t\022\020"
+  "\n\010modified\030\007 \001(\001\".\n\013GalleryList\022\037\n\tgalle"
+  "ries\030\001 \003(\0132\014.GalleryInfo\"\007\n\005Empty*<\n\rSer"
+  "viceStatus\022\013\n\007UNKNOWN\020\000\022\t\n\005READY\020\001\022\t\n\005ER"
+  "ROR\020\002\022\010\n\004BUSY\020\003*k\n\010DataType\022\t\n\005EMPTY\020\000\022\n"
+  "\n\006STRING\020\001\022\007\n\003INT\020\002\022\t\n\005FLOAT\020\003\022\t\n\005BYTES\020"
+  "\004\022\n\n\006VECTOR\020\005\022\n\n\006PICKLE\020\006\022\007\n\003XML\020\007\022\010\n\004JS"
+  "ON\020\010*4\n\tScoreType\022\n\n\006SERVER\020\000\022\006\n\002L1\020\001\022\006\n"
+  "\002L2\020\002\022\013\n\007NEG_DOT\020\0032\206\n\n\017FaceRecognition\0220"
+  "\n\006status\022\022.FaceStatusRequest\032\020.FaceServi"
+  "ceInfo\"\000\022+\n\006detect\022\016.DetectRequest\032\017.Fac"
+  "eRecordList\"\000\022-\n\007extract\022\017.ExtractReques"
+  "t\032\017.FaceRecordList\"\000\022!\n\005score\022\r.ScoreReq"
+  "uest\032\007.Matrix\"\000\022-\n\013scoreStream\022\r.ScoreRe"
+  "quest\032\013.ScoreBlock\"\0000\001\022+\n\006enroll\022\016.Enrol"
+  "lRequest\032\017.FaceRecordList\"\000\0225\n\nbulkEnrol"
+  "l\022\016.EnrollRequest\032\023.BulkEnrollResponse\"\000"
+  "(\001\022+\n\006search\022\016.SearchRequest\032\017.FaceRecor"
+  "dList\"\000\0229\n\rdetectExtract\022\025.DetectExtract"
+  "Request\032\017.FaceRecordList\"\000\022E\n\023detectExtr"
+  "actEnroll\022\033.DetectExtractEnrollRequest\032\017"
+  ".FaceRecordList\"\000\022E\n\023detectExtractSearch"
+  "\022\033.DetectExtractSearchRequest\032\017.FaceReco"
+  "rdList\"\000\0222\n\013galleryList\022\023.GalleryListReq"
+  "uest\032\014.GalleryList\"\000\0220\n\rgalleryDelete\022\025."
+  "GalleryDeleteRequest\032\006.Empty\"\000\0226\n\020galler"
+  "yConfigure\022\030.GalleryConfigureRequest\032\006.E"
+  "mpty\"\000\022C\n\016galleryCompact\022\026.GalleryCompac"
+  "tRequest\032\027.GalleryCompactResponse\"\000\0229\n\rg"
+  "alleryExport\022\025.GalleryExportRequest\032\r.Ga"
+  "lleryChunk\"\0000\001\022<\n\rgalleryImport\022\r.Galler"
+  "yChunk\032\026.GalleryImportResponse\"\000(\0010\001\022;\n\016"
   "enrollmentList\022\026.EnrollmentListRequest\032\017"
-  ".FaceRecordList\"\000\022\?\n\020enrollmentDelete\022\030."
-  "EnrollmentDeleteRequest\032\017.FaceRecordList"
-  "\"\000\022J\n\033enrollmentDeleteConditional\022\030.Enro"
-  "llmentDeleteRequest\032\017.FaceRecordList\"\000\022A"
-  "\n\022enrollmentTransfer\022\030.EnrollmentDeleteR"
-  "equest\032\017.FaceRecordList\"\000\022\032\n\004echo\022\007.Matr"
-  "ix\032\007.Matrix\"\000B\r\252\002\nFaro.Protob\006proto3"
+  ".FaceRecordList\"\000\0224\n\020trainFromGallery\022\026."
+  "EnrollmentListRequest\032\006.Empty\"\000\022F\n\rsubje"
+  "ctDelete\022\030.EnrollmentDeleteRequest\032\031.Enr"
+  "ollmentDeleteResponse\"\000\022>\n\031generateMatch"
+  "Distribution\022\026.EnrollmentListRequest\032\007.M"
+  "atrix\"\000\022F\n\021matchDistribution\022\031.MatchDist"
+  "ributionRequest\032\022.MatchDistribution\"\0000\001\022"
+  "\032\n\004echo\022\007.Matrix\032\007.Matrix\"\000B\r\252\002\nFaro.Pro"
+  "tob\006proto3"
   ;
 static const ::PROTOBUF_NAMESPACE_ID::internal::DescriptorTable*const descriptor_table_faro_2fproto_2fface_5fservice_2eproto_deps[2] = {
   &::descriptor_table_faro_2fproto_2fgeometry_2eproto,
   &::descriptor_table_faro_2fproto_2fimage_2eproto,
 };
-static ::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase*const descriptor_table_faro_2fproto_2fface_5fservice_2eproto_sccs[37] = {
+static ::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase*const descriptor_table_faro_2fproto_2fface_5fservice_2eproto_sccs[52] = {
   &scc_info_AccessRecord_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_Attribute_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_BulkEnrollResponse_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_DetectExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_DetectExtractSearchRequest_faro_2fproto_2fface_5fservice_2eproto.base,
@@ -1342,7 +1891,9 @@ static ::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase*const descriptor_table_far
   &scc_info_Empty_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollOptions_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_EnrollmentDeleteResponse_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollmentListRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_EnrollmentListResponse_faro_2fproto_2fface_5fservice_2eproto.base,
@@ -1353,14 +1904,25 @@ static ::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase*const descriptor_table_far
   &scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_FaceStatusRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_GalleryInfo_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_GalleryList_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_GalleryListRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_Landmark_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_MatchInfo_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_MatchList_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto.base,
+  &scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto.base,
   &scc_info_TemplateInput_faro_2fproto_2fface_5fservice_2eproto.base,
@@ -1371,10 +1933,10 @@ static ::PROTOBUF_NAMESPACE_ID::internal::SCCInfoBase*const descriptor_table_far
 static ::PROTOBUF_NAMESPACE_ID::internal::once_flag descriptor_table_faro_2fproto_2fface_5fservice_2eproto_once;
 static bool descriptor_table_faro_2fproto_2fface_5fservice_2eproto_initialized = false;
 const ::PROTOBUF_NAMESPACE_ID::internal::DescriptorTable descriptor_table_faro_2fproto_2fface_5fservice_2eproto = {
-  &descriptor_table_faro_2fproto_2fface_5fservice_2eproto_initialized, descriptor_table_protodef_faro_2fproto_2fface_5fservice_2eproto, "faro/proto/face_service.proto", 5516,
-  &descriptor_table_faro_2fproto_2fface_5fservice_2eproto_once, descriptor_table_faro_2fproto_2fface_5fservice_2eproto_sccs, descriptor_table_faro_2fproto_2fface_5fservice_2eproto_deps, 37, 2,
+  &descriptor_table_faro_2fproto_2fface_5fservice_2eproto_initialized, descriptor_table_protodef_faro_2fproto_2fface_5fservice_2eproto, "faro/proto/face_service.proto", 8250,
+  &descriptor_table_faro_2fproto_2fface_5fservice_2eproto_once, descriptor_table_faro_2fproto_2fface_5fservice_2eproto_sccs, descriptor_table_faro_2fproto_2fface_5fservice_2eproto_deps, 52, 2,
   schemas, file_default_instances, TableStruct_faro_2fproto_2fface_5fservice_2eproto::offsets,
-  file_level_metadata_faro_2fproto_2fface_5fservice_2eproto, 38, file_level_enum_descriptors_faro_2fproto_2fface_5fservice_2eproto, file_level_service_descriptors_faro_2fproto_2fface_5fservice_2eproto,
+  file_level_metadata_faro_2fproto_2fface_5fservice_2eproto, 53, file_level_enum_descriptors_faro_2fproto_2fface_5fservice_2eproto, file_level_service_descriptors_faro_2fproto_2fface_5fservice_2eproto,
 };
 
 // Force running AddDescriptors() at dynamic initialization time.
@@ -3641,6 +4203,7 @@ const int DetectionOptions::kScanOverlapFieldNumber;
 const int DetectionOptions::kMinSizeFieldNumber;
 const int DetectionOptions::kSaveRequestFieldNumber;
 const int DetectionOptions::kDebugFieldNumber;
+const int DetectionOptions::kDownsampleFieldNumber;
 const int DetectionOptions::kAttributesFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
@@ -3659,8 +4222,8 @@ DetectionOptions::DetectionOptions(const DetectionOptions& from)
     algorithm_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_id_);
   }
   ::memcpy(&threshold_, &from.threshold_,
-    static_cast<size_t>(reinterpret_cast<char*>(&debug_) -
-    reinterpret_cast<char*>(&threshold_)) + sizeof(debug_));
+    static_cast<size_t>(reinterpret_cast<char*>(&downsample_) -
+    reinterpret_cast<char*>(&threshold_)) + sizeof(downsample_));
   // @@protoc_insertion_point(copy_constructor:DetectionOptions)
 }
 
@@ -3668,8 +4231,8 @@ void DetectionOptions::SharedCtor() {
   ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectionOptions_faro_2fproto_2fface_5fservice_2eproto.base);
   algorithm_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   ::memset(&threshold_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&debug_) -
-      reinterpret_cast<char*>(&threshold_)) + sizeof(debug_));
+      reinterpret_cast<char*>(&downsample_) -
+      reinterpret_cast<char*>(&threshold_)) + sizeof(downsample_));
 }
 
 DetectionOptions::~DetectionOptions() {
@@ -3699,8 +4262,8 @@ void DetectionOptions::Clear() {
   attributes_.Clear();
   algorithm_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   ::memset(&threshold_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&debug_) -
-      reinterpret_cast<char*>(&threshold_)) + sizeof(debug_));
+      reinterpret_cast<char*>(&downsample_) -
+      reinterpret_cast<char*>(&threshold_)) + sizeof(downsample_));
   _internal_metadata_.Clear();
 }
 
@@ -3787,6 +4350,13 @@ const char* DetectionOptions::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPA
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
+      // int32 downsample = 11;
+      case 11:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 88)) {
+          downsample_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -3947,6 +4517,19 @@ bool DetectionOptions::MergePartialFromCodedStream(
         break;
       }
 
+      // int32 downsample = 11;
+      case 11: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (88 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &downsample_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
       handle_unusual:
         if (tag == 0) {
@@ -4033,6 +4616,11 @@ void DetectionOptions::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(10, this->debug(), output);
   }
 
+  // int32 downsample = 11;
+  if (this->downsample() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(11, this->downsample(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -4105,6 +4693,11 @@ void DetectionOptions::SerializeWithCachedSizes(
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(10, this->debug(), target);
   }
 
+  // int32 downsample = 11;
+  if (this->downsample() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(11, this->downsample(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -4190,6 +4783,13 @@ size_t DetectionOptions::ByteSizeLong() const {
     total_size += 1 + 1;
   }
 
+  // int32 downsample = 11;
+  if (this->downsample() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->downsample());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
@@ -4246,6 +4846,9 @@ void DetectionOptions::MergeFrom(const DetectionOptions& from) {
   if (from.debug() != 0) {
     set_debug(from.debug());
   }
+  if (from.downsample() != 0) {
+    set_downsample(from.downsample());
+  }
 }
 
 void DetectionOptions::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
@@ -4284,6 +4887,7 @@ void DetectionOptions::InternalSwap(DetectionOptions* other) {
   swap(best_, other->best_);
   swap(save_request_, other->save_request_);
   swap(debug_, other->debug_);
+  swap(downsample_, other->downsample_);
 }
 
 ::PROTOBUF_NAMESPACE_ID::Metadata DetectionOptions::GetMetadata() const {
@@ -4725,6 +5329,8 @@ class EnrollOptions::HasBitSetters {
 const int EnrollOptions::kSaveRequestFieldNumber;
 const int EnrollOptions::kDebugFieldNumber;
 const int EnrollOptions::kAttributesFieldNumber;
+const int EnrollOptions::kDedupDistanceFieldNumber;
+const int EnrollOptions::kDedupMergeFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
 EnrollOptions::EnrollOptions()
@@ -4738,16 +5344,16 @@ EnrollOptions::EnrollOptions(const EnrollOptions& from)
       attributes_(from.attributes_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::memcpy(&save_request_, &from.save_request_,
-    static_cast<size_t>(reinterpret_cast<char*>(&debug_) -
-    reinterpret_cast<char*>(&save_request_)) + sizeof(debug_));
+    static_cast<size_t>(reinterpret_cast<char*>(&dedup_distance_) -
+    reinterpret_cast<char*>(&save_request_)) + sizeof(dedup_distance_));
   // @@protoc_insertion_point(copy_constructor:EnrollOptions)
 }
 
 void EnrollOptions::SharedCtor() {
   ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollOptions_faro_2fproto_2fface_5fservice_2eproto.base);
   ::memset(&save_request_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&debug_) -
-      reinterpret_cast<char*>(&save_request_)) + sizeof(debug_));
+      reinterpret_cast<char*>(&dedup_distance_) -
+      reinterpret_cast<char*>(&save_request_)) + sizeof(dedup_distance_));
 }
 
 EnrollOptions::~EnrollOptions() {
@@ -4775,8 +5381,8 @@ void EnrollOptions::Clear() {
 
   attributes_.Clear();
   ::memset(&save_request_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&debug_) -
-      reinterpret_cast<char*>(&save_request_)) + sizeof(debug_));
+      reinterpret_cast<char*>(&dedup_distance_) -
+      reinterpret_cast<char*>(&save_request_)) + sizeof(dedup_distance_));
   _internal_metadata_.Clear();
 }
 
@@ -4814,6 +5420,20 @@ const char* EnrollOptions::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_
           } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 66);
         } else goto handle_unusual;
         continue;
+      // float dedup_distance = 9;
+      case 9:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 77)) {
+          dedup_distance_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // bool dedup_merge = 10;
+      case 10:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 80)) {
+          dedup_merge_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -4881,17 +5501,43 @@ bool EnrollOptions::MergePartialFromCodedStream(
         break;
       }
 
-      default: {
-      handle_unusual:
-        if (tag == 0) {
-          goto success;
+      // float dedup_distance = 9;
+      case 9: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (77 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &dedup_distance_)));
+        } else {
+          goto handle_unusual;
         }
-        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
-              input, tag, _internal_metadata_.mutable_unknown_fields()));
         break;
       }
-    }
-  }
+
+      // bool dedup_merge = 10;
+      case 10: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (80 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &dedup_merge_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
 success:
   // @@protoc_insertion_point(parse_success:EnrollOptions)
   return true;
@@ -4927,6 +5573,16 @@ void EnrollOptions::SerializeWithCachedSizes(
       output);
   }
 
+  // float dedup_distance = 9;
+  if (!(this->dedup_distance() <= 0 && this->dedup_distance() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(9, this->dedup_distance(), output);
+  }
+
+  // bool dedup_merge = 10;
+  if (this->dedup_merge() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(10, this->dedup_merge(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -4958,6 +5614,16 @@ void EnrollOptions::SerializeWithCachedSizes(
         8, this->attributes(static_cast<int>(i)), target);
   }
 
+  // float dedup_distance = 9;
+  if (!(this->dedup_distance() <= 0 && this->dedup_distance() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(9, this->dedup_distance(), target);
+  }
+
+  // bool dedup_merge = 10;
+  if (this->dedup_merge() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(10, this->dedup_merge(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -5000,6 +5666,16 @@ size_t EnrollOptions::ByteSizeLong() const {
     total_size += 1 + 1;
   }
 
+  // bool dedup_merge = 10;
+  if (this->dedup_merge() != 0) {
+    total_size += 1 + 1;
+  }
+
+  // float dedup_distance = 9;
+  if (!(this->dedup_distance() <= 0 && this->dedup_distance() >= 0)) {
+    total_size += 1 + 4;
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
@@ -5034,6 +5710,12 @@ void EnrollOptions::MergeFrom(const EnrollOptions& from) {
   if (from.debug() != 0) {
     set_debug(from.debug());
   }
+  if (from.dedup_merge() != 0) {
+    set_dedup_merge(from.dedup_merge());
+  }
+  if (!(from.dedup_distance() <= 0 && from.dedup_distance() >= 0)) {
+    set_dedup_distance(from.dedup_distance());
+  }
 }
 
 void EnrollOptions::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
@@ -5064,6 +5746,8 @@ void EnrollOptions::InternalSwap(EnrollOptions* other) {
   CastToBase(&attributes_)->InternalSwap(CastToBase(&other->attributes_));
   swap(save_request_, other->save_request_);
   swap(debug_, other->debug_);
+  swap(dedup_merge_, other->dedup_merge_);
+  swap(dedup_distance_, other->dedup_distance_);
 }
 
 ::PROTOBUF_NAMESPACE_ID::Metadata EnrollOptions::GetMetadata() const {
@@ -6787,6 +7471,7 @@ void FaceTemplate::clear_data() {
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
 const int FaceTemplate::kDataFieldNumber;
 const int FaceTemplate::kBufferFieldNumber;
+const int FaceTemplate::kAlgorithmFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
 FaceTemplate::FaceTemplate()
@@ -6802,6 +7487,10 @@ FaceTemplate::FaceTemplate(const FaceTemplate& from)
   if (from.buffer().size() > 0) {
     buffer_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.buffer_);
   }
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.algorithm().size() > 0) {
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
   if (from.has_data()) {
     data_ = new ::Vector(*from.data_);
   } else {
@@ -6813,6 +7502,7 @@ FaceTemplate::FaceTemplate(const FaceTemplate& from)
 void FaceTemplate::SharedCtor() {
   ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_FaceTemplate_faro_2fproto_2fface_5fservice_2eproto.base);
   buffer_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   data_ = nullptr;
 }
 
@@ -6823,6 +7513,7 @@ FaceTemplate::~FaceTemplate() {
 
 void FaceTemplate::SharedDtor() {
   buffer_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (this != internal_default_instance()) delete data_;
 }
 
@@ -6842,6 +7533,7 @@ void FaceTemplate::Clear() {
   (void) cached_has_bits;
 
   buffer_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (GetArenaNoVirtual() == nullptr && data_ != nullptr) {
     delete data_;
   }
@@ -6871,6 +7563,13 @@ const char* FaceTemplate::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_I
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
+      // string algorithm = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_algorithm(), ptr, ctx, "FaceTemplate.algorithm");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -6923,6 +7622,21 @@ bool FaceTemplate::MergePartialFromCodedStream(
         break;
       }
 
+      // string algorithm = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_algorithm()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceTemplate.algorithm"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
       handle_unusual:
         if (tag == 0) {
@@ -6962,6 +7676,16 @@ void FaceTemplate::SerializeWithCachedSizes(
       2, this->buffer(), output);
   }
 
+  // string algorithm = 3;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceTemplate.algorithm");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      3, this->algorithm(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -6989,6 +7713,17 @@ void FaceTemplate::SerializeWithCachedSizes(
         2, this->buffer(), target);
   }
 
+  // string algorithm = 3;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceTemplate.algorithm");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        3, this->algorithm(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -7017,6 +7752,13 @@ size_t FaceTemplate::ByteSizeLong() const {
         this->buffer());
   }
 
+  // string algorithm = 3;
+  if (this->algorithm().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->algorithm());
+  }
+
   // .Vector data = 1;
   if (this->has_data()) {
     total_size += 1 +
@@ -7055,6 +7797,10 @@ void FaceTemplate::MergeFrom(const FaceTemplate& from) {
 
     buffer_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.buffer_);
   }
+  if (from.algorithm().size() > 0) {
+
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
   if (from.has_data()) {
     mutable_data()->::Vector::MergeFrom(from.data());
   }
@@ -7087,6 +7833,8 @@ void FaceTemplate::InternalSwap(FaceTemplate* other) {
   _internal_metadata_.Swap(&other->_internal_metadata_);
   buffer_.Swap(&other->buffer_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
+  algorithm_.Swap(&other->algorithm_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
   swap(data_, other->data_);
 }
 
@@ -7864,6 +8612,7 @@ const int FaceRecord::kSubjectIdFieldNumber;
 const int FaceRecord::kNameFieldNumber;
 const int FaceRecord::kSourceFieldNumber;
 const int FaceRecord::kFrameFieldNumber;
+const int FaceRecord::kAlgorithmFieldNumber;
 const int FaceRecord::kNotesFieldNumber;
 const int FaceRecord::kGalleryKeyFieldNumber;
 const int FaceRecord::kCollectionDateFieldNumber;
@@ -7915,6 +8664,10 @@ FaceRecord::FaceRecord(const FaceRecord& from)
   if (from.gallery_key().size() > 0) {
     gallery_key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_key_);
   }
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.algorithm().size() > 0) {
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
   if (from.has_detection()) {
     detection_ = new ::Detection(*from.detection_);
   } else {
@@ -7953,6 +8706,7 @@ void FaceRecord::SharedCtor() {
   name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   notes_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   gallery_key_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   ::memset(&detection_, 0, static_cast<size_t>(
       reinterpret_cast<char*>(&enrollment_date_) -
       reinterpret_cast<char*>(&detection_)) + sizeof(enrollment_date_));
@@ -7969,6 +8723,7 @@ void FaceRecord::SharedDtor() {
   name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   notes_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   gallery_key_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (this != internal_default_instance()) delete detection_;
   if (this != internal_default_instance()) delete template__;
   if (this != internal_default_instance()) delete view_;
@@ -8001,6 +8756,7 @@ void FaceRecord::Clear() {
   name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   gallery_key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (GetArenaNoVirtual() == nullptr && detection_ != nullptr) {
     delete detection_;
   }
@@ -8193,6 +8949,13 @@ const char* FaceRecord::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID:
           } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint16>(ptr) == 410);
         } else goto handle_unusual;
         continue;
+      // string algorithm = 20;
+      case 20:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 162)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_algorithm(), ptr, ctx, "FaceRecord.algorithm");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -8460,6 +9223,21 @@ bool FaceRecord::MergePartialFromCodedStream(
         break;
       }
 
+      // string algorithm = 20;
+      case 20: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (162 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_algorithm()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceRecord.algorithm"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
       handle_unusual:
         if (tag == 0) {
@@ -8632,6 +9410,16 @@ void FaceRecord::SerializeWithCachedSizes(
       output);
   }
 
+  // string algorithm = 20;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceRecord.algorithm");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      20, this->algorithm(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -8795,6 +9583,17 @@ void FaceRecord::SerializeWithCachedSizes(
         19, this->access_records(static_cast<int>(i)), target);
   }
 
+  // string algorithm = 20;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceRecord.algorithm");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        20, this->algorithm(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -8906,6 +9705,13 @@ size_t FaceRecord::ByteSizeLong() const {
         this->gallery_key());
   }
 
+  // string algorithm = 20;
+  if (this->algorithm().size() > 0) {
+    total_size += 2 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->algorithm());
+  }
+
   // .Detection detection = 2;
   if (this->has_detection()) {
     total_size += 1 +
@@ -9015,6 +9821,10 @@ void FaceRecord::MergeFrom(const FaceRecord& from) {
 
     gallery_key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_key_);
   }
+  if (from.algorithm().size() > 0) {
+
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
   if (from.has_detection()) {
     mutable_detection()->::Detection::MergeFrom(from.detection());
   }
@@ -9084,6 +9894,8 @@ void FaceRecord::InternalSwap(FaceRecord* other) {
     GetArenaNoVirtual());
   gallery_key_.Swap(&other->gallery_key_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
+  algorithm_.Swap(&other->algorithm_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
   swap(detection_, other->detection_);
   swap(template__, other->template__);
   swap(view_, other->view_);
@@ -9103,13 +9915,21 @@ void FaceRecord::InternalSwap(FaceRecord* other) {
 // ===================================================================
 
 void FaceRecordList::InitAsDefaultInstance() {
+  ::_FaceRecordList_default_instance_._instance.get_mutable()->enroll_stats_ = const_cast< ::EnrollStats*>(
+      ::EnrollStats::internal_default_instance());
 }
 class FaceRecordList::HasBitSetters {
  public:
+  static const ::EnrollStats& enroll_stats(const FaceRecordList* msg);
 };
 
+const ::EnrollStats&
+FaceRecordList::HasBitSetters::enroll_stats(const FaceRecordList* msg) {
+  return *msg->enroll_stats_;
+}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
 const int FaceRecordList::kFaceRecordsFieldNumber;
+const int FaceRecordList::kEnrollStatsFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
 FaceRecordList::FaceRecordList()
@@ -9122,11 +9942,17 @@ FaceRecordList::FaceRecordList(const FaceRecordList& from)
       _internal_metadata_(nullptr),
       face_records_(from.face_records_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_enroll_stats()) {
+    enroll_stats_ = new ::EnrollStats(*from.enroll_stats_);
+  } else {
+    enroll_stats_ = nullptr;
+  }
   // @@protoc_insertion_point(copy_constructor:FaceRecordList)
 }
 
 void FaceRecordList::SharedCtor() {
   ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_FaceRecord_faro_2fproto_2fface_5fservice_2eproto.base);
+  enroll_stats_ = nullptr;
 }
 
 FaceRecordList::~FaceRecordList() {
@@ -9135,6 +9961,7 @@ FaceRecordList::~FaceRecordList() {
 }
 
 void FaceRecordList::SharedDtor() {
+  if (this != internal_default_instance()) delete enroll_stats_;
 }
 
 void FaceRecordList::SetCachedSize(int size) const {
@@ -9153,6 +9980,10 @@ void FaceRecordList::Clear() {
   (void) cached_has_bits;
 
   face_records_.Clear();
+  if (GetArenaNoVirtual() == nullptr && enroll_stats_ != nullptr) {
+    delete enroll_stats_;
+  }
+  enroll_stats_ = nullptr;
   _internal_metadata_.Clear();
 }
 
@@ -9176,6 +10007,13 @@ const char* FaceRecordList::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE
           } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 10);
         } else goto handle_unusual;
         continue;
+      // .EnrollStats enroll_stats = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ctx->ParseMessage(mutable_enroll_stats(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -9217,6 +10055,17 @@ bool FaceRecordList::MergePartialFromCodedStream(
         break;
       }
 
+      // .EnrollStats enroll_stats = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_enroll_stats()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
       handle_unusual:
         if (tag == 0) {
@@ -9253,6 +10102,12 @@ void FaceRecordList::SerializeWithCachedSizes(
       output);
   }
 
+  // .EnrollStats enroll_stats = 3;
+  if (this->has_enroll_stats()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      3, HasBitSetters::enroll_stats(this), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -9274,6 +10129,13 @@ void FaceRecordList::SerializeWithCachedSizes(
         1, this->face_records(static_cast<int>(i)), target);
   }
 
+  // .EnrollStats enroll_stats = 3;
+  if (this->has_enroll_stats()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        3, HasBitSetters::enroll_stats(this), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -9306,6 +10168,13 @@ size_t FaceRecordList::ByteSizeLong() const {
     }
   }
 
+  // .EnrollStats enroll_stats = 3;
+  if (this->has_enroll_stats()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *enroll_stats_);
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
@@ -9334,6 +10203,9 @@ void FaceRecordList::MergeFrom(const FaceRecordList& from) {
   (void) cached_has_bits;
 
   face_records_.MergeFrom(from.face_records_);
+  if (from.has_enroll_stats()) {
+    mutable_enroll_stats()->::EnrollStats::MergeFrom(from.enroll_stats());
+  }
 }
 
 void FaceRecordList::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
@@ -9362,6 +10234,7 @@ void FaceRecordList::InternalSwap(FaceRecordList* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
   CastToBase(&face_records_)->InternalSwap(CastToBase(&other->face_records_));
+  swap(enroll_stats_, other->enroll_stats_);
 }
 
 ::PROTOBUF_NAMESPACE_ID::Metadata FaceRecordList::GetMetadata() const {
@@ -9371,108 +10244,103 @@ void FaceRecordList::InternalSwap(FaceRecordList* other) {
 
 // ===================================================================
 
-void VerificationRequest::InitAsDefaultInstance() {
+void EnrollStats::InitAsDefaultInstance() {
 }
-class VerificationRequest::HasBitSetters {
+class EnrollStats::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int VerificationRequest::kGalleryFieldNumber;
-const int VerificationRequest::kSubjectIdFieldNumber;
-const int VerificationRequest::kFaceRecordFieldNumber;
+const int EnrollStats::kEnrollCountFieldNumber;
+const int EnrollStats::kReplaceCountFieldNumber;
+const int EnrollStats::kSkipCountFieldNumber;
+const int EnrollStats::kMergeCountFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-VerificationRequest::VerificationRequest()
+EnrollStats::EnrollStats()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:VerificationRequest)
+  // @@protoc_insertion_point(constructor:EnrollStats)
 }
-VerificationRequest::VerificationRequest(const VerificationRequest& from)
+EnrollStats::EnrollStats(const EnrollStats& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr),
-      face_record_(from.face_record_) {
+      _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.gallery().size() > 0) {
-    gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_);
-  }
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.subject_id().size() > 0) {
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  // @@protoc_insertion_point(copy_constructor:VerificationRequest)
+  ::memcpy(&enroll_count_, &from.enroll_count_,
+    static_cast<size_t>(reinterpret_cast<char*>(&merge_count_) -
+    reinterpret_cast<char*>(&enroll_count_)) + sizeof(merge_count_));
+  // @@protoc_insertion_point(copy_constructor:EnrollStats)
 }
 
-void VerificationRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_VerificationRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollStats::SharedCtor() {
+  ::memset(&enroll_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&merge_count_) -
+      reinterpret_cast<char*>(&enroll_count_)) + sizeof(merge_count_));
 }
 
-VerificationRequest::~VerificationRequest() {
-  // @@protoc_insertion_point(destructor:VerificationRequest)
+EnrollStats::~EnrollStats() {
+  // @@protoc_insertion_point(destructor:EnrollStats)
   SharedDtor();
 }
 
-void VerificationRequest::SharedDtor() {
-  gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollStats::SharedDtor() {
 }
 
-void VerificationRequest::SetCachedSize(int size) const {
+void EnrollStats::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const VerificationRequest& VerificationRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_VerificationRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollStats& EnrollStats::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollStats_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void VerificationRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:VerificationRequest)
+void EnrollStats::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollStats)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  face_record_.Clear();
-  gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&enroll_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&merge_count_) -
+      reinterpret_cast<char*>(&enroll_count_)) + sizeof(merge_count_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* VerificationRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollStats::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string gallery = 1;
+      // int64 enroll_count = 1;
       case 1:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery(), ptr, ctx, "VerificationRequest.gallery");
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          enroll_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // string subject_id = 2;
+      // int64 replace_count = 2;
       case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "VerificationRequest.subject_id");
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          replace_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // repeated .FaceRecord face_record = 3;
+      // int64 skip_count = 3;
       case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
-          ptr -= 1;
-          do {
-            ptr += 1;
-            ptr = ctx->ParseMessage(add_face_record(), ptr);
-            CHK_(ptr);
-            if (!ctx->DataAvailable(ptr)) break;
-          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 26);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          skip_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 merge_count = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          merge_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
         } else goto handle_unusual;
         continue;
       default: {
@@ -9495,51 +10363,62 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool VerificationRequest::MergePartialFromCodedStream(
+bool EnrollStats::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:VerificationRequest)
+  // @@protoc_insertion_point(parse_start:EnrollStats)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string gallery = 1;
+      // int64 enroll_count = 1;
       case 1: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_gallery()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->gallery().data(), static_cast<int>(this->gallery().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "VerificationRequest.gallery"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &enroll_count_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string subject_id = 2;
+      // int64 replace_count = 2;
       case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_subject_id()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "VerificationRequest.subject_id"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &replace_count_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // repeated .FaceRecord face_record = 3;
+      // int64 skip_count = 3;
       case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-                input, add_face_record()));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &skip_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 merge_count = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &merge_count_)));
         } else {
           goto handle_unusual;
         }
@@ -9558,103 +10437,84 @@ bool VerificationRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:VerificationRequest)
+  // @@protoc_insertion_point(parse_success:EnrollStats)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:VerificationRequest)
+  // @@protoc_insertion_point(parse_failure:EnrollStats)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void VerificationRequest::SerializeWithCachedSizes(
+void EnrollStats::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:VerificationRequest)
+  // @@protoc_insertion_point(serialize_start:EnrollStats)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery = 1;
-  if (this->gallery().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery().data(), static_cast<int>(this->gallery().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationRequest.gallery");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->gallery(), output);
+  // int64 enroll_count = 1;
+  if (this->enroll_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(1, this->enroll_count(), output);
   }
 
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationRequest.subject_id");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      2, this->subject_id(), output);
+  // int64 replace_count = 2;
+  if (this->replace_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->replace_count(), output);
   }
 
-  // repeated .FaceRecord face_record = 3;
-  for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->face_record_size()); i < n; i++) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      3,
-      this->face_record(static_cast<int>(i)),
-      output);
+  // int64 skip_count = 3;
+  if (this->skip_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->skip_count(), output);
+  }
+
+  // int64 merge_count = 4;
+  if (this->merge_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->merge_count(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:VerificationRequest)
+  // @@protoc_insertion_point(serialize_end:EnrollStats)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* VerificationRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollStats::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:VerificationRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollStats)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery = 1;
-  if (this->gallery().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery().data(), static_cast<int>(this->gallery().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationRequest.gallery");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->gallery(), target);
+  // int64 enroll_count = 1;
+  if (this->enroll_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(1, this->enroll_count(), target);
   }
 
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationRequest.subject_id");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        2, this->subject_id(), target);
+  // int64 replace_count = 2;
+  if (this->replace_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->replace_count(), target);
   }
 
-  // repeated .FaceRecord face_record = 3;
-  for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->face_record_size()); i < n; i++) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        3, this->face_record(static_cast<int>(i)), target);
+  // int64 skip_count = 3;
+  if (this->skip_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->skip_count(), target);
+  }
+
+  // int64 merge_count = 4;
+  if (this->merge_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->merge_count(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:VerificationRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollStats)
   return target;
 }
 
-size_t VerificationRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:VerificationRequest)
+size_t EnrollStats::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollStats)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -9666,29 +10526,32 @@ size_t VerificationRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // repeated .FaceRecord face_record = 3;
-  {
-    unsigned int count = static_cast<unsigned int>(this->face_record_size());
-    total_size += 1UL * count;
-    for (unsigned int i = 0; i < count; i++) {
-      total_size +=
-        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-          this->face_record(static_cast<int>(i)));
-    }
+  // int64 enroll_count = 1;
+  if (this->enroll_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->enroll_count());
   }
 
-  // string gallery = 1;
-  if (this->gallery().size() > 0) {
+  // int64 replace_count = 2;
+  if (this->replace_count() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->gallery());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->replace_count());
   }
 
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
+  // int64 skip_count = 3;
+  if (this->skip_count() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->subject_id());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->skip_count());
+  }
+
+  // int64 merge_count = 4;
+  if (this->merge_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->merge_count());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -9696,200 +10559,184 @@ size_t VerificationRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void VerificationRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:VerificationRequest)
+void EnrollStats::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollStats)
   GOOGLE_DCHECK_NE(&from, this);
-  const VerificationRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<VerificationRequest>(
+  const EnrollStats* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollStats>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:VerificationRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollStats)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:VerificationRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollStats)
     MergeFrom(*source);
   }
 }
 
-void VerificationRequest::MergeFrom(const VerificationRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:VerificationRequest)
+void EnrollStats::MergeFrom(const EnrollStats& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollStats)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  face_record_.MergeFrom(from.face_record_);
-  if (from.gallery().size() > 0) {
-
-    gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_);
+  if (from.enroll_count() != 0) {
+    set_enroll_count(from.enroll_count());
   }
-  if (from.subject_id().size() > 0) {
-
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  if (from.replace_count() != 0) {
+    set_replace_count(from.replace_count());
+  }
+  if (from.skip_count() != 0) {
+    set_skip_count(from.skip_count());
+  }
+  if (from.merge_count() != 0) {
+    set_merge_count(from.merge_count());
   }
 }
 
-void VerificationRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:VerificationRequest)
+void EnrollStats::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollStats)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void VerificationRequest::CopyFrom(const VerificationRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:VerificationRequest)
+void EnrollStats::CopyFrom(const EnrollStats& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollStats)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool VerificationRequest::IsInitialized() const {
+bool EnrollStats::IsInitialized() const {
   return true;
 }
 
-void VerificationRequest::Swap(VerificationRequest* other) {
+void EnrollStats::Swap(EnrollStats* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void VerificationRequest::InternalSwap(VerificationRequest* other) {
+void EnrollStats::InternalSwap(EnrollStats* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  CastToBase(&face_record_)->InternalSwap(CastToBase(&other->face_record_));
-  gallery_.Swap(&other->gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
+  swap(enroll_count_, other->enroll_count_);
+  swap(replace_count_, other->replace_count_);
+  swap(skip_count_, other->skip_count_);
+  swap(merge_count_, other->merge_count_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata VerificationRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollStats::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void VerificationResponse::InitAsDefaultInstance() {
+void VerificationRequest::InitAsDefaultInstance() {
 }
-class VerificationResponse::HasBitSetters {
+class VerificationRequest::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int VerificationResponse::kErrorCodeFieldNumber;
-const int VerificationResponse::kErrorMessageFieldNumber;
-const int VerificationResponse::kSuccessFieldNumber;
-const int VerificationResponse::kConfidenceFieldNumber;
-const int VerificationResponse::kMatchesFieldNumber;
+const int VerificationRequest::kGalleryFieldNumber;
+const int VerificationRequest::kSubjectIdFieldNumber;
+const int VerificationRequest::kFaceRecordFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-VerificationResponse::VerificationResponse()
+VerificationRequest::VerificationRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:VerificationResponse)
+  // @@protoc_insertion_point(constructor:VerificationRequest)
 }
-VerificationResponse::VerificationResponse(const VerificationResponse& from)
+VerificationRequest::VerificationRequest(const VerificationRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr),
-      matches_(from.matches_) {
+      face_record_(from.face_record_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  error_message_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.error_message().size() > 0) {
-    error_message_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.error_message_);
+  gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery().size() > 0) {
+    gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_);
   }
-  ::memcpy(&success_, &from.success_,
-    static_cast<size_t>(reinterpret_cast<char*>(&error_code_) -
-    reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
-  // @@protoc_insertion_point(copy_constructor:VerificationResponse)
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.subject_id().size() > 0) {
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  // @@protoc_insertion_point(copy_constructor:VerificationRequest)
 }
 
-void VerificationResponse::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_VerificationResponse_faro_2fproto_2fface_5fservice_2eproto.base);
-  error_message_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&success_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&error_code_) -
-      reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
+void VerificationRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_VerificationRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-VerificationResponse::~VerificationResponse() {
-  // @@protoc_insertion_point(destructor:VerificationResponse)
+VerificationRequest::~VerificationRequest() {
+  // @@protoc_insertion_point(destructor:VerificationRequest)
   SharedDtor();
 }
 
-void VerificationResponse::SharedDtor() {
-  error_message_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void VerificationRequest::SharedDtor() {
+  gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void VerificationResponse::SetCachedSize(int size) const {
+void VerificationRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const VerificationResponse& VerificationResponse::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_VerificationResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+const VerificationRequest& VerificationRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_VerificationRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void VerificationResponse::Clear() {
-// @@protoc_insertion_point(message_clear_start:VerificationResponse)
+void VerificationRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:VerificationRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  matches_.Clear();
-  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&success_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&error_code_) -
-      reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
+  face_record_.Clear();
+  gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* VerificationResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* VerificationRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // bool success = 1;
+      // string gallery = 1;
       case 1:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
-          success_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery(), ptr, ctx, "VerificationRequest.gallery");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // float confidence = 2;
+      // string subject_id = 2;
       case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 21)) {
-          confidence_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
-          ptr += sizeof(float);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "VerificationRequest.subject_id");
+          CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // repeated .FaceRecord matches = 3;
+      // repeated .FaceRecord face_record = 3;
       case 3:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
           ptr -= 1;
           do {
             ptr += 1;
-            ptr = ctx->ParseMessage(add_matches(), ptr);
+            ptr = ctx->ParseMessage(add_face_record(), ptr);
             CHK_(ptr);
             if (!ctx->DataAvailable(ptr)) break;
           } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 26);
         } else goto handle_unusual;
         continue;
-      // int32 error_code = 4;
-      case 4:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
-          error_code_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // string error_message = 5;
-      case 5:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_error_message(), ptr, ctx, "VerificationResponse.error_message");
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -9910,75 +10757,51 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool VerificationResponse::MergePartialFromCodedStream(
+bool VerificationRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:VerificationResponse)
+  // @@protoc_insertion_point(parse_start:VerificationRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // bool success = 1;
+      // string gallery = 1;
       case 1: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
-                 input, &success_)));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // float confidence = 2;
-      case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (21 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
-                 input, &confidence_)));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // repeated .FaceRecord matches = 3;
-      case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-                input, add_matches()));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery().data(), static_cast<int>(this->gallery().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "VerificationRequest.gallery"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // int32 error_code = 4;
-      case 4: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
-                 input, &error_code_)));
+      // string subject_id = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_subject_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "VerificationRequest.subject_id"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string error_message = 5;
-      case 5: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_error_message()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->error_message().data(), static_cast<int>(this->error_message().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "VerificationResponse.error_message"));
+      // repeated .FaceRecord face_record = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+                input, add_face_record()));
         } else {
           goto handle_unusual;
         }
@@ -9997,112 +10820,103 @@ bool VerificationResponse::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:VerificationResponse)
+  // @@protoc_insertion_point(parse_success:VerificationRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:VerificationResponse)
+  // @@protoc_insertion_point(parse_failure:VerificationRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void VerificationResponse::SerializeWithCachedSizes(
+void VerificationRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:VerificationResponse)
+  // @@protoc_insertion_point(serialize_start:VerificationRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // bool success = 1;
-  if (this->success() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(1, this->success(), output);
+  // string gallery = 1;
+  if (this->gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery().data(), static_cast<int>(this->gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationRequest.gallery");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery(), output);
   }
 
-  // float confidence = 2;
-  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(2, this->confidence(), output);
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationRequest.subject_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->subject_id(), output);
   }
 
-  // repeated .FaceRecord matches = 3;
+  // repeated .FaceRecord face_record = 3;
   for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->matches_size()); i < n; i++) {
+      n = static_cast<unsigned int>(this->face_record_size()); i < n; i++) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
       3,
-      this->matches(static_cast<int>(i)),
+      this->face_record(static_cast<int>(i)),
       output);
   }
 
-  // int32 error_code = 4;
-  if (this->error_code() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->error_code(), output);
-  }
-
-  // string error_message = 5;
-  if (this->error_message().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->error_message().data(), static_cast<int>(this->error_message().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationResponse.error_message");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      5, this->error_message(), output);
-  }
-
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:VerificationResponse)
+  // @@protoc_insertion_point(serialize_end:VerificationRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* VerificationResponse::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* VerificationRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:VerificationResponse)
+  // @@protoc_insertion_point(serialize_to_array_start:VerificationRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // bool success = 1;
-  if (this->success() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(1, this->success(), target);
+  // string gallery = 1;
+  if (this->gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery().data(), static_cast<int>(this->gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationRequest.gallery");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery(), target);
   }
 
-  // float confidence = 2;
-  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(2, this->confidence(), target);
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationRequest.subject_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->subject_id(), target);
   }
 
-  // repeated .FaceRecord matches = 3;
+  // repeated .FaceRecord face_record = 3;
   for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->matches_size()); i < n; i++) {
+      n = static_cast<unsigned int>(this->face_record_size()); i < n; i++) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        3, this->matches(static_cast<int>(i)), target);
-  }
-
-  // int32 error_code = 4;
-  if (this->error_code() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->error_code(), target);
-  }
-
-  // string error_message = 5;
-  if (this->error_message().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->error_message().data(), static_cast<int>(this->error_message().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "VerificationResponse.error_message");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        5, this->error_message(), target);
+        3, this->face_record(static_cast<int>(i)), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:VerificationResponse)
+  // @@protoc_insertion_point(serialize_to_array_end:VerificationRequest)
   return target;
 }
 
-size_t VerificationResponse::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:VerificationResponse)
+size_t VerificationRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:VerificationRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -10114,39 +10928,29 @@ size_t VerificationResponse::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // repeated .FaceRecord matches = 3;
+  // repeated .FaceRecord face_record = 3;
   {
-    unsigned int count = static_cast<unsigned int>(this->matches_size());
+    unsigned int count = static_cast<unsigned int>(this->face_record_size());
     total_size += 1UL * count;
     for (unsigned int i = 0; i < count; i++) {
       total_size +=
         ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-          this->matches(static_cast<int>(i)));
+          this->face_record(static_cast<int>(i)));
     }
   }
 
-  // string error_message = 5;
-  if (this->error_message().size() > 0) {
+  // string gallery = 1;
+  if (this->gallery().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->error_message());
-  }
-
-  // bool success = 1;
-  if (this->success() != 0) {
-    total_size += 1 + 1;
-  }
-
-  // float confidence = 2;
-  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
-    total_size += 1 + 4;
+        this->gallery());
   }
 
-  // int32 error_code = 4;
-  if (this->error_code() != 0) {
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
-        this->error_code());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->subject_id());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -10154,206 +10958,198 @@ size_t VerificationResponse::ByteSizeLong() const {
   return total_size;
 }
 
-void VerificationResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:VerificationResponse)
+void VerificationRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:VerificationRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const VerificationResponse* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<VerificationResponse>(
+  const VerificationRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<VerificationRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:VerificationResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:VerificationRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:VerificationResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:VerificationRequest)
     MergeFrom(*source);
   }
 }
 
-void VerificationResponse::MergeFrom(const VerificationResponse& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:VerificationResponse)
+void VerificationRequest::MergeFrom(const VerificationRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:VerificationRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  matches_.MergeFrom(from.matches_);
-  if (from.error_message().size() > 0) {
+  face_record_.MergeFrom(from.face_record_);
+  if (from.gallery().size() > 0) {
 
-    error_message_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.error_message_);
-  }
-  if (from.success() != 0) {
-    set_success(from.success());
-  }
-  if (!(from.confidence() <= 0 && from.confidence() >= 0)) {
-    set_confidence(from.confidence());
+    gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_);
   }
-  if (from.error_code() != 0) {
-    set_error_code(from.error_code());
+  if (from.subject_id().size() > 0) {
+
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
   }
 }
 
-void VerificationResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:VerificationResponse)
+void VerificationRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:VerificationRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void VerificationResponse::CopyFrom(const VerificationResponse& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:VerificationResponse)
+void VerificationRequest::CopyFrom(const VerificationRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:VerificationRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool VerificationResponse::IsInitialized() const {
+bool VerificationRequest::IsInitialized() const {
   return true;
 }
 
-void VerificationResponse::Swap(VerificationResponse* other) {
+void VerificationRequest::Swap(VerificationRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void VerificationResponse::InternalSwap(VerificationResponse* other) {
+void VerificationRequest::InternalSwap(VerificationRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  CastToBase(&matches_)->InternalSwap(CastToBase(&other->matches_));
-  error_message_.Swap(&other->error_message_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  CastToBase(&face_record_)->InternalSwap(CastToBase(&other->face_record_));
+  gallery_.Swap(&other->gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  swap(success_, other->success_);
-  swap(confidence_, other->confidence_);
-  swap(error_code_, other->error_code_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata VerificationResponse::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata VerificationRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void SearchRequest::InitAsDefaultInstance() {
-  ::_SearchRequest_default_instance_._instance.get_mutable()->probes_ = const_cast< ::FaceRecordList*>(
-      ::FaceRecordList::internal_default_instance());
+void VerificationResponse::InitAsDefaultInstance() {
 }
-class SearchRequest::HasBitSetters {
+class VerificationResponse::HasBitSetters {
  public:
-  static const ::FaceRecordList& probes(const SearchRequest* msg);
 };
 
-const ::FaceRecordList&
-SearchRequest::HasBitSetters::probes(const SearchRequest* msg) {
-  return *msg->probes_;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int SearchRequest::kSearchGalleryFieldNumber;
-const int SearchRequest::kProbesFieldNumber;
-const int SearchRequest::kMaxResultsFieldNumber;
-const int SearchRequest::kThresholdFieldNumber;
+const int VerificationResponse::kErrorCodeFieldNumber;
+const int VerificationResponse::kErrorMessageFieldNumber;
+const int VerificationResponse::kSuccessFieldNumber;
+const int VerificationResponse::kConfidenceFieldNumber;
+const int VerificationResponse::kMatchesFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-SearchRequest::SearchRequest()
+VerificationResponse::VerificationResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:SearchRequest)
+  // @@protoc_insertion_point(constructor:VerificationResponse)
 }
-SearchRequest::SearchRequest(const SearchRequest& from)
+VerificationResponse::VerificationResponse(const VerificationResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr) {
+      _internal_metadata_(nullptr),
+      matches_(from.matches_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  search_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.search_gallery().size() > 0) {
-    search_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.search_gallery_);
-  }
-  if (from.has_probes()) {
-    probes_ = new ::FaceRecordList(*from.probes_);
-  } else {
-    probes_ = nullptr;
+  error_message_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.error_message().size() > 0) {
+    error_message_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.error_message_);
   }
-  ::memcpy(&max_results_, &from.max_results_,
-    static_cast<size_t>(reinterpret_cast<char*>(&threshold_) -
-    reinterpret_cast<char*>(&max_results_)) + sizeof(threshold_));
-  // @@protoc_insertion_point(copy_constructor:SearchRequest)
+  ::memcpy(&success_, &from.success_,
+    static_cast<size_t>(reinterpret_cast<char*>(&error_code_) -
+    reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
+  // @@protoc_insertion_point(copy_constructor:VerificationResponse)
 }
 
-void SearchRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  search_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&probes_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&threshold_) -
-      reinterpret_cast<char*>(&probes_)) + sizeof(threshold_));
+void VerificationResponse::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_VerificationResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  error_message_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&success_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&error_code_) -
+      reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
 }
 
-SearchRequest::~SearchRequest() {
-  // @@protoc_insertion_point(destructor:SearchRequest)
+VerificationResponse::~VerificationResponse() {
+  // @@protoc_insertion_point(destructor:VerificationResponse)
   SharedDtor();
 }
 
-void SearchRequest::SharedDtor() {
-  search_gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (this != internal_default_instance()) delete probes_;
+void VerificationResponse::SharedDtor() {
+  error_message_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void SearchRequest::SetCachedSize(int size) const {
+void VerificationResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const SearchRequest& SearchRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const VerificationResponse& VerificationResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_VerificationResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void SearchRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:SearchRequest)
+void VerificationResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:VerificationResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  search_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
-    delete probes_;
-  }
-  probes_ = nullptr;
-  ::memset(&max_results_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&threshold_) -
-      reinterpret_cast<char*>(&max_results_)) + sizeof(threshold_));
+  matches_.Clear();
+  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&success_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&error_code_) -
+      reinterpret_cast<char*>(&success_)) + sizeof(error_code_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* SearchRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* VerificationResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string search_gallery = 1;
+      // bool success = 1;
       case 1:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_search_gallery(), ptr, ctx, "SearchRequest.search_gallery");
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          success_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .FaceRecordList probes = 3;
+      // float confidence = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 21)) {
+          confidence_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // repeated .FaceRecord matches = 3;
       case 3:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
-          ptr = ctx->ParseMessage(mutable_probes(), ptr);
-          CHK_(ptr);
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(add_matches(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 26);
         } else goto handle_unusual;
         continue;
-      // int32 max_results = 4;
+      // int32 error_code = 4;
       case 4:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
-          max_results_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          error_code_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // float threshold = 5;
+      // string error_message = 5;
       case 5:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 45)) {
-          threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
-          ptr += sizeof(float);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_error_message(), ptr, ctx, "VerificationResponse.error_message");
+          CHK_(ptr);
         } else goto handle_unusual;
         continue;
       default: {
@@ -10376,62 +11172,75 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool SearchRequest::MergePartialFromCodedStream(
+bool VerificationResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:SearchRequest)
+  // @@protoc_insertion_point(parse_start:VerificationResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string search_gallery = 1;
+      // bool success = 1;
       case 1: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_search_gallery()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "SearchRequest.search_gallery"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &success_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .FaceRecordList probes = 3;
+      // float confidence = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (21 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &confidence_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated .FaceRecord matches = 3;
       case 3: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_probes()));
+                input, add_matches()));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // int32 max_results = 4;
+      // int32 error_code = 4;
       case 4: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
                    ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
-                 input, &max_results_)));
+                 input, &error_code_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // float threshold = 5;
+      // string error_message = 5;
       case 5: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (45 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
-                 input, &threshold_)));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_error_message()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->error_message().data(), static_cast<int>(this->error_message().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "VerificationResponse.error_message"));
         } else {
           goto handle_unusual;
         }
@@ -10450,98 +11259,112 @@ bool SearchRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:SearchRequest)
+  // @@protoc_insertion_point(parse_success:VerificationResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:SearchRequest)
+  // @@protoc_insertion_point(parse_failure:VerificationResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void SearchRequest::SerializeWithCachedSizes(
+void VerificationResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:SearchRequest)
+  // @@protoc_insertion_point(serialize_start:VerificationResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string search_gallery = 1;
-  if (this->search_gallery().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "SearchRequest.search_gallery");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->search_gallery(), output);
+  // bool success = 1;
+  if (this->success() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(1, this->success(), output);
   }
 
-  // .FaceRecordList probes = 3;
-  if (this->has_probes()) {
+  // float confidence = 2;
+  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(2, this->confidence(), output);
+  }
+
+  // repeated .FaceRecord matches = 3;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->matches_size()); i < n; i++) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      3, HasBitSetters::probes(this), output);
+      3,
+      this->matches(static_cast<int>(i)),
+      output);
   }
 
-  // int32 max_results = 4;
-  if (this->max_results() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->max_results(), output);
+  // int32 error_code = 4;
+  if (this->error_code() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->error_code(), output);
   }
 
-  // float threshold = 5;
-  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(5, this->threshold(), output);
+  // string error_message = 5;
+  if (this->error_message().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->error_message().data(), static_cast<int>(this->error_message().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationResponse.error_message");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      5, this->error_message(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:SearchRequest)
+  // @@protoc_insertion_point(serialize_end:VerificationResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* SearchRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* VerificationResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:SearchRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:VerificationResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string search_gallery = 1;
-  if (this->search_gallery().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "SearchRequest.search_gallery");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->search_gallery(), target);
+  // bool success = 1;
+  if (this->success() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(1, this->success(), target);
   }
 
-  // .FaceRecordList probes = 3;
-  if (this->has_probes()) {
+  // float confidence = 2;
+  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(2, this->confidence(), target);
+  }
+
+  // repeated .FaceRecord matches = 3;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->matches_size()); i < n; i++) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        3, HasBitSetters::probes(this), target);
+        3, this->matches(static_cast<int>(i)), target);
   }
 
-  // int32 max_results = 4;
-  if (this->max_results() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->max_results(), target);
+  // int32 error_code = 4;
+  if (this->error_code() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->error_code(), target);
   }
 
-  // float threshold = 5;
-  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(5, this->threshold(), target);
+  // string error_message = 5;
+  if (this->error_message().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->error_message().data(), static_cast<int>(this->error_message().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "VerificationResponse.error_message");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        5, this->error_message(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:SearchRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:VerificationResponse)
   return target;
 }
 
-size_t SearchRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:SearchRequest)
+size_t VerificationResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:VerificationResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -10553,225 +11376,281 @@ size_t SearchRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string search_gallery = 1;
-  if (this->search_gallery().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->search_gallery());
+  // repeated .FaceRecord matches = 3;
+  {
+    unsigned int count = static_cast<unsigned int>(this->matches_size());
+    total_size += 1UL * count;
+    for (unsigned int i = 0; i < count; i++) {
+      total_size +=
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          this->matches(static_cast<int>(i)));
+    }
   }
 
-  // .FaceRecordList probes = 3;
-  if (this->has_probes()) {
+  // string error_message = 5;
+  if (this->error_message().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *probes_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->error_message());
   }
 
-  // int32 max_results = 4;
-  if (this->max_results() != 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
-        this->max_results());
+  // bool success = 1;
+  if (this->success() != 0) {
+    total_size += 1 + 1;
   }
 
-  // float threshold = 5;
-  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
+  // float confidence = 2;
+  if (!(this->confidence() <= 0 && this->confidence() >= 0)) {
     total_size += 1 + 4;
   }
 
+  // int32 error_code = 4;
+  if (this->error_code() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->error_code());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
 }
 
-void SearchRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:SearchRequest)
+void VerificationResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:VerificationResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const SearchRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<SearchRequest>(
+  const VerificationResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<VerificationResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:SearchRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:VerificationResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:SearchRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:VerificationResponse)
     MergeFrom(*source);
   }
 }
 
-void SearchRequest::MergeFrom(const SearchRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:SearchRequest)
+void VerificationResponse::MergeFrom(const VerificationResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:VerificationResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.search_gallery().size() > 0) {
+  matches_.MergeFrom(from.matches_);
+  if (from.error_message().size() > 0) {
 
-    search_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.search_gallery_);
+    error_message_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.error_message_);
   }
-  if (from.has_probes()) {
-    mutable_probes()->::FaceRecordList::MergeFrom(from.probes());
+  if (from.success() != 0) {
+    set_success(from.success());
   }
-  if (from.max_results() != 0) {
-    set_max_results(from.max_results());
+  if (!(from.confidence() <= 0 && from.confidence() >= 0)) {
+    set_confidence(from.confidence());
   }
-  if (!(from.threshold() <= 0 && from.threshold() >= 0)) {
-    set_threshold(from.threshold());
+  if (from.error_code() != 0) {
+    set_error_code(from.error_code());
   }
 }
 
-void SearchRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:SearchRequest)
+void VerificationResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:VerificationResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void SearchRequest::CopyFrom(const SearchRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:SearchRequest)
+void VerificationResponse::CopyFrom(const VerificationResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:VerificationResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool SearchRequest::IsInitialized() const {
+bool VerificationResponse::IsInitialized() const {
   return true;
 }
 
-void SearchRequest::Swap(SearchRequest* other) {
+void VerificationResponse::Swap(VerificationResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void SearchRequest::InternalSwap(SearchRequest* other) {
+void VerificationResponse::InternalSwap(VerificationResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  search_gallery_.Swap(&other->search_gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  CastToBase(&matches_)->InternalSwap(CastToBase(&other->matches_));
+  error_message_.Swap(&other->error_message_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  swap(probes_, other->probes_);
-  swap(max_results_, other->max_results_);
-  swap(threshold_, other->threshold_);
+  swap(success_, other->success_);
+  swap(confidence_, other->confidence_);
+  swap(error_code_, other->error_code_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata SearchRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata VerificationResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void SearchResponse::InitAsDefaultInstance() {
-  ::_SearchResponse_default_instance_._instance.get_mutable()->message_ = const_cast< ::ErrorMessage*>(
-      ::ErrorMessage::internal_default_instance());
-  ::_SearchResponse_default_instance_._instance.get_mutable()->probes_ = const_cast< ::FaceRecordList*>(
+void SearchRequest::InitAsDefaultInstance() {
+  ::_SearchRequest_default_instance_._instance.get_mutable()->probes_ = const_cast< ::FaceRecordList*>(
       ::FaceRecordList::internal_default_instance());
+  ::_SearchRequest_default_instance_._instance.get_mutable()->filter_ = const_cast< ::SearchFilter*>(
+      ::SearchFilter::internal_default_instance());
 }
-class SearchResponse::HasBitSetters {
+class SearchRequest::HasBitSetters {
  public:
-  static const ::ErrorMessage& message(const SearchResponse* msg);
-  static const ::FaceRecordList& probes(const SearchResponse* msg);
+  static const ::FaceRecordList& probes(const SearchRequest* msg);
+  static const ::SearchFilter& filter(const SearchRequest* msg);
 };
 
-const ::ErrorMessage&
-SearchResponse::HasBitSetters::message(const SearchResponse* msg) {
-  return *msg->message_;
-}
 const ::FaceRecordList&
-SearchResponse::HasBitSetters::probes(const SearchResponse* msg) {
+SearchRequest::HasBitSetters::probes(const SearchRequest* msg) {
   return *msg->probes_;
 }
+const ::SearchFilter&
+SearchRequest::HasBitSetters::filter(const SearchRequest* msg) {
+  return *msg->filter_;
+}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int SearchResponse::kMessageFieldNumber;
-const int SearchResponse::kProbesFieldNumber;
+const int SearchRequest::kSearchGalleryFieldNumber;
+const int SearchRequest::kProbesFieldNumber;
+const int SearchRequest::kMaxResultsFieldNumber;
+const int SearchRequest::kThresholdFieldNumber;
+const int SearchRequest::kNprobeFieldNumber;
+const int SearchRequest::kFilterFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-SearchResponse::SearchResponse()
+SearchRequest::SearchRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:SearchResponse)
+  // @@protoc_insertion_point(constructor:SearchRequest)
 }
-SearchResponse::SearchResponse(const SearchResponse& from)
+SearchRequest::SearchRequest(const SearchRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_message()) {
-    message_ = new ::ErrorMessage(*from.message_);
-  } else {
-    message_ = nullptr;
+  search_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.search_gallery().size() > 0) {
+    search_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.search_gallery_);
   }
   if (from.has_probes()) {
     probes_ = new ::FaceRecordList(*from.probes_);
   } else {
     probes_ = nullptr;
   }
-  // @@protoc_insertion_point(copy_constructor:SearchResponse)
+  if (from.has_filter()) {
+    filter_ = new ::SearchFilter(*from.filter_);
+  } else {
+    filter_ = nullptr;
+  }
+  ::memcpy(&max_results_, &from.max_results_,
+    static_cast<size_t>(reinterpret_cast<char*>(&nprobe_) -
+    reinterpret_cast<char*>(&max_results_)) + sizeof(nprobe_));
+  // @@protoc_insertion_point(copy_constructor:SearchRequest)
 }
 
-void SearchResponse::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&message_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&probes_) -
-      reinterpret_cast<char*>(&message_)) + sizeof(probes_));
+void SearchRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  search_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&probes_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&nprobe_) -
+      reinterpret_cast<char*>(&probes_)) + sizeof(nprobe_));
 }
 
-SearchResponse::~SearchResponse() {
-  // @@protoc_insertion_point(destructor:SearchResponse)
+SearchRequest::~SearchRequest() {
+  // @@protoc_insertion_point(destructor:SearchRequest)
   SharedDtor();
 }
 
-void SearchResponse::SharedDtor() {
-  if (this != internal_default_instance()) delete message_;
+void SearchRequest::SharedDtor() {
+  search_gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (this != internal_default_instance()) delete probes_;
+  if (this != internal_default_instance()) delete filter_;
 }
 
-void SearchResponse::SetCachedSize(int size) const {
+void SearchRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const SearchResponse& SearchResponse::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+const SearchRequest& SearchRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_SearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void SearchResponse::Clear() {
-// @@protoc_insertion_point(message_clear_start:SearchResponse)
+void SearchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:SearchRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && message_ != nullptr) {
-    delete message_;
-  }
-  message_ = nullptr;
+  search_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
     delete probes_;
   }
   probes_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && filter_ != nullptr) {
+    delete filter_;
+  }
+  filter_ = nullptr;
+  ::memset(&max_results_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&nprobe_) -
+      reinterpret_cast<char*>(&max_results_)) + sizeof(nprobe_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* SearchResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* SearchRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .ErrorMessage message = 1;
+      // string search_gallery = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_message(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_search_gallery(), ptr, ctx, "SearchRequest.search_gallery");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .FaceRecordList probes = 2;
-      case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+      // .FaceRecordList probes = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
           ptr = ctx->ParseMessage(mutable_probes(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
+      // int32 max_results = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          max_results_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // float threshold = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 45)) {
+          threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // int32 nprobe = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
+          nprobe_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .SearchFilter filter = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 58)) {
+          ptr = ctx->ParseMessage(mutable_filter(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -10792,30 +11671,34 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool SearchResponse::MergePartialFromCodedStream(
+bool SearchRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:SearchResponse)
+  // @@protoc_insertion_point(parse_start:SearchRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .ErrorMessage message = 1;
+      // string search_gallery = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_message()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_search_gallery()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "SearchRequest.search_gallery"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .FaceRecordList probes = 2;
-      case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+      // .FaceRecordList probes = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
                input, mutable_probes()));
         } else {
@@ -10824,8 +11707,58 @@ bool SearchResponse::MergePartialFromCodedStream(
         break;
       }
 
-      default: {
-      handle_unusual:
+      // int32 max_results = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &max_results_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float threshold = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (45 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &threshold_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 nprobe = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &nprobe_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .SearchFilter filter = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (58 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_filter()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
         if (tag == 0) {
           goto success;
         }
@@ -10836,70 +11769,121 @@ bool SearchResponse::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:SearchResponse)
+  // @@protoc_insertion_point(parse_success:SearchRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:SearchResponse)
+  // @@protoc_insertion_point(parse_failure:SearchRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void SearchResponse::SerializeWithCachedSizes(
+void SearchRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:SearchResponse)
+  // @@protoc_insertion_point(serialize_start:SearchRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .ErrorMessage message = 1;
-  if (this->has_message()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::message(this), output);
+  // string search_gallery = 1;
+  if (this->search_gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "SearchRequest.search_gallery");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->search_gallery(), output);
   }
 
-  // .FaceRecordList probes = 2;
+  // .FaceRecordList probes = 3;
   if (this->has_probes()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::probes(this), output);
+      3, HasBitSetters::probes(this), output);
+  }
+
+  // int32 max_results = 4;
+  if (this->max_results() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->max_results(), output);
+  }
+
+  // float threshold = 5;
+  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(5, this->threshold(), output);
+  }
+
+  // int32 nprobe = 6;
+  if (this->nprobe() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(6, this->nprobe(), output);
+  }
+
+  // .SearchFilter filter = 7;
+  if (this->has_filter()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      7, HasBitSetters::filter(this), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:SearchResponse)
+  // @@protoc_insertion_point(serialize_end:SearchRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* SearchResponse::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* SearchRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:SearchResponse)
+  // @@protoc_insertion_point(serialize_to_array_start:SearchRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .ErrorMessage message = 1;
-  if (this->has_message()) {
+  // string search_gallery = 1;
+  if (this->search_gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->search_gallery().data(), static_cast<int>(this->search_gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "SearchRequest.search_gallery");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->search_gallery(), target);
+  }
+
+  // .FaceRecordList probes = 3;
+  if (this->has_probes()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        1, HasBitSetters::message(this), target);
+        3, HasBitSetters::probes(this), target);
   }
 
-  // .FaceRecordList probes = 2;
-  if (this->has_probes()) {
+  // int32 max_results = 4;
+  if (this->max_results() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->max_results(), target);
+  }
+
+  // float threshold = 5;
+  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(5, this->threshold(), target);
+  }
+
+  // int32 nprobe = 6;
+  if (this->nprobe() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(6, this->nprobe(), target);
+  }
+
+  // .SearchFilter filter = 7;
+  if (this->has_filter()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        2, HasBitSetters::probes(this), target);
+        7, HasBitSetters::filter(this), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:SearchResponse)
+  // @@protoc_insertion_point(serialize_to_array_end:SearchRequest)
   return target;
 }
 
-size_t SearchResponse::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:SearchResponse)
+size_t SearchRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:SearchRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -10911,216 +11895,247 @@ size_t SearchResponse::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // .ErrorMessage message = 1;
-  if (this->has_message()) {
+  // string search_gallery = 1;
+  if (this->search_gallery().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *message_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->search_gallery());
   }
 
-  // .FaceRecordList probes = 2;
+  // .FaceRecordList probes = 3;
   if (this->has_probes()) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
         *probes_);
   }
 
+  // .SearchFilter filter = 7;
+  if (this->has_filter()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *filter_);
+  }
+
+  // int32 max_results = 4;
+  if (this->max_results() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->max_results());
+  }
+
+  // float threshold = 5;
+  if (!(this->threshold() <= 0 && this->threshold() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  // int32 nprobe = 6;
+  if (this->nprobe() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->nprobe());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
 }
 
-void SearchResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:SearchResponse)
+void SearchRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:SearchRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const SearchResponse* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<SearchResponse>(
+  const SearchRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<SearchRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:SearchResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:SearchRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:SearchResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:SearchRequest)
     MergeFrom(*source);
   }
 }
 
-void SearchResponse::MergeFrom(const SearchResponse& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:SearchResponse)
+void SearchRequest::MergeFrom(const SearchRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:SearchRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_message()) {
-    mutable_message()->::ErrorMessage::MergeFrom(from.message());
+  if (from.search_gallery().size() > 0) {
+
+    search_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.search_gallery_);
   }
   if (from.has_probes()) {
     mutable_probes()->::FaceRecordList::MergeFrom(from.probes());
   }
+  if (from.has_filter()) {
+    mutable_filter()->::SearchFilter::MergeFrom(from.filter());
+  }
+  if (from.max_results() != 0) {
+    set_max_results(from.max_results());
+  }
+  if (!(from.threshold() <= 0 && from.threshold() >= 0)) {
+    set_threshold(from.threshold());
+  }
+  if (from.nprobe() != 0) {
+    set_nprobe(from.nprobe());
+  }
 }
 
-void SearchResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:SearchResponse)
+void SearchRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:SearchRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void SearchResponse::CopyFrom(const SearchResponse& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:SearchResponse)
+void SearchRequest::CopyFrom(const SearchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:SearchRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool SearchResponse::IsInitialized() const {
+bool SearchRequest::IsInitialized() const {
   return true;
 }
 
-void SearchResponse::Swap(SearchResponse* other) {
+void SearchRequest::Swap(SearchRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void SearchResponse::InternalSwap(SearchResponse* other) {
+void SearchRequest::InternalSwap(SearchRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(message_, other->message_);
+  search_gallery_.Swap(&other->search_gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
   swap(probes_, other->probes_);
+  swap(filter_, other->filter_);
+  swap(max_results_, other->max_results_);
+  swap(threshold_, other->threshold_);
+  swap(nprobe_, other->nprobe_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata SearchResponse::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata SearchRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void EnrollRequest::InitAsDefaultInstance() {
-  ::_EnrollRequest_default_instance_._instance.get_mutable()->records_ = const_cast< ::FaceRecordList*>(
-      ::FaceRecordList::internal_default_instance());
-  ::_EnrollRequest_default_instance_._instance.get_mutable()->enroll_options_ = const_cast< ::EnrollOptions*>(
-      ::EnrollOptions::internal_default_instance());
+void AttributeFilter::InitAsDefaultInstance() {
 }
-class EnrollRequest::HasBitSetters {
+class AttributeFilter::HasBitSetters {
  public:
-  static const ::FaceRecordList& records(const EnrollRequest* msg);
-  static const ::EnrollOptions& enroll_options(const EnrollRequest* msg);
 };
 
-const ::FaceRecordList&
-EnrollRequest::HasBitSetters::records(const EnrollRequest* msg) {
-  return *msg->records_;
-}
-const ::EnrollOptions&
-EnrollRequest::HasBitSetters::enroll_options(const EnrollRequest* msg) {
-  return *msg->enroll_options_;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int EnrollRequest::kEnrollGalleryFieldNumber;
-const int EnrollRequest::kRecordsFieldNumber;
-const int EnrollRequest::kEnrollOptionsFieldNumber;
+const int AttributeFilter::kKeyFieldNumber;
+const int AttributeFilter::kValuesFieldNumber;
+const int AttributeFilter::kMinValueFieldNumber;
+const int AttributeFilter::kMaxValueFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-EnrollRequest::EnrollRequest()
+AttributeFilter::AttributeFilter()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:EnrollRequest)
+  // @@protoc_insertion_point(constructor:AttributeFilter)
 }
-EnrollRequest::EnrollRequest(const EnrollRequest& from)
+AttributeFilter::AttributeFilter(const AttributeFilter& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr) {
+      _internal_metadata_(nullptr),
+      values_(from.values_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  enroll_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.enroll_gallery().size() > 0) {
-    enroll_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.enroll_gallery_);
-  }
-  if (from.has_records()) {
-    records_ = new ::FaceRecordList(*from.records_);
-  } else {
-    records_ = nullptr;
-  }
-  if (from.has_enroll_options()) {
-    enroll_options_ = new ::EnrollOptions(*from.enroll_options_);
-  } else {
-    enroll_options_ = nullptr;
+  key_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.key().size() > 0) {
+    key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.key_);
   }
-  // @@protoc_insertion_point(copy_constructor:EnrollRequest)
+  ::memcpy(&min_value_, &from.min_value_,
+    static_cast<size_t>(reinterpret_cast<char*>(&max_value_) -
+    reinterpret_cast<char*>(&min_value_)) + sizeof(max_value_));
+  // @@protoc_insertion_point(copy_constructor:AttributeFilter)
 }
 
-void EnrollRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  enroll_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&records_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&enroll_options_) -
-      reinterpret_cast<char*>(&records_)) + sizeof(enroll_options_));
+void AttributeFilter::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto.base);
+  key_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&min_value_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&max_value_) -
+      reinterpret_cast<char*>(&min_value_)) + sizeof(max_value_));
 }
 
-EnrollRequest::~EnrollRequest() {
-  // @@protoc_insertion_point(destructor:EnrollRequest)
+AttributeFilter::~AttributeFilter() {
+  // @@protoc_insertion_point(destructor:AttributeFilter)
   SharedDtor();
 }
 
-void EnrollRequest::SharedDtor() {
-  enroll_gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (this != internal_default_instance()) delete records_;
-  if (this != internal_default_instance()) delete enroll_options_;
+void AttributeFilter::SharedDtor() {
+  key_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void EnrollRequest::SetCachedSize(int size) const {
+void AttributeFilter::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const EnrollRequest& EnrollRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const AttributeFilter& AttributeFilter::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_AttributeFilter_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void EnrollRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:EnrollRequest)
+void AttributeFilter::Clear() {
+// @@protoc_insertion_point(message_clear_start:AttributeFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  enroll_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
-    delete records_;
-  }
-  records_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && enroll_options_ != nullptr) {
-    delete enroll_options_;
-  }
-  enroll_options_ = nullptr;
+  values_.Clear();
+  key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&min_value_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&max_value_) -
+      reinterpret_cast<char*>(&min_value_)) + sizeof(max_value_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* EnrollRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* AttributeFilter::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string enroll_gallery = 1;
+      // string key = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_enroll_gallery(), ptr, ctx, "EnrollRequest.enroll_gallery");
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_key(), ptr, ctx, "AttributeFilter.key");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .FaceRecordList records = 2;
+      // repeated string values = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ctx->ParseMessage(mutable_records(), ptr);
-          CHK_(ptr);
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(add_values(), ptr, ctx, "AttributeFilter.values");
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 18);
         } else goto handle_unusual;
         continue;
-      // .EnrollOptions enroll_options = 10;
-      case 10:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 82)) {
-          ptr = ctx->ParseMessage(mutable_enroll_options(), ptr);
-          CHK_(ptr);
+      // float min_value = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 29)) {
+          min_value_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // float max_value = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 37)) {
+          max_value_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
         } else goto handle_unusual;
         continue;
       default: {
@@ -11143,47 +12158,67 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool EnrollRequest::MergePartialFromCodedStream(
+bool AttributeFilter::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:EnrollRequest)
+  // @@protoc_insertion_point(parse_start:AttributeFilter)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string enroll_gallery = 1;
+      // string key = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_enroll_gallery()));
+                input, this->mutable_key()));
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+            this->key().data(), static_cast<int>(this->key().length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollRequest.enroll_gallery"));
+            "AttributeFilter.key"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .FaceRecordList records = 2;
+      // repeated string values = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_records()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->add_values()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->values(this->values_size() - 1).data(),
+            static_cast<int>(this->values(this->values_size() - 1).length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "AttributeFilter.values"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .EnrollOptions enroll_options = 10;
-      case 10: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (82 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_enroll_options()));
+      // float min_value = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (29 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &min_value_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float max_value = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (37 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &max_value_)));
         } else {
           goto handle_unusual;
         }
@@ -11202,91 +12237,105 @@ bool EnrollRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:EnrollRequest)
+  // @@protoc_insertion_point(parse_success:AttributeFilter)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:EnrollRequest)
+  // @@protoc_insertion_point(parse_failure:AttributeFilter)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void EnrollRequest::SerializeWithCachedSizes(
+void AttributeFilter::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:EnrollRequest)
+  // @@protoc_insertion_point(serialize_start:AttributeFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string enroll_gallery = 1;
-  if (this->enroll_gallery().size() > 0) {
+  // string key = 1;
+  if (this->key().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+      this->key().data(), static_cast<int>(this->key().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollRequest.enroll_gallery");
+      "AttributeFilter.key");
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->enroll_gallery(), output);
+      1, this->key(), output);
   }
 
-  // .FaceRecordList records = 2;
-  if (this->has_records()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::records(this), output);
+  // repeated string values = 2;
+  for (int i = 0, n = this->values_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->values(i).data(), static_cast<int>(this->values(i).length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "AttributeFilter.values");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteString(
+      2, this->values(i), output);
   }
 
-  // .EnrollOptions enroll_options = 10;
-  if (this->has_enroll_options()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      10, HasBitSetters::enroll_options(this), output);
+  // float min_value = 3;
+  if (!(this->min_value() <= 0 && this->min_value() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(3, this->min_value(), output);
+  }
+
+  // float max_value = 4;
+  if (!(this->max_value() <= 0 && this->max_value() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(4, this->max_value(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:EnrollRequest)
+  // @@protoc_insertion_point(serialize_end:AttributeFilter)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* EnrollRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* AttributeFilter::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:EnrollRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:AttributeFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string enroll_gallery = 1;
-  if (this->enroll_gallery().size() > 0) {
+  // string key = 1;
+  if (this->key().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+      this->key().data(), static_cast<int>(this->key().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollRequest.enroll_gallery");
+      "AttributeFilter.key");
     target =
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->enroll_gallery(), target);
+        1, this->key(), target);
   }
 
-  // .FaceRecordList records = 2;
-  if (this->has_records()) {
+  // repeated string values = 2;
+  for (int i = 0, n = this->values_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->values(i).data(), static_cast<int>(this->values(i).length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "AttributeFilter.values");
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, HasBitSetters::records(this), target);
+      WriteStringToArray(2, this->values(i), target);
   }
 
-  // .EnrollOptions enroll_options = 10;
-  if (this->has_enroll_options()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        10, HasBitSetters::enroll_options(this), target);
+  // float min_value = 3;
+  if (!(this->min_value() <= 0 && this->min_value() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(3, this->min_value(), target);
+  }
+
+  // float max_value = 4;
+  if (!(this->max_value() <= 0 && this->max_value() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(4, this->max_value(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:EnrollRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:AttributeFilter)
   return target;
 }
 
-size_t EnrollRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:EnrollRequest)
+size_t AttributeFilter::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:AttributeFilter)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -11298,25 +12347,29 @@ size_t EnrollRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string enroll_gallery = 1;
-  if (this->enroll_gallery().size() > 0) {
+  // repeated string values = 2;
+  total_size += 1 *
+      ::PROTOBUF_NAMESPACE_ID::internal::FromIntSize(this->values_size());
+  for (int i = 0, n = this->values_size(); i < n; i++) {
+    total_size += ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+      this->values(i));
+  }
+
+  // string key = 1;
+  if (this->key().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->enroll_gallery());
+        this->key());
   }
 
-  // .FaceRecordList records = 2;
-  if (this->has_records()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *records_);
+  // float min_value = 3;
+  if (!(this->min_value() <= 0 && this->min_value() >= 0)) {
+    total_size += 1 + 4;
   }
 
-  // .EnrollOptions enroll_options = 10;
-  if (this->has_enroll_options()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *enroll_options_);
+  // float max_value = 4;
+  if (!(this->max_value() <= 0 && this->max_value() >= 0)) {
+    total_size += 1 + 4;
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -11324,249 +12377,223 @@ size_t EnrollRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void EnrollRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:EnrollRequest)
+void AttributeFilter::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:AttributeFilter)
   GOOGLE_DCHECK_NE(&from, this);
-  const EnrollRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollRequest>(
+  const AttributeFilter* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<AttributeFilter>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:AttributeFilter)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:AttributeFilter)
     MergeFrom(*source);
   }
 }
 
-void EnrollRequest::MergeFrom(const EnrollRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:EnrollRequest)
+void AttributeFilter::MergeFrom(const AttributeFilter& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:AttributeFilter)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.enroll_gallery().size() > 0) {
+  values_.MergeFrom(from.values_);
+  if (from.key().size() > 0) {
 
-    enroll_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.enroll_gallery_);
+    key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.key_);
   }
-  if (from.has_records()) {
-    mutable_records()->::FaceRecordList::MergeFrom(from.records());
+  if (!(from.min_value() <= 0 && from.min_value() >= 0)) {
+    set_min_value(from.min_value());
   }
-  if (from.has_enroll_options()) {
-    mutable_enroll_options()->::EnrollOptions::MergeFrom(from.enroll_options());
+  if (!(from.max_value() <= 0 && from.max_value() >= 0)) {
+    set_max_value(from.max_value());
   }
 }
 
-void EnrollRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:EnrollRequest)
+void AttributeFilter::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:AttributeFilter)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void EnrollRequest::CopyFrom(const EnrollRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:EnrollRequest)
+void AttributeFilter::CopyFrom(const AttributeFilter& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:AttributeFilter)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool EnrollRequest::IsInitialized() const {
+bool AttributeFilter::IsInitialized() const {
   return true;
 }
 
-void EnrollRequest::Swap(EnrollRequest* other) {
+void AttributeFilter::Swap(AttributeFilter* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void EnrollRequest::InternalSwap(EnrollRequest* other) {
+void AttributeFilter::InternalSwap(AttributeFilter* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  enroll_gallery_.Swap(&other->enroll_gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  values_.InternalSwap(CastToBase(&other->values_));
+  key_.Swap(&other->key_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  swap(records_, other->records_);
-  swap(enroll_options_, other->enroll_options_);
+  swap(min_value_, other->min_value_);
+  swap(max_value_, other->max_value_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata EnrollRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata AttributeFilter::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void DetectRequest::InitAsDefaultInstance() {
-  ::_DetectRequest_default_instance_._instance.get_mutable()->image_ = const_cast< ::Image*>(
-      ::Image::internal_default_instance());
-  ::_DetectRequest_default_instance_._instance.get_mutable()->detect_options_ = const_cast< ::DetectionOptions*>(
-      ::DetectionOptions::internal_default_instance());
+void SearchFilter::InitAsDefaultInstance() {
 }
-class DetectRequest::HasBitSetters {
+class SearchFilter::HasBitSetters {
  public:
-  static const ::Image& image(const DetectRequest* msg);
-  static const ::DetectionOptions& detect_options(const DetectRequest* msg);
 };
 
-const ::Image&
-DetectRequest::HasBitSetters::image(const DetectRequest* msg) {
-  return *msg->image_;
-}
-const ::DetectionOptions&
-DetectRequest::HasBitSetters::detect_options(const DetectRequest* msg) {
-  return *msg->detect_options_;
-}
-void DetectRequest::clear_image() {
-  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
-    delete image_;
-  }
-  image_ = nullptr;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int DetectRequest::kImageFieldNumber;
-const int DetectRequest::kSourceFieldNumber;
-const int DetectRequest::kFrameFieldNumber;
-const int DetectRequest::kSubjectIdFieldNumber;
-const int DetectRequest::kSubjectNameFieldNumber;
-const int DetectRequest::kDetectOptionsFieldNumber;
+const int SearchFilter::kSubjectIdsFieldNumber;
+const int SearchFilter::kSourcesFieldNumber;
+const int SearchFilter::kMinCollectionDateFieldNumber;
+const int SearchFilter::kMaxCollectionDateFieldNumber;
+const int SearchFilter::kMinEnrollmentDateFieldNumber;
+const int SearchFilter::kMaxEnrollmentDateFieldNumber;
+const int SearchFilter::kAttributesFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-DetectRequest::DetectRequest()
+SearchFilter::SearchFilter()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:DetectRequest)
+  // @@protoc_insertion_point(constructor:SearchFilter)
 }
-DetectRequest::DetectRequest(const DetectRequest& from)
+SearchFilter::SearchFilter(const SearchFilter& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr) {
+      _internal_metadata_(nullptr),
+      subject_ids_(from.subject_ids_),
+      sources_(from.sources_),
+      attributes_(from.attributes_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  source_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.source().size() > 0) {
-    source_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.source_);
-  }
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.subject_id().size() > 0) {
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  subject_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.subject_name().size() > 0) {
-    subject_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_name_);
-  }
-  if (from.has_image()) {
-    image_ = new ::Image(*from.image_);
-  } else {
-    image_ = nullptr;
-  }
-  if (from.has_detect_options()) {
-    detect_options_ = new ::DetectionOptions(*from.detect_options_);
-  } else {
-    detect_options_ = nullptr;
-  }
-  frame_ = from.frame_;
-  // @@protoc_insertion_point(copy_constructor:DetectRequest)
+  ::memcpy(&min_collection_date_, &from.min_collection_date_,
+    static_cast<size_t>(reinterpret_cast<char*>(&max_enrollment_date_) -
+    reinterpret_cast<char*>(&min_collection_date_)) + sizeof(max_enrollment_date_));
+  // @@protoc_insertion_point(copy_constructor:SearchFilter)
 }
 
-void DetectRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  source_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&image_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&frame_) -
-      reinterpret_cast<char*>(&image_)) + sizeof(frame_));
+void SearchFilter::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&min_collection_date_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&max_enrollment_date_) -
+      reinterpret_cast<char*>(&min_collection_date_)) + sizeof(max_enrollment_date_));
 }
 
-DetectRequest::~DetectRequest() {
-  // @@protoc_insertion_point(destructor:DetectRequest)
+SearchFilter::~SearchFilter() {
+  // @@protoc_insertion_point(destructor:SearchFilter)
   SharedDtor();
 }
 
-void DetectRequest::SharedDtor() {
-  source_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (this != internal_default_instance()) delete image_;
-  if (this != internal_default_instance()) delete detect_options_;
+void SearchFilter::SharedDtor() {
 }
 
-void DetectRequest::SetCachedSize(int size) const {
+void SearchFilter::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const DetectRequest& DetectRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const SearchFilter& SearchFilter::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_SearchFilter_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void DetectRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:DetectRequest)
+void SearchFilter::Clear() {
+// @@protoc_insertion_point(message_clear_start:SearchFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
-    delete image_;
-  }
-  image_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && detect_options_ != nullptr) {
-    delete detect_options_;
-  }
-  detect_options_ = nullptr;
-  frame_ = PROTOBUF_LONGLONG(0);
+  subject_ids_.Clear();
+  sources_.Clear();
+  attributes_.Clear();
+  ::memset(&min_collection_date_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&max_enrollment_date_) -
+      reinterpret_cast<char*>(&min_collection_date_)) + sizeof(max_enrollment_date_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* DetectRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* SearchFilter::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .Image image = 1;
+      // repeated string subject_ids = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_image(), ptr);
-          CHK_(ptr);
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(add_subject_ids(), ptr, ctx, "SearchFilter.subject_ids");
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 10);
         } else goto handle_unusual;
         continue;
-      // string source = 2;
+      // repeated string sources = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_source(), ptr, ctx, "DetectRequest.source");
-          CHK_(ptr);
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(add_sources(), ptr, ctx, "SearchFilter.sources");
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 18);
         } else goto handle_unusual;
         continue;
-      // int64 frame = 3;
+      // float min_collection_date = 3;
       case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
-          frame_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
-          CHK_(ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 29)) {
+          min_collection_date_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
         } else goto handle_unusual;
         continue;
-      // string subject_id = 4;
+      // float max_collection_date = 4;
       case 4:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "DetectRequest.subject_id");
-          CHK_(ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 37)) {
+          max_collection_date_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
         } else goto handle_unusual;
         continue;
-      // string subject_name = 5;
+      // float min_enrollment_date = 5;
       case 5:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_name(), ptr, ctx, "DetectRequest.subject_name");
-          CHK_(ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 45)) {
+          min_enrollment_date_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
         } else goto handle_unusual;
         continue;
-      // .DetectionOptions detect_options = 8;
-      case 8:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 66)) {
-          ptr = ctx->ParseMessage(mutable_detect_options(), ptr);
-          CHK_(ptr);
+      // float max_enrollment_date = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 53)) {
+          max_enrollment_date_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // repeated .AttributeFilter attributes = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(add_attributes(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 58);
         } else goto handle_unusual;
         continue;
       default: {
@@ -11589,90 +12616,105 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool DetectRequest::MergePartialFromCodedStream(
+bool SearchFilter::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:DetectRequest)
+  // @@protoc_insertion_point(parse_start:SearchFilter)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .Image image = 1;
+      // repeated string subject_ids = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_image()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->add_subject_ids()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->subject_ids(this->subject_ids_size() - 1).data(),
+            static_cast<int>(this->subject_ids(this->subject_ids_size() - 1).length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "SearchFilter.subject_ids"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string source = 2;
+      // repeated string sources = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_source()));
+                input, this->add_sources()));
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->source().data(), static_cast<int>(this->source().length()),
+            this->sources(this->sources_size() - 1).data(),
+            static_cast<int>(this->sources(this->sources_size() - 1).length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "DetectRequest.source"));
+            "SearchFilter.sources"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // int64 frame = 3;
+      // float min_collection_date = 3;
       case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (29 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
-                 input, &frame_)));
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &min_collection_date_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string subject_id = 4;
+      // float max_collection_date = 4;
       case 4: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_subject_id()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "DetectRequest.subject_id"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (37 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &max_collection_date_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string subject_name = 5;
+      // float min_enrollment_date = 5;
       case 5: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_subject_name()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->subject_name().data(), static_cast<int>(this->subject_name().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "DetectRequest.subject_name"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (45 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &min_enrollment_date_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .DetectionOptions detect_options = 8;
-      case 8: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (66 & 0xFF)) {
+      // float max_enrollment_date = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (53 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &max_enrollment_date_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated .AttributeFilter attributes = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (58 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_detect_options()));
+                input, add_attributes()));
         } else {
           goto handle_unusual;
         }
@@ -11691,143 +12733,141 @@ bool DetectRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:DetectRequest)
+  // @@protoc_insertion_point(parse_success:SearchFilter)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:DetectRequest)
+  // @@protoc_insertion_point(parse_failure:SearchFilter)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void DetectRequest::SerializeWithCachedSizes(
+void SearchFilter::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:DetectRequest)
+  // @@protoc_insertion_point(serialize_start:SearchFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .Image image = 1;
-  if (this->has_image()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::image(this), output);
+  // repeated string subject_ids = 1;
+  for (int i = 0, n = this->subject_ids_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_ids(i).data(), static_cast<int>(this->subject_ids(i).length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "SearchFilter.subject_ids");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteString(
+      1, this->subject_ids(i), output);
   }
 
-  // string source = 2;
-  if (this->source().size() > 0) {
+  // repeated string sources = 2;
+  for (int i = 0, n = this->sources_size(); i < n; i++) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->source().data(), static_cast<int>(this->source().length()),
+      this->sources(i).data(), static_cast<int>(this->sources(i).length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.source");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      2, this->source(), output);
+      "SearchFilter.sources");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteString(
+      2, this->sources(i), output);
   }
 
-  // int64 frame = 3;
-  if (this->frame() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->frame(), output);
+  // float min_collection_date = 3;
+  if (!(this->min_collection_date() <= 0 && this->min_collection_date() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(3, this->min_collection_date(), output);
   }
 
-  // string subject_id = 4;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.subject_id");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      4, this->subject_id(), output);
+  // float max_collection_date = 4;
+  if (!(this->max_collection_date() <= 0 && this->max_collection_date() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(4, this->max_collection_date(), output);
   }
 
-  // string subject_name = 5;
-  if (this->subject_name().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_name().data(), static_cast<int>(this->subject_name().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.subject_name");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      5, this->subject_name(), output);
+  // float min_enrollment_date = 5;
+  if (!(this->min_enrollment_date() <= 0 && this->min_enrollment_date() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(5, this->min_enrollment_date(), output);
   }
 
-  // .DetectionOptions detect_options = 8;
-  if (this->has_detect_options()) {
+  // float max_enrollment_date = 6;
+  if (!(this->max_enrollment_date() <= 0 && this->max_enrollment_date() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(6, this->max_enrollment_date(), output);
+  }
+
+  // repeated .AttributeFilter attributes = 7;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->attributes_size()); i < n; i++) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      8, HasBitSetters::detect_options(this), output);
+      7,
+      this->attributes(static_cast<int>(i)),
+      output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:DetectRequest)
+  // @@protoc_insertion_point(serialize_end:SearchFilter)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* DetectRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* SearchFilter::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:DetectRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:SearchFilter)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .Image image = 1;
-  if (this->has_image()) {
+  // repeated string subject_ids = 1;
+  for (int i = 0, n = this->subject_ids_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_ids(i).data(), static_cast<int>(this->subject_ids(i).length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "SearchFilter.subject_ids");
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        1, HasBitSetters::image(this), target);
+      WriteStringToArray(1, this->subject_ids(i), target);
   }
 
-  // string source = 2;
-  if (this->source().size() > 0) {
+  // repeated string sources = 2;
+  for (int i = 0, n = this->sources_size(); i < n; i++) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->source().data(), static_cast<int>(this->source().length()),
+      this->sources(i).data(), static_cast<int>(this->sources(i).length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.source");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        2, this->source(), target);
+      "SearchFilter.sources");
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteStringToArray(2, this->sources(i), target);
   }
 
-  // int64 frame = 3;
-  if (this->frame() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->frame(), target);
+  // float min_collection_date = 3;
+  if (!(this->min_collection_date() <= 0 && this->min_collection_date() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(3, this->min_collection_date(), target);
   }
 
-  // string subject_id = 4;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.subject_id");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        4, this->subject_id(), target);
+  // float max_collection_date = 4;
+  if (!(this->max_collection_date() <= 0 && this->max_collection_date() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(4, this->max_collection_date(), target);
   }
 
-  // string subject_name = 5;
-  if (this->subject_name().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_name().data(), static_cast<int>(this->subject_name().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "DetectRequest.subject_name");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        5, this->subject_name(), target);
+  // float min_enrollment_date = 5;
+  if (!(this->min_enrollment_date() <= 0 && this->min_enrollment_date() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(5, this->min_enrollment_date(), target);
   }
 
-  // .DetectionOptions detect_options = 8;
-  if (this->has_detect_options()) {
+  // float max_enrollment_date = 6;
+  if (!(this->max_enrollment_date() <= 0 && this->max_enrollment_date() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(6, this->max_enrollment_date(), target);
+  }
+
+  // repeated .AttributeFilter attributes = 7;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->attributes_size()); i < n; i++) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        8, HasBitSetters::detect_options(this), target);
+        7, this->attributes(static_cast<int>(i)), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:DetectRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:SearchFilter)
   return target;
 }
 
-size_t DetectRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:DetectRequest)
+size_t SearchFilter::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:SearchFilter)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -11839,46 +12879,51 @@ size_t DetectRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string source = 2;
-  if (this->source().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->source());
+  // repeated string subject_ids = 1;
+  total_size += 1 *
+      ::PROTOBUF_NAMESPACE_ID::internal::FromIntSize(this->subject_ids_size());
+  for (int i = 0, n = this->subject_ids_size(); i < n; i++) {
+    total_size += ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+      this->subject_ids(i));
   }
 
-  // string subject_id = 4;
-  if (this->subject_id().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->subject_id());
+  // repeated string sources = 2;
+  total_size += 1 *
+      ::PROTOBUF_NAMESPACE_ID::internal::FromIntSize(this->sources_size());
+  for (int i = 0, n = this->sources_size(); i < n; i++) {
+    total_size += ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+      this->sources(i));
   }
 
-  // string subject_name = 5;
-  if (this->subject_name().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->subject_name());
+  // repeated .AttributeFilter attributes = 7;
+  {
+    unsigned int count = static_cast<unsigned int>(this->attributes_size());
+    total_size += 1UL * count;
+    for (unsigned int i = 0; i < count; i++) {
+      total_size +=
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          this->attributes(static_cast<int>(i)));
+    }
   }
 
-  // .Image image = 1;
-  if (this->has_image()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *image_);
+  // float min_collection_date = 3;
+  if (!(this->min_collection_date() <= 0 && this->min_collection_date() >= 0)) {
+    total_size += 1 + 4;
   }
 
-  // .DetectionOptions detect_options = 8;
-  if (this->has_detect_options()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *detect_options_);
+  // float max_collection_date = 4;
+  if (!(this->max_collection_date() <= 0 && this->max_collection_date() >= 0)) {
+    total_size += 1 + 4;
   }
 
-  // int64 frame = 3;
-  if (this->frame() != 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
-        this->frame());
+  // float min_enrollment_date = 5;
+  if (!(this->min_enrollment_date() <= 0 && this->min_enrollment_date() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  // float max_enrollment_date = 6;
+  if (!(this->max_enrollment_date() <= 0 && this->max_enrollment_date() >= 0)) {
+    total_size += 1 + 4;
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -11886,234 +12931,195 @@ size_t DetectRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void DetectRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:DetectRequest)
+void SearchFilter::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:SearchFilter)
   GOOGLE_DCHECK_NE(&from, this);
-  const DetectRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectRequest>(
+  const SearchFilter* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<SearchFilter>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:SearchFilter)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:SearchFilter)
     MergeFrom(*source);
   }
 }
 
-void DetectRequest::MergeFrom(const DetectRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:DetectRequest)
+void SearchFilter::MergeFrom(const SearchFilter& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:SearchFilter)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.source().size() > 0) {
-
-    source_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.source_);
-  }
-  if (from.subject_id().size() > 0) {
-
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  if (from.subject_name().size() > 0) {
-
-    subject_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_name_);
+  subject_ids_.MergeFrom(from.subject_ids_);
+  sources_.MergeFrom(from.sources_);
+  attributes_.MergeFrom(from.attributes_);
+  if (!(from.min_collection_date() <= 0 && from.min_collection_date() >= 0)) {
+    set_min_collection_date(from.min_collection_date());
   }
-  if (from.has_image()) {
-    mutable_image()->::Image::MergeFrom(from.image());
+  if (!(from.max_collection_date() <= 0 && from.max_collection_date() >= 0)) {
+    set_max_collection_date(from.max_collection_date());
   }
-  if (from.has_detect_options()) {
-    mutable_detect_options()->::DetectionOptions::MergeFrom(from.detect_options());
+  if (!(from.min_enrollment_date() <= 0 && from.min_enrollment_date() >= 0)) {
+    set_min_enrollment_date(from.min_enrollment_date());
   }
-  if (from.frame() != 0) {
-    set_frame(from.frame());
+  if (!(from.max_enrollment_date() <= 0 && from.max_enrollment_date() >= 0)) {
+    set_max_enrollment_date(from.max_enrollment_date());
   }
 }
 
-void DetectRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:DetectRequest)
+void SearchFilter::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:SearchFilter)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void DetectRequest::CopyFrom(const DetectRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:DetectRequest)
+void SearchFilter::CopyFrom(const SearchFilter& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:SearchFilter)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool DetectRequest::IsInitialized() const {
+bool SearchFilter::IsInitialized() const {
   return true;
 }
 
-void DetectRequest::Swap(DetectRequest* other) {
+void SearchFilter::Swap(SearchFilter* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void DetectRequest::InternalSwap(DetectRequest* other) {
+void SearchFilter::InternalSwap(SearchFilter* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  source_.Swap(&other->source_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  subject_name_.Swap(&other->subject_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  swap(image_, other->image_);
-  swap(detect_options_, other->detect_options_);
-  swap(frame_, other->frame_);
+  subject_ids_.InternalSwap(CastToBase(&other->subject_ids_));
+  sources_.InternalSwap(CastToBase(&other->sources_));
+  CastToBase(&attributes_)->InternalSwap(CastToBase(&other->attributes_));
+  swap(min_collection_date_, other->min_collection_date_);
+  swap(max_collection_date_, other->max_collection_date_);
+  swap(min_enrollment_date_, other->min_enrollment_date_);
+  swap(max_enrollment_date_, other->max_enrollment_date_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata DetectRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata SearchFilter::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void ExtractRequest::InitAsDefaultInstance() {
-  ::_ExtractRequest_default_instance_._instance.get_mutable()->image_ = const_cast< ::Image*>(
-      ::Image::internal_default_instance());
-  ::_ExtractRequest_default_instance_._instance.get_mutable()->records_ = const_cast< ::FaceRecordList*>(
+void SearchResponse::InitAsDefaultInstance() {
+  ::_SearchResponse_default_instance_._instance.get_mutable()->message_ = const_cast< ::ErrorMessage*>(
+      ::ErrorMessage::internal_default_instance());
+  ::_SearchResponse_default_instance_._instance.get_mutable()->probes_ = const_cast< ::FaceRecordList*>(
       ::FaceRecordList::internal_default_instance());
-  ::_ExtractRequest_default_instance_._instance.get_mutable()->extract_options_ = const_cast< ::ExtractOptions*>(
-      ::ExtractOptions::internal_default_instance());
 }
-class ExtractRequest::HasBitSetters {
+class SearchResponse::HasBitSetters {
  public:
-  static const ::Image& image(const ExtractRequest* msg);
-  static const ::FaceRecordList& records(const ExtractRequest* msg);
-  static const ::ExtractOptions& extract_options(const ExtractRequest* msg);
+  static const ::ErrorMessage& message(const SearchResponse* msg);
+  static const ::FaceRecordList& probes(const SearchResponse* msg);
 };
 
-const ::Image&
-ExtractRequest::HasBitSetters::image(const ExtractRequest* msg) {
-  return *msg->image_;
+const ::ErrorMessage&
+SearchResponse::HasBitSetters::message(const SearchResponse* msg) {
+  return *msg->message_;
 }
 const ::FaceRecordList&
-ExtractRequest::HasBitSetters::records(const ExtractRequest* msg) {
-  return *msg->records_;
-}
-const ::ExtractOptions&
-ExtractRequest::HasBitSetters::extract_options(const ExtractRequest* msg) {
-  return *msg->extract_options_;
-}
-void ExtractRequest::clear_image() {
-  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
-    delete image_;
-  }
-  image_ = nullptr;
+SearchResponse::HasBitSetters::probes(const SearchResponse* msg) {
+  return *msg->probes_;
 }
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int ExtractRequest::kImageFieldNumber;
-const int ExtractRequest::kRecordsFieldNumber;
-const int ExtractRequest::kExtractOptionsFieldNumber;
+const int SearchResponse::kMessageFieldNumber;
+const int SearchResponse::kProbesFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-ExtractRequest::ExtractRequest()
+SearchResponse::SearchResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:ExtractRequest)
+  // @@protoc_insertion_point(constructor:SearchResponse)
 }
-ExtractRequest::ExtractRequest(const ExtractRequest& from)
+SearchResponse::SearchResponse(const SearchResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_image()) {
-    image_ = new ::Image(*from.image_);
-  } else {
-    image_ = nullptr;
-  }
-  if (from.has_records()) {
-    records_ = new ::FaceRecordList(*from.records_);
+  if (from.has_message()) {
+    message_ = new ::ErrorMessage(*from.message_);
   } else {
-    records_ = nullptr;
+    message_ = nullptr;
   }
-  if (from.has_extract_options()) {
-    extract_options_ = new ::ExtractOptions(*from.extract_options_);
+  if (from.has_probes()) {
+    probes_ = new ::FaceRecordList(*from.probes_);
   } else {
-    extract_options_ = nullptr;
+    probes_ = nullptr;
   }
-  // @@protoc_insertion_point(copy_constructor:ExtractRequest)
+  // @@protoc_insertion_point(copy_constructor:SearchResponse)
 }
 
-void ExtractRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_ExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&image_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&extract_options_) -
-      reinterpret_cast<char*>(&image_)) + sizeof(extract_options_));
+void SearchResponse::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&message_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&probes_) -
+      reinterpret_cast<char*>(&message_)) + sizeof(probes_));
 }
 
-ExtractRequest::~ExtractRequest() {
-  // @@protoc_insertion_point(destructor:ExtractRequest)
+SearchResponse::~SearchResponse() {
+  // @@protoc_insertion_point(destructor:SearchResponse)
   SharedDtor();
 }
 
-void ExtractRequest::SharedDtor() {
-  if (this != internal_default_instance()) delete image_;
-  if (this != internal_default_instance()) delete records_;
-  if (this != internal_default_instance()) delete extract_options_;
+void SearchResponse::SharedDtor() {
+  if (this != internal_default_instance()) delete message_;
+  if (this != internal_default_instance()) delete probes_;
 }
 
-void ExtractRequest::SetCachedSize(int size) const {
+void SearchResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const ExtractRequest& ExtractRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_ExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const SearchResponse& SearchResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_SearchResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void ExtractRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:ExtractRequest)
+void SearchResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:SearchResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
-    delete image_;
-  }
-  image_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
-    delete records_;
+  if (GetArenaNoVirtual() == nullptr && message_ != nullptr) {
+    delete message_;
   }
-  records_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && extract_options_ != nullptr) {
-    delete extract_options_;
+  message_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
+    delete probes_;
   }
-  extract_options_ = nullptr;
+  probes_ = nullptr;
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* ExtractRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* SearchResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .Image image = 1;
+      // .ErrorMessage message = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_image(), ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // .FaceRecordList records = 4;
-      case 4:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
-          ptr = ctx->ParseMessage(mutable_records(), ptr);
+          ptr = ctx->ParseMessage(mutable_message(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .ExtractOptions extract_options = 9;
-      case 9:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 74)) {
-          ptr = ctx->ParseMessage(mutable_extract_options(), ptr);
+      // .FaceRecordList probes = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ctx->ParseMessage(mutable_probes(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -12137,43 +13143,32 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool ExtractRequest::MergePartialFromCodedStream(
+bool SearchResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:ExtractRequest)
+  // @@protoc_insertion_point(parse_start:SearchResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .Image image = 1;
+      // .ErrorMessage message = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_image()));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // .FaceRecordList records = 4;
-      case 4: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_records()));
+               input, mutable_message()));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .ExtractOptions extract_options = 9;
-      case 9: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (74 & 0xFF)) {
+      // .FaceRecordList probes = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_extract_options()));
+               input, mutable_probes()));
         } else {
           goto handle_unusual;
         }
@@ -12192,83 +13187,70 @@ bool ExtractRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:ExtractRequest)
+  // @@protoc_insertion_point(parse_success:SearchResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:ExtractRequest)
+  // @@protoc_insertion_point(parse_failure:SearchResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void ExtractRequest::SerializeWithCachedSizes(
+void SearchResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:ExtractRequest)
+  // @@protoc_insertion_point(serialize_start:SearchResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .Image image = 1;
-  if (this->has_image()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::image(this), output);
-  }
-
-  // .FaceRecordList records = 4;
-  if (this->has_records()) {
+  // .ErrorMessage message = 1;
+  if (this->has_message()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      4, HasBitSetters::records(this), output);
+      1, HasBitSetters::message(this), output);
   }
 
-  // .ExtractOptions extract_options = 9;
-  if (this->has_extract_options()) {
+  // .FaceRecordList probes = 2;
+  if (this->has_probes()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      9, HasBitSetters::extract_options(this), output);
+      2, HasBitSetters::probes(this), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:ExtractRequest)
+  // @@protoc_insertion_point(serialize_end:SearchResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* ExtractRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* SearchResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:ExtractRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:SearchResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .Image image = 1;
-  if (this->has_image()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        1, HasBitSetters::image(this), target);
-  }
-
-  // .FaceRecordList records = 4;
-  if (this->has_records()) {
+  // .ErrorMessage message = 1;
+  if (this->has_message()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        4, HasBitSetters::records(this), target);
+        1, HasBitSetters::message(this), target);
   }
 
-  // .ExtractOptions extract_options = 9;
-  if (this->has_extract_options()) {
+  // .FaceRecordList probes = 2;
+  if (this->has_probes()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        9, HasBitSetters::extract_options(this), target);
+        2, HasBitSetters::probes(this), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:ExtractRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:SearchResponse)
   return target;
 }
 
-size_t ExtractRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:ExtractRequest)
+size_t SearchResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:SearchResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -12280,25 +13262,18 @@ size_t ExtractRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // .Image image = 1;
-  if (this->has_image()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *image_);
-  }
-
-  // .FaceRecordList records = 4;
-  if (this->has_records()) {
+  // .ErrorMessage message = 1;
+  if (this->has_message()) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *records_);
+        *message_);
   }
 
-  // .ExtractOptions extract_options = 9;
-  if (this->has_extract_options()) {
+  // .FaceRecordList probes = 2;
+  if (this->has_probes()) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *extract_options_);
+        *probes_);
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -12306,235 +13281,196 @@ size_t ExtractRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void ExtractRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:ExtractRequest)
+void SearchResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:SearchResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const ExtractRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<ExtractRequest>(
+  const SearchResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<SearchResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:ExtractRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:SearchResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:ExtractRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:SearchResponse)
     MergeFrom(*source);
   }
 }
 
-void ExtractRequest::MergeFrom(const ExtractRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:ExtractRequest)
+void SearchResponse::MergeFrom(const SearchResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:SearchResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_image()) {
-    mutable_image()->::Image::MergeFrom(from.image());
-  }
-  if (from.has_records()) {
-    mutable_records()->::FaceRecordList::MergeFrom(from.records());
+  if (from.has_message()) {
+    mutable_message()->::ErrorMessage::MergeFrom(from.message());
   }
-  if (from.has_extract_options()) {
-    mutable_extract_options()->::ExtractOptions::MergeFrom(from.extract_options());
+  if (from.has_probes()) {
+    mutable_probes()->::FaceRecordList::MergeFrom(from.probes());
   }
 }
 
-void ExtractRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:ExtractRequest)
+void SearchResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:SearchResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void ExtractRequest::CopyFrom(const ExtractRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:ExtractRequest)
+void SearchResponse::CopyFrom(const SearchResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:SearchResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool ExtractRequest::IsInitialized() const {
+bool SearchResponse::IsInitialized() const {
   return true;
 }
 
-void ExtractRequest::Swap(ExtractRequest* other) {
+void SearchResponse::Swap(SearchResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void ExtractRequest::InternalSwap(ExtractRequest* other) {
+void SearchResponse::InternalSwap(SearchResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(image_, other->image_);
-  swap(records_, other->records_);
-  swap(extract_options_, other->extract_options_);
+  swap(message_, other->message_);
+  swap(probes_, other->probes_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata ExtractRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata SearchResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void ScoreRequest::InitAsDefaultInstance() {
-  ::_ScoreRequest_default_instance_._instance.get_mutable()->face_probes_ = const_cast< ::FaceRecordList*>(
-      ::FaceRecordList::internal_default_instance());
-  ::_ScoreRequest_default_instance_._instance.get_mutable()->face_gallery_ = const_cast< ::FaceRecordList*>(
+void EnrollRequest::InitAsDefaultInstance() {
+  ::_EnrollRequest_default_instance_._instance.get_mutable()->records_ = const_cast< ::FaceRecordList*>(
       ::FaceRecordList::internal_default_instance());
-  ::_ScoreRequest_default_instance_._instance.get_mutable()->template_probes_ = const_cast< ::TemplateList*>(
-      ::TemplateList::internal_default_instance());
-  ::_ScoreRequest_default_instance_._instance.get_mutable()->template_gallery_ = const_cast< ::TemplateList*>(
-      ::TemplateList::internal_default_instance());
+  ::_EnrollRequest_default_instance_._instance.get_mutable()->enroll_options_ = const_cast< ::EnrollOptions*>(
+      ::EnrollOptions::internal_default_instance());
 }
-class ScoreRequest::HasBitSetters {
+class EnrollRequest::HasBitSetters {
  public:
-  static const ::FaceRecordList& face_probes(const ScoreRequest* msg);
-  static const ::FaceRecordList& face_gallery(const ScoreRequest* msg);
-  static const ::TemplateList& template_probes(const ScoreRequest* msg);
-  static const ::TemplateList& template_gallery(const ScoreRequest* msg);
+  static const ::FaceRecordList& records(const EnrollRequest* msg);
+  static const ::EnrollOptions& enroll_options(const EnrollRequest* msg);
 };
 
 const ::FaceRecordList&
-ScoreRequest::HasBitSetters::face_probes(const ScoreRequest* msg) {
-  return *msg->face_probes_;
-}
-const ::FaceRecordList&
-ScoreRequest::HasBitSetters::face_gallery(const ScoreRequest* msg) {
-  return *msg->face_gallery_;
-}
-const ::TemplateList&
-ScoreRequest::HasBitSetters::template_probes(const ScoreRequest* msg) {
-  return *msg->template_probes_;
+EnrollRequest::HasBitSetters::records(const EnrollRequest* msg) {
+  return *msg->records_;
 }
-const ::TemplateList&
-ScoreRequest::HasBitSetters::template_gallery(const ScoreRequest* msg) {
-  return *msg->template_gallery_;
+const ::EnrollOptions&
+EnrollRequest::HasBitSetters::enroll_options(const EnrollRequest* msg) {
+  return *msg->enroll_options_;
 }
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int ScoreRequest::kFaceProbesFieldNumber;
-const int ScoreRequest::kFaceGalleryFieldNumber;
-const int ScoreRequest::kTemplateProbesFieldNumber;
-const int ScoreRequest::kTemplateGalleryFieldNumber;
+const int EnrollRequest::kEnrollGalleryFieldNumber;
+const int EnrollRequest::kRecordsFieldNumber;
+const int EnrollRequest::kEnrollOptionsFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-ScoreRequest::ScoreRequest()
+EnrollRequest::EnrollRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:ScoreRequest)
+  // @@protoc_insertion_point(constructor:EnrollRequest)
 }
-ScoreRequest::ScoreRequest(const ScoreRequest& from)
+EnrollRequest::EnrollRequest(const EnrollRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_face_probes()) {
-    face_probes_ = new ::FaceRecordList(*from.face_probes_);
-  } else {
-    face_probes_ = nullptr;
-  }
-  if (from.has_face_gallery()) {
-    face_gallery_ = new ::FaceRecordList(*from.face_gallery_);
-  } else {
-    face_gallery_ = nullptr;
+  enroll_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.enroll_gallery().size() > 0) {
+    enroll_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.enroll_gallery_);
   }
-  if (from.has_template_probes()) {
-    template_probes_ = new ::TemplateList(*from.template_probes_);
+  if (from.has_records()) {
+    records_ = new ::FaceRecordList(*from.records_);
   } else {
-    template_probes_ = nullptr;
+    records_ = nullptr;
   }
-  if (from.has_template_gallery()) {
-    template_gallery_ = new ::TemplateList(*from.template_gallery_);
+  if (from.has_enroll_options()) {
+    enroll_options_ = new ::EnrollOptions(*from.enroll_options_);
   } else {
-    template_gallery_ = nullptr;
+    enroll_options_ = nullptr;
   }
-  // @@protoc_insertion_point(copy_constructor:ScoreRequest)
+  // @@protoc_insertion_point(copy_constructor:EnrollRequest)
 }
 
-void ScoreRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&face_probes_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&template_gallery_) -
-      reinterpret_cast<char*>(&face_probes_)) + sizeof(template_gallery_));
+void EnrollRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  enroll_gallery_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&records_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&enroll_options_) -
+      reinterpret_cast<char*>(&records_)) + sizeof(enroll_options_));
 }
 
-ScoreRequest::~ScoreRequest() {
-  // @@protoc_insertion_point(destructor:ScoreRequest)
+EnrollRequest::~EnrollRequest() {
+  // @@protoc_insertion_point(destructor:EnrollRequest)
   SharedDtor();
 }
 
-void ScoreRequest::SharedDtor() {
-  if (this != internal_default_instance()) delete face_probes_;
-  if (this != internal_default_instance()) delete face_gallery_;
-  if (this != internal_default_instance()) delete template_probes_;
-  if (this != internal_default_instance()) delete template_gallery_;
+void EnrollRequest::SharedDtor() {
+  enroll_gallery_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (this != internal_default_instance()) delete records_;
+  if (this != internal_default_instance()) delete enroll_options_;
 }
 
-void ScoreRequest::SetCachedSize(int size) const {
+void EnrollRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const ScoreRequest& ScoreRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollRequest& EnrollRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void ScoreRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:ScoreRequest)
+void EnrollRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && face_probes_ != nullptr) {
-    delete face_probes_;
-  }
-  face_probes_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && face_gallery_ != nullptr) {
-    delete face_gallery_;
-  }
-  face_gallery_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && template_probes_ != nullptr) {
-    delete template_probes_;
+  enroll_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
   }
-  template_probes_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && template_gallery_ != nullptr) {
-    delete template_gallery_;
+  records_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && enroll_options_ != nullptr) {
+    delete enroll_options_;
   }
-  template_gallery_ = nullptr;
+  enroll_options_ = nullptr;
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* ScoreRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .FaceRecordList face_probes = 1;
+      // string enroll_gallery = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_face_probes(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_enroll_gallery(), ptr, ctx, "EnrollRequest.enroll_gallery");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .FaceRecordList face_gallery = 2;
+      // .FaceRecordList records = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ctx->ParseMessage(mutable_face_gallery(), ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // .TemplateList template_probes = 3;
-      case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
-          ptr = ctx->ParseMessage(mutable_template_probes(), ptr);
+          ptr = ctx->ParseMessage(mutable_records(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .TemplateList template_gallery = 4;
-      case 4:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
-          ptr = ctx->ParseMessage(mutable_template_gallery(), ptr);
+      // .EnrollOptions enroll_options = 10;
+      case 10:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 82)) {
+          ptr = ctx->ParseMessage(mutable_enroll_options(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -12558,54 +13494,47 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool ScoreRequest::MergePartialFromCodedStream(
+bool EnrollRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:ScoreRequest)
+  // @@protoc_insertion_point(parse_start:EnrollRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .FaceRecordList face_probes = 1;
+      // string enroll_gallery = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_face_probes()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_enroll_gallery()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "EnrollRequest.enroll_gallery"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .FaceRecordList face_gallery = 2;
+      // .FaceRecordList records = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_face_gallery()));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // .TemplateList template_probes = 3;
-      case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_template_probes()));
+               input, mutable_records()));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .TemplateList template_gallery = 4;
-      case 4: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
+      // .EnrollOptions enroll_options = 10;
+      case 10: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (82 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_template_gallery()));
+               input, mutable_enroll_options()));
         } else {
           goto handle_unusual;
         }
@@ -12624,96 +13553,6890 @@ bool ScoreRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:ScoreRequest)
+  // @@protoc_insertion_point(parse_success:EnrollRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:ScoreRequest)
+  // @@protoc_insertion_point(parse_failure:EnrollRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void ScoreRequest::SerializeWithCachedSizes(
+void EnrollRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:ScoreRequest)
+  // @@protoc_insertion_point(serialize_start:EnrollRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .FaceRecordList face_probes = 1;
-  if (this->has_face_probes()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::face_probes(this), output);
-  }
-
-  // .FaceRecordList face_gallery = 2;
-  if (this->has_face_gallery()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::face_gallery(this), output);
+  // string enroll_gallery = 1;
+  if (this->enroll_gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollRequest.enroll_gallery");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->enroll_gallery(), output);
   }
 
-  // .TemplateList template_probes = 3;
-  if (this->has_template_probes()) {
+  // .FaceRecordList records = 2;
+  if (this->has_records()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      3, HasBitSetters::template_probes(this), output);
+      2, HasBitSetters::records(this), output);
   }
 
-  // .TemplateList template_gallery = 4;
-  if (this->has_template_gallery()) {
+  // .EnrollOptions enroll_options = 10;
+  if (this->has_enroll_options()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      4, HasBitSetters::template_gallery(this), output);
+      10, HasBitSetters::enroll_options(this), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:ScoreRequest)
+  // @@protoc_insertion_point(serialize_end:EnrollRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* ScoreRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:ScoreRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .FaceRecordList face_probes = 1;
-  if (this->has_face_probes()) {
+  // string enroll_gallery = 1;
+  if (this->enroll_gallery().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->enroll_gallery().data(), static_cast<int>(this->enroll_gallery().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollRequest.enroll_gallery");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->enroll_gallery(), target);
+  }
+
+  // .FaceRecordList records = 2;
+  if (this->has_records()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
       InternalWriteMessageToArray(
-        1, HasBitSetters::face_probes(this), target);
+        2, HasBitSetters::records(this), target);
+  }
+
+  // .EnrollOptions enroll_options = 10;
+  if (this->has_enroll_options()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        10, HasBitSetters::enroll_options(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollRequest)
+  return target;
+}
+
+size_t EnrollRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string enroll_gallery = 1;
+  if (this->enroll_gallery().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->enroll_gallery());
+  }
+
+  // .FaceRecordList records = 2;
+  if (this->has_records()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *records_);
+  }
+
+  // .EnrollOptions enroll_options = 10;
+  if (this->has_enroll_options()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *enroll_options_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void EnrollRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const EnrollRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollRequest)
+    MergeFrom(*source);
+  }
+}
+
+void EnrollRequest::MergeFrom(const EnrollRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.enroll_gallery().size() > 0) {
+
+    enroll_gallery_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.enroll_gallery_);
+  }
+  if (from.has_records()) {
+    mutable_records()->::FaceRecordList::MergeFrom(from.records());
+  }
+  if (from.has_enroll_options()) {
+    mutable_enroll_options()->::EnrollOptions::MergeFrom(from.enroll_options());
+  }
+}
+
+void EnrollRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void EnrollRequest::CopyFrom(const EnrollRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool EnrollRequest::IsInitialized() const {
+  return true;
+}
+
+void EnrollRequest::Swap(EnrollRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void EnrollRequest::InternalSwap(EnrollRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  enroll_gallery_.Swap(&other->enroll_gallery_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(records_, other->records_);
+  swap(enroll_options_, other->enroll_options_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void BulkEnrollResponse::InitAsDefaultInstance() {
+}
+class BulkEnrollResponse::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int BulkEnrollResponse::kRequestCountFieldNumber;
+const int BulkEnrollResponse::kEnrollCountFieldNumber;
+const int BulkEnrollResponse::kReplaceCountFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+BulkEnrollResponse::BulkEnrollResponse()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:BulkEnrollResponse)
+}
+BulkEnrollResponse::BulkEnrollResponse(const BulkEnrollResponse& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::memcpy(&request_count_, &from.request_count_,
+    static_cast<size_t>(reinterpret_cast<char*>(&replace_count_) -
+    reinterpret_cast<char*>(&request_count_)) + sizeof(replace_count_));
+  // @@protoc_insertion_point(copy_constructor:BulkEnrollResponse)
+}
+
+void BulkEnrollResponse::SharedCtor() {
+  ::memset(&request_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&replace_count_) -
+      reinterpret_cast<char*>(&request_count_)) + sizeof(replace_count_));
+}
+
+BulkEnrollResponse::~BulkEnrollResponse() {
+  // @@protoc_insertion_point(destructor:BulkEnrollResponse)
+  SharedDtor();
+}
+
+void BulkEnrollResponse::SharedDtor() {
+}
+
+void BulkEnrollResponse::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const BulkEnrollResponse& BulkEnrollResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_BulkEnrollResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void BulkEnrollResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:BulkEnrollResponse)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  ::memset(&request_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&replace_count_) -
+      reinterpret_cast<char*>(&request_count_)) + sizeof(replace_count_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* BulkEnrollResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // int64 request_count = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          request_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 enroll_count = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          enroll_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 replace_count = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          replace_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool BulkEnrollResponse::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:BulkEnrollResponse)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // int64 request_count = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &request_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 enroll_count = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &enroll_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 replace_count = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &replace_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:BulkEnrollResponse)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:BulkEnrollResponse)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void BulkEnrollResponse::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:BulkEnrollResponse)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 request_count = 1;
+  if (this->request_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(1, this->request_count(), output);
+  }
+
+  // int64 enroll_count = 2;
+  if (this->enroll_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->enroll_count(), output);
+  }
+
+  // int64 replace_count = 3;
+  if (this->replace_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->replace_count(), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:BulkEnrollResponse)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* BulkEnrollResponse::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:BulkEnrollResponse)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 request_count = 1;
+  if (this->request_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(1, this->request_count(), target);
+  }
+
+  // int64 enroll_count = 2;
+  if (this->enroll_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->enroll_count(), target);
+  }
+
+  // int64 replace_count = 3;
+  if (this->replace_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->replace_count(), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:BulkEnrollResponse)
+  return target;
+}
+
+size_t BulkEnrollResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:BulkEnrollResponse)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // int64 request_count = 1;
+  if (this->request_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->request_count());
+  }
+
+  // int64 enroll_count = 2;
+  if (this->enroll_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->enroll_count());
+  }
+
+  // int64 replace_count = 3;
+  if (this->replace_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->replace_count());
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void BulkEnrollResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:BulkEnrollResponse)
+  GOOGLE_DCHECK_NE(&from, this);
+  const BulkEnrollResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<BulkEnrollResponse>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:BulkEnrollResponse)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:BulkEnrollResponse)
+    MergeFrom(*source);
+  }
+}
+
+void BulkEnrollResponse::MergeFrom(const BulkEnrollResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:BulkEnrollResponse)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.request_count() != 0) {
+    set_request_count(from.request_count());
+  }
+  if (from.enroll_count() != 0) {
+    set_enroll_count(from.enroll_count());
+  }
+  if (from.replace_count() != 0) {
+    set_replace_count(from.replace_count());
+  }
+}
+
+void BulkEnrollResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:BulkEnrollResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void BulkEnrollResponse::CopyFrom(const BulkEnrollResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:BulkEnrollResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool BulkEnrollResponse::IsInitialized() const {
+  return true;
+}
+
+void BulkEnrollResponse::Swap(BulkEnrollResponse* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void BulkEnrollResponse::InternalSwap(BulkEnrollResponse* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(request_count_, other->request_count_);
+  swap(enroll_count_, other->enroll_count_);
+  swap(replace_count_, other->replace_count_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata BulkEnrollResponse::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void DetectRequest::InitAsDefaultInstance() {
+  ::_DetectRequest_default_instance_._instance.get_mutable()->image_ = const_cast< ::Image*>(
+      ::Image::internal_default_instance());
+  ::_DetectRequest_default_instance_._instance.get_mutable()->detect_options_ = const_cast< ::DetectionOptions*>(
+      ::DetectionOptions::internal_default_instance());
+}
+class DetectRequest::HasBitSetters {
+ public:
+  static const ::Image& image(const DetectRequest* msg);
+  static const ::DetectionOptions& detect_options(const DetectRequest* msg);
+};
+
+const ::Image&
+DetectRequest::HasBitSetters::image(const DetectRequest* msg) {
+  return *msg->image_;
+}
+const ::DetectionOptions&
+DetectRequest::HasBitSetters::detect_options(const DetectRequest* msg) {
+  return *msg->detect_options_;
+}
+void DetectRequest::clear_image() {
+  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
+    delete image_;
+  }
+  image_ = nullptr;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int DetectRequest::kImageFieldNumber;
+const int DetectRequest::kSourceFieldNumber;
+const int DetectRequest::kFrameFieldNumber;
+const int DetectRequest::kSubjectIdFieldNumber;
+const int DetectRequest::kSubjectNameFieldNumber;
+const int DetectRequest::kDetectOptionsFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+DetectRequest::DetectRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:DetectRequest)
+}
+DetectRequest::DetectRequest(const DetectRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  source_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.source().size() > 0) {
+    source_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.source_);
+  }
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.subject_id().size() > 0) {
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  subject_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.subject_name().size() > 0) {
+    subject_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_name_);
+  }
+  if (from.has_image()) {
+    image_ = new ::Image(*from.image_);
+  } else {
+    image_ = nullptr;
+  }
+  if (from.has_detect_options()) {
+    detect_options_ = new ::DetectionOptions(*from.detect_options_);
+  } else {
+    detect_options_ = nullptr;
+  }
+  frame_ = from.frame_;
+  // @@protoc_insertion_point(copy_constructor:DetectRequest)
+}
+
+void DetectRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  source_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&image_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&frame_) -
+      reinterpret_cast<char*>(&image_)) + sizeof(frame_));
+}
+
+DetectRequest::~DetectRequest() {
+  // @@protoc_insertion_point(destructor:DetectRequest)
+  SharedDtor();
+}
+
+void DetectRequest::SharedDtor() {
+  source_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (this != internal_default_instance()) delete image_;
+  if (this != internal_default_instance()) delete detect_options_;
+}
+
+void DetectRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const DetectRequest& DetectRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void DetectRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:DetectRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
+    delete image_;
+  }
+  image_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && detect_options_ != nullptr) {
+    delete detect_options_;
+  }
+  detect_options_ = nullptr;
+  frame_ = PROTOBUF_LONGLONG(0);
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* DetectRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .Image image = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_image(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string source = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_source(), ptr, ctx, "DetectRequest.source");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 frame = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          frame_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string subject_id = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "DetectRequest.subject_id");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string subject_name = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_name(), ptr, ctx, "DetectRequest.subject_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .DetectionOptions detect_options = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 66)) {
+          ptr = ctx->ParseMessage(mutable_detect_options(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool DetectRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:DetectRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .Image image = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_image()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string source = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_source()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->source().data(), static_cast<int>(this->source().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "DetectRequest.source"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 frame = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &frame_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string subject_id = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_subject_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "DetectRequest.subject_id"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string subject_name = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_subject_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->subject_name().data(), static_cast<int>(this->subject_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "DetectRequest.subject_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .DetectionOptions detect_options = 8;
+      case 8: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (66 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_detect_options()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:DetectRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:DetectRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void DetectRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:DetectRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::image(this), output);
+  }
+
+  // string source = 2;
+  if (this->source().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->source().data(), static_cast<int>(this->source().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.source");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->source(), output);
+  }
+
+  // int64 frame = 3;
+  if (this->frame() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->frame(), output);
+  }
+
+  // string subject_id = 4;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.subject_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      4, this->subject_id(), output);
+  }
+
+  // string subject_name = 5;
+  if (this->subject_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_name().data(), static_cast<int>(this->subject_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.subject_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      5, this->subject_name(), output);
+  }
+
+  // .DetectionOptions detect_options = 8;
+  if (this->has_detect_options()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      8, HasBitSetters::detect_options(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:DetectRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* DetectRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:DetectRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::image(this), target);
+  }
+
+  // string source = 2;
+  if (this->source().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->source().data(), static_cast<int>(this->source().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.source");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->source(), target);
+  }
+
+  // int64 frame = 3;
+  if (this->frame() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->frame(), target);
+  }
+
+  // string subject_id = 4;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.subject_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        4, this->subject_id(), target);
+  }
+
+  // string subject_name = 5;
+  if (this->subject_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_name().data(), static_cast<int>(this->subject_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "DetectRequest.subject_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        5, this->subject_name(), target);
+  }
+
+  // .DetectionOptions detect_options = 8;
+  if (this->has_detect_options()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        8, HasBitSetters::detect_options(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:DetectRequest)
+  return target;
+}
+
+size_t DetectRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:DetectRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string source = 2;
+  if (this->source().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->source());
+  }
+
+  // string subject_id = 4;
+  if (this->subject_id().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->subject_id());
+  }
+
+  // string subject_name = 5;
+  if (this->subject_name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->subject_name());
+  }
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *image_);
+  }
+
+  // .DetectionOptions detect_options = 8;
+  if (this->has_detect_options()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *detect_options_);
+  }
+
+  // int64 frame = 3;
+  if (this->frame() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->frame());
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void DetectRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:DetectRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const DetectRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectRequest)
+    MergeFrom(*source);
+  }
+}
+
+void DetectRequest::MergeFrom(const DetectRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:DetectRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.source().size() > 0) {
+
+    source_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.source_);
+  }
+  if (from.subject_id().size() > 0) {
+
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  if (from.subject_name().size() > 0) {
+
+    subject_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_name_);
+  }
+  if (from.has_image()) {
+    mutable_image()->::Image::MergeFrom(from.image());
+  }
+  if (from.has_detect_options()) {
+    mutable_detect_options()->::DetectionOptions::MergeFrom(from.detect_options());
+  }
+  if (from.frame() != 0) {
+    set_frame(from.frame());
+  }
+}
+
+void DetectRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:DetectRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void DetectRequest::CopyFrom(const DetectRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:DetectRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool DetectRequest::IsInitialized() const {
+  return true;
+}
+
+void DetectRequest::Swap(DetectRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void DetectRequest::InternalSwap(DetectRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  source_.Swap(&other->source_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  subject_name_.Swap(&other->subject_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(image_, other->image_);
+  swap(detect_options_, other->detect_options_);
+  swap(frame_, other->frame_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata DetectRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void ExtractRequest::InitAsDefaultInstance() {
+  ::_ExtractRequest_default_instance_._instance.get_mutable()->image_ = const_cast< ::Image*>(
+      ::Image::internal_default_instance());
+  ::_ExtractRequest_default_instance_._instance.get_mutable()->records_ = const_cast< ::FaceRecordList*>(
+      ::FaceRecordList::internal_default_instance());
+  ::_ExtractRequest_default_instance_._instance.get_mutable()->extract_options_ = const_cast< ::ExtractOptions*>(
+      ::ExtractOptions::internal_default_instance());
+}
+class ExtractRequest::HasBitSetters {
+ public:
+  static const ::Image& image(const ExtractRequest* msg);
+  static const ::FaceRecordList& records(const ExtractRequest* msg);
+  static const ::ExtractOptions& extract_options(const ExtractRequest* msg);
+};
+
+const ::Image&
+ExtractRequest::HasBitSetters::image(const ExtractRequest* msg) {
+  return *msg->image_;
+}
+const ::FaceRecordList&
+ExtractRequest::HasBitSetters::records(const ExtractRequest* msg) {
+  return *msg->records_;
+}
+const ::ExtractOptions&
+ExtractRequest::HasBitSetters::extract_options(const ExtractRequest* msg) {
+  return *msg->extract_options_;
+}
+void ExtractRequest::clear_image() {
+  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
+    delete image_;
+  }
+  image_ = nullptr;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int ExtractRequest::kImageFieldNumber;
+const int ExtractRequest::kRecordsFieldNumber;
+const int ExtractRequest::kExtractOptionsFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+ExtractRequest::ExtractRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:ExtractRequest)
+}
+ExtractRequest::ExtractRequest(const ExtractRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_image()) {
+    image_ = new ::Image(*from.image_);
+  } else {
+    image_ = nullptr;
+  }
+  if (from.has_records()) {
+    records_ = new ::FaceRecordList(*from.records_);
+  } else {
+    records_ = nullptr;
+  }
+  if (from.has_extract_options()) {
+    extract_options_ = new ::ExtractOptions(*from.extract_options_);
+  } else {
+    extract_options_ = nullptr;
+  }
+  // @@protoc_insertion_point(copy_constructor:ExtractRequest)
+}
+
+void ExtractRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_ExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&image_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&extract_options_) -
+      reinterpret_cast<char*>(&image_)) + sizeof(extract_options_));
+}
+
+ExtractRequest::~ExtractRequest() {
+  // @@protoc_insertion_point(destructor:ExtractRequest)
+  SharedDtor();
+}
+
+void ExtractRequest::SharedDtor() {
+  if (this != internal_default_instance()) delete image_;
+  if (this != internal_default_instance()) delete records_;
+  if (this != internal_default_instance()) delete extract_options_;
+}
+
+void ExtractRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const ExtractRequest& ExtractRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_ExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void ExtractRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:ExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  if (GetArenaNoVirtual() == nullptr && image_ != nullptr) {
+    delete image_;
+  }
+  image_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
+  }
+  records_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && extract_options_ != nullptr) {
+    delete extract_options_;
+  }
+  extract_options_ = nullptr;
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* ExtractRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .Image image = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_image(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .FaceRecordList records = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
+          ptr = ctx->ParseMessage(mutable_records(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .ExtractOptions extract_options = 9;
+      case 9:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 74)) {
+          ptr = ctx->ParseMessage(mutable_extract_options(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool ExtractRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:ExtractRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .Image image = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_image()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .FaceRecordList records = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_records()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .ExtractOptions extract_options = 9;
+      case 9: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (74 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_extract_options()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:ExtractRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:ExtractRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void ExtractRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:ExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::image(this), output);
+  }
+
+  // .FaceRecordList records = 4;
+  if (this->has_records()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      4, HasBitSetters::records(this), output);
+  }
+
+  // .ExtractOptions extract_options = 9;
+  if (this->has_extract_options()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      9, HasBitSetters::extract_options(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:ExtractRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* ExtractRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:ExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::image(this), target);
+  }
+
+  // .FaceRecordList records = 4;
+  if (this->has_records()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        4, HasBitSetters::records(this), target);
+  }
+
+  // .ExtractOptions extract_options = 9;
+  if (this->has_extract_options()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        9, HasBitSetters::extract_options(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:ExtractRequest)
+  return target;
+}
+
+size_t ExtractRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:ExtractRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // .Image image = 1;
+  if (this->has_image()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *image_);
+  }
+
+  // .FaceRecordList records = 4;
+  if (this->has_records()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *records_);
+  }
+
+  // .ExtractOptions extract_options = 9;
+  if (this->has_extract_options()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *extract_options_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void ExtractRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:ExtractRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const ExtractRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<ExtractRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:ExtractRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:ExtractRequest)
+    MergeFrom(*source);
+  }
+}
+
+void ExtractRequest::MergeFrom(const ExtractRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:ExtractRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.has_image()) {
+    mutable_image()->::Image::MergeFrom(from.image());
+  }
+  if (from.has_records()) {
+    mutable_records()->::FaceRecordList::MergeFrom(from.records());
+  }
+  if (from.has_extract_options()) {
+    mutable_extract_options()->::ExtractOptions::MergeFrom(from.extract_options());
+  }
+}
+
+void ExtractRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:ExtractRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void ExtractRequest::CopyFrom(const ExtractRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:ExtractRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ExtractRequest::IsInitialized() const {
+  return true;
+}
+
+void ExtractRequest::Swap(ExtractRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void ExtractRequest::InternalSwap(ExtractRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(image_, other->image_);
+  swap(records_, other->records_);
+  swap(extract_options_, other->extract_options_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ExtractRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void ScoreRequest::InitAsDefaultInstance() {
+  ::_ScoreRequest_default_instance_._instance.get_mutable()->face_probes_ = const_cast< ::FaceRecordList*>(
+      ::FaceRecordList::internal_default_instance());
+  ::_ScoreRequest_default_instance_._instance.get_mutable()->face_gallery_ = const_cast< ::FaceRecordList*>(
+      ::FaceRecordList::internal_default_instance());
+  ::_ScoreRequest_default_instance_._instance.get_mutable()->template_probes_ = const_cast< ::TemplateList*>(
+      ::TemplateList::internal_default_instance());
+  ::_ScoreRequest_default_instance_._instance.get_mutable()->template_gallery_ = const_cast< ::TemplateList*>(
+      ::TemplateList::internal_default_instance());
+}
+class ScoreRequest::HasBitSetters {
+ public:
+  static const ::FaceRecordList& face_probes(const ScoreRequest* msg);
+  static const ::FaceRecordList& face_gallery(const ScoreRequest* msg);
+  static const ::TemplateList& template_probes(const ScoreRequest* msg);
+  static const ::TemplateList& template_gallery(const ScoreRequest* msg);
+};
+
+const ::FaceRecordList&
+ScoreRequest::HasBitSetters::face_probes(const ScoreRequest* msg) {
+  return *msg->face_probes_;
+}
+const ::FaceRecordList&
+ScoreRequest::HasBitSetters::face_gallery(const ScoreRequest* msg) {
+  return *msg->face_gallery_;
+}
+const ::TemplateList&
+ScoreRequest::HasBitSetters::template_probes(const ScoreRequest* msg) {
+  return *msg->template_probes_;
+}
+const ::TemplateList&
+ScoreRequest::HasBitSetters::template_gallery(const ScoreRequest* msg) {
+  return *msg->template_gallery_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int ScoreRequest::kFaceProbesFieldNumber;
+const int ScoreRequest::kFaceGalleryFieldNumber;
+const int ScoreRequest::kTemplateProbesFieldNumber;
+const int ScoreRequest::kTemplateGalleryFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+ScoreRequest::ScoreRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:ScoreRequest)
+}
+ScoreRequest::ScoreRequest(const ScoreRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_face_probes()) {
+    face_probes_ = new ::FaceRecordList(*from.face_probes_);
+  } else {
+    face_probes_ = nullptr;
+  }
+  if (from.has_face_gallery()) {
+    face_gallery_ = new ::FaceRecordList(*from.face_gallery_);
+  } else {
+    face_gallery_ = nullptr;
+  }
+  if (from.has_template_probes()) {
+    template_probes_ = new ::TemplateList(*from.template_probes_);
+  } else {
+    template_probes_ = nullptr;
+  }
+  if (from.has_template_gallery()) {
+    template_gallery_ = new ::TemplateList(*from.template_gallery_);
+  } else {
+    template_gallery_ = nullptr;
+  }
+  // @@protoc_insertion_point(copy_constructor:ScoreRequest)
+}
+
+void ScoreRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&face_probes_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&template_gallery_) -
+      reinterpret_cast<char*>(&face_probes_)) + sizeof(template_gallery_));
+}
+
+ScoreRequest::~ScoreRequest() {
+  // @@protoc_insertion_point(destructor:ScoreRequest)
+  SharedDtor();
+}
+
+void ScoreRequest::SharedDtor() {
+  if (this != internal_default_instance()) delete face_probes_;
+  if (this != internal_default_instance()) delete face_gallery_;
+  if (this != internal_default_instance()) delete template_probes_;
+  if (this != internal_default_instance()) delete template_gallery_;
+}
+
+void ScoreRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const ScoreRequest& ScoreRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_ScoreRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void ScoreRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:ScoreRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  if (GetArenaNoVirtual() == nullptr && face_probes_ != nullptr) {
+    delete face_probes_;
+  }
+  face_probes_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && face_gallery_ != nullptr) {
+    delete face_gallery_;
+  }
+  face_gallery_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && template_probes_ != nullptr) {
+    delete template_probes_;
+  }
+  template_probes_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && template_gallery_ != nullptr) {
+    delete template_gallery_;
+  }
+  template_gallery_ = nullptr;
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* ScoreRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .FaceRecordList face_probes = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_face_probes(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .FaceRecordList face_gallery = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ctx->ParseMessage(mutable_face_gallery(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .TemplateList template_probes = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ctx->ParseMessage(mutable_template_probes(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .TemplateList template_gallery = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 34)) {
+          ptr = ctx->ParseMessage(mutable_template_gallery(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool ScoreRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:ScoreRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .FaceRecordList face_probes = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_face_probes()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .FaceRecordList face_gallery = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_face_gallery()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .TemplateList template_probes = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_template_probes()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .TemplateList template_gallery = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (34 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_template_gallery()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:ScoreRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:ScoreRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void ScoreRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:ScoreRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .FaceRecordList face_probes = 1;
+  if (this->has_face_probes()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::face_probes(this), output);
+  }
+
+  // .FaceRecordList face_gallery = 2;
+  if (this->has_face_gallery()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      2, HasBitSetters::face_gallery(this), output);
+  }
+
+  // .TemplateList template_probes = 3;
+  if (this->has_template_probes()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      3, HasBitSetters::template_probes(this), output);
+  }
+
+  // .TemplateList template_gallery = 4;
+  if (this->has_template_gallery()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      4, HasBitSetters::template_gallery(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:ScoreRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* ScoreRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:ScoreRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .FaceRecordList face_probes = 1;
+  if (this->has_face_probes()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::face_probes(this), target);
+  }
+
+  // .FaceRecordList face_gallery = 2;
+  if (this->has_face_gallery()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        2, HasBitSetters::face_gallery(this), target);
+  }
+
+  // .TemplateList template_probes = 3;
+  if (this->has_template_probes()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        3, HasBitSetters::template_probes(this), target);
+  }
+
+  // .TemplateList template_gallery = 4;
+  if (this->has_template_gallery()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        4, HasBitSetters::template_gallery(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:ScoreRequest)
+  return target;
+}
+
+size_t ScoreRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:ScoreRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // .FaceRecordList face_probes = 1;
+  if (this->has_face_probes()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *face_probes_);
+  }
+
+  // .FaceRecordList face_gallery = 2;
+  if (this->has_face_gallery()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *face_gallery_);
+  }
+
+  // .TemplateList template_probes = 3;
+  if (this->has_template_probes()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *template_probes_);
+  }
+
+  // .TemplateList template_gallery = 4;
+  if (this->has_template_gallery()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *template_gallery_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void ScoreRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:ScoreRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const ScoreRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<ScoreRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:ScoreRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:ScoreRequest)
+    MergeFrom(*source);
+  }
+}
+
+void ScoreRequest::MergeFrom(const ScoreRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:ScoreRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.has_face_probes()) {
+    mutable_face_probes()->::FaceRecordList::MergeFrom(from.face_probes());
+  }
+  if (from.has_face_gallery()) {
+    mutable_face_gallery()->::FaceRecordList::MergeFrom(from.face_gallery());
+  }
+  if (from.has_template_probes()) {
+    mutable_template_probes()->::TemplateList::MergeFrom(from.template_probes());
+  }
+  if (from.has_template_gallery()) {
+    mutable_template_gallery()->::TemplateList::MergeFrom(from.template_gallery());
+  }
+}
+
+void ScoreRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:ScoreRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void ScoreRequest::CopyFrom(const ScoreRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:ScoreRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScoreRequest::IsInitialized() const {
+  return true;
+}
+
+void ScoreRequest::Swap(ScoreRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void ScoreRequest::InternalSwap(ScoreRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(face_probes_, other->face_probes_);
+  swap(face_gallery_, other->face_gallery_);
+  swap(template_probes_, other->template_probes_);
+  swap(template_gallery_, other->template_gallery_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScoreRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void ScoreBlock::InitAsDefaultInstance() {
+}
+class ScoreBlock::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int ScoreBlock::kProbeStartFieldNumber;
+const int ScoreBlock::kGalleryStartFieldNumber;
+const int ScoreBlock::kProbeCountFieldNumber;
+const int ScoreBlock::kGalleryCountFieldNumber;
+const int ScoreBlock::kScoresFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+ScoreBlock::ScoreBlock()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:ScoreBlock)
+}
+ScoreBlock::ScoreBlock(const ScoreBlock& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  scores_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.scores().size() > 0) {
+    scores_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.scores_);
+  }
+  ::memcpy(&probe_start_, &from.probe_start_,
+    static_cast<size_t>(reinterpret_cast<char*>(&gallery_count_) -
+    reinterpret_cast<char*>(&probe_start_)) + sizeof(gallery_count_));
+  // @@protoc_insertion_point(copy_constructor:ScoreBlock)
+}
+
+void ScoreBlock::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto.base);
+  scores_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&probe_start_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&gallery_count_) -
+      reinterpret_cast<char*>(&probe_start_)) + sizeof(gallery_count_));
+}
+
+ScoreBlock::~ScoreBlock() {
+  // @@protoc_insertion_point(destructor:ScoreBlock)
+  SharedDtor();
+}
+
+void ScoreBlock::SharedDtor() {
+  scores_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+
+void ScoreBlock::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const ScoreBlock& ScoreBlock::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_ScoreBlock_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void ScoreBlock::Clear() {
+// @@protoc_insertion_point(message_clear_start:ScoreBlock)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  scores_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&probe_start_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&gallery_count_) -
+      reinterpret_cast<char*>(&probe_start_)) + sizeof(gallery_count_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* ScoreBlock::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // int64 probe_start = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          probe_start_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 gallery_start = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          gallery_start_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 probe_count = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          probe_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 gallery_count = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          gallery_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bytes scores = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParser(mutable_scores(), ptr, ctx);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool ScoreBlock::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:ScoreBlock)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // int64 probe_start = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &probe_start_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 gallery_start = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &gallery_start_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 probe_count = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &probe_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 gallery_count = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &gallery_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bytes scores = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadBytes(
+                input, this->mutable_scores()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:ScoreBlock)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:ScoreBlock)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void ScoreBlock::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:ScoreBlock)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 probe_start = 1;
+  if (this->probe_start() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(1, this->probe_start(), output);
+  }
+
+  // int64 gallery_start = 2;
+  if (this->gallery_start() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->gallery_start(), output);
+  }
+
+  // int32 probe_count = 3;
+  if (this->probe_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(3, this->probe_count(), output);
+  }
+
+  // int32 gallery_count = 4;
+  if (this->gallery_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->gallery_count(), output);
+  }
+
+  // bytes scores = 5;
+  if (this->scores().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBytesMaybeAliased(
+      5, this->scores(), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:ScoreBlock)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* ScoreBlock::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:ScoreBlock)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 probe_start = 1;
+  if (this->probe_start() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(1, this->probe_start(), target);
+  }
+
+  // int64 gallery_start = 2;
+  if (this->gallery_start() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->gallery_start(), target);
+  }
+
+  // int32 probe_count = 3;
+  if (this->probe_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(3, this->probe_count(), target);
+  }
+
+  // int32 gallery_count = 4;
+  if (this->gallery_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->gallery_count(), target);
+  }
+
+  // bytes scores = 5;
+  if (this->scores().size() > 0) {
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBytesToArray(
+        5, this->scores(), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:ScoreBlock)
+  return target;
+}
+
+size_t ScoreBlock::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:ScoreBlock)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // bytes scores = 5;
+  if (this->scores().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->scores());
+  }
+
+  // int64 probe_start = 1;
+  if (this->probe_start() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->probe_start());
+  }
+
+  // int64 gallery_start = 2;
+  if (this->gallery_start() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->gallery_start());
+  }
+
+  // int32 probe_count = 3;
+  if (this->probe_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->probe_count());
+  }
+
+  // int32 gallery_count = 4;
+  if (this->gallery_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->gallery_count());
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void ScoreBlock::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:ScoreBlock)
+  GOOGLE_DCHECK_NE(&from, this);
+  const ScoreBlock* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<ScoreBlock>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:ScoreBlock)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:ScoreBlock)
+    MergeFrom(*source);
+  }
+}
+
+void ScoreBlock::MergeFrom(const ScoreBlock& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:ScoreBlock)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.scores().size() > 0) {
+
+    scores_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.scores_);
+  }
+  if (from.probe_start() != 0) {
+    set_probe_start(from.probe_start());
+  }
+  if (from.gallery_start() != 0) {
+    set_gallery_start(from.gallery_start());
+  }
+  if (from.probe_count() != 0) {
+    set_probe_count(from.probe_count());
+  }
+  if (from.gallery_count() != 0) {
+    set_gallery_count(from.gallery_count());
+  }
+}
+
+void ScoreBlock::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:ScoreBlock)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void ScoreBlock::CopyFrom(const ScoreBlock& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:ScoreBlock)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScoreBlock::IsInitialized() const {
+  return true;
+}
+
+void ScoreBlock::Swap(ScoreBlock* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void ScoreBlock::InternalSwap(ScoreBlock* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  scores_.Swap(&other->scores_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(probe_start_, other->probe_start_);
+  swap(gallery_start_, other->gallery_start_);
+  swap(probe_count_, other->probe_count_);
+  swap(gallery_count_, other->gallery_count_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScoreBlock::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void MatchDistributionRequest::InitAsDefaultInstance() {
+}
+class MatchDistributionRequest::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int MatchDistributionRequest::kGalleryNameFieldNumber;
+const int MatchDistributionRequest::kBinsFieldNumber;
+const int MatchDistributionRequest::kMinScoreFieldNumber;
+const int MatchDistributionRequest::kMaxScoreFieldNumber;
+const int MatchDistributionRequest::kIncludeScoresFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+MatchDistributionRequest::MatchDistributionRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:MatchDistributionRequest)
+}
+MatchDistributionRequest::MatchDistributionRequest(const MatchDistributionRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  ::memcpy(&bins_, &from.bins_,
+    static_cast<size_t>(reinterpret_cast<char*>(&include_scores_) -
+    reinterpret_cast<char*>(&bins_)) + sizeof(include_scores_));
+  // @@protoc_insertion_point(copy_constructor:MatchDistributionRequest)
+}
+
+void MatchDistributionRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&bins_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&include_scores_) -
+      reinterpret_cast<char*>(&bins_)) + sizeof(include_scores_));
+}
+
+MatchDistributionRequest::~MatchDistributionRequest() {
+  // @@protoc_insertion_point(destructor:MatchDistributionRequest)
+  SharedDtor();
+}
+
+void MatchDistributionRequest::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+
+void MatchDistributionRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const MatchDistributionRequest& MatchDistributionRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_MatchDistributionRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void MatchDistributionRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:MatchDistributionRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&bins_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&include_scores_) -
+      reinterpret_cast<char*>(&bins_)) + sizeof(include_scores_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* MatchDistributionRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // string gallery_name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "MatchDistributionRequest.gallery_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 bins = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          bins_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // float min_score = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 29)) {
+          min_score_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // float max_score = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 37)) {
+          max_score_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // bool include_scores = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          include_scores_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool MatchDistributionRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:MatchDistributionRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // string gallery_name = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "MatchDistributionRequest.gallery_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 bins = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &bins_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float min_score = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (29 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &min_score_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float max_score = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (37 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &max_score_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool include_scores = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &include_scores_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:MatchDistributionRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:MatchDistributionRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void MatchDistributionRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:MatchDistributionRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "MatchDistributionRequest.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
+  }
+
+  // int32 bins = 2;
+  if (this->bins() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(2, this->bins(), output);
+  }
+
+  // float min_score = 3;
+  if (!(this->min_score() <= 0 && this->min_score() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(3, this->min_score(), output);
+  }
+
+  // float max_score = 4;
+  if (!(this->max_score() <= 0 && this->max_score() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(4, this->max_score(), output);
+  }
+
+  // bool include_scores = 5;
+  if (this->include_scores() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(5, this->include_scores(), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:MatchDistributionRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* MatchDistributionRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:MatchDistributionRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "MatchDistributionRequest.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
+  }
+
+  // int32 bins = 2;
+  if (this->bins() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(2, this->bins(), target);
+  }
+
+  // float min_score = 3;
+  if (!(this->min_score() <= 0 && this->min_score() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(3, this->min_score(), target);
+  }
+
+  // float max_score = 4;
+  if (!(this->max_score() <= 0 && this->max_score() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(4, this->max_score(), target);
+  }
+
+  // bool include_scores = 5;
+  if (this->include_scores() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(5, this->include_scores(), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:MatchDistributionRequest)
+  return target;
+}
+
+size_t MatchDistributionRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:MatchDistributionRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
+  }
+
+  // int32 bins = 2;
+  if (this->bins() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->bins());
+  }
+
+  // float min_score = 3;
+  if (!(this->min_score() <= 0 && this->min_score() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  // float max_score = 4;
+  if (!(this->max_score() <= 0 && this->max_score() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  // bool include_scores = 5;
+  if (this->include_scores() != 0) {
+    total_size += 1 + 1;
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void MatchDistributionRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:MatchDistributionRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const MatchDistributionRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<MatchDistributionRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:MatchDistributionRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:MatchDistributionRequest)
+    MergeFrom(*source);
+  }
+}
+
+void MatchDistributionRequest::MergeFrom(const MatchDistributionRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:MatchDistributionRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  if (from.bins() != 0) {
+    set_bins(from.bins());
+  }
+  if (!(from.min_score() <= 0 && from.min_score() >= 0)) {
+    set_min_score(from.min_score());
+  }
+  if (!(from.max_score() <= 0 && from.max_score() >= 0)) {
+    set_max_score(from.max_score());
+  }
+  if (from.include_scores() != 0) {
+    set_include_scores(from.include_scores());
+  }
+}
+
+void MatchDistributionRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:MatchDistributionRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void MatchDistributionRequest::CopyFrom(const MatchDistributionRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:MatchDistributionRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool MatchDistributionRequest::IsInitialized() const {
+  return true;
+}
+
+void MatchDistributionRequest::Swap(MatchDistributionRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void MatchDistributionRequest::InternalSwap(MatchDistributionRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(bins_, other->bins_);
+  swap(min_score_, other->min_score_);
+  swap(max_score_, other->max_score_);
+  swap(include_scores_, other->include_scores_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata MatchDistributionRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void MatchDistribution::InitAsDefaultInstance() {
+  ::_MatchDistribution_default_instance_._instance.get_mutable()->block_ = const_cast< ::ScoreBlock*>(
+      ::ScoreBlock::internal_default_instance());
+}
+class MatchDistribution::HasBitSetters {
+ public:
+  static const ::ScoreBlock& block(const MatchDistribution* msg);
+};
+
+const ::ScoreBlock&
+MatchDistribution::HasBitSetters::block(const MatchDistribution* msg) {
+  return *msg->block_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int MatchDistribution::kBlockFieldNumber;
+const int MatchDistribution::kFaceCountFieldNumber;
+const int MatchDistribution::kGenuineCountFieldNumber;
+const int MatchDistribution::kImpostorCountFieldNumber;
+const int MatchDistribution::kBinEdgesFieldNumber;
+const int MatchDistribution::kGenuineHistogramFieldNumber;
+const int MatchDistribution::kImpostorHistogramFieldNumber;
+const int MatchDistribution::kThresholdsFieldNumber;
+const int MatchDistribution::kFarFieldNumber;
+const int MatchDistribution::kFrrFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+MatchDistribution::MatchDistribution()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:MatchDistribution)
+}
+MatchDistribution::MatchDistribution(const MatchDistribution& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr),
+      bin_edges_(from.bin_edges_),
+      genuine_histogram_(from.genuine_histogram_),
+      impostor_histogram_(from.impostor_histogram_),
+      thresholds_(from.thresholds_),
+      far_(from.far_),
+      frr_(from.frr_) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_block()) {
+    block_ = new ::ScoreBlock(*from.block_);
+  } else {
+    block_ = nullptr;
+  }
+  ::memcpy(&face_count_, &from.face_count_,
+    static_cast<size_t>(reinterpret_cast<char*>(&impostor_count_) -
+    reinterpret_cast<char*>(&face_count_)) + sizeof(impostor_count_));
+  // @@protoc_insertion_point(copy_constructor:MatchDistribution)
+}
+
+void MatchDistribution::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&block_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&impostor_count_) -
+      reinterpret_cast<char*>(&block_)) + sizeof(impostor_count_));
+}
+
+MatchDistribution::~MatchDistribution() {
+  // @@protoc_insertion_point(destructor:MatchDistribution)
+  SharedDtor();
+}
+
+void MatchDistribution::SharedDtor() {
+  if (this != internal_default_instance()) delete block_;
+}
+
+void MatchDistribution::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const MatchDistribution& MatchDistribution::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_MatchDistribution_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void MatchDistribution::Clear() {
+// @@protoc_insertion_point(message_clear_start:MatchDistribution)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  bin_edges_.Clear();
+  genuine_histogram_.Clear();
+  impostor_histogram_.Clear();
+  thresholds_.Clear();
+  far_.Clear();
+  frr_.Clear();
+  if (GetArenaNoVirtual() == nullptr && block_ != nullptr) {
+    delete block_;
+  }
+  block_ = nullptr;
+  ::memset(&face_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&impostor_count_) -
+      reinterpret_cast<char*>(&face_count_)) + sizeof(impostor_count_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* MatchDistribution::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .ScoreBlock block = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_block(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 face_count = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          face_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 genuine_count = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          genuine_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 impostor_count = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          impostor_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // repeated float bin_edges = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 42)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedFloatParser(mutable_bin_edges(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 45) {
+          add_bin_edges(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr));
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // repeated int64 genuine_histogram = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 50)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedInt64Parser(mutable_genuine_histogram(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48) {
+          add_genuine_histogram(::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr));
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // repeated int64 impostor_histogram = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 58)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedInt64Parser(mutable_impostor_histogram(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 56) {
+          add_impostor_histogram(::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr));
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // repeated float thresholds = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 66)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedFloatParser(mutable_thresholds(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 69) {
+          add_thresholds(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr));
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // repeated float far = 9;
+      case 9:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 74)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedFloatParser(mutable_far(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 77) {
+          add_far(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr));
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // repeated float frr = 10;
+      case 10:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 82)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedFloatParser(mutable_frr(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 85) {
+          add_frr(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr));
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool MatchDistribution::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:MatchDistribution)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .ScoreBlock block = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_block()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 face_count = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &face_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 genuine_count = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &genuine_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 impostor_count = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &impostor_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated float bin_edges = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (42 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, this->mutable_bin_edges())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (45 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 1, 42u, input, this->mutable_bin_edges())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated int64 genuine_histogram = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (50 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, this->mutable_genuine_histogram())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 1, 50u, input, this->mutable_genuine_histogram())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated int64 impostor_histogram = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (58 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, this->mutable_impostor_histogram())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (56 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 1, 58u, input, this->mutable_impostor_histogram())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated float thresholds = 8;
+      case 8: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (66 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, this->mutable_thresholds())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (69 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 1, 66u, input, this->mutable_thresholds())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated float far = 9;
+      case 9: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (74 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, this->mutable_far())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (77 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 1, 74u, input, this->mutable_far())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // repeated float frr = 10;
+      case 10: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (82 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPackedPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, this->mutable_frr())));
+        } else if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (85 & 0xFF)) {
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 1, 82u, input, this->mutable_frr())));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:MatchDistribution)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:MatchDistribution)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void MatchDistribution::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:MatchDistribution)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .ScoreBlock block = 1;
+  if (this->has_block()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::block(this), output);
+  }
+
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->face_count(), output);
+  }
+
+  // int64 genuine_count = 3;
+  if (this->genuine_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->genuine_count(), output);
+  }
+
+  // int64 impostor_count = 4;
+  if (this->impostor_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->impostor_count(), output);
+  }
+
+  // repeated float bin_edges = 5;
+  if (this->bin_edges_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(5, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_bin_edges_cached_byte_size_.load(
+        std::memory_order_relaxed));
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatArray(
+      this->bin_edges().data(), this->bin_edges_size(), output);
+  }
+
+  // repeated int64 genuine_histogram = 6;
+  if (this->genuine_histogram_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(6, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_genuine_histogram_cached_byte_size_.load(
+        std::memory_order_relaxed));
+  }
+  for (int i = 0, n = this->genuine_histogram_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64NoTag(
+      this->genuine_histogram(i), output);
+  }
+
+  // repeated int64 impostor_histogram = 7;
+  if (this->impostor_histogram_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(7, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_impostor_histogram_cached_byte_size_.load(
+        std::memory_order_relaxed));
+  }
+  for (int i = 0, n = this->impostor_histogram_size(); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64NoTag(
+      this->impostor_histogram(i), output);
+  }
+
+  // repeated float thresholds = 8;
+  if (this->thresholds_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(8, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_thresholds_cached_byte_size_.load(
+        std::memory_order_relaxed));
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatArray(
+      this->thresholds().data(), this->thresholds_size(), output);
+  }
+
+  // repeated float far = 9;
+  if (this->far_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(9, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_far_cached_byte_size_.load(
+        std::memory_order_relaxed));
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatArray(
+      this->far().data(), this->far_size(), output);
+  }
+
+  // repeated float frr = 10;
+  if (this->frr_size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTag(10, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_frr_cached_byte_size_.load(
+        std::memory_order_relaxed));
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatArray(
+      this->frr().data(), this->frr_size(), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:MatchDistribution)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* MatchDistribution::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:MatchDistribution)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .ScoreBlock block = 1;
+  if (this->has_block()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::block(this), target);
+  }
+
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->face_count(), target);
+  }
+
+  // int64 genuine_count = 3;
+  if (this->genuine_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->genuine_count(), target);
+  }
+
+  // int64 impostor_count = 4;
+  if (this->impostor_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->impostor_count(), target);
+  }
+
+  // repeated float bin_edges = 5;
+  if (this->bin_edges_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      5,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _bin_edges_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteFloatNoTagToArray(this->bin_edges_, target);
+  }
+
+  // repeated int64 genuine_histogram = 6;
+  if (this->genuine_histogram_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      6,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _genuine_histogram_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteInt64NoTagToArray(this->genuine_histogram_, target);
+  }
+
+  // repeated int64 impostor_histogram = 7;
+  if (this->impostor_histogram_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      7,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _impostor_histogram_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteInt64NoTagToArray(this->impostor_histogram_, target);
+  }
+
+  // repeated float thresholds = 8;
+  if (this->thresholds_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      8,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _thresholds_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteFloatNoTagToArray(this->thresholds_, target);
+  }
+
+  // repeated float far = 9;
+  if (this->far_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      9,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _far_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteFloatNoTagToArray(this->far_, target);
+  }
+
+  // repeated float frr = 10;
+  if (this->frr_size() > 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteTagToArray(
+      10,
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream::WriteVarint32ToArray(
+        _frr_cached_byte_size_.load(std::memory_order_relaxed),
+         target);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      WriteFloatNoTagToArray(this->frr_, target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:MatchDistribution)
+  return target;
+}
+
+size_t MatchDistribution::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:MatchDistribution)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated float bin_edges = 5;
+  {
+    unsigned int count = static_cast<unsigned int>(this->bin_edges_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _bin_edges_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated int64 genuine_histogram = 6;
+  {
+    size_t data_size = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      Int64Size(this->genuine_histogram_);
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _genuine_histogram_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated int64 impostor_histogram = 7;
+  {
+    size_t data_size = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      Int64Size(this->impostor_histogram_);
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _impostor_histogram_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated float thresholds = 8;
+  {
+    unsigned int count = static_cast<unsigned int>(this->thresholds_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _thresholds_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated float far = 9;
+  {
+    unsigned int count = static_cast<unsigned int>(this->far_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _far_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated float frr = 10;
+  {
+    unsigned int count = static_cast<unsigned int>(this->frr_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+            static_cast<::PROTOBUF_NAMESPACE_ID::int32>(data_size));
+    }
+    int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(data_size);
+    _frr_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // .ScoreBlock block = 1;
+  if (this->has_block()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *block_);
+  }
+
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->face_count());
+  }
+
+  // int64 genuine_count = 3;
+  if (this->genuine_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->genuine_count());
+  }
+
+  // int64 impostor_count = 4;
+  if (this->impostor_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->impostor_count());
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void MatchDistribution::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:MatchDistribution)
+  GOOGLE_DCHECK_NE(&from, this);
+  const MatchDistribution* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<MatchDistribution>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:MatchDistribution)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:MatchDistribution)
+    MergeFrom(*source);
+  }
+}
+
+void MatchDistribution::MergeFrom(const MatchDistribution& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:MatchDistribution)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  bin_edges_.MergeFrom(from.bin_edges_);
+  genuine_histogram_.MergeFrom(from.genuine_histogram_);
+  impostor_histogram_.MergeFrom(from.impostor_histogram_);
+  thresholds_.MergeFrom(from.thresholds_);
+  far_.MergeFrom(from.far_);
+  frr_.MergeFrom(from.frr_);
+  if (from.has_block()) {
+    mutable_block()->::ScoreBlock::MergeFrom(from.block());
+  }
+  if (from.face_count() != 0) {
+    set_face_count(from.face_count());
+  }
+  if (from.genuine_count() != 0) {
+    set_genuine_count(from.genuine_count());
+  }
+  if (from.impostor_count() != 0) {
+    set_impostor_count(from.impostor_count());
+  }
+}
+
+void MatchDistribution::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:MatchDistribution)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void MatchDistribution::CopyFrom(const MatchDistribution& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:MatchDistribution)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool MatchDistribution::IsInitialized() const {
+  return true;
+}
+
+void MatchDistribution::Swap(MatchDistribution* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void MatchDistribution::InternalSwap(MatchDistribution* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  bin_edges_.InternalSwap(&other->bin_edges_);
+  genuine_histogram_.InternalSwap(&other->genuine_histogram_);
+  impostor_histogram_.InternalSwap(&other->impostor_histogram_);
+  thresholds_.InternalSwap(&other->thresholds_);
+  far_.InternalSwap(&other->far_);
+  frr_.InternalSwap(&other->frr_);
+  swap(block_, other->block_);
+  swap(face_count_, other->face_count_);
+  swap(genuine_count_, other->genuine_count_);
+  swap(impostor_count_, other->impostor_count_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata MatchDistribution::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void DetectExtractRequest::InitAsDefaultInstance() {
+  ::_DetectExtractRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
+      ::DetectRequest::internal_default_instance());
+  ::_DetectExtractRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
+      ::ExtractRequest::internal_default_instance());
+}
+class DetectExtractRequest::HasBitSetters {
+ public:
+  static const ::DetectRequest& detect_request(const DetectExtractRequest* msg);
+  static const ::ExtractRequest& extract_request(const DetectExtractRequest* msg);
+};
+
+const ::DetectRequest&
+DetectExtractRequest::HasBitSetters::detect_request(const DetectExtractRequest* msg) {
+  return *msg->detect_request_;
+}
+const ::ExtractRequest&
+DetectExtractRequest::HasBitSetters::extract_request(const DetectExtractRequest* msg) {
+  return *msg->extract_request_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int DetectExtractRequest::kDetectRequestFieldNumber;
+const int DetectExtractRequest::kExtractRequestFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+DetectExtractRequest::DetectExtractRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:DetectExtractRequest)
+}
+DetectExtractRequest::DetectExtractRequest(const DetectExtractRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_detect_request()) {
+    detect_request_ = new ::DetectRequest(*from.detect_request_);
+  } else {
+    detect_request_ = nullptr;
+  }
+  if (from.has_extract_request()) {
+    extract_request_ = new ::ExtractRequest(*from.extract_request_);
+  } else {
+    extract_request_ = nullptr;
+  }
+  // @@protoc_insertion_point(copy_constructor:DetectExtractRequest)
+}
+
+void DetectExtractRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&detect_request_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&extract_request_) -
+      reinterpret_cast<char*>(&detect_request_)) + sizeof(extract_request_));
+}
+
+DetectExtractRequest::~DetectExtractRequest() {
+  // @@protoc_insertion_point(destructor:DetectExtractRequest)
+  SharedDtor();
+}
+
+void DetectExtractRequest::SharedDtor() {
+  if (this != internal_default_instance()) delete detect_request_;
+  if (this != internal_default_instance()) delete extract_request_;
+}
+
+void DetectExtractRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const DetectExtractRequest& DetectExtractRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void DetectExtractRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:DetectExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
+  }
+  detect_request_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
+  }
+  extract_request_ = nullptr;
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* DetectExtractRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .DetectRequest detect_request = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .ExtractRequest extract_request = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool DetectExtractRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:DetectExtractRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .DetectRequest detect_request = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_detect_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .ExtractRequest extract_request = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_extract_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:DetectExtractRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:DetectExtractRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void DetectExtractRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:DetectExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::detect_request(this), output);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      2, HasBitSetters::extract_request(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:DetectExtractRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::detect_request(this), target);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        2, HasBitSetters::extract_request(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractRequest)
+  return target;
+}
+
+size_t DetectExtractRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:DetectExtractRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *detect_request_);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *extract_request_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void DetectExtractRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const DetectExtractRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractRequest)
+    MergeFrom(*source);
+  }
+}
+
+void DetectExtractRequest::MergeFrom(const DetectExtractRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.has_detect_request()) {
+    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
+  }
+  if (from.has_extract_request()) {
+    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
+  }
+}
+
+void DetectExtractRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void DetectExtractRequest::CopyFrom(const DetectExtractRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool DetectExtractRequest::IsInitialized() const {
+  return true;
+}
+
+void DetectExtractRequest::Swap(DetectExtractRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void DetectExtractRequest::InternalSwap(DetectExtractRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(detect_request_, other->detect_request_);
+  swap(extract_request_, other->extract_request_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void DetectExtractEnrollRequest::InitAsDefaultInstance() {
+  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
+      ::DetectRequest::internal_default_instance());
+  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
+      ::ExtractRequest::internal_default_instance());
+  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->enroll_request_ = const_cast< ::EnrollRequest*>(
+      ::EnrollRequest::internal_default_instance());
+}
+class DetectExtractEnrollRequest::HasBitSetters {
+ public:
+  static const ::DetectRequest& detect_request(const DetectExtractEnrollRequest* msg);
+  static const ::ExtractRequest& extract_request(const DetectExtractEnrollRequest* msg);
+  static const ::EnrollRequest& enroll_request(const DetectExtractEnrollRequest* msg);
+};
+
+const ::DetectRequest&
+DetectExtractEnrollRequest::HasBitSetters::detect_request(const DetectExtractEnrollRequest* msg) {
+  return *msg->detect_request_;
+}
+const ::ExtractRequest&
+DetectExtractEnrollRequest::HasBitSetters::extract_request(const DetectExtractEnrollRequest* msg) {
+  return *msg->extract_request_;
+}
+const ::EnrollRequest&
+DetectExtractEnrollRequest::HasBitSetters::enroll_request(const DetectExtractEnrollRequest* msg) {
+  return *msg->enroll_request_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int DetectExtractEnrollRequest::kDetectRequestFieldNumber;
+const int DetectExtractEnrollRequest::kExtractRequestFieldNumber;
+const int DetectExtractEnrollRequest::kEnrollRequestFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+DetectExtractEnrollRequest::DetectExtractEnrollRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:DetectExtractEnrollRequest)
+}
+DetectExtractEnrollRequest::DetectExtractEnrollRequest(const DetectExtractEnrollRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_detect_request()) {
+    detect_request_ = new ::DetectRequest(*from.detect_request_);
+  } else {
+    detect_request_ = nullptr;
+  }
+  if (from.has_extract_request()) {
+    extract_request_ = new ::ExtractRequest(*from.extract_request_);
+  } else {
+    extract_request_ = nullptr;
+  }
+  if (from.has_enroll_request()) {
+    enroll_request_ = new ::EnrollRequest(*from.enroll_request_);
+  } else {
+    enroll_request_ = nullptr;
+  }
+  // @@protoc_insertion_point(copy_constructor:DetectExtractEnrollRequest)
+}
+
+void DetectExtractEnrollRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&detect_request_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&enroll_request_) -
+      reinterpret_cast<char*>(&detect_request_)) + sizeof(enroll_request_));
+}
+
+DetectExtractEnrollRequest::~DetectExtractEnrollRequest() {
+  // @@protoc_insertion_point(destructor:DetectExtractEnrollRequest)
+  SharedDtor();
+}
+
+void DetectExtractEnrollRequest::SharedDtor() {
+  if (this != internal_default_instance()) delete detect_request_;
+  if (this != internal_default_instance()) delete extract_request_;
+  if (this != internal_default_instance()) delete enroll_request_;
+}
+
+void DetectExtractEnrollRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const DetectExtractEnrollRequest& DetectExtractEnrollRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void DetectExtractEnrollRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:DetectExtractEnrollRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
+  }
+  detect_request_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
+  }
+  extract_request_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && enroll_request_ != nullptr) {
+    delete enroll_request_;
+  }
+  enroll_request_ = nullptr;
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* DetectExtractEnrollRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .DetectRequest detect_request = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .ExtractRequest extract_request = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .EnrollRequest enroll_request = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ctx->ParseMessage(mutable_enroll_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool DetectExtractEnrollRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:DetectExtractEnrollRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .DetectRequest detect_request = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_detect_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .ExtractRequest extract_request = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_extract_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .EnrollRequest enroll_request = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_enroll_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:DetectExtractEnrollRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:DetectExtractEnrollRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void DetectExtractEnrollRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:DetectExtractEnrollRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::detect_request(this), output);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      2, HasBitSetters::extract_request(this), output);
+  }
+
+  // .EnrollRequest enroll_request = 3;
+  if (this->has_enroll_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      3, HasBitSetters::enroll_request(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:DetectExtractEnrollRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractEnrollRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractEnrollRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::detect_request(this), target);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        2, HasBitSetters::extract_request(this), target);
+  }
+
+  // .EnrollRequest enroll_request = 3;
+  if (this->has_enroll_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        3, HasBitSetters::enroll_request(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractEnrollRequest)
+  return target;
+}
+
+size_t DetectExtractEnrollRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:DetectExtractEnrollRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *detect_request_);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *extract_request_);
+  }
+
+  // .EnrollRequest enroll_request = 3;
+  if (this->has_enroll_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *enroll_request_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void DetectExtractEnrollRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractEnrollRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const DetectExtractEnrollRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractEnrollRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractEnrollRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractEnrollRequest)
+    MergeFrom(*source);
+  }
+}
+
+void DetectExtractEnrollRequest::MergeFrom(const DetectExtractEnrollRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractEnrollRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.has_detect_request()) {
+    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
+  }
+  if (from.has_extract_request()) {
+    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
+  }
+  if (from.has_enroll_request()) {
+    mutable_enroll_request()->::EnrollRequest::MergeFrom(from.enroll_request());
+  }
+}
+
+void DetectExtractEnrollRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractEnrollRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void DetectExtractEnrollRequest::CopyFrom(const DetectExtractEnrollRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractEnrollRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool DetectExtractEnrollRequest::IsInitialized() const {
+  return true;
+}
+
+void DetectExtractEnrollRequest::Swap(DetectExtractEnrollRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void DetectExtractEnrollRequest::InternalSwap(DetectExtractEnrollRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(detect_request_, other->detect_request_);
+  swap(extract_request_, other->extract_request_);
+  swap(enroll_request_, other->enroll_request_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractEnrollRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void DetectExtractSearchRequest::InitAsDefaultInstance() {
+  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
+      ::DetectRequest::internal_default_instance());
+  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
+      ::ExtractRequest::internal_default_instance());
+  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->search_request_ = const_cast< ::SearchRequest*>(
+      ::SearchRequest::internal_default_instance());
+}
+class DetectExtractSearchRequest::HasBitSetters {
+ public:
+  static const ::DetectRequest& detect_request(const DetectExtractSearchRequest* msg);
+  static const ::ExtractRequest& extract_request(const DetectExtractSearchRequest* msg);
+  static const ::SearchRequest& search_request(const DetectExtractSearchRequest* msg);
+};
+
+const ::DetectRequest&
+DetectExtractSearchRequest::HasBitSetters::detect_request(const DetectExtractSearchRequest* msg) {
+  return *msg->detect_request_;
+}
+const ::ExtractRequest&
+DetectExtractSearchRequest::HasBitSetters::extract_request(const DetectExtractSearchRequest* msg) {
+  return *msg->extract_request_;
+}
+const ::SearchRequest&
+DetectExtractSearchRequest::HasBitSetters::search_request(const DetectExtractSearchRequest* msg) {
+  return *msg->search_request_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int DetectExtractSearchRequest::kDetectRequestFieldNumber;
+const int DetectExtractSearchRequest::kExtractRequestFieldNumber;
+const int DetectExtractSearchRequest::kSearchRequestFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+DetectExtractSearchRequest::DetectExtractSearchRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:DetectExtractSearchRequest)
+}
+DetectExtractSearchRequest::DetectExtractSearchRequest(const DetectExtractSearchRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  if (from.has_detect_request()) {
+    detect_request_ = new ::DetectRequest(*from.detect_request_);
+  } else {
+    detect_request_ = nullptr;
+  }
+  if (from.has_extract_request()) {
+    extract_request_ = new ::ExtractRequest(*from.extract_request_);
+  } else {
+    extract_request_ = nullptr;
+  }
+  if (from.has_search_request()) {
+    search_request_ = new ::SearchRequest(*from.search_request_);
+  } else {
+    search_request_ = nullptr;
+  }
+  // @@protoc_insertion_point(copy_constructor:DetectExtractSearchRequest)
+}
+
+void DetectExtractSearchRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractSearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  ::memset(&detect_request_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&search_request_) -
+      reinterpret_cast<char*>(&detect_request_)) + sizeof(search_request_));
+}
+
+DetectExtractSearchRequest::~DetectExtractSearchRequest() {
+  // @@protoc_insertion_point(destructor:DetectExtractSearchRequest)
+  SharedDtor();
+}
+
+void DetectExtractSearchRequest::SharedDtor() {
+  if (this != internal_default_instance()) delete detect_request_;
+  if (this != internal_default_instance()) delete extract_request_;
+  if (this != internal_default_instance()) delete search_request_;
+}
+
+void DetectExtractSearchRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const DetectExtractSearchRequest& DetectExtractSearchRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractSearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void DetectExtractSearchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:DetectExtractSearchRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
+  }
+  detect_request_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
+  }
+  extract_request_ = nullptr;
+  if (GetArenaNoVirtual() == nullptr && search_request_ != nullptr) {
+    delete search_request_;
+  }
+  search_request_ = nullptr;
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* DetectExtractSearchRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .DetectRequest detect_request = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .ExtractRequest extract_request = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .SearchRequest search_request = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ctx->ParseMessage(mutable_search_request(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool DetectExtractSearchRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:DetectExtractSearchRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .DetectRequest detect_request = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_detect_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .ExtractRequest extract_request = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_extract_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .SearchRequest search_request = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_search_request()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:DetectExtractSearchRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:DetectExtractSearchRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void DetectExtractSearchRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:DetectExtractSearchRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      1, HasBitSetters::detect_request(this), output);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      2, HasBitSetters::extract_request(this), output);
+  }
+
+  // .SearchRequest search_request = 3;
+  if (this->has_search_request()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      3, HasBitSetters::search_request(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:DetectExtractSearchRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractSearchRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractSearchRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        1, HasBitSetters::detect_request(this), target);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        2, HasBitSetters::extract_request(this), target);
+  }
+
+  // .SearchRequest search_request = 3;
+  if (this->has_search_request()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        3, HasBitSetters::search_request(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractSearchRequest)
+  return target;
+}
+
+size_t DetectExtractSearchRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:DetectExtractSearchRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // .DetectRequest detect_request = 1;
+  if (this->has_detect_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *detect_request_);
+  }
+
+  // .ExtractRequest extract_request = 2;
+  if (this->has_extract_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *extract_request_);
+  }
+
+  // .SearchRequest search_request = 3;
+  if (this->has_search_request()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *search_request_);
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void DetectExtractSearchRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractSearchRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const DetectExtractSearchRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractSearchRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractSearchRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractSearchRequest)
+    MergeFrom(*source);
+  }
+}
+
+void DetectExtractSearchRequest::MergeFrom(const DetectExtractSearchRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractSearchRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.has_detect_request()) {
+    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
+  }
+  if (from.has_extract_request()) {
+    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
+  }
+  if (from.has_search_request()) {
+    mutable_search_request()->::SearchRequest::MergeFrom(from.search_request());
+  }
+}
+
+void DetectExtractSearchRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractSearchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void DetectExtractSearchRequest::CopyFrom(const DetectExtractSearchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractSearchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool DetectExtractSearchRequest::IsInitialized() const {
+  return true;
+}
+
+void DetectExtractSearchRequest::Swap(DetectExtractSearchRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void DetectExtractSearchRequest::InternalSwap(DetectExtractSearchRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(detect_request_, other->detect_request_);
+  swap(extract_request_, other->extract_request_);
+  swap(search_request_, other->search_request_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractSearchRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void FaceStatusRequest::InitAsDefaultInstance() {
+}
+class FaceStatusRequest::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+FaceStatusRequest::FaceStatusRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:FaceStatusRequest)
+}
+FaceStatusRequest::FaceStatusRequest(const FaceStatusRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  // @@protoc_insertion_point(copy_constructor:FaceStatusRequest)
+}
+
+void FaceStatusRequest::SharedCtor() {
+}
+
+FaceStatusRequest::~FaceStatusRequest() {
+  // @@protoc_insertion_point(destructor:FaceStatusRequest)
+  SharedDtor();
+}
+
+void FaceStatusRequest::SharedDtor() {
+}
+
+void FaceStatusRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const FaceStatusRequest& FaceStatusRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_FaceStatusRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void FaceStatusRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:FaceStatusRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* FaceStatusRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      default: {
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool FaceStatusRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:FaceStatusRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+  handle_unusual:
+    if (tag == 0) {
+      goto success;
+    }
+    DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+          input, tag, _internal_metadata_.mutable_unknown_fields()));
+  }
+success:
+  // @@protoc_insertion_point(parse_success:FaceStatusRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:FaceStatusRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void FaceStatusRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:FaceStatusRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:FaceStatusRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* FaceStatusRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:FaceStatusRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:FaceStatusRequest)
+  return target;
+}
+
+size_t FaceStatusRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:FaceStatusRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void FaceStatusRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:FaceStatusRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const FaceStatusRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<FaceStatusRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:FaceStatusRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:FaceStatusRequest)
+    MergeFrom(*source);
+  }
+}
+
+void FaceStatusRequest::MergeFrom(const FaceStatusRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:FaceStatusRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+}
+
+void FaceStatusRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:FaceStatusRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void FaceStatusRequest::CopyFrom(const FaceStatusRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:FaceStatusRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool FaceStatusRequest::IsInitialized() const {
+  return true;
+}
+
+void FaceStatusRequest::Swap(FaceStatusRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void FaceStatusRequest::InternalSwap(FaceStatusRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata FaceStatusRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void FaceServiceInfo::InitAsDefaultInstance() {
+  ::_FaceServiceInfo_default_instance_._instance.get_mutable()->gallery_cache_ = const_cast< ::GalleryCacheStats*>(
+      ::GalleryCacheStats::internal_default_instance());
+}
+class FaceServiceInfo::HasBitSetters {
+ public:
+  static const ::GalleryCacheStats& gallery_cache(const FaceServiceInfo* msg);
+};
+
+const ::GalleryCacheStats&
+FaceServiceInfo::HasBitSetters::gallery_cache(const FaceServiceInfo* msg) {
+  return *msg->gallery_cache_;
+}
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int FaceServiceInfo::kStatusFieldNumber;
+const int FaceServiceInfo::kWorkerCountFieldNumber;
+const int FaceServiceInfo::kDetectionSupportFieldNumber;
+const int FaceServiceInfo::kExtractSupportFieldNumber;
+const int FaceServiceInfo::kScoreSupportFieldNumber;
+const int FaceServiceInfo::kAttributeSupportFieldNumber;
+const int FaceServiceInfo::kScoreTypeFieldNumber;
+const int FaceServiceInfo::kDetectionThresholdFieldNumber;
+const int FaceServiceInfo::kMatchThresholdFieldNumber;
+const int FaceServiceInfo::kAlgorithmFieldNumber;
+const int FaceServiceInfo::kNotesFieldNumber;
+const int FaceServiceInfo::kFaroVersionFieldNumber;
+const int FaceServiceInfo::kInstanceNameFieldNumber;
+const int FaceServiceInfo::kGalleryCacheFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+FaceServiceInfo::FaceServiceInfo()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:FaceServiceInfo)
+}
+FaceServiceInfo::FaceServiceInfo(const FaceServiceInfo& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.algorithm().size() > 0) {
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
+  notes_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.notes().size() > 0) {
+    notes_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.notes_);
+  }
+  faro_version_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.faro_version().size() > 0) {
+    faro_version_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.faro_version_);
+  }
+  instance_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.instance_name().size() > 0) {
+    instance_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.instance_name_);
+  }
+  if (from.has_gallery_cache()) {
+    gallery_cache_ = new ::GalleryCacheStats(*from.gallery_cache_);
+  } else {
+    gallery_cache_ = nullptr;
+  }
+  ::memcpy(&status_, &from.status_,
+    static_cast<size_t>(reinterpret_cast<char*>(&match_threshold_) -
+    reinterpret_cast<char*>(&status_)) + sizeof(match_threshold_));
+  // @@protoc_insertion_point(copy_constructor:FaceServiceInfo)
+}
+
+void FaceServiceInfo::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto.base);
+  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  notes_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  faro_version_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  instance_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&gallery_cache_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&match_threshold_) -
+      reinterpret_cast<char*>(&gallery_cache_)) + sizeof(match_threshold_));
+}
+
+FaceServiceInfo::~FaceServiceInfo() {
+  // @@protoc_insertion_point(destructor:FaceServiceInfo)
+  SharedDtor();
+}
+
+void FaceServiceInfo::SharedDtor() {
+  algorithm_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  notes_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  faro_version_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  instance_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (this != internal_default_instance()) delete gallery_cache_;
+}
+
+void FaceServiceInfo::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const FaceServiceInfo& FaceServiceInfo::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void FaceServiceInfo::Clear() {
+// @@protoc_insertion_point(message_clear_start:FaceServiceInfo)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  faro_version_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  instance_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (GetArenaNoVirtual() == nullptr && gallery_cache_ != nullptr) {
+    delete gallery_cache_;
+  }
+  gallery_cache_ = nullptr;
+  ::memset(&status_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&match_threshold_) -
+      reinterpret_cast<char*>(&status_)) + sizeof(match_threshold_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* FaceServiceInfo::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // .ServiceStatus status = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          ::PROTOBUF_NAMESPACE_ID::uint64 val = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+          set_status(static_cast<::ServiceStatus>(val));
+        } else goto handle_unusual;
+        continue;
+      // int32 worker_count = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          worker_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bool detection_support = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          detection_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bool extract_support = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          extract_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bool score_support = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          score_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bool attribute_support = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
+          attribute_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .ScoreType score_type = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 56)) {
+          ::PROTOBUF_NAMESPACE_ID::uint64 val = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+          set_score_type(static_cast<::ScoreType>(val));
+        } else goto handle_unusual;
+        continue;
+      // float detection_threshold = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 69)) {
+          detection_threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // float match_threshold = 9;
+      case 9:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 77)) {
+          match_threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
+      // string algorithm = 10;
+      case 10:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 82)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_algorithm(), ptr, ctx, "FaceServiceInfo.algorithm");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string notes = 11;
+      case 11:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 90)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_notes(), ptr, ctx, "FaceServiceInfo.notes");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string faro_version = 12;
+      case 12:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 98)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_faro_version(), ptr, ctx, "FaceServiceInfo.faro_version");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string instance_name = 13;
+      case 13:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 106)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_instance_name(), ptr, ctx, "FaceServiceInfo.instance_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // .GalleryCacheStats gallery_cache = 14;
+      case 14:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 114)) {
+          ptr = ctx->ParseMessage(mutable_gallery_cache(), ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool FaceServiceInfo::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:FaceServiceInfo)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // .ServiceStatus status = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+          int value = 0;
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   int, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_ENUM>(
+                 input, &value)));
+          set_status(static_cast< ::ServiceStatus >(value));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 worker_count = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &worker_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool detection_support = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &detection_support_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool extract_support = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &extract_support_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool score_support = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &score_support_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool attribute_support = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &attribute_support_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .ScoreType score_type = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (56 & 0xFF)) {
+          int value = 0;
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   int, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_ENUM>(
+                 input, &value)));
+          set_score_type(static_cast< ::ScoreType >(value));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float detection_threshold = 8;
+      case 8: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (69 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &detection_threshold_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float match_threshold = 9;
+      case 9: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (77 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &match_threshold_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string algorithm = 10;
+      case 10: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (82 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_algorithm()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceServiceInfo.algorithm"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string notes = 11;
+      case 11: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (90 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_notes()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->notes().data(), static_cast<int>(this->notes().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceServiceInfo.notes"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string faro_version = 12;
+      case 12: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (98 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_faro_version()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->faro_version().data(), static_cast<int>(this->faro_version().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceServiceInfo.faro_version"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string instance_name = 13;
+      case 13: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (106 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_instance_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->instance_name().data(), static_cast<int>(this->instance_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "FaceServiceInfo.instance_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // .GalleryCacheStats gallery_cache = 14;
+      case 14: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (114 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_gallery_cache()));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:FaceServiceInfo)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:FaceServiceInfo)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void FaceServiceInfo::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:FaceServiceInfo)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .ServiceStatus status = 1;
+  if (this->status() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnum(
+      1, this->status(), output);
+  }
+
+  // int32 worker_count = 2;
+  if (this->worker_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(2, this->worker_count(), output);
+  }
+
+  // bool detection_support = 3;
+  if (this->detection_support() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(3, this->detection_support(), output);
+  }
+
+  // bool extract_support = 4;
+  if (this->extract_support() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(4, this->extract_support(), output);
+  }
+
+  // bool score_support = 5;
+  if (this->score_support() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(5, this->score_support(), output);
+  }
+
+  // bool attribute_support = 6;
+  if (this->attribute_support() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(6, this->attribute_support(), output);
+  }
+
+  // .ScoreType score_type = 7;
+  if (this->score_type() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnum(
+      7, this->score_type(), output);
+  }
+
+  // float detection_threshold = 8;
+  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(8, this->detection_threshold(), output);
+  }
+
+  // float match_threshold = 9;
+  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(9, this->match_threshold(), output);
+  }
+
+  // string algorithm = 10;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.algorithm");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      10, this->algorithm(), output);
+  }
+
+  // string notes = 11;
+  if (this->notes().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->notes().data(), static_cast<int>(this->notes().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.notes");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      11, this->notes(), output);
+  }
+
+  // string faro_version = 12;
+  if (this->faro_version().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->faro_version().data(), static_cast<int>(this->faro_version().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.faro_version");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      12, this->faro_version(), output);
+  }
+
+  // string instance_name = 13;
+  if (this->instance_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->instance_name().data(), static_cast<int>(this->instance_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.instance_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      13, this->instance_name(), output);
+  }
+
+  // .GalleryCacheStats gallery_cache = 14;
+  if (this->has_gallery_cache()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      14, HasBitSetters::gallery_cache(this), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:FaceServiceInfo)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* FaceServiceInfo::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:FaceServiceInfo)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // .ServiceStatus status = 1;
+  if (this->status() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnumToArray(
+      1, this->status(), target);
+  }
+
+  // int32 worker_count = 2;
+  if (this->worker_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(2, this->worker_count(), target);
+  }
+
+  // bool detection_support = 3;
+  if (this->detection_support() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(3, this->detection_support(), target);
+  }
+
+  // bool extract_support = 4;
+  if (this->extract_support() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(4, this->extract_support(), target);
+  }
+
+  // bool score_support = 5;
+  if (this->score_support() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(5, this->score_support(), target);
+  }
+
+  // bool attribute_support = 6;
+  if (this->attribute_support() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(6, this->attribute_support(), target);
+  }
+
+  // .ScoreType score_type = 7;
+  if (this->score_type() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnumToArray(
+      7, this->score_type(), target);
+  }
+
+  // float detection_threshold = 8;
+  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(8, this->detection_threshold(), target);
+  }
+
+  // float match_threshold = 9;
+  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(9, this->match_threshold(), target);
+  }
+
+  // string algorithm = 10;
+  if (this->algorithm().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.algorithm");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        10, this->algorithm(), target);
+  }
+
+  // string notes = 11;
+  if (this->notes().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->notes().data(), static_cast<int>(this->notes().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.notes");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        11, this->notes(), target);
+  }
+
+  // string faro_version = 12;
+  if (this->faro_version().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->faro_version().data(), static_cast<int>(this->faro_version().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.faro_version");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        12, this->faro_version(), target);
+  }
+
+  // string instance_name = 13;
+  if (this->instance_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->instance_name().data(), static_cast<int>(this->instance_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "FaceServiceInfo.instance_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        13, this->instance_name(), target);
+  }
+
+  // .GalleryCacheStats gallery_cache = 14;
+  if (this->has_gallery_cache()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        14, HasBitSetters::gallery_cache(this), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:FaceServiceInfo)
+  return target;
+}
+
+size_t FaceServiceInfo::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:FaceServiceInfo)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string algorithm = 10;
+  if (this->algorithm().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->algorithm());
+  }
+
+  // string notes = 11;
+  if (this->notes().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->notes());
+  }
+
+  // string faro_version = 12;
+  if (this->faro_version().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->faro_version());
+  }
+
+  // string instance_name = 13;
+  if (this->instance_name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->instance_name());
+  }
+
+  // .GalleryCacheStats gallery_cache = 14;
+  if (this->has_gallery_cache()) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *gallery_cache_);
+  }
+
+  // .ServiceStatus status = 1;
+  if (this->status() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::EnumSize(this->status());
+  }
+
+  // int32 worker_count = 2;
+  if (this->worker_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->worker_count());
+  }
+
+  // bool detection_support = 3;
+  if (this->detection_support() != 0) {
+    total_size += 1 + 1;
+  }
+
+  // bool extract_support = 4;
+  if (this->extract_support() != 0) {
+    total_size += 1 + 1;
+  }
+
+  // bool score_support = 5;
+  if (this->score_support() != 0) {
+    total_size += 1 + 1;
+  }
+
+  // bool attribute_support = 6;
+  if (this->attribute_support() != 0) {
+    total_size += 1 + 1;
+  }
+
+  // .ScoreType score_type = 7;
+  if (this->score_type() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::EnumSize(this->score_type());
+  }
+
+  // float detection_threshold = 8;
+  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  // float match_threshold = 9;
+  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
+    total_size += 1 + 4;
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void FaceServiceInfo::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:FaceServiceInfo)
+  GOOGLE_DCHECK_NE(&from, this);
+  const FaceServiceInfo* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<FaceServiceInfo>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:FaceServiceInfo)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:FaceServiceInfo)
+    MergeFrom(*source);
+  }
+}
+
+void FaceServiceInfo::MergeFrom(const FaceServiceInfo& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:FaceServiceInfo)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.algorithm().size() > 0) {
+
+    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  }
+  if (from.notes().size() > 0) {
+
+    notes_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.notes_);
+  }
+  if (from.faro_version().size() > 0) {
+
+    faro_version_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.faro_version_);
+  }
+  if (from.instance_name().size() > 0) {
+
+    instance_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.instance_name_);
+  }
+  if (from.has_gallery_cache()) {
+    mutable_gallery_cache()->::GalleryCacheStats::MergeFrom(from.gallery_cache());
+  }
+  if (from.status() != 0) {
+    set_status(from.status());
+  }
+  if (from.worker_count() != 0) {
+    set_worker_count(from.worker_count());
+  }
+  if (from.detection_support() != 0) {
+    set_detection_support(from.detection_support());
+  }
+  if (from.extract_support() != 0) {
+    set_extract_support(from.extract_support());
+  }
+  if (from.score_support() != 0) {
+    set_score_support(from.score_support());
+  }
+  if (from.attribute_support() != 0) {
+    set_attribute_support(from.attribute_support());
+  }
+  if (from.score_type() != 0) {
+    set_score_type(from.score_type());
+  }
+  if (!(from.detection_threshold() <= 0 && from.detection_threshold() >= 0)) {
+    set_detection_threshold(from.detection_threshold());
+  }
+  if (!(from.match_threshold() <= 0 && from.match_threshold() >= 0)) {
+    set_match_threshold(from.match_threshold());
+  }
+}
+
+void FaceServiceInfo::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:FaceServiceInfo)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void FaceServiceInfo::CopyFrom(const FaceServiceInfo& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:FaceServiceInfo)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool FaceServiceInfo::IsInitialized() const {
+  return true;
+}
+
+void FaceServiceInfo::Swap(FaceServiceInfo* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void FaceServiceInfo::InternalSwap(FaceServiceInfo* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  algorithm_.Swap(&other->algorithm_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  notes_.Swap(&other->notes_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  faro_version_.Swap(&other->faro_version_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  instance_name_.Swap(&other->instance_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(gallery_cache_, other->gallery_cache_);
+  swap(status_, other->status_);
+  swap(worker_count_, other->worker_count_);
+  swap(detection_support_, other->detection_support_);
+  swap(extract_support_, other->extract_support_);
+  swap(score_support_, other->score_support_);
+  swap(attribute_support_, other->attribute_support_);
+  swap(score_type_, other->score_type_);
+  swap(detection_threshold_, other->detection_threshold_);
+  swap(match_threshold_, other->match_threshold_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata FaceServiceInfo::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void GalleryCacheStats::InitAsDefaultInstance() {
+}
+class GalleryCacheStats::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int GalleryCacheStats::kOpenGalleriesFieldNumber;
+const int GalleryCacheStats::kPinnedGalleriesFieldNumber;
+const int GalleryCacheStats::kOpenBytesFieldNumber;
+const int GalleryCacheStats::kMaxOpenFieldNumber;
+const int GalleryCacheStats::kMaxBytesFieldNumber;
+const int GalleryCacheStats::kHitsFieldNumber;
+const int GalleryCacheStats::kMissesFieldNumber;
+const int GalleryCacheStats::kEvictionsFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+GalleryCacheStats::GalleryCacheStats()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:GalleryCacheStats)
+}
+GalleryCacheStats::GalleryCacheStats(const GalleryCacheStats& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::memcpy(&open_galleries_, &from.open_galleries_,
+    static_cast<size_t>(reinterpret_cast<char*>(&evictions_) -
+    reinterpret_cast<char*>(&open_galleries_)) + sizeof(evictions_));
+  // @@protoc_insertion_point(copy_constructor:GalleryCacheStats)
+}
+
+void GalleryCacheStats::SharedCtor() {
+  ::memset(&open_galleries_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&evictions_) -
+      reinterpret_cast<char*>(&open_galleries_)) + sizeof(evictions_));
+}
+
+GalleryCacheStats::~GalleryCacheStats() {
+  // @@protoc_insertion_point(destructor:GalleryCacheStats)
+  SharedDtor();
+}
+
+void GalleryCacheStats::SharedDtor() {
+}
+
+void GalleryCacheStats::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const GalleryCacheStats& GalleryCacheStats::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryCacheStats_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void GalleryCacheStats::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryCacheStats)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  ::memset(&open_galleries_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&evictions_) -
+      reinterpret_cast<char*>(&open_galleries_)) + sizeof(evictions_));
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* GalleryCacheStats::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // int64 open_galleries = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          open_galleries_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 pinned_galleries = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          pinned_galleries_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 open_bytes = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          open_bytes_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 max_open = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          max_open_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 max_bytes = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          max_bytes_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 hits = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
+          hits_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 misses = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 56)) {
+          misses_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 evictions = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 64)) {
+          evictions_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool GalleryCacheStats::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:GalleryCacheStats)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // int64 open_galleries = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &open_galleries_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 pinned_galleries = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &pinned_galleries_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 open_bytes = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &open_bytes_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 max_open = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &max_open_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 max_bytes = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &max_bytes_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 hits = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &hits_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 misses = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (56 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &misses_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 evictions = 8;
+      case 8: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (64 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &evictions_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:GalleryCacheStats)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:GalleryCacheStats)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void GalleryCacheStats::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:GalleryCacheStats)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 open_galleries = 1;
+  if (this->open_galleries() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(1, this->open_galleries(), output);
+  }
+
+  // int64 pinned_galleries = 2;
+  if (this->pinned_galleries() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->pinned_galleries(), output);
+  }
+
+  // int64 open_bytes = 3;
+  if (this->open_bytes() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->open_bytes(), output);
+  }
+
+  // int64 max_open = 4;
+  if (this->max_open() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->max_open(), output);
+  }
+
+  // int64 max_bytes = 5;
+  if (this->max_bytes() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(5, this->max_bytes(), output);
+  }
+
+  // int64 hits = 6;
+  if (this->hits() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(6, this->hits(), output);
+  }
+
+  // int64 misses = 7;
+  if (this->misses() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(7, this->misses(), output);
+  }
+
+  // int64 evictions = 8;
+  if (this->evictions() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(8, this->evictions(), output);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:GalleryCacheStats)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryCacheStats::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryCacheStats)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // int64 open_galleries = 1;
+  if (this->open_galleries() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(1, this->open_galleries(), target);
+  }
+
+  // int64 pinned_galleries = 2;
+  if (this->pinned_galleries() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->pinned_galleries(), target);
+  }
+
+  // int64 open_bytes = 3;
+  if (this->open_bytes() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->open_bytes(), target);
+  }
+
+  // int64 max_open = 4;
+  if (this->max_open() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->max_open(), target);
+  }
+
+  // int64 max_bytes = 5;
+  if (this->max_bytes() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(5, this->max_bytes(), target);
+  }
+
+  // int64 hits = 6;
+  if (this->hits() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(6, this->hits(), target);
+  }
+
+  // int64 misses = 7;
+  if (this->misses() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(7, this->misses(), target);
+  }
+
+  // int64 evictions = 8;
+  if (this->evictions() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(8, this->evictions(), target);
+  }
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryCacheStats)
+  return target;
+}
+
+size_t GalleryCacheStats::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryCacheStats)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // int64 open_galleries = 1;
+  if (this->open_galleries() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->open_galleries());
+  }
+
+  // int64 pinned_galleries = 2;
+  if (this->pinned_galleries() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->pinned_galleries());
+  }
+
+  // int64 open_bytes = 3;
+  if (this->open_bytes() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->open_bytes());
+  }
+
+  // int64 max_open = 4;
+  if (this->max_open() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->max_open());
+  }
+
+  // int64 max_bytes = 5;
+  if (this->max_bytes() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->max_bytes());
+  }
+
+  // int64 hits = 6;
+  if (this->hits() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->hits());
+  }
+
+  // int64 misses = 7;
+  if (this->misses() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->misses());
+  }
+
+  // int64 evictions = 8;
+  if (this->evictions() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->evictions());
+  }
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void GalleryCacheStats::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryCacheStats)
+  GOOGLE_DCHECK_NE(&from, this);
+  const GalleryCacheStats* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryCacheStats>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryCacheStats)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryCacheStats)
+    MergeFrom(*source);
+  }
+}
+
+void GalleryCacheStats::MergeFrom(const GalleryCacheStats& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryCacheStats)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (from.open_galleries() != 0) {
+    set_open_galleries(from.open_galleries());
+  }
+  if (from.pinned_galleries() != 0) {
+    set_pinned_galleries(from.pinned_galleries());
+  }
+  if (from.open_bytes() != 0) {
+    set_open_bytes(from.open_bytes());
+  }
+  if (from.max_open() != 0) {
+    set_max_open(from.max_open());
+  }
+  if (from.max_bytes() != 0) {
+    set_max_bytes(from.max_bytes());
+  }
+  if (from.hits() != 0) {
+    set_hits(from.hits());
+  }
+  if (from.misses() != 0) {
+    set_misses(from.misses());
+  }
+  if (from.evictions() != 0) {
+    set_evictions(from.evictions());
+  }
+}
+
+void GalleryCacheStats::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryCacheStats)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void GalleryCacheStats::CopyFrom(const GalleryCacheStats& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryCacheStats)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool GalleryCacheStats::IsInitialized() const {
+  return true;
+}
+
+void GalleryCacheStats::Swap(GalleryCacheStats* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void GalleryCacheStats::InternalSwap(GalleryCacheStats* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+  swap(open_galleries_, other->open_galleries_);
+  swap(pinned_galleries_, other->pinned_galleries_);
+  swap(open_bytes_, other->open_bytes_);
+  swap(max_open_, other->max_open_);
+  swap(max_bytes_, other->max_bytes_);
+  swap(hits_, other->hits_);
+  swap(misses_, other->misses_);
+  swap(evictions_, other->evictions_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryCacheStats::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void GalleryListRequest::InitAsDefaultInstance() {
+}
+class GalleryListRequest::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+GalleryListRequest::GalleryListRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:GalleryListRequest)
+}
+GalleryListRequest::GalleryListRequest(const GalleryListRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  // @@protoc_insertion_point(copy_constructor:GalleryListRequest)
+}
+
+void GalleryListRequest::SharedCtor() {
+}
+
+GalleryListRequest::~GalleryListRequest() {
+  // @@protoc_insertion_point(destructor:GalleryListRequest)
+  SharedDtor();
+}
+
+void GalleryListRequest::SharedDtor() {
+}
+
+void GalleryListRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const GalleryListRequest& GalleryListRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void GalleryListRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryListRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* GalleryListRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      default: {
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool GalleryListRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:GalleryListRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+  handle_unusual:
+    if (tag == 0) {
+      goto success;
+    }
+    DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+          input, tag, _internal_metadata_.mutable_unknown_fields()));
+  }
+success:
+  // @@protoc_insertion_point(parse_success:GalleryListRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:GalleryListRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void GalleryListRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:GalleryListRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
+  }
+  // @@protoc_insertion_point(serialize_end:GalleryListRequest)
+}
+
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryListRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryListRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields(), target);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryListRequest)
+  return target;
+}
+
+size_t GalleryListRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryListRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
+  }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
+  SetCachedSize(cached_size);
+  return total_size;
+}
+
+void GalleryListRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryListRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  const GalleryListRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryListRequest>(
+          &from);
+  if (source == nullptr) {
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryListRequest)
+    ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
+  } else {
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryListRequest)
+    MergeFrom(*source);
+  }
+}
+
+void GalleryListRequest::MergeFrom(const GalleryListRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryListRequest)
+  GOOGLE_DCHECK_NE(&from, this);
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+}
+
+void GalleryListRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryListRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+void GalleryListRequest::CopyFrom(const GalleryListRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryListRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool GalleryListRequest::IsInitialized() const {
+  return true;
+}
+
+void GalleryListRequest::Swap(GalleryListRequest* other) {
+  if (other == this) return;
+  InternalSwap(other);
+}
+void GalleryListRequest::InternalSwap(GalleryListRequest* other) {
+  using std::swap;
+  _internal_metadata_.Swap(&other->_internal_metadata_);
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryListRequest::GetMetadata() const {
+  return GetMetadataStatic();
+}
+
+
+// ===================================================================
+
+void GalleryDeleteRequest::InitAsDefaultInstance() {
+}
+class GalleryDeleteRequest::HasBitSetters {
+ public:
+};
+
+#if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int GalleryDeleteRequest::kGalleryNameFieldNumber;
+#endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
+
+GalleryDeleteRequest::GalleryDeleteRequest()
+  : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
+  SharedCtor();
+  // @@protoc_insertion_point(constructor:GalleryDeleteRequest)
+}
+GalleryDeleteRequest::GalleryDeleteRequest(const GalleryDeleteRequest& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message(),
+      _internal_metadata_(nullptr) {
+  _internal_metadata_.MergeFrom(from._internal_metadata_);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  // @@protoc_insertion_point(copy_constructor:GalleryDeleteRequest)
+}
+
+void GalleryDeleteRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+
+GalleryDeleteRequest::~GalleryDeleteRequest() {
+  // @@protoc_insertion_point(destructor:GalleryDeleteRequest)
+  SharedDtor();
+}
+
+void GalleryDeleteRequest::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+
+void GalleryDeleteRequest::SetCachedSize(int size) const {
+  _cached_size_.Set(size);
+}
+const GalleryDeleteRequest& GalleryDeleteRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  return *internal_default_instance();
+}
+
+
+void GalleryDeleteRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryDeleteRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  _internal_metadata_.Clear();
+}
+
+#if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+const char* GalleryDeleteRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  while (!ctx->Done(&ptr)) {
+    ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+    ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
+    CHK_(ptr);
+    switch (tag >> 3) {
+      // string gallery_name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryDeleteRequest.gallery_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool GalleryDeleteRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:GalleryDeleteRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // string gallery_name = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryDeleteRequest.gallery_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
+    }
+  }
+success:
+  // @@protoc_insertion_point(parse_success:GalleryDeleteRequest)
+  return true;
+failure:
+  // @@protoc_insertion_point(parse_failure:GalleryDeleteRequest)
+  return false;
+#undef DO_
+}
+#endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+
+void GalleryDeleteRequest::SerializeWithCachedSizes(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
+  // @@protoc_insertion_point(serialize_start:GalleryDeleteRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryDeleteRequest.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
   }
 
-  // .FaceRecordList face_gallery = 2;
-  if (this->has_face_gallery()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, HasBitSetters::face_gallery(this), target);
+  if (_internal_metadata_.have_unknown_fields()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
+        _internal_metadata_.unknown_fields(), output);
   }
+  // @@protoc_insertion_point(serialize_end:GalleryDeleteRequest)
+}
 
-  // .TemplateList template_probes = 3;
-  if (this->has_template_probes()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        3, HasBitSetters::template_probes(this), target);
-  }
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryDeleteRequest::InternalSerializeWithCachedSizesToArray(
+    ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryDeleteRequest)
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  (void) cached_has_bits;
 
-  // .TemplateList template_gallery = 4;
-  if (this->has_template_gallery()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        4, HasBitSetters::template_gallery(this), target);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryDeleteRequest.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:ScoreRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryDeleteRequest)
   return target;
 }
 
-size_t ScoreRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:ScoreRequest)
+size_t GalleryDeleteRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryDeleteRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -12725,32 +20448,11 @@ size_t ScoreRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // .FaceRecordList face_probes = 1;
-  if (this->has_face_probes()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *face_probes_);
-  }
-
-  // .FaceRecordList face_gallery = 2;
-  if (this->has_face_gallery()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *face_gallery_);
-  }
-
-  // .TemplateList template_probes = 3;
-  if (this->has_template_probes()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *template_probes_);
-  }
-
-  // .TemplateList template_gallery = 4;
-  if (this->has_template_gallery()) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *template_gallery_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -12758,189 +20460,156 @@ size_t ScoreRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void ScoreRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:ScoreRequest)
+void GalleryDeleteRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryDeleteRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const ScoreRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<ScoreRequest>(
+  const GalleryDeleteRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryDeleteRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:ScoreRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryDeleteRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:ScoreRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryDeleteRequest)
     MergeFrom(*source);
   }
 }
 
-void ScoreRequest::MergeFrom(const ScoreRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:ScoreRequest)
+void GalleryDeleteRequest::MergeFrom(const GalleryDeleteRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryDeleteRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_face_probes()) {
-    mutable_face_probes()->::FaceRecordList::MergeFrom(from.face_probes());
-  }
-  if (from.has_face_gallery()) {
-    mutable_face_gallery()->::FaceRecordList::MergeFrom(from.face_gallery());
-  }
-  if (from.has_template_probes()) {
-    mutable_template_probes()->::TemplateList::MergeFrom(from.template_probes());
-  }
-  if (from.has_template_gallery()) {
-    mutable_template_gallery()->::TemplateList::MergeFrom(from.template_gallery());
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
 }
 
-void ScoreRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:ScoreRequest)
+void GalleryDeleteRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryDeleteRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void ScoreRequest::CopyFrom(const ScoreRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:ScoreRequest)
+void GalleryDeleteRequest::CopyFrom(const GalleryDeleteRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryDeleteRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool ScoreRequest::IsInitialized() const {
+bool GalleryDeleteRequest::IsInitialized() const {
   return true;
 }
 
-void ScoreRequest::Swap(ScoreRequest* other) {
+void GalleryDeleteRequest::Swap(GalleryDeleteRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void ScoreRequest::InternalSwap(ScoreRequest* other) {
+void GalleryDeleteRequest::InternalSwap(GalleryDeleteRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(face_probes_, other->face_probes_);
-  swap(face_gallery_, other->face_gallery_);
-  swap(template_probes_, other->template_probes_);
-  swap(template_gallery_, other->template_gallery_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata ScoreRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryDeleteRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void DetectExtractRequest::InitAsDefaultInstance() {
-  ::_DetectExtractRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
-      ::DetectRequest::internal_default_instance());
-  ::_DetectExtractRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
-      ::ExtractRequest::internal_default_instance());
+void GalleryConfigureRequest::InitAsDefaultInstance() {
 }
-class DetectExtractRequest::HasBitSetters {
+class GalleryConfigureRequest::HasBitSetters {
  public:
-  static const ::DetectRequest& detect_request(const DetectExtractRequest* msg);
-  static const ::ExtractRequest& extract_request(const DetectExtractRequest* msg);
 };
 
-const ::DetectRequest&
-DetectExtractRequest::HasBitSetters::detect_request(const DetectExtractRequest* msg) {
-  return *msg->detect_request_;
-}
-const ::ExtractRequest&
-DetectExtractRequest::HasBitSetters::extract_request(const DetectExtractRequest* msg) {
-  return *msg->extract_request_;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int DetectExtractRequest::kDetectRequestFieldNumber;
-const int DetectExtractRequest::kExtractRequestFieldNumber;
+const int GalleryConfigureRequest::kGalleryNameFieldNumber;
+const int GalleryConfigureRequest::kIndexQuantizationFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-DetectExtractRequest::DetectExtractRequest()
+GalleryConfigureRequest::GalleryConfigureRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:DetectExtractRequest)
+  // @@protoc_insertion_point(constructor:GalleryConfigureRequest)
 }
-DetectExtractRequest::DetectExtractRequest(const DetectExtractRequest& from)
+GalleryConfigureRequest::GalleryConfigureRequest(const GalleryConfigureRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_detect_request()) {
-    detect_request_ = new ::DetectRequest(*from.detect_request_);
-  } else {
-    detect_request_ = nullptr;
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  if (from.has_extract_request()) {
-    extract_request_ = new ::ExtractRequest(*from.extract_request_);
-  } else {
-    extract_request_ = nullptr;
+  index_quantization_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.index_quantization().size() > 0) {
+    index_quantization_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.index_quantization_);
   }
-  // @@protoc_insertion_point(copy_constructor:DetectExtractRequest)
+  // @@protoc_insertion_point(copy_constructor:GalleryConfigureRequest)
 }
 
-void DetectExtractRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&detect_request_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&extract_request_) -
-      reinterpret_cast<char*>(&detect_request_)) + sizeof(extract_request_));
+void GalleryConfigureRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  index_quantization_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-DetectExtractRequest::~DetectExtractRequest() {
-  // @@protoc_insertion_point(destructor:DetectExtractRequest)
+GalleryConfigureRequest::~GalleryConfigureRequest() {
+  // @@protoc_insertion_point(destructor:GalleryConfigureRequest)
   SharedDtor();
 }
 
-void DetectExtractRequest::SharedDtor() {
-  if (this != internal_default_instance()) delete detect_request_;
-  if (this != internal_default_instance()) delete extract_request_;
+void GalleryConfigureRequest::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  index_quantization_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void DetectExtractRequest::SetCachedSize(int size) const {
+void GalleryConfigureRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const DetectExtractRequest& DetectExtractRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryConfigureRequest& GalleryConfigureRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryConfigureRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void DetectExtractRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:DetectExtractRequest)
+void GalleryConfigureRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryConfigureRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  index_quantization_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* DetectExtractRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryConfigureRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryConfigureRequest.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .ExtractRequest extract_request = 2;
+      // string index_quantization = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_index_quantization(), ptr, ctx, "GalleryConfigureRequest.index_quantization");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -12964,32 +20633,40 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool DetectExtractRequest::MergePartialFromCodedStream(
+bool GalleryConfigureRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:DetectExtractRequest)
+  // @@protoc_insertion_point(parse_start:GalleryConfigureRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_detect_request()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryConfigureRequest.gallery_name"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .ExtractRequest extract_request = 2;
+      // string index_quantization = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_extract_request()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_index_quantization()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->index_quantization().data(), static_cast<int>(this->index_quantization().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryConfigureRequest.index_quantization"));
         } else {
           goto handle_unusual;
         }
@@ -13008,70 +20685,86 @@ bool DetectExtractRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:DetectExtractRequest)
+  // @@protoc_insertion_point(parse_success:GalleryConfigureRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:DetectExtractRequest)
+  // @@protoc_insertion_point(parse_failure:GalleryConfigureRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void DetectExtractRequest::SerializeWithCachedSizes(
+void GalleryConfigureRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:DetectExtractRequest)
+  // @@protoc_insertion_point(serialize_start:GalleryConfigureRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::detect_request(this), output);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryConfigureRequest.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::extract_request(this), output);
+  // string index_quantization = 2;
+  if (this->index_quantization().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->index_quantization().data(), static_cast<int>(this->index_quantization().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryConfigureRequest.index_quantization");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->index_quantization(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:DetectExtractRequest)
+  // @@protoc_insertion_point(serialize_end:GalleryConfigureRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryConfigureRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryConfigureRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        1, HasBitSetters::detect_request(this), target);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryConfigureRequest.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, HasBitSetters::extract_request(this), target);
+  // string index_quantization = 2;
+  if (this->index_quantization().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->index_quantization().data(), static_cast<int>(this->index_quantization().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryConfigureRequest.index_quantization");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->index_quantization(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryConfigureRequest)
   return target;
 }
 
-size_t DetectExtractRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:DetectExtractRequest)
+size_t GalleryConfigureRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryConfigureRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -13083,18 +20776,18 @@ size_t DetectExtractRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *detect_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
+  // string index_quantization = 2;
+  if (this->index_quantization().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *extract_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->index_quantization());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -13102,206 +20795,147 @@ size_t DetectExtractRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void DetectExtractRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractRequest)
+void GalleryConfigureRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryConfigureRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const DetectExtractRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractRequest>(
+  const GalleryConfigureRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryConfigureRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryConfigureRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryConfigureRequest)
     MergeFrom(*source);
   }
 }
 
-void DetectExtractRequest::MergeFrom(const DetectExtractRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractRequest)
+void GalleryConfigureRequest::MergeFrom(const GalleryConfigureRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryConfigureRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_detect_request()) {
-    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  if (from.has_extract_request()) {
-    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
+  if (from.index_quantization().size() > 0) {
+
+    index_quantization_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.index_quantization_);
   }
 }
 
-void DetectExtractRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractRequest)
+void GalleryConfigureRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryConfigureRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void DetectExtractRequest::CopyFrom(const DetectExtractRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractRequest)
+void GalleryConfigureRequest::CopyFrom(const GalleryConfigureRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryConfigureRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool DetectExtractRequest::IsInitialized() const {
+bool GalleryConfigureRequest::IsInitialized() const {
   return true;
 }
 
-void DetectExtractRequest::Swap(DetectExtractRequest* other) {
+void GalleryConfigureRequest::Swap(GalleryConfigureRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void DetectExtractRequest::InternalSwap(DetectExtractRequest* other) {
+void GalleryConfigureRequest::InternalSwap(GalleryConfigureRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(detect_request_, other->detect_request_);
-  swap(extract_request_, other->extract_request_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  index_quantization_.Swap(&other->index_quantization_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryConfigureRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void DetectExtractEnrollRequest::InitAsDefaultInstance() {
-  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
-      ::DetectRequest::internal_default_instance());
-  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
-      ::ExtractRequest::internal_default_instance());
-  ::_DetectExtractEnrollRequest_default_instance_._instance.get_mutable()->enroll_request_ = const_cast< ::EnrollRequest*>(
-      ::EnrollRequest::internal_default_instance());
+void GalleryCompactRequest::InitAsDefaultInstance() {
 }
-class DetectExtractEnrollRequest::HasBitSetters {
+class GalleryCompactRequest::HasBitSetters {
  public:
-  static const ::DetectRequest& detect_request(const DetectExtractEnrollRequest* msg);
-  static const ::ExtractRequest& extract_request(const DetectExtractEnrollRequest* msg);
-  static const ::EnrollRequest& enroll_request(const DetectExtractEnrollRequest* msg);
 };
 
-const ::DetectRequest&
-DetectExtractEnrollRequest::HasBitSetters::detect_request(const DetectExtractEnrollRequest* msg) {
-  return *msg->detect_request_;
-}
-const ::ExtractRequest&
-DetectExtractEnrollRequest::HasBitSetters::extract_request(const DetectExtractEnrollRequest* msg) {
-  return *msg->extract_request_;
-}
-const ::EnrollRequest&
-DetectExtractEnrollRequest::HasBitSetters::enroll_request(const DetectExtractEnrollRequest* msg) {
-  return *msg->enroll_request_;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int DetectExtractEnrollRequest::kDetectRequestFieldNumber;
-const int DetectExtractEnrollRequest::kExtractRequestFieldNumber;
-const int DetectExtractEnrollRequest::kEnrollRequestFieldNumber;
+const int GalleryCompactRequest::kGalleryNameFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-DetectExtractEnrollRequest::DetectExtractEnrollRequest()
+GalleryCompactRequest::GalleryCompactRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(constructor:GalleryCompactRequest)
 }
-DetectExtractEnrollRequest::DetectExtractEnrollRequest(const DetectExtractEnrollRequest& from)
+GalleryCompactRequest::GalleryCompactRequest(const GalleryCompactRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_detect_request()) {
-    detect_request_ = new ::DetectRequest(*from.detect_request_);
-  } else {
-    detect_request_ = nullptr;
-  }
-  if (from.has_extract_request()) {
-    extract_request_ = new ::ExtractRequest(*from.extract_request_);
-  } else {
-    extract_request_ = nullptr;
-  }
-  if (from.has_enroll_request()) {
-    enroll_request_ = new ::EnrollRequest(*from.enroll_request_);
-  } else {
-    enroll_request_ = nullptr;
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  // @@protoc_insertion_point(copy_constructor:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(copy_constructor:GalleryCompactRequest)
 }
 
-void DetectExtractEnrollRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&detect_request_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&enroll_request_) -
-      reinterpret_cast<char*>(&detect_request_)) + sizeof(enroll_request_));
+void GalleryCompactRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-DetectExtractEnrollRequest::~DetectExtractEnrollRequest() {
-  // @@protoc_insertion_point(destructor:DetectExtractEnrollRequest)
+GalleryCompactRequest::~GalleryCompactRequest() {
+  // @@protoc_insertion_point(destructor:GalleryCompactRequest)
   SharedDtor();
 }
 
-void DetectExtractEnrollRequest::SharedDtor() {
-  if (this != internal_default_instance()) delete detect_request_;
-  if (this != internal_default_instance()) delete extract_request_;
-  if (this != internal_default_instance()) delete enroll_request_;
+void GalleryCompactRequest::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void DetectExtractEnrollRequest::SetCachedSize(int size) const {
+void GalleryCompactRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const DetectExtractEnrollRequest& DetectExtractEnrollRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractEnrollRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryCompactRequest& GalleryCompactRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryCompactRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void DetectExtractEnrollRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:DetectExtractEnrollRequest)
+void GalleryCompactRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryCompactRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && enroll_request_ != nullptr) {
-    delete enroll_request_;
-  }
-  enroll_request_ = nullptr;
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* DetectExtractEnrollRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryCompactRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // .ExtractRequest extract_request = 2;
-      case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // .EnrollRequest enroll_request = 3;
-      case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
-          ptr = ctx->ParseMessage(mutable_enroll_request(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryCompactRequest.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -13325,43 +20959,25 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool DetectExtractEnrollRequest::MergePartialFromCodedStream(
+bool GalleryCompactRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(parse_start:GalleryCompactRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_detect_request()));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // .ExtractRequest extract_request = 2;
-      case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_extract_request()));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // .EnrollRequest enroll_request = 3;
-      case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_enroll_request()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryCompactRequest.gallery_name"));
         } else {
           goto handle_unusual;
         }
@@ -13380,113 +20996,81 @@ bool DetectExtractEnrollRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(parse_success:GalleryCompactRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(parse_failure:GalleryCompactRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void DetectExtractEnrollRequest::SerializeWithCachedSizes(
+void GalleryCompactRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(serialize_start:GalleryCompactRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::detect_request(this), output);
-  }
-
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::extract_request(this), output);
-  }
-
-  // .EnrollRequest enroll_request = 3;
-  if (this->has_enroll_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      3, HasBitSetters::enroll_request(this), output);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryCompactRequest.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(serialize_end:GalleryCompactRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractEnrollRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryCompactRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryCompactRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        1, HasBitSetters::detect_request(this), target);
-  }
-
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, HasBitSetters::extract_request(this), target);
-  }
-
-  // .EnrollRequest enroll_request = 3;
-  if (this->has_enroll_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        3, HasBitSetters::enroll_request(this), target);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryCompactRequest.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryCompactRequest)
   return target;
-}
-
-size_t DetectExtractEnrollRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:DetectExtractEnrollRequest)
-  size_t total_size = 0;
-
-  if (_internal_metadata_.have_unknown_fields()) {
-    total_size +=
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
-        _internal_metadata_.unknown_fields());
-  }
-  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
-  // Prevent compiler warnings about cached_has_bits being unused
-  (void) cached_has_bits;
-
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *detect_request_);
-  }
-
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *extract_request_);
+}
+
+size_t GalleryCompactRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryCompactRequest)
+  size_t total_size = 0;
+
+  if (_internal_metadata_.have_unknown_fields()) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::ComputeUnknownFieldsSize(
+        _internal_metadata_.unknown_fields());
   }
+  ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
 
-  // .EnrollRequest enroll_request = 3;
-  if (this->has_enroll_request()) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *enroll_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -13494,213 +21078,201 @@ size_t DetectExtractEnrollRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void DetectExtractEnrollRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractEnrollRequest)
+void GalleryCompactRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryCompactRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const DetectExtractEnrollRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractEnrollRequest>(
+  const GalleryCompactRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryCompactRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryCompactRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractEnrollRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryCompactRequest)
     MergeFrom(*source);
   }
 }
 
-void DetectExtractEnrollRequest::MergeFrom(const DetectExtractEnrollRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractEnrollRequest)
+void GalleryCompactRequest::MergeFrom(const GalleryCompactRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryCompactRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_detect_request()) {
-    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
-  }
-  if (from.has_extract_request()) {
-    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
-  }
-  if (from.has_enroll_request()) {
-    mutable_enroll_request()->::EnrollRequest::MergeFrom(from.enroll_request());
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
 }
 
-void DetectExtractEnrollRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractEnrollRequest)
+void GalleryCompactRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryCompactRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void DetectExtractEnrollRequest::CopyFrom(const DetectExtractEnrollRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractEnrollRequest)
+void GalleryCompactRequest::CopyFrom(const GalleryCompactRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryCompactRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool DetectExtractEnrollRequest::IsInitialized() const {
+bool GalleryCompactRequest::IsInitialized() const {
   return true;
 }
 
-void DetectExtractEnrollRequest::Swap(DetectExtractEnrollRequest* other) {
+void GalleryCompactRequest::Swap(GalleryCompactRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void DetectExtractEnrollRequest::InternalSwap(DetectExtractEnrollRequest* other) {
+void GalleryCompactRequest::InternalSwap(GalleryCompactRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(detect_request_, other->detect_request_);
-  swap(extract_request_, other->extract_request_);
-  swap(enroll_request_, other->enroll_request_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractEnrollRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryCompactRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void DetectExtractSearchRequest::InitAsDefaultInstance() {
-  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->detect_request_ = const_cast< ::DetectRequest*>(
-      ::DetectRequest::internal_default_instance());
-  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->extract_request_ = const_cast< ::ExtractRequest*>(
-      ::ExtractRequest::internal_default_instance());
-  ::_DetectExtractSearchRequest_default_instance_._instance.get_mutable()->search_request_ = const_cast< ::SearchRequest*>(
-      ::SearchRequest::internal_default_instance());
+void GalleryCompactResponse::InitAsDefaultInstance() {
 }
-class DetectExtractSearchRequest::HasBitSetters {
+class GalleryCompactResponse::HasBitSetters {
  public:
-  static const ::DetectRequest& detect_request(const DetectExtractSearchRequest* msg);
-  static const ::ExtractRequest& extract_request(const DetectExtractSearchRequest* msg);
-  static const ::SearchRequest& search_request(const DetectExtractSearchRequest* msg);
 };
 
-const ::DetectRequest&
-DetectExtractSearchRequest::HasBitSetters::detect_request(const DetectExtractSearchRequest* msg) {
-  return *msg->detect_request_;
-}
-const ::ExtractRequest&
-DetectExtractSearchRequest::HasBitSetters::extract_request(const DetectExtractSearchRequest* msg) {
-  return *msg->extract_request_;
-}
-const ::SearchRequest&
-DetectExtractSearchRequest::HasBitSetters::search_request(const DetectExtractSearchRequest* msg) {
-  return *msg->search_request_;
-}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int DetectExtractSearchRequest::kDetectRequestFieldNumber;
-const int DetectExtractSearchRequest::kExtractRequestFieldNumber;
-const int DetectExtractSearchRequest::kSearchRequestFieldNumber;
+const int GalleryCompactResponse::kGalleryNameFieldNumber;
+const int GalleryCompactResponse::kFaceCountFieldNumber;
+const int GalleryCompactResponse::kRowsRemovedFieldNumber;
+const int GalleryCompactResponse::kBytesBeforeFieldNumber;
+const int GalleryCompactResponse::kBytesAfterFieldNumber;
+const int GalleryCompactResponse::kBytesReclaimedFieldNumber;
+const int GalleryCompactResponse::kCompactTimeFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-DetectExtractSearchRequest::DetectExtractSearchRequest()
+GalleryCompactResponse::GalleryCompactResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(constructor:GalleryCompactResponse)
 }
-DetectExtractSearchRequest::DetectExtractSearchRequest(const DetectExtractSearchRequest& from)
+GalleryCompactResponse::GalleryCompactResponse(const GalleryCompactResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  if (from.has_detect_request()) {
-    detect_request_ = new ::DetectRequest(*from.detect_request_);
-  } else {
-    detect_request_ = nullptr;
-  }
-  if (from.has_extract_request()) {
-    extract_request_ = new ::ExtractRequest(*from.extract_request_);
-  } else {
-    extract_request_ = nullptr;
-  }
-  if (from.has_search_request()) {
-    search_request_ = new ::SearchRequest(*from.search_request_);
-  } else {
-    search_request_ = nullptr;
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  // @@protoc_insertion_point(copy_constructor:DetectExtractSearchRequest)
+  ::memcpy(&face_count_, &from.face_count_,
+    static_cast<size_t>(reinterpret_cast<char*>(&compact_time_) -
+    reinterpret_cast<char*>(&face_count_)) + sizeof(compact_time_));
+  // @@protoc_insertion_point(copy_constructor:GalleryCompactResponse)
 }
 
-void DetectExtractSearchRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_DetectExtractSearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  ::memset(&detect_request_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&search_request_) -
-      reinterpret_cast<char*>(&detect_request_)) + sizeof(search_request_));
+void GalleryCompactResponse::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&face_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&compact_time_) -
+      reinterpret_cast<char*>(&face_count_)) + sizeof(compact_time_));
 }
 
-DetectExtractSearchRequest::~DetectExtractSearchRequest() {
-  // @@protoc_insertion_point(destructor:DetectExtractSearchRequest)
+GalleryCompactResponse::~GalleryCompactResponse() {
+  // @@protoc_insertion_point(destructor:GalleryCompactResponse)
   SharedDtor();
 }
 
-void DetectExtractSearchRequest::SharedDtor() {
-  if (this != internal_default_instance()) delete detect_request_;
-  if (this != internal_default_instance()) delete extract_request_;
-  if (this != internal_default_instance()) delete search_request_;
+void GalleryCompactResponse::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void DetectExtractSearchRequest::SetCachedSize(int size) const {
+void GalleryCompactResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const DetectExtractSearchRequest& DetectExtractSearchRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_DetectExtractSearchRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryCompactResponse& GalleryCompactResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryCompactResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void DetectExtractSearchRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:DetectExtractSearchRequest)
+void GalleryCompactResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryCompactResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
-  if (GetArenaNoVirtual() == nullptr && search_request_ != nullptr) {
-    delete search_request_;
-  }
-  search_request_ = nullptr;
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&face_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&compact_time_) -
+      reinterpret_cast<char*>(&face_count_)) + sizeof(compact_time_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* DetectExtractSearchRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryCompactResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ctx->ParseMessage(mutable_detect_request(), ptr);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryCompactResponse.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .ExtractRequest extract_request = 2;
+      // int64 face_count = 2;
       case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ctx->ParseMessage(mutable_extract_request(), ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          face_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // .SearchRequest search_request = 3;
+      // int64 rows_removed = 3;
       case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
-          ptr = ctx->ParseMessage(mutable_search_request(), ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          rows_removed_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 bytes_before = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          bytes_before_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 bytes_after = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          bytes_after_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 bytes_reclaimed = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
+          bytes_reclaimed_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
+      // float compact_time = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 61)) {
+          compact_time_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -13721,43 +21293,103 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool DetectExtractSearchRequest::MergePartialFromCodedStream(
+bool GalleryCompactResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(parse_start:GalleryCompactResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .DetectRequest detect_request = 1;
+      // string gallery_name = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_detect_request()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryCompactResponse.gallery_name"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .ExtractRequest extract_request = 2;
+      // int64 face_count = 2;
       case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_extract_request()));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &face_count_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .SearchRequest search_request = 3;
+      // int64 rows_removed = 3;
       case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-               input, mutable_search_request()));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &rows_removed_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 bytes_before = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &bytes_before_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 bytes_after = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &bytes_after_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 bytes_reclaimed = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &bytes_reclaimed_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // float compact_time = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (61 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
+                 input, &compact_time_)));
         } else {
           goto handle_unusual;
         }
@@ -13776,83 +21408,125 @@ bool DetectExtractSearchRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(parse_success:GalleryCompactResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(parse_failure:GalleryCompactResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void DetectExtractSearchRequest::SerializeWithCachedSizes(
+void GalleryCompactResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(serialize_start:GalleryCompactResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      1, HasBitSetters::detect_request(this), output);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryCompactResponse.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
+  }
+
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->face_count(), output);
+  }
+
+  // int64 rows_removed = 3;
+  if (this->rows_removed() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->rows_removed(), output);
+  }
+
+  // int64 bytes_before = 4;
+  if (this->bytes_before() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->bytes_before(), output);
+  }
+
+  // int64 bytes_after = 5;
+  if (this->bytes_after() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(5, this->bytes_after(), output);
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2, HasBitSetters::extract_request(this), output);
+  // int64 bytes_reclaimed = 6;
+  if (this->bytes_reclaimed() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(6, this->bytes_reclaimed(), output);
   }
 
-  // .SearchRequest search_request = 3;
-  if (this->has_search_request()) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      3, HasBitSetters::search_request(this), output);
+  // float compact_time = 7;
+  if (!(this->compact_time() <= 0 && this->compact_time() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(7, this->compact_time(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(serialize_end:GalleryCompactResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* DetectExtractSearchRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryCompactResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryCompactResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        1, HasBitSetters::detect_request(this), target);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryCompactResponse.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, HasBitSetters::extract_request(this), target);
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->face_count(), target);
   }
 
-  // .SearchRequest search_request = 3;
-  if (this->has_search_request()) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        3, HasBitSetters::search_request(this), target);
+  // int64 rows_removed = 3;
+  if (this->rows_removed() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->rows_removed(), target);
+  }
+
+  // int64 bytes_before = 4;
+  if (this->bytes_before() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->bytes_before(), target);
+  }
+
+  // int64 bytes_after = 5;
+  if (this->bytes_after() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(5, this->bytes_after(), target);
+  }
+
+  // int64 bytes_reclaimed = 6;
+  if (this->bytes_reclaimed() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(6, this->bytes_reclaimed(), target);
+  }
+
+  // float compact_time = 7;
+  if (!(this->compact_time() <= 0 && this->compact_time() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(7, this->compact_time(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryCompactResponse)
   return target;
 }
 
-size_t DetectExtractSearchRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:DetectExtractSearchRequest)
+size_t GalleryCompactResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryCompactResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -13864,25 +21538,51 @@ size_t DetectExtractSearchRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // .DetectRequest detect_request = 1;
-  if (this->has_detect_request()) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *detect_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
   }
 
-  // .ExtractRequest extract_request = 2;
-  if (this->has_extract_request()) {
+  // int64 face_count = 2;
+  if (this->face_count() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *extract_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->face_count());
   }
 
-  // .SearchRequest search_request = 3;
-  if (this->has_search_request()) {
+  // int64 rows_removed = 3;
+  if (this->rows_removed() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-        *search_request_);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->rows_removed());
+  }
+
+  // int64 bytes_before = 4;
+  if (this->bytes_before() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->bytes_before());
+  }
+
+  // int64 bytes_after = 5;
+  if (this->bytes_after() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->bytes_after());
+  }
+
+  // int64 bytes_reclaimed = 6;
+  if (this->bytes_reclaimed() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->bytes_reclaimed());
+  }
+
+  // float compact_time = 7;
+  if (!(this->compact_time() <= 0 && this->compact_time() >= 0)) {
+    total_size += 1 + 4;
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -13890,208 +21590,437 @@ size_t DetectExtractSearchRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void DetectExtractSearchRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:DetectExtractSearchRequest)
+void GalleryCompactResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryCompactResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const DetectExtractSearchRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<DetectExtractSearchRequest>(
+  const GalleryCompactResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryCompactResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryCompactResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:DetectExtractSearchRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryCompactResponse)
     MergeFrom(*source);
   }
 }
 
-void DetectExtractSearchRequest::MergeFrom(const DetectExtractSearchRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:DetectExtractSearchRequest)
+void GalleryCompactResponse::MergeFrom(const GalleryCompactResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryCompactResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.has_detect_request()) {
-    mutable_detect_request()->::DetectRequest::MergeFrom(from.detect_request());
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  if (from.has_extract_request()) {
-    mutable_extract_request()->::ExtractRequest::MergeFrom(from.extract_request());
+  if (from.face_count() != 0) {
+    set_face_count(from.face_count());
   }
-  if (from.has_search_request()) {
-    mutable_search_request()->::SearchRequest::MergeFrom(from.search_request());
+  if (from.rows_removed() != 0) {
+    set_rows_removed(from.rows_removed());
+  }
+  if (from.bytes_before() != 0) {
+    set_bytes_before(from.bytes_before());
+  }
+  if (from.bytes_after() != 0) {
+    set_bytes_after(from.bytes_after());
+  }
+  if (from.bytes_reclaimed() != 0) {
+    set_bytes_reclaimed(from.bytes_reclaimed());
+  }
+  if (!(from.compact_time() <= 0 && from.compact_time() >= 0)) {
+    set_compact_time(from.compact_time());
   }
 }
 
-void DetectExtractSearchRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:DetectExtractSearchRequest)
+void GalleryCompactResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryCompactResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void DetectExtractSearchRequest::CopyFrom(const DetectExtractSearchRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:DetectExtractSearchRequest)
+void GalleryCompactResponse::CopyFrom(const GalleryCompactResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryCompactResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool DetectExtractSearchRequest::IsInitialized() const {
+bool GalleryCompactResponse::IsInitialized() const {
   return true;
 }
 
-void DetectExtractSearchRequest::Swap(DetectExtractSearchRequest* other) {
+void GalleryCompactResponse::Swap(GalleryCompactResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void DetectExtractSearchRequest::InternalSwap(DetectExtractSearchRequest* other) {
+void GalleryCompactResponse::InternalSwap(GalleryCompactResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  swap(detect_request_, other->detect_request_);
-  swap(extract_request_, other->extract_request_);
-  swap(search_request_, other->search_request_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(face_count_, other->face_count_);
+  swap(rows_removed_, other->rows_removed_);
+  swap(bytes_before_, other->bytes_before_);
+  swap(bytes_after_, other->bytes_after_);
+  swap(bytes_reclaimed_, other->bytes_reclaimed_);
+  swap(compact_time_, other->compact_time_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata DetectExtractSearchRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryCompactResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void FaceStatusRequest::InitAsDefaultInstance() {
+void GalleryExportRequest::InitAsDefaultInstance() {
 }
-class FaceStatusRequest::HasBitSetters {
+class GalleryExportRequest::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int GalleryExportRequest::kGalleryNameFieldNumber;
+const int GalleryExportRequest::kStartRowFieldNumber;
+const int GalleryExportRequest::kFileIdFieldNumber;
+const int GalleryExportRequest::kChunkSizeFieldNumber;
+const int GalleryExportRequest::kIncludeViewsFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-FaceStatusRequest::FaceStatusRequest()
+GalleryExportRequest::GalleryExportRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:FaceStatusRequest)
+  // @@protoc_insertion_point(constructor:GalleryExportRequest)
 }
-FaceStatusRequest::FaceStatusRequest(const FaceStatusRequest& from)
+GalleryExportRequest::GalleryExportRequest(const GalleryExportRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  // @@protoc_insertion_point(copy_constructor:FaceStatusRequest)
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.file_id().size() > 0) {
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
+  }
+  ::memcpy(&start_row_, &from.start_row_,
+    static_cast<size_t>(reinterpret_cast<char*>(&include_views_) -
+    reinterpret_cast<char*>(&start_row_)) + sizeof(include_views_));
+  // @@protoc_insertion_point(copy_constructor:GalleryExportRequest)
 }
 
-void FaceStatusRequest::SharedCtor() {
+void GalleryExportRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&start_row_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&include_views_) -
+      reinterpret_cast<char*>(&start_row_)) + sizeof(include_views_));
 }
 
-FaceStatusRequest::~FaceStatusRequest() {
-  // @@protoc_insertion_point(destructor:FaceStatusRequest)
+GalleryExportRequest::~GalleryExportRequest() {
+  // @@protoc_insertion_point(destructor:GalleryExportRequest)
   SharedDtor();
 }
 
-void FaceStatusRequest::SharedDtor() {
+void GalleryExportRequest::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void FaceStatusRequest::SetCachedSize(int size) const {
+void GalleryExportRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const FaceStatusRequest& FaceStatusRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_FaceStatusRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryExportRequest& GalleryExportRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryExportRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void FaceStatusRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:FaceStatusRequest)
+void GalleryExportRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryExportRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&start_row_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&include_views_) -
+      reinterpret_cast<char*>(&start_row_)) + sizeof(include_views_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* FaceStatusRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryExportRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
+      // string gallery_name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryExportRequest.gallery_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 start_row = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
+          start_row_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string file_id = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_file_id(), ptr, ctx, "GalleryExportRequest.file_id");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 chunk_size = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          chunk_size_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // bool include_views = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          include_views_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      default: {
+      handle_unusual:
+        if ((tag & 7) == 4 || tag == 0) {
+          ctx->SetLastTag(tag);
+          goto success;
+        }
+        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
+        CHK_(ptr != nullptr);
+        continue;
+      }
+    }  // switch
+  }  // while
+success:
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto success;
+#undef CHK_
+}
+#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+bool GalleryExportRequest::MergePartialFromCodedStream(
+    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
+#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
+  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
+  // @@protoc_insertion_point(parse_start:GalleryExportRequest)
+  for (;;) {
+    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
+    tag = p.first;
+    if (!p.second) goto handle_unusual;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // string gallery_name = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryExportRequest.gallery_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 start_row = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &start_row_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string file_id = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_file_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->file_id().data(), static_cast<int>(this->file_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryExportRequest.file_id"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 chunk_size = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &chunk_size_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // bool include_views = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
+                 input, &include_views_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
-        if ((tag & 7) == 4 || tag == 0) {
-          ctx->SetLastTag(tag);
+      handle_unusual:
+        if (tag == 0) {
           goto success;
         }
-        ptr = UnknownFieldParse(tag, &_internal_metadata_, ptr, ctx);
-        CHK_(ptr != nullptr);
-        continue;
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
       }
-    }  // switch
-  }  // while
-success:
-  return ptr;
-failure:
-  ptr = nullptr;
-  goto success;
-#undef CHK_
-}
-#else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool FaceStatusRequest::MergePartialFromCodedStream(
-    ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
-#define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
-  ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:FaceStatusRequest)
-  for (;;) {
-    ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
-    tag = p.first;
-    if (!p.second) goto handle_unusual;
-  handle_unusual:
-    if (tag == 0) {
-      goto success;
     }
-    DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
-          input, tag, _internal_metadata_.mutable_unknown_fields()));
   }
 success:
-  // @@protoc_insertion_point(parse_success:FaceStatusRequest)
+  // @@protoc_insertion_point(parse_success:GalleryExportRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:FaceStatusRequest)
+  // @@protoc_insertion_point(parse_failure:GalleryExportRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void FaceStatusRequest::SerializeWithCachedSizes(
+void GalleryExportRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:FaceStatusRequest)
+  // @@protoc_insertion_point(serialize_start:GalleryExportRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryExportRequest.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
+  }
+
+  // int64 start_row = 2;
+  if (this->start_row() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->start_row(), output);
+  }
+
+  // string file_id = 3;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryExportRequest.file_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      3, this->file_id(), output);
+  }
+
+  // int32 chunk_size = 4;
+  if (this->chunk_size() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->chunk_size(), output);
+  }
+
+  // bool include_views = 5;
+  if (this->include_views() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(5, this->include_views(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:FaceStatusRequest)
+  // @@protoc_insertion_point(serialize_end:GalleryExportRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* FaceStatusRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryExportRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:FaceStatusRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryExportRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryExportRequest.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
+  }
+
+  // int64 start_row = 2;
+  if (this->start_row() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->start_row(), target);
+  }
+
+  // string file_id = 3;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryExportRequest.file_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        3, this->file_id(), target);
+  }
+
+  // int32 chunk_size = 4;
+  if (this->chunk_size() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->chunk_size(), target);
+  }
+
+  // bool include_views = 5;
+  if (this->include_views() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(5, this->include_views(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:FaceStatusRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryExportRequest)
   return target;
 }
 
-size_t FaceStatusRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:FaceStatusRequest)
+size_t GalleryExportRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryExportRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -14103,238 +22032,293 @@ size_t FaceStatusRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
+  }
+
+  // string file_id = 3;
+  if (this->file_id().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->file_id());
+  }
+
+  // int64 start_row = 2;
+  if (this->start_row() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->start_row());
+  }
+
+  // int32 chunk_size = 4;
+  if (this->chunk_size() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->chunk_size());
+  }
+
+  // bool include_views = 5;
+  if (this->include_views() != 0) {
+    total_size += 1 + 1;
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
 }
 
-void FaceStatusRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:FaceStatusRequest)
+void GalleryExportRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryExportRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const FaceStatusRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<FaceStatusRequest>(
+  const GalleryExportRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryExportRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:FaceStatusRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryExportRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:FaceStatusRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryExportRequest)
     MergeFrom(*source);
   }
 }
 
-void FaceStatusRequest::MergeFrom(const FaceStatusRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:FaceStatusRequest)
+void GalleryExportRequest::MergeFrom(const GalleryExportRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryExportRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  if (from.file_id().size() > 0) {
+
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
+  }
+  if (from.start_row() != 0) {
+    set_start_row(from.start_row());
+  }
+  if (from.chunk_size() != 0) {
+    set_chunk_size(from.chunk_size());
+  }
+  if (from.include_views() != 0) {
+    set_include_views(from.include_views());
+  }
 }
 
-void FaceStatusRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:FaceStatusRequest)
+void GalleryExportRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryExportRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void FaceStatusRequest::CopyFrom(const FaceStatusRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:FaceStatusRequest)
+void GalleryExportRequest::CopyFrom(const GalleryExportRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryExportRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool FaceStatusRequest::IsInitialized() const {
+bool GalleryExportRequest::IsInitialized() const {
   return true;
 }
 
-void FaceStatusRequest::Swap(FaceStatusRequest* other) {
+void GalleryExportRequest::Swap(GalleryExportRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void FaceStatusRequest::InternalSwap(FaceStatusRequest* other) {
+void GalleryExportRequest::InternalSwap(GalleryExportRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  file_id_.Swap(&other->file_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(start_row_, other->start_row_);
+  swap(chunk_size_, other->chunk_size_);
+  swap(include_views_, other->include_views_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata FaceStatusRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryExportRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void FaceServiceInfo::InitAsDefaultInstance() {
+void GalleryChunk::InitAsDefaultInstance() {
+  ::_GalleryChunk_default_instance_._instance.get_mutable()->records_ = const_cast< ::FaceRecordList*>(
+      ::FaceRecordList::internal_default_instance());
 }
-class FaceServiceInfo::HasBitSetters {
+class GalleryChunk::HasBitSetters {
  public:
+  static const ::FaceRecordList& records(const GalleryChunk* msg);
 };
 
+const ::FaceRecordList&
+GalleryChunk::HasBitSetters::records(const GalleryChunk* msg) {
+  return *msg->records_;
+}
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int FaceServiceInfo::kStatusFieldNumber;
-const int FaceServiceInfo::kWorkerCountFieldNumber;
-const int FaceServiceInfo::kDetectionSupportFieldNumber;
-const int FaceServiceInfo::kExtractSupportFieldNumber;
-const int FaceServiceInfo::kScoreSupportFieldNumber;
-const int FaceServiceInfo::kAttributeSupportFieldNumber;
-const int FaceServiceInfo::kScoreTypeFieldNumber;
-const int FaceServiceInfo::kDetectionThresholdFieldNumber;
-const int FaceServiceInfo::kMatchThresholdFieldNumber;
-const int FaceServiceInfo::kAlgorithmFieldNumber;
-const int FaceServiceInfo::kNotesFieldNumber;
+const int GalleryChunk::kGalleryNameFieldNumber;
+const int GalleryChunk::kFileIdFieldNumber;
+const int GalleryChunk::kStartRowFieldNumber;
+const int GalleryChunk::kNextRowFieldNumber;
+const int GalleryChunk::kRowCountFieldNumber;
+const int GalleryChunk::kDimFieldNumber;
+const int GalleryChunk::kTemplatesFieldNumber;
+const int GalleryChunk::kRecordsFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-FaceServiceInfo::FaceServiceInfo()
+GalleryChunk::GalleryChunk()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:FaceServiceInfo)
+  // @@protoc_insertion_point(constructor:GalleryChunk)
 }
-FaceServiceInfo::FaceServiceInfo(const FaceServiceInfo& from)
+GalleryChunk::GalleryChunk(const GalleryChunk& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.algorithm().size() > 0) {
-    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  notes_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.notes().size() > 0) {
-    notes_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.notes_);
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.file_id().size() > 0) {
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
   }
-  ::memcpy(&status_, &from.status_,
-    static_cast<size_t>(reinterpret_cast<char*>(&match_threshold_) -
-    reinterpret_cast<char*>(&status_)) + sizeof(match_threshold_));
-  // @@protoc_insertion_point(copy_constructor:FaceServiceInfo)
+  templates_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.templates().size() > 0) {
+    templates_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.templates_);
+  }
+  if (from.has_records()) {
+    records_ = new ::FaceRecordList(*from.records_);
+  } else {
+    records_ = nullptr;
+  }
+  ::memcpy(&start_row_, &from.start_row_,
+    static_cast<size_t>(reinterpret_cast<char*>(&dim_) -
+    reinterpret_cast<char*>(&start_row_)) + sizeof(dim_));
+  // @@protoc_insertion_point(copy_constructor:GalleryChunk)
 }
 
-void FaceServiceInfo::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto.base);
-  algorithm_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  notes_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&status_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&match_threshold_) -
-      reinterpret_cast<char*>(&status_)) + sizeof(match_threshold_));
+void GalleryChunk::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  templates_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&records_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&dim_) -
+      reinterpret_cast<char*>(&records_)) + sizeof(dim_));
 }
 
-FaceServiceInfo::~FaceServiceInfo() {
-  // @@protoc_insertion_point(destructor:FaceServiceInfo)
+GalleryChunk::~GalleryChunk() {
+  // @@protoc_insertion_point(destructor:GalleryChunk)
   SharedDtor();
 }
 
-void FaceServiceInfo::SharedDtor() {
-  algorithm_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  notes_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void GalleryChunk::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  templates_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (this != internal_default_instance()) delete records_;
 }
 
-void FaceServiceInfo::SetCachedSize(int size) const {
+void GalleryChunk::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const FaceServiceInfo& FaceServiceInfo::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_FaceServiceInfo_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryChunk& GalleryChunk::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryChunk_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void FaceServiceInfo::Clear() {
-// @@protoc_insertion_point(message_clear_start:FaceServiceInfo)
+void GalleryChunk::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryChunk)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  ::memset(&status_, 0, static_cast<size_t>(
-      reinterpret_cast<char*>(&match_threshold_) -
-      reinterpret_cast<char*>(&status_)) + sizeof(match_threshold_));
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  templates_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
+  }
+  records_ = nullptr;
+  ::memset(&start_row_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&dim_) -
+      reinterpret_cast<char*>(&start_row_)) + sizeof(dim_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* FaceServiceInfo::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryChunk::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // .ServiceStatus status = 1;
+      // string gallery_name = 1;
       case 1:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
-          ::PROTOBUF_NAMESPACE_ID::uint64 val = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryChunk.gallery_name");
           CHK_(ptr);
-          set_status(static_cast<::ServiceStatus>(val));
         } else goto handle_unusual;
         continue;
-      // int32 worker_count = 2;
+      // string file_id = 2;
       case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 16)) {
-          worker_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_file_id(), ptr, ctx, "GalleryChunk.file_id");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // bool detection_support = 3;
+      // int64 start_row = 3;
       case 3:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
-          detection_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          start_row_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // bool extract_support = 4;
+      // int64 next_row = 4;
       case 4:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
-          extract_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          next_row_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // bool score_support = 5;
+      // int64 row_count = 5;
       case 5:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
-          score_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // bool attribute_support = 6;
-      case 6:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
-          attribute_support_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // .ScoreType score_type = 7;
-      case 7:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 56)) {
-          ::PROTOBUF_NAMESPACE_ID::uint64 val = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          row_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
-          set_score_type(static_cast<::ScoreType>(val));
-        } else goto handle_unusual;
-        continue;
-      // float detection_threshold = 8;
-      case 8:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 69)) {
-          detection_threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
-          ptr += sizeof(float);
         } else goto handle_unusual;
-        continue;
-      // float match_threshold = 9;
-      case 9:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 77)) {
-          match_threshold_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
-          ptr += sizeof(float);
+        continue;
+      // int32 dim = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 48)) {
+          dim_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // string algorithm = 10;
-      case 10:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 82)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_algorithm(), ptr, ctx, "FaceServiceInfo.algorithm");
+      // bytes templates = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 58)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParser(mutable_templates(), ptr, ctx);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // string notes = 11;
-      case 11:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 90)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_notes(), ptr, ctx, "FaceServiceInfo.notes");
+      // .FaceRecordList records = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 66)) {
+          ptr = ctx->ParseMessage(mutable_records(), ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -14358,159 +22342,114 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool FaceServiceInfo::MergePartialFromCodedStream(
+bool GalleryChunk::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:FaceServiceInfo)
+  // @@protoc_insertion_point(parse_start:GalleryChunk)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // .ServiceStatus status = 1;
+      // string gallery_name = 1;
       case 1: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
-          int value = 0;
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   int, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_ENUM>(
-                 input, &value)));
-          set_status(static_cast< ::ServiceStatus >(value));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryChunk.gallery_name"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // int32 worker_count = 2;
+      // string file_id = 2;
       case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (16 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
-                 input, &worker_count_)));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_file_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->file_id().data(), static_cast<int>(this->file_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryChunk.file_id"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // bool detection_support = 3;
+      // int64 start_row = 3;
       case 3: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
-                 input, &detection_support_)));
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &start_row_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // bool extract_support = 4;
+      // int64 next_row = 4;
       case 4: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
-                 input, &extract_support_)));
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &next_row_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // bool score_support = 5;
+      // int64 row_count = 5;
       case 5: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
-                 input, &score_support_)));
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &row_count_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // bool attribute_support = 6;
+      // int32 dim = 6;
       case 6: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (48 & 0xFF)) {
 
           DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   bool, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_BOOL>(
-                 input, &attribute_support_)));
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &dim_)));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // .ScoreType score_type = 7;
+      // bytes templates = 7;
       case 7: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (56 & 0xFF)) {
-          int value = 0;
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   int, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_ENUM>(
-                 input, &value)));
-          set_score_type(static_cast< ::ScoreType >(value));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (58 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadBytes(
+                input, this->mutable_templates()));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // float detection_threshold = 8;
+      // .FaceRecordList records = 8;
       case 8: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (69 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
-                 input, &detection_threshold_)));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // float match_threshold = 9;
-      case 9: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (77 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   float, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_FLOAT>(
-                 input, &match_threshold_)));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // string algorithm = 10;
-      case 10: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (82 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_algorithm()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->algorithm().data(), static_cast<int>(this->algorithm().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "FaceServiceInfo.algorithm"));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // string notes = 11;
-      case 11: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (90 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_notes()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->notes().data(), static_cast<int>(this->notes().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "FaceServiceInfo.notes"));
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (66 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+               input, mutable_records()));
         } else {
           goto handle_unusual;
         }
@@ -14529,180 +22468,152 @@ bool FaceServiceInfo::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:FaceServiceInfo)
+  // @@protoc_insertion_point(parse_success:GalleryChunk)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:FaceServiceInfo)
+  // @@protoc_insertion_point(parse_failure:GalleryChunk)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void FaceServiceInfo::SerializeWithCachedSizes(
+void GalleryChunk::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:FaceServiceInfo)
+  // @@protoc_insertion_point(serialize_start:GalleryChunk)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .ServiceStatus status = 1;
-  if (this->status() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnum(
-      1, this->status(), output);
-  }
-
-  // int32 worker_count = 2;
-  if (this->worker_count() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(2, this->worker_count(), output);
-  }
-
-  // bool detection_support = 3;
-  if (this->detection_support() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(3, this->detection_support(), output);
-  }
-
-  // bool extract_support = 4;
-  if (this->extract_support() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(4, this->extract_support(), output);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryChunk.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
   }
 
-  // bool score_support = 5;
-  if (this->score_support() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(5, this->score_support(), output);
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryChunk.file_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->file_id(), output);
   }
 
-  // bool attribute_support = 6;
-  if (this->attribute_support() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBool(6, this->attribute_support(), output);
+  // int64 start_row = 3;
+  if (this->start_row() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->start_row(), output);
   }
 
-  // .ScoreType score_type = 7;
-  if (this->score_type() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnum(
-      7, this->score_type(), output);
+  // int64 next_row = 4;
+  if (this->next_row() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->next_row(), output);
   }
 
-  // float detection_threshold = 8;
-  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(8, this->detection_threshold(), output);
+  // int64 row_count = 5;
+  if (this->row_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(5, this->row_count(), output);
   }
 
-  // float match_threshold = 9;
-  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloat(9, this->match_threshold(), output);
+  // int32 dim = 6;
+  if (this->dim() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(6, this->dim(), output);
   }
 
-  // string algorithm = 10;
-  if (this->algorithm().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "FaceServiceInfo.algorithm");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      10, this->algorithm(), output);
+  // bytes templates = 7;
+  if (this->templates().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBytesMaybeAliased(
+      7, this->templates(), output);
   }
 
-  // string notes = 11;
-  if (this->notes().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->notes().data(), static_cast<int>(this->notes().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "FaceServiceInfo.notes");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      11, this->notes(), output);
+  // .FaceRecordList records = 8;
+  if (this->has_records()) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      8, HasBitSetters::records(this), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:FaceServiceInfo)
+  // @@protoc_insertion_point(serialize_end:GalleryChunk)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* FaceServiceInfo::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryChunk::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:FaceServiceInfo)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryChunk)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // .ServiceStatus status = 1;
-  if (this->status() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnumToArray(
-      1, this->status(), target);
-  }
-
-  // int32 worker_count = 2;
-  if (this->worker_count() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(2, this->worker_count(), target);
-  }
-
-  // bool detection_support = 3;
-  if (this->detection_support() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(3, this->detection_support(), target);
-  }
-
-  // bool extract_support = 4;
-  if (this->extract_support() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(4, this->extract_support(), target);
-  }
-
-  // bool score_support = 5;
-  if (this->score_support() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(5, this->score_support(), target);
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryChunk.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
   }
 
-  // bool attribute_support = 6;
-  if (this->attribute_support() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBoolToArray(6, this->attribute_support(), target);
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryChunk.file_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->file_id(), target);
   }
 
-  // .ScoreType score_type = 7;
-  if (this->score_type() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteEnumToArray(
-      7, this->score_type(), target);
+  // int64 start_row = 3;
+  if (this->start_row() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->start_row(), target);
   }
 
-  // float detection_threshold = 8;
-  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(8, this->detection_threshold(), target);
+  // int64 next_row = 4;
+  if (this->next_row() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->next_row(), target);
   }
 
-  // float match_threshold = 9;
-  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteFloatToArray(9, this->match_threshold(), target);
+  // int64 row_count = 5;
+  if (this->row_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(5, this->row_count(), target);
   }
 
-  // string algorithm = 10;
-  if (this->algorithm().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->algorithm().data(), static_cast<int>(this->algorithm().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "FaceServiceInfo.algorithm");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        10, this->algorithm(), target);
+  // int32 dim = 6;
+  if (this->dim() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(6, this->dim(), target);
   }
-
-  // string notes = 11;
-  if (this->notes().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->notes().data(), static_cast<int>(this->notes().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "FaceServiceInfo.notes");
+
+  // bytes templates = 7;
+  if (this->templates().size() > 0) {
     target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        11, this->notes(), target);
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteBytesToArray(
+        7, this->templates(), target);
+  }
+
+  // .FaceRecordList records = 8;
+  if (this->has_records()) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        8, HasBitSetters::records(this), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:FaceServiceInfo)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryChunk)
   return target;
 }
 
-size_t FaceServiceInfo::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:FaceServiceInfo)
+size_t GalleryChunk::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryChunk)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -14714,67 +22625,60 @@ size_t FaceServiceInfo::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string algorithm = 10;
-  if (this->algorithm().size() > 0) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->algorithm());
+        this->gallery_name());
   }
 
-  // string notes = 11;
-  if (this->notes().size() > 0) {
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->notes());
+        this->file_id());
   }
 
-  // .ServiceStatus status = 1;
-  if (this->status() != 0) {
+  // bytes templates = 7;
+  if (this->templates().size() > 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::EnumSize(this->status());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->templates());
   }
 
-  // int32 worker_count = 2;
-  if (this->worker_count() != 0) {
+  // .FaceRecordList records = 8;
+  if (this->has_records()) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
-        this->worker_count());
-  }
-
-  // bool detection_support = 3;
-  if (this->detection_support() != 0) {
-    total_size += 1 + 1;
-  }
-
-  // bool extract_support = 4;
-  if (this->extract_support() != 0) {
-    total_size += 1 + 1;
-  }
-
-  // bool score_support = 5;
-  if (this->score_support() != 0) {
-    total_size += 1 + 1;
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+        *records_);
   }
 
-  // bool attribute_support = 6;
-  if (this->attribute_support() != 0) {
-    total_size += 1 + 1;
+  // int64 start_row = 3;
+  if (this->start_row() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->start_row());
   }
 
-  // .ScoreType score_type = 7;
-  if (this->score_type() != 0) {
+  // int64 next_row = 4;
+  if (this->next_row() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::EnumSize(this->score_type());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->next_row());
   }
 
-  // float detection_threshold = 8;
-  if (!(this->detection_threshold() <= 0 && this->detection_threshold() >= 0)) {
-    total_size += 1 + 4;
+  // int64 row_count = 5;
+  if (this->row_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->row_count());
   }
 
-  // float match_threshold = 9;
-  if (!(this->match_threshold() <= 0 && this->match_threshold() >= 0)) {
-    total_size += 1 + 4;
+  // int32 dim = 6;
+  if (this->dim() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->dim());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -14782,171 +22686,226 @@ size_t FaceServiceInfo::ByteSizeLong() const {
   return total_size;
 }
 
-void FaceServiceInfo::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:FaceServiceInfo)
+void GalleryChunk::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryChunk)
   GOOGLE_DCHECK_NE(&from, this);
-  const FaceServiceInfo* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<FaceServiceInfo>(
+  const GalleryChunk* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryChunk>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:FaceServiceInfo)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryChunk)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:FaceServiceInfo)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryChunk)
     MergeFrom(*source);
   }
 }
 
-void FaceServiceInfo::MergeFrom(const FaceServiceInfo& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:FaceServiceInfo)
+void GalleryChunk::MergeFrom(const GalleryChunk& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryChunk)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.algorithm().size() > 0) {
+  if (from.gallery_name().size() > 0) {
 
-    algorithm_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.algorithm_);
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  if (from.notes().size() > 0) {
+  if (from.file_id().size() > 0) {
 
-    notes_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.notes_);
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
   }
-  if (from.status() != 0) {
-    set_status(from.status());
-  }
-  if (from.worker_count() != 0) {
-    set_worker_count(from.worker_count());
-  }
-  if (from.detection_support() != 0) {
-    set_detection_support(from.detection_support());
-  }
-  if (from.extract_support() != 0) {
-    set_extract_support(from.extract_support());
+  if (from.templates().size() > 0) {
+
+    templates_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.templates_);
   }
-  if (from.score_support() != 0) {
-    set_score_support(from.score_support());
+  if (from.has_records()) {
+    mutable_records()->::FaceRecordList::MergeFrom(from.records());
   }
-  if (from.attribute_support() != 0) {
-    set_attribute_support(from.attribute_support());
+  if (from.start_row() != 0) {
+    set_start_row(from.start_row());
   }
-  if (from.score_type() != 0) {
-    set_score_type(from.score_type());
+  if (from.next_row() != 0) {
+    set_next_row(from.next_row());
   }
-  if (!(from.detection_threshold() <= 0 && from.detection_threshold() >= 0)) {
-    set_detection_threshold(from.detection_threshold());
+  if (from.row_count() != 0) {
+    set_row_count(from.row_count());
   }
-  if (!(from.match_threshold() <= 0 && from.match_threshold() >= 0)) {
-    set_match_threshold(from.match_threshold());
+  if (from.dim() != 0) {
+    set_dim(from.dim());
   }
 }
 
-void FaceServiceInfo::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:FaceServiceInfo)
+void GalleryChunk::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryChunk)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void FaceServiceInfo::CopyFrom(const FaceServiceInfo& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:FaceServiceInfo)
+void GalleryChunk::CopyFrom(const GalleryChunk& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryChunk)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool FaceServiceInfo::IsInitialized() const {
+bool GalleryChunk::IsInitialized() const {
   return true;
 }
 
-void FaceServiceInfo::Swap(FaceServiceInfo* other) {
+void GalleryChunk::Swap(GalleryChunk* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void FaceServiceInfo::InternalSwap(FaceServiceInfo* other) {
+void GalleryChunk::InternalSwap(GalleryChunk* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  algorithm_.Swap(&other->algorithm_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  notes_.Swap(&other->notes_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  file_id_.Swap(&other->file_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  swap(status_, other->status_);
-  swap(worker_count_, other->worker_count_);
-  swap(detection_support_, other->detection_support_);
-  swap(extract_support_, other->extract_support_);
-  swap(score_support_, other->score_support_);
-  swap(attribute_support_, other->attribute_support_);
-  swap(score_type_, other->score_type_);
-  swap(detection_threshold_, other->detection_threshold_);
-  swap(match_threshold_, other->match_threshold_);
+  templates_.Swap(&other->templates_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(records_, other->records_);
+  swap(start_row_, other->start_row_);
+  swap(next_row_, other->next_row_);
+  swap(row_count_, other->row_count_);
+  swap(dim_, other->dim_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata FaceServiceInfo::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryChunk::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void GalleryListRequest::InitAsDefaultInstance() {
+void GalleryImportResponse::InitAsDefaultInstance() {
 }
-class GalleryListRequest::HasBitSetters {
+class GalleryImportResponse::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
+const int GalleryImportResponse::kGalleryNameFieldNumber;
+const int GalleryImportResponse::kFileIdFieldNumber;
+const int GalleryImportResponse::kNextRowFieldNumber;
+const int GalleryImportResponse::kEnrollCountFieldNumber;
+const int GalleryImportResponse::kReplaceCountFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-GalleryListRequest::GalleryListRequest()
+GalleryImportResponse::GalleryImportResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:GalleryListRequest)
+  // @@protoc_insertion_point(constructor:GalleryImportResponse)
 }
-GalleryListRequest::GalleryListRequest(const GalleryListRequest& from)
+GalleryImportResponse::GalleryImportResponse(const GalleryImportResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  // @@protoc_insertion_point(copy_constructor:GalleryListRequest)
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.file_id().size() > 0) {
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
+  }
+  ::memcpy(&next_row_, &from.next_row_,
+    static_cast<size_t>(reinterpret_cast<char*>(&replace_count_) -
+    reinterpret_cast<char*>(&next_row_)) + sizeof(replace_count_));
+  // @@protoc_insertion_point(copy_constructor:GalleryImportResponse)
 }
 
-void GalleryListRequest::SharedCtor() {
+void GalleryImportResponse::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&next_row_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&replace_count_) -
+      reinterpret_cast<char*>(&next_row_)) + sizeof(replace_count_));
 }
 
-GalleryListRequest::~GalleryListRequest() {
-  // @@protoc_insertion_point(destructor:GalleryListRequest)
+GalleryImportResponse::~GalleryImportResponse() {
+  // @@protoc_insertion_point(destructor:GalleryImportResponse)
   SharedDtor();
 }
 
-void GalleryListRequest::SharedDtor() {
+void GalleryImportResponse::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void GalleryListRequest::SetCachedSize(int size) const {
+void GalleryImportResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const GalleryListRequest& GalleryListRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const GalleryImportResponse& GalleryImportResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryImportResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void GalleryListRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:GalleryListRequest)
+void GalleryImportResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:GalleryImportResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&next_row_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&replace_count_) -
+      reinterpret_cast<char*>(&next_row_)) + sizeof(replace_count_));
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* GalleryListRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* GalleryImportResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
+      // string gallery_name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryImportResponse.gallery_name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string file_id = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_file_id(), ptr, ctx, "GalleryImportResponse.file_id");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 next_row = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          next_row_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 enroll_count = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          enroll_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 replace_count = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          replace_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
       default: {
+      handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
           ctx->SetLastTag(tag);
           goto success;
@@ -14965,61 +22924,207 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool GalleryListRequest::MergePartialFromCodedStream(
+bool GalleryImportResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:GalleryListRequest)
+  // @@protoc_insertion_point(parse_start:GalleryImportResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
-  handle_unusual:
-    if (tag == 0) {
-      goto success;
+    switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
+      // string gallery_name = 1;
+      case 1: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryImportResponse.gallery_name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string file_id = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_file_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->file_id().data(), static_cast<int>(this->file_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryImportResponse.file_id"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 next_row = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &next_row_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 enroll_count = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &enroll_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 replace_count = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &replace_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      default: {
+      handle_unusual:
+        if (tag == 0) {
+          goto success;
+        }
+        DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
+              input, tag, _internal_metadata_.mutable_unknown_fields()));
+        break;
+      }
     }
-    DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SkipField(
-          input, tag, _internal_metadata_.mutable_unknown_fields()));
   }
 success:
-  // @@protoc_insertion_point(parse_success:GalleryListRequest)
+  // @@protoc_insertion_point(parse_success:GalleryImportResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:GalleryListRequest)
+  // @@protoc_insertion_point(parse_failure:GalleryImportResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void GalleryListRequest::SerializeWithCachedSizes(
+void GalleryImportResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:GalleryListRequest)
+  // @@protoc_insertion_point(serialize_start:GalleryImportResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryImportResponse.gallery_name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      1, this->gallery_name(), output);
+  }
+
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryImportResponse.file_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->file_id(), output);
+  }
+
+  // int64 next_row = 3;
+  if (this->next_row() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->next_row(), output);
+  }
+
+  // int64 enroll_count = 4;
+  if (this->enroll_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(4, this->enroll_count(), output);
+  }
+
+  // int64 replace_count = 5;
+  if (this->replace_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(5, this->replace_count(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:GalleryListRequest)
+  // @@protoc_insertion_point(serialize_end:GalleryImportResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* GalleryListRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* GalleryImportResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:GalleryListRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:GalleryImportResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryImportResponse.gallery_name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        1, this->gallery_name(), target);
+  }
+
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->file_id().data(), static_cast<int>(this->file_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryImportResponse.file_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->file_id(), target);
+  }
+
+  // int64 next_row = 3;
+  if (this->next_row() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->next_row(), target);
+  }
+
+  // int64 enroll_count = 4;
+  if (this->enroll_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(4, this->enroll_count(), target);
+  }
+
+  // int64 replace_count = 5;
+  if (this->replace_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(5, this->replace_count(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:GalleryListRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:GalleryImportResponse)
   return target;
 }
 
-size_t GalleryListRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:GalleryListRequest)
+size_t GalleryImportResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:GalleryImportResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -15031,85 +23136,144 @@ size_t GalleryListRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_name());
+  }
+
+  // string file_id = 2;
+  if (this->file_id().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->file_id());
+  }
+
+  // int64 next_row = 3;
+  if (this->next_row() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->next_row());
+  }
+
+  // int64 enroll_count = 4;
+  if (this->enroll_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->enroll_count());
+  }
+
+  // int64 replace_count = 5;
+  if (this->replace_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->replace_count());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
 }
 
-void GalleryListRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:GalleryListRequest)
+void GalleryImportResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:GalleryImportResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const GalleryListRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryListRequest>(
+  const GalleryImportResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryImportResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryListRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryImportResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryListRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryImportResponse)
     MergeFrom(*source);
   }
 }
 
-void GalleryListRequest::MergeFrom(const GalleryListRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:GalleryListRequest)
+void GalleryImportResponse::MergeFrom(const GalleryImportResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:GalleryImportResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
+  if (from.gallery_name().size() > 0) {
+
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  }
+  if (from.file_id().size() > 0) {
+
+    file_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.file_id_);
+  }
+  if (from.next_row() != 0) {
+    set_next_row(from.next_row());
+  }
+  if (from.enroll_count() != 0) {
+    set_enroll_count(from.enroll_count());
+  }
+  if (from.replace_count() != 0) {
+    set_replace_count(from.replace_count());
+  }
 }
 
-void GalleryListRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:GalleryListRequest)
+void GalleryImportResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:GalleryImportResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void GalleryListRequest::CopyFrom(const GalleryListRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:GalleryListRequest)
+void GalleryImportResponse::CopyFrom(const GalleryImportResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:GalleryImportResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool GalleryListRequest::IsInitialized() const {
+bool GalleryImportResponse::IsInitialized() const {
   return true;
 }
 
-void GalleryListRequest::Swap(GalleryListRequest* other) {
+void GalleryImportResponse::Swap(GalleryImportResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void GalleryListRequest::InternalSwap(GalleryListRequest* other) {
+void GalleryImportResponse::InternalSwap(GalleryImportResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  file_id_.Swap(&other->file_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  swap(next_row_, other->next_row_);
+  swap(enroll_count_, other->enroll_count_);
+  swap(replace_count_, other->replace_count_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata GalleryListRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata GalleryImportResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void GalleryDeleteRequest::InitAsDefaultInstance() {
+void EnrollmentListRequest::InitAsDefaultInstance() {
 }
-class GalleryDeleteRequest::HasBitSetters {
+class EnrollmentListRequest::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int GalleryDeleteRequest::kGalleryNameFieldNumber;
+const int EnrollmentListRequest::kGalleryNameFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-GalleryDeleteRequest::GalleryDeleteRequest()
+EnrollmentListRequest::EnrollmentListRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:GalleryDeleteRequest)
+  // @@protoc_insertion_point(constructor:EnrollmentListRequest)
 }
-GalleryDeleteRequest::GalleryDeleteRequest(const GalleryDeleteRequest& from)
+EnrollmentListRequest::EnrollmentListRequest(const EnrollmentListRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
@@ -15117,34 +23281,34 @@ GalleryDeleteRequest::GalleryDeleteRequest(const GalleryDeleteRequest& from)
   if (from.gallery_name().size() > 0) {
     gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  // @@protoc_insertion_point(copy_constructor:GalleryDeleteRequest)
+  // @@protoc_insertion_point(copy_constructor:EnrollmentListRequest)
 }
 
-void GalleryDeleteRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+void EnrollmentListRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-GalleryDeleteRequest::~GalleryDeleteRequest() {
-  // @@protoc_insertion_point(destructor:GalleryDeleteRequest)
+EnrollmentListRequest::~EnrollmentListRequest() {
+  // @@protoc_insertion_point(destructor:EnrollmentListRequest)
   SharedDtor();
 }
 
-void GalleryDeleteRequest::SharedDtor() {
+void EnrollmentListRequest::SharedDtor() {
   gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void GalleryDeleteRequest::SetCachedSize(int size) const {
+void EnrollmentListRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const GalleryDeleteRequest& GalleryDeleteRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_GalleryDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollmentListRequest& EnrollmentListRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void GalleryDeleteRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:GalleryDeleteRequest)
+void EnrollmentListRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollmentListRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
@@ -15154,7 +23318,7 @@ void GalleryDeleteRequest::Clear() {
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* GalleryDeleteRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollmentListRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
@@ -15164,7 +23328,7 @@ const char* GalleryDeleteRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAM
       // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "GalleryDeleteRequest.gallery_name");
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentListRequest.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -15188,11 +23352,11 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool GalleryDeleteRequest::MergePartialFromCodedStream(
+bool EnrollmentListRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:GalleryDeleteRequest)
+  // @@protoc_insertion_point(parse_start:EnrollmentListRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
@@ -15206,7 +23370,7 @@ bool GalleryDeleteRequest::MergePartialFromCodedStream(
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
             this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "GalleryDeleteRequest.gallery_name"));
+            "EnrollmentListRequest.gallery_name"));
         } else {
           goto handle_unusual;
         }
@@ -15225,18 +23389,18 @@ bool GalleryDeleteRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:GalleryDeleteRequest)
+  // @@protoc_insertion_point(parse_success:EnrollmentListRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:GalleryDeleteRequest)
+  // @@protoc_insertion_point(parse_failure:EnrollmentListRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void GalleryDeleteRequest::SerializeWithCachedSizes(
+void EnrollmentListRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:GalleryDeleteRequest)
+  // @@protoc_insertion_point(serialize_start:EnrollmentListRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
@@ -15245,7 +23409,7 @@ void GalleryDeleteRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
       this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "GalleryDeleteRequest.gallery_name");
+      "EnrollmentListRequest.gallery_name");
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
       1, this->gallery_name(), output);
   }
@@ -15254,12 +23418,12 @@ void GalleryDeleteRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:GalleryDeleteRequest)
+  // @@protoc_insertion_point(serialize_end:EnrollmentListRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* GalleryDeleteRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentListRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:GalleryDeleteRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentListRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
@@ -15268,7 +23432,7 @@ void GalleryDeleteRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
       this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "GalleryDeleteRequest.gallery_name");
+      "EnrollmentListRequest.gallery_name");
     target =
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
         1, this->gallery_name(), target);
@@ -15278,12 +23442,12 @@ void GalleryDeleteRequest::SerializeWithCachedSizes(
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:GalleryDeleteRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentListRequest)
   return target;
 }
 
-size_t GalleryDeleteRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:GalleryDeleteRequest)
+size_t EnrollmentListRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollmentListRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -15307,23 +23471,23 @@ size_t GalleryDeleteRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void GalleryDeleteRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:GalleryDeleteRequest)
+void EnrollmentListRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentListRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const GalleryDeleteRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<GalleryDeleteRequest>(
+  const EnrollmentListRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentListRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:GalleryDeleteRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentListRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:GalleryDeleteRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentListRequest)
     MergeFrom(*source);
   }
 }
 
-void GalleryDeleteRequest::MergeFrom(const GalleryDeleteRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:GalleryDeleteRequest)
+void EnrollmentListRequest::MergeFrom(const EnrollmentListRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentListRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
@@ -15335,113 +23499,139 @@ void GalleryDeleteRequest::MergeFrom(const GalleryDeleteRequest& from) {
   }
 }
 
-void GalleryDeleteRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:GalleryDeleteRequest)
+void EnrollmentListRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentListRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void GalleryDeleteRequest::CopyFrom(const GalleryDeleteRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:GalleryDeleteRequest)
+void EnrollmentListRequest::CopyFrom(const EnrollmentListRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentListRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool GalleryDeleteRequest::IsInitialized() const {
+bool EnrollmentListRequest::IsInitialized() const {
   return true;
 }
 
-void GalleryDeleteRequest::Swap(GalleryDeleteRequest* other) {
+void EnrollmentListRequest::Swap(EnrollmentListRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void GalleryDeleteRequest::InternalSwap(GalleryDeleteRequest* other) {
+void EnrollmentListRequest::InternalSwap(EnrollmentListRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
   gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata GalleryDeleteRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentListRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void EnrollmentListRequest::InitAsDefaultInstance() {
+void EnrollmentInfo::InitAsDefaultInstance() {
 }
-class EnrollmentListRequest::HasBitSetters {
+class EnrollmentInfo::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int EnrollmentListRequest::kGalleryNameFieldNumber;
+const int EnrollmentInfo::kSubjectIdFieldNumber;
+const int EnrollmentInfo::kNameFieldNumber;
+const int EnrollmentInfo::kFaceCountFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-EnrollmentListRequest::EnrollmentListRequest()
+EnrollmentInfo::EnrollmentInfo()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:EnrollmentListRequest)
+  // @@protoc_insertion_point(constructor:EnrollmentInfo)
 }
-EnrollmentListRequest::EnrollmentListRequest(const EnrollmentListRequest& from)
+EnrollmentInfo::EnrollmentInfo(const EnrollmentInfo& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.gallery_name().size() > 0) {
-    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.subject_id().size() > 0) {
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
   }
-  // @@protoc_insertion_point(copy_constructor:EnrollmentListRequest)
+  name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.name().size() > 0) {
+    name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.name_);
+  }
+  face_count_ = from.face_count_;
+  // @@protoc_insertion_point(copy_constructor:EnrollmentInfo)
 }
 
-void EnrollmentListRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollmentInfo::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto.base);
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  face_count_ = 0;
 }
 
-EnrollmentListRequest::~EnrollmentListRequest() {
-  // @@protoc_insertion_point(destructor:EnrollmentListRequest)
+EnrollmentInfo::~EnrollmentInfo() {
+  // @@protoc_insertion_point(destructor:EnrollmentInfo)
   SharedDtor();
 }
 
-void EnrollmentListRequest::SharedDtor() {
-  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollmentInfo::SharedDtor() {
+  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void EnrollmentListRequest::SetCachedSize(int size) const {
+void EnrollmentInfo::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const EnrollmentListRequest& EnrollmentListRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentListRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollmentInfo& EnrollmentInfo::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void EnrollmentListRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:EnrollmentListRequest)
+void EnrollmentInfo::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollmentInfo)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  face_count_ = 0;
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* EnrollmentListRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollmentInfo::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string gallery_name = 1;
+      // string subject_id = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentListRequest.gallery_name");
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "EnrollmentInfo.subject_id");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string name = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_name(), ptr, ctx, "EnrollmentInfo.name");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 face_count = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          face_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -15465,25 +23655,53 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool EnrollmentListRequest::MergePartialFromCodedStream(
+bool EnrollmentInfo::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:EnrollmentListRequest)
+  // @@protoc_insertion_point(parse_start:EnrollmentInfo)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string gallery_name = 1;
+      // string subject_id = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_gallery_name()));
+                input, this->mutable_subject_id()));
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentListRequest.gallery_name"));
+            "EnrollmentInfo.subject_id"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string name = 2;
+      case 2: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_name()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->name().data(), static_cast<int>(this->name().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "EnrollmentInfo.name"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 face_count = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &face_count_)));
         } else {
           goto handle_unusual;
         }
@@ -15502,65 +23720,96 @@ bool EnrollmentListRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:EnrollmentListRequest)
+  // @@protoc_insertion_point(parse_success:EnrollmentInfo)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:EnrollmentListRequest)
+  // @@protoc_insertion_point(parse_failure:EnrollmentInfo)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void EnrollmentListRequest::SerializeWithCachedSizes(
+void EnrollmentInfo::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:EnrollmentListRequest)
+  // @@protoc_insertion_point(serialize_start:EnrollmentInfo)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
+  // string subject_id = 1;
+  if (this->subject_id().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentListRequest.gallery_name");
+      "EnrollmentInfo.subject_id");
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->gallery_name(), output);
+      1, this->subject_id(), output);
+  }
+
+  // string name = 2;
+  if (this->name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->name().data(), static_cast<int>(this->name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentInfo.name");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->name(), output);
+  }
+
+  // int32 face_count = 3;
+  if (this->face_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(3, this->face_count(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:EnrollmentListRequest)
+  // @@protoc_insertion_point(serialize_end:EnrollmentInfo)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentListRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentInfo::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentListRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentInfo)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
+  // string subject_id = 1;
+  if (this->subject_id().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentListRequest.gallery_name");
+      "EnrollmentInfo.subject_id");
     target =
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->gallery_name(), target);
+        1, this->subject_id(), target);
+  }
+
+  // string name = 2;
+  if (this->name().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->name().data(), static_cast<int>(this->name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentInfo.name");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->name(), target);
+  }
+
+  // int32 face_count = 3;
+  if (this->face_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(3, this->face_count(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentListRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentInfo)
   return target;
 }
 
-size_t EnrollmentListRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:EnrollmentListRequest)
+size_t EnrollmentInfo::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollmentInfo)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -15572,11 +23821,25 @@ size_t EnrollmentListRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
+  // string subject_id = 1;
+  if (this->subject_id().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->gallery_name());
+        this->subject_id());
+  }
+
+  // string name = 2;
+  if (this->name().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->name());
+  }
+
+  // int32 face_count = 3;
+  if (this->face_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->face_count());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -15584,168 +23847,167 @@ size_t EnrollmentListRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void EnrollmentListRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentListRequest)
+void EnrollmentInfo::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentInfo)
   GOOGLE_DCHECK_NE(&from, this);
-  const EnrollmentListRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentListRequest>(
+  const EnrollmentInfo* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentInfo>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentListRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentInfo)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentListRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentInfo)
     MergeFrom(*source);
   }
 }
 
-void EnrollmentListRequest::MergeFrom(const EnrollmentListRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentListRequest)
+void EnrollmentInfo::MergeFrom(const EnrollmentInfo& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentInfo)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.gallery_name().size() > 0) {
+  if (from.subject_id().size() > 0) {
 
-    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  if (from.name().size() > 0) {
+
+    name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.name_);
+  }
+  if (from.face_count() != 0) {
+    set_face_count(from.face_count());
   }
 }
 
-void EnrollmentListRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentListRequest)
+void EnrollmentInfo::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentInfo)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void EnrollmentListRequest::CopyFrom(const EnrollmentListRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentListRequest)
+void EnrollmentInfo::CopyFrom(const EnrollmentInfo& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentInfo)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool EnrollmentListRequest::IsInitialized() const {
+bool EnrollmentInfo::IsInitialized() const {
   return true;
 }
 
-void EnrollmentListRequest::Swap(EnrollmentListRequest* other) {
+void EnrollmentInfo::Swap(EnrollmentInfo* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void EnrollmentListRequest::InternalSwap(EnrollmentListRequest* other) {
+void EnrollmentInfo::InternalSwap(EnrollmentInfo* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  name_.Swap(&other->name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
+  swap(face_count_, other->face_count_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentListRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentInfo::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void EnrollmentInfo::InitAsDefaultInstance() {
+void EnrollmentListResponse::InitAsDefaultInstance() {
 }
-class EnrollmentInfo::HasBitSetters {
+class EnrollmentListResponse::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int EnrollmentInfo::kSubjectIdFieldNumber;
-const int EnrollmentInfo::kNameFieldNumber;
-const int EnrollmentInfo::kFaceCountFieldNumber;
+const int EnrollmentListResponse::kGalleryNameFieldNumber;
+const int EnrollmentListResponse::kEnrollmentsFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-EnrollmentInfo::EnrollmentInfo()
+EnrollmentListResponse::EnrollmentListResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:EnrollmentInfo)
+  // @@protoc_insertion_point(constructor:EnrollmentListResponse)
 }
-EnrollmentInfo::EnrollmentInfo(const EnrollmentInfo& from)
+EnrollmentListResponse::EnrollmentListResponse(const EnrollmentListResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr) {
+      _internal_metadata_(nullptr),
+      enrollments_(from.enrollments_) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.subject_id().size() > 0) {
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.name().size() > 0) {
-    name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.name_);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_name().size() > 0) {
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  face_count_ = from.face_count_;
-  // @@protoc_insertion_point(copy_constructor:EnrollmentInfo)
+  // @@protoc_insertion_point(copy_constructor:EnrollmentListResponse)
 }
 
-void EnrollmentInfo::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto.base);
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  face_count_ = 0;
+void EnrollmentListResponse::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentListResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-EnrollmentInfo::~EnrollmentInfo() {
-  // @@protoc_insertion_point(destructor:EnrollmentInfo)
+EnrollmentListResponse::~EnrollmentListResponse() {
+  // @@protoc_insertion_point(destructor:EnrollmentListResponse)
   SharedDtor();
 }
 
-void EnrollmentInfo::SharedDtor() {
-  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollmentListResponse::SharedDtor() {
+  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void EnrollmentInfo::SetCachedSize(int size) const {
+void EnrollmentListResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const EnrollmentInfo& EnrollmentInfo::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentInfo_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollmentListResponse& EnrollmentListResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentListResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void EnrollmentInfo::Clear() {
-// @@protoc_insertion_point(message_clear_start:EnrollmentInfo)
+void EnrollmentListResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollmentListResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  face_count_ = 0;
+  enrollments_.Clear();
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* EnrollmentInfo::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollmentListResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string subject_id = 1;
+      // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "EnrollmentInfo.subject_id");
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentListResponse.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // string name = 2;
+      // repeated .EnrollmentInfo enrollments = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_name(), ptr, ctx, "EnrollmentInfo.name");
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // int32 face_count = 3;
-      case 3:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
-          face_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
-          CHK_(ptr);
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(add_enrollments(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 18);
         } else goto handle_unusual;
         continue;
       default: {
@@ -15768,53 +24030,36 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool EnrollmentInfo::MergePartialFromCodedStream(
+bool EnrollmentListResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:EnrollmentInfo)
+  // @@protoc_insertion_point(parse_start:EnrollmentListResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string subject_id = 1;
+      // string gallery_name = 1;
       case 1: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_subject_id()));
+                input, this->mutable_gallery_name()));
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentInfo.subject_id"));
+            "EnrollmentListResponse.gallery_name"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // string name = 2;
+      // repeated .EnrollmentInfo enrollments = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_name()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->name().data(), static_cast<int>(this->name().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentInfo.name"));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
-
-      // int32 face_count = 3;
-      case 3: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
-
-          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
-                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
-                 input, &face_count_)));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
+                input, add_enrollments()));
         } else {
           goto handle_unusual;
         }
@@ -15833,96 +24078,82 @@ bool EnrollmentInfo::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:EnrollmentInfo)
+  // @@protoc_insertion_point(parse_success:EnrollmentListResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:EnrollmentInfo)
+  // @@protoc_insertion_point(parse_failure:EnrollmentListResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void EnrollmentInfo::SerializeWithCachedSizes(
+void EnrollmentListResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:EnrollmentInfo)
+  // @@protoc_insertion_point(serialize_start:EnrollmentListResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string subject_id = 1;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentInfo.subject_id");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->subject_id(), output);
-  }
-
-  // string name = 2;
-  if (this->name().size() > 0) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->name().data(), static_cast<int>(this->name().length()),
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentInfo.name");
+      "EnrollmentListResponse.gallery_name");
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      2, this->name(), output);
+      1, this->gallery_name(), output);
   }
 
-  // int32 face_count = 3;
-  if (this->face_count() != 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(3, this->face_count(), output);
+  // repeated .EnrollmentInfo enrollments = 2;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->enrollments_size()); i < n; i++) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
+      2,
+      this->enrollments(static_cast<int>(i)),
+      output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:EnrollmentInfo)
+  // @@protoc_insertion_point(serialize_end:EnrollmentListResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentInfo::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentListResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentInfo)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentListResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string subject_id = 1;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentInfo.subject_id");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->subject_id(), target);
-  }
-
-  // string name = 2;
-  if (this->name().size() > 0) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->name().data(), static_cast<int>(this->name().length()),
+      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentInfo.name");
+      "EnrollmentListResponse.gallery_name");
     target =
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        2, this->name(), target);
+        1, this->gallery_name(), target);
   }
 
-  // int32 face_count = 3;
-  if (this->face_count() != 0) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(3, this->face_count(), target);
+  // repeated .EnrollmentInfo enrollments = 2;
+  for (unsigned int i = 0,
+      n = static_cast<unsigned int>(this->enrollments_size()); i < n; i++) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+      InternalWriteMessageToArray(
+        2, this->enrollments(static_cast<int>(i)), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentInfo)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentListResponse)
   return target;
 }
 
-size_t EnrollmentInfo::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:EnrollmentInfo)
+size_t EnrollmentListResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollmentListResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -15934,25 +24165,22 @@ size_t EnrollmentInfo::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string subject_id = 1;
-  if (this->subject_id().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->subject_id());
+  // repeated .EnrollmentInfo enrollments = 2;
+  {
+    unsigned int count = static_cast<unsigned int>(this->enrollments_size());
+    total_size += 1UL * count;
+    for (unsigned int i = 0; i < count; i++) {
+      total_size +=
+        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
+          this->enrollments(static_cast<int>(i)));
+    }
   }
 
-  // string name = 2;
-  if (this->name().size() > 0) {
+  // string gallery_name = 1;
+  if (this->gallery_name().size() > 0) {
     total_size += 1 +
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->name());
-  }
-
-  // int32 face_count = 3;
-  if (this->face_count() != 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
-        this->face_count());
+        this->gallery_name());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -15960,144 +24188,149 @@ size_t EnrollmentInfo::ByteSizeLong() const {
   return total_size;
 }
 
-void EnrollmentInfo::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentInfo)
+void EnrollmentListResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentListResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const EnrollmentInfo* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentInfo>(
+  const EnrollmentListResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentListResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentInfo)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentListResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentInfo)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentListResponse)
     MergeFrom(*source);
   }
 }
 
-void EnrollmentInfo::MergeFrom(const EnrollmentInfo& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentInfo)
+void EnrollmentListResponse::MergeFrom(const EnrollmentListResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentListResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.subject_id().size() > 0) {
-
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  if (from.name().size() > 0) {
+  enrollments_.MergeFrom(from.enrollments_);
+  if (from.gallery_name().size() > 0) {
 
-    name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.name_);
-  }
-  if (from.face_count() != 0) {
-    set_face_count(from.face_count());
+    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
 }
 
-void EnrollmentInfo::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentInfo)
+void EnrollmentListResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentListResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void EnrollmentInfo::CopyFrom(const EnrollmentInfo& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentInfo)
+void EnrollmentListResponse::CopyFrom(const EnrollmentListResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentListResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool EnrollmentInfo::IsInitialized() const {
+bool EnrollmentListResponse::IsInitialized() const {
   return true;
 }
 
-void EnrollmentInfo::Swap(EnrollmentInfo* other) {
+void EnrollmentListResponse::Swap(EnrollmentListResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void EnrollmentInfo::InternalSwap(EnrollmentInfo* other) {
+void EnrollmentListResponse::InternalSwap(EnrollmentListResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  name_.Swap(&other->name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  CastToBase(&enrollments_)->InternalSwap(CastToBase(&other->enrollments_));
+  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
-  swap(face_count_, other->face_count_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentInfo::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentListResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void EnrollmentListResponse::InitAsDefaultInstance() {
+void EnrollmentDeleteRequest::InitAsDefaultInstance() {
 }
-class EnrollmentListResponse::HasBitSetters {
+class EnrollmentDeleteRequest::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int EnrollmentListResponse::kGalleryNameFieldNumber;
-const int EnrollmentListResponse::kEnrollmentsFieldNumber;
+const int EnrollmentDeleteRequest::kGalleryNameFieldNumber;
+const int EnrollmentDeleteRequest::kSubjectIdFieldNumber;
+const int EnrollmentDeleteRequest::kGalleryKeyFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-EnrollmentListResponse::EnrollmentListResponse()
+EnrollmentDeleteRequest::EnrollmentDeleteRequest()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:EnrollmentListResponse)
+  // @@protoc_insertion_point(constructor:EnrollmentDeleteRequest)
 }
-EnrollmentListResponse::EnrollmentListResponse(const EnrollmentListResponse& from)
+EnrollmentDeleteRequest::EnrollmentDeleteRequest(const EnrollmentDeleteRequest& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
-      _internal_metadata_(nullptr),
-      enrollments_(from.enrollments_) {
+      _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   if (from.gallery_name().size() > 0) {
     gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  // @@protoc_insertion_point(copy_constructor:EnrollmentListResponse)
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.subject_id().size() > 0) {
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  gallery_key_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.gallery_key().size() > 0) {
+    gallery_key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_key_);
+  }
+  // @@protoc_insertion_point(copy_constructor:EnrollmentDeleteRequest)
 }
 
-void EnrollmentListResponse::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentListResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+void EnrollmentDeleteRequest::SharedCtor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  gallery_key_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-EnrollmentListResponse::~EnrollmentListResponse() {
-  // @@protoc_insertion_point(destructor:EnrollmentListResponse)
+EnrollmentDeleteRequest::~EnrollmentDeleteRequest() {
+  // @@protoc_insertion_point(destructor:EnrollmentDeleteRequest)
   SharedDtor();
 }
 
-void EnrollmentListResponse::SharedDtor() {
+void EnrollmentDeleteRequest::SharedDtor() {
   gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  gallery_key_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
-void EnrollmentListResponse::SetCachedSize(int size) const {
+void EnrollmentDeleteRequest::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const EnrollmentListResponse& EnrollmentListResponse::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentListResponse_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollmentDeleteRequest& EnrollmentDeleteRequest::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void EnrollmentListResponse::Clear() {
-// @@protoc_insertion_point(message_clear_start:EnrollmentListResponse)
+void EnrollmentDeleteRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollmentDeleteRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  enrollments_.Clear();
   gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  gallery_key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* EnrollmentListResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollmentDeleteRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
@@ -16107,20 +24340,22 @@ const char* EnrollmentListResponse::_InternalParse(const char* ptr, ::PROTOBUF_N
       // string gallery_name = 1;
       case 1:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentListResponse.gallery_name");
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentDeleteRequest.gallery_name");
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
-      // repeated .EnrollmentInfo enrollments = 2;
+      // string subject_id = 2;
       case 2:
         if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr -= 1;
-          do {
-            ptr += 1;
-            ptr = ctx->ParseMessage(add_enrollments(), ptr);
-            CHK_(ptr);
-            if (!ctx->DataAvailable(ptr)) break;
-          } while (::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<::PROTOBUF_NAMESPACE_ID::uint8>(ptr) == 18);
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "EnrollmentDeleteRequest.subject_id");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string gallery_key = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_key(), ptr, ctx, "EnrollmentDeleteRequest.gallery_key");
+          CHK_(ptr);
         } else goto handle_unusual;
         continue;
       default: {
@@ -16143,11 +24378,11 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool EnrollmentListResponse::MergePartialFromCodedStream(
+bool EnrollmentDeleteRequest::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:EnrollmentListResponse)
+  // @@protoc_insertion_point(parse_start:EnrollmentDeleteRequest)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
@@ -16161,18 +24396,37 @@ bool EnrollmentListResponse::MergePartialFromCodedStream(
           DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
             this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
             ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentListResponse.gallery_name"));
+            "EnrollmentDeleteRequest.gallery_name"));
         } else {
           goto handle_unusual;
         }
         break;
       }
 
-      // repeated .EnrollmentInfo enrollments = 2;
+      // string subject_id = 2;
       case 2: {
         if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadMessage(
-                input, add_enrollments()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_subject_id()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "EnrollmentDeleteRequest.subject_id"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string gallery_key = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (26 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_gallery_key()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->gallery_key().data(), static_cast<int>(this->gallery_key().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "EnrollmentDeleteRequest.gallery_key"));
         } else {
           goto handle_unusual;
         }
@@ -16191,18 +24445,18 @@ bool EnrollmentListResponse::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:EnrollmentListResponse)
+  // @@protoc_insertion_point(parse_success:EnrollmentDeleteRequest)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:EnrollmentListResponse)
+  // @@protoc_insertion_point(parse_failure:EnrollmentDeleteRequest)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void EnrollmentListResponse::SerializeWithCachedSizes(
+void EnrollmentDeleteRequest::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:EnrollmentListResponse)
+  // @@protoc_insertion_point(serialize_start:EnrollmentDeleteRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
@@ -16211,30 +24465,41 @@ void EnrollmentListResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
       this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentListResponse.gallery_name");
+      "EnrollmentDeleteRequest.gallery_name");
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
       1, this->gallery_name(), output);
   }
 
-  // repeated .EnrollmentInfo enrollments = 2;
-  for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->enrollments_size()); i < n; i++) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteMessageMaybeToArray(
-      2,
-      this->enrollments(static_cast<int>(i)),
-      output);
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentDeleteRequest.subject_id");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      2, this->subject_id(), output);
+  }
+
+  // string gallery_key = 3;
+  if (this->gallery_key().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_key().data(), static_cast<int>(this->gallery_key().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentDeleteRequest.gallery_key");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      3, this->gallery_key(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:EnrollmentListResponse)
+  // @@protoc_insertion_point(serialize_end:EnrollmentDeleteRequest)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentListResponse::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentDeleteRequest::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentListResponse)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentDeleteRequest)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
@@ -16243,30 +24508,44 @@ void EnrollmentListResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
       this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentListResponse.gallery_name");
+      "EnrollmentDeleteRequest.gallery_name");
     target =
       ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
         1, this->gallery_name(), target);
   }
 
-  // repeated .EnrollmentInfo enrollments = 2;
-  for (unsigned int i = 0,
-      n = static_cast<unsigned int>(this->enrollments_size()); i < n; i++) {
-    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
-      InternalWriteMessageToArray(
-        2, this->enrollments(static_cast<int>(i)), target);
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentDeleteRequest.subject_id");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        2, this->subject_id(), target);
+  }
+
+  // string gallery_key = 3;
+  if (this->gallery_key().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->gallery_key().data(), static_cast<int>(this->gallery_key().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "EnrollmentDeleteRequest.gallery_key");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        3, this->gallery_key(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentListResponse)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentDeleteRequest)
   return target;
 }
 
-size_t EnrollmentListResponse::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:EnrollmentListResponse)
+size_t EnrollmentDeleteRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollmentDeleteRequest)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -16278,17 +24557,6 @@ size_t EnrollmentListResponse::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // repeated .EnrollmentInfo enrollments = 2;
-  {
-    unsigned int count = static_cast<unsigned int>(this->enrollments_size());
-    total_size += 1UL * count;
-    for (unsigned int i = 0; i < count; i++) {
-      total_size +=
-        ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(
-          this->enrollments(static_cast<int>(i)));
-    }
-  }
-
   // string gallery_name = 1;
   if (this->gallery_name().size() > 0) {
     total_size += 1 +
@@ -16296,163 +24564,167 @@ size_t EnrollmentListResponse::ByteSizeLong() const {
         this->gallery_name());
   }
 
+  // string subject_id = 2;
+  if (this->subject_id().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->subject_id());
+  }
+
+  // string gallery_key = 3;
+  if (this->gallery_key().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->gallery_key());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
 }
 
-void EnrollmentListResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentListResponse)
+void EnrollmentDeleteRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentDeleteRequest)
   GOOGLE_DCHECK_NE(&from, this);
-  const EnrollmentListResponse* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentListResponse>(
+  const EnrollmentDeleteRequest* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentDeleteRequest>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentListResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentDeleteRequest)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentListResponse)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentDeleteRequest)
     MergeFrom(*source);
   }
 }
 
-void EnrollmentListResponse::MergeFrom(const EnrollmentListResponse& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentListResponse)
+void EnrollmentDeleteRequest::MergeFrom(const EnrollmentDeleteRequest& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentDeleteRequest)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  enrollments_.MergeFrom(from.enrollments_);
   if (from.gallery_name().size() > 0) {
 
     gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
+  if (from.subject_id().size() > 0) {
+
+    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  }
+  if (from.gallery_key().size() > 0) {
+
+    gallery_key_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_key_);
+  }
 }
 
-void EnrollmentListResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentListResponse)
+void EnrollmentDeleteRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentDeleteRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void EnrollmentListResponse::CopyFrom(const EnrollmentListResponse& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentListResponse)
+void EnrollmentDeleteRequest::CopyFrom(const EnrollmentDeleteRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentDeleteRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool EnrollmentListResponse::IsInitialized() const {
+bool EnrollmentDeleteRequest::IsInitialized() const {
   return true;
 }
 
-void EnrollmentListResponse::Swap(EnrollmentListResponse* other) {
+void EnrollmentDeleteRequest::Swap(EnrollmentDeleteRequest* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void EnrollmentListResponse::InternalSwap(EnrollmentListResponse* other) {
+void EnrollmentDeleteRequest::InternalSwap(EnrollmentDeleteRequest* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  CastToBase(&enrollments_)->InternalSwap(CastToBase(&other->enrollments_));
   gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
+  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
+  gallery_key_.Swap(&other->gallery_key_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentListResponse::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentDeleteRequest::GetMetadata() const {
   return GetMetadataStatic();
 }
 
 
 // ===================================================================
 
-void EnrollmentDeleteRequest::InitAsDefaultInstance() {
+void EnrollmentDeleteResponse::InitAsDefaultInstance() {
 }
-class EnrollmentDeleteRequest::HasBitSetters {
+class EnrollmentDeleteResponse::HasBitSetters {
  public:
 };
 
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
-const int EnrollmentDeleteRequest::kGalleryNameFieldNumber;
-const int EnrollmentDeleteRequest::kSubjectIdFieldNumber;
+const int EnrollmentDeleteResponse::kDeleteCountFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
-EnrollmentDeleteRequest::EnrollmentDeleteRequest()
+EnrollmentDeleteResponse::EnrollmentDeleteResponse()
   : ::PROTOBUF_NAMESPACE_ID::Message(), _internal_metadata_(nullptr) {
   SharedCtor();
-  // @@protoc_insertion_point(constructor:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(constructor:EnrollmentDeleteResponse)
 }
-EnrollmentDeleteRequest::EnrollmentDeleteRequest(const EnrollmentDeleteRequest& from)
+EnrollmentDeleteResponse::EnrollmentDeleteResponse(const EnrollmentDeleteResponse& from)
   : ::PROTOBUF_NAMESPACE_ID::Message(),
       _internal_metadata_(nullptr) {
   _internal_metadata_.MergeFrom(from._internal_metadata_);
-  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.gallery_name().size() > 0) {
-    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
-  }
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  if (from.subject_id().size() > 0) {
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
-  }
-  // @@protoc_insertion_point(copy_constructor:EnrollmentDeleteRequest)
+  delete_count_ = from.delete_count_;
+  // @@protoc_insertion_point(copy_constructor:EnrollmentDeleteResponse)
 }
 
-void EnrollmentDeleteRequest::SharedCtor() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
-  gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollmentDeleteResponse::SharedCtor() {
+  delete_count_ = PROTOBUF_LONGLONG(0);
 }
 
-EnrollmentDeleteRequest::~EnrollmentDeleteRequest() {
-  // @@protoc_insertion_point(destructor:EnrollmentDeleteRequest)
+EnrollmentDeleteResponse::~EnrollmentDeleteResponse() {
+  // @@protoc_insertion_point(destructor:EnrollmentDeleteResponse)
   SharedDtor();
 }
 
-void EnrollmentDeleteRequest::SharedDtor() {
-  gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+void EnrollmentDeleteResponse::SharedDtor() {
 }
 
-void EnrollmentDeleteRequest::SetCachedSize(int size) const {
+void EnrollmentDeleteResponse::SetCachedSize(int size) const {
   _cached_size_.Set(size);
 }
-const EnrollmentDeleteRequest& EnrollmentDeleteRequest::default_instance() {
-  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentDeleteRequest_faro_2fproto_2fface_5fservice_2eproto.base);
+const EnrollmentDeleteResponse& EnrollmentDeleteResponse::default_instance() {
+  ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&::scc_info_EnrollmentDeleteResponse_faro_2fproto_2fface_5fservice_2eproto.base);
   return *internal_default_instance();
 }
 
 
-void EnrollmentDeleteRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:EnrollmentDeleteRequest)
+void EnrollmentDeleteResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:EnrollmentDeleteResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  delete_count_ = PROTOBUF_LONGLONG(0);
   _internal_metadata_.Clear();
 }
 
 #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-const char* EnrollmentDeleteRequest::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
+const char* EnrollmentDeleteResponse::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) {
 #define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
   while (!ctx->Done(&ptr)) {
     ::PROTOBUF_NAMESPACE_ID::uint32 tag;
     ptr = ::PROTOBUF_NAMESPACE_ID::internal::ReadTag(ptr, &tag);
     CHK_(ptr);
     switch (tag >> 3) {
-      // string gallery_name = 1;
+      // int64 delete_count = 1;
       case 1:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 10)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_gallery_name(), ptr, ctx, "EnrollmentDeleteRequest.gallery_name");
-          CHK_(ptr);
-        } else goto handle_unusual;
-        continue;
-      // string subject_id = 2;
-      case 2:
-        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 18)) {
-          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_subject_id(), ptr, ctx, "EnrollmentDeleteRequest.subject_id");
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 8)) {
+          delete_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
@@ -16476,40 +24748,23 @@ failure:
 #undef CHK_
 }
 #else  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
-bool EnrollmentDeleteRequest::MergePartialFromCodedStream(
+bool EnrollmentDeleteResponse::MergePartialFromCodedStream(
     ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) {
 #define DO_(EXPRESSION) if (!PROTOBUF_PREDICT_TRUE(EXPRESSION)) goto failure
   ::PROTOBUF_NAMESPACE_ID::uint32 tag;
-  // @@protoc_insertion_point(parse_start:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(parse_start:EnrollmentDeleteResponse)
   for (;;) {
     ::std::pair<::PROTOBUF_NAMESPACE_ID::uint32, bool> p = input->ReadTagWithCutoffNoLastTag(127u);
     tag = p.first;
     if (!p.second) goto handle_unusual;
     switch (::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // string gallery_name = 1;
+      // int64 delete_count = 1;
       case 1: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (10 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_gallery_name()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentDeleteRequest.gallery_name"));
-        } else {
-          goto handle_unusual;
-        }
-        break;
-      }
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (8 & 0xFF)) {
 
-      // string subject_id = 2;
-      case 2: {
-        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (18 & 0xFF)) {
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
-                input, this->mutable_subject_id()));
-          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-            this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
-            "EnrollmentDeleteRequest.subject_id"));
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &delete_count_)));
         } else {
           goto handle_unusual;
         }
@@ -16528,86 +24783,54 @@ bool EnrollmentDeleteRequest::MergePartialFromCodedStream(
     }
   }
 success:
-  // @@protoc_insertion_point(parse_success:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(parse_success:EnrollmentDeleteResponse)
   return true;
 failure:
-  // @@protoc_insertion_point(parse_failure:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(parse_failure:EnrollmentDeleteResponse)
   return false;
 #undef DO_
 }
 #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
 
-void EnrollmentDeleteRequest::SerializeWithCachedSizes(
+void EnrollmentDeleteResponse::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const {
-  // @@protoc_insertion_point(serialize_start:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(serialize_start:EnrollmentDeleteResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentDeleteRequest.gallery_name");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      1, this->gallery_name(), output);
-  }
-
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentDeleteRequest.subject_id");
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
-      2, this->subject_id(), output);
+  // int64 delete_count = 1;
+  if (this->delete_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(1, this->delete_count(), output);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
   }
-  // @@protoc_insertion_point(serialize_end:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(serialize_end:EnrollmentDeleteResponse)
 }
 
-::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentDeleteRequest::InternalSerializeWithCachedSizesToArray(
+::PROTOBUF_NAMESPACE_ID::uint8* EnrollmentDeleteResponse::InternalSerializeWithCachedSizesToArray(
     ::PROTOBUF_NAMESPACE_ID::uint8* target) const {
-  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:EnrollmentDeleteResponse)
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->gallery_name().data(), static_cast<int>(this->gallery_name().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentDeleteRequest.gallery_name");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        1, this->gallery_name(), target);
-  }
-
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
-    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
-      this->subject_id().data(), static_cast<int>(this->subject_id().length()),
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
-      "EnrollmentDeleteRequest.subject_id");
-    target =
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
-        2, this->subject_id(), target);
+  // int64 delete_count = 1;
+  if (this->delete_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(1, this->delete_count(), target);
   }
 
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:EnrollmentDeleteResponse)
   return target;
 }
 
-size_t EnrollmentDeleteRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:EnrollmentDeleteRequest)
+size_t EnrollmentDeleteResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EnrollmentDeleteResponse)
   size_t total_size = 0;
 
   if (_internal_metadata_.have_unknown_fields()) {
@@ -16619,18 +24842,11 @@ size_t EnrollmentDeleteRequest::ByteSizeLong() const {
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string gallery_name = 1;
-  if (this->gallery_name().size() > 0) {
-    total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->gallery_name());
-  }
-
-  // string subject_id = 2;
-  if (this->subject_id().size() > 0) {
+  // int64 delete_count = 1;
+  if (this->delete_count() != 0) {
     total_size += 1 +
-      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
-        this->subject_id());
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->delete_count());
   }
 
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
@@ -16638,70 +24854,62 @@ size_t EnrollmentDeleteRequest::ByteSizeLong() const {
   return total_size;
 }
 
-void EnrollmentDeleteRequest::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentDeleteRequest)
+void EnrollmentDeleteResponse::MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_merge_from_start:EnrollmentDeleteResponse)
   GOOGLE_DCHECK_NE(&from, this);
-  const EnrollmentDeleteRequest* source =
-      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentDeleteRequest>(
+  const EnrollmentDeleteResponse* source =
+      ::PROTOBUF_NAMESPACE_ID::DynamicCastToGenerated<EnrollmentDeleteResponse>(
           &from);
   if (source == nullptr) {
-  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_fail:EnrollmentDeleteResponse)
     ::PROTOBUF_NAMESPACE_ID::internal::ReflectionOps::Merge(from, this);
   } else {
-  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentDeleteRequest)
+  // @@protoc_insertion_point(generalized_merge_from_cast_success:EnrollmentDeleteResponse)
     MergeFrom(*source);
   }
 }
 
-void EnrollmentDeleteRequest::MergeFrom(const EnrollmentDeleteRequest& from) {
-// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentDeleteRequest)
+void EnrollmentDeleteResponse::MergeFrom(const EnrollmentDeleteResponse& from) {
+// @@protoc_insertion_point(class_specific_merge_from_start:EnrollmentDeleteResponse)
   GOOGLE_DCHECK_NE(&from, this);
   _internal_metadata_.MergeFrom(from._internal_metadata_);
   ::PROTOBUF_NAMESPACE_ID::uint32 cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (from.gallery_name().size() > 0) {
-
-    gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
-  }
-  if (from.subject_id().size() > 0) {
-
-    subject_id_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.subject_id_);
+  if (from.delete_count() != 0) {
+    set_delete_count(from.delete_count());
   }
 }
 
-void EnrollmentDeleteRequest::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
-// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentDeleteRequest)
+void EnrollmentDeleteResponse::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
+// @@protoc_insertion_point(generalized_copy_from_start:EnrollmentDeleteResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-void EnrollmentDeleteRequest::CopyFrom(const EnrollmentDeleteRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentDeleteRequest)
+void EnrollmentDeleteResponse::CopyFrom(const EnrollmentDeleteResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EnrollmentDeleteResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-bool EnrollmentDeleteRequest::IsInitialized() const {
+bool EnrollmentDeleteResponse::IsInitialized() const {
   return true;
 }
 
-void EnrollmentDeleteRequest::Swap(EnrollmentDeleteRequest* other) {
+void EnrollmentDeleteResponse::Swap(EnrollmentDeleteResponse* other) {
   if (other == this) return;
   InternalSwap(other);
 }
-void EnrollmentDeleteRequest::InternalSwap(EnrollmentDeleteRequest* other) {
+void EnrollmentDeleteResponse::InternalSwap(EnrollmentDeleteResponse* other) {
   using std::swap;
   _internal_metadata_.Swap(&other->_internal_metadata_);
-  gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
-  subject_id_.Swap(&other->subject_id_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-    GetArenaNoVirtual());
+  swap(delete_count_, other->delete_count_);
 }
 
-::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentDeleteRequest::GetMetadata() const {
+::PROTOBUF_NAMESPACE_ID::Metadata EnrollmentDeleteResponse::GetMetadata() const {
   return GetMetadataStatic();
 }
 
@@ -16717,6 +24925,11 @@ class GalleryInfo::HasBitSetters {
 #if !defined(_MSC_VER) || _MSC_VER >= 1900
 const int GalleryInfo::kGalleryNameFieldNumber;
 const int GalleryInfo::kFaceCountFieldNumber;
+const int GalleryInfo::kSubjectCountFieldNumber;
+const int GalleryInfo::kTemplateDimFieldNumber;
+const int GalleryInfo::kFileBytesFieldNumber;
+const int GalleryInfo::kIndexStateFieldNumber;
+const int GalleryInfo::kModifiedFieldNumber;
 #endif  // !defined(_MSC_VER) || _MSC_VER >= 1900
 
 GalleryInfo::GalleryInfo()
@@ -16732,14 +24945,23 @@ GalleryInfo::GalleryInfo(const GalleryInfo& from)
   if (from.gallery_name().size() > 0) {
     gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
-  face_count_ = from.face_count_;
+  index_state_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (from.index_state().size() > 0) {
+    index_state_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.index_state_);
+  }
+  ::memcpy(&face_count_, &from.face_count_,
+    static_cast<size_t>(reinterpret_cast<char*>(&template_dim_) -
+    reinterpret_cast<char*>(&face_count_)) + sizeof(template_dim_));
   // @@protoc_insertion_point(copy_constructor:GalleryInfo)
 }
 
 void GalleryInfo::SharedCtor() {
   ::PROTOBUF_NAMESPACE_ID::internal::InitSCC(&scc_info_GalleryInfo_faro_2fproto_2fface_5fservice_2eproto.base);
   gallery_name_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  face_count_ = PROTOBUF_LONGLONG(0);
+  index_state_.UnsafeSetDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&face_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&template_dim_) -
+      reinterpret_cast<char*>(&face_count_)) + sizeof(template_dim_));
 }
 
 GalleryInfo::~GalleryInfo() {
@@ -16749,6 +24971,7 @@ GalleryInfo::~GalleryInfo() {
 
 void GalleryInfo::SharedDtor() {
   gallery_name_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  index_state_.DestroyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
 
 void GalleryInfo::SetCachedSize(int size) const {
@@ -16767,7 +24990,10 @@ void GalleryInfo::Clear() {
   (void) cached_has_bits;
 
   gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-  face_count_ = PROTOBUF_LONGLONG(0);
+  index_state_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::memset(&face_count_, 0, static_cast<size_t>(
+      reinterpret_cast<char*>(&template_dim_) -
+      reinterpret_cast<char*>(&face_count_)) + sizeof(template_dim_));
   _internal_metadata_.Clear();
 }
 
@@ -16793,6 +25019,41 @@ const char* GalleryInfo::_InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID
           CHK_(ptr);
         } else goto handle_unusual;
         continue;
+      // int64 subject_count = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 24)) {
+          subject_count_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int32 template_dim = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 32)) {
+          template_dim_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // int64 file_bytes = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 40)) {
+          file_bytes_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint(&ptr);
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // string index_state = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 50)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::InlineGreedyStringParserUTF8(mutable_index_state(), ptr, ctx, "GalleryInfo.index_state");
+          CHK_(ptr);
+        } else goto handle_unusual;
+        continue;
+      // double modified = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<::PROTOBUF_NAMESPACE_ID::uint8>(tag) == 57)) {
+          modified_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else goto handle_unusual;
+        continue;
       default: {
       handle_unusual:
         if ((tag & 7) == 4 || tag == 0) {
@@ -16851,6 +25112,73 @@ bool GalleryInfo::MergePartialFromCodedStream(
         break;
       }
 
+      // int64 subject_count = 3;
+      case 3: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (24 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &subject_count_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int32 template_dim = 4;
+      case 4: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (32 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int32, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT32>(
+                 input, &template_dim_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // int64 file_bytes = 5;
+      case 5: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (40 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   ::PROTOBUF_NAMESPACE_ID::int64, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_INT64>(
+                 input, &file_bytes_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // string index_state = 6;
+      case 6: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (50 & 0xFF)) {
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadString(
+                input, this->mutable_index_state()));
+          DO_(::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+            this->index_state().data(), static_cast<int>(this->index_state().length()),
+            ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::PARSE,
+            "GalleryInfo.index_state"));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
+      // double modified = 7;
+      case 7: {
+        if (static_cast< ::PROTOBUF_NAMESPACE_ID::uint8>(tag) == (57 & 0xFF)) {
+
+          DO_((::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::ReadPrimitive<
+                   double, ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::TYPE_DOUBLE>(
+                 input, &modified_)));
+        } else {
+          goto handle_unusual;
+        }
+        break;
+      }
+
       default: {
       handle_unusual:
         if (tag == 0) {
@@ -16893,6 +25221,36 @@ void GalleryInfo::SerializeWithCachedSizes(
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(2, this->face_count(), output);
   }
 
+  // int64 subject_count = 3;
+  if (this->subject_count() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(3, this->subject_count(), output);
+  }
+
+  // int32 template_dim = 4;
+  if (this->template_dim() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32(4, this->template_dim(), output);
+  }
+
+  // int64 file_bytes = 5;
+  if (this->file_bytes() != 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64(5, this->file_bytes(), output);
+  }
+
+  // string index_state = 6;
+  if (this->index_state().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->index_state().data(), static_cast<int>(this->index_state().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryInfo.index_state");
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringMaybeAliased(
+      6, this->index_state(), output);
+  }
+
+  // double modified = 7;
+  if (!(this->modified() <= 0 && this->modified() >= 0)) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteDouble(7, this->modified(), output);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFields(
         _internal_metadata_.unknown_fields(), output);
@@ -16922,6 +25280,37 @@ void GalleryInfo::SerializeWithCachedSizes(
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(2, this->face_count(), target);
   }
 
+  // int64 subject_count = 3;
+  if (this->subject_count() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(3, this->subject_count(), target);
+  }
+
+  // int32 template_dim = 4;
+  if (this->template_dim() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt32ToArray(4, this->template_dim(), target);
+  }
+
+  // int64 file_bytes = 5;
+  if (this->file_bytes() != 0) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteInt64ToArray(5, this->file_bytes(), target);
+  }
+
+  // string index_state = 6;
+  if (this->index_state().size() > 0) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::VerifyUtf8String(
+      this->index_state().data(), static_cast<int>(this->index_state().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::SERIALIZE,
+      "GalleryInfo.index_state");
+    target =
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteStringToArray(
+        6, this->index_state(), target);
+  }
+
+  // double modified = 7;
+  if (!(this->modified() <= 0 && this->modified() >= 0)) {
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::WriteDoubleToArray(7, this->modified(), target);
+  }
+
   if (_internal_metadata_.have_unknown_fields()) {
     target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SerializeUnknownFieldsToArray(
         _internal_metadata_.unknown_fields(), target);
@@ -16950,6 +25339,13 @@ size_t GalleryInfo::ByteSizeLong() const {
         this->gallery_name());
   }
 
+  // string index_state = 6;
+  if (this->index_state().size() > 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->index_state());
+  }
+
   // int64 face_count = 2;
   if (this->face_count() != 0) {
     total_size += 1 +
@@ -16957,6 +25353,32 @@ size_t GalleryInfo::ByteSizeLong() const {
         this->face_count());
   }
 
+  // int64 subject_count = 3;
+  if (this->subject_count() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->subject_count());
+  }
+
+  // int64 file_bytes = 5;
+  if (this->file_bytes() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int64Size(
+        this->file_bytes());
+  }
+
+  // double modified = 7;
+  if (!(this->modified() <= 0 && this->modified() >= 0)) {
+    total_size += 1 + 8;
+  }
+
+  // int32 template_dim = 4;
+  if (this->template_dim() != 0) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::Int32Size(
+        this->template_dim());
+  }
+
   int cached_size = ::PROTOBUF_NAMESPACE_ID::internal::ToCachedSize(total_size);
   SetCachedSize(cached_size);
   return total_size;
@@ -16988,9 +25410,25 @@ void GalleryInfo::MergeFrom(const GalleryInfo& from) {
 
     gallery_name_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.gallery_name_);
   }
+  if (from.index_state().size() > 0) {
+
+    index_state_.AssignWithDefault(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), from.index_state_);
+  }
   if (from.face_count() != 0) {
     set_face_count(from.face_count());
   }
+  if (from.subject_count() != 0) {
+    set_subject_count(from.subject_count());
+  }
+  if (from.file_bytes() != 0) {
+    set_file_bytes(from.file_bytes());
+  }
+  if (!(from.modified() <= 0 && from.modified() >= 0)) {
+    set_modified(from.modified());
+  }
+  if (from.template_dim() != 0) {
+    set_template_dim(from.template_dim());
+  }
 }
 
 void GalleryInfo::CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) {
@@ -17020,7 +25458,13 @@ void GalleryInfo::InternalSwap(GalleryInfo* other) {
   _internal_metadata_.Swap(&other->_internal_metadata_);
   gallery_name_.Swap(&other->gallery_name_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
     GetArenaNoVirtual());
+  index_state_.Swap(&other->index_state_, &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+    GetArenaNoVirtual());
   swap(face_count_, other->face_count_);
+  swap(subject_count_, other->subject_count_);
+  swap(file_bytes_, other->file_bytes_);
+  swap(modified_, other->modified_);
+  swap(template_dim_, other->template_dim_);
 }
 
 ::PROTOBUF_NAMESPACE_ID::Metadata GalleryInfo::GetMetadata() const {
@@ -17553,6 +25997,9 @@ template<> PROTOBUF_NOINLINE ::FaceRecord* Arena::CreateMaybeMessage< ::FaceReco
 template<> PROTOBUF_NOINLINE ::FaceRecordList* Arena::CreateMaybeMessage< ::FaceRecordList >(Arena* arena) {
   return Arena::CreateInternal< ::FaceRecordList >(arena);
 }
+template<> PROTOBUF_NOINLINE ::EnrollStats* Arena::CreateMaybeMessage< ::EnrollStats >(Arena* arena) {
+  return Arena::CreateInternal< ::EnrollStats >(arena);
+}
 template<> PROTOBUF_NOINLINE ::VerificationRequest* Arena::CreateMaybeMessage< ::VerificationRequest >(Arena* arena) {
   return Arena::CreateInternal< ::VerificationRequest >(arena);
 }
@@ -17562,12 +26009,21 @@ template<> PROTOBUF_NOINLINE ::VerificationResponse* Arena::CreateMaybeMessage<
 template<> PROTOBUF_NOINLINE ::SearchRequest* Arena::CreateMaybeMessage< ::SearchRequest >(Arena* arena) {
   return Arena::CreateInternal< ::SearchRequest >(arena);
 }
+template<> PROTOBUF_NOINLINE ::AttributeFilter* Arena::CreateMaybeMessage< ::AttributeFilter >(Arena* arena) {
+  return Arena::CreateInternal< ::AttributeFilter >(arena);
+}
+template<> PROTOBUF_NOINLINE ::SearchFilter* Arena::CreateMaybeMessage< ::SearchFilter >(Arena* arena) {
+  return Arena::CreateInternal< ::SearchFilter >(arena);
+}
 template<> PROTOBUF_NOINLINE ::SearchResponse* Arena::CreateMaybeMessage< ::SearchResponse >(Arena* arena) {
   return Arena::CreateInternal< ::SearchResponse >(arena);
 }
 template<> PROTOBUF_NOINLINE ::EnrollRequest* Arena::CreateMaybeMessage< ::EnrollRequest >(Arena* arena) {
   return Arena::CreateInternal< ::EnrollRequest >(arena);
 }
+template<> PROTOBUF_NOINLINE ::BulkEnrollResponse* Arena::CreateMaybeMessage< ::BulkEnrollResponse >(Arena* arena) {
+  return Arena::CreateInternal< ::BulkEnrollResponse >(arena);
+}
 template<> PROTOBUF_NOINLINE ::DetectRequest* Arena::CreateMaybeMessage< ::DetectRequest >(Arena* arena) {
   return Arena::CreateInternal< ::DetectRequest >(arena);
 }
@@ -17577,6 +26033,15 @@ template<> PROTOBUF_NOINLINE ::ExtractRequest* Arena::CreateMaybeMessage< ::Extr
 template<> PROTOBUF_NOINLINE ::ScoreRequest* Arena::CreateMaybeMessage< ::ScoreRequest >(Arena* arena) {
   return Arena::CreateInternal< ::ScoreRequest >(arena);
 }
+template<> PROTOBUF_NOINLINE ::ScoreBlock* Arena::CreateMaybeMessage< ::ScoreBlock >(Arena* arena) {
+  return Arena::CreateInternal< ::ScoreBlock >(arena);
+}
+template<> PROTOBUF_NOINLINE ::MatchDistributionRequest* Arena::CreateMaybeMessage< ::MatchDistributionRequest >(Arena* arena) {
+  return Arena::CreateInternal< ::MatchDistributionRequest >(arena);
+}
+template<> PROTOBUF_NOINLINE ::MatchDistribution* Arena::CreateMaybeMessage< ::MatchDistribution >(Arena* arena) {
+  return Arena::CreateInternal< ::MatchDistribution >(arena);
+}
 template<> PROTOBUF_NOINLINE ::DetectExtractRequest* Arena::CreateMaybeMessage< ::DetectExtractRequest >(Arena* arena) {
   return Arena::CreateInternal< ::DetectExtractRequest >(arena);
 }
@@ -17592,12 +26057,33 @@ template<> PROTOBUF_NOINLINE ::FaceStatusRequest* Arena::CreateMaybeMessage< ::F
 template<> PROTOBUF_NOINLINE ::FaceServiceInfo* Arena::CreateMaybeMessage< ::FaceServiceInfo >(Arena* arena) {
   return Arena::CreateInternal< ::FaceServiceInfo >(arena);
 }
+template<> PROTOBUF_NOINLINE ::GalleryCacheStats* Arena::CreateMaybeMessage< ::GalleryCacheStats >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryCacheStats >(arena);
+}
 template<> PROTOBUF_NOINLINE ::GalleryListRequest* Arena::CreateMaybeMessage< ::GalleryListRequest >(Arena* arena) {
   return Arena::CreateInternal< ::GalleryListRequest >(arena);
 }
 template<> PROTOBUF_NOINLINE ::GalleryDeleteRequest* Arena::CreateMaybeMessage< ::GalleryDeleteRequest >(Arena* arena) {
   return Arena::CreateInternal< ::GalleryDeleteRequest >(arena);
 }
+template<> PROTOBUF_NOINLINE ::GalleryConfigureRequest* Arena::CreateMaybeMessage< ::GalleryConfigureRequest >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryConfigureRequest >(arena);
+}
+template<> PROTOBUF_NOINLINE ::GalleryCompactRequest* Arena::CreateMaybeMessage< ::GalleryCompactRequest >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryCompactRequest >(arena);
+}
+template<> PROTOBUF_NOINLINE ::GalleryCompactResponse* Arena::CreateMaybeMessage< ::GalleryCompactResponse >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryCompactResponse >(arena);
+}
+template<> PROTOBUF_NOINLINE ::GalleryExportRequest* Arena::CreateMaybeMessage< ::GalleryExportRequest >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryExportRequest >(arena);
+}
+template<> PROTOBUF_NOINLINE ::GalleryChunk* Arena::CreateMaybeMessage< ::GalleryChunk >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryChunk >(arena);
+}
+template<> PROTOBUF_NOINLINE ::GalleryImportResponse* Arena::CreateMaybeMessage< ::GalleryImportResponse >(Arena* arena) {
+  return Arena::CreateInternal< ::GalleryImportResponse >(arena);
+}
 template<> PROTOBUF_NOINLINE ::EnrollmentListRequest* Arena::CreateMaybeMessage< ::EnrollmentListRequest >(Arena* arena) {
   return Arena::CreateInternal< ::EnrollmentListRequest >(arena);
 }
@@ -17610,6 +26096,9 @@ template<> PROTOBUF_NOINLINE ::EnrollmentListResponse* Arena::CreateMaybeMessage
 template<> PROTOBUF_NOINLINE ::EnrollmentDeleteRequest* Arena::CreateMaybeMessage< ::EnrollmentDeleteRequest >(Arena* arena) {
   return Arena::CreateInternal< ::EnrollmentDeleteRequest >(arena);
 }
+template<> PROTOBUF_NOINLINE ::EnrollmentDeleteResponse* Arena::CreateMaybeMessage< ::EnrollmentDeleteResponse >(Arena* arena) {
+  return Arena::CreateInternal< ::EnrollmentDeleteResponse >(arena);
+}
 template<> PROTOBUF_NOINLINE ::GalleryInfo* Arena::CreateMaybeMessage< ::GalleryInfo >(Arena* arena) {
   return Arena::CreateInternal< ::GalleryInfo >(arena);
 }
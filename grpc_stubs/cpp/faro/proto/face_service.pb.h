@@ -50,7 +50,7 @@ struct TableStruct_faro_2fproto_2fface_5fservice_2eproto {
     PROTOBUF_SECTION_VARIABLE(protodesc_cold);
   static const ::PROTOBUF_NAMESPACE_ID::internal::AuxillaryParseTableField aux[]
     PROTOBUF_SECTION_VARIABLE(protodesc_cold);
-  static const ::PROTOBUF_NAMESPACE_ID::internal::ParseTable schema[38]
+  static const ::PROTOBUF_NAMESPACE_ID::internal::ParseTable schema[53]
     PROTOBUF_SECTION_VARIABLE(protodesc_cold);
   static const ::PROTOBUF_NAMESPACE_ID::internal::FieldMetadata field_metadata[];
   static const ::PROTOBUF_NAMESPACE_ID::internal::SerializationTable serialization_table[];
@@ -63,6 +63,12 @@ extern AccessRecordDefaultTypeInternal _AccessRecord_default_instance_;
 class Attribute;
 class AttributeDefaultTypeInternal;
 extern AttributeDefaultTypeInternal _Attribute_default_instance_;
+class AttributeFilter;
+class AttributeFilterDefaultTypeInternal;
+extern AttributeFilterDefaultTypeInternal _AttributeFilter_default_instance_;
+class BulkEnrollResponse;
+class BulkEnrollResponseDefaultTypeInternal;
+extern BulkEnrollResponseDefaultTypeInternal _BulkEnrollResponse_default_instance_;
 class DetectExtractEnrollRequest;
 class DetectExtractEnrollRequestDefaultTypeInternal;
 extern DetectExtractEnrollRequestDefaultTypeInternal _DetectExtractEnrollRequest_default_instance_;
@@ -93,9 +99,15 @@ extern EnrollOptionsDefaultTypeInternal _EnrollOptions_default_instance_;
 class EnrollRequest;
 class EnrollRequestDefaultTypeInternal;
 extern EnrollRequestDefaultTypeInternal _EnrollRequest_default_instance_;
+class EnrollStats;
+class EnrollStatsDefaultTypeInternal;
+extern EnrollStatsDefaultTypeInternal _EnrollStats_default_instance_;
 class EnrollmentDeleteRequest;
 class EnrollmentDeleteRequestDefaultTypeInternal;
 extern EnrollmentDeleteRequestDefaultTypeInternal _EnrollmentDeleteRequest_default_instance_;
+class EnrollmentDeleteResponse;
+class EnrollmentDeleteResponseDefaultTypeInternal;
+extern EnrollmentDeleteResponseDefaultTypeInternal _EnrollmentDeleteResponse_default_instance_;
 class EnrollmentInfo;
 class EnrollmentInfoDefaultTypeInternal;
 extern EnrollmentInfoDefaultTypeInternal _EnrollmentInfo_default_instance_;
@@ -129,9 +141,30 @@ extern FaceStatusRequestDefaultTypeInternal _FaceStatusRequest_default_instance_
 class FaceTemplate;
 class FaceTemplateDefaultTypeInternal;
 extern FaceTemplateDefaultTypeInternal _FaceTemplate_default_instance_;
+class GalleryCacheStats;
+class GalleryCacheStatsDefaultTypeInternal;
+extern GalleryCacheStatsDefaultTypeInternal _GalleryCacheStats_default_instance_;
+class GalleryChunk;
+class GalleryChunkDefaultTypeInternal;
+extern GalleryChunkDefaultTypeInternal _GalleryChunk_default_instance_;
+class GalleryCompactRequest;
+class GalleryCompactRequestDefaultTypeInternal;
+extern GalleryCompactRequestDefaultTypeInternal _GalleryCompactRequest_default_instance_;
+class GalleryCompactResponse;
+class GalleryCompactResponseDefaultTypeInternal;
+extern GalleryCompactResponseDefaultTypeInternal _GalleryCompactResponse_default_instance_;
+class GalleryConfigureRequest;
+class GalleryConfigureRequestDefaultTypeInternal;
+extern GalleryConfigureRequestDefaultTypeInternal _GalleryConfigureRequest_default_instance_;
 class GalleryDeleteRequest;
 class GalleryDeleteRequestDefaultTypeInternal;
 extern GalleryDeleteRequestDefaultTypeInternal _GalleryDeleteRequest_default_instance_;
+class GalleryExportRequest;
+class GalleryExportRequestDefaultTypeInternal;
+extern GalleryExportRequestDefaultTypeInternal _GalleryExportRequest_default_instance_;
+class GalleryImportResponse;
+class GalleryImportResponseDefaultTypeInternal;
+extern GalleryImportResponseDefaultTypeInternal _GalleryImportResponse_default_instance_;
 class GalleryInfo;
 class GalleryInfoDefaultTypeInternal;
 extern GalleryInfoDefaultTypeInternal _GalleryInfo_default_instance_;
@@ -144,15 +177,27 @@ extern GalleryListRequestDefaultTypeInternal _GalleryListRequest_default_instanc
 class Landmark;
 class LandmarkDefaultTypeInternal;
 extern LandmarkDefaultTypeInternal _Landmark_default_instance_;
+class MatchDistribution;
+class MatchDistributionDefaultTypeInternal;
+extern MatchDistributionDefaultTypeInternal _MatchDistribution_default_instance_;
+class MatchDistributionRequest;
+class MatchDistributionRequestDefaultTypeInternal;
+extern MatchDistributionRequestDefaultTypeInternal _MatchDistributionRequest_default_instance_;
 class MatchInfo;
 class MatchInfoDefaultTypeInternal;
 extern MatchInfoDefaultTypeInternal _MatchInfo_default_instance_;
 class MatchList;
 class MatchListDefaultTypeInternal;
 extern MatchListDefaultTypeInternal _MatchList_default_instance_;
+class ScoreBlock;
+class ScoreBlockDefaultTypeInternal;
+extern ScoreBlockDefaultTypeInternal _ScoreBlock_default_instance_;
 class ScoreRequest;
 class ScoreRequestDefaultTypeInternal;
 extern ScoreRequestDefaultTypeInternal _ScoreRequest_default_instance_;
+class SearchFilter;
+class SearchFilterDefaultTypeInternal;
+extern SearchFilterDefaultTypeInternal _SearchFilter_default_instance_;
 class SearchRequest;
 class SearchRequestDefaultTypeInternal;
 extern SearchRequestDefaultTypeInternal _SearchRequest_default_instance_;
@@ -174,6 +219,8 @@ extern VerificationResponseDefaultTypeInternal _VerificationResponse_default_ins
 PROTOBUF_NAMESPACE_OPEN
 template<> ::AccessRecord* Arena::CreateMaybeMessage<::AccessRecord>(Arena*);
 template<> ::Attribute* Arena::CreateMaybeMessage<::Attribute>(Arena*);
+template<> ::AttributeFilter* Arena::CreateMaybeMessage<::AttributeFilter>(Arena*);
+template<> ::BulkEnrollResponse* Arena::CreateMaybeMessage<::BulkEnrollResponse>(Arena*);
 template<> ::DetectExtractEnrollRequest* Arena::CreateMaybeMessage<::DetectExtractEnrollRequest>(Arena*);
 template<> ::DetectExtractRequest* Arena::CreateMaybeMessage<::DetectExtractRequest>(Arena*);
 template<> ::DetectExtractSearchRequest* Arena::CreateMaybeMessage<::DetectExtractSearchRequest>(Arena*);
@@ -184,7 +231,9 @@ template<> ::DetectionOptions* Arena::CreateMaybeMessage<::DetectionOptions>(Are
 template<> ::Empty* Arena::CreateMaybeMessage<::Empty>(Arena*);
 template<> ::EnrollOptions* Arena::CreateMaybeMessage<::EnrollOptions>(Arena*);
 template<> ::EnrollRequest* Arena::CreateMaybeMessage<::EnrollRequest>(Arena*);
+template<> ::EnrollStats* Arena::CreateMaybeMessage<::EnrollStats>(Arena*);
 template<> ::EnrollmentDeleteRequest* Arena::CreateMaybeMessage<::EnrollmentDeleteRequest>(Arena*);
+template<> ::EnrollmentDeleteResponse* Arena::CreateMaybeMessage<::EnrollmentDeleteResponse>(Arena*);
 template<> ::EnrollmentInfo* Arena::CreateMaybeMessage<::EnrollmentInfo>(Arena*);
 template<> ::EnrollmentListRequest* Arena::CreateMaybeMessage<::EnrollmentListRequest>(Arena*);
 template<> ::EnrollmentListResponse* Arena::CreateMaybeMessage<::EnrollmentListResponse>(Arena*);
@@ -196,14 +245,25 @@ template<> ::FaceRecordList* Arena::CreateMaybeMessage<::FaceRecordList>(Arena*)
 template<> ::FaceServiceInfo* Arena::CreateMaybeMessage<::FaceServiceInfo>(Arena*);
 template<> ::FaceStatusRequest* Arena::CreateMaybeMessage<::FaceStatusRequest>(Arena*);
 template<> ::FaceTemplate* Arena::CreateMaybeMessage<::FaceTemplate>(Arena*);
+template<> ::GalleryCacheStats* Arena::CreateMaybeMessage<::GalleryCacheStats>(Arena*);
+template<> ::GalleryChunk* Arena::CreateMaybeMessage<::GalleryChunk>(Arena*);
+template<> ::GalleryCompactRequest* Arena::CreateMaybeMessage<::GalleryCompactRequest>(Arena*);
+template<> ::GalleryCompactResponse* Arena::CreateMaybeMessage<::GalleryCompactResponse>(Arena*);
+template<> ::GalleryConfigureRequest* Arena::CreateMaybeMessage<::GalleryConfigureRequest>(Arena*);
 template<> ::GalleryDeleteRequest* Arena::CreateMaybeMessage<::GalleryDeleteRequest>(Arena*);
+template<> ::GalleryExportRequest* Arena::CreateMaybeMessage<::GalleryExportRequest>(Arena*);
+template<> ::GalleryImportResponse* Arena::CreateMaybeMessage<::GalleryImportResponse>(Arena*);
 template<> ::GalleryInfo* Arena::CreateMaybeMessage<::GalleryInfo>(Arena*);
 template<> ::GalleryList* Arena::CreateMaybeMessage<::GalleryList>(Arena*);
 template<> ::GalleryListRequest* Arena::CreateMaybeMessage<::GalleryListRequest>(Arena*);
 template<> ::Landmark* Arena::CreateMaybeMessage<::Landmark>(Arena*);
+template<> ::MatchDistribution* Arena::CreateMaybeMessage<::MatchDistribution>(Arena*);
+template<> ::MatchDistributionRequest* Arena::CreateMaybeMessage<::MatchDistributionRequest>(Arena*);
 template<> ::MatchInfo* Arena::CreateMaybeMessage<::MatchInfo>(Arena*);
 template<> ::MatchList* Arena::CreateMaybeMessage<::MatchList>(Arena*);
+template<> ::ScoreBlock* Arena::CreateMaybeMessage<::ScoreBlock>(Arena*);
 template<> ::ScoreRequest* Arena::CreateMaybeMessage<::ScoreRequest>(Arena*);
+template<> ::SearchFilter* Arena::CreateMaybeMessage<::SearchFilter>(Arena*);
 template<> ::SearchRequest* Arena::CreateMaybeMessage<::SearchRequest>(Arena*);
 template<> ::SearchResponse* Arena::CreateMaybeMessage<::SearchResponse>(Arena*);
 template<> ::TemplateInput* Arena::CreateMaybeMessage<::TemplateInput>(Arena*);
@@ -1205,6 +1265,12 @@ class DetectionOptions :
   bool debug() const;
   void set_debug(bool value);
 
+  // int32 downsample = 11;
+  void clear_downsample();
+  static const int kDownsampleFieldNumber = 11;
+  ::PROTOBUF_NAMESPACE_ID::int32 downsample() const;
+  void set_downsample(::PROTOBUF_NAMESPACE_ID::int32 value);
+
   // @@protoc_insertion_point(class_scope:DetectionOptions)
  private:
   class HasBitSetters;
@@ -1220,6 +1286,7 @@ class DetectionOptions :
   bool best_;
   bool save_request_;
   bool debug_;
+  ::PROTOBUF_NAMESPACE_ID::int32 downsample_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
@@ -1517,6 +1584,18 @@ class EnrollOptions :
   bool debug() const;
   void set_debug(bool value);
 
+  // bool dedup_merge = 10;
+  void clear_dedup_merge();
+  static const int kDedupMergeFieldNumber = 10;
+  bool dedup_merge() const;
+  void set_dedup_merge(bool value);
+
+  // float dedup_distance = 9;
+  void clear_dedup_distance();
+  static const int kDedupDistanceFieldNumber = 9;
+  float dedup_distance() const;
+  void set_dedup_distance(float value);
+
   // @@protoc_insertion_point(class_scope:EnrollOptions)
  private:
   class HasBitSetters;
@@ -1525,6 +1604,8 @@ class EnrollOptions :
   ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute > attributes_;
   bool save_request_;
   bool debug_;
+  bool dedup_merge_;
+  float dedup_distance_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
@@ -2283,6 +2364,18 @@ class FaceTemplate :
   std::string* release_buffer();
   void set_allocated_buffer(std::string* buffer);
 
+  // string algorithm = 3;
+  void clear_algorithm();
+  static const int kAlgorithmFieldNumber = 3;
+  const std::string& algorithm() const;
+  void set_algorithm(const std::string& value);
+  void set_algorithm(std::string&& value);
+  void set_algorithm(const char* value);
+  void set_algorithm(const char* value, size_t size);
+  std::string* mutable_algorithm();
+  std::string* release_algorithm();
+  void set_allocated_algorithm(std::string* algorithm);
+
   // .Vector data = 1;
   bool has_data() const;
   void clear_data();
@@ -2298,6 +2391,7 @@ class FaceTemplate :
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
   ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr buffer_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr algorithm_;
   ::Vector* data_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
@@ -2830,6 +2924,18 @@ class FaceRecord :
   std::string* release_gallery_key();
   void set_allocated_gallery_key(std::string* gallery_key);
 
+  // string algorithm = 20;
+  void clear_algorithm();
+  static const int kAlgorithmFieldNumber = 20;
+  const std::string& algorithm() const;
+  void set_algorithm(const std::string& value);
+  void set_algorithm(std::string&& value);
+  void set_algorithm(const char* value);
+  void set_algorithm(const char* value, size_t size);
+  std::string* mutable_algorithm();
+  std::string* release_algorithm();
+  void set_allocated_algorithm(std::string* algorithm);
+
   // .Detection detection = 2;
   bool has_detection() const;
   void clear_detection();
@@ -2914,6 +3020,7 @@ class FaceRecord :
   ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
   ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr notes_;
   ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_key_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr algorithm_;
   ::Detection* detection_;
   ::FaceTemplate* template__;
   ::Image* view_;
@@ -3049,12 +3156,169 @@ class FaceRecordList :
   const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
       face_records() const;
 
+  // .EnrollStats enroll_stats = 3;
+  bool has_enroll_stats() const;
+  void clear_enroll_stats();
+  static const int kEnrollStatsFieldNumber = 3;
+  const ::EnrollStats& enroll_stats() const;
+  ::EnrollStats* release_enroll_stats();
+  ::EnrollStats* mutable_enroll_stats();
+  void set_allocated_enroll_stats(::EnrollStats* enroll_stats);
+
   // @@protoc_insertion_point(class_scope:FaceRecordList)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
   ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord > face_records_;
+  ::EnrollStats* enroll_stats_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollStats :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollStats) */ {
+ public:
+  EnrollStats();
+  virtual ~EnrollStats();
+
+  EnrollStats(const EnrollStats& from);
+  EnrollStats(EnrollStats&& from) noexcept
+    : EnrollStats() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollStats& operator=(const EnrollStats& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollStats& operator=(EnrollStats&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollStats& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollStats* internal_default_instance() {
+    return reinterpret_cast<const EnrollStats*>(
+               &_EnrollStats_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    16;
+
+  void Swap(EnrollStats* other);
+  friend void swap(EnrollStats& a, EnrollStats& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollStats* New() const final {
+    return CreateMaybeMessage<EnrollStats>(nullptr);
+  }
+
+  EnrollStats* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollStats>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollStats& from);
+  void MergeFrom(const EnrollStats& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollStats* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollStats";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // int64 enroll_count = 1;
+  void clear_enroll_count();
+  static const int kEnrollCountFieldNumber = 1;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count() const;
+  void set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 replace_count = 2;
+  void clear_replace_count();
+  static const int kReplaceCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count() const;
+  void set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 skip_count = 3;
+  void clear_skip_count();
+  static const int kSkipCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 skip_count() const;
+  void set_skip_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 merge_count = 4;
+  void clear_merge_count();
+  static const int kMergeCountFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 merge_count() const;
+  void set_merge_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:EnrollStats)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 skip_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 merge_count_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
@@ -3102,7 +3366,7 @@ class VerificationRequest :
                &_VerificationRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    16;
+    17;
 
   void Swap(VerificationRequest* other);
   friend void swap(VerificationRequest& a, VerificationRequest& b) {
@@ -3260,7 +3524,7 @@ class VerificationResponse :
                &_VerificationResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    17;
+    18;
 
   void Swap(VerificationResponse* other);
   friend void swap(VerificationResponse& a, VerificationResponse& b) {
@@ -3426,7 +3690,7 @@ class SearchRequest :
                &_SearchRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    18;
+    19;
 
   void Swap(SearchRequest* other);
   friend void swap(SearchRequest& a, SearchRequest& b) {
@@ -3514,6 +3778,15 @@ class SearchRequest :
   ::FaceRecordList* mutable_probes();
   void set_allocated_probes(::FaceRecordList* probes);
 
+  // .SearchFilter filter = 7;
+  bool has_filter() const;
+  void clear_filter();
+  static const int kFilterFieldNumber = 7;
+  const ::SearchFilter& filter() const;
+  ::SearchFilter* release_filter();
+  ::SearchFilter* mutable_filter();
+  void set_allocated_filter(::SearchFilter* filter);
+
   // int32 max_results = 4;
   void clear_max_results();
   static const int kMaxResultsFieldNumber = 4;
@@ -3526,6 +3799,12 @@ class SearchRequest :
   float threshold() const;
   void set_threshold(float value);
 
+  // int32 nprobe = 6;
+  void clear_nprobe();
+  static const int kNprobeFieldNumber = 6;
+  ::PROTOBUF_NAMESPACE_ID::int32 nprobe() const;
+  void set_nprobe(::PROTOBUF_NAMESPACE_ID::int32 value);
+
   // @@protoc_insertion_point(class_scope:SearchRequest)
  private:
   class HasBitSetters;
@@ -3533,30 +3812,32 @@ class SearchRequest :
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
   ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr search_gallery_;
   ::FaceRecordList* probes_;
+  ::SearchFilter* filter_;
   ::PROTOBUF_NAMESPACE_ID::int32 max_results_;
   float threshold_;
+  ::PROTOBUF_NAMESPACE_ID::int32 nprobe_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class SearchResponse :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:SearchResponse) */ {
+class AttributeFilter :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:AttributeFilter) */ {
  public:
-  SearchResponse();
-  virtual ~SearchResponse();
+  AttributeFilter();
+  virtual ~AttributeFilter();
 
-  SearchResponse(const SearchResponse& from);
-  SearchResponse(SearchResponse&& from) noexcept
-    : SearchResponse() {
+  AttributeFilter(const AttributeFilter& from);
+  AttributeFilter(AttributeFilter&& from) noexcept
+    : AttributeFilter() {
     *this = ::std::move(from);
   }
 
-  inline SearchResponse& operator=(const SearchResponse& from) {
+  inline AttributeFilter& operator=(const AttributeFilter& from) {
     CopyFrom(from);
     return *this;
   }
-  inline SearchResponse& operator=(SearchResponse&& from) noexcept {
+  inline AttributeFilter& operator=(AttributeFilter&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -3574,34 +3855,34 @@ class SearchResponse :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const SearchResponse& default_instance();
+  static const AttributeFilter& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const SearchResponse* internal_default_instance() {
-    return reinterpret_cast<const SearchResponse*>(
-               &_SearchResponse_default_instance_);
+  static inline const AttributeFilter* internal_default_instance() {
+    return reinterpret_cast<const AttributeFilter*>(
+               &_AttributeFilter_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    19;
+    20;
 
-  void Swap(SearchResponse* other);
-  friend void swap(SearchResponse& a, SearchResponse& b) {
+  void Swap(AttributeFilter* other);
+  friend void swap(AttributeFilter& a, AttributeFilter& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline SearchResponse* New() const final {
-    return CreateMaybeMessage<SearchResponse>(nullptr);
+  inline AttributeFilter* New() const final {
+    return CreateMaybeMessage<AttributeFilter>(nullptr);
   }
 
-  SearchResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<SearchResponse>(arena);
+  AttributeFilter* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<AttributeFilter>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const SearchResponse& from);
-  void MergeFrom(const SearchResponse& from);
+  void CopyFrom(const AttributeFilter& from);
+  void MergeFrom(const AttributeFilter& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -3622,10 +3903,10 @@ class SearchResponse :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(SearchResponse* other);
+  void InternalSwap(AttributeFilter* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "SearchResponse";
+    return "AttributeFilter";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -3649,53 +3930,79 @@ class SearchResponse :
 
   // accessors -------------------------------------------------------
 
-  // .ErrorMessage message = 1;
-  bool has_message() const;
-  void clear_message();
-  static const int kMessageFieldNumber = 1;
-  const ::ErrorMessage& message() const;
-  ::ErrorMessage* release_message();
-  ::ErrorMessage* mutable_message();
-  void set_allocated_message(::ErrorMessage* message);
+  // repeated string values = 2;
+  int values_size() const;
+  void clear_values();
+  static const int kValuesFieldNumber = 2;
+  const std::string& values(int index) const;
+  std::string* mutable_values(int index);
+  void set_values(int index, const std::string& value);
+  void set_values(int index, std::string&& value);
+  void set_values(int index, const char* value);
+  void set_values(int index, const char* value, size_t size);
+  std::string* add_values();
+  void add_values(const std::string& value);
+  void add_values(std::string&& value);
+  void add_values(const char* value);
+  void add_values(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& values() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_values();
 
-  // .FaceRecordList probes = 2;
-  bool has_probes() const;
-  void clear_probes();
-  static const int kProbesFieldNumber = 2;
-  const ::FaceRecordList& probes() const;
-  ::FaceRecordList* release_probes();
-  ::FaceRecordList* mutable_probes();
-  void set_allocated_probes(::FaceRecordList* probes);
+  // string key = 1;
+  void clear_key();
+  static const int kKeyFieldNumber = 1;
+  const std::string& key() const;
+  void set_key(const std::string& value);
+  void set_key(std::string&& value);
+  void set_key(const char* value);
+  void set_key(const char* value, size_t size);
+  std::string* mutable_key();
+  std::string* release_key();
+  void set_allocated_key(std::string* key);
 
-  // @@protoc_insertion_point(class_scope:SearchResponse)
+  // float min_value = 3;
+  void clear_min_value();
+  static const int kMinValueFieldNumber = 3;
+  float min_value() const;
+  void set_min_value(float value);
+
+  // float max_value = 4;
+  void clear_max_value();
+  static const int kMaxValueFieldNumber = 4;
+  float max_value() const;
+  void set_max_value(float value);
+
+  // @@protoc_insertion_point(class_scope:AttributeFilter)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::ErrorMessage* message_;
-  ::FaceRecordList* probes_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> values_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr key_;
+  float min_value_;
+  float max_value_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class EnrollRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollRequest) */ {
+class SearchFilter :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:SearchFilter) */ {
  public:
-  EnrollRequest();
-  virtual ~EnrollRequest();
+  SearchFilter();
+  virtual ~SearchFilter();
 
-  EnrollRequest(const EnrollRequest& from);
-  EnrollRequest(EnrollRequest&& from) noexcept
-    : EnrollRequest() {
+  SearchFilter(const SearchFilter& from);
+  SearchFilter(SearchFilter&& from) noexcept
+    : SearchFilter() {
     *this = ::std::move(from);
   }
 
-  inline EnrollRequest& operator=(const EnrollRequest& from) {
+  inline SearchFilter& operator=(const SearchFilter& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EnrollRequest& operator=(EnrollRequest&& from) noexcept {
+  inline SearchFilter& operator=(SearchFilter&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -3713,34 +4020,34 @@ class EnrollRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const EnrollRequest& default_instance();
+  static const SearchFilter& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const EnrollRequest* internal_default_instance() {
-    return reinterpret_cast<const EnrollRequest*>(
-               &_EnrollRequest_default_instance_);
+  static inline const SearchFilter* internal_default_instance() {
+    return reinterpret_cast<const SearchFilter*>(
+               &_SearchFilter_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    20;
+    21;
 
-  void Swap(EnrollRequest* other);
-  friend void swap(EnrollRequest& a, EnrollRequest& b) {
+  void Swap(SearchFilter* other);
+  friend void swap(SearchFilter& a, SearchFilter& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline EnrollRequest* New() const final {
-    return CreateMaybeMessage<EnrollRequest>(nullptr);
+  inline SearchFilter* New() const final {
+    return CreateMaybeMessage<SearchFilter>(nullptr);
   }
 
-  EnrollRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<EnrollRequest>(arena);
+  SearchFilter* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<SearchFilter>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const EnrollRequest& from);
-  void MergeFrom(const EnrollRequest& from);
+  void CopyFrom(const SearchFilter& from);
+  void MergeFrom(const SearchFilter& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -3761,10 +4068,10 @@ class EnrollRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(EnrollRequest* other);
+  void InternalSwap(SearchFilter* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "EnrollRequest";
+    return "SearchFilter";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -3788,66 +4095,112 @@ class EnrollRequest :
 
   // accessors -------------------------------------------------------
 
-  // string enroll_gallery = 1;
-  void clear_enroll_gallery();
-  static const int kEnrollGalleryFieldNumber = 1;
-  const std::string& enroll_gallery() const;
-  void set_enroll_gallery(const std::string& value);
-  void set_enroll_gallery(std::string&& value);
-  void set_enroll_gallery(const char* value);
-  void set_enroll_gallery(const char* value, size_t size);
-  std::string* mutable_enroll_gallery();
-  std::string* release_enroll_gallery();
-  void set_allocated_enroll_gallery(std::string* enroll_gallery);
-
-  // .FaceRecordList records = 2;
-  bool has_records() const;
-  void clear_records();
-  static const int kRecordsFieldNumber = 2;
-  const ::FaceRecordList& records() const;
-  ::FaceRecordList* release_records();
-  ::FaceRecordList* mutable_records();
-  void set_allocated_records(::FaceRecordList* records);
-
-  // .EnrollOptions enroll_options = 10;
-  bool has_enroll_options() const;
-  void clear_enroll_options();
-  static const int kEnrollOptionsFieldNumber = 10;
-  const ::EnrollOptions& enroll_options() const;
-  ::EnrollOptions* release_enroll_options();
-  ::EnrollOptions* mutable_enroll_options();
-  void set_allocated_enroll_options(::EnrollOptions* enroll_options);
+  // repeated string subject_ids = 1;
+  int subject_ids_size() const;
+  void clear_subject_ids();
+  static const int kSubjectIdsFieldNumber = 1;
+  const std::string& subject_ids(int index) const;
+  std::string* mutable_subject_ids(int index);
+  void set_subject_ids(int index, const std::string& value);
+  void set_subject_ids(int index, std::string&& value);
+  void set_subject_ids(int index, const char* value);
+  void set_subject_ids(int index, const char* value, size_t size);
+  std::string* add_subject_ids();
+  void add_subject_ids(const std::string& value);
+  void add_subject_ids(std::string&& value);
+  void add_subject_ids(const char* value);
+  void add_subject_ids(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& subject_ids() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_subject_ids();
+
+  // repeated string sources = 2;
+  int sources_size() const;
+  void clear_sources();
+  static const int kSourcesFieldNumber = 2;
+  const std::string& sources(int index) const;
+  std::string* mutable_sources(int index);
+  void set_sources(int index, const std::string& value);
+  void set_sources(int index, std::string&& value);
+  void set_sources(int index, const char* value);
+  void set_sources(int index, const char* value, size_t size);
+  std::string* add_sources();
+  void add_sources(const std::string& value);
+  void add_sources(std::string&& value);
+  void add_sources(const char* value);
+  void add_sources(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& sources() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_sources();
+
+  // repeated .AttributeFilter attributes = 7;
+  int attributes_size() const;
+  void clear_attributes();
+  static const int kAttributesFieldNumber = 7;
+  ::AttributeFilter* mutable_attributes(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AttributeFilter >*
+      mutable_attributes();
+  const ::AttributeFilter& attributes(int index) const;
+  ::AttributeFilter* add_attributes();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AttributeFilter >&
+      attributes() const;
 
-  // @@protoc_insertion_point(class_scope:EnrollRequest)
+  // float min_collection_date = 3;
+  void clear_min_collection_date();
+  static const int kMinCollectionDateFieldNumber = 3;
+  float min_collection_date() const;
+  void set_min_collection_date(float value);
+
+  // float max_collection_date = 4;
+  void clear_max_collection_date();
+  static const int kMaxCollectionDateFieldNumber = 4;
+  float max_collection_date() const;
+  void set_max_collection_date(float value);
+
+  // float min_enrollment_date = 5;
+  void clear_min_enrollment_date();
+  static const int kMinEnrollmentDateFieldNumber = 5;
+  float min_enrollment_date() const;
+  void set_min_enrollment_date(float value);
+
+  // float max_enrollment_date = 6;
+  void clear_max_enrollment_date();
+  static const int kMaxEnrollmentDateFieldNumber = 6;
+  float max_enrollment_date() const;
+  void set_max_enrollment_date(float value);
+
+  // @@protoc_insertion_point(class_scope:SearchFilter)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr enroll_gallery_;
-  ::FaceRecordList* records_;
-  ::EnrollOptions* enroll_options_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> subject_ids_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> sources_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AttributeFilter > attributes_;
+  float min_collection_date_;
+  float max_collection_date_;
+  float min_enrollment_date_;
+  float max_enrollment_date_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class DetectRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectRequest) */ {
+class SearchResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:SearchResponse) */ {
  public:
-  DetectRequest();
-  virtual ~DetectRequest();
-
-  DetectRequest(const DetectRequest& from);
-  DetectRequest(DetectRequest&& from) noexcept
-    : DetectRequest() {
+  SearchResponse();
+  virtual ~SearchResponse();
+
+  SearchResponse(const SearchResponse& from);
+  SearchResponse(SearchResponse&& from) noexcept
+    : SearchResponse() {
     *this = ::std::move(from);
   }
 
-  inline DetectRequest& operator=(const DetectRequest& from) {
+  inline SearchResponse& operator=(const SearchResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DetectRequest& operator=(DetectRequest&& from) noexcept {
+  inline SearchResponse& operator=(SearchResponse&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -3865,34 +4218,34 @@ class DetectRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const DetectRequest& default_instance();
+  static const SearchResponse& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const DetectRequest* internal_default_instance() {
-    return reinterpret_cast<const DetectRequest*>(
-               &_DetectRequest_default_instance_);
+  static inline const SearchResponse* internal_default_instance() {
+    return reinterpret_cast<const SearchResponse*>(
+               &_SearchResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    21;
+    22;
 
-  void Swap(DetectRequest* other);
-  friend void swap(DetectRequest& a, DetectRequest& b) {
+  void Swap(SearchResponse* other);
+  friend void swap(SearchResponse& a, SearchResponse& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline DetectRequest* New() const final {
-    return CreateMaybeMessage<DetectRequest>(nullptr);
+  inline SearchResponse* New() const final {
+    return CreateMaybeMessage<SearchResponse>(nullptr);
   }
 
-  DetectRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<DetectRequest>(arena);
+  SearchResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<SearchResponse>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const DetectRequest& from);
-  void MergeFrom(const DetectRequest& from);
+  void CopyFrom(const SearchResponse& from);
+  void MergeFrom(const SearchResponse& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -3913,10 +4266,10 @@ class DetectRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(DetectRequest* other);
+  void InternalSwap(SearchResponse* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "DetectRequest";
+    return "SearchResponse";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -3940,99 +4293,53 @@ class DetectRequest :
 
   // accessors -------------------------------------------------------
 
-  // string source = 2;
-  void clear_source();
-  static const int kSourceFieldNumber = 2;
-  const std::string& source() const;
-  void set_source(const std::string& value);
-  void set_source(std::string&& value);
-  void set_source(const char* value);
-  void set_source(const char* value, size_t size);
-  std::string* mutable_source();
-  std::string* release_source();
-  void set_allocated_source(std::string* source);
-
-  // string subject_id = 4;
-  void clear_subject_id();
-  static const int kSubjectIdFieldNumber = 4;
-  const std::string& subject_id() const;
-  void set_subject_id(const std::string& value);
-  void set_subject_id(std::string&& value);
-  void set_subject_id(const char* value);
-  void set_subject_id(const char* value, size_t size);
-  std::string* mutable_subject_id();
-  std::string* release_subject_id();
-  void set_allocated_subject_id(std::string* subject_id);
-
-  // string subject_name = 5;
-  void clear_subject_name();
-  static const int kSubjectNameFieldNumber = 5;
-  const std::string& subject_name() const;
-  void set_subject_name(const std::string& value);
-  void set_subject_name(std::string&& value);
-  void set_subject_name(const char* value);
-  void set_subject_name(const char* value, size_t size);
-  std::string* mutable_subject_name();
-  std::string* release_subject_name();
-  void set_allocated_subject_name(std::string* subject_name);
-
-  // .Image image = 1;
-  bool has_image() const;
-  void clear_image();
-  static const int kImageFieldNumber = 1;
-  const ::Image& image() const;
-  ::Image* release_image();
-  ::Image* mutable_image();
-  void set_allocated_image(::Image* image);
-
-  // .DetectionOptions detect_options = 8;
-  bool has_detect_options() const;
-  void clear_detect_options();
-  static const int kDetectOptionsFieldNumber = 8;
-  const ::DetectionOptions& detect_options() const;
-  ::DetectionOptions* release_detect_options();
-  ::DetectionOptions* mutable_detect_options();
-  void set_allocated_detect_options(::DetectionOptions* detect_options);
+  // .ErrorMessage message = 1;
+  bool has_message() const;
+  void clear_message();
+  static const int kMessageFieldNumber = 1;
+  const ::ErrorMessage& message() const;
+  ::ErrorMessage* release_message();
+  ::ErrorMessage* mutable_message();
+  void set_allocated_message(::ErrorMessage* message);
 
-  // int64 frame = 3;
-  void clear_frame();
-  static const int kFrameFieldNumber = 3;
-  ::PROTOBUF_NAMESPACE_ID::int64 frame() const;
-  void set_frame(::PROTOBUF_NAMESPACE_ID::int64 value);
+  // .FaceRecordList probes = 2;
+  bool has_probes() const;
+  void clear_probes();
+  static const int kProbesFieldNumber = 2;
+  const ::FaceRecordList& probes() const;
+  ::FaceRecordList* release_probes();
+  ::FaceRecordList* mutable_probes();
+  void set_allocated_probes(::FaceRecordList* probes);
 
-  // @@protoc_insertion_point(class_scope:DetectRequest)
+  // @@protoc_insertion_point(class_scope:SearchResponse)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr source_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_name_;
-  ::Image* image_;
-  ::DetectionOptions* detect_options_;
-  ::PROTOBUF_NAMESPACE_ID::int64 frame_;
+  ::ErrorMessage* message_;
+  ::FaceRecordList* probes_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class ExtractRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:ExtractRequest) */ {
+class EnrollRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollRequest) */ {
  public:
-  ExtractRequest();
-  virtual ~ExtractRequest();
+  EnrollRequest();
+  virtual ~EnrollRequest();
 
-  ExtractRequest(const ExtractRequest& from);
-  ExtractRequest(ExtractRequest&& from) noexcept
-    : ExtractRequest() {
+  EnrollRequest(const EnrollRequest& from);
+  EnrollRequest(EnrollRequest&& from) noexcept
+    : EnrollRequest() {
     *this = ::std::move(from);
   }
 
-  inline ExtractRequest& operator=(const ExtractRequest& from) {
+  inline EnrollRequest& operator=(const EnrollRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ExtractRequest& operator=(ExtractRequest&& from) noexcept {
+  inline EnrollRequest& operator=(EnrollRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4050,34 +4357,34 @@ class ExtractRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const ExtractRequest& default_instance();
+  static const EnrollRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const ExtractRequest* internal_default_instance() {
-    return reinterpret_cast<const ExtractRequest*>(
-               &_ExtractRequest_default_instance_);
+  static inline const EnrollRequest* internal_default_instance() {
+    return reinterpret_cast<const EnrollRequest*>(
+               &_EnrollRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    22;
+    23;
 
-  void Swap(ExtractRequest* other);
-  friend void swap(ExtractRequest& a, ExtractRequest& b) {
+  void Swap(EnrollRequest* other);
+  friend void swap(EnrollRequest& a, EnrollRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline ExtractRequest* New() const final {
-    return CreateMaybeMessage<ExtractRequest>(nullptr);
+  inline EnrollRequest* New() const final {
+    return CreateMaybeMessage<EnrollRequest>(nullptr);
   }
 
-  ExtractRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<ExtractRequest>(arena);
+  EnrollRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const ExtractRequest& from);
-  void MergeFrom(const ExtractRequest& from);
+  void CopyFrom(const EnrollRequest& from);
+  void MergeFrom(const EnrollRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4098,10 +4405,10 @@ class ExtractRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ExtractRequest* other);
+  void InternalSwap(EnrollRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "ExtractRequest";
+    return "EnrollRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4125,63 +4432,66 @@ class ExtractRequest :
 
   // accessors -------------------------------------------------------
 
-  // .Image image = 1;
-  bool has_image() const;
-  void clear_image();
-  static const int kImageFieldNumber = 1;
-  const ::Image& image() const;
-  ::Image* release_image();
-  ::Image* mutable_image();
-  void set_allocated_image(::Image* image);
+  // string enroll_gallery = 1;
+  void clear_enroll_gallery();
+  static const int kEnrollGalleryFieldNumber = 1;
+  const std::string& enroll_gallery() const;
+  void set_enroll_gallery(const std::string& value);
+  void set_enroll_gallery(std::string&& value);
+  void set_enroll_gallery(const char* value);
+  void set_enroll_gallery(const char* value, size_t size);
+  std::string* mutable_enroll_gallery();
+  std::string* release_enroll_gallery();
+  void set_allocated_enroll_gallery(std::string* enroll_gallery);
 
-  // .FaceRecordList records = 4;
+  // .FaceRecordList records = 2;
   bool has_records() const;
   void clear_records();
-  static const int kRecordsFieldNumber = 4;
+  static const int kRecordsFieldNumber = 2;
   const ::FaceRecordList& records() const;
   ::FaceRecordList* release_records();
   ::FaceRecordList* mutable_records();
   void set_allocated_records(::FaceRecordList* records);
 
-  // .ExtractOptions extract_options = 9;
-  bool has_extract_options() const;
-  void clear_extract_options();
-  static const int kExtractOptionsFieldNumber = 9;
-  const ::ExtractOptions& extract_options() const;
-  ::ExtractOptions* release_extract_options();
-  ::ExtractOptions* mutable_extract_options();
-  void set_allocated_extract_options(::ExtractOptions* extract_options);
+  // .EnrollOptions enroll_options = 10;
+  bool has_enroll_options() const;
+  void clear_enroll_options();
+  static const int kEnrollOptionsFieldNumber = 10;
+  const ::EnrollOptions& enroll_options() const;
+  ::EnrollOptions* release_enroll_options();
+  ::EnrollOptions* mutable_enroll_options();
+  void set_allocated_enroll_options(::EnrollOptions* enroll_options);
 
-  // @@protoc_insertion_point(class_scope:ExtractRequest)
+  // @@protoc_insertion_point(class_scope:EnrollRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::Image* image_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr enroll_gallery_;
   ::FaceRecordList* records_;
-  ::ExtractOptions* extract_options_;
+  ::EnrollOptions* enroll_options_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class ScoreRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:ScoreRequest) */ {
+class BulkEnrollResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:BulkEnrollResponse) */ {
  public:
-  ScoreRequest();
-  virtual ~ScoreRequest();
+  BulkEnrollResponse();
+  virtual ~BulkEnrollResponse();
 
-  ScoreRequest(const ScoreRequest& from);
-  ScoreRequest(ScoreRequest&& from) noexcept
-    : ScoreRequest() {
+  BulkEnrollResponse(const BulkEnrollResponse& from);
+  BulkEnrollResponse(BulkEnrollResponse&& from) noexcept
+    : BulkEnrollResponse() {
     *this = ::std::move(from);
   }
 
-  inline ScoreRequest& operator=(const ScoreRequest& from) {
+  inline BulkEnrollResponse& operator=(const BulkEnrollResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ScoreRequest& operator=(ScoreRequest&& from) noexcept {
+  inline BulkEnrollResponse& operator=(BulkEnrollResponse&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4199,34 +4509,34 @@ class ScoreRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const ScoreRequest& default_instance();
+  static const BulkEnrollResponse& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const ScoreRequest* internal_default_instance() {
-    return reinterpret_cast<const ScoreRequest*>(
-               &_ScoreRequest_default_instance_);
+  static inline const BulkEnrollResponse* internal_default_instance() {
+    return reinterpret_cast<const BulkEnrollResponse*>(
+               &_BulkEnrollResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    23;
+    24;
 
-  void Swap(ScoreRequest* other);
-  friend void swap(ScoreRequest& a, ScoreRequest& b) {
+  void Swap(BulkEnrollResponse* other);
+  friend void swap(BulkEnrollResponse& a, BulkEnrollResponse& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline ScoreRequest* New() const final {
-    return CreateMaybeMessage<ScoreRequest>(nullptr);
+  inline BulkEnrollResponse* New() const final {
+    return CreateMaybeMessage<BulkEnrollResponse>(nullptr);
   }
 
-  ScoreRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<ScoreRequest>(arena);
+  BulkEnrollResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<BulkEnrollResponse>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const ScoreRequest& from);
-  void MergeFrom(const ScoreRequest& from);
+  void CopyFrom(const BulkEnrollResponse& from);
+  void MergeFrom(const BulkEnrollResponse& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4247,10 +4557,10 @@ class ScoreRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ScoreRequest* other);
+  void InternalSwap(BulkEnrollResponse* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "ScoreRequest";
+    return "BulkEnrollResponse";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4274,73 +4584,54 @@ class ScoreRequest :
 
   // accessors -------------------------------------------------------
 
-  // .FaceRecordList face_probes = 1;
-  bool has_face_probes() const;
-  void clear_face_probes();
-  static const int kFaceProbesFieldNumber = 1;
-  const ::FaceRecordList& face_probes() const;
-  ::FaceRecordList* release_face_probes();
-  ::FaceRecordList* mutable_face_probes();
-  void set_allocated_face_probes(::FaceRecordList* face_probes);
-
-  // .FaceRecordList face_gallery = 2;
-  bool has_face_gallery() const;
-  void clear_face_gallery();
-  static const int kFaceGalleryFieldNumber = 2;
-  const ::FaceRecordList& face_gallery() const;
-  ::FaceRecordList* release_face_gallery();
-  ::FaceRecordList* mutable_face_gallery();
-  void set_allocated_face_gallery(::FaceRecordList* face_gallery);
-
-  // .TemplateList template_probes = 3;
-  bool has_template_probes() const;
-  void clear_template_probes();
-  static const int kTemplateProbesFieldNumber = 3;
-  const ::TemplateList& template_probes() const;
-  ::TemplateList* release_template_probes();
-  ::TemplateList* mutable_template_probes();
-  void set_allocated_template_probes(::TemplateList* template_probes);
-
-  // .TemplateList template_gallery = 4;
-  bool has_template_gallery() const;
-  void clear_template_gallery();
-  static const int kTemplateGalleryFieldNumber = 4;
-  const ::TemplateList& template_gallery() const;
-  ::TemplateList* release_template_gallery();
-  ::TemplateList* mutable_template_gallery();
-  void set_allocated_template_gallery(::TemplateList* template_gallery);
-
-  // @@protoc_insertion_point(class_scope:ScoreRequest)
- private:
-  class HasBitSetters;
+  // int64 request_count = 1;
+  void clear_request_count();
+  static const int kRequestCountFieldNumber = 1;
+  ::PROTOBUF_NAMESPACE_ID::int64 request_count() const;
+  void set_request_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 enroll_count = 2;
+  void clear_enroll_count();
+  static const int kEnrollCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count() const;
+  void set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 replace_count = 3;
+  void clear_replace_count();
+  static const int kReplaceCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count() const;
+  void set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:BulkEnrollResponse)
+ private:
+  class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::FaceRecordList* face_probes_;
-  ::FaceRecordList* face_gallery_;
-  ::TemplateList* template_probes_;
-  ::TemplateList* template_gallery_;
+  ::PROTOBUF_NAMESPACE_ID::int64 request_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class DetectExtractRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractRequest) */ {
+class DetectRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectRequest) */ {
  public:
-  DetectExtractRequest();
-  virtual ~DetectExtractRequest();
+  DetectRequest();
+  virtual ~DetectRequest();
 
-  DetectExtractRequest(const DetectExtractRequest& from);
-  DetectExtractRequest(DetectExtractRequest&& from) noexcept
-    : DetectExtractRequest() {
+  DetectRequest(const DetectRequest& from);
+  DetectRequest(DetectRequest&& from) noexcept
+    : DetectRequest() {
     *this = ::std::move(from);
   }
 
-  inline DetectExtractRequest& operator=(const DetectExtractRequest& from) {
+  inline DetectRequest& operator=(const DetectRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DetectExtractRequest& operator=(DetectExtractRequest&& from) noexcept {
+  inline DetectRequest& operator=(DetectRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4358,34 +4649,34 @@ class DetectExtractRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const DetectExtractRequest& default_instance();
+  static const DetectRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const DetectExtractRequest* internal_default_instance() {
-    return reinterpret_cast<const DetectExtractRequest*>(
-               &_DetectExtractRequest_default_instance_);
+  static inline const DetectRequest* internal_default_instance() {
+    return reinterpret_cast<const DetectRequest*>(
+               &_DetectRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    24;
+    25;
 
-  void Swap(DetectExtractRequest* other);
-  friend void swap(DetectExtractRequest& a, DetectExtractRequest& b) {
+  void Swap(DetectRequest* other);
+  friend void swap(DetectRequest& a, DetectRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline DetectExtractRequest* New() const final {
-    return CreateMaybeMessage<DetectExtractRequest>(nullptr);
+  inline DetectRequest* New() const final {
+    return CreateMaybeMessage<DetectRequest>(nullptr);
   }
 
-  DetectExtractRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<DetectExtractRequest>(arena);
+  DetectRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<DetectRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const DetectExtractRequest& from);
-  void MergeFrom(const DetectExtractRequest& from);
+  void CopyFrom(const DetectRequest& from);
+  void MergeFrom(const DetectRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4406,10 +4697,10 @@ class DetectExtractRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(DetectExtractRequest* other);
+  void InternalSwap(DetectRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "DetectExtractRequest";
+    return "DetectRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4433,53 +4724,99 @@ class DetectExtractRequest :
 
   // accessors -------------------------------------------------------
 
-  // .DetectRequest detect_request = 1;
-  bool has_detect_request() const;
-  void clear_detect_request();
-  static const int kDetectRequestFieldNumber = 1;
-  const ::DetectRequest& detect_request() const;
-  ::DetectRequest* release_detect_request();
-  ::DetectRequest* mutable_detect_request();
-  void set_allocated_detect_request(::DetectRequest* detect_request);
+  // string source = 2;
+  void clear_source();
+  static const int kSourceFieldNumber = 2;
+  const std::string& source() const;
+  void set_source(const std::string& value);
+  void set_source(std::string&& value);
+  void set_source(const char* value);
+  void set_source(const char* value, size_t size);
+  std::string* mutable_source();
+  std::string* release_source();
+  void set_allocated_source(std::string* source);
 
-  // .ExtractRequest extract_request = 2;
-  bool has_extract_request() const;
-  void clear_extract_request();
-  static const int kExtractRequestFieldNumber = 2;
-  const ::ExtractRequest& extract_request() const;
-  ::ExtractRequest* release_extract_request();
-  ::ExtractRequest* mutable_extract_request();
-  void set_allocated_extract_request(::ExtractRequest* extract_request);
+  // string subject_id = 4;
+  void clear_subject_id();
+  static const int kSubjectIdFieldNumber = 4;
+  const std::string& subject_id() const;
+  void set_subject_id(const std::string& value);
+  void set_subject_id(std::string&& value);
+  void set_subject_id(const char* value);
+  void set_subject_id(const char* value, size_t size);
+  std::string* mutable_subject_id();
+  std::string* release_subject_id();
+  void set_allocated_subject_id(std::string* subject_id);
 
-  // @@protoc_insertion_point(class_scope:DetectExtractRequest)
+  // string subject_name = 5;
+  void clear_subject_name();
+  static const int kSubjectNameFieldNumber = 5;
+  const std::string& subject_name() const;
+  void set_subject_name(const std::string& value);
+  void set_subject_name(std::string&& value);
+  void set_subject_name(const char* value);
+  void set_subject_name(const char* value, size_t size);
+  std::string* mutable_subject_name();
+  std::string* release_subject_name();
+  void set_allocated_subject_name(std::string* subject_name);
+
+  // .Image image = 1;
+  bool has_image() const;
+  void clear_image();
+  static const int kImageFieldNumber = 1;
+  const ::Image& image() const;
+  ::Image* release_image();
+  ::Image* mutable_image();
+  void set_allocated_image(::Image* image);
+
+  // .DetectionOptions detect_options = 8;
+  bool has_detect_options() const;
+  void clear_detect_options();
+  static const int kDetectOptionsFieldNumber = 8;
+  const ::DetectionOptions& detect_options() const;
+  ::DetectionOptions* release_detect_options();
+  ::DetectionOptions* mutable_detect_options();
+  void set_allocated_detect_options(::DetectionOptions* detect_options);
+
+  // int64 frame = 3;
+  void clear_frame();
+  static const int kFrameFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 frame() const;
+  void set_frame(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:DetectRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::DetectRequest* detect_request_;
-  ::ExtractRequest* extract_request_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr source_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_name_;
+  ::Image* image_;
+  ::DetectionOptions* detect_options_;
+  ::PROTOBUF_NAMESPACE_ID::int64 frame_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class DetectExtractEnrollRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractEnrollRequest) */ {
+class ExtractRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:ExtractRequest) */ {
  public:
-  DetectExtractEnrollRequest();
-  virtual ~DetectExtractEnrollRequest();
+  ExtractRequest();
+  virtual ~ExtractRequest();
 
-  DetectExtractEnrollRequest(const DetectExtractEnrollRequest& from);
-  DetectExtractEnrollRequest(DetectExtractEnrollRequest&& from) noexcept
-    : DetectExtractEnrollRequest() {
+  ExtractRequest(const ExtractRequest& from);
+  ExtractRequest(ExtractRequest&& from) noexcept
+    : ExtractRequest() {
     *this = ::std::move(from);
   }
 
-  inline DetectExtractEnrollRequest& operator=(const DetectExtractEnrollRequest& from) {
+  inline ExtractRequest& operator=(const ExtractRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DetectExtractEnrollRequest& operator=(DetectExtractEnrollRequest&& from) noexcept {
+  inline ExtractRequest& operator=(ExtractRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4497,34 +4834,34 @@ class DetectExtractEnrollRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const DetectExtractEnrollRequest& default_instance();
+  static const ExtractRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const DetectExtractEnrollRequest* internal_default_instance() {
-    return reinterpret_cast<const DetectExtractEnrollRequest*>(
-               &_DetectExtractEnrollRequest_default_instance_);
+  static inline const ExtractRequest* internal_default_instance() {
+    return reinterpret_cast<const ExtractRequest*>(
+               &_ExtractRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    25;
+    26;
 
-  void Swap(DetectExtractEnrollRequest* other);
-  friend void swap(DetectExtractEnrollRequest& a, DetectExtractEnrollRequest& b) {
+  void Swap(ExtractRequest* other);
+  friend void swap(ExtractRequest& a, ExtractRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline DetectExtractEnrollRequest* New() const final {
-    return CreateMaybeMessage<DetectExtractEnrollRequest>(nullptr);
+  inline ExtractRequest* New() const final {
+    return CreateMaybeMessage<ExtractRequest>(nullptr);
   }
 
-  DetectExtractEnrollRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<DetectExtractEnrollRequest>(arena);
+  ExtractRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<ExtractRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const DetectExtractEnrollRequest& from);
-  void MergeFrom(const DetectExtractEnrollRequest& from);
+  void CopyFrom(const ExtractRequest& from);
+  void MergeFrom(const ExtractRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4545,10 +4882,10 @@ class DetectExtractEnrollRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(DetectExtractEnrollRequest* other);
+  void InternalSwap(ExtractRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "DetectExtractEnrollRequest";
+    return "ExtractRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4572,63 +4909,63 @@ class DetectExtractEnrollRequest :
 
   // accessors -------------------------------------------------------
 
-  // .DetectRequest detect_request = 1;
-  bool has_detect_request() const;
-  void clear_detect_request();
-  static const int kDetectRequestFieldNumber = 1;
-  const ::DetectRequest& detect_request() const;
-  ::DetectRequest* release_detect_request();
-  ::DetectRequest* mutable_detect_request();
-  void set_allocated_detect_request(::DetectRequest* detect_request);
-
-  // .ExtractRequest extract_request = 2;
-  bool has_extract_request() const;
-  void clear_extract_request();
-  static const int kExtractRequestFieldNumber = 2;
-  const ::ExtractRequest& extract_request() const;
-  ::ExtractRequest* release_extract_request();
-  ::ExtractRequest* mutable_extract_request();
-  void set_allocated_extract_request(::ExtractRequest* extract_request);
+  // .Image image = 1;
+  bool has_image() const;
+  void clear_image();
+  static const int kImageFieldNumber = 1;
+  const ::Image& image() const;
+  ::Image* release_image();
+  ::Image* mutable_image();
+  void set_allocated_image(::Image* image);
 
-  // .EnrollRequest enroll_request = 3;
-  bool has_enroll_request() const;
-  void clear_enroll_request();
-  static const int kEnrollRequestFieldNumber = 3;
-  const ::EnrollRequest& enroll_request() const;
-  ::EnrollRequest* release_enroll_request();
-  ::EnrollRequest* mutable_enroll_request();
-  void set_allocated_enroll_request(::EnrollRequest* enroll_request);
+  // .FaceRecordList records = 4;
+  bool has_records() const;
+  void clear_records();
+  static const int kRecordsFieldNumber = 4;
+  const ::FaceRecordList& records() const;
+  ::FaceRecordList* release_records();
+  ::FaceRecordList* mutable_records();
+  void set_allocated_records(::FaceRecordList* records);
 
-  // @@protoc_insertion_point(class_scope:DetectExtractEnrollRequest)
+  // .ExtractOptions extract_options = 9;
+  bool has_extract_options() const;
+  void clear_extract_options();
+  static const int kExtractOptionsFieldNumber = 9;
+  const ::ExtractOptions& extract_options() const;
+  ::ExtractOptions* release_extract_options();
+  ::ExtractOptions* mutable_extract_options();
+  void set_allocated_extract_options(::ExtractOptions* extract_options);
+
+  // @@protoc_insertion_point(class_scope:ExtractRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::DetectRequest* detect_request_;
-  ::ExtractRequest* extract_request_;
-  ::EnrollRequest* enroll_request_;
+  ::Image* image_;
+  ::FaceRecordList* records_;
+  ::ExtractOptions* extract_options_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class DetectExtractSearchRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractSearchRequest) */ {
+class ScoreRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:ScoreRequest) */ {
  public:
-  DetectExtractSearchRequest();
-  virtual ~DetectExtractSearchRequest();
+  ScoreRequest();
+  virtual ~ScoreRequest();
 
-  DetectExtractSearchRequest(const DetectExtractSearchRequest& from);
-  DetectExtractSearchRequest(DetectExtractSearchRequest&& from) noexcept
-    : DetectExtractSearchRequest() {
+  ScoreRequest(const ScoreRequest& from);
+  ScoreRequest(ScoreRequest&& from) noexcept
+    : ScoreRequest() {
     *this = ::std::move(from);
   }
 
-  inline DetectExtractSearchRequest& operator=(const DetectExtractSearchRequest& from) {
+  inline ScoreRequest& operator=(const ScoreRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DetectExtractSearchRequest& operator=(DetectExtractSearchRequest&& from) noexcept {
+  inline ScoreRequest& operator=(ScoreRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4646,34 +4983,34 @@ class DetectExtractSearchRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const DetectExtractSearchRequest& default_instance();
+  static const ScoreRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const DetectExtractSearchRequest* internal_default_instance() {
-    return reinterpret_cast<const DetectExtractSearchRequest*>(
-               &_DetectExtractSearchRequest_default_instance_);
+  static inline const ScoreRequest* internal_default_instance() {
+    return reinterpret_cast<const ScoreRequest*>(
+               &_ScoreRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    26;
+    27;
 
-  void Swap(DetectExtractSearchRequest* other);
-  friend void swap(DetectExtractSearchRequest& a, DetectExtractSearchRequest& b) {
+  void Swap(ScoreRequest* other);
+  friend void swap(ScoreRequest& a, ScoreRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline DetectExtractSearchRequest* New() const final {
-    return CreateMaybeMessage<DetectExtractSearchRequest>(nullptr);
+  inline ScoreRequest* New() const final {
+    return CreateMaybeMessage<ScoreRequest>(nullptr);
   }
 
-  DetectExtractSearchRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<DetectExtractSearchRequest>(arena);
+  ScoreRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<ScoreRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const DetectExtractSearchRequest& from);
-  void MergeFrom(const DetectExtractSearchRequest& from);
+  void CopyFrom(const ScoreRequest& from);
+  void MergeFrom(const ScoreRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4694,10 +5031,10 @@ class DetectExtractSearchRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(DetectExtractSearchRequest* other);
+  void InternalSwap(ScoreRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "DetectExtractSearchRequest";
+    return "ScoreRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4721,63 +5058,73 @@ class DetectExtractSearchRequest :
 
   // accessors -------------------------------------------------------
 
-  // .DetectRequest detect_request = 1;
-  bool has_detect_request() const;
-  void clear_detect_request();
-  static const int kDetectRequestFieldNumber = 1;
-  const ::DetectRequest& detect_request() const;
-  ::DetectRequest* release_detect_request();
-  ::DetectRequest* mutable_detect_request();
-  void set_allocated_detect_request(::DetectRequest* detect_request);
+  // .FaceRecordList face_probes = 1;
+  bool has_face_probes() const;
+  void clear_face_probes();
+  static const int kFaceProbesFieldNumber = 1;
+  const ::FaceRecordList& face_probes() const;
+  ::FaceRecordList* release_face_probes();
+  ::FaceRecordList* mutable_face_probes();
+  void set_allocated_face_probes(::FaceRecordList* face_probes);
 
-  // .ExtractRequest extract_request = 2;
-  bool has_extract_request() const;
-  void clear_extract_request();
-  static const int kExtractRequestFieldNumber = 2;
-  const ::ExtractRequest& extract_request() const;
-  ::ExtractRequest* release_extract_request();
-  ::ExtractRequest* mutable_extract_request();
-  void set_allocated_extract_request(::ExtractRequest* extract_request);
+  // .FaceRecordList face_gallery = 2;
+  bool has_face_gallery() const;
+  void clear_face_gallery();
+  static const int kFaceGalleryFieldNumber = 2;
+  const ::FaceRecordList& face_gallery() const;
+  ::FaceRecordList* release_face_gallery();
+  ::FaceRecordList* mutable_face_gallery();
+  void set_allocated_face_gallery(::FaceRecordList* face_gallery);
 
-  // .SearchRequest search_request = 3;
-  bool has_search_request() const;
-  void clear_search_request();
-  static const int kSearchRequestFieldNumber = 3;
-  const ::SearchRequest& search_request() const;
-  ::SearchRequest* release_search_request();
-  ::SearchRequest* mutable_search_request();
-  void set_allocated_search_request(::SearchRequest* search_request);
+  // .TemplateList template_probes = 3;
+  bool has_template_probes() const;
+  void clear_template_probes();
+  static const int kTemplateProbesFieldNumber = 3;
+  const ::TemplateList& template_probes() const;
+  ::TemplateList* release_template_probes();
+  ::TemplateList* mutable_template_probes();
+  void set_allocated_template_probes(::TemplateList* template_probes);
 
-  // @@protoc_insertion_point(class_scope:DetectExtractSearchRequest)
+  // .TemplateList template_gallery = 4;
+  bool has_template_gallery() const;
+  void clear_template_gallery();
+  static const int kTemplateGalleryFieldNumber = 4;
+  const ::TemplateList& template_gallery() const;
+  ::TemplateList* release_template_gallery();
+  ::TemplateList* mutable_template_gallery();
+  void set_allocated_template_gallery(::TemplateList* template_gallery);
+
+  // @@protoc_insertion_point(class_scope:ScoreRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::DetectRequest* detect_request_;
-  ::ExtractRequest* extract_request_;
-  ::SearchRequest* search_request_;
+  ::FaceRecordList* face_probes_;
+  ::FaceRecordList* face_gallery_;
+  ::TemplateList* template_probes_;
+  ::TemplateList* template_gallery_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class FaceStatusRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:FaceStatusRequest) */ {
+class ScoreBlock :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:ScoreBlock) */ {
  public:
-  FaceStatusRequest();
-  virtual ~FaceStatusRequest();
+  ScoreBlock();
+  virtual ~ScoreBlock();
 
-  FaceStatusRequest(const FaceStatusRequest& from);
-  FaceStatusRequest(FaceStatusRequest&& from) noexcept
-    : FaceStatusRequest() {
+  ScoreBlock(const ScoreBlock& from);
+  ScoreBlock(ScoreBlock&& from) noexcept
+    : ScoreBlock() {
     *this = ::std::move(from);
   }
 
-  inline FaceStatusRequest& operator=(const FaceStatusRequest& from) {
+  inline ScoreBlock& operator=(const ScoreBlock& from) {
     CopyFrom(from);
     return *this;
   }
-  inline FaceStatusRequest& operator=(FaceStatusRequest&& from) noexcept {
+  inline ScoreBlock& operator=(ScoreBlock&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4795,34 +5142,34 @@ class FaceStatusRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const FaceStatusRequest& default_instance();
+  static const ScoreBlock& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const FaceStatusRequest* internal_default_instance() {
-    return reinterpret_cast<const FaceStatusRequest*>(
-               &_FaceStatusRequest_default_instance_);
+  static inline const ScoreBlock* internal_default_instance() {
+    return reinterpret_cast<const ScoreBlock*>(
+               &_ScoreBlock_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    27;
+    28;
 
-  void Swap(FaceStatusRequest* other);
-  friend void swap(FaceStatusRequest& a, FaceStatusRequest& b) {
+  void Swap(ScoreBlock* other);
+  friend void swap(ScoreBlock& a, ScoreBlock& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline FaceStatusRequest* New() const final {
-    return CreateMaybeMessage<FaceStatusRequest>(nullptr);
+  inline ScoreBlock* New() const final {
+    return CreateMaybeMessage<ScoreBlock>(nullptr);
   }
 
-  FaceStatusRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<FaceStatusRequest>(arena);
+  ScoreBlock* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<ScoreBlock>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const FaceStatusRequest& from);
-  void MergeFrom(const FaceStatusRequest& from);
+  void CopyFrom(const ScoreBlock& from);
+  void MergeFrom(const ScoreBlock& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4843,10 +5190,10 @@ class FaceStatusRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(FaceStatusRequest* other);
+  void InternalSwap(ScoreBlock* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "FaceStatusRequest";
+    return "ScoreBlock";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4870,33 +5217,74 @@ class FaceStatusRequest :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:FaceStatusRequest)
+  // bytes scores = 5;
+  void clear_scores();
+  static const int kScoresFieldNumber = 5;
+  const std::string& scores() const;
+  void set_scores(const std::string& value);
+  void set_scores(std::string&& value);
+  void set_scores(const char* value);
+  void set_scores(const void* value, size_t size);
+  std::string* mutable_scores();
+  std::string* release_scores();
+  void set_allocated_scores(std::string* scores);
+
+  // int64 probe_start = 1;
+  void clear_probe_start();
+  static const int kProbeStartFieldNumber = 1;
+  ::PROTOBUF_NAMESPACE_ID::int64 probe_start() const;
+  void set_probe_start(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 gallery_start = 2;
+  void clear_gallery_start();
+  static const int kGalleryStartFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 gallery_start() const;
+  void set_gallery_start(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int32 probe_count = 3;
+  void clear_probe_count();
+  static const int kProbeCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int32 probe_count() const;
+  void set_probe_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // int32 gallery_count = 4;
+  void clear_gallery_count();
+  static const int kGalleryCountFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int32 gallery_count() const;
+  void set_gallery_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // @@protoc_insertion_point(class_scope:ScoreBlock)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr scores_;
+  ::PROTOBUF_NAMESPACE_ID::int64 probe_start_;
+  ::PROTOBUF_NAMESPACE_ID::int64 gallery_start_;
+  ::PROTOBUF_NAMESPACE_ID::int32 probe_count_;
+  ::PROTOBUF_NAMESPACE_ID::int32 gallery_count_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class FaceServiceInfo :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:FaceServiceInfo) */ {
+class MatchDistributionRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:MatchDistributionRequest) */ {
  public:
-  FaceServiceInfo();
-  virtual ~FaceServiceInfo();
+  MatchDistributionRequest();
+  virtual ~MatchDistributionRequest();
 
-  FaceServiceInfo(const FaceServiceInfo& from);
-  FaceServiceInfo(FaceServiceInfo&& from) noexcept
-    : FaceServiceInfo() {
+  MatchDistributionRequest(const MatchDistributionRequest& from);
+  MatchDistributionRequest(MatchDistributionRequest&& from) noexcept
+    : MatchDistributionRequest() {
     *this = ::std::move(from);
   }
 
-  inline FaceServiceInfo& operator=(const FaceServiceInfo& from) {
+  inline MatchDistributionRequest& operator=(const MatchDistributionRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline FaceServiceInfo& operator=(FaceServiceInfo&& from) noexcept {
+  inline MatchDistributionRequest& operator=(MatchDistributionRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -4914,34 +5302,34 @@ class FaceServiceInfo :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const FaceServiceInfo& default_instance();
+  static const MatchDistributionRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const FaceServiceInfo* internal_default_instance() {
-    return reinterpret_cast<const FaceServiceInfo*>(
-               &_FaceServiceInfo_default_instance_);
+  static inline const MatchDistributionRequest* internal_default_instance() {
+    return reinterpret_cast<const MatchDistributionRequest*>(
+               &_MatchDistributionRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    28;
+    29;
 
-  void Swap(FaceServiceInfo* other);
-  friend void swap(FaceServiceInfo& a, FaceServiceInfo& b) {
+  void Swap(MatchDistributionRequest* other);
+  friend void swap(MatchDistributionRequest& a, MatchDistributionRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline FaceServiceInfo* New() const final {
-    return CreateMaybeMessage<FaceServiceInfo>(nullptr);
+  inline MatchDistributionRequest* New() const final {
+    return CreateMaybeMessage<MatchDistributionRequest>(nullptr);
   }
 
-  FaceServiceInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<FaceServiceInfo>(arena);
+  MatchDistributionRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<MatchDistributionRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const FaceServiceInfo& from);
-  void MergeFrom(const FaceServiceInfo& from);
+  void CopyFrom(const MatchDistributionRequest& from);
+  void MergeFrom(const MatchDistributionRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -4962,10 +5350,10 @@ class FaceServiceInfo :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(FaceServiceInfo* other);
+  void InternalSwap(MatchDistributionRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "FaceServiceInfo";
+    return "MatchDistributionRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -4989,129 +5377,81 @@ class FaceServiceInfo :
 
   // accessors -------------------------------------------------------
 
-  // string algorithm = 10;
-  void clear_algorithm();
-  static const int kAlgorithmFieldNumber = 10;
-  const std::string& algorithm() const;
-  void set_algorithm(const std::string& value);
-  void set_algorithm(std::string&& value);
-  void set_algorithm(const char* value);
-  void set_algorithm(const char* value, size_t size);
-  std::string* mutable_algorithm();
-  std::string* release_algorithm();
-  void set_allocated_algorithm(std::string* algorithm);
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
 
-  // string notes = 11;
-  void clear_notes();
-  static const int kNotesFieldNumber = 11;
-  const std::string& notes() const;
-  void set_notes(const std::string& value);
-  void set_notes(std::string&& value);
-  void set_notes(const char* value);
-  void set_notes(const char* value, size_t size);
-  std::string* mutable_notes();
-  std::string* release_notes();
-  void set_allocated_notes(std::string* notes);
+  // int32 bins = 2;
+  void clear_bins();
+  static const int kBinsFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int32 bins() const;
+  void set_bins(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // float min_score = 3;
+  void clear_min_score();
+  static const int kMinScoreFieldNumber = 3;
+  float min_score() const;
+  void set_min_score(float value);
+
+  // float max_score = 4;
+  void clear_max_score();
+  static const int kMaxScoreFieldNumber = 4;
+  float max_score() const;
+  void set_max_score(float value);
+
+  // bool include_scores = 5;
+  void clear_include_scores();
+  static const int kIncludeScoresFieldNumber = 5;
+  bool include_scores() const;
+  void set_include_scores(bool value);
+
+  // @@protoc_insertion_point(class_scope:MatchDistributionRequest)
+ private:
+  class HasBitSetters;
 
-  // .ServiceStatus status = 1;
-  void clear_status();
-  static const int kStatusFieldNumber = 1;
-  ::ServiceStatus status() const;
-  void set_status(::ServiceStatus value);
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::int32 bins_;
+  float min_score_;
+  float max_score_;
+  bool include_scores_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
 
-  // int32 worker_count = 2;
-  void clear_worker_count();
-  static const int kWorkerCountFieldNumber = 2;
-  ::PROTOBUF_NAMESPACE_ID::int32 worker_count() const;
-  void set_worker_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+class MatchDistribution :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:MatchDistribution) */ {
+ public:
+  MatchDistribution();
+  virtual ~MatchDistribution();
 
-  // bool detection_support = 3;
-  void clear_detection_support();
-  static const int kDetectionSupportFieldNumber = 3;
-  bool detection_support() const;
-  void set_detection_support(bool value);
+  MatchDistribution(const MatchDistribution& from);
+  MatchDistribution(MatchDistribution&& from) noexcept
+    : MatchDistribution() {
+    *this = ::std::move(from);
+  }
 
-  // bool extract_support = 4;
-  void clear_extract_support();
-  static const int kExtractSupportFieldNumber = 4;
-  bool extract_support() const;
-  void set_extract_support(bool value);
-
-  // bool score_support = 5;
-  void clear_score_support();
-  static const int kScoreSupportFieldNumber = 5;
-  bool score_support() const;
-  void set_score_support(bool value);
-
-  // bool attribute_support = 6;
-  void clear_attribute_support();
-  static const int kAttributeSupportFieldNumber = 6;
-  bool attribute_support() const;
-  void set_attribute_support(bool value);
-
-  // .ScoreType score_type = 7;
-  void clear_score_type();
-  static const int kScoreTypeFieldNumber = 7;
-  ::ScoreType score_type() const;
-  void set_score_type(::ScoreType value);
-
-  // float detection_threshold = 8;
-  void clear_detection_threshold();
-  static const int kDetectionThresholdFieldNumber = 8;
-  float detection_threshold() const;
-  void set_detection_threshold(float value);
-
-  // float match_threshold = 9;
-  void clear_match_threshold();
-  static const int kMatchThresholdFieldNumber = 9;
-  float match_threshold() const;
-  void set_match_threshold(float value);
-
-  // @@protoc_insertion_point(class_scope:FaceServiceInfo)
- private:
-  class HasBitSetters;
-
-  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr algorithm_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr notes_;
-  int status_;
-  ::PROTOBUF_NAMESPACE_ID::int32 worker_count_;
-  bool detection_support_;
-  bool extract_support_;
-  bool score_support_;
-  bool attribute_support_;
-  int score_type_;
-  float detection_threshold_;
-  float match_threshold_;
-  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
-  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
-};
-// -------------------------------------------------------------------
-
-class GalleryListRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryListRequest) */ {
- public:
-  GalleryListRequest();
-  virtual ~GalleryListRequest();
-
-  GalleryListRequest(const GalleryListRequest& from);
-  GalleryListRequest(GalleryListRequest&& from) noexcept
-    : GalleryListRequest() {
-    *this = ::std::move(from);
-  }
-
-  inline GalleryListRequest& operator=(const GalleryListRequest& from) {
-    CopyFrom(from);
-    return *this;
-  }
-  inline GalleryListRequest& operator=(GalleryListRequest&& from) noexcept {
-    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
-      if (this != &from) InternalSwap(&from);
-    } else {
-      CopyFrom(from);
-    }
-    return *this;
-  }
+  inline MatchDistribution& operator=(const MatchDistribution& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline MatchDistribution& operator=(MatchDistribution&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
 
   static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
     return GetDescriptor();
@@ -5122,34 +5462,34 @@ class GalleryListRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const GalleryListRequest& default_instance();
+  static const MatchDistribution& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const GalleryListRequest* internal_default_instance() {
-    return reinterpret_cast<const GalleryListRequest*>(
-               &_GalleryListRequest_default_instance_);
+  static inline const MatchDistribution* internal_default_instance() {
+    return reinterpret_cast<const MatchDistribution*>(
+               &_MatchDistribution_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    29;
+    30;
 
-  void Swap(GalleryListRequest* other);
-  friend void swap(GalleryListRequest& a, GalleryListRequest& b) {
+  void Swap(MatchDistribution* other);
+  friend void swap(MatchDistribution& a, MatchDistribution& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline GalleryListRequest* New() const final {
-    return CreateMaybeMessage<GalleryListRequest>(nullptr);
+  inline MatchDistribution* New() const final {
+    return CreateMaybeMessage<MatchDistribution>(nullptr);
   }
 
-  GalleryListRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<GalleryListRequest>(arena);
+  MatchDistribution* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<MatchDistribution>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const GalleryListRequest& from);
-  void MergeFrom(const GalleryListRequest& from);
+  void CopyFrom(const MatchDistribution& from);
+  void MergeFrom(const MatchDistribution& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5170,10 +5510,10 @@ class GalleryListRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GalleryListRequest* other);
+  void InternalSwap(MatchDistribution* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "GalleryListRequest";
+    return "MatchDistribution";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5197,33 +5537,148 @@ class GalleryListRequest :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:GalleryListRequest)
+  // repeated float bin_edges = 5;
+  int bin_edges_size() const;
+  void clear_bin_edges();
+  static const int kBinEdgesFieldNumber = 5;
+  float bin_edges(int index) const;
+  void set_bin_edges(int index, float value);
+  void add_bin_edges(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      bin_edges() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_bin_edges();
+
+  // repeated int64 genuine_histogram = 6;
+  int genuine_histogram_size() const;
+  void clear_genuine_histogram();
+  static const int kGenuineHistogramFieldNumber = 6;
+  ::PROTOBUF_NAMESPACE_ID::int64 genuine_histogram(int index) const;
+  void set_genuine_histogram(int index, ::PROTOBUF_NAMESPACE_ID::int64 value);
+  void add_genuine_histogram(::PROTOBUF_NAMESPACE_ID::int64 value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >&
+      genuine_histogram() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >*
+      mutable_genuine_histogram();
+
+  // repeated int64 impostor_histogram = 7;
+  int impostor_histogram_size() const;
+  void clear_impostor_histogram();
+  static const int kImpostorHistogramFieldNumber = 7;
+  ::PROTOBUF_NAMESPACE_ID::int64 impostor_histogram(int index) const;
+  void set_impostor_histogram(int index, ::PROTOBUF_NAMESPACE_ID::int64 value);
+  void add_impostor_histogram(::PROTOBUF_NAMESPACE_ID::int64 value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >&
+      impostor_histogram() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >*
+      mutable_impostor_histogram();
+
+  // repeated float thresholds = 8;
+  int thresholds_size() const;
+  void clear_thresholds();
+  static const int kThresholdsFieldNumber = 8;
+  float thresholds(int index) const;
+  void set_thresholds(int index, float value);
+  void add_thresholds(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      thresholds() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_thresholds();
+
+  // repeated float far = 9;
+  int far_size() const;
+  void clear_far();
+  static const int kFarFieldNumber = 9;
+  float far(int index) const;
+  void set_far(int index, float value);
+  void add_far(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      far() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_far();
+
+  // repeated float frr = 10;
+  int frr_size() const;
+  void clear_frr();
+  static const int kFrrFieldNumber = 10;
+  float frr(int index) const;
+  void set_frr(int index, float value);
+  void add_frr(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      frr() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_frr();
+
+  // .ScoreBlock block = 1;
+  bool has_block() const;
+  void clear_block();
+  static const int kBlockFieldNumber = 1;
+  const ::ScoreBlock& block() const;
+  ::ScoreBlock* release_block();
+  ::ScoreBlock* mutable_block();
+  void set_allocated_block(::ScoreBlock* block);
+
+  // int64 face_count = 2;
+  void clear_face_count();
+  static const int kFaceCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count() const;
+  void set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 genuine_count = 3;
+  void clear_genuine_count();
+  static const int kGenuineCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 genuine_count() const;
+  void set_genuine_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 impostor_count = 4;
+  void clear_impostor_count();
+  static const int kImpostorCountFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 impostor_count() const;
+  void set_impostor_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:MatchDistribution)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > bin_edges_;
+  mutable std::atomic<int> _bin_edges_cached_byte_size_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 > genuine_histogram_;
+  mutable std::atomic<int> _genuine_histogram_cached_byte_size_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 > impostor_histogram_;
+  mutable std::atomic<int> _impostor_histogram_cached_byte_size_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > thresholds_;
+  mutable std::atomic<int> _thresholds_cached_byte_size_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > far_;
+  mutable std::atomic<int> _far_cached_byte_size_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > frr_;
+  mutable std::atomic<int> _frr_cached_byte_size_;
+  ::ScoreBlock* block_;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 genuine_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 impostor_count_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class GalleryDeleteRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryDeleteRequest) */ {
+class DetectExtractRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractRequest) */ {
  public:
-  GalleryDeleteRequest();
-  virtual ~GalleryDeleteRequest();
+  DetectExtractRequest();
+  virtual ~DetectExtractRequest();
 
-  GalleryDeleteRequest(const GalleryDeleteRequest& from);
-  GalleryDeleteRequest(GalleryDeleteRequest&& from) noexcept
-    : GalleryDeleteRequest() {
+  DetectExtractRequest(const DetectExtractRequest& from);
+  DetectExtractRequest(DetectExtractRequest&& from) noexcept
+    : DetectExtractRequest() {
     *this = ::std::move(from);
   }
 
-  inline GalleryDeleteRequest& operator=(const GalleryDeleteRequest& from) {
+  inline DetectExtractRequest& operator=(const DetectExtractRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GalleryDeleteRequest& operator=(GalleryDeleteRequest&& from) noexcept {
+  inline DetectExtractRequest& operator=(DetectExtractRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5241,34 +5696,34 @@ class GalleryDeleteRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const GalleryDeleteRequest& default_instance();
+  static const DetectExtractRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const GalleryDeleteRequest* internal_default_instance() {
-    return reinterpret_cast<const GalleryDeleteRequest*>(
-               &_GalleryDeleteRequest_default_instance_);
+  static inline const DetectExtractRequest* internal_default_instance() {
+    return reinterpret_cast<const DetectExtractRequest*>(
+               &_DetectExtractRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    30;
+    31;
 
-  void Swap(GalleryDeleteRequest* other);
-  friend void swap(GalleryDeleteRequest& a, GalleryDeleteRequest& b) {
+  void Swap(DetectExtractRequest* other);
+  friend void swap(DetectExtractRequest& a, DetectExtractRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline GalleryDeleteRequest* New() const final {
-    return CreateMaybeMessage<GalleryDeleteRequest>(nullptr);
+  inline DetectExtractRequest* New() const final {
+    return CreateMaybeMessage<DetectExtractRequest>(nullptr);
   }
 
-  GalleryDeleteRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<GalleryDeleteRequest>(arena);
+  DetectExtractRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<DetectExtractRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const GalleryDeleteRequest& from);
-  void MergeFrom(const GalleryDeleteRequest& from);
+  void CopyFrom(const DetectExtractRequest& from);
+  void MergeFrom(const DetectExtractRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5289,10 +5744,10 @@ class GalleryDeleteRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GalleryDeleteRequest* other);
+  void InternalSwap(DetectExtractRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "GalleryDeleteRequest";
+    return "DetectExtractRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5316,46 +5771,53 @@ class GalleryDeleteRequest :
 
   // accessors -------------------------------------------------------
 
-  // string gallery_name = 1;
-  void clear_gallery_name();
-  static const int kGalleryNameFieldNumber = 1;
-  const std::string& gallery_name() const;
-  void set_gallery_name(const std::string& value);
-  void set_gallery_name(std::string&& value);
-  void set_gallery_name(const char* value);
-  void set_gallery_name(const char* value, size_t size);
-  std::string* mutable_gallery_name();
-  std::string* release_gallery_name();
-  void set_allocated_gallery_name(std::string* gallery_name);
+  // .DetectRequest detect_request = 1;
+  bool has_detect_request() const;
+  void clear_detect_request();
+  static const int kDetectRequestFieldNumber = 1;
+  const ::DetectRequest& detect_request() const;
+  ::DetectRequest* release_detect_request();
+  ::DetectRequest* mutable_detect_request();
+  void set_allocated_detect_request(::DetectRequest* detect_request);
 
-  // @@protoc_insertion_point(class_scope:GalleryDeleteRequest)
+  // .ExtractRequest extract_request = 2;
+  bool has_extract_request() const;
+  void clear_extract_request();
+  static const int kExtractRequestFieldNumber = 2;
+  const ::ExtractRequest& extract_request() const;
+  ::ExtractRequest* release_extract_request();
+  ::ExtractRequest* mutable_extract_request();
+  void set_allocated_extract_request(::ExtractRequest* extract_request);
+
+  // @@protoc_insertion_point(class_scope:DetectExtractRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::DetectRequest* detect_request_;
+  ::ExtractRequest* extract_request_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class EnrollmentListRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentListRequest) */ {
+class DetectExtractEnrollRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractEnrollRequest) */ {
  public:
-  EnrollmentListRequest();
-  virtual ~EnrollmentListRequest();
+  DetectExtractEnrollRequest();
+  virtual ~DetectExtractEnrollRequest();
 
-  EnrollmentListRequest(const EnrollmentListRequest& from);
-  EnrollmentListRequest(EnrollmentListRequest&& from) noexcept
-    : EnrollmentListRequest() {
+  DetectExtractEnrollRequest(const DetectExtractEnrollRequest& from);
+  DetectExtractEnrollRequest(DetectExtractEnrollRequest&& from) noexcept
+    : DetectExtractEnrollRequest() {
     *this = ::std::move(from);
   }
 
-  inline EnrollmentListRequest& operator=(const EnrollmentListRequest& from) {
+  inline DetectExtractEnrollRequest& operator=(const DetectExtractEnrollRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EnrollmentListRequest& operator=(EnrollmentListRequest&& from) noexcept {
+  inline DetectExtractEnrollRequest& operator=(DetectExtractEnrollRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5373,34 +5835,34 @@ class EnrollmentListRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const EnrollmentListRequest& default_instance();
+  static const DetectExtractEnrollRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const EnrollmentListRequest* internal_default_instance() {
-    return reinterpret_cast<const EnrollmentListRequest*>(
-               &_EnrollmentListRequest_default_instance_);
+  static inline const DetectExtractEnrollRequest* internal_default_instance() {
+    return reinterpret_cast<const DetectExtractEnrollRequest*>(
+               &_DetectExtractEnrollRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    31;
+    32;
 
-  void Swap(EnrollmentListRequest* other);
-  friend void swap(EnrollmentListRequest& a, EnrollmentListRequest& b) {
+  void Swap(DetectExtractEnrollRequest* other);
+  friend void swap(DetectExtractEnrollRequest& a, DetectExtractEnrollRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline EnrollmentListRequest* New() const final {
-    return CreateMaybeMessage<EnrollmentListRequest>(nullptr);
+  inline DetectExtractEnrollRequest* New() const final {
+    return CreateMaybeMessage<DetectExtractEnrollRequest>(nullptr);
   }
 
-  EnrollmentListRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<EnrollmentListRequest>(arena);
+  DetectExtractEnrollRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<DetectExtractEnrollRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const EnrollmentListRequest& from);
-  void MergeFrom(const EnrollmentListRequest& from);
+  void CopyFrom(const DetectExtractEnrollRequest& from);
+  void MergeFrom(const DetectExtractEnrollRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5421,10 +5883,10 @@ class EnrollmentListRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(EnrollmentListRequest* other);
+  void InternalSwap(DetectExtractEnrollRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "EnrollmentListRequest";
+    return "DetectExtractEnrollRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5448,46 +5910,63 @@ class EnrollmentListRequest :
 
   // accessors -------------------------------------------------------
 
-  // string gallery_name = 1;
-  void clear_gallery_name();
-  static const int kGalleryNameFieldNumber = 1;
-  const std::string& gallery_name() const;
-  void set_gallery_name(const std::string& value);
-  void set_gallery_name(std::string&& value);
-  void set_gallery_name(const char* value);
-  void set_gallery_name(const char* value, size_t size);
-  std::string* mutable_gallery_name();
-  std::string* release_gallery_name();
-  void set_allocated_gallery_name(std::string* gallery_name);
-
-  // @@protoc_insertion_point(class_scope:EnrollmentListRequest)
- private:
-  class HasBitSetters;
+  // .DetectRequest detect_request = 1;
+  bool has_detect_request() const;
+  void clear_detect_request();
+  static const int kDetectRequestFieldNumber = 1;
+  const ::DetectRequest& detect_request() const;
+  ::DetectRequest* release_detect_request();
+  ::DetectRequest* mutable_detect_request();
+  void set_allocated_detect_request(::DetectRequest* detect_request);
 
-  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  // .ExtractRequest extract_request = 2;
+  bool has_extract_request() const;
+  void clear_extract_request();
+  static const int kExtractRequestFieldNumber = 2;
+  const ::ExtractRequest& extract_request() const;
+  ::ExtractRequest* release_extract_request();
+  ::ExtractRequest* mutable_extract_request();
+  void set_allocated_extract_request(::ExtractRequest* extract_request);
+
+  // .EnrollRequest enroll_request = 3;
+  bool has_enroll_request() const;
+  void clear_enroll_request();
+  static const int kEnrollRequestFieldNumber = 3;
+  const ::EnrollRequest& enroll_request() const;
+  ::EnrollRequest* release_enroll_request();
+  ::EnrollRequest* mutable_enroll_request();
+  void set_allocated_enroll_request(::EnrollRequest* enroll_request);
+
+  // @@protoc_insertion_point(class_scope:DetectExtractEnrollRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::DetectRequest* detect_request_;
+  ::ExtractRequest* extract_request_;
+  ::EnrollRequest* enroll_request_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class EnrollmentInfo :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentInfo) */ {
+class DetectExtractSearchRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:DetectExtractSearchRequest) */ {
  public:
-  EnrollmentInfo();
-  virtual ~EnrollmentInfo();
+  DetectExtractSearchRequest();
+  virtual ~DetectExtractSearchRequest();
 
-  EnrollmentInfo(const EnrollmentInfo& from);
-  EnrollmentInfo(EnrollmentInfo&& from) noexcept
-    : EnrollmentInfo() {
+  DetectExtractSearchRequest(const DetectExtractSearchRequest& from);
+  DetectExtractSearchRequest(DetectExtractSearchRequest&& from) noexcept
+    : DetectExtractSearchRequest() {
     *this = ::std::move(from);
   }
 
-  inline EnrollmentInfo& operator=(const EnrollmentInfo& from) {
+  inline DetectExtractSearchRequest& operator=(const DetectExtractSearchRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EnrollmentInfo& operator=(EnrollmentInfo&& from) noexcept {
+  inline DetectExtractSearchRequest& operator=(DetectExtractSearchRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5505,34 +5984,34 @@ class EnrollmentInfo :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const EnrollmentInfo& default_instance();
+  static const DetectExtractSearchRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const EnrollmentInfo* internal_default_instance() {
-    return reinterpret_cast<const EnrollmentInfo*>(
-               &_EnrollmentInfo_default_instance_);
+  static inline const DetectExtractSearchRequest* internal_default_instance() {
+    return reinterpret_cast<const DetectExtractSearchRequest*>(
+               &_DetectExtractSearchRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    32;
+    33;
 
-  void Swap(EnrollmentInfo* other);
-  friend void swap(EnrollmentInfo& a, EnrollmentInfo& b) {
+  void Swap(DetectExtractSearchRequest* other);
+  friend void swap(DetectExtractSearchRequest& a, DetectExtractSearchRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline EnrollmentInfo* New() const final {
-    return CreateMaybeMessage<EnrollmentInfo>(nullptr);
+  inline DetectExtractSearchRequest* New() const final {
+    return CreateMaybeMessage<DetectExtractSearchRequest>(nullptr);
   }
 
-  EnrollmentInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<EnrollmentInfo>(arena);
+  DetectExtractSearchRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<DetectExtractSearchRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const EnrollmentInfo& from);
-  void MergeFrom(const EnrollmentInfo& from);
+  void CopyFrom(const DetectExtractSearchRequest& from);
+  void MergeFrom(const DetectExtractSearchRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5553,10 +6032,10 @@ class EnrollmentInfo :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(EnrollmentInfo* other);
+  void InternalSwap(DetectExtractSearchRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "EnrollmentInfo";
+    return "DetectExtractSearchRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5580,66 +6059,63 @@ class EnrollmentInfo :
 
   // accessors -------------------------------------------------------
 
-  // string subject_id = 1;
-  void clear_subject_id();
-  static const int kSubjectIdFieldNumber = 1;
-  const std::string& subject_id() const;
-  void set_subject_id(const std::string& value);
-  void set_subject_id(std::string&& value);
-  void set_subject_id(const char* value);
-  void set_subject_id(const char* value, size_t size);
-  std::string* mutable_subject_id();
-  std::string* release_subject_id();
-  void set_allocated_subject_id(std::string* subject_id);
+  // .DetectRequest detect_request = 1;
+  bool has_detect_request() const;
+  void clear_detect_request();
+  static const int kDetectRequestFieldNumber = 1;
+  const ::DetectRequest& detect_request() const;
+  ::DetectRequest* release_detect_request();
+  ::DetectRequest* mutable_detect_request();
+  void set_allocated_detect_request(::DetectRequest* detect_request);
 
-  // string name = 2;
-  void clear_name();
-  static const int kNameFieldNumber = 2;
-  const std::string& name() const;
-  void set_name(const std::string& value);
-  void set_name(std::string&& value);
-  void set_name(const char* value);
-  void set_name(const char* value, size_t size);
-  std::string* mutable_name();
-  std::string* release_name();
-  void set_allocated_name(std::string* name);
+  // .ExtractRequest extract_request = 2;
+  bool has_extract_request() const;
+  void clear_extract_request();
+  static const int kExtractRequestFieldNumber = 2;
+  const ::ExtractRequest& extract_request() const;
+  ::ExtractRequest* release_extract_request();
+  ::ExtractRequest* mutable_extract_request();
+  void set_allocated_extract_request(::ExtractRequest* extract_request);
 
-  // int32 face_count = 3;
-  void clear_face_count();
-  static const int kFaceCountFieldNumber = 3;
-  ::PROTOBUF_NAMESPACE_ID::int32 face_count() const;
-  void set_face_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+  // .SearchRequest search_request = 3;
+  bool has_search_request() const;
+  void clear_search_request();
+  static const int kSearchRequestFieldNumber = 3;
+  const ::SearchRequest& search_request() const;
+  ::SearchRequest* release_search_request();
+  ::SearchRequest* mutable_search_request();
+  void set_allocated_search_request(::SearchRequest* search_request);
 
-  // @@protoc_insertion_point(class_scope:EnrollmentInfo)
+  // @@protoc_insertion_point(class_scope:DetectExtractSearchRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
-  ::PROTOBUF_NAMESPACE_ID::int32 face_count_;
+  ::DetectRequest* detect_request_;
+  ::ExtractRequest* extract_request_;
+  ::SearchRequest* search_request_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class EnrollmentListResponse :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentListResponse) */ {
+class FaceStatusRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:FaceStatusRequest) */ {
  public:
-  EnrollmentListResponse();
-  virtual ~EnrollmentListResponse();
+  FaceStatusRequest();
+  virtual ~FaceStatusRequest();
 
-  EnrollmentListResponse(const EnrollmentListResponse& from);
-  EnrollmentListResponse(EnrollmentListResponse&& from) noexcept
-    : EnrollmentListResponse() {
+  FaceStatusRequest(const FaceStatusRequest& from);
+  FaceStatusRequest(FaceStatusRequest&& from) noexcept
+    : FaceStatusRequest() {
     *this = ::std::move(from);
   }
 
-  inline EnrollmentListResponse& operator=(const EnrollmentListResponse& from) {
+  inline FaceStatusRequest& operator=(const FaceStatusRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EnrollmentListResponse& operator=(EnrollmentListResponse&& from) noexcept {
+  inline FaceStatusRequest& operator=(FaceStatusRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5657,34 +6133,34 @@ class EnrollmentListResponse :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const EnrollmentListResponse& default_instance();
+  static const FaceStatusRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const EnrollmentListResponse* internal_default_instance() {
-    return reinterpret_cast<const EnrollmentListResponse*>(
-               &_EnrollmentListResponse_default_instance_);
+  static inline const FaceStatusRequest* internal_default_instance() {
+    return reinterpret_cast<const FaceStatusRequest*>(
+               &_FaceStatusRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    33;
+    34;
 
-  void Swap(EnrollmentListResponse* other);
-  friend void swap(EnrollmentListResponse& a, EnrollmentListResponse& b) {
+  void Swap(FaceStatusRequest* other);
+  friend void swap(FaceStatusRequest& a, FaceStatusRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline EnrollmentListResponse* New() const final {
-    return CreateMaybeMessage<EnrollmentListResponse>(nullptr);
+  inline FaceStatusRequest* New() const final {
+    return CreateMaybeMessage<FaceStatusRequest>(nullptr);
   }
 
-  EnrollmentListResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<EnrollmentListResponse>(arena);
+  FaceStatusRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<FaceStatusRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const EnrollmentListResponse& from);
-  void MergeFrom(const EnrollmentListResponse& from);
+  void CopyFrom(const FaceStatusRequest& from);
+  void MergeFrom(const FaceStatusRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5705,10 +6181,10 @@ class EnrollmentListResponse :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(EnrollmentListResponse* other);
+  void InternalSwap(FaceStatusRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "EnrollmentListResponse";
+    return "FaceStatusRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5732,59 +6208,33 @@ class EnrollmentListResponse :
 
   // accessors -------------------------------------------------------
 
-  // repeated .EnrollmentInfo enrollments = 2;
-  int enrollments_size() const;
-  void clear_enrollments();
-  static const int kEnrollmentsFieldNumber = 2;
-  ::EnrollmentInfo* mutable_enrollments(int index);
-  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo >*
-      mutable_enrollments();
-  const ::EnrollmentInfo& enrollments(int index) const;
-  ::EnrollmentInfo* add_enrollments();
-  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo >&
-      enrollments() const;
-
-  // string gallery_name = 1;
-  void clear_gallery_name();
-  static const int kGalleryNameFieldNumber = 1;
-  const std::string& gallery_name() const;
-  void set_gallery_name(const std::string& value);
-  void set_gallery_name(std::string&& value);
-  void set_gallery_name(const char* value);
-  void set_gallery_name(const char* value, size_t size);
-  std::string* mutable_gallery_name();
-  std::string* release_gallery_name();
-  void set_allocated_gallery_name(std::string* gallery_name);
-
-  // @@protoc_insertion_point(class_scope:EnrollmentListResponse)
+  // @@protoc_insertion_point(class_scope:FaceStatusRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo > enrollments_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class EnrollmentDeleteRequest :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentDeleteRequest) */ {
+class FaceServiceInfo :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:FaceServiceInfo) */ {
  public:
-  EnrollmentDeleteRequest();
-  virtual ~EnrollmentDeleteRequest();
+  FaceServiceInfo();
+  virtual ~FaceServiceInfo();
 
-  EnrollmentDeleteRequest(const EnrollmentDeleteRequest& from);
-  EnrollmentDeleteRequest(EnrollmentDeleteRequest&& from) noexcept
-    : EnrollmentDeleteRequest() {
+  FaceServiceInfo(const FaceServiceInfo& from);
+  FaceServiceInfo(FaceServiceInfo&& from) noexcept
+    : FaceServiceInfo() {
     *this = ::std::move(from);
   }
 
-  inline EnrollmentDeleteRequest& operator=(const EnrollmentDeleteRequest& from) {
+  inline FaceServiceInfo& operator=(const FaceServiceInfo& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EnrollmentDeleteRequest& operator=(EnrollmentDeleteRequest&& from) noexcept {
+  inline FaceServiceInfo& operator=(FaceServiceInfo&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5802,34 +6252,34 @@ class EnrollmentDeleteRequest :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const EnrollmentDeleteRequest& default_instance();
+  static const FaceServiceInfo& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const EnrollmentDeleteRequest* internal_default_instance() {
-    return reinterpret_cast<const EnrollmentDeleteRequest*>(
-               &_EnrollmentDeleteRequest_default_instance_);
+  static inline const FaceServiceInfo* internal_default_instance() {
+    return reinterpret_cast<const FaceServiceInfo*>(
+               &_FaceServiceInfo_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    34;
+    35;
 
-  void Swap(EnrollmentDeleteRequest* other);
-  friend void swap(EnrollmentDeleteRequest& a, EnrollmentDeleteRequest& b) {
+  void Swap(FaceServiceInfo* other);
+  friend void swap(FaceServiceInfo& a, FaceServiceInfo& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline EnrollmentDeleteRequest* New() const final {
-    return CreateMaybeMessage<EnrollmentDeleteRequest>(nullptr);
+  inline FaceServiceInfo* New() const final {
+    return CreateMaybeMessage<FaceServiceInfo>(nullptr);
   }
 
-  EnrollmentDeleteRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<EnrollmentDeleteRequest>(arena);
+  FaceServiceInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<FaceServiceInfo>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const EnrollmentDeleteRequest& from);
-  void MergeFrom(const EnrollmentDeleteRequest& from);
+  void CopyFrom(const FaceServiceInfo& from);
+  void MergeFrom(const FaceServiceInfo& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5850,10 +6300,10 @@ class EnrollmentDeleteRequest :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(EnrollmentDeleteRequest* other);
+  void InternalSwap(FaceServiceInfo* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "EnrollmentDeleteRequest";
+    return "FaceServiceInfo";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -5877,59 +6327,158 @@ class EnrollmentDeleteRequest :
 
   // accessors -------------------------------------------------------
 
-  // string gallery_name = 1;
-  void clear_gallery_name();
-  static const int kGalleryNameFieldNumber = 1;
-  const std::string& gallery_name() const;
-  void set_gallery_name(const std::string& value);
-  void set_gallery_name(std::string&& value);
-  void set_gallery_name(const char* value);
-  void set_gallery_name(const char* value, size_t size);
-  std::string* mutable_gallery_name();
-  std::string* release_gallery_name();
-  void set_allocated_gallery_name(std::string* gallery_name);
+  // string algorithm = 10;
+  void clear_algorithm();
+  static const int kAlgorithmFieldNumber = 10;
+  const std::string& algorithm() const;
+  void set_algorithm(const std::string& value);
+  void set_algorithm(std::string&& value);
+  void set_algorithm(const char* value);
+  void set_algorithm(const char* value, size_t size);
+  std::string* mutable_algorithm();
+  std::string* release_algorithm();
+  void set_allocated_algorithm(std::string* algorithm);
 
-  // string subject_id = 2;
-  void clear_subject_id();
-  static const int kSubjectIdFieldNumber = 2;
-  const std::string& subject_id() const;
-  void set_subject_id(const std::string& value);
-  void set_subject_id(std::string&& value);
-  void set_subject_id(const char* value);
-  void set_subject_id(const char* value, size_t size);
-  std::string* mutable_subject_id();
-  std::string* release_subject_id();
-  void set_allocated_subject_id(std::string* subject_id);
+  // string notes = 11;
+  void clear_notes();
+  static const int kNotesFieldNumber = 11;
+  const std::string& notes() const;
+  void set_notes(const std::string& value);
+  void set_notes(std::string&& value);
+  void set_notes(const char* value);
+  void set_notes(const char* value, size_t size);
+  std::string* mutable_notes();
+  std::string* release_notes();
+  void set_allocated_notes(std::string* notes);
 
-  // @@protoc_insertion_point(class_scope:EnrollmentDeleteRequest)
+  // string faro_version = 12;
+  void clear_faro_version();
+  static const int kFaroVersionFieldNumber = 12;
+  const std::string& faro_version() const;
+  void set_faro_version(const std::string& value);
+  void set_faro_version(std::string&& value);
+  void set_faro_version(const char* value);
+  void set_faro_version(const char* value, size_t size);
+  std::string* mutable_faro_version();
+  std::string* release_faro_version();
+  void set_allocated_faro_version(std::string* faro_version);
+
+  // string instance_name = 13;
+  void clear_instance_name();
+  static const int kInstanceNameFieldNumber = 13;
+  const std::string& instance_name() const;
+  void set_instance_name(const std::string& value);
+  void set_instance_name(std::string&& value);
+  void set_instance_name(const char* value);
+  void set_instance_name(const char* value, size_t size);
+  std::string* mutable_instance_name();
+  std::string* release_instance_name();
+  void set_allocated_instance_name(std::string* instance_name);
+
+  // .GalleryCacheStats gallery_cache = 14;
+  bool has_gallery_cache() const;
+  void clear_gallery_cache();
+  static const int kGalleryCacheFieldNumber = 14;
+  const ::GalleryCacheStats& gallery_cache() const;
+  ::GalleryCacheStats* release_gallery_cache();
+  ::GalleryCacheStats* mutable_gallery_cache();
+  void set_allocated_gallery_cache(::GalleryCacheStats* gallery_cache);
+
+  // .ServiceStatus status = 1;
+  void clear_status();
+  static const int kStatusFieldNumber = 1;
+  ::ServiceStatus status() const;
+  void set_status(::ServiceStatus value);
+
+  // int32 worker_count = 2;
+  void clear_worker_count();
+  static const int kWorkerCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int32 worker_count() const;
+  void set_worker_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // bool detection_support = 3;
+  void clear_detection_support();
+  static const int kDetectionSupportFieldNumber = 3;
+  bool detection_support() const;
+  void set_detection_support(bool value);
+
+  // bool extract_support = 4;
+  void clear_extract_support();
+  static const int kExtractSupportFieldNumber = 4;
+  bool extract_support() const;
+  void set_extract_support(bool value);
+
+  // bool score_support = 5;
+  void clear_score_support();
+  static const int kScoreSupportFieldNumber = 5;
+  bool score_support() const;
+  void set_score_support(bool value);
+
+  // bool attribute_support = 6;
+  void clear_attribute_support();
+  static const int kAttributeSupportFieldNumber = 6;
+  bool attribute_support() const;
+  void set_attribute_support(bool value);
+
+  // .ScoreType score_type = 7;
+  void clear_score_type();
+  static const int kScoreTypeFieldNumber = 7;
+  ::ScoreType score_type() const;
+  void set_score_type(::ScoreType value);
+
+  // float detection_threshold = 8;
+  void clear_detection_threshold();
+  static const int kDetectionThresholdFieldNumber = 8;
+  float detection_threshold() const;
+  void set_detection_threshold(float value);
+
+  // float match_threshold = 9;
+  void clear_match_threshold();
+  static const int kMatchThresholdFieldNumber = 9;
+  float match_threshold() const;
+  void set_match_threshold(float value);
+
+  // @@protoc_insertion_point(class_scope:FaceServiceInfo)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr algorithm_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr notes_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr faro_version_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr instance_name_;
+  ::GalleryCacheStats* gallery_cache_;
+  int status_;
+  ::PROTOBUF_NAMESPACE_ID::int32 worker_count_;
+  bool detection_support_;
+  bool extract_support_;
+  bool score_support_;
+  bool attribute_support_;
+  int score_type_;
+  float detection_threshold_;
+  float match_threshold_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class GalleryInfo :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryInfo) */ {
+class GalleryCacheStats :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryCacheStats) */ {
  public:
-  GalleryInfo();
-  virtual ~GalleryInfo();
+  GalleryCacheStats();
+  virtual ~GalleryCacheStats();
 
-  GalleryInfo(const GalleryInfo& from);
-  GalleryInfo(GalleryInfo&& from) noexcept
-    : GalleryInfo() {
+  GalleryCacheStats(const GalleryCacheStats& from);
+  GalleryCacheStats(GalleryCacheStats&& from) noexcept
+    : GalleryCacheStats() {
     *this = ::std::move(from);
   }
 
-  inline GalleryInfo& operator=(const GalleryInfo& from) {
+  inline GalleryCacheStats& operator=(const GalleryCacheStats& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GalleryInfo& operator=(GalleryInfo&& from) noexcept {
+  inline GalleryCacheStats& operator=(GalleryCacheStats&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -5947,34 +6496,34 @@ class GalleryInfo :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const GalleryInfo& default_instance();
+  static const GalleryCacheStats& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const GalleryInfo* internal_default_instance() {
-    return reinterpret_cast<const GalleryInfo*>(
-               &_GalleryInfo_default_instance_);
+  static inline const GalleryCacheStats* internal_default_instance() {
+    return reinterpret_cast<const GalleryCacheStats*>(
+               &_GalleryCacheStats_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    35;
+    36;
 
-  void Swap(GalleryInfo* other);
-  friend void swap(GalleryInfo& a, GalleryInfo& b) {
+  void Swap(GalleryCacheStats* other);
+  friend void swap(GalleryCacheStats& a, GalleryCacheStats& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline GalleryInfo* New() const final {
-    return CreateMaybeMessage<GalleryInfo>(nullptr);
+  inline GalleryCacheStats* New() const final {
+    return CreateMaybeMessage<GalleryCacheStats>(nullptr);
   }
 
-  GalleryInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<GalleryInfo>(arena);
+  GalleryCacheStats* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryCacheStats>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const GalleryInfo& from);
-  void MergeFrom(const GalleryInfo& from);
+  void CopyFrom(const GalleryCacheStats& from);
+  void MergeFrom(const GalleryCacheStats& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -5995,10 +6544,10 @@ class GalleryInfo :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GalleryInfo* other);
+  void InternalSwap(GalleryCacheStats* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "GalleryInfo";
+    return "GalleryCacheStats";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -6022,53 +6571,89 @@ class GalleryInfo :
 
   // accessors -------------------------------------------------------
 
-  // string gallery_name = 1;
-  void clear_gallery_name();
-  static const int kGalleryNameFieldNumber = 1;
-  const std::string& gallery_name() const;
-  void set_gallery_name(const std::string& value);
-  void set_gallery_name(std::string&& value);
-  void set_gallery_name(const char* value);
-  void set_gallery_name(const char* value, size_t size);
-  std::string* mutable_gallery_name();
-  std::string* release_gallery_name();
-  void set_allocated_gallery_name(std::string* gallery_name);
-
-  // int64 face_count = 2;
-  void clear_face_count();
-  static const int kFaceCountFieldNumber = 2;
-  ::PROTOBUF_NAMESPACE_ID::int64 face_count() const;
-  void set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value);
-
-  // @@protoc_insertion_point(class_scope:GalleryInfo)
+  // int64 open_galleries = 1;
+  void clear_open_galleries();
+  static const int kOpenGalleriesFieldNumber = 1;
+  ::PROTOBUF_NAMESPACE_ID::int64 open_galleries() const;
+  void set_open_galleries(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 pinned_galleries = 2;
+  void clear_pinned_galleries();
+  static const int kPinnedGalleriesFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 pinned_galleries() const;
+  void set_pinned_galleries(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 open_bytes = 3;
+  void clear_open_bytes();
+  static const int kOpenBytesFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 open_bytes() const;
+  void set_open_bytes(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 max_open = 4;
+  void clear_max_open();
+  static const int kMaxOpenFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 max_open() const;
+  void set_max_open(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 max_bytes = 5;
+  void clear_max_bytes();
+  static const int kMaxBytesFieldNumber = 5;
+  ::PROTOBUF_NAMESPACE_ID::int64 max_bytes() const;
+  void set_max_bytes(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 hits = 6;
+  void clear_hits();
+  static const int kHitsFieldNumber = 6;
+  ::PROTOBUF_NAMESPACE_ID::int64 hits() const;
+  void set_hits(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 misses = 7;
+  void clear_misses();
+  static const int kMissesFieldNumber = 7;
+  ::PROTOBUF_NAMESPACE_ID::int64 misses() const;
+  void set_misses(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 evictions = 8;
+  void clear_evictions();
+  static const int kEvictionsFieldNumber = 8;
+  ::PROTOBUF_NAMESPACE_ID::int64 evictions() const;
+  void set_evictions(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:GalleryCacheStats)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
-  ::PROTOBUF_NAMESPACE_ID::int64 face_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 open_galleries_;
+  ::PROTOBUF_NAMESPACE_ID::int64 pinned_galleries_;
+  ::PROTOBUF_NAMESPACE_ID::int64 open_bytes_;
+  ::PROTOBUF_NAMESPACE_ID::int64 max_open_;
+  ::PROTOBUF_NAMESPACE_ID::int64 max_bytes_;
+  ::PROTOBUF_NAMESPACE_ID::int64 hits_;
+  ::PROTOBUF_NAMESPACE_ID::int64 misses_;
+  ::PROTOBUF_NAMESPACE_ID::int64 evictions_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class GalleryList :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryList) */ {
+class GalleryListRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryListRequest) */ {
  public:
-  GalleryList();
-  virtual ~GalleryList();
+  GalleryListRequest();
+  virtual ~GalleryListRequest();
 
-  GalleryList(const GalleryList& from);
-  GalleryList(GalleryList&& from) noexcept
-    : GalleryList() {
+  GalleryListRequest(const GalleryListRequest& from);
+  GalleryListRequest(GalleryListRequest&& from) noexcept
+    : GalleryListRequest() {
     *this = ::std::move(from);
   }
 
-  inline GalleryList& operator=(const GalleryList& from) {
+  inline GalleryListRequest& operator=(const GalleryListRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GalleryList& operator=(GalleryList&& from) noexcept {
+  inline GalleryListRequest& operator=(GalleryListRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -6086,34 +6671,34 @@ class GalleryList :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const GalleryList& default_instance();
+  static const GalleryListRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const GalleryList* internal_default_instance() {
-    return reinterpret_cast<const GalleryList*>(
-               &_GalleryList_default_instance_);
+  static inline const GalleryListRequest* internal_default_instance() {
+    return reinterpret_cast<const GalleryListRequest*>(
+               &_GalleryListRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    36;
+    37;
 
-  void Swap(GalleryList* other);
-  friend void swap(GalleryList& a, GalleryList& b) {
+  void Swap(GalleryListRequest* other);
+  friend void swap(GalleryListRequest& a, GalleryListRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline GalleryList* New() const final {
-    return CreateMaybeMessage<GalleryList>(nullptr);
+  inline GalleryListRequest* New() const final {
+    return CreateMaybeMessage<GalleryListRequest>(nullptr);
   }
 
-  GalleryList* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<GalleryList>(arena);
+  GalleryListRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryListRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const GalleryList& from);
-  void MergeFrom(const GalleryList& from);
+  void CopyFrom(const GalleryListRequest& from);
+  void MergeFrom(const GalleryListRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -6134,10 +6719,10 @@ class GalleryList :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GalleryList* other);
+  void InternalSwap(GalleryListRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "GalleryList";
+    return "GalleryListRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -6161,46 +6746,33 @@ class GalleryList :
 
   // accessors -------------------------------------------------------
 
-  // repeated .GalleryInfo galleries = 1;
-  int galleries_size() const;
-  void clear_galleries();
-  static const int kGalleriesFieldNumber = 1;
-  ::GalleryInfo* mutable_galleries(int index);
-  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo >*
-      mutable_galleries();
-  const ::GalleryInfo& galleries(int index) const;
-  ::GalleryInfo* add_galleries();
-  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo >&
-      galleries() const;
-
-  // @@protoc_insertion_point(class_scope:GalleryList)
+  // @@protoc_insertion_point(class_scope:GalleryListRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
-  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo > galleries_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
 // -------------------------------------------------------------------
 
-class Empty :
-    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:Empty) */ {
+class GalleryDeleteRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryDeleteRequest) */ {
  public:
-  Empty();
-  virtual ~Empty();
+  GalleryDeleteRequest();
+  virtual ~GalleryDeleteRequest();
 
-  Empty(const Empty& from);
-  Empty(Empty&& from) noexcept
-    : Empty() {
+  GalleryDeleteRequest(const GalleryDeleteRequest& from);
+  GalleryDeleteRequest(GalleryDeleteRequest&& from) noexcept
+    : GalleryDeleteRequest() {
     *this = ::std::move(from);
   }
 
-  inline Empty& operator=(const Empty& from) {
+  inline GalleryDeleteRequest& operator=(const GalleryDeleteRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Empty& operator=(Empty&& from) noexcept {
+  inline GalleryDeleteRequest& operator=(GalleryDeleteRequest&& from) noexcept {
     if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
       if (this != &from) InternalSwap(&from);
     } else {
@@ -6218,34 +6790,34 @@ class Empty :
   static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
     return GetMetadataStatic().reflection;
   }
-  static const Empty& default_instance();
+  static const GalleryDeleteRequest& default_instance();
 
   static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
-  static inline const Empty* internal_default_instance() {
-    return reinterpret_cast<const Empty*>(
-               &_Empty_default_instance_);
+  static inline const GalleryDeleteRequest* internal_default_instance() {
+    return reinterpret_cast<const GalleryDeleteRequest*>(
+               &_GalleryDeleteRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    37;
+    38;
 
-  void Swap(Empty* other);
-  friend void swap(Empty& a, Empty& b) {
+  void Swap(GalleryDeleteRequest* other);
+  friend void swap(GalleryDeleteRequest& a, GalleryDeleteRequest& b) {
     a.Swap(&b);
   }
 
   // implements Message ----------------------------------------------
 
-  inline Empty* New() const final {
-    return CreateMaybeMessage<Empty>(nullptr);
+  inline GalleryDeleteRequest* New() const final {
+    return CreateMaybeMessage<GalleryDeleteRequest>(nullptr);
   }
 
-  Empty* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
-    return CreateMaybeMessage<Empty>(arena);
+  GalleryDeleteRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryDeleteRequest>(arena);
   }
   void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
   void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
-  void CopyFrom(const Empty& from);
-  void MergeFrom(const Empty& from);
+  void CopyFrom(const GalleryDeleteRequest& from);
+  void MergeFrom(const GalleryDeleteRequest& from);
   PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
   bool IsInitialized() const final;
 
@@ -6266,10 +6838,10 @@ class Empty :
   inline void SharedCtor();
   inline void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(Empty* other);
+  void InternalSwap(GalleryDeleteRequest* other);
   friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
   static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
-    return "Empty";
+    return "GalleryDeleteRequest";
   }
   private:
   inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
@@ -6293,4877 +6865,9375 @@ class Empty :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:Empty)
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // @@protoc_insertion_point(class_scope:GalleryDeleteRequest)
  private:
   class HasBitSetters;
 
   ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
   mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
   friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
 };
-// ===================================================================
+// -------------------------------------------------------------------
 
+class GalleryConfigureRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryConfigureRequest) */ {
+ public:
+  GalleryConfigureRequest();
+  virtual ~GalleryConfigureRequest();
 
-// ===================================================================
+  GalleryConfigureRequest(const GalleryConfigureRequest& from);
+  GalleryConfigureRequest(GalleryConfigureRequest&& from) noexcept
+    : GalleryConfigureRequest() {
+    *this = ::std::move(from);
+  }
 
-#ifdef __GNUC__
-  #pragma GCC diagnostic push
-  #pragma GCC diagnostic ignored "-Wstrict-aliasing"
-#endif  // __GNUC__
-// Attribute
+  inline GalleryConfigureRequest& operator=(const GalleryConfigureRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryConfigureRequest& operator=(GalleryConfigureRequest&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
 
-// string key = 1;
-inline void Attribute::clear_key() {
-  key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& Attribute::key() const {
-  // @@protoc_insertion_point(field_get:Attribute.key)
-  return key_.GetNoArena();
-}
-inline void Attribute::set_key(const std::string& value) {
-  
-  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.key)
-}
-inline void Attribute::set_key(std::string&& value) {
-  
-  key_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.key)
-}
-inline void Attribute::set_key(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.key)
-}
-inline void Attribute::set_key(const char* value, size_t size) {
-  
-  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.key)
-}
-inline std::string* Attribute::mutable_key() {
-  
-  // @@protoc_insertion_point(field_mutable:Attribute.key)
-  return key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline std::string* Attribute::release_key() {
-  // @@protoc_insertion_point(field_release:Attribute.key)
-  
-  return key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline void Attribute::set_allocated_key(std::string* key) {
-  if (key != nullptr) {
-    
-  } else {
-    
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
   }
-  key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), key);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.key)
-}
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryConfigureRequest& default_instance();
 
-// string description = 2;
-inline void Attribute::clear_description() {
-  description_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& Attribute::description() const {
-  // @@protoc_insertion_point(field_get:Attribute.description)
-  return description_.GetNoArena();
-}
-inline void Attribute::set_description(const std::string& value) {
-  
-  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.description)
-}
-inline void Attribute::set_description(std::string&& value) {
-  
-  description_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.description)
-}
-inline void Attribute::set_description(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.description)
-}
-inline void Attribute::set_description(const char* value, size_t size) {
-  
-  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.description)
-}
-inline std::string* Attribute::mutable_description() {
-  
-  // @@protoc_insertion_point(field_mutable:Attribute.description)
-  return description_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline std::string* Attribute::release_description() {
-  // @@protoc_insertion_point(field_release:Attribute.description)
-  
-  return description_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline void Attribute::set_allocated_description(std::string* description) {
-  if (description != nullptr) {
-    
-  } else {
-    
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryConfigureRequest* internal_default_instance() {
+    return reinterpret_cast<const GalleryConfigureRequest*>(
+               &_GalleryConfigureRequest_default_instance_);
   }
-  description_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), description);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.description)
-}
+  static constexpr int kIndexInFileMessages =
+    39;
 
-// bytes buffer = 3;
-inline void Attribute::clear_buffer() {
-  buffer_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& Attribute::buffer() const {
-  // @@protoc_insertion_point(field_get:Attribute.buffer)
-  return buffer_.GetNoArena();
-}
-inline void Attribute::set_buffer(const std::string& value) {
-  
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.buffer)
-}
-inline void Attribute::set_buffer(std::string&& value) {
-  
-  buffer_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.buffer)
-}
-inline void Attribute::set_buffer(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.buffer)
-}
-inline void Attribute::set_buffer(const void* value, size_t size) {
-  
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.buffer)
-}
-inline std::string* Attribute::mutable_buffer() {
-  
-  // @@protoc_insertion_point(field_mutable:Attribute.buffer)
-  return buffer_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline std::string* Attribute::release_buffer() {
-  // @@protoc_insertion_point(field_release:Attribute.buffer)
-  
-  return buffer_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline void Attribute::set_allocated_buffer(std::string* buffer) {
-  if (buffer != nullptr) {
-    
-  } else {
-    
+  void Swap(GalleryConfigureRequest* other);
+  friend void swap(GalleryConfigureRequest& a, GalleryConfigureRequest& b) {
+    a.Swap(&b);
   }
-  buffer_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), buffer);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.buffer)
-}
 
-// float fvalue = 4;
-inline void Attribute::clear_fvalue() {
-  fvalue_ = 0;
-}
-inline float Attribute::fvalue() const {
-  // @@protoc_insertion_point(field_get:Attribute.fvalue)
-  return fvalue_;
-}
-inline void Attribute::set_fvalue(float value) {
-  
-  fvalue_ = value;
-  // @@protoc_insertion_point(field_set:Attribute.fvalue)
-}
+  // implements Message ----------------------------------------------
 
-// int32 ivalue = 5;
-inline void Attribute::clear_ivalue() {
-  ivalue_ = 0;
-}
-inline ::PROTOBUF_NAMESPACE_ID::int32 Attribute::ivalue() const {
-  // @@protoc_insertion_point(field_get:Attribute.ivalue)
-  return ivalue_;
-}
-inline void Attribute::set_ivalue(::PROTOBUF_NAMESPACE_ID::int32 value) {
-  
-  ivalue_ = value;
-  // @@protoc_insertion_point(field_set:Attribute.ivalue)
-}
+  inline GalleryConfigureRequest* New() const final {
+    return CreateMaybeMessage<GalleryConfigureRequest>(nullptr);
+  }
 
-// string text = 6;
-inline void Attribute::clear_text() {
-  text_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& Attribute::text() const {
-  // @@protoc_insertion_point(field_get:Attribute.text)
-  return text_.GetNoArena();
-}
-inline void Attribute::set_text(const std::string& value) {
-  
-  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.text)
-}
-inline void Attribute::set_text(std::string&& value) {
-  
-  text_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.text)
-}
+  GalleryConfigureRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryConfigureRequest>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryConfigureRequest& from);
+  void MergeFrom(const GalleryConfigureRequest& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryConfigureRequest* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryConfigureRequest";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string index_quantization = 2;
+  void clear_index_quantization();
+  static const int kIndexQuantizationFieldNumber = 2;
+  const std::string& index_quantization() const;
+  void set_index_quantization(const std::string& value);
+  void set_index_quantization(std::string&& value);
+  void set_index_quantization(const char* value);
+  void set_index_quantization(const char* value, size_t size);
+  std::string* mutable_index_quantization();
+  std::string* release_index_quantization();
+  void set_allocated_index_quantization(std::string* index_quantization);
+
+  // @@protoc_insertion_point(class_scope:GalleryConfigureRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr index_quantization_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryCompactRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryCompactRequest) */ {
+ public:
+  GalleryCompactRequest();
+  virtual ~GalleryCompactRequest();
+
+  GalleryCompactRequest(const GalleryCompactRequest& from);
+  GalleryCompactRequest(GalleryCompactRequest&& from) noexcept
+    : GalleryCompactRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryCompactRequest& operator=(const GalleryCompactRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryCompactRequest& operator=(GalleryCompactRequest&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryCompactRequest& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryCompactRequest* internal_default_instance() {
+    return reinterpret_cast<const GalleryCompactRequest*>(
+               &_GalleryCompactRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    40;
+
+  void Swap(GalleryCompactRequest* other);
+  friend void swap(GalleryCompactRequest& a, GalleryCompactRequest& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryCompactRequest* New() const final {
+    return CreateMaybeMessage<GalleryCompactRequest>(nullptr);
+  }
+
+  GalleryCompactRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryCompactRequest>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryCompactRequest& from);
+  void MergeFrom(const GalleryCompactRequest& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryCompactRequest* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryCompactRequest";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // @@protoc_insertion_point(class_scope:GalleryCompactRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryCompactResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryCompactResponse) */ {
+ public:
+  GalleryCompactResponse();
+  virtual ~GalleryCompactResponse();
+
+  GalleryCompactResponse(const GalleryCompactResponse& from);
+  GalleryCompactResponse(GalleryCompactResponse&& from) noexcept
+    : GalleryCompactResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryCompactResponse& operator=(const GalleryCompactResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryCompactResponse& operator=(GalleryCompactResponse&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryCompactResponse& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryCompactResponse* internal_default_instance() {
+    return reinterpret_cast<const GalleryCompactResponse*>(
+               &_GalleryCompactResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    41;
+
+  void Swap(GalleryCompactResponse* other);
+  friend void swap(GalleryCompactResponse& a, GalleryCompactResponse& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryCompactResponse* New() const final {
+    return CreateMaybeMessage<GalleryCompactResponse>(nullptr);
+  }
+
+  GalleryCompactResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryCompactResponse>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryCompactResponse& from);
+  void MergeFrom(const GalleryCompactResponse& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryCompactResponse* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryCompactResponse";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // int64 face_count = 2;
+  void clear_face_count();
+  static const int kFaceCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count() const;
+  void set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 rows_removed = 3;
+  void clear_rows_removed();
+  static const int kRowsRemovedFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 rows_removed() const;
+  void set_rows_removed(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 bytes_before = 4;
+  void clear_bytes_before();
+  static const int kBytesBeforeFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_before() const;
+  void set_bytes_before(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 bytes_after = 5;
+  void clear_bytes_after();
+  static const int kBytesAfterFieldNumber = 5;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_after() const;
+  void set_bytes_after(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 bytes_reclaimed = 6;
+  void clear_bytes_reclaimed();
+  static const int kBytesReclaimedFieldNumber = 6;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_reclaimed() const;
+  void set_bytes_reclaimed(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // float compact_time = 7;
+  void clear_compact_time();
+  static const int kCompactTimeFieldNumber = 7;
+  float compact_time() const;
+  void set_compact_time(float value);
+
+  // @@protoc_insertion_point(class_scope:GalleryCompactResponse)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 rows_removed_;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_before_;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_after_;
+  ::PROTOBUF_NAMESPACE_ID::int64 bytes_reclaimed_;
+  float compact_time_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryExportRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryExportRequest) */ {
+ public:
+  GalleryExportRequest();
+  virtual ~GalleryExportRequest();
+
+  GalleryExportRequest(const GalleryExportRequest& from);
+  GalleryExportRequest(GalleryExportRequest&& from) noexcept
+    : GalleryExportRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryExportRequest& operator=(const GalleryExportRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryExportRequest& operator=(GalleryExportRequest&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryExportRequest& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryExportRequest* internal_default_instance() {
+    return reinterpret_cast<const GalleryExportRequest*>(
+               &_GalleryExportRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    42;
+
+  void Swap(GalleryExportRequest* other);
+  friend void swap(GalleryExportRequest& a, GalleryExportRequest& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryExportRequest* New() const final {
+    return CreateMaybeMessage<GalleryExportRequest>(nullptr);
+  }
+
+  GalleryExportRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryExportRequest>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryExportRequest& from);
+  void MergeFrom(const GalleryExportRequest& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryExportRequest* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryExportRequest";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string file_id = 3;
+  void clear_file_id();
+  static const int kFileIdFieldNumber = 3;
+  const std::string& file_id() const;
+  void set_file_id(const std::string& value);
+  void set_file_id(std::string&& value);
+  void set_file_id(const char* value);
+  void set_file_id(const char* value, size_t size);
+  std::string* mutable_file_id();
+  std::string* release_file_id();
+  void set_allocated_file_id(std::string* file_id);
+
+  // int64 start_row = 2;
+  void clear_start_row();
+  static const int kStartRowFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 start_row() const;
+  void set_start_row(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int32 chunk_size = 4;
+  void clear_chunk_size();
+  static const int kChunkSizeFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int32 chunk_size() const;
+  void set_chunk_size(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // bool include_views = 5;
+  void clear_include_views();
+  static const int kIncludeViewsFieldNumber = 5;
+  bool include_views() const;
+  void set_include_views(bool value);
+
+  // @@protoc_insertion_point(class_scope:GalleryExportRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr file_id_;
+  ::PROTOBUF_NAMESPACE_ID::int64 start_row_;
+  ::PROTOBUF_NAMESPACE_ID::int32 chunk_size_;
+  bool include_views_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryChunk :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryChunk) */ {
+ public:
+  GalleryChunk();
+  virtual ~GalleryChunk();
+
+  GalleryChunk(const GalleryChunk& from);
+  GalleryChunk(GalleryChunk&& from) noexcept
+    : GalleryChunk() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryChunk& operator=(const GalleryChunk& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryChunk& operator=(GalleryChunk&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryChunk& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryChunk* internal_default_instance() {
+    return reinterpret_cast<const GalleryChunk*>(
+               &_GalleryChunk_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    43;
+
+  void Swap(GalleryChunk* other);
+  friend void swap(GalleryChunk& a, GalleryChunk& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryChunk* New() const final {
+    return CreateMaybeMessage<GalleryChunk>(nullptr);
+  }
+
+  GalleryChunk* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryChunk>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryChunk& from);
+  void MergeFrom(const GalleryChunk& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryChunk* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryChunk";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string file_id = 2;
+  void clear_file_id();
+  static const int kFileIdFieldNumber = 2;
+  const std::string& file_id() const;
+  void set_file_id(const std::string& value);
+  void set_file_id(std::string&& value);
+  void set_file_id(const char* value);
+  void set_file_id(const char* value, size_t size);
+  std::string* mutable_file_id();
+  std::string* release_file_id();
+  void set_allocated_file_id(std::string* file_id);
+
+  // bytes templates = 7;
+  void clear_templates();
+  static const int kTemplatesFieldNumber = 7;
+  const std::string& templates() const;
+  void set_templates(const std::string& value);
+  void set_templates(std::string&& value);
+  void set_templates(const char* value);
+  void set_templates(const void* value, size_t size);
+  std::string* mutable_templates();
+  std::string* release_templates();
+  void set_allocated_templates(std::string* templates);
+
+  // .FaceRecordList records = 8;
+  bool has_records() const;
+  void clear_records();
+  static const int kRecordsFieldNumber = 8;
+  const ::FaceRecordList& records() const;
+  ::FaceRecordList* release_records();
+  ::FaceRecordList* mutable_records();
+  void set_allocated_records(::FaceRecordList* records);
+
+  // int64 start_row = 3;
+  void clear_start_row();
+  static const int kStartRowFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 start_row() const;
+  void set_start_row(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 next_row = 4;
+  void clear_next_row();
+  static const int kNextRowFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 next_row() const;
+  void set_next_row(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 row_count = 5;
+  void clear_row_count();
+  static const int kRowCountFieldNumber = 5;
+  ::PROTOBUF_NAMESPACE_ID::int64 row_count() const;
+  void set_row_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int32 dim = 6;
+  void clear_dim();
+  static const int kDimFieldNumber = 6;
+  ::PROTOBUF_NAMESPACE_ID::int32 dim() const;
+  void set_dim(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // @@protoc_insertion_point(class_scope:GalleryChunk)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr file_id_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr templates_;
+  ::FaceRecordList* records_;
+  ::PROTOBUF_NAMESPACE_ID::int64 start_row_;
+  ::PROTOBUF_NAMESPACE_ID::int64 next_row_;
+  ::PROTOBUF_NAMESPACE_ID::int64 row_count_;
+  ::PROTOBUF_NAMESPACE_ID::int32 dim_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryImportResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryImportResponse) */ {
+ public:
+  GalleryImportResponse();
+  virtual ~GalleryImportResponse();
+
+  GalleryImportResponse(const GalleryImportResponse& from);
+  GalleryImportResponse(GalleryImportResponse&& from) noexcept
+    : GalleryImportResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryImportResponse& operator=(const GalleryImportResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryImportResponse& operator=(GalleryImportResponse&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryImportResponse& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryImportResponse* internal_default_instance() {
+    return reinterpret_cast<const GalleryImportResponse*>(
+               &_GalleryImportResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    44;
+
+  void Swap(GalleryImportResponse* other);
+  friend void swap(GalleryImportResponse& a, GalleryImportResponse& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryImportResponse* New() const final {
+    return CreateMaybeMessage<GalleryImportResponse>(nullptr);
+  }
+
+  GalleryImportResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryImportResponse>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryImportResponse& from);
+  void MergeFrom(const GalleryImportResponse& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryImportResponse* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryImportResponse";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string file_id = 2;
+  void clear_file_id();
+  static const int kFileIdFieldNumber = 2;
+  const std::string& file_id() const;
+  void set_file_id(const std::string& value);
+  void set_file_id(std::string&& value);
+  void set_file_id(const char* value);
+  void set_file_id(const char* value, size_t size);
+  std::string* mutable_file_id();
+  std::string* release_file_id();
+  void set_allocated_file_id(std::string* file_id);
+
+  // int64 next_row = 3;
+  void clear_next_row();
+  static const int kNextRowFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 next_row() const;
+  void set_next_row(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 enroll_count = 4;
+  void clear_enroll_count();
+  static const int kEnrollCountFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count() const;
+  void set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 replace_count = 5;
+  void clear_replace_count();
+  static const int kReplaceCountFieldNumber = 5;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count() const;
+  void set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:GalleryImportResponse)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr file_id_;
+  ::PROTOBUF_NAMESPACE_ID::int64 next_row_;
+  ::PROTOBUF_NAMESPACE_ID::int64 enroll_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 replace_count_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollmentListRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentListRequest) */ {
+ public:
+  EnrollmentListRequest();
+  virtual ~EnrollmentListRequest();
+
+  EnrollmentListRequest(const EnrollmentListRequest& from);
+  EnrollmentListRequest(EnrollmentListRequest&& from) noexcept
+    : EnrollmentListRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollmentListRequest& operator=(const EnrollmentListRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollmentListRequest& operator=(EnrollmentListRequest&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollmentListRequest& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollmentListRequest* internal_default_instance() {
+    return reinterpret_cast<const EnrollmentListRequest*>(
+               &_EnrollmentListRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    45;
+
+  void Swap(EnrollmentListRequest* other);
+  friend void swap(EnrollmentListRequest& a, EnrollmentListRequest& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollmentListRequest* New() const final {
+    return CreateMaybeMessage<EnrollmentListRequest>(nullptr);
+  }
+
+  EnrollmentListRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollmentListRequest>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollmentListRequest& from);
+  void MergeFrom(const EnrollmentListRequest& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollmentListRequest* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollmentListRequest";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // @@protoc_insertion_point(class_scope:EnrollmentListRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollmentInfo :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentInfo) */ {
+ public:
+  EnrollmentInfo();
+  virtual ~EnrollmentInfo();
+
+  EnrollmentInfo(const EnrollmentInfo& from);
+  EnrollmentInfo(EnrollmentInfo&& from) noexcept
+    : EnrollmentInfo() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollmentInfo& operator=(const EnrollmentInfo& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollmentInfo& operator=(EnrollmentInfo&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollmentInfo& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollmentInfo* internal_default_instance() {
+    return reinterpret_cast<const EnrollmentInfo*>(
+               &_EnrollmentInfo_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    46;
+
+  void Swap(EnrollmentInfo* other);
+  friend void swap(EnrollmentInfo& a, EnrollmentInfo& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollmentInfo* New() const final {
+    return CreateMaybeMessage<EnrollmentInfo>(nullptr);
+  }
+
+  EnrollmentInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollmentInfo>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollmentInfo& from);
+  void MergeFrom(const EnrollmentInfo& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollmentInfo* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollmentInfo";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string subject_id = 1;
+  void clear_subject_id();
+  static const int kSubjectIdFieldNumber = 1;
+  const std::string& subject_id() const;
+  void set_subject_id(const std::string& value);
+  void set_subject_id(std::string&& value);
+  void set_subject_id(const char* value);
+  void set_subject_id(const char* value, size_t size);
+  std::string* mutable_subject_id();
+  std::string* release_subject_id();
+  void set_allocated_subject_id(std::string* subject_id);
+
+  // string name = 2;
+  void clear_name();
+  static const int kNameFieldNumber = 2;
+  const std::string& name() const;
+  void set_name(const std::string& value);
+  void set_name(std::string&& value);
+  void set_name(const char* value);
+  void set_name(const char* value, size_t size);
+  std::string* mutable_name();
+  std::string* release_name();
+  void set_allocated_name(std::string* name);
+
+  // int32 face_count = 3;
+  void clear_face_count();
+  static const int kFaceCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int32 face_count() const;
+  void set_face_count(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // @@protoc_insertion_point(class_scope:EnrollmentInfo)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+  ::PROTOBUF_NAMESPACE_ID::int32 face_count_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollmentListResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentListResponse) */ {
+ public:
+  EnrollmentListResponse();
+  virtual ~EnrollmentListResponse();
+
+  EnrollmentListResponse(const EnrollmentListResponse& from);
+  EnrollmentListResponse(EnrollmentListResponse&& from) noexcept
+    : EnrollmentListResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollmentListResponse& operator=(const EnrollmentListResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollmentListResponse& operator=(EnrollmentListResponse&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollmentListResponse& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollmentListResponse* internal_default_instance() {
+    return reinterpret_cast<const EnrollmentListResponse*>(
+               &_EnrollmentListResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    47;
+
+  void Swap(EnrollmentListResponse* other);
+  friend void swap(EnrollmentListResponse& a, EnrollmentListResponse& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollmentListResponse* New() const final {
+    return CreateMaybeMessage<EnrollmentListResponse>(nullptr);
+  }
+
+  EnrollmentListResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollmentListResponse>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollmentListResponse& from);
+  void MergeFrom(const EnrollmentListResponse& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollmentListResponse* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollmentListResponse";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // repeated .EnrollmentInfo enrollments = 2;
+  int enrollments_size() const;
+  void clear_enrollments();
+  static const int kEnrollmentsFieldNumber = 2;
+  ::EnrollmentInfo* mutable_enrollments(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo >*
+      mutable_enrollments();
+  const ::EnrollmentInfo& enrollments(int index) const;
+  ::EnrollmentInfo* add_enrollments();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo >&
+      enrollments() const;
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // @@protoc_insertion_point(class_scope:EnrollmentListResponse)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::EnrollmentInfo > enrollments_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollmentDeleteRequest :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentDeleteRequest) */ {
+ public:
+  EnrollmentDeleteRequest();
+  virtual ~EnrollmentDeleteRequest();
+
+  EnrollmentDeleteRequest(const EnrollmentDeleteRequest& from);
+  EnrollmentDeleteRequest(EnrollmentDeleteRequest&& from) noexcept
+    : EnrollmentDeleteRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollmentDeleteRequest& operator=(const EnrollmentDeleteRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollmentDeleteRequest& operator=(EnrollmentDeleteRequest&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollmentDeleteRequest& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollmentDeleteRequest* internal_default_instance() {
+    return reinterpret_cast<const EnrollmentDeleteRequest*>(
+               &_EnrollmentDeleteRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    48;
+
+  void Swap(EnrollmentDeleteRequest* other);
+  friend void swap(EnrollmentDeleteRequest& a, EnrollmentDeleteRequest& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollmentDeleteRequest* New() const final {
+    return CreateMaybeMessage<EnrollmentDeleteRequest>(nullptr);
+  }
+
+  EnrollmentDeleteRequest* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollmentDeleteRequest>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollmentDeleteRequest& from);
+  void MergeFrom(const EnrollmentDeleteRequest& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollmentDeleteRequest* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollmentDeleteRequest";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string subject_id = 2;
+  void clear_subject_id();
+  static const int kSubjectIdFieldNumber = 2;
+  const std::string& subject_id() const;
+  void set_subject_id(const std::string& value);
+  void set_subject_id(std::string&& value);
+  void set_subject_id(const char* value);
+  void set_subject_id(const char* value, size_t size);
+  std::string* mutable_subject_id();
+  std::string* release_subject_id();
+  void set_allocated_subject_id(std::string* subject_id);
+
+  // string gallery_key = 3;
+  void clear_gallery_key();
+  static const int kGalleryKeyFieldNumber = 3;
+  const std::string& gallery_key() const;
+  void set_gallery_key(const std::string& value);
+  void set_gallery_key(std::string&& value);
+  void set_gallery_key(const char* value);
+  void set_gallery_key(const char* value, size_t size);
+  std::string* mutable_gallery_key();
+  std::string* release_gallery_key();
+  void set_allocated_gallery_key(std::string* gallery_key);
+
+  // @@protoc_insertion_point(class_scope:EnrollmentDeleteRequest)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr subject_id_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_key_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class EnrollmentDeleteResponse :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:EnrollmentDeleteResponse) */ {
+ public:
+  EnrollmentDeleteResponse();
+  virtual ~EnrollmentDeleteResponse();
+
+  EnrollmentDeleteResponse(const EnrollmentDeleteResponse& from);
+  EnrollmentDeleteResponse(EnrollmentDeleteResponse&& from) noexcept
+    : EnrollmentDeleteResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline EnrollmentDeleteResponse& operator=(const EnrollmentDeleteResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline EnrollmentDeleteResponse& operator=(EnrollmentDeleteResponse&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const EnrollmentDeleteResponse& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const EnrollmentDeleteResponse* internal_default_instance() {
+    return reinterpret_cast<const EnrollmentDeleteResponse*>(
+               &_EnrollmentDeleteResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    49;
+
+  void Swap(EnrollmentDeleteResponse* other);
+  friend void swap(EnrollmentDeleteResponse& a, EnrollmentDeleteResponse& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline EnrollmentDeleteResponse* New() const final {
+    return CreateMaybeMessage<EnrollmentDeleteResponse>(nullptr);
+  }
+
+  EnrollmentDeleteResponse* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<EnrollmentDeleteResponse>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const EnrollmentDeleteResponse& from);
+  void MergeFrom(const EnrollmentDeleteResponse& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(EnrollmentDeleteResponse* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "EnrollmentDeleteResponse";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // int64 delete_count = 1;
+  void clear_delete_count();
+  static const int kDeleteCountFieldNumber = 1;
+  ::PROTOBUF_NAMESPACE_ID::int64 delete_count() const;
+  void set_delete_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // @@protoc_insertion_point(class_scope:EnrollmentDeleteResponse)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::int64 delete_count_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryInfo :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryInfo) */ {
+ public:
+  GalleryInfo();
+  virtual ~GalleryInfo();
+
+  GalleryInfo(const GalleryInfo& from);
+  GalleryInfo(GalleryInfo&& from) noexcept
+    : GalleryInfo() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryInfo& operator=(const GalleryInfo& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryInfo& operator=(GalleryInfo&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryInfo& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryInfo* internal_default_instance() {
+    return reinterpret_cast<const GalleryInfo*>(
+               &_GalleryInfo_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    50;
+
+  void Swap(GalleryInfo* other);
+  friend void swap(GalleryInfo& a, GalleryInfo& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryInfo* New() const final {
+    return CreateMaybeMessage<GalleryInfo>(nullptr);
+  }
+
+  GalleryInfo* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryInfo>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryInfo& from);
+  void MergeFrom(const GalleryInfo& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryInfo* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryInfo";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // string gallery_name = 1;
+  void clear_gallery_name();
+  static const int kGalleryNameFieldNumber = 1;
+  const std::string& gallery_name() const;
+  void set_gallery_name(const std::string& value);
+  void set_gallery_name(std::string&& value);
+  void set_gallery_name(const char* value);
+  void set_gallery_name(const char* value, size_t size);
+  std::string* mutable_gallery_name();
+  std::string* release_gallery_name();
+  void set_allocated_gallery_name(std::string* gallery_name);
+
+  // string index_state = 6;
+  void clear_index_state();
+  static const int kIndexStateFieldNumber = 6;
+  const std::string& index_state() const;
+  void set_index_state(const std::string& value);
+  void set_index_state(std::string&& value);
+  void set_index_state(const char* value);
+  void set_index_state(const char* value, size_t size);
+  std::string* mutable_index_state();
+  std::string* release_index_state();
+  void set_allocated_index_state(std::string* index_state);
+
+  // int64 face_count = 2;
+  void clear_face_count();
+  static const int kFaceCountFieldNumber = 2;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count() const;
+  void set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 subject_count = 3;
+  void clear_subject_count();
+  static const int kSubjectCountFieldNumber = 3;
+  ::PROTOBUF_NAMESPACE_ID::int64 subject_count() const;
+  void set_subject_count(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // int64 file_bytes = 5;
+  void clear_file_bytes();
+  static const int kFileBytesFieldNumber = 5;
+  ::PROTOBUF_NAMESPACE_ID::int64 file_bytes() const;
+  void set_file_bytes(::PROTOBUF_NAMESPACE_ID::int64 value);
+
+  // double modified = 7;
+  void clear_modified();
+  static const int kModifiedFieldNumber = 7;
+  double modified() const;
+  void set_modified(double value);
+
+  // int32 template_dim = 4;
+  void clear_template_dim();
+  static const int kTemplateDimFieldNumber = 4;
+  ::PROTOBUF_NAMESPACE_ID::int32 template_dim() const;
+  void set_template_dim(::PROTOBUF_NAMESPACE_ID::int32 value);
+
+  // @@protoc_insertion_point(class_scope:GalleryInfo)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr gallery_name_;
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr index_state_;
+  ::PROTOBUF_NAMESPACE_ID::int64 face_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 subject_count_;
+  ::PROTOBUF_NAMESPACE_ID::int64 file_bytes_;
+  double modified_;
+  ::PROTOBUF_NAMESPACE_ID::int32 template_dim_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GalleryList :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:GalleryList) */ {
+ public:
+  GalleryList();
+  virtual ~GalleryList();
+
+  GalleryList(const GalleryList& from);
+  GalleryList(GalleryList&& from) noexcept
+    : GalleryList() {
+    *this = ::std::move(from);
+  }
+
+  inline GalleryList& operator=(const GalleryList& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GalleryList& operator=(GalleryList&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const GalleryList& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const GalleryList* internal_default_instance() {
+    return reinterpret_cast<const GalleryList*>(
+               &_GalleryList_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    51;
+
+  void Swap(GalleryList* other);
+  friend void swap(GalleryList& a, GalleryList& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline GalleryList* New() const final {
+    return CreateMaybeMessage<GalleryList>(nullptr);
+  }
+
+  GalleryList* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<GalleryList>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const GalleryList& from);
+  void MergeFrom(const GalleryList& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GalleryList* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "GalleryList";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // repeated .GalleryInfo galleries = 1;
+  int galleries_size() const;
+  void clear_galleries();
+  static const int kGalleriesFieldNumber = 1;
+  ::GalleryInfo* mutable_galleries(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo >*
+      mutable_galleries();
+  const ::GalleryInfo& galleries(int index) const;
+  ::GalleryInfo* add_galleries();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo >&
+      galleries() const;
+
+  // @@protoc_insertion_point(class_scope:GalleryList)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::GalleryInfo > galleries_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// -------------------------------------------------------------------
+
+class Empty :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:Empty) */ {
+ public:
+  Empty();
+  virtual ~Empty();
+
+  Empty(const Empty& from);
+  Empty(Empty&& from) noexcept
+    : Empty() {
+    *this = ::std::move(from);
+  }
+
+  inline Empty& operator=(const Empty& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline Empty& operator=(Empty&& from) noexcept {
+    if (GetArenaNoVirtual() == from.GetArenaNoVirtual()) {
+      if (this != &from) InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return GetMetadataStatic().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return GetMetadataStatic().reflection;
+  }
+  static const Empty& default_instance();
+
+  static void InitAsDefaultInstance();  // FOR INTERNAL USE ONLY
+  static inline const Empty* internal_default_instance() {
+    return reinterpret_cast<const Empty*>(
+               &_Empty_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    52;
+
+  void Swap(Empty* other);
+  friend void swap(Empty& a, Empty& b) {
+    a.Swap(&b);
+  }
+
+  // implements Message ----------------------------------------------
+
+  inline Empty* New() const final {
+    return CreateMaybeMessage<Empty>(nullptr);
+  }
+
+  Empty* New(::PROTOBUF_NAMESPACE_ID::Arena* arena) const final {
+    return CreateMaybeMessage<Empty>(arena);
+  }
+  void CopyFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void MergeFrom(const ::PROTOBUF_NAMESPACE_ID::Message& from) final;
+  void CopyFrom(const Empty& from);
+  void MergeFrom(const Empty& from);
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  #if GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  #else
+  bool MergePartialFromCodedStream(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedInputStream* input) final;
+  #endif  // GOOGLE_PROTOBUF_ENABLE_EXPERIMENTAL_PARSER
+  void SerializeWithCachedSizes(
+      ::PROTOBUF_NAMESPACE_ID::io::CodedOutputStream* output) const final;
+  ::PROTOBUF_NAMESPACE_ID::uint8* InternalSerializeWithCachedSizesToArray(
+      ::PROTOBUF_NAMESPACE_ID::uint8* target) const final;
+  int GetCachedSize() const final { return _cached_size_.Get(); }
+
+  private:
+  inline void SharedCtor();
+  inline void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(Empty* other);
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "Empty";
+  }
+  private:
+  inline ::PROTOBUF_NAMESPACE_ID::Arena* GetArenaNoVirtual() const {
+    return nullptr;
+  }
+  inline void* MaybeArenaPtr() const {
+    return nullptr;
+  }
+  public:
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+  private:
+  static ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadataStatic() {
+    ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&::descriptor_table_faro_2fproto_2fface_5fservice_2eproto);
+    return ::descriptor_table_faro_2fproto_2fface_5fservice_2eproto.file_level_metadata[kIndexInFileMessages];
+  }
+
+  public:
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // @@protoc_insertion_point(class_scope:Empty)
+ private:
+  class HasBitSetters;
+
+  ::PROTOBUF_NAMESPACE_ID::internal::InternalMetadataWithArena _internal_metadata_;
+  mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  friend struct ::TableStruct_faro_2fproto_2fface_5fservice_2eproto;
+};
+// ===================================================================
+
+
+// ===================================================================
+
+#ifdef __GNUC__
+  #pragma GCC diagnostic push
+  #pragma GCC diagnostic ignored "-Wstrict-aliasing"
+#endif  // __GNUC__
+// Attribute
+
+// string key = 1;
+inline void Attribute::clear_key() {
+  key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::key() const {
+  // @@protoc_insertion_point(field_get:Attribute.key)
+  return key_.GetNoArena();
+}
+inline void Attribute::set_key(const std::string& value) {
+  
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.key)
+}
+inline void Attribute::set_key(std::string&& value) {
+  
+  key_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.key)
+}
+inline void Attribute::set_key(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.key)
+}
+inline void Attribute::set_key(const char* value, size_t size) {
+  
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.key)
+}
+inline std::string* Attribute::mutable_key() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.key)
+  return key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_key() {
+  // @@protoc_insertion_point(field_release:Attribute.key)
+  
+  return key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_key(std::string* key) {
+  if (key != nullptr) {
+    
+  } else {
+    
+  }
+  key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), key);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.key)
+}
+
+// string description = 2;
+inline void Attribute::clear_description() {
+  description_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::description() const {
+  // @@protoc_insertion_point(field_get:Attribute.description)
+  return description_.GetNoArena();
+}
+inline void Attribute::set_description(const std::string& value) {
+  
+  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.description)
+}
+inline void Attribute::set_description(std::string&& value) {
+  
+  description_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.description)
+}
+inline void Attribute::set_description(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.description)
+}
+inline void Attribute::set_description(const char* value, size_t size) {
+  
+  description_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.description)
+}
+inline std::string* Attribute::mutable_description() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.description)
+  return description_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_description() {
+  // @@protoc_insertion_point(field_release:Attribute.description)
+  
+  return description_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_description(std::string* description) {
+  if (description != nullptr) {
+    
+  } else {
+    
+  }
+  description_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), description);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.description)
+}
+
+// bytes buffer = 3;
+inline void Attribute::clear_buffer() {
+  buffer_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::buffer() const {
+  // @@protoc_insertion_point(field_get:Attribute.buffer)
+  return buffer_.GetNoArena();
+}
+inline void Attribute::set_buffer(const std::string& value) {
+  
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.buffer)
+}
+inline void Attribute::set_buffer(std::string&& value) {
+  
+  buffer_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.buffer)
+}
+inline void Attribute::set_buffer(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.buffer)
+}
+inline void Attribute::set_buffer(const void* value, size_t size) {
+  
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.buffer)
+}
+inline std::string* Attribute::mutable_buffer() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.buffer)
+  return buffer_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_buffer() {
+  // @@protoc_insertion_point(field_release:Attribute.buffer)
+  
+  return buffer_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_buffer(std::string* buffer) {
+  if (buffer != nullptr) {
+    
+  } else {
+    
+  }
+  buffer_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), buffer);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.buffer)
+}
+
+// float fvalue = 4;
+inline void Attribute::clear_fvalue() {
+  fvalue_ = 0;
+}
+inline float Attribute::fvalue() const {
+  // @@protoc_insertion_point(field_get:Attribute.fvalue)
+  return fvalue_;
+}
+inline void Attribute::set_fvalue(float value) {
+  
+  fvalue_ = value;
+  // @@protoc_insertion_point(field_set:Attribute.fvalue)
+}
+
+// int32 ivalue = 5;
+inline void Attribute::clear_ivalue() {
+  ivalue_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 Attribute::ivalue() const {
+  // @@protoc_insertion_point(field_get:Attribute.ivalue)
+  return ivalue_;
+}
+inline void Attribute::set_ivalue(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  ivalue_ = value;
+  // @@protoc_insertion_point(field_set:Attribute.ivalue)
+}
+
+// string text = 6;
+inline void Attribute::clear_text() {
+  text_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::text() const {
+  // @@protoc_insertion_point(field_get:Attribute.text)
+  return text_.GetNoArena();
+}
+inline void Attribute::set_text(const std::string& value) {
+  
+  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.text)
+}
+inline void Attribute::set_text(std::string&& value) {
+  
+  text_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.text)
+}
 inline void Attribute::set_text(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.text)
+  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.text)
+}
+inline void Attribute::set_text(const char* value, size_t size) {
+  
+  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.text)
+}
+inline std::string* Attribute::mutable_text() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.text)
+  return text_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_text() {
+  // @@protoc_insertion_point(field_release:Attribute.text)
+  
+  return text_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_text(std::string* text) {
+  if (text != nullptr) {
+    
+  } else {
+    
+  }
+  text_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), text);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.text)
+}
+
+// bytes pickle = 7;
+inline void Attribute::clear_pickle() {
+  pickle_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::pickle() const {
+  // @@protoc_insertion_point(field_get:Attribute.pickle)
+  return pickle_.GetNoArena();
+}
+inline void Attribute::set_pickle(const std::string& value) {
+  
+  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.pickle)
+}
+inline void Attribute::set_pickle(std::string&& value) {
+  
+  pickle_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.pickle)
+}
+inline void Attribute::set_pickle(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.pickle)
+}
+inline void Attribute::set_pickle(const void* value, size_t size) {
+  
+  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.pickle)
+}
+inline std::string* Attribute::mutable_pickle() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.pickle)
+  return pickle_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_pickle() {
+  // @@protoc_insertion_point(field_release:Attribute.pickle)
+  
+  return pickle_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_pickle(std::string* pickle) {
+  if (pickle != nullptr) {
+    
+  } else {
+    
+  }
+  pickle_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), pickle);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.pickle)
+}
+
+// bytes json = 8;
+inline void Attribute::clear_json() {
+  json_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::json() const {
+  // @@protoc_insertion_point(field_get:Attribute.json)
+  return json_.GetNoArena();
+}
+inline void Attribute::set_json(const std::string& value) {
+  
+  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.json)
+}
+inline void Attribute::set_json(std::string&& value) {
+  
+  json_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.json)
+}
+inline void Attribute::set_json(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.json)
+}
+inline void Attribute::set_json(const void* value, size_t size) {
+  
+  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.json)
+}
+inline std::string* Attribute::mutable_json() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.json)
+  return json_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_json() {
+  // @@protoc_insertion_point(field_release:Attribute.json)
+  
+  return json_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_json(std::string* json) {
+  if (json != nullptr) {
+    
+  } else {
+    
+  }
+  json_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), json);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.json)
+}
+
+// .Matrix matrix = 9;
+inline bool Attribute::has_matrix() const {
+  return this != internal_default_instance() && matrix_ != nullptr;
+}
+inline const ::Matrix& Attribute::matrix() const {
+  const ::Matrix* p = matrix_;
+  // @@protoc_insertion_point(field_get:Attribute.matrix)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Matrix*>(
+      &::_Matrix_default_instance_);
+}
+inline ::Matrix* Attribute::release_matrix() {
+  // @@protoc_insertion_point(field_release:Attribute.matrix)
+  
+  ::Matrix* temp = matrix_;
+  matrix_ = nullptr;
+  return temp;
+}
+inline ::Matrix* Attribute::mutable_matrix() {
+  
+  if (matrix_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Matrix>(GetArenaNoVirtual());
+    matrix_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Attribute.matrix)
+  return matrix_;
+}
+inline void Attribute::set_allocated_matrix(::Matrix* matrix) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(matrix_);
+  }
+  if (matrix) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      matrix = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, matrix, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  matrix_ = matrix;
+  // @@protoc_insertion_point(field_set_allocated:Attribute.matrix)
+}
+
+// .Vector vector = 10;
+inline bool Attribute::has_vector() const {
+  return this != internal_default_instance() && vector_ != nullptr;
+}
+inline const ::Vector& Attribute::vector() const {
+  const ::Vector* p = vector_;
+  // @@protoc_insertion_point(field_get:Attribute.vector)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Vector*>(
+      &::_Vector_default_instance_);
+}
+inline ::Vector* Attribute::release_vector() {
+  // @@protoc_insertion_point(field_release:Attribute.vector)
+  
+  ::Vector* temp = vector_;
+  vector_ = nullptr;
+  return temp;
+}
+inline ::Vector* Attribute::mutable_vector() {
+  
+  if (vector_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Vector>(GetArenaNoVirtual());
+    vector_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Attribute.vector)
+  return vector_;
+}
+inline void Attribute::set_allocated_vector(::Vector* vector) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(vector_);
+  }
+  if (vector) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      vector = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, vector, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  vector_ = vector;
+  // @@protoc_insertion_point(field_set_allocated:Attribute.vector)
+}
+
+// .Image image = 11;
+inline bool Attribute::has_image() const {
+  return this != internal_default_instance() && image_ != nullptr;
+}
+inline const ::Image& Attribute::image() const {
+  const ::Image* p = image_;
+  // @@protoc_insertion_point(field_get:Attribute.image)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
+}
+inline ::Image* Attribute::release_image() {
+  // @@protoc_insertion_point(field_release:Attribute.image)
+  
+  ::Image* temp = image_;
+  image_ = nullptr;
+  return temp;
+}
+inline ::Image* Attribute::mutable_image() {
+  
+  if (image_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    image_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Attribute.image)
+  return image_;
+}
+inline void Attribute::set_allocated_image(::Image* image) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
+  }
+  if (image) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, image, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  image_ = image;
+  // @@protoc_insertion_point(field_set_allocated:Attribute.image)
+}
+
+// .Point2D point = 12;
+inline bool Attribute::has_point() const {
+  return this != internal_default_instance() && point_ != nullptr;
+}
+inline const ::Point2D& Attribute::point() const {
+  const ::Point2D* p = point_;
+  // @@protoc_insertion_point(field_get:Attribute.point)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Point2D*>(
+      &::_Point2D_default_instance_);
+}
+inline ::Point2D* Attribute::release_point() {
+  // @@protoc_insertion_point(field_release:Attribute.point)
+  
+  ::Point2D* temp = point_;
+  point_ = nullptr;
+  return temp;
+}
+inline ::Point2D* Attribute::mutable_point() {
+  
+  if (point_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Point2D>(GetArenaNoVirtual());
+    point_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Attribute.point)
+  return point_;
+}
+inline void Attribute::set_allocated_point(::Point2D* point) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(point_);
+  }
+  if (point) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      point = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, point, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  point_ = point;
+  // @@protoc_insertion_point(field_set_allocated:Attribute.point)
+}
+
+// .Rect rect = 13;
+inline bool Attribute::has_rect() const {
+  return this != internal_default_instance() && rect_ != nullptr;
+}
+inline const ::Rect& Attribute::rect() const {
+  const ::Rect* p = rect_;
+  // @@protoc_insertion_point(field_get:Attribute.rect)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Rect*>(
+      &::_Rect_default_instance_);
+}
+inline ::Rect* Attribute::release_rect() {
+  // @@protoc_insertion_point(field_release:Attribute.rect)
+  
+  ::Rect* temp = rect_;
+  rect_ = nullptr;
+  return temp;
+}
+inline ::Rect* Attribute::mutable_rect() {
+  
+  if (rect_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Rect>(GetArenaNoVirtual());
+    rect_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Attribute.rect)
+  return rect_;
+}
+inline void Attribute::set_allocated_rect(::Rect* rect) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(rect_);
+  }
+  if (rect) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      rect = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, rect, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  rect_ = rect;
+  // @@protoc_insertion_point(field_set_allocated:Attribute.rect)
+}
+
+// bytes xml = 14;
+inline void Attribute::clear_xml() {
+  xml_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Attribute::xml() const {
+  // @@protoc_insertion_point(field_get:Attribute.xml)
+  return xml_.GetNoArena();
+}
+inline void Attribute::set_xml(const std::string& value) {
+  
+  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Attribute.xml)
+}
+inline void Attribute::set_xml(std::string&& value) {
+  
+  xml_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Attribute.xml)
+}
+inline void Attribute::set_xml(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Attribute.xml)
+}
+inline void Attribute::set_xml(const void* value, size_t size) {
+  
+  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Attribute.xml)
+}
+inline std::string* Attribute::mutable_xml() {
+  
+  // @@protoc_insertion_point(field_mutable:Attribute.xml)
+  return xml_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Attribute::release_xml() {
+  // @@protoc_insertion_point(field_release:Attribute.xml)
+  
+  return xml_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Attribute::set_allocated_xml(std::string* xml) {
+  if (xml != nullptr) {
+    
+  } else {
+    
+  }
+  xml_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), xml);
+  // @@protoc_insertion_point(field_set_allocated:Attribute.xml)
+}
+
+// -------------------------------------------------------------------
+
+// ErrorMessage
+
+// int32 error_code = 3;
+inline void ErrorMessage::clear_error_code() {
+  error_code_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 ErrorMessage::error_code() const {
+  // @@protoc_insertion_point(field_get:ErrorMessage.error_code)
+  return error_code_;
+}
+inline void ErrorMessage::set_error_code(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  error_code_ = value;
+  // @@protoc_insertion_point(field_set:ErrorMessage.error_code)
+}
+
+// string error_message = 4;
+inline void ErrorMessage::clear_error_message() {
+  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& ErrorMessage::error_message() const {
+  // @@protoc_insertion_point(field_get:ErrorMessage.error_message)
+  return error_message_.GetNoArena();
+}
+inline void ErrorMessage::set_error_message(const std::string& value) {
+  
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:ErrorMessage.error_message)
+}
+inline void ErrorMessage::set_error_message(std::string&& value) {
+  
+  error_message_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:ErrorMessage.error_message)
+}
+inline void ErrorMessage::set_error_message(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:ErrorMessage.error_message)
+}
+inline void ErrorMessage::set_error_message(const char* value, size_t size) {
+  
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:ErrorMessage.error_message)
+}
+inline std::string* ErrorMessage::mutable_error_message() {
+  
+  // @@protoc_insertion_point(field_mutable:ErrorMessage.error_message)
+  return error_message_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* ErrorMessage::release_error_message() {
+  // @@protoc_insertion_point(field_release:ErrorMessage.error_message)
+  
+  return error_message_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void ErrorMessage::set_allocated_error_message(std::string* error_message) {
+  if (error_message != nullptr) {
+    
+  } else {
+    
+  }
+  error_message_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), error_message);
+  // @@protoc_insertion_point(field_set_allocated:ErrorMessage.error_message)
+}
+
+// -------------------------------------------------------------------
+
+// Detection
+
+// float score = 1;
+inline void Detection::clear_score() {
+  score_ = 0;
+}
+inline float Detection::score() const {
+  // @@protoc_insertion_point(field_get:Detection.score)
+  return score_;
+}
+inline void Detection::set_score(float value) {
+  
+  score_ = value;
+  // @@protoc_insertion_point(field_set:Detection.score)
+}
+
+// .Rect location = 2;
+inline bool Detection::has_location() const {
+  return this != internal_default_instance() && location_ != nullptr;
+}
+inline const ::Rect& Detection::location() const {
+  const ::Rect* p = location_;
+  // @@protoc_insertion_point(field_get:Detection.location)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Rect*>(
+      &::_Rect_default_instance_);
+}
+inline ::Rect* Detection::release_location() {
+  // @@protoc_insertion_point(field_release:Detection.location)
+  
+  ::Rect* temp = location_;
+  location_ = nullptr;
+  return temp;
+}
+inline ::Rect* Detection::mutable_location() {
+  
+  if (location_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Rect>(GetArenaNoVirtual());
+    location_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Detection.location)
+  return location_;
+}
+inline void Detection::set_allocated_location(::Rect* location) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(location_);
+  }
+  if (location) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      location = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, location, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  location_ = location;
+  // @@protoc_insertion_point(field_set_allocated:Detection.location)
+}
+
+// int32 detection_id = 3;
+inline void Detection::clear_detection_id() {
+  detection_id_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 Detection::detection_id() const {
+  // @@protoc_insertion_point(field_get:Detection.detection_id)
+  return detection_id_;
+}
+inline void Detection::set_detection_id(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  detection_id_ = value;
+  // @@protoc_insertion_point(field_set:Detection.detection_id)
+}
+
+// string detection_class = 4;
+inline void Detection::clear_detection_class() {
+  detection_class_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Detection::detection_class() const {
+  // @@protoc_insertion_point(field_get:Detection.detection_class)
+  return detection_class_.GetNoArena();
+}
+inline void Detection::set_detection_class(const std::string& value) {
+  
+  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Detection.detection_class)
+}
+inline void Detection::set_detection_class(std::string&& value) {
+  
+  detection_class_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Detection.detection_class)
+}
+inline void Detection::set_detection_class(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Detection.detection_class)
+}
+inline void Detection::set_detection_class(const char* value, size_t size) {
+  
+  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Detection.detection_class)
+}
+inline std::string* Detection::mutable_detection_class() {
+  
+  // @@protoc_insertion_point(field_mutable:Detection.detection_class)
+  return detection_class_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Detection::release_detection_class() {
+  // @@protoc_insertion_point(field_release:Detection.detection_class)
+  
+  return detection_class_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Detection::set_allocated_detection_class(std::string* detection_class) {
+  if (detection_class != nullptr) {
+    
+  } else {
+    
+  }
+  detection_class_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), detection_class);
+  // @@protoc_insertion_point(field_set_allocated:Detection.detection_class)
+}
+
+// repeated .Attribute attributes = 5;
+inline int Detection::attributes_size() const {
+  return attributes_.size();
+}
+inline void Detection::clear_attributes() {
+  attributes_.Clear();
+}
+inline ::Attribute* Detection::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:Detection.attributes)
+  return attributes_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+Detection::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:Detection.attributes)
+  return &attributes_;
+}
+inline const ::Attribute& Detection::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:Detection.attributes)
+  return attributes_.Get(index);
+}
+inline ::Attribute* Detection::add_attributes() {
+  // @@protoc_insertion_point(field_add:Detection.attributes)
+  return attributes_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+Detection::attributes() const {
+  // @@protoc_insertion_point(field_list:Detection.attributes)
+  return attributes_;
+}
+
+// -------------------------------------------------------------------
+
+// Landmark
+
+// string landmark_id = 1;
+inline void Landmark::clear_landmark_id() {
+  landmark_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& Landmark::landmark_id() const {
+  // @@protoc_insertion_point(field_get:Landmark.landmark_id)
+  return landmark_id_.GetNoArena();
+}
+inline void Landmark::set_landmark_id(const std::string& value) {
+  
+  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:Landmark.landmark_id)
+}
+inline void Landmark::set_landmark_id(std::string&& value) {
+  
+  landmark_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:Landmark.landmark_id)
+}
+inline void Landmark::set_landmark_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:Landmark.landmark_id)
+}
+inline void Landmark::set_landmark_id(const char* value, size_t size) {
+  
+  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:Landmark.landmark_id)
+}
+inline std::string* Landmark::mutable_landmark_id() {
+  
+  // @@protoc_insertion_point(field_mutable:Landmark.landmark_id)
+  return landmark_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* Landmark::release_landmark_id() {
+  // @@protoc_insertion_point(field_release:Landmark.landmark_id)
+  
+  return landmark_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void Landmark::set_allocated_landmark_id(std::string* landmark_id) {
+  if (landmark_id != nullptr) {
+    
+  } else {
+    
+  }
+  landmark_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), landmark_id);
+  // @@protoc_insertion_point(field_set_allocated:Landmark.landmark_id)
+}
+
+// .Point2D location = 2;
+inline bool Landmark::has_location() const {
+  return this != internal_default_instance() && location_ != nullptr;
+}
+inline const ::Point2D& Landmark::location() const {
+  const ::Point2D* p = location_;
+  // @@protoc_insertion_point(field_get:Landmark.location)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Point2D*>(
+      &::_Point2D_default_instance_);
+}
+inline ::Point2D* Landmark::release_location() {
+  // @@protoc_insertion_point(field_release:Landmark.location)
+  
+  ::Point2D* temp = location_;
+  location_ = nullptr;
+  return temp;
+}
+inline ::Point2D* Landmark::mutable_location() {
+  
+  if (location_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Point2D>(GetArenaNoVirtual());
+    location_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:Landmark.location)
+  return location_;
+}
+inline void Landmark::set_allocated_location(::Point2D* location) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(location_);
+  }
+  if (location) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      location = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, location, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  location_ = location;
+  // @@protoc_insertion_point(field_set_allocated:Landmark.location)
+}
+
+// -------------------------------------------------------------------
+
+// DetectionOptions
+
+// string algorithm_id = 1;
+inline void DetectionOptions::clear_algorithm_id() {
+  algorithm_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& DetectionOptions::algorithm_id() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.algorithm_id)
+  return algorithm_id_.GetNoArena();
+}
+inline void DetectionOptions::set_algorithm_id(const std::string& value) {
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:DetectionOptions.algorithm_id)
+}
+inline void DetectionOptions::set_algorithm_id(std::string&& value) {
+  
+  algorithm_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:DetectionOptions.algorithm_id)
+}
+inline void DetectionOptions::set_algorithm_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:DetectionOptions.algorithm_id)
+}
+inline void DetectionOptions::set_algorithm_id(const char* value, size_t size) {
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:DetectionOptions.algorithm_id)
+}
+inline std::string* DetectionOptions::mutable_algorithm_id() {
+  
+  // @@protoc_insertion_point(field_mutable:DetectionOptions.algorithm_id)
+  return algorithm_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* DetectionOptions::release_algorithm_id() {
+  // @@protoc_insertion_point(field_release:DetectionOptions.algorithm_id)
+  
+  return algorithm_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void DetectionOptions::set_allocated_algorithm_id(std::string* algorithm_id) {
+  if (algorithm_id != nullptr) {
+    
+  } else {
+    
+  }
+  algorithm_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm_id);
+  // @@protoc_insertion_point(field_set_allocated:DetectionOptions.algorithm_id)
+}
+
+// bool best = 2;
+inline void DetectionOptions::clear_best() {
+  best_ = false;
+}
+inline bool DetectionOptions::best() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.best)
+  return best_;
+}
+inline void DetectionOptions::set_best(bool value) {
+  
+  best_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.best)
+}
+
+// float threshold = 3;
+inline void DetectionOptions::clear_threshold() {
+  threshold_ = 0;
+}
+inline float DetectionOptions::threshold() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.threshold)
+  return threshold_;
+}
+inline void DetectionOptions::set_threshold(float value) {
+  
+  threshold_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.threshold)
+}
+
+// int32 scale_levels = 4;
+inline void DetectionOptions::clear_scale_levels() {
+  scale_levels_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::scale_levels() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.scale_levels)
+  return scale_levels_;
+}
+inline void DetectionOptions::set_scale_levels(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  scale_levels_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.scale_levels)
+}
+
+// int32 scan_levels = 5;
+inline void DetectionOptions::clear_scan_levels() {
+  scan_levels_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::scan_levels() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.scan_levels)
+  return scan_levels_;
+}
+inline void DetectionOptions::set_scan_levels(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  scan_levels_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.scan_levels)
+}
+
+// float scan_overlap = 6;
+inline void DetectionOptions::clear_scan_overlap() {
+  scan_overlap_ = 0;
+}
+inline float DetectionOptions::scan_overlap() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.scan_overlap)
+  return scan_overlap_;
+}
+inline void DetectionOptions::set_scan_overlap(float value) {
+  
+  scan_overlap_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.scan_overlap)
+}
+
+// int32 min_size = 7;
+inline void DetectionOptions::clear_min_size() {
+  min_size_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::min_size() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.min_size)
+  return min_size_;
+}
+inline void DetectionOptions::set_min_size(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  min_size_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.min_size)
+}
+
+// bool save_request = 9;
+inline void DetectionOptions::clear_save_request() {
+  save_request_ = false;
+}
+inline bool DetectionOptions::save_request() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.save_request)
+  return save_request_;
+}
+inline void DetectionOptions::set_save_request(bool value) {
+  
+  save_request_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.save_request)
+}
+
+// bool debug = 10;
+inline void DetectionOptions::clear_debug() {
+  debug_ = false;
+}
+inline bool DetectionOptions::debug() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.debug)
+  return debug_;
+}
+inline void DetectionOptions::set_debug(bool value) {
+  
+  debug_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.debug)
+}
+
+// int32 downsample = 11;
+inline void DetectionOptions::clear_downsample() {
+  downsample_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::downsample() const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.downsample)
+  return downsample_;
+}
+inline void DetectionOptions::set_downsample(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  downsample_ = value;
+  // @@protoc_insertion_point(field_set:DetectionOptions.downsample)
+}
+
+// repeated .Attribute attributes = 8;
+inline int DetectionOptions::attributes_size() const {
+  return attributes_.size();
+}
+inline void DetectionOptions::clear_attributes() {
+  attributes_.Clear();
+}
+inline ::Attribute* DetectionOptions::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:DetectionOptions.attributes)
+  return attributes_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+DetectionOptions::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:DetectionOptions.attributes)
+  return &attributes_;
+}
+inline const ::Attribute& DetectionOptions::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:DetectionOptions.attributes)
+  return attributes_.Get(index);
+}
+inline ::Attribute* DetectionOptions::add_attributes() {
+  // @@protoc_insertion_point(field_add:DetectionOptions.attributes)
+  return attributes_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+DetectionOptions::attributes() const {
+  // @@protoc_insertion_point(field_list:DetectionOptions.attributes)
+  return attributes_;
+}
+
+// -------------------------------------------------------------------
+
+// ExtractOptions
+
+// string algorithm_id = 1;
+inline void ExtractOptions::clear_algorithm_id() {
+  algorithm_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& ExtractOptions::algorithm_id() const {
+  // @@protoc_insertion_point(field_get:ExtractOptions.algorithm_id)
+  return algorithm_id_.GetNoArena();
+}
+inline void ExtractOptions::set_algorithm_id(const std::string& value) {
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:ExtractOptions.algorithm_id)
+}
+inline void ExtractOptions::set_algorithm_id(std::string&& value) {
+  
+  algorithm_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:ExtractOptions.algorithm_id)
+}
+inline void ExtractOptions::set_algorithm_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:ExtractOptions.algorithm_id)
+}
+inline void ExtractOptions::set_algorithm_id(const char* value, size_t size) {
+  
+  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:ExtractOptions.algorithm_id)
+}
+inline std::string* ExtractOptions::mutable_algorithm_id() {
+  
+  // @@protoc_insertion_point(field_mutable:ExtractOptions.algorithm_id)
+  return algorithm_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* ExtractOptions::release_algorithm_id() {
+  // @@protoc_insertion_point(field_release:ExtractOptions.algorithm_id)
+  
+  return algorithm_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void ExtractOptions::set_allocated_algorithm_id(std::string* algorithm_id) {
+  if (algorithm_id != nullptr) {
+    
+  } else {
+    
+  }
+  algorithm_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm_id);
+  // @@protoc_insertion_point(field_set_allocated:ExtractOptions.algorithm_id)
+}
+
+// bool save_request = 2;
+inline void ExtractOptions::clear_save_request() {
+  save_request_ = false;
+}
+inline bool ExtractOptions::save_request() const {
+  // @@protoc_insertion_point(field_get:ExtractOptions.save_request)
+  return save_request_;
+}
+inline void ExtractOptions::set_save_request(bool value) {
+  
+  save_request_ = value;
+  // @@protoc_insertion_point(field_set:ExtractOptions.save_request)
+}
+
+// bool debug = 3;
+inline void ExtractOptions::clear_debug() {
+  debug_ = false;
+}
+inline bool ExtractOptions::debug() const {
+  // @@protoc_insertion_point(field_get:ExtractOptions.debug)
+  return debug_;
+}
+inline void ExtractOptions::set_debug(bool value) {
+  
+  debug_ = value;
+  // @@protoc_insertion_point(field_set:ExtractOptions.debug)
+}
+
+// repeated .Attribute attributes = 8;
+inline int ExtractOptions::attributes_size() const {
+  return attributes_.size();
+}
+inline void ExtractOptions::clear_attributes() {
+  attributes_.Clear();
+}
+inline ::Attribute* ExtractOptions::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:ExtractOptions.attributes)
+  return attributes_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+ExtractOptions::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:ExtractOptions.attributes)
+  return &attributes_;
+}
+inline const ::Attribute& ExtractOptions::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:ExtractOptions.attributes)
+  return attributes_.Get(index);
+}
+inline ::Attribute* ExtractOptions::add_attributes() {
+  // @@protoc_insertion_point(field_add:ExtractOptions.attributes)
+  return attributes_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+ExtractOptions::attributes() const {
+  // @@protoc_insertion_point(field_list:ExtractOptions.attributes)
+  return attributes_;
+}
+
+// -------------------------------------------------------------------
+
+// EnrollOptions
+
+// bool save_request = 2;
+inline void EnrollOptions::clear_save_request() {
+  save_request_ = false;
+}
+inline bool EnrollOptions::save_request() const {
+  // @@protoc_insertion_point(field_get:EnrollOptions.save_request)
+  return save_request_;
+}
+inline void EnrollOptions::set_save_request(bool value) {
+  
+  save_request_ = value;
+  // @@protoc_insertion_point(field_set:EnrollOptions.save_request)
+}
+
+// bool debug = 3;
+inline void EnrollOptions::clear_debug() {
+  debug_ = false;
+}
+inline bool EnrollOptions::debug() const {
+  // @@protoc_insertion_point(field_get:EnrollOptions.debug)
+  return debug_;
+}
+inline void EnrollOptions::set_debug(bool value) {
+  
+  debug_ = value;
+  // @@protoc_insertion_point(field_set:EnrollOptions.debug)
+}
+
+// repeated .Attribute attributes = 8;
+inline int EnrollOptions::attributes_size() const {
+  return attributes_.size();
+}
+inline void EnrollOptions::clear_attributes() {
+  attributes_.Clear();
+}
+inline ::Attribute* EnrollOptions::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:EnrollOptions.attributes)
+  return attributes_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+EnrollOptions::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:EnrollOptions.attributes)
+  return &attributes_;
+}
+inline const ::Attribute& EnrollOptions::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:EnrollOptions.attributes)
+  return attributes_.Get(index);
+}
+inline ::Attribute* EnrollOptions::add_attributes() {
+  // @@protoc_insertion_point(field_add:EnrollOptions.attributes)
+  return attributes_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+EnrollOptions::attributes() const {
+  // @@protoc_insertion_point(field_list:EnrollOptions.attributes)
+  return attributes_;
+}
+
+// float dedup_distance = 9;
+inline void EnrollOptions::clear_dedup_distance() {
+  dedup_distance_ = 0;
+}
+inline float EnrollOptions::dedup_distance() const {
+  // @@protoc_insertion_point(field_get:EnrollOptions.dedup_distance)
+  return dedup_distance_;
+}
+inline void EnrollOptions::set_dedup_distance(float value) {
+  
+  dedup_distance_ = value;
+  // @@protoc_insertion_point(field_set:EnrollOptions.dedup_distance)
+}
+
+// bool dedup_merge = 10;
+inline void EnrollOptions::clear_dedup_merge() {
+  dedup_merge_ = false;
+}
+inline bool EnrollOptions::dedup_merge() const {
+  // @@protoc_insertion_point(field_get:EnrollOptions.dedup_merge)
+  return dedup_merge_;
+}
+inline void EnrollOptions::set_dedup_merge(bool value) {
+  
+  dedup_merge_ = value;
+  // @@protoc_insertion_point(field_set:EnrollOptions.dedup_merge)
+}
+
+// -------------------------------------------------------------------
+
+// DetectionList
+
+// repeated .Detection detections = 1;
+inline int DetectionList::detections_size() const {
+  return detections_.size();
+}
+inline void DetectionList::clear_detections() {
+  detections_.Clear();
+}
+inline ::Detection* DetectionList::mutable_detections(int index) {
+  // @@protoc_insertion_point(field_mutable:DetectionList.detections)
+  return detections_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Detection >*
+DetectionList::mutable_detections() {
+  // @@protoc_insertion_point(field_mutable_list:DetectionList.detections)
+  return &detections_;
+}
+inline const ::Detection& DetectionList::detections(int index) const {
+  // @@protoc_insertion_point(field_get:DetectionList.detections)
+  return detections_.Get(index);
+}
+inline ::Detection* DetectionList::add_detections() {
+  // @@protoc_insertion_point(field_add:DetectionList.detections)
+  return detections_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Detection >&
+DetectionList::detections() const {
+  // @@protoc_insertion_point(field_list:DetectionList.detections)
+  return detections_;
+}
+
+// float detection_time = 2;
+inline void DetectionList::clear_detection_time() {
+  detection_time_ = 0;
+}
+inline float DetectionList::detection_time() const {
+  // @@protoc_insertion_point(field_get:DetectionList.detection_time)
+  return detection_time_;
+}
+inline void DetectionList::set_detection_time(float value) {
+  
+  detection_time_ = value;
+  // @@protoc_insertion_point(field_set:DetectionList.detection_time)
+}
+
+// int32 image_width = 3;
+inline void DetectionList::clear_image_width() {
+  image_width_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::image_width() const {
+  // @@protoc_insertion_point(field_get:DetectionList.image_width)
+  return image_width_;
+}
+inline void DetectionList::set_image_width(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  image_width_ = value;
+  // @@protoc_insertion_point(field_set:DetectionList.image_width)
+}
+
+// int32 image_height = 4;
+inline void DetectionList::clear_image_height() {
+  image_height_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::image_height() const {
+  // @@protoc_insertion_point(field_get:DetectionList.image_height)
+  return image_height_;
+}
+inline void DetectionList::set_image_height(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  image_height_ = value;
+  // @@protoc_insertion_point(field_set:DetectionList.image_height)
+}
+
+// int32 detection_count = 5;
+inline void DetectionList::clear_detection_count() {
+  detection_count_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::detection_count() const {
+  // @@protoc_insertion_point(field_get:DetectionList.detection_count)
+  return detection_count_;
+}
+inline void DetectionList::set_detection_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  detection_count_ = value;
+  // @@protoc_insertion_point(field_set:DetectionList.detection_count)
+}
+
+// .DetectionOptions options = 6;
+inline bool DetectionList::has_options() const {
+  return this != internal_default_instance() && options_ != nullptr;
+}
+inline void DetectionList::clear_options() {
+  if (GetArenaNoVirtual() == nullptr && options_ != nullptr) {
+    delete options_;
+  }
+  options_ = nullptr;
+}
+inline const ::DetectionOptions& DetectionList::options() const {
+  const ::DetectionOptions* p = options_;
+  // @@protoc_insertion_point(field_get:DetectionList.options)
+  return p != nullptr ? *p : *reinterpret_cast<const ::DetectionOptions*>(
+      &::_DetectionOptions_default_instance_);
+}
+inline ::DetectionOptions* DetectionList::release_options() {
+  // @@protoc_insertion_point(field_release:DetectionList.options)
+  
+  ::DetectionOptions* temp = options_;
+  options_ = nullptr;
+  return temp;
+}
+inline ::DetectionOptions* DetectionList::mutable_options() {
+  
+  if (options_ == nullptr) {
+    auto* p = CreateMaybeMessage<::DetectionOptions>(GetArenaNoVirtual());
+    options_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:DetectionList.options)
+  return options_;
+}
+inline void DetectionList::set_allocated_options(::DetectionOptions* options) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete options_;
+  }
+  if (options) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, options, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  options_ = options;
+  // @@protoc_insertion_point(field_set_allocated:DetectionList.options)
+}
+
+// -------------------------------------------------------------------
+
+// MatchList
+
+// repeated .MatchInfo match_list = 1;
+inline int MatchList::match_list_size() const {
+  return match_list_.size();
+}
+inline void MatchList::clear_match_list() {
+  match_list_.Clear();
+}
+inline ::MatchInfo* MatchList::mutable_match_list(int index) {
+  // @@protoc_insertion_point(field_mutable:MatchList.match_list)
+  return match_list_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::MatchInfo >*
+MatchList::mutable_match_list() {
+  // @@protoc_insertion_point(field_mutable_list:MatchList.match_list)
+  return &match_list_;
+}
+inline const ::MatchInfo& MatchList::match_list(int index) const {
+  // @@protoc_insertion_point(field_get:MatchList.match_list)
+  return match_list_.Get(index);
+}
+inline ::MatchInfo* MatchList::add_match_list() {
+  // @@protoc_insertion_point(field_add:MatchList.match_list)
+  return match_list_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::MatchInfo >&
+MatchList::match_list() const {
+  // @@protoc_insertion_point(field_list:MatchList.match_list)
+  return match_list_;
+}
+
+// -------------------------------------------------------------------
+
+// MatchInfo
+
+// float score = 1;
+inline void MatchInfo::clear_score() {
+  score_ = 0;
+}
+inline float MatchInfo::score() const {
+  // @@protoc_insertion_point(field_get:MatchInfo.score)
+  return score_;
+}
+inline void MatchInfo::set_score(float value) {
+  
+  score_ = value;
+  // @@protoc_insertion_point(field_set:MatchInfo.score)
+}
+
+// string image_id = 2;
+inline void MatchInfo::clear_image_id() {
+  image_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& MatchInfo::image_id() const {
+  // @@protoc_insertion_point(field_get:MatchInfo.image_id)
+  return image_id_.GetNoArena();
+}
+inline void MatchInfo::set_image_id(const std::string& value) {
+  
+  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:MatchInfo.image_id)
+}
+inline void MatchInfo::set_image_id(std::string&& value) {
+  
+  image_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.image_id)
+}
+inline void MatchInfo::set_image_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:MatchInfo.image_id)
 }
-inline void Attribute::set_text(const char* value, size_t size) {
+inline void MatchInfo::set_image_id(const char* value, size_t size) {
   
-  text_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.text)
+  // @@protoc_insertion_point(field_set_pointer:MatchInfo.image_id)
 }
-inline std::string* Attribute::mutable_text() {
+inline std::string* MatchInfo::mutable_image_id() {
   
-  // @@protoc_insertion_point(field_mutable:Attribute.text)
-  return text_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:MatchInfo.image_id)
+  return image_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* Attribute::release_text() {
-  // @@protoc_insertion_point(field_release:Attribute.text)
+inline std::string* MatchInfo::release_image_id() {
+  // @@protoc_insertion_point(field_release:MatchInfo.image_id)
   
-  return text_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return image_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Attribute::set_allocated_text(std::string* text) {
-  if (text != nullptr) {
+inline void MatchInfo::set_allocated_image_id(std::string* image_id) {
+  if (image_id != nullptr) {
     
   } else {
     
   }
-  text_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), text);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.text)
+  image_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), image_id);
+  // @@protoc_insertion_point(field_set_allocated:MatchInfo.image_id)
 }
 
-// bytes pickle = 7;
-inline void Attribute::clear_pickle() {
-  pickle_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// string detection_id = 3;
+inline void MatchInfo::clear_detection_id() {
+  detection_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& Attribute::pickle() const {
-  // @@protoc_insertion_point(field_get:Attribute.pickle)
-  return pickle_.GetNoArena();
+inline const std::string& MatchInfo::detection_id() const {
+  // @@protoc_insertion_point(field_get:MatchInfo.detection_id)
+  return detection_id_.GetNoArena();
 }
-inline void Attribute::set_pickle(const std::string& value) {
+inline void MatchInfo::set_detection_id(const std::string& value) {
   
-  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.pickle)
+  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:MatchInfo.detection_id)
 }
-inline void Attribute::set_pickle(std::string&& value) {
+inline void MatchInfo::set_detection_id(std::string&& value) {
   
-  pickle_.SetNoArena(
+  detection_id_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.pickle)
+  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.detection_id)
 }
-inline void Attribute::set_pickle(const char* value) {
+inline void MatchInfo::set_detection_id(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.pickle)
+  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:MatchInfo.detection_id)
 }
-inline void Attribute::set_pickle(const void* value, size_t size) {
+inline void MatchInfo::set_detection_id(const char* value, size_t size) {
   
-  pickle_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.pickle)
+  // @@protoc_insertion_point(field_set_pointer:MatchInfo.detection_id)
+}
+inline std::string* MatchInfo::mutable_detection_id() {
+  
+  // @@protoc_insertion_point(field_mutable:MatchInfo.detection_id)
+  return detection_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* MatchInfo::release_detection_id() {
+  // @@protoc_insertion_point(field_release:MatchInfo.detection_id)
+  
+  return detection_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void MatchInfo::set_allocated_detection_id(std::string* detection_id) {
+  if (detection_id != nullptr) {
+    
+  } else {
+    
+  }
+  detection_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), detection_id);
+  // @@protoc_insertion_point(field_set_allocated:MatchInfo.detection_id)
+}
+
+// string subject_id = 4;
+inline void MatchInfo::clear_subject_id() {
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& MatchInfo::subject_id() const {
+  // @@protoc_insertion_point(field_get:MatchInfo.subject_id)
+  return subject_id_.GetNoArena();
+}
+inline void MatchInfo::set_subject_id(const std::string& value) {
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:MatchInfo.subject_id)
+}
+inline void MatchInfo::set_subject_id(std::string&& value) {
+  
+  subject_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.subject_id)
+}
+inline void MatchInfo::set_subject_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:MatchInfo.subject_id)
+}
+inline void MatchInfo::set_subject_id(const char* value, size_t size) {
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:MatchInfo.subject_id)
+}
+inline std::string* MatchInfo::mutable_subject_id() {
+  
+  // @@protoc_insertion_point(field_mutable:MatchInfo.subject_id)
+  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* MatchInfo::release_subject_id() {
+  // @@protoc_insertion_point(field_release:MatchInfo.subject_id)
+  
+  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void MatchInfo::set_allocated_subject_id(std::string* subject_id) {
+  if (subject_id != nullptr) {
+    
+  } else {
+    
+  }
+  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
+  // @@protoc_insertion_point(field_set_allocated:MatchInfo.subject_id)
+}
+
+// string subject_name = 5;
+inline void MatchInfo::clear_subject_name() {
+  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& MatchInfo::subject_name() const {
+  // @@protoc_insertion_point(field_get:MatchInfo.subject_name)
+  return subject_name_.GetNoArena();
+}
+inline void MatchInfo::set_subject_name(const std::string& value) {
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:MatchInfo.subject_name)
+}
+inline void MatchInfo::set_subject_name(std::string&& value) {
+  
+  subject_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.subject_name)
+}
+inline void MatchInfo::set_subject_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:MatchInfo.subject_name)
+}
+inline void MatchInfo::set_subject_name(const char* value, size_t size) {
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:MatchInfo.subject_name)
 }
-inline std::string* Attribute::mutable_pickle() {
+inline std::string* MatchInfo::mutable_subject_name() {
   
-  // @@protoc_insertion_point(field_mutable:Attribute.pickle)
-  return pickle_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:MatchInfo.subject_name)
+  return subject_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* Attribute::release_pickle() {
-  // @@protoc_insertion_point(field_release:Attribute.pickle)
+inline std::string* MatchInfo::release_subject_name() {
+  // @@protoc_insertion_point(field_release:MatchInfo.subject_name)
   
-  return pickle_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return subject_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Attribute::set_allocated_pickle(std::string* pickle) {
-  if (pickle != nullptr) {
+inline void MatchInfo::set_allocated_subject_name(std::string* subject_name) {
+  if (subject_name != nullptr) {
     
   } else {
     
   }
-  pickle_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), pickle);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.pickle)
+  subject_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_name);
+  // @@protoc_insertion_point(field_set_allocated:MatchInfo.subject_name)
 }
 
-// bytes json = 8;
-inline void Attribute::clear_json() {
-  json_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// .Image face = 6;
+inline bool MatchInfo::has_face() const {
+  return this != internal_default_instance() && face_ != nullptr;
 }
-inline const std::string& Attribute::json() const {
-  // @@protoc_insertion_point(field_get:Attribute.json)
-  return json_.GetNoArena();
+inline const ::Image& MatchInfo::face() const {
+  const ::Image* p = face_;
+  // @@protoc_insertion_point(field_get:MatchInfo.face)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
 }
-inline void Attribute::set_json(const std::string& value) {
+inline ::Image* MatchInfo::release_face() {
+  // @@protoc_insertion_point(field_release:MatchInfo.face)
   
-  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.json)
+  ::Image* temp = face_;
+  face_ = nullptr;
+  return temp;
 }
-inline void Attribute::set_json(std::string&& value) {
+inline ::Image* MatchInfo::mutable_face() {
   
-  json_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.json)
+  if (face_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    face_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:MatchInfo.face)
+  return face_;
 }
-inline void Attribute::set_json(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.json)
+inline void MatchInfo::set_allocated_face(::Image* face) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(face_);
+  }
+  if (face) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      face = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, face, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  face_ = face;
+  // @@protoc_insertion_point(field_set_allocated:MatchInfo.face)
 }
-inline void Attribute::set_json(const void* value, size_t size) {
-  
-  json_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.json)
+
+// -------------------------------------------------------------------
+
+// TemplateInput
+
+// .Image im = 1;
+inline bool TemplateInput::has_im() const {
+  return this != internal_default_instance() && im_ != nullptr;
 }
-inline std::string* Attribute::mutable_json() {
+inline const ::Image& TemplateInput::im() const {
+  const ::Image* p = im_;
+  // @@protoc_insertion_point(field_get:TemplateInput.im)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
+}
+inline ::Image* TemplateInput::release_im() {
+  // @@protoc_insertion_point(field_release:TemplateInput.im)
   
-  // @@protoc_insertion_point(field_mutable:Attribute.json)
-  return json_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::Image* temp = im_;
+  im_ = nullptr;
+  return temp;
 }
-inline std::string* Attribute::release_json() {
-  // @@protoc_insertion_point(field_release:Attribute.json)
+inline ::Image* TemplateInput::mutable_im() {
   
-  return json_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (im_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    im_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:TemplateInput.im)
+  return im_;
 }
-inline void Attribute::set_allocated_json(std::string* json) {
-  if (json != nullptr) {
+inline void TemplateInput::set_allocated_im(::Image* im) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(im_);
+  }
+  if (im) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      im = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, im, submessage_arena);
+    }
     
   } else {
     
   }
-  json_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), json);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.json)
+  im_ = im;
+  // @@protoc_insertion_point(field_set_allocated:TemplateInput.im)
 }
 
-// .Matrix matrix = 9;
-inline bool Attribute::has_matrix() const {
-  return this != internal_default_instance() && matrix_ != nullptr;
+// repeated .Rect detections = 2;
+inline int TemplateInput::detections_size() const {
+  return detections_.size();
 }
-inline const ::Matrix& Attribute::matrix() const {
-  const ::Matrix* p = matrix_;
-  // @@protoc_insertion_point(field_get:Attribute.matrix)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Matrix*>(
-      &::_Matrix_default_instance_);
+inline ::Rect* TemplateInput::mutable_detections(int index) {
+  // @@protoc_insertion_point(field_mutable:TemplateInput.detections)
+  return detections_.Mutable(index);
 }
-inline ::Matrix* Attribute::release_matrix() {
-  // @@protoc_insertion_point(field_release:Attribute.matrix)
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Rect >*
+TemplateInput::mutable_detections() {
+  // @@protoc_insertion_point(field_mutable_list:TemplateInput.detections)
+  return &detections_;
+}
+inline const ::Rect& TemplateInput::detections(int index) const {
+  // @@protoc_insertion_point(field_get:TemplateInput.detections)
+  return detections_.Get(index);
+}
+inline ::Rect* TemplateInput::add_detections() {
+  // @@protoc_insertion_point(field_add:TemplateInput.detections)
+  return detections_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Rect >&
+TemplateInput::detections() const {
+  // @@protoc_insertion_point(field_list:TemplateInput.detections)
+  return detections_;
+}
+
+// -------------------------------------------------------------------
+
+// FaceTemplate
+
+// .Vector data = 1;
+inline bool FaceTemplate::has_data() const {
+  return this != internal_default_instance() && data_ != nullptr;
+}
+inline const ::Vector& FaceTemplate::data() const {
+  const ::Vector* p = data_;
+  // @@protoc_insertion_point(field_get:FaceTemplate.data)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Vector*>(
+      &::_Vector_default_instance_);
+}
+inline ::Vector* FaceTemplate::release_data() {
+  // @@protoc_insertion_point(field_release:FaceTemplate.data)
   
-  ::Matrix* temp = matrix_;
-  matrix_ = nullptr;
+  ::Vector* temp = data_;
+  data_ = nullptr;
   return temp;
 }
-inline ::Matrix* Attribute::mutable_matrix() {
+inline ::Vector* FaceTemplate::mutable_data() {
   
-  if (matrix_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Matrix>(GetArenaNoVirtual());
-    matrix_ = p;
+  if (data_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Vector>(GetArenaNoVirtual());
+    data_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:Attribute.matrix)
-  return matrix_;
+  // @@protoc_insertion_point(field_mutable:FaceTemplate.data)
+  return data_;
 }
-inline void Attribute::set_allocated_matrix(::Matrix* matrix) {
+inline void FaceTemplate::set_allocated_data(::Vector* data) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(matrix_);
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(data_);
   }
-  if (matrix) {
+  if (data) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      matrix = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, matrix, submessage_arena);
+      data = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, data, submessage_arena);
     }
     
   } else {
     
   }
-  matrix_ = matrix;
-  // @@protoc_insertion_point(field_set_allocated:Attribute.matrix)
+  data_ = data;
+  // @@protoc_insertion_point(field_set_allocated:FaceTemplate.data)
 }
 
-// .Vector vector = 10;
-inline bool Attribute::has_vector() const {
-  return this != internal_default_instance() && vector_ != nullptr;
+// bytes buffer = 2;
+inline void FaceTemplate::clear_buffer() {
+  buffer_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::Vector& Attribute::vector() const {
-  const ::Vector* p = vector_;
-  // @@protoc_insertion_point(field_get:Attribute.vector)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Vector*>(
-      &::_Vector_default_instance_);
+inline const std::string& FaceTemplate::buffer() const {
+  // @@protoc_insertion_point(field_get:FaceTemplate.buffer)
+  return buffer_.GetNoArena();
 }
-inline ::Vector* Attribute::release_vector() {
-  // @@protoc_insertion_point(field_release:Attribute.vector)
+inline void FaceTemplate::set_buffer(const std::string& value) {
   
-  ::Vector* temp = vector_;
-  vector_ = nullptr;
-  return temp;
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceTemplate.buffer)
+}
+inline void FaceTemplate::set_buffer(std::string&& value) {
+  
+  buffer_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceTemplate.buffer)
+}
+inline void FaceTemplate::set_buffer(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceTemplate.buffer)
+}
+inline void FaceTemplate::set_buffer(const void* value, size_t size) {
+  
+  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceTemplate.buffer)
+}
+inline std::string* FaceTemplate::mutable_buffer() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceTemplate.buffer)
+  return buffer_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::Vector* Attribute::mutable_vector() {
+inline std::string* FaceTemplate::release_buffer() {
+  // @@protoc_insertion_point(field_release:FaceTemplate.buffer)
   
-  if (vector_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Vector>(GetArenaNoVirtual());
-    vector_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Attribute.vector)
-  return vector_;
+  return buffer_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Attribute::set_allocated_vector(::Vector* vector) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(vector_);
-  }
-  if (vector) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      vector = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, vector, submessage_arena);
-    }
+inline void FaceTemplate::set_allocated_buffer(std::string* buffer) {
+  if (buffer != nullptr) {
     
   } else {
     
   }
-  vector_ = vector;
-  // @@protoc_insertion_point(field_set_allocated:Attribute.vector)
+  buffer_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), buffer);
+  // @@protoc_insertion_point(field_set_allocated:FaceTemplate.buffer)
 }
 
-// .Image image = 11;
-inline bool Attribute::has_image() const {
-  return this != internal_default_instance() && image_ != nullptr;
+// string algorithm = 3;
+inline void FaceTemplate::clear_algorithm() {
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::Image& Attribute::image() const {
-  const ::Image* p = image_;
-  // @@protoc_insertion_point(field_get:Attribute.image)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline const std::string& FaceTemplate::algorithm() const {
+  // @@protoc_insertion_point(field_get:FaceTemplate.algorithm)
+  return algorithm_.GetNoArena();
 }
-inline ::Image* Attribute::release_image() {
-  // @@protoc_insertion_point(field_release:Attribute.image)
+inline void FaceTemplate::set_algorithm(const std::string& value) {
   
-  ::Image* temp = image_;
-  image_ = nullptr;
-  return temp;
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceTemplate.algorithm)
 }
-inline ::Image* Attribute::mutable_image() {
+inline void FaceTemplate::set_algorithm(std::string&& value) {
   
-  if (image_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    image_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Attribute.image)
-  return image_;
+  algorithm_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceTemplate.algorithm)
 }
-inline void Attribute::set_allocated_image(::Image* image) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
-  }
-  if (image) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, image, submessage_arena);
-    }
+inline void FaceTemplate::set_algorithm(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceTemplate.algorithm)
+}
+inline void FaceTemplate::set_algorithm(const char* value, size_t size) {
+  
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceTemplate.algorithm)
+}
+inline std::string* FaceTemplate::mutable_algorithm() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceTemplate.algorithm)
+  return algorithm_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* FaceTemplate::release_algorithm() {
+  // @@protoc_insertion_point(field_release:FaceTemplate.algorithm)
+  
+  return algorithm_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceTemplate::set_allocated_algorithm(std::string* algorithm) {
+  if (algorithm != nullptr) {
     
   } else {
     
   }
-  image_ = image;
-  // @@protoc_insertion_point(field_set_allocated:Attribute.image)
+  algorithm_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm);
+  // @@protoc_insertion_point(field_set_allocated:FaceTemplate.algorithm)
 }
 
-// .Point2D point = 12;
-inline bool Attribute::has_point() const {
-  return this != internal_default_instance() && point_ != nullptr;
+// -------------------------------------------------------------------
+
+// TemplateList
+
+// repeated .FaceTemplate templates = 1;
+inline int TemplateList::templates_size() const {
+  return templates_.size();
 }
-inline const ::Point2D& Attribute::point() const {
-  const ::Point2D* p = point_;
-  // @@protoc_insertion_point(field_get:Attribute.point)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Point2D*>(
-      &::_Point2D_default_instance_);
+inline void TemplateList::clear_templates() {
+  templates_.Clear();
 }
-inline ::Point2D* Attribute::release_point() {
-  // @@protoc_insertion_point(field_release:Attribute.point)
+inline ::FaceTemplate* TemplateList::mutable_templates(int index) {
+  // @@protoc_insertion_point(field_mutable:TemplateList.templates)
+  return templates_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceTemplate >*
+TemplateList::mutable_templates() {
+  // @@protoc_insertion_point(field_mutable_list:TemplateList.templates)
+  return &templates_;
+}
+inline const ::FaceTemplate& TemplateList::templates(int index) const {
+  // @@protoc_insertion_point(field_get:TemplateList.templates)
+  return templates_.Get(index);
+}
+inline ::FaceTemplate* TemplateList::add_templates() {
+  // @@protoc_insertion_point(field_add:TemplateList.templates)
+  return templates_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceTemplate >&
+TemplateList::templates() const {
+  // @@protoc_insertion_point(field_list:TemplateList.templates)
+  return templates_;
+}
+
+// -------------------------------------------------------------------
+
+// AccessRecord
+
+// float datetime = 1;
+inline void AccessRecord::clear_datetime() {
+  datetime_ = 0;
+}
+inline float AccessRecord::datetime() const {
+  // @@protoc_insertion_point(field_get:AccessRecord.datetime)
+  return datetime_;
+}
+inline void AccessRecord::set_datetime(float value) {
   
-  ::Point2D* temp = point_;
-  point_ = nullptr;
-  return temp;
+  datetime_ = value;
+  // @@protoc_insertion_point(field_set:AccessRecord.datetime)
 }
-inline ::Point2D* Attribute::mutable_point() {
+
+// string notes = 2;
+inline void AccessRecord::clear_notes() {
+  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& AccessRecord::notes() const {
+  // @@protoc_insertion_point(field_get:AccessRecord.notes)
+  return notes_.GetNoArena();
+}
+inline void AccessRecord::set_notes(const std::string& value) {
   
-  if (point_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Point2D>(GetArenaNoVirtual());
-    point_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Attribute.point)
-  return point_;
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:AccessRecord.notes)
 }
-inline void Attribute::set_allocated_point(::Point2D* point) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(point_);
-  }
-  if (point) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      point = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, point, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  point_ = point;
-  // @@protoc_insertion_point(field_set_allocated:Attribute.point)
+inline void AccessRecord::set_notes(std::string&& value) {
+  
+  notes_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:AccessRecord.notes)
 }
-
-// .Rect rect = 13;
-inline bool Attribute::has_rect() const {
-  return this != internal_default_instance() && rect_ != nullptr;
+inline void AccessRecord::set_notes(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:AccessRecord.notes)
 }
-inline const ::Rect& Attribute::rect() const {
-  const ::Rect* p = rect_;
-  // @@protoc_insertion_point(field_get:Attribute.rect)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Rect*>(
-      &::_Rect_default_instance_);
+inline void AccessRecord::set_notes(const char* value, size_t size) {
+  
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:AccessRecord.notes)
 }
-inline ::Rect* Attribute::release_rect() {
-  // @@protoc_insertion_point(field_release:Attribute.rect)
+inline std::string* AccessRecord::mutable_notes() {
   
-  ::Rect* temp = rect_;
-  rect_ = nullptr;
-  return temp;
+  // @@protoc_insertion_point(field_mutable:AccessRecord.notes)
+  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::Rect* Attribute::mutable_rect() {
+inline std::string* AccessRecord::release_notes() {
+  // @@protoc_insertion_point(field_release:AccessRecord.notes)
   
-  if (rect_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Rect>(GetArenaNoVirtual());
-    rect_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Attribute.rect)
-  return rect_;
+  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Attribute::set_allocated_rect(::Rect* rect) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(rect_);
-  }
-  if (rect) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      rect = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, rect, submessage_arena);
-    }
+inline void AccessRecord::set_allocated_notes(std::string* notes) {
+  if (notes != nullptr) {
     
   } else {
     
   }
-  rect_ = rect;
-  // @@protoc_insertion_point(field_set_allocated:Attribute.rect)
+  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
+  // @@protoc_insertion_point(field_set_allocated:AccessRecord.notes)
 }
 
-// bytes xml = 14;
-inline void Attribute::clear_xml() {
-  xml_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// string credential = 3;
+inline void AccessRecord::clear_credential() {
+  credential_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& Attribute::xml() const {
-  // @@protoc_insertion_point(field_get:Attribute.xml)
-  return xml_.GetNoArena();
+inline const std::string& AccessRecord::credential() const {
+  // @@protoc_insertion_point(field_get:AccessRecord.credential)
+  return credential_.GetNoArena();
 }
-inline void Attribute::set_xml(const std::string& value) {
+inline void AccessRecord::set_credential(const std::string& value) {
   
-  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Attribute.xml)
+  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:AccessRecord.credential)
 }
-inline void Attribute::set_xml(std::string&& value) {
+inline void AccessRecord::set_credential(std::string&& value) {
   
-  xml_.SetNoArena(
+  credential_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Attribute.xml)
+  // @@protoc_insertion_point(field_set_rvalue:AccessRecord.credential)
 }
-inline void Attribute::set_xml(const char* value) {
+inline void AccessRecord::set_credential(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Attribute.xml)
+  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:AccessRecord.credential)
 }
-inline void Attribute::set_xml(const void* value, size_t size) {
+inline void AccessRecord::set_credential(const char* value, size_t size) {
   
-  xml_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Attribute.xml)
+  // @@protoc_insertion_point(field_set_pointer:AccessRecord.credential)
 }
-inline std::string* Attribute::mutable_xml() {
+inline std::string* AccessRecord::mutable_credential() {
   
-  // @@protoc_insertion_point(field_mutable:Attribute.xml)
-  return xml_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:AccessRecord.credential)
+  return credential_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* Attribute::release_xml() {
-  // @@protoc_insertion_point(field_release:Attribute.xml)
+inline std::string* AccessRecord::release_credential() {
+  // @@protoc_insertion_point(field_release:AccessRecord.credential)
   
-  return xml_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return credential_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Attribute::set_allocated_xml(std::string* xml) {
-  if (xml != nullptr) {
+inline void AccessRecord::set_allocated_credential(std::string* credential) {
+  if (credential != nullptr) {
     
   } else {
     
   }
-  xml_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), xml);
-  // @@protoc_insertion_point(field_set_allocated:Attribute.xml)
+  credential_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), credential);
+  // @@protoc_insertion_point(field_set_allocated:AccessRecord.credential)
 }
 
-// -------------------------------------------------------------------
-
-// ErrorMessage
-
-// int32 error_code = 3;
-inline void ErrorMessage::clear_error_code() {
-  error_code_ = 0;
+// repeated .Attribute metadata = 4;
+inline int AccessRecord::metadata_size() const {
+  return metadata_.size();
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 ErrorMessage::error_code() const {
-  // @@protoc_insertion_point(field_get:ErrorMessage.error_code)
-  return error_code_;
+inline void AccessRecord::clear_metadata() {
+  metadata_.Clear();
 }
-inline void ErrorMessage::set_error_code(::PROTOBUF_NAMESPACE_ID::int32 value) {
-  
-  error_code_ = value;
-  // @@protoc_insertion_point(field_set:ErrorMessage.error_code)
+inline ::Attribute* AccessRecord::mutable_metadata(int index) {
+  // @@protoc_insertion_point(field_mutable:AccessRecord.metadata)
+  return metadata_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+AccessRecord::mutable_metadata() {
+  // @@protoc_insertion_point(field_mutable_list:AccessRecord.metadata)
+  return &metadata_;
+}
+inline const ::Attribute& AccessRecord::metadata(int index) const {
+  // @@protoc_insertion_point(field_get:AccessRecord.metadata)
+  return metadata_.Get(index);
+}
+inline ::Attribute* AccessRecord::add_metadata() {
+  // @@protoc_insertion_point(field_add:AccessRecord.metadata)
+  return metadata_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+AccessRecord::metadata() const {
+  // @@protoc_insertion_point(field_list:AccessRecord.metadata)
+  return metadata_;
 }
 
-// string error_message = 4;
-inline void ErrorMessage::clear_error_message() {
-  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// -------------------------------------------------------------------
+
+// FaceRecord
+
+// string subject_id = 1;
+inline void FaceRecord::clear_subject_id() {
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& ErrorMessage::error_message() const {
-  // @@protoc_insertion_point(field_get:ErrorMessage.error_message)
-  return error_message_.GetNoArena();
+inline const std::string& FaceRecord::subject_id() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.subject_id)
+  return subject_id_.GetNoArena();
 }
-inline void ErrorMessage::set_error_message(const std::string& value) {
+inline void FaceRecord::set_subject_id(const std::string& value) {
   
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:ErrorMessage.error_message)
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.subject_id)
 }
-inline void ErrorMessage::set_error_message(std::string&& value) {
+inline void FaceRecord::set_subject_id(std::string&& value) {
   
-  error_message_.SetNoArena(
+  subject_id_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:ErrorMessage.error_message)
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.subject_id)
 }
-inline void ErrorMessage::set_error_message(const char* value) {
+inline void FaceRecord::set_subject_id(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:ErrorMessage.error_message)
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.subject_id)
 }
-inline void ErrorMessage::set_error_message(const char* value, size_t size) {
+inline void FaceRecord::set_subject_id(const char* value, size_t size) {
   
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:ErrorMessage.error_message)
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.subject_id)
 }
-inline std::string* ErrorMessage::mutable_error_message() {
+inline std::string* FaceRecord::mutable_subject_id() {
   
-  // @@protoc_insertion_point(field_mutable:ErrorMessage.error_message)
-  return error_message_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:FaceRecord.subject_id)
+  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* ErrorMessage::release_error_message() {
-  // @@protoc_insertion_point(field_release:ErrorMessage.error_message)
+inline std::string* FaceRecord::release_subject_id() {
+  // @@protoc_insertion_point(field_release:FaceRecord.subject_id)
   
-  return error_message_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ErrorMessage::set_allocated_error_message(std::string* error_message) {
-  if (error_message != nullptr) {
+inline void FaceRecord::set_allocated_subject_id(std::string* subject_id) {
+  if (subject_id != nullptr) {
     
   } else {
     
   }
-  error_message_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), error_message);
-  // @@protoc_insertion_point(field_set_allocated:ErrorMessage.error_message)
+  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.subject_id)
 }
 
-// -------------------------------------------------------------------
-
-// Detection
-
-// float score = 1;
-inline void Detection::clear_score() {
-  score_ = 0;
+// string name = 5;
+inline void FaceRecord::clear_name() {
+  name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline float Detection::score() const {
-  // @@protoc_insertion_point(field_get:Detection.score)
-  return score_;
+inline const std::string& FaceRecord::name() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.name)
+  return name_.GetNoArena();
 }
-inline void Detection::set_score(float value) {
+inline void FaceRecord::set_name(const std::string& value) {
   
-  score_ = value;
-  // @@protoc_insertion_point(field_set:Detection.score)
+  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.name)
 }
-
-// .Rect location = 2;
-inline bool Detection::has_location() const {
-  return this != internal_default_instance() && location_ != nullptr;
+inline void FaceRecord::set_name(std::string&& value) {
+  
+  name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.name)
 }
-inline const ::Rect& Detection::location() const {
-  const ::Rect* p = location_;
-  // @@protoc_insertion_point(field_get:Detection.location)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Rect*>(
-      &::_Rect_default_instance_);
+inline void FaceRecord::set_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.name)
 }
-inline ::Rect* Detection::release_location() {
-  // @@protoc_insertion_point(field_release:Detection.location)
+inline void FaceRecord::set_name(const char* value, size_t size) {
   
-  ::Rect* temp = location_;
-  location_ = nullptr;
-  return temp;
+  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.name)
 }
-inline ::Rect* Detection::mutable_location() {
+inline std::string* FaceRecord::mutable_name() {
   
-  if (location_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Rect>(GetArenaNoVirtual());
-    location_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Detection.location)
-  return location_;
+  // @@protoc_insertion_point(field_mutable:FaceRecord.name)
+  return name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Detection::set_allocated_location(::Rect* location) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(location_);
-  }
-  if (location) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      location = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, location, submessage_arena);
-    }
+inline std::string* FaceRecord::release_name() {
+  // @@protoc_insertion_point(field_release:FaceRecord.name)
+  
+  return name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceRecord::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
     
   } else {
     
   }
-  location_ = location;
-  // @@protoc_insertion_point(field_set_allocated:Detection.location)
-}
-
-// int32 detection_id = 3;
-inline void Detection::clear_detection_id() {
-  detection_id_ = 0;
-}
-inline ::PROTOBUF_NAMESPACE_ID::int32 Detection::detection_id() const {
-  // @@protoc_insertion_point(field_get:Detection.detection_id)
-  return detection_id_;
-}
-inline void Detection::set_detection_id(::PROTOBUF_NAMESPACE_ID::int32 value) {
-  
-  detection_id_ = value;
-  // @@protoc_insertion_point(field_set:Detection.detection_id)
+  name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), name);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.name)
 }
 
-// string detection_class = 4;
-inline void Detection::clear_detection_class() {
-  detection_class_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// string source = 4;
+inline void FaceRecord::clear_source() {
+  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& Detection::detection_class() const {
-  // @@protoc_insertion_point(field_get:Detection.detection_class)
-  return detection_class_.GetNoArena();
+inline const std::string& FaceRecord::source() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.source)
+  return source_.GetNoArena();
 }
-inline void Detection::set_detection_class(const std::string& value) {
+inline void FaceRecord::set_source(const std::string& value) {
   
-  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Detection.detection_class)
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.source)
 }
-inline void Detection::set_detection_class(std::string&& value) {
+inline void FaceRecord::set_source(std::string&& value) {
   
-  detection_class_.SetNoArena(
+  source_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Detection.detection_class)
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.source)
 }
-inline void Detection::set_detection_class(const char* value) {
+inline void FaceRecord::set_source(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Detection.detection_class)
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.source)
 }
-inline void Detection::set_detection_class(const char* value, size_t size) {
+inline void FaceRecord::set_source(const char* value, size_t size) {
   
-  detection_class_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Detection.detection_class)
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.source)
 }
-inline std::string* Detection::mutable_detection_class() {
+inline std::string* FaceRecord::mutable_source() {
   
-  // @@protoc_insertion_point(field_mutable:Detection.detection_class)
-  return detection_class_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:FaceRecord.source)
+  return source_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* Detection::release_detection_class() {
-  // @@protoc_insertion_point(field_release:Detection.detection_class)
+inline std::string* FaceRecord::release_source() {
+  // @@protoc_insertion_point(field_release:FaceRecord.source)
   
-  return detection_class_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return source_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Detection::set_allocated_detection_class(std::string* detection_class) {
-  if (detection_class != nullptr) {
+inline void FaceRecord::set_allocated_source(std::string* source) {
+  if (source != nullptr) {
     
   } else {
     
   }
-  detection_class_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), detection_class);
-  // @@protoc_insertion_point(field_set_allocated:Detection.detection_class)
+  source_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), source);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.source)
 }
 
-// repeated .Attribute attributes = 5;
-inline int Detection::attributes_size() const {
-  return attributes_.size();
-}
-inline void Detection::clear_attributes() {
-  attributes_.Clear();
-}
-inline ::Attribute* Detection::mutable_attributes(int index) {
-  // @@protoc_insertion_point(field_mutable:Detection.attributes)
-  return attributes_.Mutable(index);
-}
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-Detection::mutable_attributes() {
-  // @@protoc_insertion_point(field_mutable_list:Detection.attributes)
-  return &attributes_;
-}
-inline const ::Attribute& Detection::attributes(int index) const {
-  // @@protoc_insertion_point(field_get:Detection.attributes)
-  return attributes_.Get(index);
+// int64 frame = 14;
+inline void FaceRecord::clear_frame() {
+  frame_ = PROTOBUF_LONGLONG(0);
 }
-inline ::Attribute* Detection::add_attributes() {
-  // @@protoc_insertion_point(field_add:Detection.attributes)
-  return attributes_.Add();
+inline ::PROTOBUF_NAMESPACE_ID::int64 FaceRecord::frame() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.frame)
+  return frame_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-Detection::attributes() const {
-  // @@protoc_insertion_point(field_list:Detection.attributes)
-  return attributes_;
+inline void FaceRecord::set_frame(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  frame_ = value;
+  // @@protoc_insertion_point(field_set:FaceRecord.frame)
 }
 
-// -------------------------------------------------------------------
-
-// Landmark
-
-// string landmark_id = 1;
-inline void Landmark::clear_landmark_id() {
-  landmark_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// string algorithm = 20;
+inline void FaceRecord::clear_algorithm() {
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& Landmark::landmark_id() const {
-  // @@protoc_insertion_point(field_get:Landmark.landmark_id)
-  return landmark_id_.GetNoArena();
+inline const std::string& FaceRecord::algorithm() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.algorithm)
+  return algorithm_.GetNoArena();
 }
-inline void Landmark::set_landmark_id(const std::string& value) {
+inline void FaceRecord::set_algorithm(const std::string& value) {
   
-  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:Landmark.landmark_id)
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.algorithm)
 }
-inline void Landmark::set_landmark_id(std::string&& value) {
+inline void FaceRecord::set_algorithm(std::string&& value) {
   
-  landmark_id_.SetNoArena(
+  algorithm_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:Landmark.landmark_id)
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.algorithm)
 }
-inline void Landmark::set_landmark_id(const char* value) {
+inline void FaceRecord::set_algorithm(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:Landmark.landmark_id)
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.algorithm)
 }
-inline void Landmark::set_landmark_id(const char* value, size_t size) {
+inline void FaceRecord::set_algorithm(const char* value, size_t size) {
   
-  landmark_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:Landmark.landmark_id)
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.algorithm)
 }
-inline std::string* Landmark::mutable_landmark_id() {
-  
-  // @@protoc_insertion_point(field_mutable:Landmark.landmark_id)
-  return landmark_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline std::string* Landmark::release_landmark_id() {
-  // @@protoc_insertion_point(field_release:Landmark.landmark_id)
-  
-  return landmark_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline void Landmark::set_allocated_landmark_id(std::string* landmark_id) {
-  if (landmark_id != nullptr) {
-    
-  } else {
-    
-  }
-  landmark_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), landmark_id);
-  // @@protoc_insertion_point(field_set_allocated:Landmark.landmark_id)
-}
-
-// .Point2D location = 2;
-inline bool Landmark::has_location() const {
-  return this != internal_default_instance() && location_ != nullptr;
-}
-inline const ::Point2D& Landmark::location() const {
-  const ::Point2D* p = location_;
-  // @@protoc_insertion_point(field_get:Landmark.location)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Point2D*>(
-      &::_Point2D_default_instance_);
-}
-inline ::Point2D* Landmark::release_location() {
-  // @@protoc_insertion_point(field_release:Landmark.location)
+inline std::string* FaceRecord::mutable_algorithm() {
   
-  ::Point2D* temp = location_;
-  location_ = nullptr;
-  return temp;
+  // @@protoc_insertion_point(field_mutable:FaceRecord.algorithm)
+  return algorithm_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::Point2D* Landmark::mutable_location() {
+inline std::string* FaceRecord::release_algorithm() {
+  // @@protoc_insertion_point(field_release:FaceRecord.algorithm)
   
-  if (location_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Point2D>(GetArenaNoVirtual());
-    location_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:Landmark.location)
-  return location_;
+  return algorithm_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void Landmark::set_allocated_location(::Point2D* location) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(location_);
-  }
-  if (location) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      location = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, location, submessage_arena);
-    }
+inline void FaceRecord::set_allocated_algorithm(std::string* algorithm) {
+  if (algorithm != nullptr) {
     
   } else {
     
   }
-  location_ = location;
-  // @@protoc_insertion_point(field_set_allocated:Landmark.location)
+  algorithm_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.algorithm)
 }
 
-// -------------------------------------------------------------------
-
-// DetectionOptions
-
-// string algorithm_id = 1;
-inline void DetectionOptions::clear_algorithm_id() {
-  algorithm_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// string notes = 6;
+inline void FaceRecord::clear_notes() {
+  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& DetectionOptions::algorithm_id() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.algorithm_id)
-  return algorithm_id_.GetNoArena();
+inline const std::string& FaceRecord::notes() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.notes)
+  return notes_.GetNoArena();
 }
-inline void DetectionOptions::set_algorithm_id(const std::string& value) {
+inline void FaceRecord::set_notes(const std::string& value) {
   
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:DetectionOptions.algorithm_id)
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.notes)
 }
-inline void DetectionOptions::set_algorithm_id(std::string&& value) {
+inline void FaceRecord::set_notes(std::string&& value) {
   
-  algorithm_id_.SetNoArena(
+  notes_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:DetectionOptions.algorithm_id)
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.notes)
 }
-inline void DetectionOptions::set_algorithm_id(const char* value) {
+inline void FaceRecord::set_notes(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:DetectionOptions.algorithm_id)
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.notes)
 }
-inline void DetectionOptions::set_algorithm_id(const char* value, size_t size) {
+inline void FaceRecord::set_notes(const char* value, size_t size) {
   
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:DetectionOptions.algorithm_id)
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.notes)
 }
-inline std::string* DetectionOptions::mutable_algorithm_id() {
+inline std::string* FaceRecord::mutable_notes() {
   
-  // @@protoc_insertion_point(field_mutable:DetectionOptions.algorithm_id)
-  return algorithm_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:FaceRecord.notes)
+  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* DetectionOptions::release_algorithm_id() {
-  // @@protoc_insertion_point(field_release:DetectionOptions.algorithm_id)
+inline std::string* FaceRecord::release_notes() {
+  // @@protoc_insertion_point(field_release:FaceRecord.notes)
   
-  return algorithm_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectionOptions::set_allocated_algorithm_id(std::string* algorithm_id) {
-  if (algorithm_id != nullptr) {
+inline void FaceRecord::set_allocated_notes(std::string* notes) {
+  if (notes != nullptr) {
     
   } else {
     
   }
-  algorithm_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm_id);
-  // @@protoc_insertion_point(field_set_allocated:DetectionOptions.algorithm_id)
+  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.notes)
 }
 
-// bool best = 2;
-inline void DetectionOptions::clear_best() {
-  best_ = false;
+// string gallery_key = 15;
+inline void FaceRecord::clear_gallery_key() {
+  gallery_key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline bool DetectionOptions::best() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.best)
-  return best_;
+inline const std::string& FaceRecord::gallery_key() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.gallery_key)
+  return gallery_key_.GetNoArena();
 }
-inline void DetectionOptions::set_best(bool value) {
+inline void FaceRecord::set_gallery_key(const std::string& value) {
   
-  best_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.best)
-}
-
-// float threshold = 3;
-inline void DetectionOptions::clear_threshold() {
-  threshold_ = 0;
-}
-inline float DetectionOptions::threshold() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.threshold)
-  return threshold_;
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceRecord.gallery_key)
 }
-inline void DetectionOptions::set_threshold(float value) {
+inline void FaceRecord::set_gallery_key(std::string&& value) {
   
-  threshold_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.threshold)
-}
-
-// int32 scale_levels = 4;
-inline void DetectionOptions::clear_scale_levels() {
-  scale_levels_ = 0;
-}
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::scale_levels() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.scale_levels)
-  return scale_levels_;
+  gallery_key_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.gallery_key)
 }
-inline void DetectionOptions::set_scale_levels(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline void FaceRecord::set_gallery_key(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  scale_levels_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.scale_levels)
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceRecord.gallery_key)
 }
-
-// int32 scan_levels = 5;
-inline void DetectionOptions::clear_scan_levels() {
-  scan_levels_ = 0;
+inline void FaceRecord::set_gallery_key(const char* value, size_t size) {
+  
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceRecord.gallery_key)
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::scan_levels() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.scan_levels)
-  return scan_levels_;
+inline std::string* FaceRecord::mutable_gallery_key() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceRecord.gallery_key)
+  return gallery_key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectionOptions::set_scan_levels(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline std::string* FaceRecord::release_gallery_key() {
+  // @@protoc_insertion_point(field_release:FaceRecord.gallery_key)
   
-  scan_levels_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.scan_levels)
+  return gallery_key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceRecord::set_allocated_gallery_key(std::string* gallery_key) {
+  if (gallery_key != nullptr) {
+    
+  } else {
+    
+  }
+  gallery_key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_key);
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.gallery_key)
 }
 
-// float scan_overlap = 6;
-inline void DetectionOptions::clear_scan_overlap() {
-  scan_overlap_ = 0;
+// float collection_date = 16;
+inline void FaceRecord::clear_collection_date() {
+  collection_date_ = 0;
 }
-inline float DetectionOptions::scan_overlap() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.scan_overlap)
-  return scan_overlap_;
+inline float FaceRecord::collection_date() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.collection_date)
+  return collection_date_;
 }
-inline void DetectionOptions::set_scan_overlap(float value) {
+inline void FaceRecord::set_collection_date(float value) {
   
-  scan_overlap_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.scan_overlap)
+  collection_date_ = value;
+  // @@protoc_insertion_point(field_set:FaceRecord.collection_date)
 }
 
-// int32 min_size = 7;
-inline void DetectionOptions::clear_min_size() {
-  min_size_ = 0;
+// float enrollment_date = 17;
+inline void FaceRecord::clear_enrollment_date() {
+  enrollment_date_ = 0;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionOptions::min_size() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.min_size)
-  return min_size_;
+inline float FaceRecord::enrollment_date() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.enrollment_date)
+  return enrollment_date_;
 }
-inline void DetectionOptions::set_min_size(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline void FaceRecord::set_enrollment_date(float value) {
   
-  min_size_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.min_size)
+  enrollment_date_ = value;
+  // @@protoc_insertion_point(field_set:FaceRecord.enrollment_date)
 }
 
-// bool save_request = 9;
-inline void DetectionOptions::clear_save_request() {
-  save_request_ = false;
+// repeated .Attribute metadata = 18;
+inline int FaceRecord::metadata_size() const {
+  return metadata_.size();
 }
-inline bool DetectionOptions::save_request() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.save_request)
-  return save_request_;
+inline void FaceRecord::clear_metadata() {
+  metadata_.Clear();
 }
-inline void DetectionOptions::set_save_request(bool value) {
-  
-  save_request_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.save_request)
+inline ::Attribute* FaceRecord::mutable_metadata(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecord.metadata)
+  return metadata_.Mutable(index);
 }
-
-// bool debug = 10;
-inline void DetectionOptions::clear_debug() {
-  debug_ = false;
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+FaceRecord::mutable_metadata() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecord.metadata)
+  return &metadata_;
 }
-inline bool DetectionOptions::debug() const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.debug)
-  return debug_;
+inline const ::Attribute& FaceRecord::metadata(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecord.metadata)
+  return metadata_.Get(index);
 }
-inline void DetectionOptions::set_debug(bool value) {
-  
-  debug_ = value;
-  // @@protoc_insertion_point(field_set:DetectionOptions.debug)
+inline ::Attribute* FaceRecord::add_metadata() {
+  // @@protoc_insertion_point(field_add:FaceRecord.metadata)
+  return metadata_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+FaceRecord::metadata() const {
+  // @@protoc_insertion_point(field_list:FaceRecord.metadata)
+  return metadata_;
 }
 
-// repeated .Attribute attributes = 8;
-inline int DetectionOptions::attributes_size() const {
-  return attributes_.size();
+// repeated .AccessRecord access_records = 19;
+inline int FaceRecord::access_records_size() const {
+  return access_records_.size();
 }
-inline void DetectionOptions::clear_attributes() {
-  attributes_.Clear();
+inline void FaceRecord::clear_access_records() {
+  access_records_.Clear();
 }
-inline ::Attribute* DetectionOptions::mutable_attributes(int index) {
-  // @@protoc_insertion_point(field_mutable:DetectionOptions.attributes)
-  return attributes_.Mutable(index);
+inline ::AccessRecord* FaceRecord::mutable_access_records(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecord.access_records)
+  return access_records_.Mutable(index);
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-DetectionOptions::mutable_attributes() {
-  // @@protoc_insertion_point(field_mutable_list:DetectionOptions.attributes)
-  return &attributes_;
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AccessRecord >*
+FaceRecord::mutable_access_records() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecord.access_records)
+  return &access_records_;
 }
-inline const ::Attribute& DetectionOptions::attributes(int index) const {
-  // @@protoc_insertion_point(field_get:DetectionOptions.attributes)
-  return attributes_.Get(index);
+inline const ::AccessRecord& FaceRecord::access_records(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecord.access_records)
+  return access_records_.Get(index);
 }
-inline ::Attribute* DetectionOptions::add_attributes() {
-  // @@protoc_insertion_point(field_add:DetectionOptions.attributes)
-  return attributes_.Add();
+inline ::AccessRecord* FaceRecord::add_access_records() {
+  // @@protoc_insertion_point(field_add:FaceRecord.access_records)
+  return access_records_.Add();
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-DetectionOptions::attributes() const {
-  // @@protoc_insertion_point(field_list:DetectionOptions.attributes)
-  return attributes_;
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AccessRecord >&
+FaceRecord::access_records() const {
+  // @@protoc_insertion_point(field_list:FaceRecord.access_records)
+  return access_records_;
 }
 
-// -------------------------------------------------------------------
-
-// ExtractOptions
-
-// string algorithm_id = 1;
-inline void ExtractOptions::clear_algorithm_id() {
-  algorithm_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// .Image view = 7;
+inline bool FaceRecord::has_view() const {
+  return this != internal_default_instance() && view_ != nullptr;
 }
-inline const std::string& ExtractOptions::algorithm_id() const {
-  // @@protoc_insertion_point(field_get:ExtractOptions.algorithm_id)
-  return algorithm_id_.GetNoArena();
+inline const ::Image& FaceRecord::view() const {
+  const ::Image* p = view_;
+  // @@protoc_insertion_point(field_get:FaceRecord.view)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
 }
-inline void ExtractOptions::set_algorithm_id(const std::string& value) {
+inline ::Image* FaceRecord::release_view() {
+  // @@protoc_insertion_point(field_release:FaceRecord.view)
   
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:ExtractOptions.algorithm_id)
+  ::Image* temp = view_;
+  view_ = nullptr;
+  return temp;
 }
-inline void ExtractOptions::set_algorithm_id(std::string&& value) {
+inline ::Image* FaceRecord::mutable_view() {
   
-  algorithm_id_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:ExtractOptions.algorithm_id)
+  if (view_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    view_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:FaceRecord.view)
+  return view_;
 }
-inline void ExtractOptions::set_algorithm_id(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:ExtractOptions.algorithm_id)
+inline void FaceRecord::set_allocated_view(::Image* view) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(view_);
+  }
+  if (view) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      view = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, view, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  view_ = view;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.view)
 }
-inline void ExtractOptions::set_algorithm_id(const char* value, size_t size) {
-  
-  algorithm_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:ExtractOptions.algorithm_id)
+
+// .Image aligned = 9;
+inline bool FaceRecord::has_aligned() const {
+  return this != internal_default_instance() && aligned_ != nullptr;
 }
-inline std::string* ExtractOptions::mutable_algorithm_id() {
+inline const ::Image& FaceRecord::aligned() const {
+  const ::Image* p = aligned_;
+  // @@protoc_insertion_point(field_get:FaceRecord.aligned)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
+}
+inline ::Image* FaceRecord::release_aligned() {
+  // @@protoc_insertion_point(field_release:FaceRecord.aligned)
   
-  // @@protoc_insertion_point(field_mutable:ExtractOptions.algorithm_id)
-  return algorithm_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::Image* temp = aligned_;
+  aligned_ = nullptr;
+  return temp;
 }
-inline std::string* ExtractOptions::release_algorithm_id() {
-  // @@protoc_insertion_point(field_release:ExtractOptions.algorithm_id)
+inline ::Image* FaceRecord::mutable_aligned() {
   
-  return algorithm_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (aligned_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    aligned_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:FaceRecord.aligned)
+  return aligned_;
 }
-inline void ExtractOptions::set_allocated_algorithm_id(std::string* algorithm_id) {
-  if (algorithm_id != nullptr) {
+inline void FaceRecord::set_allocated_aligned(::Image* aligned) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(aligned_);
+  }
+  if (aligned) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      aligned = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, aligned, submessage_arena);
+    }
     
   } else {
     
   }
-  algorithm_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm_id);
-  // @@protoc_insertion_point(field_set_allocated:ExtractOptions.algorithm_id)
+  aligned_ = aligned;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.aligned)
 }
 
-// bool save_request = 2;
-inline void ExtractOptions::clear_save_request() {
-  save_request_ = false;
-}
-inline bool ExtractOptions::save_request() const {
-  // @@protoc_insertion_point(field_get:ExtractOptions.save_request)
-  return save_request_;
-}
-inline void ExtractOptions::set_save_request(bool value) {
-  
-  save_request_ = value;
-  // @@protoc_insertion_point(field_set:ExtractOptions.save_request)
+// .Detection detection = 2;
+inline bool FaceRecord::has_detection() const {
+  return this != internal_default_instance() && detection_ != nullptr;
 }
-
-// bool debug = 3;
-inline void ExtractOptions::clear_debug() {
-  debug_ = false;
+inline void FaceRecord::clear_detection() {
+  if (GetArenaNoVirtual() == nullptr && detection_ != nullptr) {
+    delete detection_;
+  }
+  detection_ = nullptr;
 }
-inline bool ExtractOptions::debug() const {
-  // @@protoc_insertion_point(field_get:ExtractOptions.debug)
-  return debug_;
+inline const ::Detection& FaceRecord::detection() const {
+  const ::Detection* p = detection_;
+  // @@protoc_insertion_point(field_get:FaceRecord.detection)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Detection*>(
+      &::_Detection_default_instance_);
 }
-inline void ExtractOptions::set_debug(bool value) {
+inline ::Detection* FaceRecord::release_detection() {
+  // @@protoc_insertion_point(field_release:FaceRecord.detection)
   
-  debug_ = value;
-  // @@protoc_insertion_point(field_set:ExtractOptions.debug)
-}
-
-// repeated .Attribute attributes = 8;
-inline int ExtractOptions::attributes_size() const {
-  return attributes_.size();
-}
-inline void ExtractOptions::clear_attributes() {
-  attributes_.Clear();
-}
-inline ::Attribute* ExtractOptions::mutable_attributes(int index) {
-  // @@protoc_insertion_point(field_mutable:ExtractOptions.attributes)
-  return attributes_.Mutable(index);
-}
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-ExtractOptions::mutable_attributes() {
-  // @@protoc_insertion_point(field_mutable_list:ExtractOptions.attributes)
-  return &attributes_;
-}
-inline const ::Attribute& ExtractOptions::attributes(int index) const {
-  // @@protoc_insertion_point(field_get:ExtractOptions.attributes)
-  return attributes_.Get(index);
+  ::Detection* temp = detection_;
+  detection_ = nullptr;
+  return temp;
 }
-inline ::Attribute* ExtractOptions::add_attributes() {
-  // @@protoc_insertion_point(field_add:ExtractOptions.attributes)
-  return attributes_.Add();
+inline ::Detection* FaceRecord::mutable_detection() {
+  
+  if (detection_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Detection>(GetArenaNoVirtual());
+    detection_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:FaceRecord.detection)
+  return detection_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-ExtractOptions::attributes() const {
-  // @@protoc_insertion_point(field_list:ExtractOptions.attributes)
-  return attributes_;
+inline void FaceRecord::set_allocated_detection(::Detection* detection) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete detection_;
+  }
+  if (detection) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      detection = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, detection, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  detection_ = detection;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.detection)
 }
 
-// -------------------------------------------------------------------
-
-// EnrollOptions
-
-// bool save_request = 2;
-inline void EnrollOptions::clear_save_request() {
-  save_request_ = false;
+// repeated .Landmark landmarks = 8;
+inline int FaceRecord::landmarks_size() const {
+  return landmarks_.size();
 }
-inline bool EnrollOptions::save_request() const {
-  // @@protoc_insertion_point(field_get:EnrollOptions.save_request)
-  return save_request_;
+inline void FaceRecord::clear_landmarks() {
+  landmarks_.Clear();
 }
-inline void EnrollOptions::set_save_request(bool value) {
-  
-  save_request_ = value;
-  // @@protoc_insertion_point(field_set:EnrollOptions.save_request)
+inline ::Landmark* FaceRecord::mutable_landmarks(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecord.landmarks)
+  return landmarks_.Mutable(index);
 }
-
-// bool debug = 3;
-inline void EnrollOptions::clear_debug() {
-  debug_ = false;
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Landmark >*
+FaceRecord::mutable_landmarks() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecord.landmarks)
+  return &landmarks_;
 }
-inline bool EnrollOptions::debug() const {
-  // @@protoc_insertion_point(field_get:EnrollOptions.debug)
-  return debug_;
+inline const ::Landmark& FaceRecord::landmarks(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecord.landmarks)
+  return landmarks_.Get(index);
 }
-inline void EnrollOptions::set_debug(bool value) {
-  
-  debug_ = value;
-  // @@protoc_insertion_point(field_set:EnrollOptions.debug)
+inline ::Landmark* FaceRecord::add_landmarks() {
+  // @@protoc_insertion_point(field_add:FaceRecord.landmarks)
+  return landmarks_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Landmark >&
+FaceRecord::landmarks() const {
+  // @@protoc_insertion_point(field_list:FaceRecord.landmarks)
+  return landmarks_;
 }
 
-// repeated .Attribute attributes = 8;
-inline int EnrollOptions::attributes_size() const {
+// repeated .Attribute attributes = 10;
+inline int FaceRecord::attributes_size() const {
   return attributes_.size();
 }
-inline void EnrollOptions::clear_attributes() {
+inline void FaceRecord::clear_attributes() {
   attributes_.Clear();
 }
-inline ::Attribute* EnrollOptions::mutable_attributes(int index) {
-  // @@protoc_insertion_point(field_mutable:EnrollOptions.attributes)
+inline ::Attribute* FaceRecord::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecord.attributes)
   return attributes_.Mutable(index);
 }
 inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-EnrollOptions::mutable_attributes() {
-  // @@protoc_insertion_point(field_mutable_list:EnrollOptions.attributes)
+FaceRecord::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecord.attributes)
   return &attributes_;
 }
-inline const ::Attribute& EnrollOptions::attributes(int index) const {
-  // @@protoc_insertion_point(field_get:EnrollOptions.attributes)
+inline const ::Attribute& FaceRecord::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecord.attributes)
   return attributes_.Get(index);
 }
-inline ::Attribute* EnrollOptions::add_attributes() {
-  // @@protoc_insertion_point(field_add:EnrollOptions.attributes)
+inline ::Attribute* FaceRecord::add_attributes() {
+  // @@protoc_insertion_point(field_add:FaceRecord.attributes)
   return attributes_.Add();
 }
 inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-EnrollOptions::attributes() const {
-  // @@protoc_insertion_point(field_list:EnrollOptions.attributes)
+FaceRecord::attributes() const {
+  // @@protoc_insertion_point(field_list:FaceRecord.attributes)
   return attributes_;
 }
 
-// -------------------------------------------------------------------
-
-// DetectionList
-
-// repeated .Detection detections = 1;
-inline int DetectionList::detections_size() const {
-  return detections_.size();
-}
-inline void DetectionList::clear_detections() {
-  detections_.Clear();
-}
-inline ::Detection* DetectionList::mutable_detections(int index) {
-  // @@protoc_insertion_point(field_mutable:DetectionList.detections)
-  return detections_.Mutable(index);
-}
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Detection >*
-DetectionList::mutable_detections() {
-  // @@protoc_insertion_point(field_mutable_list:DetectionList.detections)
-  return &detections_;
-}
-inline const ::Detection& DetectionList::detections(int index) const {
-  // @@protoc_insertion_point(field_get:DetectionList.detections)
-  return detections_.Get(index);
-}
-inline ::Detection* DetectionList::add_detections() {
-  // @@protoc_insertion_point(field_add:DetectionList.detections)
-  return detections_.Add();
-}
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Detection >&
-DetectionList::detections() const {
-  // @@protoc_insertion_point(field_list:DetectionList.detections)
-  return detections_;
+// repeated .Attribute internal_data = 11;
+inline int FaceRecord::internal_data_size() const {
+  return internal_data_.size();
 }
-
-// float detection_time = 2;
-inline void DetectionList::clear_detection_time() {
-  detection_time_ = 0;
+inline void FaceRecord::clear_internal_data() {
+  internal_data_.Clear();
 }
-inline float DetectionList::detection_time() const {
-  // @@protoc_insertion_point(field_get:DetectionList.detection_time)
-  return detection_time_;
+inline ::Attribute* FaceRecord::mutable_internal_data(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecord.internal_data)
+  return internal_data_.Mutable(index);
 }
-inline void DetectionList::set_detection_time(float value) {
-  
-  detection_time_ = value;
-  // @@protoc_insertion_point(field_set:DetectionList.detection_time)
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
+FaceRecord::mutable_internal_data() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecord.internal_data)
+  return &internal_data_;
 }
-
-// int32 image_width = 3;
-inline void DetectionList::clear_image_width() {
-  image_width_ = 0;
+inline const ::Attribute& FaceRecord::internal_data(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecord.internal_data)
+  return internal_data_.Get(index);
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::image_width() const {
-  // @@protoc_insertion_point(field_get:DetectionList.image_width)
-  return image_width_;
+inline ::Attribute* FaceRecord::add_internal_data() {
+  // @@protoc_insertion_point(field_add:FaceRecord.internal_data)
+  return internal_data_.Add();
 }
-inline void DetectionList::set_image_width(::PROTOBUF_NAMESPACE_ID::int32 value) {
-  
-  image_width_ = value;
-  // @@protoc_insertion_point(field_set:DetectionList.image_width)
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
+FaceRecord::internal_data() const {
+  // @@protoc_insertion_point(field_list:FaceRecord.internal_data)
+  return internal_data_;
 }
 
-// int32 image_height = 4;
-inline void DetectionList::clear_image_height() {
-  image_height_ = 0;
+// .FaceTemplate template = 3;
+inline bool FaceRecord::has_template_() const {
+  return this != internal_default_instance() && template__ != nullptr;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::image_height() const {
-  // @@protoc_insertion_point(field_get:DetectionList.image_height)
-  return image_height_;
+inline void FaceRecord::clear_template_() {
+  if (GetArenaNoVirtual() == nullptr && template__ != nullptr) {
+    delete template__;
+  }
+  template__ = nullptr;
 }
-inline void DetectionList::set_image_height(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline const ::FaceTemplate& FaceRecord::template_() const {
+  const ::FaceTemplate* p = template__;
+  // @@protoc_insertion_point(field_get:FaceRecord.template)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceTemplate*>(
+      &::_FaceTemplate_default_instance_);
+}
+inline ::FaceTemplate* FaceRecord::release_template_() {
+  // @@protoc_insertion_point(field_release:FaceRecord.template)
   
-  image_height_ = value;
-  // @@protoc_insertion_point(field_set:DetectionList.image_height)
+  ::FaceTemplate* temp = template__;
+  template__ = nullptr;
+  return temp;
+}
+inline ::FaceTemplate* FaceRecord::mutable_template_() {
+  
+  if (template__ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceTemplate>(GetArenaNoVirtual());
+    template__ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:FaceRecord.template)
+  return template__;
+}
+inline void FaceRecord::set_allocated_template_(::FaceTemplate* template_) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete template__;
+  }
+  if (template_) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      template_ = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, template_, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  template__ = template_;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.template)
 }
 
-// int32 detection_count = 5;
-inline void DetectionList::clear_detection_count() {
-  detection_count_ = 0;
+// float score = 12;
+inline void FaceRecord::clear_score() {
+  score_ = 0;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 DetectionList::detection_count() const {
-  // @@protoc_insertion_point(field_get:DetectionList.detection_count)
-  return detection_count_;
+inline float FaceRecord::score() const {
+  // @@protoc_insertion_point(field_get:FaceRecord.score)
+  return score_;
 }
-inline void DetectionList::set_detection_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline void FaceRecord::set_score(float value) {
   
-  detection_count_ = value;
-  // @@protoc_insertion_point(field_set:DetectionList.detection_count)
+  score_ = value;
+  // @@protoc_insertion_point(field_set:FaceRecord.score)
 }
 
-// .DetectionOptions options = 6;
-inline bool DetectionList::has_options() const {
-  return this != internal_default_instance() && options_ != nullptr;
+// .FaceRecordList search_results = 13;
+inline bool FaceRecord::has_search_results() const {
+  return this != internal_default_instance() && search_results_ != nullptr;
 }
-inline void DetectionList::clear_options() {
-  if (GetArenaNoVirtual() == nullptr && options_ != nullptr) {
-    delete options_;
+inline void FaceRecord::clear_search_results() {
+  if (GetArenaNoVirtual() == nullptr && search_results_ != nullptr) {
+    delete search_results_;
   }
-  options_ = nullptr;
+  search_results_ = nullptr;
 }
-inline const ::DetectionOptions& DetectionList::options() const {
-  const ::DetectionOptions* p = options_;
-  // @@protoc_insertion_point(field_get:DetectionList.options)
-  return p != nullptr ? *p : *reinterpret_cast<const ::DetectionOptions*>(
-      &::_DetectionOptions_default_instance_);
+inline const ::FaceRecordList& FaceRecord::search_results() const {
+  const ::FaceRecordList* p = search_results_;
+  // @@protoc_insertion_point(field_get:FaceRecord.search_results)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
 }
-inline ::DetectionOptions* DetectionList::release_options() {
-  // @@protoc_insertion_point(field_release:DetectionList.options)
+inline ::FaceRecordList* FaceRecord::release_search_results() {
+  // @@protoc_insertion_point(field_release:FaceRecord.search_results)
   
-  ::DetectionOptions* temp = options_;
-  options_ = nullptr;
+  ::FaceRecordList* temp = search_results_;
+  search_results_ = nullptr;
   return temp;
 }
-inline ::DetectionOptions* DetectionList::mutable_options() {
+inline ::FaceRecordList* FaceRecord::mutable_search_results() {
   
-  if (options_ == nullptr) {
-    auto* p = CreateMaybeMessage<::DetectionOptions>(GetArenaNoVirtual());
-    options_ = p;
+  if (search_results_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    search_results_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:DetectionList.options)
-  return options_;
+  // @@protoc_insertion_point(field_mutable:FaceRecord.search_results)
+  return search_results_;
 }
-inline void DetectionList::set_allocated_options(::DetectionOptions* options) {
+inline void FaceRecord::set_allocated_search_results(::FaceRecordList* search_results) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete options_;
+    delete search_results_;
   }
-  if (options) {
+  if (search_results) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, options, submessage_arena);
+      search_results = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, search_results, submessage_arena);
     }
     
   } else {
     
   }
-  options_ = options;
-  // @@protoc_insertion_point(field_set_allocated:DetectionList.options)
+  search_results_ = search_results;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecord.search_results)
 }
 
 // -------------------------------------------------------------------
 
-// MatchList
+// FaceRecordList
 
-// repeated .MatchInfo match_list = 1;
-inline int MatchList::match_list_size() const {
-  return match_list_.size();
+// repeated .FaceRecord face_records = 1;
+inline int FaceRecordList::face_records_size() const {
+  return face_records_.size();
 }
-inline void MatchList::clear_match_list() {
-  match_list_.Clear();
+inline void FaceRecordList::clear_face_records() {
+  face_records_.Clear();
 }
-inline ::MatchInfo* MatchList::mutable_match_list(int index) {
-  // @@protoc_insertion_point(field_mutable:MatchList.match_list)
-  return match_list_.Mutable(index);
+inline ::FaceRecord* FaceRecordList::mutable_face_records(int index) {
+  // @@protoc_insertion_point(field_mutable:FaceRecordList.face_records)
+  return face_records_.Mutable(index);
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::MatchInfo >*
-MatchList::mutable_match_list() {
-  // @@protoc_insertion_point(field_mutable_list:MatchList.match_list)
-  return &match_list_;
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
+FaceRecordList::mutable_face_records() {
+  // @@protoc_insertion_point(field_mutable_list:FaceRecordList.face_records)
+  return &face_records_;
 }
-inline const ::MatchInfo& MatchList::match_list(int index) const {
-  // @@protoc_insertion_point(field_get:MatchList.match_list)
-  return match_list_.Get(index);
+inline const ::FaceRecord& FaceRecordList::face_records(int index) const {
+  // @@protoc_insertion_point(field_get:FaceRecordList.face_records)
+  return face_records_.Get(index);
 }
-inline ::MatchInfo* MatchList::add_match_list() {
-  // @@protoc_insertion_point(field_add:MatchList.match_list)
-  return match_list_.Add();
+inline ::FaceRecord* FaceRecordList::add_face_records() {
+  // @@protoc_insertion_point(field_add:FaceRecordList.face_records)
+  return face_records_.Add();
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::MatchInfo >&
-MatchList::match_list() const {
-  // @@protoc_insertion_point(field_list:MatchList.match_list)
-  return match_list_;
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
+FaceRecordList::face_records() const {
+  // @@protoc_insertion_point(field_list:FaceRecordList.face_records)
+  return face_records_;
 }
 
-// -------------------------------------------------------------------
-
-// MatchInfo
-
-// float score = 1;
-inline void MatchInfo::clear_score() {
-  score_ = 0;
+// .EnrollStats enroll_stats = 3;
+inline bool FaceRecordList::has_enroll_stats() const {
+  return this != internal_default_instance() && enroll_stats_ != nullptr;
 }
-inline float MatchInfo::score() const {
-  // @@protoc_insertion_point(field_get:MatchInfo.score)
-  return score_;
+inline void FaceRecordList::clear_enroll_stats() {
+  if (GetArenaNoVirtual() == nullptr && enroll_stats_ != nullptr) {
+    delete enroll_stats_;
+  }
+  enroll_stats_ = nullptr;
 }
-inline void MatchInfo::set_score(float value) {
+inline const ::EnrollStats& FaceRecordList::enroll_stats() const {
+  const ::EnrollStats* p = enroll_stats_;
+  // @@protoc_insertion_point(field_get:FaceRecordList.enroll_stats)
+  return p != nullptr ? *p : *reinterpret_cast<const ::EnrollStats*>(
+      &::_EnrollStats_default_instance_);
+}
+inline ::EnrollStats* FaceRecordList::release_enroll_stats() {
+  // @@protoc_insertion_point(field_release:FaceRecordList.enroll_stats)
   
-  score_ = value;
-  // @@protoc_insertion_point(field_set:MatchInfo.score)
+  ::EnrollStats* temp = enroll_stats_;
+  enroll_stats_ = nullptr;
+  return temp;
+}
+inline ::EnrollStats* FaceRecordList::mutable_enroll_stats() {
+  
+  if (enroll_stats_ == nullptr) {
+    auto* p = CreateMaybeMessage<::EnrollStats>(GetArenaNoVirtual());
+    enroll_stats_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:FaceRecordList.enroll_stats)
+  return enroll_stats_;
+}
+inline void FaceRecordList::set_allocated_enroll_stats(::EnrollStats* enroll_stats) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete enroll_stats_;
+  }
+  if (enroll_stats) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      enroll_stats = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, enroll_stats, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  enroll_stats_ = enroll_stats;
+  // @@protoc_insertion_point(field_set_allocated:FaceRecordList.enroll_stats)
 }
 
-// string image_id = 2;
-inline void MatchInfo::clear_image_id() {
-  image_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// -------------------------------------------------------------------
+
+// EnrollStats
+
+// int64 enroll_count = 1;
+inline void EnrollStats::clear_enroll_count() {
+  enroll_count_ = PROTOBUF_LONGLONG(0);
 }
-inline const std::string& MatchInfo::image_id() const {
-  // @@protoc_insertion_point(field_get:MatchInfo.image_id)
-  return image_id_.GetNoArena();
+inline ::PROTOBUF_NAMESPACE_ID::int64 EnrollStats::enroll_count() const {
+  // @@protoc_insertion_point(field_get:EnrollStats.enroll_count)
+  return enroll_count_;
 }
-inline void MatchInfo::set_image_id(const std::string& value) {
+inline void EnrollStats::set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:MatchInfo.image_id)
+  enroll_count_ = value;
+  // @@protoc_insertion_point(field_set:EnrollStats.enroll_count)
 }
-inline void MatchInfo::set_image_id(std::string&& value) {
-  
-  image_id_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.image_id)
+
+// int64 replace_count = 2;
+inline void EnrollStats::clear_replace_count() {
+  replace_count_ = PROTOBUF_LONGLONG(0);
 }
-inline void MatchInfo::set_image_id(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:MatchInfo.image_id)
+inline ::PROTOBUF_NAMESPACE_ID::int64 EnrollStats::replace_count() const {
+  // @@protoc_insertion_point(field_get:EnrollStats.replace_count)
+  return replace_count_;
 }
-inline void MatchInfo::set_image_id(const char* value, size_t size) {
+inline void EnrollStats::set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  image_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:MatchInfo.image_id)
+  replace_count_ = value;
+  // @@protoc_insertion_point(field_set:EnrollStats.replace_count)
 }
-inline std::string* MatchInfo::mutable_image_id() {
-  
-  // @@protoc_insertion_point(field_mutable:MatchInfo.image_id)
-  return image_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+
+// int64 skip_count = 3;
+inline void EnrollStats::clear_skip_count() {
+  skip_count_ = PROTOBUF_LONGLONG(0);
 }
-inline std::string* MatchInfo::release_image_id() {
-  // @@protoc_insertion_point(field_release:MatchInfo.image_id)
-  
-  return image_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline ::PROTOBUF_NAMESPACE_ID::int64 EnrollStats::skip_count() const {
+  // @@protoc_insertion_point(field_get:EnrollStats.skip_count)
+  return skip_count_;
 }
-inline void MatchInfo::set_allocated_image_id(std::string* image_id) {
-  if (image_id != nullptr) {
-    
-  } else {
-    
-  }
-  image_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), image_id);
-  // @@protoc_insertion_point(field_set_allocated:MatchInfo.image_id)
+inline void EnrollStats::set_skip_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  skip_count_ = value;
+  // @@protoc_insertion_point(field_set:EnrollStats.skip_count)
 }
 
-// string detection_id = 3;
-inline void MatchInfo::clear_detection_id() {
-  detection_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// int64 merge_count = 4;
+inline void EnrollStats::clear_merge_count() {
+  merge_count_ = PROTOBUF_LONGLONG(0);
 }
-inline const std::string& MatchInfo::detection_id() const {
-  // @@protoc_insertion_point(field_get:MatchInfo.detection_id)
-  return detection_id_.GetNoArena();
+inline ::PROTOBUF_NAMESPACE_ID::int64 EnrollStats::merge_count() const {
+  // @@protoc_insertion_point(field_get:EnrollStats.merge_count)
+  return merge_count_;
 }
-inline void MatchInfo::set_detection_id(const std::string& value) {
+inline void EnrollStats::set_merge_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:MatchInfo.detection_id)
+  merge_count_ = value;
+  // @@protoc_insertion_point(field_set:EnrollStats.merge_count)
 }
-inline void MatchInfo::set_detection_id(std::string&& value) {
+
+// -------------------------------------------------------------------
+
+// VerificationRequest
+
+// string gallery = 1;
+inline void VerificationRequest::clear_gallery() {
+  gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& VerificationRequest::gallery() const {
+  // @@protoc_insertion_point(field_get:VerificationRequest.gallery)
+  return gallery_.GetNoArena();
+}
+inline void VerificationRequest::set_gallery(const std::string& value) {
   
-  detection_id_.SetNoArena(
+  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:VerificationRequest.gallery)
+}
+inline void VerificationRequest::set_gallery(std::string&& value) {
+  
+  gallery_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.detection_id)
+  // @@protoc_insertion_point(field_set_rvalue:VerificationRequest.gallery)
 }
-inline void MatchInfo::set_detection_id(const char* value) {
+inline void VerificationRequest::set_gallery(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:MatchInfo.detection_id)
+  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:VerificationRequest.gallery)
 }
-inline void MatchInfo::set_detection_id(const char* value, size_t size) {
+inline void VerificationRequest::set_gallery(const char* value, size_t size) {
   
-  detection_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:MatchInfo.detection_id)
+  // @@protoc_insertion_point(field_set_pointer:VerificationRequest.gallery)
 }
-inline std::string* MatchInfo::mutable_detection_id() {
+inline std::string* VerificationRequest::mutable_gallery() {
   
-  // @@protoc_insertion_point(field_mutable:MatchInfo.detection_id)
-  return detection_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:VerificationRequest.gallery)
+  return gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* MatchInfo::release_detection_id() {
-  // @@protoc_insertion_point(field_release:MatchInfo.detection_id)
+inline std::string* VerificationRequest::release_gallery() {
+  // @@protoc_insertion_point(field_release:VerificationRequest.gallery)
   
-  return detection_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void MatchInfo::set_allocated_detection_id(std::string* detection_id) {
-  if (detection_id != nullptr) {
+inline void VerificationRequest::set_allocated_gallery(std::string* gallery) {
+  if (gallery != nullptr) {
     
   } else {
     
   }
-  detection_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), detection_id);
-  // @@protoc_insertion_point(field_set_allocated:MatchInfo.detection_id)
+  gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery);
+  // @@protoc_insertion_point(field_set_allocated:VerificationRequest.gallery)
 }
 
-// string subject_id = 4;
-inline void MatchInfo::clear_subject_id() {
+// string subject_id = 2;
+inline void VerificationRequest::clear_subject_id() {
   subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& MatchInfo::subject_id() const {
-  // @@protoc_insertion_point(field_get:MatchInfo.subject_id)
+inline const std::string& VerificationRequest::subject_id() const {
+  // @@protoc_insertion_point(field_get:VerificationRequest.subject_id)
   return subject_id_.GetNoArena();
 }
-inline void MatchInfo::set_subject_id(const std::string& value) {
+inline void VerificationRequest::set_subject_id(const std::string& value) {
   
   subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_set:VerificationRequest.subject_id)
 }
-inline void MatchInfo::set_subject_id(std::string&& value) {
+inline void VerificationRequest::set_subject_id(std::string&& value) {
   
   subject_id_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_set_rvalue:VerificationRequest.subject_id)
 }
-inline void MatchInfo::set_subject_id(const char* value) {
+inline void VerificationRequest::set_subject_id(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
   subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_set_char:VerificationRequest.subject_id)
 }
-inline void MatchInfo::set_subject_id(const char* value, size_t size) {
+inline void VerificationRequest::set_subject_id(const char* value, size_t size) {
   
   subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_set_pointer:VerificationRequest.subject_id)
 }
-inline std::string* MatchInfo::mutable_subject_id() {
+inline std::string* VerificationRequest::mutable_subject_id() {
   
-  // @@protoc_insertion_point(field_mutable:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_mutable:VerificationRequest.subject_id)
   return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* MatchInfo::release_subject_id() {
-  // @@protoc_insertion_point(field_release:MatchInfo.subject_id)
+inline std::string* VerificationRequest::release_subject_id() {
+  // @@protoc_insertion_point(field_release:VerificationRequest.subject_id)
   
   return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void MatchInfo::set_allocated_subject_id(std::string* subject_id) {
+inline void VerificationRequest::set_allocated_subject_id(std::string* subject_id) {
   if (subject_id != nullptr) {
     
   } else {
     
   }
   subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
-  // @@protoc_insertion_point(field_set_allocated:MatchInfo.subject_id)
+  // @@protoc_insertion_point(field_set_allocated:VerificationRequest.subject_id)
 }
 
-// string subject_name = 5;
-inline void MatchInfo::clear_subject_name() {
-  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// repeated .FaceRecord face_record = 3;
+inline int VerificationRequest::face_record_size() const {
+  return face_record_.size();
 }
-inline const std::string& MatchInfo::subject_name() const {
-  // @@protoc_insertion_point(field_get:MatchInfo.subject_name)
-  return subject_name_.GetNoArena();
+inline void VerificationRequest::clear_face_record() {
+  face_record_.Clear();
 }
-inline void MatchInfo::set_subject_name(const std::string& value) {
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:MatchInfo.subject_name)
+inline ::FaceRecord* VerificationRequest::mutable_face_record(int index) {
+  // @@protoc_insertion_point(field_mutable:VerificationRequest.face_record)
+  return face_record_.Mutable(index);
 }
-inline void MatchInfo::set_subject_name(std::string&& value) {
-  
-  subject_name_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:MatchInfo.subject_name)
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
+VerificationRequest::mutable_face_record() {
+  // @@protoc_insertion_point(field_mutable_list:VerificationRequest.face_record)
+  return &face_record_;
 }
-inline void MatchInfo::set_subject_name(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:MatchInfo.subject_name)
+inline const ::FaceRecord& VerificationRequest::face_record(int index) const {
+  // @@protoc_insertion_point(field_get:VerificationRequest.face_record)
+  return face_record_.Get(index);
 }
-inline void MatchInfo::set_subject_name(const char* value, size_t size) {
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:MatchInfo.subject_name)
+inline ::FaceRecord* VerificationRequest::add_face_record() {
+  // @@protoc_insertion_point(field_add:VerificationRequest.face_record)
+  return face_record_.Add();
 }
-inline std::string* MatchInfo::mutable_subject_name() {
-  
-  // @@protoc_insertion_point(field_mutable:MatchInfo.subject_name)
-  return subject_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
+VerificationRequest::face_record() const {
+  // @@protoc_insertion_point(field_list:VerificationRequest.face_record)
+  return face_record_;
 }
-inline std::string* MatchInfo::release_subject_name() {
-  // @@protoc_insertion_point(field_release:MatchInfo.subject_name)
-  
-  return subject_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+
+// -------------------------------------------------------------------
+
+// VerificationResponse
+
+// int32 error_code = 4;
+inline void VerificationResponse::clear_error_code() {
+  error_code_ = 0;
 }
-inline void MatchInfo::set_allocated_subject_name(std::string* subject_name) {
-  if (subject_name != nullptr) {
-    
-  } else {
-    
-  }
-  subject_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_name);
-  // @@protoc_insertion_point(field_set_allocated:MatchInfo.subject_name)
+inline ::PROTOBUF_NAMESPACE_ID::int32 VerificationResponse::error_code() const {
+  // @@protoc_insertion_point(field_get:VerificationResponse.error_code)
+  return error_code_;
+}
+inline void VerificationResponse::set_error_code(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  error_code_ = value;
+  // @@protoc_insertion_point(field_set:VerificationResponse.error_code)
 }
 
-// .Image face = 6;
-inline bool MatchInfo::has_face() const {
-  return this != internal_default_instance() && face_ != nullptr;
+// string error_message = 5;
+inline void VerificationResponse::clear_error_message() {
+  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::Image& MatchInfo::face() const {
-  const ::Image* p = face_;
-  // @@protoc_insertion_point(field_get:MatchInfo.face)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline const std::string& VerificationResponse::error_message() const {
+  // @@protoc_insertion_point(field_get:VerificationResponse.error_message)
+  return error_message_.GetNoArena();
 }
-inline ::Image* MatchInfo::release_face() {
-  // @@protoc_insertion_point(field_release:MatchInfo.face)
+inline void VerificationResponse::set_error_message(const std::string& value) {
   
-  ::Image* temp = face_;
-  face_ = nullptr;
-  return temp;
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:VerificationResponse.error_message)
 }
-inline ::Image* MatchInfo::mutable_face() {
+inline void VerificationResponse::set_error_message(std::string&& value) {
   
-  if (face_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    face_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:MatchInfo.face)
-  return face_;
-}
-inline void MatchInfo::set_allocated_face(::Image* face) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(face_);
-  }
-  if (face) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      face = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, face, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  face_ = face;
-  // @@protoc_insertion_point(field_set_allocated:MatchInfo.face)
+  error_message_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:VerificationResponse.error_message)
 }
-
-// -------------------------------------------------------------------
-
-// TemplateInput
-
-// .Image im = 1;
-inline bool TemplateInput::has_im() const {
-  return this != internal_default_instance() && im_ != nullptr;
+inline void VerificationResponse::set_error_message(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:VerificationResponse.error_message)
 }
-inline const ::Image& TemplateInput::im() const {
-  const ::Image* p = im_;
-  // @@protoc_insertion_point(field_get:TemplateInput.im)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline void VerificationResponse::set_error_message(const char* value, size_t size) {
+  
+  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:VerificationResponse.error_message)
 }
-inline ::Image* TemplateInput::release_im() {
-  // @@protoc_insertion_point(field_release:TemplateInput.im)
+inline std::string* VerificationResponse::mutable_error_message() {
   
-  ::Image* temp = im_;
-  im_ = nullptr;
-  return temp;
+  // @@protoc_insertion_point(field_mutable:VerificationResponse.error_message)
+  return error_message_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::Image* TemplateInput::mutable_im() {
+inline std::string* VerificationResponse::release_error_message() {
+  // @@protoc_insertion_point(field_release:VerificationResponse.error_message)
   
-  if (im_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    im_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:TemplateInput.im)
-  return im_;
+  return error_message_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void TemplateInput::set_allocated_im(::Image* im) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(im_);
-  }
-  if (im) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      im = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, im, submessage_arena);
-    }
+inline void VerificationResponse::set_allocated_error_message(std::string* error_message) {
+  if (error_message != nullptr) {
     
   } else {
     
   }
-  im_ = im;
-  // @@protoc_insertion_point(field_set_allocated:TemplateInput.im)
+  error_message_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), error_message);
+  // @@protoc_insertion_point(field_set_allocated:VerificationResponse.error_message)
 }
 
-// repeated .Rect detections = 2;
-inline int TemplateInput::detections_size() const {
-  return detections_.size();
+// bool success = 1;
+inline void VerificationResponse::clear_success() {
+  success_ = false;
 }
-inline ::Rect* TemplateInput::mutable_detections(int index) {
-  // @@protoc_insertion_point(field_mutable:TemplateInput.detections)
-  return detections_.Mutable(index);
+inline bool VerificationResponse::success() const {
+  // @@protoc_insertion_point(field_get:VerificationResponse.success)
+  return success_;
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Rect >*
-TemplateInput::mutable_detections() {
-  // @@protoc_insertion_point(field_mutable_list:TemplateInput.detections)
-  return &detections_;
+inline void VerificationResponse::set_success(bool value) {
+  
+  success_ = value;
+  // @@protoc_insertion_point(field_set:VerificationResponse.success)
 }
-inline const ::Rect& TemplateInput::detections(int index) const {
-  // @@protoc_insertion_point(field_get:TemplateInput.detections)
-  return detections_.Get(index);
+
+// float confidence = 2;
+inline void VerificationResponse::clear_confidence() {
+  confidence_ = 0;
 }
-inline ::Rect* TemplateInput::add_detections() {
-  // @@protoc_insertion_point(field_add:TemplateInput.detections)
-  return detections_.Add();
+inline float VerificationResponse::confidence() const {
+  // @@protoc_insertion_point(field_get:VerificationResponse.confidence)
+  return confidence_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Rect >&
-TemplateInput::detections() const {
-  // @@protoc_insertion_point(field_list:TemplateInput.detections)
-  return detections_;
+inline void VerificationResponse::set_confidence(float value) {
+  
+  confidence_ = value;
+  // @@protoc_insertion_point(field_set:VerificationResponse.confidence)
 }
 
-// -------------------------------------------------------------------
-
-// FaceTemplate
-
-// .Vector data = 1;
-inline bool FaceTemplate::has_data() const {
-  return this != internal_default_instance() && data_ != nullptr;
+// repeated .FaceRecord matches = 3;
+inline int VerificationResponse::matches_size() const {
+  return matches_.size();
 }
-inline const ::Vector& FaceTemplate::data() const {
-  const ::Vector* p = data_;
-  // @@protoc_insertion_point(field_get:FaceTemplate.data)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Vector*>(
-      &::_Vector_default_instance_);
+inline void VerificationResponse::clear_matches() {
+  matches_.Clear();
 }
-inline ::Vector* FaceTemplate::release_data() {
-  // @@protoc_insertion_point(field_release:FaceTemplate.data)
-  
-  ::Vector* temp = data_;
-  data_ = nullptr;
-  return temp;
+inline ::FaceRecord* VerificationResponse::mutable_matches(int index) {
+  // @@protoc_insertion_point(field_mutable:VerificationResponse.matches)
+  return matches_.Mutable(index);
 }
-inline ::Vector* FaceTemplate::mutable_data() {
-  
-  if (data_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Vector>(GetArenaNoVirtual());
-    data_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:FaceTemplate.data)
-  return data_;
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
+VerificationResponse::mutable_matches() {
+  // @@protoc_insertion_point(field_mutable_list:VerificationResponse.matches)
+  return &matches_;
 }
-inline void FaceTemplate::set_allocated_data(::Vector* data) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(data_);
-  }
-  if (data) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      data = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, data, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  data_ = data;
-  // @@protoc_insertion_point(field_set_allocated:FaceTemplate.data)
+inline const ::FaceRecord& VerificationResponse::matches(int index) const {
+  // @@protoc_insertion_point(field_get:VerificationResponse.matches)
+  return matches_.Get(index);
+}
+inline ::FaceRecord* VerificationResponse::add_matches() {
+  // @@protoc_insertion_point(field_add:VerificationResponse.matches)
+  return matches_.Add();
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
+VerificationResponse::matches() const {
+  // @@protoc_insertion_point(field_list:VerificationResponse.matches)
+  return matches_;
 }
 
-// bytes buffer = 2;
-inline void FaceTemplate::clear_buffer() {
-  buffer_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// -------------------------------------------------------------------
+
+// SearchRequest
+
+// string search_gallery = 1;
+inline void SearchRequest::clear_search_gallery() {
+  search_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& FaceTemplate::buffer() const {
-  // @@protoc_insertion_point(field_get:FaceTemplate.buffer)
-  return buffer_.GetNoArena();
+inline const std::string& SearchRequest::search_gallery() const {
+  // @@protoc_insertion_point(field_get:SearchRequest.search_gallery)
+  return search_gallery_.GetNoArena();
 }
-inline void FaceTemplate::set_buffer(const std::string& value) {
+inline void SearchRequest::set_search_gallery(const std::string& value) {
   
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceTemplate.buffer)
+  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:SearchRequest.search_gallery)
 }
-inline void FaceTemplate::set_buffer(std::string&& value) {
+inline void SearchRequest::set_search_gallery(std::string&& value) {
   
-  buffer_.SetNoArena(
+  search_gallery_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceTemplate.buffer)
+  // @@protoc_insertion_point(field_set_rvalue:SearchRequest.search_gallery)
 }
-inline void FaceTemplate::set_buffer(const char* value) {
+inline void SearchRequest::set_search_gallery(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceTemplate.buffer)
+  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:SearchRequest.search_gallery)
 }
-inline void FaceTemplate::set_buffer(const void* value, size_t size) {
+inline void SearchRequest::set_search_gallery(const char* value, size_t size) {
   
-  buffer_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceTemplate.buffer)
+  // @@protoc_insertion_point(field_set_pointer:SearchRequest.search_gallery)
 }
-inline std::string* FaceTemplate::mutable_buffer() {
+inline std::string* SearchRequest::mutable_search_gallery() {
   
-  // @@protoc_insertion_point(field_mutable:FaceTemplate.buffer)
-  return buffer_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:SearchRequest.search_gallery)
+  return search_gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* FaceTemplate::release_buffer() {
-  // @@protoc_insertion_point(field_release:FaceTemplate.buffer)
+inline std::string* SearchRequest::release_search_gallery() {
+  // @@protoc_insertion_point(field_release:SearchRequest.search_gallery)
   
-  return buffer_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return search_gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceTemplate::set_allocated_buffer(std::string* buffer) {
-  if (buffer != nullptr) {
+inline void SearchRequest::set_allocated_search_gallery(std::string* search_gallery) {
+  if (search_gallery != nullptr) {
     
   } else {
     
   }
-  buffer_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), buffer);
-  // @@protoc_insertion_point(field_set_allocated:FaceTemplate.buffer)
+  search_gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), search_gallery);
+  // @@protoc_insertion_point(field_set_allocated:SearchRequest.search_gallery)
 }
 
-// -------------------------------------------------------------------
-
-// TemplateList
-
-// repeated .FaceTemplate templates = 1;
-inline int TemplateList::templates_size() const {
-  return templates_.size();
+// .FaceRecordList probes = 3;
+inline bool SearchRequest::has_probes() const {
+  return this != internal_default_instance() && probes_ != nullptr;
 }
-inline void TemplateList::clear_templates() {
-  templates_.Clear();
+inline void SearchRequest::clear_probes() {
+  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
+    delete probes_;
+  }
+  probes_ = nullptr;
 }
-inline ::FaceTemplate* TemplateList::mutable_templates(int index) {
-  // @@protoc_insertion_point(field_mutable:TemplateList.templates)
-  return templates_.Mutable(index);
+inline const ::FaceRecordList& SearchRequest::probes() const {
+  const ::FaceRecordList* p = probes_;
+  // @@protoc_insertion_point(field_get:SearchRequest.probes)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceTemplate >*
-TemplateList::mutable_templates() {
-  // @@protoc_insertion_point(field_mutable_list:TemplateList.templates)
-  return &templates_;
+inline ::FaceRecordList* SearchRequest::release_probes() {
+  // @@protoc_insertion_point(field_release:SearchRequest.probes)
+  
+  ::FaceRecordList* temp = probes_;
+  probes_ = nullptr;
+  return temp;
+}
+inline ::FaceRecordList* SearchRequest::mutable_probes() {
+  
+  if (probes_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    probes_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:SearchRequest.probes)
+  return probes_;
+}
+inline void SearchRequest::set_allocated_probes(::FaceRecordList* probes) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete probes_;
+  }
+  if (probes) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, probes, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  probes_ = probes;
+  // @@protoc_insertion_point(field_set_allocated:SearchRequest.probes)
 }
-inline const ::FaceTemplate& TemplateList::templates(int index) const {
-  // @@protoc_insertion_point(field_get:TemplateList.templates)
-  return templates_.Get(index);
+
+// int32 max_results = 4;
+inline void SearchRequest::clear_max_results() {
+  max_results_ = 0;
 }
-inline ::FaceTemplate* TemplateList::add_templates() {
-  // @@protoc_insertion_point(field_add:TemplateList.templates)
-  return templates_.Add();
+inline ::PROTOBUF_NAMESPACE_ID::int32 SearchRequest::max_results() const {
+  // @@protoc_insertion_point(field_get:SearchRequest.max_results)
+  return max_results_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceTemplate >&
-TemplateList::templates() const {
-  // @@protoc_insertion_point(field_list:TemplateList.templates)
-  return templates_;
+inline void SearchRequest::set_max_results(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  max_results_ = value;
+  // @@protoc_insertion_point(field_set:SearchRequest.max_results)
 }
 
-// -------------------------------------------------------------------
-
-// AccessRecord
-
-// float datetime = 1;
-inline void AccessRecord::clear_datetime() {
-  datetime_ = 0;
+// float threshold = 5;
+inline void SearchRequest::clear_threshold() {
+  threshold_ = 0;
 }
-inline float AccessRecord::datetime() const {
-  // @@protoc_insertion_point(field_get:AccessRecord.datetime)
-  return datetime_;
+inline float SearchRequest::threshold() const {
+  // @@protoc_insertion_point(field_get:SearchRequest.threshold)
+  return threshold_;
 }
-inline void AccessRecord::set_datetime(float value) {
+inline void SearchRequest::set_threshold(float value) {
   
-  datetime_ = value;
-  // @@protoc_insertion_point(field_set:AccessRecord.datetime)
+  threshold_ = value;
+  // @@protoc_insertion_point(field_set:SearchRequest.threshold)
 }
 
-// string notes = 2;
-inline void AccessRecord::clear_notes() {
-  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// int32 nprobe = 6;
+inline void SearchRequest::clear_nprobe() {
+  nprobe_ = 0;
 }
-inline const std::string& AccessRecord::notes() const {
-  // @@protoc_insertion_point(field_get:AccessRecord.notes)
-  return notes_.GetNoArena();
+inline ::PROTOBUF_NAMESPACE_ID::int32 SearchRequest::nprobe() const {
+  // @@protoc_insertion_point(field_get:SearchRequest.nprobe)
+  return nprobe_;
 }
-inline void AccessRecord::set_notes(const std::string& value) {
+inline void SearchRequest::set_nprobe(::PROTOBUF_NAMESPACE_ID::int32 value) {
   
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:AccessRecord.notes)
+  nprobe_ = value;
+  // @@protoc_insertion_point(field_set:SearchRequest.nprobe)
 }
-inline void AccessRecord::set_notes(std::string&& value) {
-  
-  notes_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:AccessRecord.notes)
+
+// .SearchFilter filter = 7;
+inline bool SearchRequest::has_filter() const {
+  return this != internal_default_instance() && filter_ != nullptr;
 }
-inline void AccessRecord::set_notes(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:AccessRecord.notes)
+inline void SearchRequest::clear_filter() {
+  if (GetArenaNoVirtual() == nullptr && filter_ != nullptr) {
+    delete filter_;
+  }
+  filter_ = nullptr;
 }
-inline void AccessRecord::set_notes(const char* value, size_t size) {
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:AccessRecord.notes)
+inline const ::SearchFilter& SearchRequest::filter() const {
+  const ::SearchFilter* p = filter_;
+  // @@protoc_insertion_point(field_get:SearchRequest.filter)
+  return p != nullptr ? *p : *reinterpret_cast<const ::SearchFilter*>(
+      &::_SearchFilter_default_instance_);
 }
-inline std::string* AccessRecord::mutable_notes() {
+inline ::SearchFilter* SearchRequest::release_filter() {
+  // @@protoc_insertion_point(field_release:SearchRequest.filter)
   
-  // @@protoc_insertion_point(field_mutable:AccessRecord.notes)
-  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::SearchFilter* temp = filter_;
+  filter_ = nullptr;
+  return temp;
 }
-inline std::string* AccessRecord::release_notes() {
-  // @@protoc_insertion_point(field_release:AccessRecord.notes)
+inline ::SearchFilter* SearchRequest::mutable_filter() {
   
-  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (filter_ == nullptr) {
+    auto* p = CreateMaybeMessage<::SearchFilter>(GetArenaNoVirtual());
+    filter_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:SearchRequest.filter)
+  return filter_;
 }
-inline void AccessRecord::set_allocated_notes(std::string* notes) {
-  if (notes != nullptr) {
+inline void SearchRequest::set_allocated_filter(::SearchFilter* filter) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete filter_;
+  }
+  if (filter) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      filter = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, filter, submessage_arena);
+    }
     
   } else {
     
   }
-  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
-  // @@protoc_insertion_point(field_set_allocated:AccessRecord.notes)
+  filter_ = filter;
+  // @@protoc_insertion_point(field_set_allocated:SearchRequest.filter)
 }
 
-// string credential = 3;
-inline void AccessRecord::clear_credential() {
-  credential_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// -------------------------------------------------------------------
+
+// AttributeFilter
+
+// string key = 1;
+inline void AttributeFilter::clear_key() {
+  key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& AccessRecord::credential() const {
-  // @@protoc_insertion_point(field_get:AccessRecord.credential)
-  return credential_.GetNoArena();
+inline const std::string& AttributeFilter::key() const {
+  // @@protoc_insertion_point(field_get:AttributeFilter.key)
+  return key_.GetNoArena();
 }
-inline void AccessRecord::set_credential(const std::string& value) {
+inline void AttributeFilter::set_key(const std::string& value) {
   
-  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:AccessRecord.credential)
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:AttributeFilter.key)
 }
-inline void AccessRecord::set_credential(std::string&& value) {
+inline void AttributeFilter::set_key(std::string&& value) {
   
-  credential_.SetNoArena(
+  key_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:AccessRecord.credential)
+  // @@protoc_insertion_point(field_set_rvalue:AttributeFilter.key)
 }
-inline void AccessRecord::set_credential(const char* value) {
+inline void AttributeFilter::set_key(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:AccessRecord.credential)
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:AttributeFilter.key)
 }
-inline void AccessRecord::set_credential(const char* value, size_t size) {
+inline void AttributeFilter::set_key(const char* value, size_t size) {
   
-  credential_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:AccessRecord.credential)
+  // @@protoc_insertion_point(field_set_pointer:AttributeFilter.key)
 }
-inline std::string* AccessRecord::mutable_credential() {
+inline std::string* AttributeFilter::mutable_key() {
   
-  // @@protoc_insertion_point(field_mutable:AccessRecord.credential)
-  return credential_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:AttributeFilter.key)
+  return key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* AccessRecord::release_credential() {
-  // @@protoc_insertion_point(field_release:AccessRecord.credential)
+inline std::string* AttributeFilter::release_key() {
+  // @@protoc_insertion_point(field_release:AttributeFilter.key)
   
-  return credential_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void AccessRecord::set_allocated_credential(std::string* credential) {
-  if (credential != nullptr) {
+inline void AttributeFilter::set_allocated_key(std::string* key) {
+  if (key != nullptr) {
     
   } else {
     
   }
-  credential_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), credential);
-  // @@protoc_insertion_point(field_set_allocated:AccessRecord.credential)
+  key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), key);
+  // @@protoc_insertion_point(field_set_allocated:AttributeFilter.key)
 }
 
-// repeated .Attribute metadata = 4;
-inline int AccessRecord::metadata_size() const {
-  return metadata_.size();
+// repeated string values = 2;
+inline int AttributeFilter::values_size() const {
+  return values_.size();
 }
-inline void AccessRecord::clear_metadata() {
-  metadata_.Clear();
+inline void AttributeFilter::clear_values() {
+  values_.Clear();
 }
-inline ::Attribute* AccessRecord::mutable_metadata(int index) {
-  // @@protoc_insertion_point(field_mutable:AccessRecord.metadata)
-  return metadata_.Mutable(index);
+inline const std::string& AttributeFilter::values(int index) const {
+  // @@protoc_insertion_point(field_get:AttributeFilter.values)
+  return values_.Get(index);
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-AccessRecord::mutable_metadata() {
-  // @@protoc_insertion_point(field_mutable_list:AccessRecord.metadata)
-  return &metadata_;
+inline std::string* AttributeFilter::mutable_values(int index) {
+  // @@protoc_insertion_point(field_mutable:AttributeFilter.values)
+  return values_.Mutable(index);
 }
-inline const ::Attribute& AccessRecord::metadata(int index) const {
-  // @@protoc_insertion_point(field_get:AccessRecord.metadata)
-  return metadata_.Get(index);
+inline void AttributeFilter::set_values(int index, const std::string& value) {
+  // @@protoc_insertion_point(field_set:AttributeFilter.values)
+  values_.Mutable(index)->assign(value);
 }
-inline ::Attribute* AccessRecord::add_metadata() {
-  // @@protoc_insertion_point(field_add:AccessRecord.metadata)
-  return metadata_.Add();
+inline void AttributeFilter::set_values(int index, std::string&& value) {
+  // @@protoc_insertion_point(field_set:AttributeFilter.values)
+  values_.Mutable(index)->assign(std::move(value));
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-AccessRecord::metadata() const {
-  // @@protoc_insertion_point(field_list:AccessRecord.metadata)
-  return metadata_;
+inline void AttributeFilter::set_values(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  values_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:AttributeFilter.values)
 }
-
-// -------------------------------------------------------------------
-
-// FaceRecord
-
-// string subject_id = 1;
-inline void FaceRecord::clear_subject_id() {
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline void AttributeFilter::set_values(int index, const char* value, size_t size) {
+  values_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:AttributeFilter.values)
 }
-inline const std::string& FaceRecord::subject_id() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.subject_id)
-  return subject_id_.GetNoArena();
+inline std::string* AttributeFilter::add_values() {
+  // @@protoc_insertion_point(field_add_mutable:AttributeFilter.values)
+  return values_.Add();
 }
-inline void FaceRecord::set_subject_id(const std::string& value) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceRecord.subject_id)
+inline void AttributeFilter::add_values(const std::string& value) {
+  values_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:AttributeFilter.values)
 }
-inline void FaceRecord::set_subject_id(std::string&& value) {
-  
-  subject_id_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.subject_id)
+inline void AttributeFilter::add_values(std::string&& value) {
+  values_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:AttributeFilter.values)
 }
-inline void FaceRecord::set_subject_id(const char* value) {
+inline void AttributeFilter::add_values(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceRecord.subject_id)
-}
-inline void FaceRecord::set_subject_id(const char* value, size_t size) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceRecord.subject_id)
+  values_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:AttributeFilter.values)
 }
-inline std::string* FaceRecord::mutable_subject_id() {
-  
-  // @@protoc_insertion_point(field_mutable:FaceRecord.subject_id)
-  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline void AttributeFilter::add_values(const char* value, size_t size) {
+  values_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:AttributeFilter.values)
 }
-inline std::string* FaceRecord::release_subject_id() {
-  // @@protoc_insertion_point(field_release:FaceRecord.subject_id)
-  
-  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+AttributeFilter::values() const {
+  // @@protoc_insertion_point(field_list:AttributeFilter.values)
+  return values_;
 }
-inline void FaceRecord::set_allocated_subject_id(std::string* subject_id) {
-  if (subject_id != nullptr) {
-    
-  } else {
-    
-  }
-  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.subject_id)
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+AttributeFilter::mutable_values() {
+  // @@protoc_insertion_point(field_mutable_list:AttributeFilter.values)
+  return &values_;
 }
 
-// string name = 5;
-inline void FaceRecord::clear_name() {
-  name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// float min_value = 3;
+inline void AttributeFilter::clear_min_value() {
+  min_value_ = 0;
 }
-inline const std::string& FaceRecord::name() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.name)
-  return name_.GetNoArena();
+inline float AttributeFilter::min_value() const {
+  // @@protoc_insertion_point(field_get:AttributeFilter.min_value)
+  return min_value_;
 }
-inline void FaceRecord::set_name(const std::string& value) {
+inline void AttributeFilter::set_min_value(float value) {
   
-  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceRecord.name)
+  min_value_ = value;
+  // @@protoc_insertion_point(field_set:AttributeFilter.min_value)
 }
-inline void FaceRecord::set_name(std::string&& value) {
-  
-  name_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.name)
+
+// float max_value = 4;
+inline void AttributeFilter::clear_max_value() {
+  max_value_ = 0;
 }
-inline void FaceRecord::set_name(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceRecord.name)
+inline float AttributeFilter::max_value() const {
+  // @@protoc_insertion_point(field_get:AttributeFilter.max_value)
+  return max_value_;
 }
-inline void FaceRecord::set_name(const char* value, size_t size) {
+inline void AttributeFilter::set_max_value(float value) {
   
-  name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceRecord.name)
+  max_value_ = value;
+  // @@protoc_insertion_point(field_set:AttributeFilter.max_value)
 }
-inline std::string* FaceRecord::mutable_name() {
-  
-  // @@protoc_insertion_point(field_mutable:FaceRecord.name)
-  return name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+
+// -------------------------------------------------------------------
+
+// SearchFilter
+
+// repeated string subject_ids = 1;
+inline int SearchFilter::subject_ids_size() const {
+  return subject_ids_.size();
 }
-inline std::string* FaceRecord::release_name() {
-  // @@protoc_insertion_point(field_release:FaceRecord.name)
-  
-  return name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline void SearchFilter::clear_subject_ids() {
+  subject_ids_.Clear();
 }
-inline void FaceRecord::set_allocated_name(std::string* name) {
-  if (name != nullptr) {
-    
-  } else {
-    
-  }
-  name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), name);
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.name)
+inline const std::string& SearchFilter::subject_ids(int index) const {
+  // @@protoc_insertion_point(field_get:SearchFilter.subject_ids)
+  return subject_ids_.Get(index);
+}
+inline std::string* SearchFilter::mutable_subject_ids(int index) {
+  // @@protoc_insertion_point(field_mutable:SearchFilter.subject_ids)
+  return subject_ids_.Mutable(index);
+}
+inline void SearchFilter::set_subject_ids(int index, const std::string& value) {
+  // @@protoc_insertion_point(field_set:SearchFilter.subject_ids)
+  subject_ids_.Mutable(index)->assign(value);
+}
+inline void SearchFilter::set_subject_ids(int index, std::string&& value) {
+  // @@protoc_insertion_point(field_set:SearchFilter.subject_ids)
+  subject_ids_.Mutable(index)->assign(std::move(value));
+}
+inline void SearchFilter::set_subject_ids(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  subject_ids_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:SearchFilter.subject_ids)
+}
+inline void SearchFilter::set_subject_ids(int index, const char* value, size_t size) {
+  subject_ids_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:SearchFilter.subject_ids)
+}
+inline std::string* SearchFilter::add_subject_ids() {
+  // @@protoc_insertion_point(field_add_mutable:SearchFilter.subject_ids)
+  return subject_ids_.Add();
+}
+inline void SearchFilter::add_subject_ids(const std::string& value) {
+  subject_ids_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:SearchFilter.subject_ids)
+}
+inline void SearchFilter::add_subject_ids(std::string&& value) {
+  subject_ids_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:SearchFilter.subject_ids)
+}
+inline void SearchFilter::add_subject_ids(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  subject_ids_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:SearchFilter.subject_ids)
+}
+inline void SearchFilter::add_subject_ids(const char* value, size_t size) {
+  subject_ids_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:SearchFilter.subject_ids)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+SearchFilter::subject_ids() const {
+  // @@protoc_insertion_point(field_list:SearchFilter.subject_ids)
+  return subject_ids_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+SearchFilter::mutable_subject_ids() {
+  // @@protoc_insertion_point(field_mutable_list:SearchFilter.subject_ids)
+  return &subject_ids_;
 }
 
-// string source = 4;
-inline void FaceRecord::clear_source() {
-  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// repeated string sources = 2;
+inline int SearchFilter::sources_size() const {
+  return sources_.size();
 }
-inline const std::string& FaceRecord::source() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.source)
-  return source_.GetNoArena();
+inline void SearchFilter::clear_sources() {
+  sources_.Clear();
 }
-inline void FaceRecord::set_source(const std::string& value) {
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceRecord.source)
+inline const std::string& SearchFilter::sources(int index) const {
+  // @@protoc_insertion_point(field_get:SearchFilter.sources)
+  return sources_.Get(index);
 }
-inline void FaceRecord::set_source(std::string&& value) {
-  
-  source_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.source)
+inline std::string* SearchFilter::mutable_sources(int index) {
+  // @@protoc_insertion_point(field_mutable:SearchFilter.sources)
+  return sources_.Mutable(index);
 }
-inline void FaceRecord::set_source(const char* value) {
+inline void SearchFilter::set_sources(int index, const std::string& value) {
+  // @@protoc_insertion_point(field_set:SearchFilter.sources)
+  sources_.Mutable(index)->assign(value);
+}
+inline void SearchFilter::set_sources(int index, std::string&& value) {
+  // @@protoc_insertion_point(field_set:SearchFilter.sources)
+  sources_.Mutable(index)->assign(std::move(value));
+}
+inline void SearchFilter::set_sources(int index, const char* value) {
   GOOGLE_DCHECK(value != nullptr);
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceRecord.source)
+  sources_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:SearchFilter.sources)
 }
-inline void FaceRecord::set_source(const char* value, size_t size) {
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceRecord.source)
+inline void SearchFilter::set_sources(int index, const char* value, size_t size) {
+  sources_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:SearchFilter.sources)
 }
-inline std::string* FaceRecord::mutable_source() {
-  
-  // @@protoc_insertion_point(field_mutable:FaceRecord.source)
-  return source_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline std::string* SearchFilter::add_sources() {
+  // @@protoc_insertion_point(field_add_mutable:SearchFilter.sources)
+  return sources_.Add();
 }
-inline std::string* FaceRecord::release_source() {
-  // @@protoc_insertion_point(field_release:FaceRecord.source)
-  
-  return source_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline void SearchFilter::add_sources(const std::string& value) {
+  sources_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:SearchFilter.sources)
 }
-inline void FaceRecord::set_allocated_source(std::string* source) {
-  if (source != nullptr) {
-    
-  } else {
-    
-  }
-  source_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), source);
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.source)
+inline void SearchFilter::add_sources(std::string&& value) {
+  sources_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:SearchFilter.sources)
+}
+inline void SearchFilter::add_sources(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  sources_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:SearchFilter.sources)
+}
+inline void SearchFilter::add_sources(const char* value, size_t size) {
+  sources_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:SearchFilter.sources)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+SearchFilter::sources() const {
+  // @@protoc_insertion_point(field_list:SearchFilter.sources)
+  return sources_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+SearchFilter::mutable_sources() {
+  // @@protoc_insertion_point(field_mutable_list:SearchFilter.sources)
+  return &sources_;
 }
 
-// int64 frame = 14;
-inline void FaceRecord::clear_frame() {
-  frame_ = PROTOBUF_LONGLONG(0);
+// float min_collection_date = 3;
+inline void SearchFilter::clear_min_collection_date() {
+  min_collection_date_ = 0;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int64 FaceRecord::frame() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.frame)
-  return frame_;
+inline float SearchFilter::min_collection_date() const {
+  // @@protoc_insertion_point(field_get:SearchFilter.min_collection_date)
+  return min_collection_date_;
 }
-inline void FaceRecord::set_frame(::PROTOBUF_NAMESPACE_ID::int64 value) {
+inline void SearchFilter::set_min_collection_date(float value) {
   
-  frame_ = value;
-  // @@protoc_insertion_point(field_set:FaceRecord.frame)
+  min_collection_date_ = value;
+  // @@protoc_insertion_point(field_set:SearchFilter.min_collection_date)
 }
 
-// string notes = 6;
-inline void FaceRecord::clear_notes() {
-  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// float max_collection_date = 4;
+inline void SearchFilter::clear_max_collection_date() {
+  max_collection_date_ = 0;
 }
-inline const std::string& FaceRecord::notes() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.notes)
-  return notes_.GetNoArena();
+inline float SearchFilter::max_collection_date() const {
+  // @@protoc_insertion_point(field_get:SearchFilter.max_collection_date)
+  return max_collection_date_;
 }
-inline void FaceRecord::set_notes(const std::string& value) {
+inline void SearchFilter::set_max_collection_date(float value) {
   
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceRecord.notes)
+  max_collection_date_ = value;
+  // @@protoc_insertion_point(field_set:SearchFilter.max_collection_date)
 }
-inline void FaceRecord::set_notes(std::string&& value) {
-  
-  notes_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.notes)
+
+// float min_enrollment_date = 5;
+inline void SearchFilter::clear_min_enrollment_date() {
+  min_enrollment_date_ = 0;
 }
-inline void FaceRecord::set_notes(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceRecord.notes)
+inline float SearchFilter::min_enrollment_date() const {
+  // @@protoc_insertion_point(field_get:SearchFilter.min_enrollment_date)
+  return min_enrollment_date_;
 }
-inline void FaceRecord::set_notes(const char* value, size_t size) {
+inline void SearchFilter::set_min_enrollment_date(float value) {
   
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceRecord.notes)
+  min_enrollment_date_ = value;
+  // @@protoc_insertion_point(field_set:SearchFilter.min_enrollment_date)
 }
-inline std::string* FaceRecord::mutable_notes() {
-  
-  // @@protoc_insertion_point(field_mutable:FaceRecord.notes)
-  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+
+// float max_enrollment_date = 6;
+inline void SearchFilter::clear_max_enrollment_date() {
+  max_enrollment_date_ = 0;
 }
-inline std::string* FaceRecord::release_notes() {
-  // @@protoc_insertion_point(field_release:FaceRecord.notes)
-  
-  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline float SearchFilter::max_enrollment_date() const {
+  // @@protoc_insertion_point(field_get:SearchFilter.max_enrollment_date)
+  return max_enrollment_date_;
 }
-inline void FaceRecord::set_allocated_notes(std::string* notes) {
-  if (notes != nullptr) {
-    
-  } else {
-    
-  }
-  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.notes)
+inline void SearchFilter::set_max_enrollment_date(float value) {
+  
+  max_enrollment_date_ = value;
+  // @@protoc_insertion_point(field_set:SearchFilter.max_enrollment_date)
 }
 
-// string gallery_key = 15;
-inline void FaceRecord::clear_gallery_key() {
-  gallery_key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// repeated .AttributeFilter attributes = 7;
+inline int SearchFilter::attributes_size() const {
+  return attributes_.size();
 }
-inline const std::string& FaceRecord::gallery_key() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.gallery_key)
-  return gallery_key_.GetNoArena();
+inline void SearchFilter::clear_attributes() {
+  attributes_.Clear();
 }
-inline void FaceRecord::set_gallery_key(const std::string& value) {
-  
-  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceRecord.gallery_key)
+inline ::AttributeFilter* SearchFilter::mutable_attributes(int index) {
+  // @@protoc_insertion_point(field_mutable:SearchFilter.attributes)
+  return attributes_.Mutable(index);
 }
-inline void FaceRecord::set_gallery_key(std::string&& value) {
-  
-  gallery_key_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceRecord.gallery_key)
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AttributeFilter >*
+SearchFilter::mutable_attributes() {
+  // @@protoc_insertion_point(field_mutable_list:SearchFilter.attributes)
+  return &attributes_;
 }
-inline void FaceRecord::set_gallery_key(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceRecord.gallery_key)
+inline const ::AttributeFilter& SearchFilter::attributes(int index) const {
+  // @@protoc_insertion_point(field_get:SearchFilter.attributes)
+  return attributes_.Get(index);
 }
-inline void FaceRecord::set_gallery_key(const char* value, size_t size) {
-  
-  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceRecord.gallery_key)
+inline ::AttributeFilter* SearchFilter::add_attributes() {
+  // @@protoc_insertion_point(field_add:SearchFilter.attributes)
+  return attributes_.Add();
 }
-inline std::string* FaceRecord::mutable_gallery_key() {
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AttributeFilter >&
+SearchFilter::attributes() const {
+  // @@protoc_insertion_point(field_list:SearchFilter.attributes)
+  return attributes_;
+}
+
+// -------------------------------------------------------------------
+
+// SearchResponse
+
+// .ErrorMessage message = 1;
+inline bool SearchResponse::has_message() const {
+  return this != internal_default_instance() && message_ != nullptr;
+}
+inline void SearchResponse::clear_message() {
+  if (GetArenaNoVirtual() == nullptr && message_ != nullptr) {
+    delete message_;
+  }
+  message_ = nullptr;
+}
+inline const ::ErrorMessage& SearchResponse::message() const {
+  const ::ErrorMessage* p = message_;
+  // @@protoc_insertion_point(field_get:SearchResponse.message)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ErrorMessage*>(
+      &::_ErrorMessage_default_instance_);
+}
+inline ::ErrorMessage* SearchResponse::release_message() {
+  // @@protoc_insertion_point(field_release:SearchResponse.message)
   
-  // @@protoc_insertion_point(field_mutable:FaceRecord.gallery_key)
-  return gallery_key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::ErrorMessage* temp = message_;
+  message_ = nullptr;
+  return temp;
 }
-inline std::string* FaceRecord::release_gallery_key() {
-  // @@protoc_insertion_point(field_release:FaceRecord.gallery_key)
+inline ::ErrorMessage* SearchResponse::mutable_message() {
   
-  return gallery_key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (message_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ErrorMessage>(GetArenaNoVirtual());
+    message_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:SearchResponse.message)
+  return message_;
 }
-inline void FaceRecord::set_allocated_gallery_key(std::string* gallery_key) {
-  if (gallery_key != nullptr) {
+inline void SearchResponse::set_allocated_message(::ErrorMessage* message) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete message_;
+  }
+  if (message) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      message = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, message, submessage_arena);
+    }
     
   } else {
     
   }
-  gallery_key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_key);
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.gallery_key)
+  message_ = message;
+  // @@protoc_insertion_point(field_set_allocated:SearchResponse.message)
 }
 
-// float collection_date = 16;
-inline void FaceRecord::clear_collection_date() {
-  collection_date_ = 0;
-}
-inline float FaceRecord::collection_date() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.collection_date)
-  return collection_date_;
-}
-inline void FaceRecord::set_collection_date(float value) {
-  
-  collection_date_ = value;
-  // @@protoc_insertion_point(field_set:FaceRecord.collection_date)
+// .FaceRecordList probes = 2;
+inline bool SearchResponse::has_probes() const {
+  return this != internal_default_instance() && probes_ != nullptr;
 }
-
-// float enrollment_date = 17;
-inline void FaceRecord::clear_enrollment_date() {
-  enrollment_date_ = 0;
+inline void SearchResponse::clear_probes() {
+  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
+    delete probes_;
+  }
+  probes_ = nullptr;
 }
-inline float FaceRecord::enrollment_date() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.enrollment_date)
-  return enrollment_date_;
+inline const ::FaceRecordList& SearchResponse::probes() const {
+  const ::FaceRecordList* p = probes_;
+  // @@protoc_insertion_point(field_get:SearchResponse.probes)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
 }
-inline void FaceRecord::set_enrollment_date(float value) {
+inline ::FaceRecordList* SearchResponse::release_probes() {
+  // @@protoc_insertion_point(field_release:SearchResponse.probes)
   
-  enrollment_date_ = value;
-  // @@protoc_insertion_point(field_set:FaceRecord.enrollment_date)
-}
-
-// repeated .Attribute metadata = 18;
-inline int FaceRecord::metadata_size() const {
-  return metadata_.size();
-}
-inline void FaceRecord::clear_metadata() {
-  metadata_.Clear();
-}
-inline ::Attribute* FaceRecord::mutable_metadata(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecord.metadata)
-  return metadata_.Mutable(index);
+  ::FaceRecordList* temp = probes_;
+  probes_ = nullptr;
+  return temp;
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-FaceRecord::mutable_metadata() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecord.metadata)
-  return &metadata_;
+inline ::FaceRecordList* SearchResponse::mutable_probes() {
+  
+  if (probes_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    probes_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:SearchResponse.probes)
+  return probes_;
 }
-inline const ::Attribute& FaceRecord::metadata(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecord.metadata)
-  return metadata_.Get(index);
+inline void SearchResponse::set_allocated_probes(::FaceRecordList* probes) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete probes_;
+  }
+  if (probes) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, probes, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  probes_ = probes;
+  // @@protoc_insertion_point(field_set_allocated:SearchResponse.probes)
 }
-inline ::Attribute* FaceRecord::add_metadata() {
-  // @@protoc_insertion_point(field_add:FaceRecord.metadata)
-  return metadata_.Add();
+
+// -------------------------------------------------------------------
+
+// EnrollRequest
+
+// string enroll_gallery = 1;
+inline void EnrollRequest::clear_enroll_gallery() {
+  enroll_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-FaceRecord::metadata() const {
-  // @@protoc_insertion_point(field_list:FaceRecord.metadata)
-  return metadata_;
+inline const std::string& EnrollRequest::enroll_gallery() const {
+  // @@protoc_insertion_point(field_get:EnrollRequest.enroll_gallery)
+  return enroll_gallery_.GetNoArena();
 }
-
-// repeated .AccessRecord access_records = 19;
-inline int FaceRecord::access_records_size() const {
-  return access_records_.size();
+inline void EnrollRequest::set_enroll_gallery(const std::string& value) {
+  
+  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:EnrollRequest.enroll_gallery)
 }
-inline void FaceRecord::clear_access_records() {
-  access_records_.Clear();
+inline void EnrollRequest::set_enroll_gallery(std::string&& value) {
+  
+  enroll_gallery_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:EnrollRequest.enroll_gallery)
 }
-inline ::AccessRecord* FaceRecord::mutable_access_records(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecord.access_records)
-  return access_records_.Mutable(index);
+inline void EnrollRequest::set_enroll_gallery(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:EnrollRequest.enroll_gallery)
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AccessRecord >*
-FaceRecord::mutable_access_records() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecord.access_records)
-  return &access_records_;
+inline void EnrollRequest::set_enroll_gallery(const char* value, size_t size) {
+  
+  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:EnrollRequest.enroll_gallery)
 }
-inline const ::AccessRecord& FaceRecord::access_records(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecord.access_records)
-  return access_records_.Get(index);
+inline std::string* EnrollRequest::mutable_enroll_gallery() {
+  
+  // @@protoc_insertion_point(field_mutable:EnrollRequest.enroll_gallery)
+  return enroll_gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::AccessRecord* FaceRecord::add_access_records() {
-  // @@protoc_insertion_point(field_add:FaceRecord.access_records)
-  return access_records_.Add();
+inline std::string* EnrollRequest::release_enroll_gallery() {
+  // @@protoc_insertion_point(field_release:EnrollRequest.enroll_gallery)
+  
+  return enroll_gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::AccessRecord >&
-FaceRecord::access_records() const {
-  // @@protoc_insertion_point(field_list:FaceRecord.access_records)
-  return access_records_;
+inline void EnrollRequest::set_allocated_enroll_gallery(std::string* enroll_gallery) {
+  if (enroll_gallery != nullptr) {
+    
+  } else {
+    
+  }
+  enroll_gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), enroll_gallery);
+  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.enroll_gallery)
 }
 
-// .Image view = 7;
-inline bool FaceRecord::has_view() const {
-  return this != internal_default_instance() && view_ != nullptr;
+// .FaceRecordList records = 2;
+inline bool EnrollRequest::has_records() const {
+  return this != internal_default_instance() && records_ != nullptr;
 }
-inline const ::Image& FaceRecord::view() const {
-  const ::Image* p = view_;
-  // @@protoc_insertion_point(field_get:FaceRecord.view)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline void EnrollRequest::clear_records() {
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
+  }
+  records_ = nullptr;
 }
-inline ::Image* FaceRecord::release_view() {
-  // @@protoc_insertion_point(field_release:FaceRecord.view)
+inline const ::FaceRecordList& EnrollRequest::records() const {
+  const ::FaceRecordList* p = records_;
+  // @@protoc_insertion_point(field_get:EnrollRequest.records)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
+}
+inline ::FaceRecordList* EnrollRequest::release_records() {
+  // @@protoc_insertion_point(field_release:EnrollRequest.records)
   
-  ::Image* temp = view_;
-  view_ = nullptr;
+  ::FaceRecordList* temp = records_;
+  records_ = nullptr;
   return temp;
 }
-inline ::Image* FaceRecord::mutable_view() {
+inline ::FaceRecordList* EnrollRequest::mutable_records() {
   
-  if (view_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    view_ = p;
+  if (records_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    records_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:FaceRecord.view)
-  return view_;
+  // @@protoc_insertion_point(field_mutable:EnrollRequest.records)
+  return records_;
 }
-inline void FaceRecord::set_allocated_view(::Image* view) {
+inline void EnrollRequest::set_allocated_records(::FaceRecordList* records) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(view_);
+    delete records_;
   }
-  if (view) {
+  if (records) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      view = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, view, submessage_arena);
+      records = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, records, submessage_arena);
     }
     
   } else {
     
   }
-  view_ = view;
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.view)
+  records_ = records;
+  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.records)
 }
 
-// .Image aligned = 9;
-inline bool FaceRecord::has_aligned() const {
-  return this != internal_default_instance() && aligned_ != nullptr;
+// .EnrollOptions enroll_options = 10;
+inline bool EnrollRequest::has_enroll_options() const {
+  return this != internal_default_instance() && enroll_options_ != nullptr;
 }
-inline const ::Image& FaceRecord::aligned() const {
-  const ::Image* p = aligned_;
-  // @@protoc_insertion_point(field_get:FaceRecord.aligned)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline void EnrollRequest::clear_enroll_options() {
+  if (GetArenaNoVirtual() == nullptr && enroll_options_ != nullptr) {
+    delete enroll_options_;
+  }
+  enroll_options_ = nullptr;
 }
-inline ::Image* FaceRecord::release_aligned() {
-  // @@protoc_insertion_point(field_release:FaceRecord.aligned)
+inline const ::EnrollOptions& EnrollRequest::enroll_options() const {
+  const ::EnrollOptions* p = enroll_options_;
+  // @@protoc_insertion_point(field_get:EnrollRequest.enroll_options)
+  return p != nullptr ? *p : *reinterpret_cast<const ::EnrollOptions*>(
+      &::_EnrollOptions_default_instance_);
+}
+inline ::EnrollOptions* EnrollRequest::release_enroll_options() {
+  // @@protoc_insertion_point(field_release:EnrollRequest.enroll_options)
   
-  ::Image* temp = aligned_;
-  aligned_ = nullptr;
+  ::EnrollOptions* temp = enroll_options_;
+  enroll_options_ = nullptr;
   return temp;
 }
-inline ::Image* FaceRecord::mutable_aligned() {
+inline ::EnrollOptions* EnrollRequest::mutable_enroll_options() {
   
-  if (aligned_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    aligned_ = p;
+  if (enroll_options_ == nullptr) {
+    auto* p = CreateMaybeMessage<::EnrollOptions>(GetArenaNoVirtual());
+    enroll_options_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:FaceRecord.aligned)
-  return aligned_;
+  // @@protoc_insertion_point(field_mutable:EnrollRequest.enroll_options)
+  return enroll_options_;
 }
-inline void FaceRecord::set_allocated_aligned(::Image* aligned) {
+inline void EnrollRequest::set_allocated_enroll_options(::EnrollOptions* enroll_options) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(aligned_);
+    delete enroll_options_;
   }
-  if (aligned) {
+  if (enroll_options) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      aligned = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, aligned, submessage_arena);
+      enroll_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, enroll_options, submessage_arena);
     }
     
   } else {
     
   }
-  aligned_ = aligned;
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.aligned)
+  enroll_options_ = enroll_options;
+  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.enroll_options)
 }
 
-// .Detection detection = 2;
-inline bool FaceRecord::has_detection() const {
-  return this != internal_default_instance() && detection_ != nullptr;
+// -------------------------------------------------------------------
+
+// BulkEnrollResponse
+
+// int64 request_count = 1;
+inline void BulkEnrollResponse::clear_request_count() {
+  request_count_ = PROTOBUF_LONGLONG(0);
 }
-inline void FaceRecord::clear_detection() {
-  if (GetArenaNoVirtual() == nullptr && detection_ != nullptr) {
-    delete detection_;
-  }
-  detection_ = nullptr;
+inline ::PROTOBUF_NAMESPACE_ID::int64 BulkEnrollResponse::request_count() const {
+  // @@protoc_insertion_point(field_get:BulkEnrollResponse.request_count)
+  return request_count_;
 }
-inline const ::Detection& FaceRecord::detection() const {
-  const ::Detection* p = detection_;
-  // @@protoc_insertion_point(field_get:FaceRecord.detection)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Detection*>(
-      &::_Detection_default_instance_);
+inline void BulkEnrollResponse::set_request_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  request_count_ = value;
+  // @@protoc_insertion_point(field_set:BulkEnrollResponse.request_count)
 }
-inline ::Detection* FaceRecord::release_detection() {
-  // @@protoc_insertion_point(field_release:FaceRecord.detection)
+
+// int64 enroll_count = 2;
+inline void BulkEnrollResponse::clear_enroll_count() {
+  enroll_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 BulkEnrollResponse::enroll_count() const {
+  // @@protoc_insertion_point(field_get:BulkEnrollResponse.enroll_count)
+  return enroll_count_;
+}
+inline void BulkEnrollResponse::set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  enroll_count_ = value;
+  // @@protoc_insertion_point(field_set:BulkEnrollResponse.enroll_count)
+}
+
+// int64 replace_count = 3;
+inline void BulkEnrollResponse::clear_replace_count() {
+  replace_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 BulkEnrollResponse::replace_count() const {
+  // @@protoc_insertion_point(field_get:BulkEnrollResponse.replace_count)
+  return replace_count_;
+}
+inline void BulkEnrollResponse::set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  replace_count_ = value;
+  // @@protoc_insertion_point(field_set:BulkEnrollResponse.replace_count)
+}
+
+// -------------------------------------------------------------------
+
+// DetectRequest
+
+// .Image image = 1;
+inline bool DetectRequest::has_image() const {
+  return this != internal_default_instance() && image_ != nullptr;
+}
+inline const ::Image& DetectRequest::image() const {
+  const ::Image* p = image_;
+  // @@protoc_insertion_point(field_get:DetectRequest.image)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
+}
+inline ::Image* DetectRequest::release_image() {
+  // @@protoc_insertion_point(field_release:DetectRequest.image)
   
-  ::Detection* temp = detection_;
-  detection_ = nullptr;
+  ::Image* temp = image_;
+  image_ = nullptr;
   return temp;
 }
-inline ::Detection* FaceRecord::mutable_detection() {
+inline ::Image* DetectRequest::mutable_image() {
   
-  if (detection_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Detection>(GetArenaNoVirtual());
-    detection_ = p;
+  if (image_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    image_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:FaceRecord.detection)
-  return detection_;
+  // @@protoc_insertion_point(field_mutable:DetectRequest.image)
+  return image_;
 }
-inline void FaceRecord::set_allocated_detection(::Detection* detection) {
+inline void DetectRequest::set_allocated_image(::Image* image) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete detection_;
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
   }
-  if (detection) {
+  if (image) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      detection = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, detection, submessage_arena);
+      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, image, submessage_arena);
     }
     
   } else {
     
   }
-  detection_ = detection;
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.detection)
+  image_ = image;
+  // @@protoc_insertion_point(field_set_allocated:DetectRequest.image)
 }
 
-// repeated .Landmark landmarks = 8;
-inline int FaceRecord::landmarks_size() const {
-  return landmarks_.size();
+// string source = 2;
+inline void DetectRequest::clear_source() {
+  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceRecord::clear_landmarks() {
-  landmarks_.Clear();
+inline const std::string& DetectRequest::source() const {
+  // @@protoc_insertion_point(field_get:DetectRequest.source)
+  return source_.GetNoArena();
 }
-inline ::Landmark* FaceRecord::mutable_landmarks(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecord.landmarks)
-  return landmarks_.Mutable(index);
+inline void DetectRequest::set_source(const std::string& value) {
+  
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:DetectRequest.source)
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Landmark >*
-FaceRecord::mutable_landmarks() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecord.landmarks)
-  return &landmarks_;
+inline void DetectRequest::set_source(std::string&& value) {
+  
+  source_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.source)
 }
-inline const ::Landmark& FaceRecord::landmarks(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecord.landmarks)
-  return landmarks_.Get(index);
+inline void DetectRequest::set_source(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:DetectRequest.source)
 }
-inline ::Landmark* FaceRecord::add_landmarks() {
-  // @@protoc_insertion_point(field_add:FaceRecord.landmarks)
-  return landmarks_.Add();
+inline void DetectRequest::set_source(const char* value, size_t size) {
+  
+  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:DetectRequest.source)
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Landmark >&
-FaceRecord::landmarks() const {
-  // @@protoc_insertion_point(field_list:FaceRecord.landmarks)
-  return landmarks_;
+inline std::string* DetectRequest::mutable_source() {
+  
+  // @@protoc_insertion_point(field_mutable:DetectRequest.source)
+  return source_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* DetectRequest::release_source() {
+  // @@protoc_insertion_point(field_release:DetectRequest.source)
+  
+  return source_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void DetectRequest::set_allocated_source(std::string* source) {
+  if (source != nullptr) {
+    
+  } else {
+    
+  }
+  source_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), source);
+  // @@protoc_insertion_point(field_set_allocated:DetectRequest.source)
 }
 
-// repeated .Attribute attributes = 10;
-inline int FaceRecord::attributes_size() const {
-  return attributes_.size();
+// int64 frame = 3;
+inline void DetectRequest::clear_frame() {
+  frame_ = PROTOBUF_LONGLONG(0);
 }
-inline void FaceRecord::clear_attributes() {
-  attributes_.Clear();
+inline ::PROTOBUF_NAMESPACE_ID::int64 DetectRequest::frame() const {
+  // @@protoc_insertion_point(field_get:DetectRequest.frame)
+  return frame_;
 }
-inline ::Attribute* FaceRecord::mutable_attributes(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecord.attributes)
-  return attributes_.Mutable(index);
+inline void DetectRequest::set_frame(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  frame_ = value;
+  // @@protoc_insertion_point(field_set:DetectRequest.frame)
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-FaceRecord::mutable_attributes() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecord.attributes)
-  return &attributes_;
+
+// string subject_id = 4;
+inline void DetectRequest::clear_subject_id() {
+  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const ::Attribute& FaceRecord::attributes(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecord.attributes)
-  return attributes_.Get(index);
+inline const std::string& DetectRequest::subject_id() const {
+  // @@protoc_insertion_point(field_get:DetectRequest.subject_id)
+  return subject_id_.GetNoArena();
 }
-inline ::Attribute* FaceRecord::add_attributes() {
-  // @@protoc_insertion_point(field_add:FaceRecord.attributes)
-  return attributes_.Add();
+inline void DetectRequest::set_subject_id(const std::string& value) {
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:DetectRequest.subject_id)
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-FaceRecord::attributes() const {
-  // @@protoc_insertion_point(field_list:FaceRecord.attributes)
-  return attributes_;
+inline void DetectRequest::set_subject_id(std::string&& value) {
+  
+  subject_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.subject_id)
+}
+inline void DetectRequest::set_subject_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:DetectRequest.subject_id)
+}
+inline void DetectRequest::set_subject_id(const char* value, size_t size) {
+  
+  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:DetectRequest.subject_id)
+}
+inline std::string* DetectRequest::mutable_subject_id() {
+  
+  // @@protoc_insertion_point(field_mutable:DetectRequest.subject_id)
+  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* DetectRequest::release_subject_id() {
+  // @@protoc_insertion_point(field_release:DetectRequest.subject_id)
+  
+  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void DetectRequest::set_allocated_subject_id(std::string* subject_id) {
+  if (subject_id != nullptr) {
+    
+  } else {
+    
+  }
+  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
+  // @@protoc_insertion_point(field_set_allocated:DetectRequest.subject_id)
 }
 
-// repeated .Attribute internal_data = 11;
-inline int FaceRecord::internal_data_size() const {
-  return internal_data_.size();
+// string subject_name = 5;
+inline void DetectRequest::clear_subject_name() {
+  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceRecord::clear_internal_data() {
-  internal_data_.Clear();
+inline const std::string& DetectRequest::subject_name() const {
+  // @@protoc_insertion_point(field_get:DetectRequest.subject_name)
+  return subject_name_.GetNoArena();
 }
-inline ::Attribute* FaceRecord::mutable_internal_data(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecord.internal_data)
-  return internal_data_.Mutable(index);
+inline void DetectRequest::set_subject_name(const std::string& value) {
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:DetectRequest.subject_name)
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >*
-FaceRecord::mutable_internal_data() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecord.internal_data)
-  return &internal_data_;
+inline void DetectRequest::set_subject_name(std::string&& value) {
+  
+  subject_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.subject_name)
 }
-inline const ::Attribute& FaceRecord::internal_data(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecord.internal_data)
-  return internal_data_.Get(index);
+inline void DetectRequest::set_subject_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:DetectRequest.subject_name)
 }
-inline ::Attribute* FaceRecord::add_internal_data() {
-  // @@protoc_insertion_point(field_add:FaceRecord.internal_data)
-  return internal_data_.Add();
+inline void DetectRequest::set_subject_name(const char* value, size_t size) {
+  
+  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:DetectRequest.subject_name)
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::Attribute >&
-FaceRecord::internal_data() const {
-  // @@protoc_insertion_point(field_list:FaceRecord.internal_data)
-  return internal_data_;
+inline std::string* DetectRequest::mutable_subject_name() {
+  
+  // @@protoc_insertion_point(field_mutable:DetectRequest.subject_name)
+  return subject_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-
-// .FaceTemplate template = 3;
-inline bool FaceRecord::has_template_() const {
-  return this != internal_default_instance() && template__ != nullptr;
+inline std::string* DetectRequest::release_subject_name() {
+  // @@protoc_insertion_point(field_release:DetectRequest.subject_name)
+  
+  return subject_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceRecord::clear_template_() {
-  if (GetArenaNoVirtual() == nullptr && template__ != nullptr) {
-    delete template__;
+inline void DetectRequest::set_allocated_subject_name(std::string* subject_name) {
+  if (subject_name != nullptr) {
+    
+  } else {
+    
   }
-  template__ = nullptr;
+  subject_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_name);
+  // @@protoc_insertion_point(field_set_allocated:DetectRequest.subject_name)
 }
-inline const ::FaceTemplate& FaceRecord::template_() const {
-  const ::FaceTemplate* p = template__;
-  // @@protoc_insertion_point(field_get:FaceRecord.template)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceTemplate*>(
-      &::_FaceTemplate_default_instance_);
+
+// .DetectionOptions detect_options = 8;
+inline bool DetectRequest::has_detect_options() const {
+  return this != internal_default_instance() && detect_options_ != nullptr;
+}
+inline void DetectRequest::clear_detect_options() {
+  if (GetArenaNoVirtual() == nullptr && detect_options_ != nullptr) {
+    delete detect_options_;
+  }
+  detect_options_ = nullptr;
 }
-inline ::FaceTemplate* FaceRecord::release_template_() {
-  // @@protoc_insertion_point(field_release:FaceRecord.template)
+inline const ::DetectionOptions& DetectRequest::detect_options() const {
+  const ::DetectionOptions* p = detect_options_;
+  // @@protoc_insertion_point(field_get:DetectRequest.detect_options)
+  return p != nullptr ? *p : *reinterpret_cast<const ::DetectionOptions*>(
+      &::_DetectionOptions_default_instance_);
+}
+inline ::DetectionOptions* DetectRequest::release_detect_options() {
+  // @@protoc_insertion_point(field_release:DetectRequest.detect_options)
   
-  ::FaceTemplate* temp = template__;
-  template__ = nullptr;
+  ::DetectionOptions* temp = detect_options_;
+  detect_options_ = nullptr;
   return temp;
 }
-inline ::FaceTemplate* FaceRecord::mutable_template_() {
+inline ::DetectionOptions* DetectRequest::mutable_detect_options() {
   
-  if (template__ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceTemplate>(GetArenaNoVirtual());
-    template__ = p;
+  if (detect_options_ == nullptr) {
+    auto* p = CreateMaybeMessage<::DetectionOptions>(GetArenaNoVirtual());
+    detect_options_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:FaceRecord.template)
-  return template__;
+  // @@protoc_insertion_point(field_mutable:DetectRequest.detect_options)
+  return detect_options_;
 }
-inline void FaceRecord::set_allocated_template_(::FaceTemplate* template_) {
+inline void DetectRequest::set_allocated_detect_options(::DetectionOptions* detect_options) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete template__;
+    delete detect_options_;
   }
-  if (template_) {
+  if (detect_options) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      template_ = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, template_, submessage_arena);
+      detect_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, detect_options, submessage_arena);
     }
     
   } else {
     
   }
-  template__ = template_;
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.template)
+  detect_options_ = detect_options;
+  // @@protoc_insertion_point(field_set_allocated:DetectRequest.detect_options)
 }
 
-// float score = 12;
-inline void FaceRecord::clear_score() {
-  score_ = 0;
+// -------------------------------------------------------------------
+
+// ExtractRequest
+
+// .Image image = 1;
+inline bool ExtractRequest::has_image() const {
+  return this != internal_default_instance() && image_ != nullptr;
 }
-inline float FaceRecord::score() const {
-  // @@protoc_insertion_point(field_get:FaceRecord.score)
-  return score_;
+inline const ::Image& ExtractRequest::image() const {
+  const ::Image* p = image_;
+  // @@protoc_insertion_point(field_get:ExtractRequest.image)
+  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
+      &::_Image_default_instance_);
 }
-inline void FaceRecord::set_score(float value) {
+inline ::Image* ExtractRequest::release_image() {
+  // @@protoc_insertion_point(field_release:ExtractRequest.image)
   
-  score_ = value;
-  // @@protoc_insertion_point(field_set:FaceRecord.score)
+  ::Image* temp = image_;
+  image_ = nullptr;
+  return temp;
+}
+inline ::Image* ExtractRequest::mutable_image() {
+  
+  if (image_ == nullptr) {
+    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
+    image_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ExtractRequest.image)
+  return image_;
+}
+inline void ExtractRequest::set_allocated_image(::Image* image) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
+  }
+  if (image) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, image, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  image_ = image;
+  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.image)
 }
 
-// .FaceRecordList search_results = 13;
-inline bool FaceRecord::has_search_results() const {
-  return this != internal_default_instance() && search_results_ != nullptr;
+// .FaceRecordList records = 4;
+inline bool ExtractRequest::has_records() const {
+  return this != internal_default_instance() && records_ != nullptr;
 }
-inline void FaceRecord::clear_search_results() {
-  if (GetArenaNoVirtual() == nullptr && search_results_ != nullptr) {
-    delete search_results_;
+inline void ExtractRequest::clear_records() {
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
   }
-  search_results_ = nullptr;
+  records_ = nullptr;
 }
-inline const ::FaceRecordList& FaceRecord::search_results() const {
-  const ::FaceRecordList* p = search_results_;
-  // @@protoc_insertion_point(field_get:FaceRecord.search_results)
+inline const ::FaceRecordList& ExtractRequest::records() const {
+  const ::FaceRecordList* p = records_;
+  // @@protoc_insertion_point(field_get:ExtractRequest.records)
   return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
       &::_FaceRecordList_default_instance_);
 }
-inline ::FaceRecordList* FaceRecord::release_search_results() {
-  // @@protoc_insertion_point(field_release:FaceRecord.search_results)
+inline ::FaceRecordList* ExtractRequest::release_records() {
+  // @@protoc_insertion_point(field_release:ExtractRequest.records)
   
-  ::FaceRecordList* temp = search_results_;
-  search_results_ = nullptr;
+  ::FaceRecordList* temp = records_;
+  records_ = nullptr;
   return temp;
 }
-inline ::FaceRecordList* FaceRecord::mutable_search_results() {
+inline ::FaceRecordList* ExtractRequest::mutable_records() {
   
-  if (search_results_ == nullptr) {
+  if (records_ == nullptr) {
     auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    search_results_ = p;
+    records_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:FaceRecord.search_results)
-  return search_results_;
+  // @@protoc_insertion_point(field_mutable:ExtractRequest.records)
+  return records_;
 }
-inline void FaceRecord::set_allocated_search_results(::FaceRecordList* search_results) {
+inline void ExtractRequest::set_allocated_records(::FaceRecordList* records) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete search_results_;
+    delete records_;
   }
-  if (search_results) {
+  if (records) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      search_results = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, search_results, submessage_arena);
+      records = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, records, submessage_arena);
     }
     
   } else {
     
   }
-  search_results_ = search_results;
-  // @@protoc_insertion_point(field_set_allocated:FaceRecord.search_results)
+  records_ = records;
+  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.records)
 }
 
-// -------------------------------------------------------------------
-
-// FaceRecordList
-
-// repeated .FaceRecord face_records = 1;
-inline int FaceRecordList::face_records_size() const {
-  return face_records_.size();
-}
-inline void FaceRecordList::clear_face_records() {
-  face_records_.Clear();
+// .ExtractOptions extract_options = 9;
+inline bool ExtractRequest::has_extract_options() const {
+  return this != internal_default_instance() && extract_options_ != nullptr;
 }
-inline ::FaceRecord* FaceRecordList::mutable_face_records(int index) {
-  // @@protoc_insertion_point(field_mutable:FaceRecordList.face_records)
-  return face_records_.Mutable(index);
+inline void ExtractRequest::clear_extract_options() {
+  if (GetArenaNoVirtual() == nullptr && extract_options_ != nullptr) {
+    delete extract_options_;
+  }
+  extract_options_ = nullptr;
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
-FaceRecordList::mutable_face_records() {
-  // @@protoc_insertion_point(field_mutable_list:FaceRecordList.face_records)
-  return &face_records_;
+inline const ::ExtractOptions& ExtractRequest::extract_options() const {
+  const ::ExtractOptions* p = extract_options_;
+  // @@protoc_insertion_point(field_get:ExtractRequest.extract_options)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractOptions*>(
+      &::_ExtractOptions_default_instance_);
 }
-inline const ::FaceRecord& FaceRecordList::face_records(int index) const {
-  // @@protoc_insertion_point(field_get:FaceRecordList.face_records)
-  return face_records_.Get(index);
+inline ::ExtractOptions* ExtractRequest::release_extract_options() {
+  // @@protoc_insertion_point(field_release:ExtractRequest.extract_options)
+  
+  ::ExtractOptions* temp = extract_options_;
+  extract_options_ = nullptr;
+  return temp;
 }
-inline ::FaceRecord* FaceRecordList::add_face_records() {
-  // @@protoc_insertion_point(field_add:FaceRecordList.face_records)
-  return face_records_.Add();
+inline ::ExtractOptions* ExtractRequest::mutable_extract_options() {
+  
+  if (extract_options_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ExtractOptions>(GetArenaNoVirtual());
+    extract_options_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ExtractRequest.extract_options)
+  return extract_options_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
-FaceRecordList::face_records() const {
-  // @@protoc_insertion_point(field_list:FaceRecordList.face_records)
-  return face_records_;
+inline void ExtractRequest::set_allocated_extract_options(::ExtractOptions* extract_options) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete extract_options_;
+  }
+  if (extract_options) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      extract_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, extract_options, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  extract_options_ = extract_options;
+  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.extract_options)
 }
 
 // -------------------------------------------------------------------
 
-// VerificationRequest
+// ScoreRequest
 
-// string gallery = 1;
-inline void VerificationRequest::clear_gallery() {
-  gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& VerificationRequest::gallery() const {
-  // @@protoc_insertion_point(field_get:VerificationRequest.gallery)
-  return gallery_.GetNoArena();
-}
-inline void VerificationRequest::set_gallery(const std::string& value) {
-  
-  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:VerificationRequest.gallery)
-}
-inline void VerificationRequest::set_gallery(std::string&& value) {
-  
-  gallery_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:VerificationRequest.gallery)
-}
-inline void VerificationRequest::set_gallery(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:VerificationRequest.gallery)
+// .FaceRecordList face_probes = 1;
+inline bool ScoreRequest::has_face_probes() const {
+  return this != internal_default_instance() && face_probes_ != nullptr;
 }
-inline void VerificationRequest::set_gallery(const char* value, size_t size) {
-  
-  gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:VerificationRequest.gallery)
+inline void ScoreRequest::clear_face_probes() {
+  if (GetArenaNoVirtual() == nullptr && face_probes_ != nullptr) {
+    delete face_probes_;
+  }
+  face_probes_ = nullptr;
 }
-inline std::string* VerificationRequest::mutable_gallery() {
+inline const ::FaceRecordList& ScoreRequest::face_probes() const {
+  const ::FaceRecordList* p = face_probes_;
+  // @@protoc_insertion_point(field_get:ScoreRequest.face_probes)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
+}
+inline ::FaceRecordList* ScoreRequest::release_face_probes() {
+  // @@protoc_insertion_point(field_release:ScoreRequest.face_probes)
   
-  // @@protoc_insertion_point(field_mutable:VerificationRequest.gallery)
-  return gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::FaceRecordList* temp = face_probes_;
+  face_probes_ = nullptr;
+  return temp;
 }
-inline std::string* VerificationRequest::release_gallery() {
-  // @@protoc_insertion_point(field_release:VerificationRequest.gallery)
+inline ::FaceRecordList* ScoreRequest::mutable_face_probes() {
   
-  return gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (face_probes_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    face_probes_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ScoreRequest.face_probes)
+  return face_probes_;
 }
-inline void VerificationRequest::set_allocated_gallery(std::string* gallery) {
-  if (gallery != nullptr) {
+inline void ScoreRequest::set_allocated_face_probes(::FaceRecordList* face_probes) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete face_probes_;
+  }
+  if (face_probes) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      face_probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, face_probes, submessage_arena);
+    }
     
   } else {
     
   }
-  gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery);
-  // @@protoc_insertion_point(field_set_allocated:VerificationRequest.gallery)
+  face_probes_ = face_probes;
+  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.face_probes)
 }
 
-// string subject_id = 2;
-inline void VerificationRequest::clear_subject_id() {
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& VerificationRequest::subject_id() const {
-  // @@protoc_insertion_point(field_get:VerificationRequest.subject_id)
-  return subject_id_.GetNoArena();
-}
-inline void VerificationRequest::set_subject_id(const std::string& value) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:VerificationRequest.subject_id)
-}
-inline void VerificationRequest::set_subject_id(std::string&& value) {
-  
-  subject_id_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:VerificationRequest.subject_id)
+// .FaceRecordList face_gallery = 2;
+inline bool ScoreRequest::has_face_gallery() const {
+  return this != internal_default_instance() && face_gallery_ != nullptr;
 }
-inline void VerificationRequest::set_subject_id(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:VerificationRequest.subject_id)
+inline void ScoreRequest::clear_face_gallery() {
+  if (GetArenaNoVirtual() == nullptr && face_gallery_ != nullptr) {
+    delete face_gallery_;
+  }
+  face_gallery_ = nullptr;
 }
-inline void VerificationRequest::set_subject_id(const char* value, size_t size) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:VerificationRequest.subject_id)
+inline const ::FaceRecordList& ScoreRequest::face_gallery() const {
+  const ::FaceRecordList* p = face_gallery_;
+  // @@protoc_insertion_point(field_get:ScoreRequest.face_gallery)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
 }
-inline std::string* VerificationRequest::mutable_subject_id() {
+inline ::FaceRecordList* ScoreRequest::release_face_gallery() {
+  // @@protoc_insertion_point(field_release:ScoreRequest.face_gallery)
   
-  // @@protoc_insertion_point(field_mutable:VerificationRequest.subject_id)
-  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::FaceRecordList* temp = face_gallery_;
+  face_gallery_ = nullptr;
+  return temp;
 }
-inline std::string* VerificationRequest::release_subject_id() {
-  // @@protoc_insertion_point(field_release:VerificationRequest.subject_id)
+inline ::FaceRecordList* ScoreRequest::mutable_face_gallery() {
   
-  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (face_gallery_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    face_gallery_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ScoreRequest.face_gallery)
+  return face_gallery_;
 }
-inline void VerificationRequest::set_allocated_subject_id(std::string* subject_id) {
-  if (subject_id != nullptr) {
+inline void ScoreRequest::set_allocated_face_gallery(::FaceRecordList* face_gallery) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete face_gallery_;
+  }
+  if (face_gallery) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      face_gallery = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, face_gallery, submessage_arena);
+    }
     
   } else {
     
   }
-  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
-  // @@protoc_insertion_point(field_set_allocated:VerificationRequest.subject_id)
+  face_gallery_ = face_gallery;
+  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.face_gallery)
 }
 
-// repeated .FaceRecord face_record = 3;
-inline int VerificationRequest::face_record_size() const {
-  return face_record_.size();
-}
-inline void VerificationRequest::clear_face_record() {
-  face_record_.Clear();
-}
-inline ::FaceRecord* VerificationRequest::mutable_face_record(int index) {
-  // @@protoc_insertion_point(field_mutable:VerificationRequest.face_record)
-  return face_record_.Mutable(index);
-}
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
-VerificationRequest::mutable_face_record() {
-  // @@protoc_insertion_point(field_mutable_list:VerificationRequest.face_record)
-  return &face_record_;
-}
-inline const ::FaceRecord& VerificationRequest::face_record(int index) const {
-  // @@protoc_insertion_point(field_get:VerificationRequest.face_record)
-  return face_record_.Get(index);
-}
-inline ::FaceRecord* VerificationRequest::add_face_record() {
-  // @@protoc_insertion_point(field_add:VerificationRequest.face_record)
-  return face_record_.Add();
-}
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
-VerificationRequest::face_record() const {
-  // @@protoc_insertion_point(field_list:VerificationRequest.face_record)
-  return face_record_;
+// .TemplateList template_probes = 3;
+inline bool ScoreRequest::has_template_probes() const {
+  return this != internal_default_instance() && template_probes_ != nullptr;
 }
-
-// -------------------------------------------------------------------
-
-// VerificationResponse
-
-// int32 error_code = 4;
-inline void VerificationResponse::clear_error_code() {
-  error_code_ = 0;
+inline void ScoreRequest::clear_template_probes() {
+  if (GetArenaNoVirtual() == nullptr && template_probes_ != nullptr) {
+    delete template_probes_;
+  }
+  template_probes_ = nullptr;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 VerificationResponse::error_code() const {
-  // @@protoc_insertion_point(field_get:VerificationResponse.error_code)
-  return error_code_;
+inline const ::TemplateList& ScoreRequest::template_probes() const {
+  const ::TemplateList* p = template_probes_;
+  // @@protoc_insertion_point(field_get:ScoreRequest.template_probes)
+  return p != nullptr ? *p : *reinterpret_cast<const ::TemplateList*>(
+      &::_TemplateList_default_instance_);
 }
-inline void VerificationResponse::set_error_code(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline ::TemplateList* ScoreRequest::release_template_probes() {
+  // @@protoc_insertion_point(field_release:ScoreRequest.template_probes)
   
-  error_code_ = value;
-  // @@protoc_insertion_point(field_set:VerificationResponse.error_code)
-}
-
-// string error_message = 5;
-inline void VerificationResponse::clear_error_message() {
-  error_message_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& VerificationResponse::error_message() const {
-  // @@protoc_insertion_point(field_get:VerificationResponse.error_message)
-  return error_message_.GetNoArena();
+  ::TemplateList* temp = template_probes_;
+  template_probes_ = nullptr;
+  return temp;
 }
-inline void VerificationResponse::set_error_message(const std::string& value) {
+inline ::TemplateList* ScoreRequest::mutable_template_probes() {
   
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:VerificationResponse.error_message)
+  if (template_probes_ == nullptr) {
+    auto* p = CreateMaybeMessage<::TemplateList>(GetArenaNoVirtual());
+    template_probes_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ScoreRequest.template_probes)
+  return template_probes_;
 }
-inline void VerificationResponse::set_error_message(std::string&& value) {
-  
-  error_message_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:VerificationResponse.error_message)
+inline void ScoreRequest::set_allocated_template_probes(::TemplateList* template_probes) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete template_probes_;
+  }
+  if (template_probes) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      template_probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, template_probes, submessage_arena);
+    }
+    
+  } else {
+    
+  }
+  template_probes_ = template_probes;
+  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.template_probes)
 }
-inline void VerificationResponse::set_error_message(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:VerificationResponse.error_message)
+
+// .TemplateList template_gallery = 4;
+inline bool ScoreRequest::has_template_gallery() const {
+  return this != internal_default_instance() && template_gallery_ != nullptr;
 }
-inline void VerificationResponse::set_error_message(const char* value, size_t size) {
-  
-  error_message_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:VerificationResponse.error_message)
+inline void ScoreRequest::clear_template_gallery() {
+  if (GetArenaNoVirtual() == nullptr && template_gallery_ != nullptr) {
+    delete template_gallery_;
+  }
+  template_gallery_ = nullptr;
 }
-inline std::string* VerificationResponse::mutable_error_message() {
-  
-  // @@protoc_insertion_point(field_mutable:VerificationResponse.error_message)
-  return error_message_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+inline const ::TemplateList& ScoreRequest::template_gallery() const {
+  const ::TemplateList* p = template_gallery_;
+  // @@protoc_insertion_point(field_get:ScoreRequest.template_gallery)
+  return p != nullptr ? *p : *reinterpret_cast<const ::TemplateList*>(
+      &::_TemplateList_default_instance_);
 }
-inline std::string* VerificationResponse::release_error_message() {
-  // @@protoc_insertion_point(field_release:VerificationResponse.error_message)
+inline ::TemplateList* ScoreRequest::release_template_gallery() {
+  // @@protoc_insertion_point(field_release:ScoreRequest.template_gallery)
+  
+  ::TemplateList* temp = template_gallery_;
+  template_gallery_ = nullptr;
+  return temp;
+}
+inline ::TemplateList* ScoreRequest::mutable_template_gallery() {
   
-  return error_message_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (template_gallery_ == nullptr) {
+    auto* p = CreateMaybeMessage<::TemplateList>(GetArenaNoVirtual());
+    template_gallery_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:ScoreRequest.template_gallery)
+  return template_gallery_;
 }
-inline void VerificationResponse::set_allocated_error_message(std::string* error_message) {
-  if (error_message != nullptr) {
+inline void ScoreRequest::set_allocated_template_gallery(::TemplateList* template_gallery) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete template_gallery_;
+  }
+  if (template_gallery) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      template_gallery = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, template_gallery, submessage_arena);
+    }
     
   } else {
     
   }
-  error_message_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), error_message);
-  // @@protoc_insertion_point(field_set_allocated:VerificationResponse.error_message)
+  template_gallery_ = template_gallery;
+  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.template_gallery)
 }
 
-// bool success = 1;
-inline void VerificationResponse::clear_success() {
-  success_ = false;
+// -------------------------------------------------------------------
+
+// ScoreBlock
+
+// int64 probe_start = 1;
+inline void ScoreBlock::clear_probe_start() {
+  probe_start_ = PROTOBUF_LONGLONG(0);
 }
-inline bool VerificationResponse::success() const {
-  // @@protoc_insertion_point(field_get:VerificationResponse.success)
-  return success_;
+inline ::PROTOBUF_NAMESPACE_ID::int64 ScoreBlock::probe_start() const {
+  // @@protoc_insertion_point(field_get:ScoreBlock.probe_start)
+  return probe_start_;
 }
-inline void VerificationResponse::set_success(bool value) {
+inline void ScoreBlock::set_probe_start(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  success_ = value;
-  // @@protoc_insertion_point(field_set:VerificationResponse.success)
+  probe_start_ = value;
+  // @@protoc_insertion_point(field_set:ScoreBlock.probe_start)
 }
 
-// float confidence = 2;
-inline void VerificationResponse::clear_confidence() {
-  confidence_ = 0;
+// int64 gallery_start = 2;
+inline void ScoreBlock::clear_gallery_start() {
+  gallery_start_ = PROTOBUF_LONGLONG(0);
 }
-inline float VerificationResponse::confidence() const {
-  // @@protoc_insertion_point(field_get:VerificationResponse.confidence)
-  return confidence_;
+inline ::PROTOBUF_NAMESPACE_ID::int64 ScoreBlock::gallery_start() const {
+  // @@protoc_insertion_point(field_get:ScoreBlock.gallery_start)
+  return gallery_start_;
 }
-inline void VerificationResponse::set_confidence(float value) {
+inline void ScoreBlock::set_gallery_start(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  confidence_ = value;
-  // @@protoc_insertion_point(field_set:VerificationResponse.confidence)
+  gallery_start_ = value;
+  // @@protoc_insertion_point(field_set:ScoreBlock.gallery_start)
 }
 
-// repeated .FaceRecord matches = 3;
-inline int VerificationResponse::matches_size() const {
-  return matches_.size();
-}
-inline void VerificationResponse::clear_matches() {
-  matches_.Clear();
+// int32 probe_count = 3;
+inline void ScoreBlock::clear_probe_count() {
+  probe_count_ = 0;
 }
-inline ::FaceRecord* VerificationResponse::mutable_matches(int index) {
-  // @@protoc_insertion_point(field_mutable:VerificationResponse.matches)
-  return matches_.Mutable(index);
+inline ::PROTOBUF_NAMESPACE_ID::int32 ScoreBlock::probe_count() const {
+  // @@protoc_insertion_point(field_get:ScoreBlock.probe_count)
+  return probe_count_;
 }
-inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >*
-VerificationResponse::mutable_matches() {
-  // @@protoc_insertion_point(field_mutable_list:VerificationResponse.matches)
-  return &matches_;
+inline void ScoreBlock::set_probe_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  probe_count_ = value;
+  // @@protoc_insertion_point(field_set:ScoreBlock.probe_count)
 }
-inline const ::FaceRecord& VerificationResponse::matches(int index) const {
-  // @@protoc_insertion_point(field_get:VerificationResponse.matches)
-  return matches_.Get(index);
+
+// int32 gallery_count = 4;
+inline void ScoreBlock::clear_gallery_count() {
+  gallery_count_ = 0;
 }
-inline ::FaceRecord* VerificationResponse::add_matches() {
-  // @@protoc_insertion_point(field_add:VerificationResponse.matches)
-  return matches_.Add();
+inline ::PROTOBUF_NAMESPACE_ID::int32 ScoreBlock::gallery_count() const {
+  // @@protoc_insertion_point(field_get:ScoreBlock.gallery_count)
+  return gallery_count_;
 }
-inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::FaceRecord >&
-VerificationResponse::matches() const {
-  // @@protoc_insertion_point(field_list:VerificationResponse.matches)
-  return matches_;
+inline void ScoreBlock::set_gallery_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  gallery_count_ = value;
+  // @@protoc_insertion_point(field_set:ScoreBlock.gallery_count)
 }
 
-// -------------------------------------------------------------------
-
-// SearchRequest
-
-// string search_gallery = 1;
-inline void SearchRequest::clear_search_gallery() {
-  search_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// bytes scores = 5;
+inline void ScoreBlock::clear_scores() {
+  scores_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& SearchRequest::search_gallery() const {
-  // @@protoc_insertion_point(field_get:SearchRequest.search_gallery)
-  return search_gallery_.GetNoArena();
+inline const std::string& ScoreBlock::scores() const {
+  // @@protoc_insertion_point(field_get:ScoreBlock.scores)
+  return scores_.GetNoArena();
 }
-inline void SearchRequest::set_search_gallery(const std::string& value) {
+inline void ScoreBlock::set_scores(const std::string& value) {
   
-  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:SearchRequest.search_gallery)
+  scores_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:ScoreBlock.scores)
 }
-inline void SearchRequest::set_search_gallery(std::string&& value) {
+inline void ScoreBlock::set_scores(std::string&& value) {
   
-  search_gallery_.SetNoArena(
+  scores_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:SearchRequest.search_gallery)
+  // @@protoc_insertion_point(field_set_rvalue:ScoreBlock.scores)
 }
-inline void SearchRequest::set_search_gallery(const char* value) {
+inline void ScoreBlock::set_scores(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:SearchRequest.search_gallery)
+  scores_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:ScoreBlock.scores)
 }
-inline void SearchRequest::set_search_gallery(const char* value, size_t size) {
+inline void ScoreBlock::set_scores(const void* value, size_t size) {
   
-  search_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  scores_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:SearchRequest.search_gallery)
+  // @@protoc_insertion_point(field_set_pointer:ScoreBlock.scores)
 }
-inline std::string* SearchRequest::mutable_search_gallery() {
+inline std::string* ScoreBlock::mutable_scores() {
   
-  // @@protoc_insertion_point(field_mutable:SearchRequest.search_gallery)
-  return search_gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:ScoreBlock.scores)
+  return scores_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* SearchRequest::release_search_gallery() {
-  // @@protoc_insertion_point(field_release:SearchRequest.search_gallery)
+inline std::string* ScoreBlock::release_scores() {
+  // @@protoc_insertion_point(field_release:ScoreBlock.scores)
   
-  return search_gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return scores_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void SearchRequest::set_allocated_search_gallery(std::string* search_gallery) {
-  if (search_gallery != nullptr) {
+inline void ScoreBlock::set_allocated_scores(std::string* scores) {
+  if (scores != nullptr) {
     
   } else {
     
   }
-  search_gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), search_gallery);
-  // @@protoc_insertion_point(field_set_allocated:SearchRequest.search_gallery)
+  scores_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), scores);
+  // @@protoc_insertion_point(field_set_allocated:ScoreBlock.scores)
 }
 
-// .FaceRecordList probes = 3;
-inline bool SearchRequest::has_probes() const {
-  return this != internal_default_instance() && probes_ != nullptr;
+// -------------------------------------------------------------------
+
+// MatchDistributionRequest
+
+// string gallery_name = 1;
+inline void MatchDistributionRequest::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void SearchRequest::clear_probes() {
-  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
-    delete probes_;
-  }
-  probes_ = nullptr;
+inline const std::string& MatchDistributionRequest::gallery_name() const {
+  // @@protoc_insertion_point(field_get:MatchDistributionRequest.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline const ::FaceRecordList& SearchRequest::probes() const {
-  const ::FaceRecordList* p = probes_;
-  // @@protoc_insertion_point(field_get:SearchRequest.probes)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline void MatchDistributionRequest::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:MatchDistributionRequest.gallery_name)
 }
-inline ::FaceRecordList* SearchRequest::release_probes() {
-  // @@protoc_insertion_point(field_release:SearchRequest.probes)
+inline void MatchDistributionRequest::set_gallery_name(std::string&& value) {
   
-  ::FaceRecordList* temp = probes_;
-  probes_ = nullptr;
-  return temp;
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:MatchDistributionRequest.gallery_name)
 }
-inline ::FaceRecordList* SearchRequest::mutable_probes() {
+inline void MatchDistributionRequest::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (probes_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    probes_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:SearchRequest.probes)
-  return probes_;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:MatchDistributionRequest.gallery_name)
 }
-inline void SearchRequest::set_allocated_probes(::FaceRecordList* probes) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete probes_;
-  }
-  if (probes) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, probes, submessage_arena);
-    }
+inline void MatchDistributionRequest::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:MatchDistributionRequest.gallery_name)
+}
+inline std::string* MatchDistributionRequest::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:MatchDistributionRequest.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* MatchDistributionRequest::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:MatchDistributionRequest.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void MatchDistributionRequest::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  probes_ = probes;
-  // @@protoc_insertion_point(field_set_allocated:SearchRequest.probes)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:MatchDistributionRequest.gallery_name)
 }
 
-// int32 max_results = 4;
-inline void SearchRequest::clear_max_results() {
-  max_results_ = 0;
+// int32 bins = 2;
+inline void MatchDistributionRequest::clear_bins() {
+  bins_ = 0;
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 SearchRequest::max_results() const {
-  // @@protoc_insertion_point(field_get:SearchRequest.max_results)
-  return max_results_;
+inline ::PROTOBUF_NAMESPACE_ID::int32 MatchDistributionRequest::bins() const {
+  // @@protoc_insertion_point(field_get:MatchDistributionRequest.bins)
+  return bins_;
 }
-inline void SearchRequest::set_max_results(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline void MatchDistributionRequest::set_bins(::PROTOBUF_NAMESPACE_ID::int32 value) {
   
-  max_results_ = value;
-  // @@protoc_insertion_point(field_set:SearchRequest.max_results)
+  bins_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistributionRequest.bins)
 }
 
-// float threshold = 5;
-inline void SearchRequest::clear_threshold() {
-  threshold_ = 0;
+// float min_score = 3;
+inline void MatchDistributionRequest::clear_min_score() {
+  min_score_ = 0;
 }
-inline float SearchRequest::threshold() const {
-  // @@protoc_insertion_point(field_get:SearchRequest.threshold)
-  return threshold_;
+inline float MatchDistributionRequest::min_score() const {
+  // @@protoc_insertion_point(field_get:MatchDistributionRequest.min_score)
+  return min_score_;
 }
-inline void SearchRequest::set_threshold(float value) {
+inline void MatchDistributionRequest::set_min_score(float value) {
   
-  threshold_ = value;
-  // @@protoc_insertion_point(field_set:SearchRequest.threshold)
+  min_score_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistributionRequest.min_score)
 }
 
-// -------------------------------------------------------------------
-
-// SearchResponse
-
-// .ErrorMessage message = 1;
-inline bool SearchResponse::has_message() const {
-  return this != internal_default_instance() && message_ != nullptr;
+// float max_score = 4;
+inline void MatchDistributionRequest::clear_max_score() {
+  max_score_ = 0;
 }
-inline void SearchResponse::clear_message() {
-  if (GetArenaNoVirtual() == nullptr && message_ != nullptr) {
-    delete message_;
-  }
-  message_ = nullptr;
-}
-inline const ::ErrorMessage& SearchResponse::message() const {
-  const ::ErrorMessage* p = message_;
-  // @@protoc_insertion_point(field_get:SearchResponse.message)
-  return p != nullptr ? *p : *reinterpret_cast<const ::ErrorMessage*>(
-      &::_ErrorMessage_default_instance_);
+inline float MatchDistributionRequest::max_score() const {
+  // @@protoc_insertion_point(field_get:MatchDistributionRequest.max_score)
+  return max_score_;
 }
-inline ::ErrorMessage* SearchResponse::release_message() {
-  // @@protoc_insertion_point(field_release:SearchResponse.message)
+inline void MatchDistributionRequest::set_max_score(float value) {
   
-  ::ErrorMessage* temp = message_;
-  message_ = nullptr;
-  return temp;
+  max_score_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistributionRequest.max_score)
 }
-inline ::ErrorMessage* SearchResponse::mutable_message() {
-  
-  if (message_ == nullptr) {
-    auto* p = CreateMaybeMessage<::ErrorMessage>(GetArenaNoVirtual());
-    message_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:SearchResponse.message)
-  return message_;
+
+// bool include_scores = 5;
+inline void MatchDistributionRequest::clear_include_scores() {
+  include_scores_ = false;
 }
-inline void SearchResponse::set_allocated_message(::ErrorMessage* message) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete message_;
-  }
-  if (message) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      message = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, message, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  message_ = message;
-  // @@protoc_insertion_point(field_set_allocated:SearchResponse.message)
+inline bool MatchDistributionRequest::include_scores() const {
+  // @@protoc_insertion_point(field_get:MatchDistributionRequest.include_scores)
+  return include_scores_;
+}
+inline void MatchDistributionRequest::set_include_scores(bool value) {
+  
+  include_scores_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistributionRequest.include_scores)
 }
 
-// .FaceRecordList probes = 2;
-inline bool SearchResponse::has_probes() const {
-  return this != internal_default_instance() && probes_ != nullptr;
+// -------------------------------------------------------------------
+
+// MatchDistribution
+
+// .ScoreBlock block = 1;
+inline bool MatchDistribution::has_block() const {
+  return this != internal_default_instance() && block_ != nullptr;
 }
-inline void SearchResponse::clear_probes() {
-  if (GetArenaNoVirtual() == nullptr && probes_ != nullptr) {
-    delete probes_;
+inline void MatchDistribution::clear_block() {
+  if (GetArenaNoVirtual() == nullptr && block_ != nullptr) {
+    delete block_;
   }
-  probes_ = nullptr;
+  block_ = nullptr;
 }
-inline const ::FaceRecordList& SearchResponse::probes() const {
-  const ::FaceRecordList* p = probes_;
-  // @@protoc_insertion_point(field_get:SearchResponse.probes)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline const ::ScoreBlock& MatchDistribution::block() const {
+  const ::ScoreBlock* p = block_;
+  // @@protoc_insertion_point(field_get:MatchDistribution.block)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ScoreBlock*>(
+      &::_ScoreBlock_default_instance_);
 }
-inline ::FaceRecordList* SearchResponse::release_probes() {
-  // @@protoc_insertion_point(field_release:SearchResponse.probes)
+inline ::ScoreBlock* MatchDistribution::release_block() {
+  // @@protoc_insertion_point(field_release:MatchDistribution.block)
   
-  ::FaceRecordList* temp = probes_;
-  probes_ = nullptr;
+  ::ScoreBlock* temp = block_;
+  block_ = nullptr;
   return temp;
 }
-inline ::FaceRecordList* SearchResponse::mutable_probes() {
+inline ::ScoreBlock* MatchDistribution::mutable_block() {
   
-  if (probes_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    probes_ = p;
+  if (block_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ScoreBlock>(GetArenaNoVirtual());
+    block_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:SearchResponse.probes)
-  return probes_;
+  // @@protoc_insertion_point(field_mutable:MatchDistribution.block)
+  return block_;
 }
-inline void SearchResponse::set_allocated_probes(::FaceRecordList* probes) {
+inline void MatchDistribution::set_allocated_block(::ScoreBlock* block) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete probes_;
+    delete block_;
   }
-  if (probes) {
+  if (block) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, probes, submessage_arena);
+      block = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, block, submessage_arena);
     }
     
   } else {
     
   }
-  probes_ = probes;
-  // @@protoc_insertion_point(field_set_allocated:SearchResponse.probes)
+  block_ = block;
+  // @@protoc_insertion_point(field_set_allocated:MatchDistribution.block)
 }
 
-// -------------------------------------------------------------------
-
-// EnrollRequest
-
-// string enroll_gallery = 1;
-inline void EnrollRequest::clear_enroll_gallery() {
-  enroll_gallery_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// int64 face_count = 2;
+inline void MatchDistribution::clear_face_count() {
+  face_count_ = PROTOBUF_LONGLONG(0);
 }
-inline const std::string& EnrollRequest::enroll_gallery() const {
-  // @@protoc_insertion_point(field_get:EnrollRequest.enroll_gallery)
-  return enroll_gallery_.GetNoArena();
+inline ::PROTOBUF_NAMESPACE_ID::int64 MatchDistribution::face_count() const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.face_count)
+  return face_count_;
 }
-inline void EnrollRequest::set_enroll_gallery(const std::string& value) {
+inline void MatchDistribution::set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:EnrollRequest.enroll_gallery)
+  face_count_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistribution.face_count)
 }
-inline void EnrollRequest::set_enroll_gallery(std::string&& value) {
-  
-  enroll_gallery_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:EnrollRequest.enroll_gallery)
+
+// int64 genuine_count = 3;
+inline void MatchDistribution::clear_genuine_count() {
+  genuine_count_ = PROTOBUF_LONGLONG(0);
 }
-inline void EnrollRequest::set_enroll_gallery(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:EnrollRequest.enroll_gallery)
+inline ::PROTOBUF_NAMESPACE_ID::int64 MatchDistribution::genuine_count() const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.genuine_count)
+  return genuine_count_;
 }
-inline void EnrollRequest::set_enroll_gallery(const char* value, size_t size) {
+inline void MatchDistribution::set_genuine_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  enroll_gallery_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:EnrollRequest.enroll_gallery)
+  genuine_count_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistribution.genuine_count)
 }
-inline std::string* EnrollRequest::mutable_enroll_gallery() {
-  
-  // @@protoc_insertion_point(field_mutable:EnrollRequest.enroll_gallery)
-  return enroll_gallery_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+
+// int64 impostor_count = 4;
+inline void MatchDistribution::clear_impostor_count() {
+  impostor_count_ = PROTOBUF_LONGLONG(0);
 }
-inline std::string* EnrollRequest::release_enroll_gallery() {
-  // @@protoc_insertion_point(field_release:EnrollRequest.enroll_gallery)
+inline ::PROTOBUF_NAMESPACE_ID::int64 MatchDistribution::impostor_count() const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.impostor_count)
+  return impostor_count_;
+}
+inline void MatchDistribution::set_impostor_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  return enroll_gallery_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  impostor_count_ = value;
+  // @@protoc_insertion_point(field_set:MatchDistribution.impostor_count)
 }
-inline void EnrollRequest::set_allocated_enroll_gallery(std::string* enroll_gallery) {
-  if (enroll_gallery != nullptr) {
-    
-  } else {
-    
-  }
-  enroll_gallery_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), enroll_gallery);
-  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.enroll_gallery)
+
+// repeated float bin_edges = 5;
+inline int MatchDistribution::bin_edges_size() const {
+  return bin_edges_.size();
+}
+inline void MatchDistribution::clear_bin_edges() {
+  bin_edges_.Clear();
+}
+inline float MatchDistribution::bin_edges(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.bin_edges)
+  return bin_edges_.Get(index);
+}
+inline void MatchDistribution::set_bin_edges(int index, float value) {
+  bin_edges_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.bin_edges)
+}
+inline void MatchDistribution::add_bin_edges(float value) {
+  bin_edges_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.bin_edges)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+MatchDistribution::bin_edges() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.bin_edges)
+  return bin_edges_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+MatchDistribution::mutable_bin_edges() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.bin_edges)
+  return &bin_edges_;
 }
 
-// .FaceRecordList records = 2;
-inline bool EnrollRequest::has_records() const {
-  return this != internal_default_instance() && records_ != nullptr;
+// repeated int64 genuine_histogram = 6;
+inline int MatchDistribution::genuine_histogram_size() const {
+  return genuine_histogram_.size();
 }
-inline void EnrollRequest::clear_records() {
-  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
-    delete records_;
+inline void MatchDistribution::clear_genuine_histogram() {
+  genuine_histogram_.Clear();
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 MatchDistribution::genuine_histogram(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.genuine_histogram)
+  return genuine_histogram_.Get(index);
+}
+inline void MatchDistribution::set_genuine_histogram(int index, ::PROTOBUF_NAMESPACE_ID::int64 value) {
+  genuine_histogram_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.genuine_histogram)
+}
+inline void MatchDistribution::add_genuine_histogram(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  genuine_histogram_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.genuine_histogram)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >&
+MatchDistribution::genuine_histogram() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.genuine_histogram)
+  return genuine_histogram_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >*
+MatchDistribution::mutable_genuine_histogram() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.genuine_histogram)
+  return &genuine_histogram_;
+}
+
+// repeated int64 impostor_histogram = 7;
+inline int MatchDistribution::impostor_histogram_size() const {
+  return impostor_histogram_.size();
+}
+inline void MatchDistribution::clear_impostor_histogram() {
+  impostor_histogram_.Clear();
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 MatchDistribution::impostor_histogram(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.impostor_histogram)
+  return impostor_histogram_.Get(index);
+}
+inline void MatchDistribution::set_impostor_histogram(int index, ::PROTOBUF_NAMESPACE_ID::int64 value) {
+  impostor_histogram_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.impostor_histogram)
+}
+inline void MatchDistribution::add_impostor_histogram(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  impostor_histogram_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.impostor_histogram)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >&
+MatchDistribution::impostor_histogram() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.impostor_histogram)
+  return impostor_histogram_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< ::PROTOBUF_NAMESPACE_ID::int64 >*
+MatchDistribution::mutable_impostor_histogram() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.impostor_histogram)
+  return &impostor_histogram_;
+}
+
+// repeated float thresholds = 8;
+inline int MatchDistribution::thresholds_size() const {
+  return thresholds_.size();
+}
+inline void MatchDistribution::clear_thresholds() {
+  thresholds_.Clear();
+}
+inline float MatchDistribution::thresholds(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.thresholds)
+  return thresholds_.Get(index);
+}
+inline void MatchDistribution::set_thresholds(int index, float value) {
+  thresholds_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.thresholds)
+}
+inline void MatchDistribution::add_thresholds(float value) {
+  thresholds_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.thresholds)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+MatchDistribution::thresholds() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.thresholds)
+  return thresholds_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+MatchDistribution::mutable_thresholds() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.thresholds)
+  return &thresholds_;
+}
+
+// repeated float far = 9;
+inline int MatchDistribution::far_size() const {
+  return far_.size();
+}
+inline void MatchDistribution::clear_far() {
+  far_.Clear();
+}
+inline float MatchDistribution::far(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.far)
+  return far_.Get(index);
+}
+inline void MatchDistribution::set_far(int index, float value) {
+  far_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.far)
+}
+inline void MatchDistribution::add_far(float value) {
+  far_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.far)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+MatchDistribution::far() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.far)
+  return far_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+MatchDistribution::mutable_far() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.far)
+  return &far_;
+}
+
+// repeated float frr = 10;
+inline int MatchDistribution::frr_size() const {
+  return frr_.size();
+}
+inline void MatchDistribution::clear_frr() {
+  frr_.Clear();
+}
+inline float MatchDistribution::frr(int index) const {
+  // @@protoc_insertion_point(field_get:MatchDistribution.frr)
+  return frr_.Get(index);
+}
+inline void MatchDistribution::set_frr(int index, float value) {
+  frr_.Set(index, value);
+  // @@protoc_insertion_point(field_set:MatchDistribution.frr)
+}
+inline void MatchDistribution::add_frr(float value) {
+  frr_.Add(value);
+  // @@protoc_insertion_point(field_add:MatchDistribution.frr)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+MatchDistribution::frr() const {
+  // @@protoc_insertion_point(field_list:MatchDistribution.frr)
+  return frr_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+MatchDistribution::mutable_frr() {
+  // @@protoc_insertion_point(field_mutable_list:MatchDistribution.frr)
+  return &frr_;
+}
+
+// -------------------------------------------------------------------
+
+// DetectExtractRequest
+
+// .DetectRequest detect_request = 1;
+inline bool DetectExtractRequest::has_detect_request() const {
+  return this != internal_default_instance() && detect_request_ != nullptr;
+}
+inline void DetectExtractRequest::clear_detect_request() {
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
   }
-  records_ = nullptr;
+  detect_request_ = nullptr;
 }
-inline const ::FaceRecordList& EnrollRequest::records() const {
-  const ::FaceRecordList* p = records_;
-  // @@protoc_insertion_point(field_get:EnrollRequest.records)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline const ::DetectRequest& DetectExtractRequest::detect_request() const {
+  const ::DetectRequest* p = detect_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractRequest.detect_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
+      &::_DetectRequest_default_instance_);
 }
-inline ::FaceRecordList* EnrollRequest::release_records() {
-  // @@protoc_insertion_point(field_release:EnrollRequest.records)
+inline ::DetectRequest* DetectExtractRequest::release_detect_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractRequest.detect_request)
   
-  ::FaceRecordList* temp = records_;
-  records_ = nullptr;
+  ::DetectRequest* temp = detect_request_;
+  detect_request_ = nullptr;
   return temp;
 }
-inline ::FaceRecordList* EnrollRequest::mutable_records() {
+inline ::DetectRequest* DetectExtractRequest::mutable_detect_request() {
   
-  if (records_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    records_ = p;
+  if (detect_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
+    detect_request_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:EnrollRequest.records)
-  return records_;
+  // @@protoc_insertion_point(field_mutable:DetectExtractRequest.detect_request)
+  return detect_request_;
 }
-inline void EnrollRequest::set_allocated_records(::FaceRecordList* records) {
+inline void DetectExtractRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete records_;
+    delete detect_request_;
   }
-  if (records) {
+  if (detect_request) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      records = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, records, submessage_arena);
+      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, detect_request, submessage_arena);
     }
     
   } else {
     
   }
-  records_ = records;
-  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.records)
+  detect_request_ = detect_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractRequest.detect_request)
 }
 
-// .EnrollOptions enroll_options = 10;
-inline bool EnrollRequest::has_enroll_options() const {
-  return this != internal_default_instance() && enroll_options_ != nullptr;
+// .ExtractRequest extract_request = 2;
+inline bool DetectExtractRequest::has_extract_request() const {
+  return this != internal_default_instance() && extract_request_ != nullptr;
 }
-inline void EnrollRequest::clear_enroll_options() {
-  if (GetArenaNoVirtual() == nullptr && enroll_options_ != nullptr) {
-    delete enroll_options_;
+inline void DetectExtractRequest::clear_extract_request() {
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
   }
-  enroll_options_ = nullptr;
+  extract_request_ = nullptr;
 }
-inline const ::EnrollOptions& EnrollRequest::enroll_options() const {
-  const ::EnrollOptions* p = enroll_options_;
-  // @@protoc_insertion_point(field_get:EnrollRequest.enroll_options)
-  return p != nullptr ? *p : *reinterpret_cast<const ::EnrollOptions*>(
-      &::_EnrollOptions_default_instance_);
+inline const ::ExtractRequest& DetectExtractRequest::extract_request() const {
+  const ::ExtractRequest* p = extract_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractRequest.extract_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
+      &::_ExtractRequest_default_instance_);
 }
-inline ::EnrollOptions* EnrollRequest::release_enroll_options() {
-  // @@protoc_insertion_point(field_release:EnrollRequest.enroll_options)
+inline ::ExtractRequest* DetectExtractRequest::release_extract_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractRequest.extract_request)
   
-  ::EnrollOptions* temp = enroll_options_;
-  enroll_options_ = nullptr;
+  ::ExtractRequest* temp = extract_request_;
+  extract_request_ = nullptr;
   return temp;
 }
-inline ::EnrollOptions* EnrollRequest::mutable_enroll_options() {
+inline ::ExtractRequest* DetectExtractRequest::mutable_extract_request() {
   
-  if (enroll_options_ == nullptr) {
-    auto* p = CreateMaybeMessage<::EnrollOptions>(GetArenaNoVirtual());
-    enroll_options_ = p;
+  if (extract_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
+    extract_request_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:EnrollRequest.enroll_options)
-  return enroll_options_;
+  // @@protoc_insertion_point(field_mutable:DetectExtractRequest.extract_request)
+  return extract_request_;
 }
-inline void EnrollRequest::set_allocated_enroll_options(::EnrollOptions* enroll_options) {
+inline void DetectExtractRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete enroll_options_;
+    delete extract_request_;
   }
-  if (enroll_options) {
+  if (extract_request) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      enroll_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, enroll_options, submessage_arena);
+      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, extract_request, submessage_arena);
     }
     
   } else {
     
   }
-  enroll_options_ = enroll_options;
-  // @@protoc_insertion_point(field_set_allocated:EnrollRequest.enroll_options)
+  extract_request_ = extract_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractRequest.extract_request)
 }
 
 // -------------------------------------------------------------------
 
-// DetectRequest
+// DetectExtractEnrollRequest
 
-// .Image image = 1;
-inline bool DetectRequest::has_image() const {
-  return this != internal_default_instance() && image_ != nullptr;
+// .DetectRequest detect_request = 1;
+inline bool DetectExtractEnrollRequest::has_detect_request() const {
+  return this != internal_default_instance() && detect_request_ != nullptr;
 }
-inline const ::Image& DetectRequest::image() const {
-  const ::Image* p = image_;
-  // @@protoc_insertion_point(field_get:DetectRequest.image)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline void DetectExtractEnrollRequest::clear_detect_request() {
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
+  }
+  detect_request_ = nullptr;
 }
-inline ::Image* DetectRequest::release_image() {
-  // @@protoc_insertion_point(field_release:DetectRequest.image)
+inline const ::DetectRequest& DetectExtractEnrollRequest::detect_request() const {
+  const ::DetectRequest* p = detect_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.detect_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
+      &::_DetectRequest_default_instance_);
+}
+inline ::DetectRequest* DetectExtractEnrollRequest::release_detect_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.detect_request)
   
-  ::Image* temp = image_;
-  image_ = nullptr;
+  ::DetectRequest* temp = detect_request_;
+  detect_request_ = nullptr;
   return temp;
 }
-inline ::Image* DetectRequest::mutable_image() {
+inline ::DetectRequest* DetectExtractEnrollRequest::mutable_detect_request() {
   
-  if (image_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    image_ = p;
+  if (detect_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
+    detect_request_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:DetectRequest.image)
-  return image_;
+  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.detect_request)
+  return detect_request_;
 }
-inline void DetectRequest::set_allocated_image(::Image* image) {
+inline void DetectExtractEnrollRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
+    delete detect_request_;
   }
-  if (image) {
+  if (detect_request) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, image, submessage_arena);
+      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, detect_request, submessage_arena);
     }
     
   } else {
     
   }
-  image_ = image;
-  // @@protoc_insertion_point(field_set_allocated:DetectRequest.image)
+  detect_request_ = detect_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.detect_request)
 }
 
-// string source = 2;
-inline void DetectRequest::clear_source() {
-  source_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& DetectRequest::source() const {
-  // @@protoc_insertion_point(field_get:DetectRequest.source)
-  return source_.GetNoArena();
-}
-inline void DetectRequest::set_source(const std::string& value) {
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:DetectRequest.source)
-}
-inline void DetectRequest::set_source(std::string&& value) {
-  
-  source_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.source)
+// .ExtractRequest extract_request = 2;
+inline bool DetectExtractEnrollRequest::has_extract_request() const {
+  return this != internal_default_instance() && extract_request_ != nullptr;
 }
-inline void DetectRequest::set_source(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:DetectRequest.source)
+inline void DetectExtractEnrollRequest::clear_extract_request() {
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
+  }
+  extract_request_ = nullptr;
 }
-inline void DetectRequest::set_source(const char* value, size_t size) {
-  
-  source_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:DetectRequest.source)
+inline const ::ExtractRequest& DetectExtractEnrollRequest::extract_request() const {
+  const ::ExtractRequest* p = extract_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.extract_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
+      &::_ExtractRequest_default_instance_);
 }
-inline std::string* DetectRequest::mutable_source() {
+inline ::ExtractRequest* DetectExtractEnrollRequest::release_extract_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.extract_request)
   
-  // @@protoc_insertion_point(field_mutable:DetectRequest.source)
-  return source_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::ExtractRequest* temp = extract_request_;
+  extract_request_ = nullptr;
+  return temp;
 }
-inline std::string* DetectRequest::release_source() {
-  // @@protoc_insertion_point(field_release:DetectRequest.source)
+inline ::ExtractRequest* DetectExtractEnrollRequest::mutable_extract_request() {
   
-  return source_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (extract_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
+    extract_request_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.extract_request)
+  return extract_request_;
 }
-inline void DetectRequest::set_allocated_source(std::string* source) {
-  if (source != nullptr) {
+inline void DetectExtractEnrollRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete extract_request_;
+  }
+  if (extract_request) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, extract_request, submessage_arena);
+    }
     
   } else {
     
   }
-  source_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), source);
-  // @@protoc_insertion_point(field_set_allocated:DetectRequest.source)
-}
-
-// int64 frame = 3;
-inline void DetectRequest::clear_frame() {
-  frame_ = PROTOBUF_LONGLONG(0);
-}
-inline ::PROTOBUF_NAMESPACE_ID::int64 DetectRequest::frame() const {
-  // @@protoc_insertion_point(field_get:DetectRequest.frame)
-  return frame_;
-}
-inline void DetectRequest::set_frame(::PROTOBUF_NAMESPACE_ID::int64 value) {
-  
-  frame_ = value;
-  // @@protoc_insertion_point(field_set:DetectRequest.frame)
+  extract_request_ = extract_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.extract_request)
 }
 
-// string subject_id = 4;
-inline void DetectRequest::clear_subject_id() {
-  subject_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& DetectRequest::subject_id() const {
-  // @@protoc_insertion_point(field_get:DetectRequest.subject_id)
-  return subject_id_.GetNoArena();
-}
-inline void DetectRequest::set_subject_id(const std::string& value) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:DetectRequest.subject_id)
-}
-inline void DetectRequest::set_subject_id(std::string&& value) {
-  
-  subject_id_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.subject_id)
+// .EnrollRequest enroll_request = 3;
+inline bool DetectExtractEnrollRequest::has_enroll_request() const {
+  return this != internal_default_instance() && enroll_request_ != nullptr;
 }
-inline void DetectRequest::set_subject_id(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:DetectRequest.subject_id)
+inline void DetectExtractEnrollRequest::clear_enroll_request() {
+  if (GetArenaNoVirtual() == nullptr && enroll_request_ != nullptr) {
+    delete enroll_request_;
+  }
+  enroll_request_ = nullptr;
 }
-inline void DetectRequest::set_subject_id(const char* value, size_t size) {
-  
-  subject_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:DetectRequest.subject_id)
+inline const ::EnrollRequest& DetectExtractEnrollRequest::enroll_request() const {
+  const ::EnrollRequest* p = enroll_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.enroll_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::EnrollRequest*>(
+      &::_EnrollRequest_default_instance_);
 }
-inline std::string* DetectRequest::mutable_subject_id() {
+inline ::EnrollRequest* DetectExtractEnrollRequest::release_enroll_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.enroll_request)
   
-  // @@protoc_insertion_point(field_mutable:DetectRequest.subject_id)
-  return subject_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::EnrollRequest* temp = enroll_request_;
+  enroll_request_ = nullptr;
+  return temp;
 }
-inline std::string* DetectRequest::release_subject_id() {
-  // @@protoc_insertion_point(field_release:DetectRequest.subject_id)
+inline ::EnrollRequest* DetectExtractEnrollRequest::mutable_enroll_request() {
   
-  return subject_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (enroll_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::EnrollRequest>(GetArenaNoVirtual());
+    enroll_request_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.enroll_request)
+  return enroll_request_;
 }
-inline void DetectRequest::set_allocated_subject_id(std::string* subject_id) {
-  if (subject_id != nullptr) {
+inline void DetectExtractEnrollRequest::set_allocated_enroll_request(::EnrollRequest* enroll_request) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete enroll_request_;
+  }
+  if (enroll_request) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      enroll_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, enroll_request, submessage_arena);
+    }
     
   } else {
     
   }
-  subject_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_id);
-  // @@protoc_insertion_point(field_set_allocated:DetectRequest.subject_id)
+  enroll_request_ = enroll_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.enroll_request)
 }
 
-// string subject_name = 5;
-inline void DetectRequest::clear_subject_name() {
-  subject_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& DetectRequest::subject_name() const {
-  // @@protoc_insertion_point(field_get:DetectRequest.subject_name)
-  return subject_name_.GetNoArena();
-}
-inline void DetectRequest::set_subject_name(const std::string& value) {
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:DetectRequest.subject_name)
-}
-inline void DetectRequest::set_subject_name(std::string&& value) {
-  
-  subject_name_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:DetectRequest.subject_name)
+// -------------------------------------------------------------------
+
+// DetectExtractSearchRequest
+
+// .DetectRequest detect_request = 1;
+inline bool DetectExtractSearchRequest::has_detect_request() const {
+  return this != internal_default_instance() && detect_request_ != nullptr;
 }
-inline void DetectRequest::set_subject_name(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:DetectRequest.subject_name)
+inline void DetectExtractSearchRequest::clear_detect_request() {
+  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
+    delete detect_request_;
+  }
+  detect_request_ = nullptr;
 }
-inline void DetectRequest::set_subject_name(const char* value, size_t size) {
-  
-  subject_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:DetectRequest.subject_name)
+inline const ::DetectRequest& DetectExtractSearchRequest::detect_request() const {
+  const ::DetectRequest* p = detect_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.detect_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
+      &::_DetectRequest_default_instance_);
 }
-inline std::string* DetectRequest::mutable_subject_name() {
+inline ::DetectRequest* DetectExtractSearchRequest::release_detect_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.detect_request)
   
-  // @@protoc_insertion_point(field_mutable:DetectRequest.subject_name)
-  return subject_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::DetectRequest* temp = detect_request_;
+  detect_request_ = nullptr;
+  return temp;
 }
-inline std::string* DetectRequest::release_subject_name() {
-  // @@protoc_insertion_point(field_release:DetectRequest.subject_name)
+inline ::DetectRequest* DetectExtractSearchRequest::mutable_detect_request() {
   
-  return subject_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (detect_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
+    detect_request_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.detect_request)
+  return detect_request_;
 }
-inline void DetectRequest::set_allocated_subject_name(std::string* subject_name) {
-  if (subject_name != nullptr) {
+inline void DetectExtractSearchRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete detect_request_;
+  }
+  if (detect_request) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, detect_request, submessage_arena);
+    }
     
   } else {
     
   }
-  subject_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), subject_name);
-  // @@protoc_insertion_point(field_set_allocated:DetectRequest.subject_name)
+  detect_request_ = detect_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.detect_request)
 }
 
-// .DetectionOptions detect_options = 8;
-inline bool DetectRequest::has_detect_options() const {
-  return this != internal_default_instance() && detect_options_ != nullptr;
+// .ExtractRequest extract_request = 2;
+inline bool DetectExtractSearchRequest::has_extract_request() const {
+  return this != internal_default_instance() && extract_request_ != nullptr;
 }
-inline void DetectRequest::clear_detect_options() {
-  if (GetArenaNoVirtual() == nullptr && detect_options_ != nullptr) {
-    delete detect_options_;
+inline void DetectExtractSearchRequest::clear_extract_request() {
+  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
+    delete extract_request_;
   }
-  detect_options_ = nullptr;
+  extract_request_ = nullptr;
 }
-inline const ::DetectionOptions& DetectRequest::detect_options() const {
-  const ::DetectionOptions* p = detect_options_;
-  // @@protoc_insertion_point(field_get:DetectRequest.detect_options)
-  return p != nullptr ? *p : *reinterpret_cast<const ::DetectionOptions*>(
-      &::_DetectionOptions_default_instance_);
+inline const ::ExtractRequest& DetectExtractSearchRequest::extract_request() const {
+  const ::ExtractRequest* p = extract_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.extract_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
+      &::_ExtractRequest_default_instance_);
 }
-inline ::DetectionOptions* DetectRequest::release_detect_options() {
-  // @@protoc_insertion_point(field_release:DetectRequest.detect_options)
+inline ::ExtractRequest* DetectExtractSearchRequest::release_extract_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.extract_request)
   
-  ::DetectionOptions* temp = detect_options_;
-  detect_options_ = nullptr;
+  ::ExtractRequest* temp = extract_request_;
+  extract_request_ = nullptr;
   return temp;
 }
-inline ::DetectionOptions* DetectRequest::mutable_detect_options() {
+inline ::ExtractRequest* DetectExtractSearchRequest::mutable_extract_request() {
   
-  if (detect_options_ == nullptr) {
-    auto* p = CreateMaybeMessage<::DetectionOptions>(GetArenaNoVirtual());
-    detect_options_ = p;
+  if (extract_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
+    extract_request_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:DetectRequest.detect_options)
-  return detect_options_;
+  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.extract_request)
+  return extract_request_;
 }
-inline void DetectRequest::set_allocated_detect_options(::DetectionOptions* detect_options) {
+inline void DetectExtractSearchRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete detect_options_;
+    delete extract_request_;
   }
-  if (detect_options) {
+  if (extract_request) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      detect_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, detect_options, submessage_arena);
+      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, extract_request, submessage_arena);
     }
     
   } else {
     
   }
-  detect_options_ = detect_options;
-  // @@protoc_insertion_point(field_set_allocated:DetectRequest.detect_options)
+  extract_request_ = extract_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.extract_request)
 }
 
-// -------------------------------------------------------------------
-
-// ExtractRequest
-
-// .Image image = 1;
-inline bool ExtractRequest::has_image() const {
-  return this != internal_default_instance() && image_ != nullptr;
+// .SearchRequest search_request = 3;
+inline bool DetectExtractSearchRequest::has_search_request() const {
+  return this != internal_default_instance() && search_request_ != nullptr;
 }
-inline const ::Image& ExtractRequest::image() const {
-  const ::Image* p = image_;
-  // @@protoc_insertion_point(field_get:ExtractRequest.image)
-  return p != nullptr ? *p : *reinterpret_cast<const ::Image*>(
-      &::_Image_default_instance_);
+inline void DetectExtractSearchRequest::clear_search_request() {
+  if (GetArenaNoVirtual() == nullptr && search_request_ != nullptr) {
+    delete search_request_;
+  }
+  search_request_ = nullptr;
 }
-inline ::Image* ExtractRequest::release_image() {
-  // @@protoc_insertion_point(field_release:ExtractRequest.image)
+inline const ::SearchRequest& DetectExtractSearchRequest::search_request() const {
+  const ::SearchRequest* p = search_request_;
+  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.search_request)
+  return p != nullptr ? *p : *reinterpret_cast<const ::SearchRequest*>(
+      &::_SearchRequest_default_instance_);
+}
+inline ::SearchRequest* DetectExtractSearchRequest::release_search_request() {
+  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.search_request)
   
-  ::Image* temp = image_;
-  image_ = nullptr;
+  ::SearchRequest* temp = search_request_;
+  search_request_ = nullptr;
   return temp;
 }
-inline ::Image* ExtractRequest::mutable_image() {
+inline ::SearchRequest* DetectExtractSearchRequest::mutable_search_request() {
   
-  if (image_ == nullptr) {
-    auto* p = CreateMaybeMessage<::Image>(GetArenaNoVirtual());
-    image_ = p;
+  if (search_request_ == nullptr) {
+    auto* p = CreateMaybeMessage<::SearchRequest>(GetArenaNoVirtual());
+    search_request_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:ExtractRequest.image)
-  return image_;
+  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.search_request)
+  return search_request_;
 }
-inline void ExtractRequest::set_allocated_image(::Image* image) {
+inline void DetectExtractSearchRequest::set_allocated_search_request(::SearchRequest* search_request) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete reinterpret_cast< ::PROTOBUF_NAMESPACE_ID::MessageLite*>(image_);
+    delete search_request_;
   }
-  if (image) {
+  if (search_request) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      image = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, image, submessage_arena);
+      search_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, search_request, submessage_arena);
     }
     
   } else {
     
   }
-  image_ = image;
-  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.image)
+  search_request_ = search_request;
+  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.search_request)
+}
+
+// -------------------------------------------------------------------
+
+// FaceStatusRequest
+
+// -------------------------------------------------------------------
+
+// FaceServiceInfo
+
+// .ServiceStatus status = 1;
+inline void FaceServiceInfo::clear_status() {
+  status_ = 0;
+}
+inline ::ServiceStatus FaceServiceInfo::status() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.status)
+  return static_cast< ::ServiceStatus >(status_);
+}
+inline void FaceServiceInfo::set_status(::ServiceStatus value) {
+  
+  status_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.status)
+}
+
+// int32 worker_count = 2;
+inline void FaceServiceInfo::clear_worker_count() {
+  worker_count_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 FaceServiceInfo::worker_count() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.worker_count)
+  return worker_count_;
+}
+inline void FaceServiceInfo::set_worker_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  worker_count_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.worker_count)
+}
+
+// bool detection_support = 3;
+inline void FaceServiceInfo::clear_detection_support() {
+  detection_support_ = false;
+}
+inline bool FaceServiceInfo::detection_support() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.detection_support)
+  return detection_support_;
+}
+inline void FaceServiceInfo::set_detection_support(bool value) {
+  
+  detection_support_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.detection_support)
+}
+
+// bool extract_support = 4;
+inline void FaceServiceInfo::clear_extract_support() {
+  extract_support_ = false;
+}
+inline bool FaceServiceInfo::extract_support() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.extract_support)
+  return extract_support_;
+}
+inline void FaceServiceInfo::set_extract_support(bool value) {
+  
+  extract_support_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.extract_support)
+}
+
+// bool score_support = 5;
+inline void FaceServiceInfo::clear_score_support() {
+  score_support_ = false;
+}
+inline bool FaceServiceInfo::score_support() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.score_support)
+  return score_support_;
+}
+inline void FaceServiceInfo::set_score_support(bool value) {
+  
+  score_support_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.score_support)
+}
+
+// bool attribute_support = 6;
+inline void FaceServiceInfo::clear_attribute_support() {
+  attribute_support_ = false;
+}
+inline bool FaceServiceInfo::attribute_support() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.attribute_support)
+  return attribute_support_;
+}
+inline void FaceServiceInfo::set_attribute_support(bool value) {
+  
+  attribute_support_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.attribute_support)
+}
+
+// .ScoreType score_type = 7;
+inline void FaceServiceInfo::clear_score_type() {
+  score_type_ = 0;
+}
+inline ::ScoreType FaceServiceInfo::score_type() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.score_type)
+  return static_cast< ::ScoreType >(score_type_);
+}
+inline void FaceServiceInfo::set_score_type(::ScoreType value) {
+  
+  score_type_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.score_type)
+}
+
+// float detection_threshold = 8;
+inline void FaceServiceInfo::clear_detection_threshold() {
+  detection_threshold_ = 0;
+}
+inline float FaceServiceInfo::detection_threshold() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.detection_threshold)
+  return detection_threshold_;
+}
+inline void FaceServiceInfo::set_detection_threshold(float value) {
+  
+  detection_threshold_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.detection_threshold)
 }
 
-// .FaceRecordList records = 4;
-inline bool ExtractRequest::has_records() const {
-  return this != internal_default_instance() && records_ != nullptr;
-}
-inline void ExtractRequest::clear_records() {
-  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
-    delete records_;
-  }
-  records_ = nullptr;
+// float match_threshold = 9;
+inline void FaceServiceInfo::clear_match_threshold() {
+  match_threshold_ = 0;
 }
-inline const ::FaceRecordList& ExtractRequest::records() const {
-  const ::FaceRecordList* p = records_;
-  // @@protoc_insertion_point(field_get:ExtractRequest.records)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline float FaceServiceInfo::match_threshold() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.match_threshold)
+  return match_threshold_;
 }
-inline ::FaceRecordList* ExtractRequest::release_records() {
-  // @@protoc_insertion_point(field_release:ExtractRequest.records)
+inline void FaceServiceInfo::set_match_threshold(float value) {
   
-  ::FaceRecordList* temp = records_;
-  records_ = nullptr;
-  return temp;
+  match_threshold_ = value;
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.match_threshold)
 }
-inline ::FaceRecordList* ExtractRequest::mutable_records() {
-  
-  if (records_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    records_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:ExtractRequest.records)
-  return records_;
+
+// string algorithm = 10;
+inline void FaceServiceInfo::clear_algorithm() {
+  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ExtractRequest::set_allocated_records(::FaceRecordList* records) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete records_;
-  }
-  if (records) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      records = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, records, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  records_ = records;
-  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.records)
+inline const std::string& FaceServiceInfo::algorithm() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.algorithm)
+  return algorithm_.GetNoArena();
 }
-
-// .ExtractOptions extract_options = 9;
-inline bool ExtractRequest::has_extract_options() const {
-  return this != internal_default_instance() && extract_options_ != nullptr;
+inline void FaceServiceInfo::set_algorithm(const std::string& value) {
+  
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.algorithm)
 }
-inline void ExtractRequest::clear_extract_options() {
-  if (GetArenaNoVirtual() == nullptr && extract_options_ != nullptr) {
-    delete extract_options_;
-  }
-  extract_options_ = nullptr;
+inline void FaceServiceInfo::set_algorithm(std::string&& value) {
+  
+  algorithm_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.algorithm)
 }
-inline const ::ExtractOptions& ExtractRequest::extract_options() const {
-  const ::ExtractOptions* p = extract_options_;
-  // @@protoc_insertion_point(field_get:ExtractRequest.extract_options)
-  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractOptions*>(
-      &::_ExtractOptions_default_instance_);
+inline void FaceServiceInfo::set_algorithm(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.algorithm)
 }
-inline ::ExtractOptions* ExtractRequest::release_extract_options() {
-  // @@protoc_insertion_point(field_release:ExtractRequest.extract_options)
+inline void FaceServiceInfo::set_algorithm(const char* value, size_t size) {
   
-  ::ExtractOptions* temp = extract_options_;
-  extract_options_ = nullptr;
-  return temp;
+  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.algorithm)
 }
-inline ::ExtractOptions* ExtractRequest::mutable_extract_options() {
+inline std::string* FaceServiceInfo::mutable_algorithm() {
   
-  if (extract_options_ == nullptr) {
-    auto* p = CreateMaybeMessage<::ExtractOptions>(GetArenaNoVirtual());
-    extract_options_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:ExtractRequest.extract_options)
-  return extract_options_;
+  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.algorithm)
+  return algorithm_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ExtractRequest::set_allocated_extract_options(::ExtractOptions* extract_options) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete extract_options_;
-  }
-  if (extract_options) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      extract_options = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, extract_options, submessage_arena);
-    }
+inline std::string* FaceServiceInfo::release_algorithm() {
+  // @@protoc_insertion_point(field_release:FaceServiceInfo.algorithm)
+  
+  return algorithm_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceServiceInfo::set_allocated_algorithm(std::string* algorithm) {
+  if (algorithm != nullptr) {
     
   } else {
     
   }
-  extract_options_ = extract_options;
-  // @@protoc_insertion_point(field_set_allocated:ExtractRequest.extract_options)
+  algorithm_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm);
+  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.algorithm)
 }
 
-// -------------------------------------------------------------------
-
-// ScoreRequest
-
-// .FaceRecordList face_probes = 1;
-inline bool ScoreRequest::has_face_probes() const {
-  return this != internal_default_instance() && face_probes_ != nullptr;
+// string notes = 11;
+inline void FaceServiceInfo::clear_notes() {
+  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ScoreRequest::clear_face_probes() {
-  if (GetArenaNoVirtual() == nullptr && face_probes_ != nullptr) {
-    delete face_probes_;
-  }
-  face_probes_ = nullptr;
+inline const std::string& FaceServiceInfo::notes() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.notes)
+  return notes_.GetNoArena();
 }
-inline const ::FaceRecordList& ScoreRequest::face_probes() const {
-  const ::FaceRecordList* p = face_probes_;
-  // @@protoc_insertion_point(field_get:ScoreRequest.face_probes)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline void FaceServiceInfo::set_notes(const std::string& value) {
+  
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.notes)
 }
-inline ::FaceRecordList* ScoreRequest::release_face_probes() {
-  // @@protoc_insertion_point(field_release:ScoreRequest.face_probes)
+inline void FaceServiceInfo::set_notes(std::string&& value) {
   
-  ::FaceRecordList* temp = face_probes_;
-  face_probes_ = nullptr;
-  return temp;
+  notes_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.notes)
 }
-inline ::FaceRecordList* ScoreRequest::mutable_face_probes() {
+inline void FaceServiceInfo::set_notes(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (face_probes_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    face_probes_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:ScoreRequest.face_probes)
-  return face_probes_;
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.notes)
 }
-inline void ScoreRequest::set_allocated_face_probes(::FaceRecordList* face_probes) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete face_probes_;
-  }
-  if (face_probes) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      face_probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, face_probes, submessage_arena);
-    }
+inline void FaceServiceInfo::set_notes(const char* value, size_t size) {
+  
+  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.notes)
+}
+inline std::string* FaceServiceInfo::mutable_notes() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.notes)
+  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* FaceServiceInfo::release_notes() {
+  // @@protoc_insertion_point(field_release:FaceServiceInfo.notes)
+  
+  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceServiceInfo::set_allocated_notes(std::string* notes) {
+  if (notes != nullptr) {
     
   } else {
     
   }
-  face_probes_ = face_probes;
-  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.face_probes)
+  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
+  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.notes)
 }
 
-// .FaceRecordList face_gallery = 2;
-inline bool ScoreRequest::has_face_gallery() const {
-  return this != internal_default_instance() && face_gallery_ != nullptr;
+// string faro_version = 12;
+inline void FaceServiceInfo::clear_faro_version() {
+  faro_version_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ScoreRequest::clear_face_gallery() {
-  if (GetArenaNoVirtual() == nullptr && face_gallery_ != nullptr) {
-    delete face_gallery_;
-  }
-  face_gallery_ = nullptr;
+inline const std::string& FaceServiceInfo::faro_version() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.faro_version)
+  return faro_version_.GetNoArena();
 }
-inline const ::FaceRecordList& ScoreRequest::face_gallery() const {
-  const ::FaceRecordList* p = face_gallery_;
-  // @@protoc_insertion_point(field_get:ScoreRequest.face_gallery)
-  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
-      &::_FaceRecordList_default_instance_);
+inline void FaceServiceInfo::set_faro_version(const std::string& value) {
+  
+  faro_version_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.faro_version)
 }
-inline ::FaceRecordList* ScoreRequest::release_face_gallery() {
-  // @@protoc_insertion_point(field_release:ScoreRequest.face_gallery)
+inline void FaceServiceInfo::set_faro_version(std::string&& value) {
   
-  ::FaceRecordList* temp = face_gallery_;
-  face_gallery_ = nullptr;
-  return temp;
+  faro_version_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.faro_version)
 }
-inline ::FaceRecordList* ScoreRequest::mutable_face_gallery() {
+inline void FaceServiceInfo::set_faro_version(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (face_gallery_ == nullptr) {
-    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
-    face_gallery_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:ScoreRequest.face_gallery)
-  return face_gallery_;
+  faro_version_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.faro_version)
 }
-inline void ScoreRequest::set_allocated_face_gallery(::FaceRecordList* face_gallery) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete face_gallery_;
-  }
-  if (face_gallery) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      face_gallery = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, face_gallery, submessage_arena);
-    }
+inline void FaceServiceInfo::set_faro_version(const char* value, size_t size) {
+  
+  faro_version_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.faro_version)
+}
+inline std::string* FaceServiceInfo::mutable_faro_version() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.faro_version)
+  return faro_version_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* FaceServiceInfo::release_faro_version() {
+  // @@protoc_insertion_point(field_release:FaceServiceInfo.faro_version)
+  
+  return faro_version_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceServiceInfo::set_allocated_faro_version(std::string* faro_version) {
+  if (faro_version != nullptr) {
     
   } else {
     
   }
-  face_gallery_ = face_gallery;
-  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.face_gallery)
+  faro_version_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), faro_version);
+  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.faro_version)
 }
 
-// .TemplateList template_probes = 3;
-inline bool ScoreRequest::has_template_probes() const {
-  return this != internal_default_instance() && template_probes_ != nullptr;
+// string instance_name = 13;
+inline void FaceServiceInfo::clear_instance_name() {
+  instance_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void ScoreRequest::clear_template_probes() {
-  if (GetArenaNoVirtual() == nullptr && template_probes_ != nullptr) {
-    delete template_probes_;
-  }
-  template_probes_ = nullptr;
+inline const std::string& FaceServiceInfo::instance_name() const {
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.instance_name)
+  return instance_name_.GetNoArena();
 }
-inline const ::TemplateList& ScoreRequest::template_probes() const {
-  const ::TemplateList* p = template_probes_;
-  // @@protoc_insertion_point(field_get:ScoreRequest.template_probes)
-  return p != nullptr ? *p : *reinterpret_cast<const ::TemplateList*>(
-      &::_TemplateList_default_instance_);
+inline void FaceServiceInfo::set_instance_name(const std::string& value) {
+  
+  instance_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:FaceServiceInfo.instance_name)
 }
-inline ::TemplateList* ScoreRequest::release_template_probes() {
-  // @@protoc_insertion_point(field_release:ScoreRequest.template_probes)
+inline void FaceServiceInfo::set_instance_name(std::string&& value) {
   
-  ::TemplateList* temp = template_probes_;
-  template_probes_ = nullptr;
-  return temp;
+  instance_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.instance_name)
 }
-inline ::TemplateList* ScoreRequest::mutable_template_probes() {
+inline void FaceServiceInfo::set_instance_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (template_probes_ == nullptr) {
-    auto* p = CreateMaybeMessage<::TemplateList>(GetArenaNoVirtual());
-    template_probes_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:ScoreRequest.template_probes)
-  return template_probes_;
+  instance_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.instance_name)
 }
-inline void ScoreRequest::set_allocated_template_probes(::TemplateList* template_probes) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete template_probes_;
-  }
-  if (template_probes) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      template_probes = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, template_probes, submessage_arena);
-    }
+inline void FaceServiceInfo::set_instance_name(const char* value, size_t size) {
+  
+  instance_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.instance_name)
+}
+inline std::string* FaceServiceInfo::mutable_instance_name() {
+  
+  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.instance_name)
+  return instance_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* FaceServiceInfo::release_instance_name() {
+  // @@protoc_insertion_point(field_release:FaceServiceInfo.instance_name)
+  
+  return instance_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void FaceServiceInfo::set_allocated_instance_name(std::string* instance_name) {
+  if (instance_name != nullptr) {
     
   } else {
     
   }
-  template_probes_ = template_probes;
-  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.template_probes)
+  instance_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), instance_name);
+  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.instance_name)
 }
 
-// .TemplateList template_gallery = 4;
-inline bool ScoreRequest::has_template_gallery() const {
-  return this != internal_default_instance() && template_gallery_ != nullptr;
+// .GalleryCacheStats gallery_cache = 14;
+inline bool FaceServiceInfo::has_gallery_cache() const {
+  return this != internal_default_instance() && gallery_cache_ != nullptr;
 }
-inline void ScoreRequest::clear_template_gallery() {
-  if (GetArenaNoVirtual() == nullptr && template_gallery_ != nullptr) {
-    delete template_gallery_;
+inline void FaceServiceInfo::clear_gallery_cache() {
+  if (GetArenaNoVirtual() == nullptr && gallery_cache_ != nullptr) {
+    delete gallery_cache_;
   }
-  template_gallery_ = nullptr;
+  gallery_cache_ = nullptr;
 }
-inline const ::TemplateList& ScoreRequest::template_gallery() const {
-  const ::TemplateList* p = template_gallery_;
-  // @@protoc_insertion_point(field_get:ScoreRequest.template_gallery)
-  return p != nullptr ? *p : *reinterpret_cast<const ::TemplateList*>(
-      &::_TemplateList_default_instance_);
+inline const ::GalleryCacheStats& FaceServiceInfo::gallery_cache() const {
+  const ::GalleryCacheStats* p = gallery_cache_;
+  // @@protoc_insertion_point(field_get:FaceServiceInfo.gallery_cache)
+  return p != nullptr ? *p : *reinterpret_cast<const ::GalleryCacheStats*>(
+      &::_GalleryCacheStats_default_instance_);
 }
-inline ::TemplateList* ScoreRequest::release_template_gallery() {
-  // @@protoc_insertion_point(field_release:ScoreRequest.template_gallery)
+inline ::GalleryCacheStats* FaceServiceInfo::release_gallery_cache() {
+  // @@protoc_insertion_point(field_release:FaceServiceInfo.gallery_cache)
   
-  ::TemplateList* temp = template_gallery_;
-  template_gallery_ = nullptr;
+  ::GalleryCacheStats* temp = gallery_cache_;
+  gallery_cache_ = nullptr;
   return temp;
 }
-inline ::TemplateList* ScoreRequest::mutable_template_gallery() {
+inline ::GalleryCacheStats* FaceServiceInfo::mutable_gallery_cache() {
   
-  if (template_gallery_ == nullptr) {
-    auto* p = CreateMaybeMessage<::TemplateList>(GetArenaNoVirtual());
-    template_gallery_ = p;
+  if (gallery_cache_ == nullptr) {
+    auto* p = CreateMaybeMessage<::GalleryCacheStats>(GetArenaNoVirtual());
+    gallery_cache_ = p;
   }
-  // @@protoc_insertion_point(field_mutable:ScoreRequest.template_gallery)
-  return template_gallery_;
+  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.gallery_cache)
+  return gallery_cache_;
 }
-inline void ScoreRequest::set_allocated_template_gallery(::TemplateList* template_gallery) {
+inline void FaceServiceInfo::set_allocated_gallery_cache(::GalleryCacheStats* gallery_cache) {
   ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
   if (message_arena == nullptr) {
-    delete template_gallery_;
+    delete gallery_cache_;
   }
-  if (template_gallery) {
+  if (gallery_cache) {
     ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
     if (message_arena != submessage_arena) {
-      template_gallery = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, template_gallery, submessage_arena);
+      gallery_cache = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, gallery_cache, submessage_arena);
     }
     
   } else {
     
   }
-  template_gallery_ = template_gallery;
-  // @@protoc_insertion_point(field_set_allocated:ScoreRequest.template_gallery)
+  gallery_cache_ = gallery_cache;
+  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.gallery_cache)
 }
 
 // -------------------------------------------------------------------
 
-// DetectExtractRequest
+// GalleryCacheStats
 
-// .DetectRequest detect_request = 1;
-inline bool DetectExtractRequest::has_detect_request() const {
-  return this != internal_default_instance() && detect_request_ != nullptr;
+// int64 open_galleries = 1;
+inline void GalleryCacheStats::clear_open_galleries() {
+  open_galleries_ = PROTOBUF_LONGLONG(0);
 }
-inline void DetectExtractRequest::clear_detect_request() {
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::open_galleries() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.open_galleries)
+  return open_galleries_;
 }
-inline const ::DetectRequest& DetectExtractRequest::detect_request() const {
-  const ::DetectRequest* p = detect_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractRequest.detect_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
-      &::_DetectRequest_default_instance_);
+inline void GalleryCacheStats::set_open_galleries(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  open_galleries_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.open_galleries)
 }
-inline ::DetectRequest* DetectExtractRequest::release_detect_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractRequest.detect_request)
+
+// int64 pinned_galleries = 2;
+inline void GalleryCacheStats::clear_pinned_galleries() {
+  pinned_galleries_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::pinned_galleries() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.pinned_galleries)
+  return pinned_galleries_;
+}
+inline void GalleryCacheStats::set_pinned_galleries(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  ::DetectRequest* temp = detect_request_;
-  detect_request_ = nullptr;
-  return temp;
+  pinned_galleries_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.pinned_galleries)
 }
-inline ::DetectRequest* DetectExtractRequest::mutable_detect_request() {
+
+// int64 open_bytes = 3;
+inline void GalleryCacheStats::clear_open_bytes() {
+  open_bytes_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::open_bytes() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.open_bytes)
+  return open_bytes_;
+}
+inline void GalleryCacheStats::set_open_bytes(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  if (detect_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
-    detect_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractRequest.detect_request)
-  return detect_request_;
+  open_bytes_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.open_bytes)
 }
-inline void DetectExtractRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete detect_request_;
-  }
-  if (detect_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, detect_request, submessage_arena);
-    }
+
+// int64 max_open = 4;
+inline void GalleryCacheStats::clear_max_open() {
+  max_open_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::max_open() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.max_open)
+  return max_open_;
+}
+inline void GalleryCacheStats::set_max_open(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  max_open_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.max_open)
+}
+
+// int64 max_bytes = 5;
+inline void GalleryCacheStats::clear_max_bytes() {
+  max_bytes_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::max_bytes() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.max_bytes)
+  return max_bytes_;
+}
+inline void GalleryCacheStats::set_max_bytes(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  max_bytes_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.max_bytes)
+}
+
+// int64 hits = 6;
+inline void GalleryCacheStats::clear_hits() {
+  hits_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::hits() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.hits)
+  return hits_;
+}
+inline void GalleryCacheStats::set_hits(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  hits_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.hits)
+}
+
+// int64 misses = 7;
+inline void GalleryCacheStats::clear_misses() {
+  misses_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::misses() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.misses)
+  return misses_;
+}
+inline void GalleryCacheStats::set_misses(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  misses_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.misses)
+}
+
+// int64 evictions = 8;
+inline void GalleryCacheStats::clear_evictions() {
+  evictions_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCacheStats::evictions() const {
+  // @@protoc_insertion_point(field_get:GalleryCacheStats.evictions)
+  return evictions_;
+}
+inline void GalleryCacheStats::set_evictions(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  evictions_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCacheStats.evictions)
+}
+
+// -------------------------------------------------------------------
+
+// GalleryListRequest
+
+// -------------------------------------------------------------------
+
+// GalleryDeleteRequest
+
+// string gallery_name = 1;
+inline void GalleryDeleteRequest::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& GalleryDeleteRequest::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryDeleteRequest.gallery_name)
+  return gallery_name_.GetNoArena();
+}
+inline void GalleryDeleteRequest::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryDeleteRequest.gallery_name)
+}
+inline void GalleryDeleteRequest::set_gallery_name(std::string&& value) {
+  
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryDeleteRequest.gallery_name)
+}
+inline void GalleryDeleteRequest::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryDeleteRequest.gallery_name)
+}
+inline void GalleryDeleteRequest::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryDeleteRequest.gallery_name)
+}
+inline std::string* GalleryDeleteRequest::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryDeleteRequest.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryDeleteRequest::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryDeleteRequest.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryDeleteRequest::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  detect_request_ = detect_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractRequest.detect_request)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryDeleteRequest.gallery_name)
 }
 
-// .ExtractRequest extract_request = 2;
-inline bool DetectExtractRequest::has_extract_request() const {
-  return this != internal_default_instance() && extract_request_ != nullptr;
+// -------------------------------------------------------------------
+
+// GalleryConfigureRequest
+
+// string gallery_name = 1;
+inline void GalleryConfigureRequest::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectExtractRequest::clear_extract_request() {
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
+inline const std::string& GalleryConfigureRequest::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryConfigureRequest.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline const ::ExtractRequest& DetectExtractRequest::extract_request() const {
-  const ::ExtractRequest* p = extract_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractRequest.extract_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
-      &::_ExtractRequest_default_instance_);
+inline void GalleryConfigureRequest::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryConfigureRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractRequest::release_extract_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractRequest.extract_request)
+inline void GalleryConfigureRequest::set_gallery_name(std::string&& value) {
   
-  ::ExtractRequest* temp = extract_request_;
-  extract_request_ = nullptr;
-  return temp;
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryConfigureRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractRequest::mutable_extract_request() {
+inline void GalleryConfigureRequest::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (extract_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
-    extract_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractRequest.extract_request)
-  return extract_request_;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryConfigureRequest.gallery_name)
 }
-inline void DetectExtractRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete extract_request_;
-  }
-  if (extract_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, extract_request, submessage_arena);
-    }
+inline void GalleryConfigureRequest::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryConfigureRequest.gallery_name)
+}
+inline std::string* GalleryConfigureRequest::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryConfigureRequest.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryConfigureRequest::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryConfigureRequest.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryConfigureRequest::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  extract_request_ = extract_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractRequest.extract_request)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryConfigureRequest.gallery_name)
 }
 
-// -------------------------------------------------------------------
-
-// DetectExtractEnrollRequest
-
-// .DetectRequest detect_request = 1;
-inline bool DetectExtractEnrollRequest::has_detect_request() const {
-  return this != internal_default_instance() && detect_request_ != nullptr;
+// string index_quantization = 2;
+inline void GalleryConfigureRequest::clear_index_quantization() {
+  index_quantization_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectExtractEnrollRequest::clear_detect_request() {
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
+inline const std::string& GalleryConfigureRequest::index_quantization() const {
+  // @@protoc_insertion_point(field_get:GalleryConfigureRequest.index_quantization)
+  return index_quantization_.GetNoArena();
 }
-inline const ::DetectRequest& DetectExtractEnrollRequest::detect_request() const {
-  const ::DetectRequest* p = detect_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.detect_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
-      &::_DetectRequest_default_instance_);
+inline void GalleryConfigureRequest::set_index_quantization(const std::string& value) {
+  
+  index_quantization_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryConfigureRequest.index_quantization)
 }
-inline ::DetectRequest* DetectExtractEnrollRequest::release_detect_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.detect_request)
+inline void GalleryConfigureRequest::set_index_quantization(std::string&& value) {
   
-  ::DetectRequest* temp = detect_request_;
-  detect_request_ = nullptr;
-  return temp;
+  index_quantization_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryConfigureRequest.index_quantization)
 }
-inline ::DetectRequest* DetectExtractEnrollRequest::mutable_detect_request() {
+inline void GalleryConfigureRequest::set_index_quantization(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (detect_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
-    detect_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.detect_request)
-  return detect_request_;
+  index_quantization_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryConfigureRequest.index_quantization)
 }
-inline void DetectExtractEnrollRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete detect_request_;
-  }
-  if (detect_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, detect_request, submessage_arena);
-    }
+inline void GalleryConfigureRequest::set_index_quantization(const char* value, size_t size) {
+  
+  index_quantization_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryConfigureRequest.index_quantization)
+}
+inline std::string* GalleryConfigureRequest::mutable_index_quantization() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryConfigureRequest.index_quantization)
+  return index_quantization_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryConfigureRequest::release_index_quantization() {
+  // @@protoc_insertion_point(field_release:GalleryConfigureRequest.index_quantization)
+  
+  return index_quantization_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryConfigureRequest::set_allocated_index_quantization(std::string* index_quantization) {
+  if (index_quantization != nullptr) {
     
   } else {
     
   }
-  detect_request_ = detect_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.detect_request)
+  index_quantization_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), index_quantization);
+  // @@protoc_insertion_point(field_set_allocated:GalleryConfigureRequest.index_quantization)
 }
 
-// .ExtractRequest extract_request = 2;
-inline bool DetectExtractEnrollRequest::has_extract_request() const {
-  return this != internal_default_instance() && extract_request_ != nullptr;
+// -------------------------------------------------------------------
+
+// GalleryCompactRequest
+
+// string gallery_name = 1;
+inline void GalleryCompactRequest::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectExtractEnrollRequest::clear_extract_request() {
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
+inline const std::string& GalleryCompactRequest::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactRequest.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline const ::ExtractRequest& DetectExtractEnrollRequest::extract_request() const {
-  const ::ExtractRequest* p = extract_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.extract_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
-      &::_ExtractRequest_default_instance_);
+inline void GalleryCompactRequest::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryCompactRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractEnrollRequest::release_extract_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.extract_request)
+inline void GalleryCompactRequest::set_gallery_name(std::string&& value) {
   
-  ::ExtractRequest* temp = extract_request_;
-  extract_request_ = nullptr;
-  return temp;
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryCompactRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractEnrollRequest::mutable_extract_request() {
+inline void GalleryCompactRequest::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (extract_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
-    extract_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.extract_request)
-  return extract_request_;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryCompactRequest.gallery_name)
 }
-inline void DetectExtractEnrollRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete extract_request_;
-  }
-  if (extract_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, extract_request, submessage_arena);
-    }
+inline void GalleryCompactRequest::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryCompactRequest.gallery_name)
+}
+inline std::string* GalleryCompactRequest::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryCompactRequest.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryCompactRequest::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryCompactRequest.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryCompactRequest::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  extract_request_ = extract_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.extract_request)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryCompactRequest.gallery_name)
 }
 
-// .EnrollRequest enroll_request = 3;
-inline bool DetectExtractEnrollRequest::has_enroll_request() const {
-  return this != internal_default_instance() && enroll_request_ != nullptr;
+// -------------------------------------------------------------------
+
+// GalleryCompactResponse
+
+// string gallery_name = 1;
+inline void GalleryCompactResponse::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectExtractEnrollRequest::clear_enroll_request() {
-  if (GetArenaNoVirtual() == nullptr && enroll_request_ != nullptr) {
-    delete enroll_request_;
-  }
-  enroll_request_ = nullptr;
+inline const std::string& GalleryCompactResponse::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline const ::EnrollRequest& DetectExtractEnrollRequest::enroll_request() const {
-  const ::EnrollRequest* p = enroll_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractEnrollRequest.enroll_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::EnrollRequest*>(
-      &::_EnrollRequest_default_instance_);
+inline void GalleryCompactResponse::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.gallery_name)
 }
-inline ::EnrollRequest* DetectExtractEnrollRequest::release_enroll_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractEnrollRequest.enroll_request)
+inline void GalleryCompactResponse::set_gallery_name(std::string&& value) {
   
-  ::EnrollRequest* temp = enroll_request_;
-  enroll_request_ = nullptr;
-  return temp;
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryCompactResponse.gallery_name)
 }
-inline ::EnrollRequest* DetectExtractEnrollRequest::mutable_enroll_request() {
+inline void GalleryCompactResponse::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (enroll_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::EnrollRequest>(GetArenaNoVirtual());
-    enroll_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractEnrollRequest.enroll_request)
-  return enroll_request_;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryCompactResponse.gallery_name)
 }
-inline void DetectExtractEnrollRequest::set_allocated_enroll_request(::EnrollRequest* enroll_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete enroll_request_;
-  }
-  if (enroll_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      enroll_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, enroll_request, submessage_arena);
-    }
+inline void GalleryCompactResponse::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryCompactResponse.gallery_name)
+}
+inline std::string* GalleryCompactResponse::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryCompactResponse.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryCompactResponse::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryCompactResponse.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryCompactResponse::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  enroll_request_ = enroll_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractEnrollRequest.enroll_request)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryCompactResponse.gallery_name)
 }
 
-// -------------------------------------------------------------------
+// int64 face_count = 2;
+inline void GalleryCompactResponse::clear_face_count() {
+  face_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCompactResponse::face_count() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.face_count)
+  return face_count_;
+}
+inline void GalleryCompactResponse::set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  face_count_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.face_count)
+}
 
-// DetectExtractSearchRequest
+// int64 rows_removed = 3;
+inline void GalleryCompactResponse::clear_rows_removed() {
+  rows_removed_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCompactResponse::rows_removed() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.rows_removed)
+  return rows_removed_;
+}
+inline void GalleryCompactResponse::set_rows_removed(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  rows_removed_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.rows_removed)
+}
 
-// .DetectRequest detect_request = 1;
-inline bool DetectExtractSearchRequest::has_detect_request() const {
-  return this != internal_default_instance() && detect_request_ != nullptr;
+// int64 bytes_before = 4;
+inline void GalleryCompactResponse::clear_bytes_before() {
+  bytes_before_ = PROTOBUF_LONGLONG(0);
 }
-inline void DetectExtractSearchRequest::clear_detect_request() {
-  if (GetArenaNoVirtual() == nullptr && detect_request_ != nullptr) {
-    delete detect_request_;
-  }
-  detect_request_ = nullptr;
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCompactResponse::bytes_before() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.bytes_before)
+  return bytes_before_;
 }
-inline const ::DetectRequest& DetectExtractSearchRequest::detect_request() const {
-  const ::DetectRequest* p = detect_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.detect_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::DetectRequest*>(
-      &::_DetectRequest_default_instance_);
+inline void GalleryCompactResponse::set_bytes_before(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  bytes_before_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.bytes_before)
 }
-inline ::DetectRequest* DetectExtractSearchRequest::release_detect_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.detect_request)
+
+// int64 bytes_after = 5;
+inline void GalleryCompactResponse::clear_bytes_after() {
+  bytes_after_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCompactResponse::bytes_after() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.bytes_after)
+  return bytes_after_;
+}
+inline void GalleryCompactResponse::set_bytes_after(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  ::DetectRequest* temp = detect_request_;
-  detect_request_ = nullptr;
-  return temp;
+  bytes_after_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.bytes_after)
 }
-inline ::DetectRequest* DetectExtractSearchRequest::mutable_detect_request() {
+
+// int64 bytes_reclaimed = 6;
+inline void GalleryCompactResponse::clear_bytes_reclaimed() {
+  bytes_reclaimed_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryCompactResponse::bytes_reclaimed() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.bytes_reclaimed)
+  return bytes_reclaimed_;
+}
+inline void GalleryCompactResponse::set_bytes_reclaimed(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  if (detect_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::DetectRequest>(GetArenaNoVirtual());
-    detect_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.detect_request)
-  return detect_request_;
+  bytes_reclaimed_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.bytes_reclaimed)
 }
-inline void DetectExtractSearchRequest::set_allocated_detect_request(::DetectRequest* detect_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete detect_request_;
-  }
-  if (detect_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      detect_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, detect_request, submessage_arena);
-    }
-    
-  } else {
-    
-  }
-  detect_request_ = detect_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.detect_request)
+
+// float compact_time = 7;
+inline void GalleryCompactResponse::clear_compact_time() {
+  compact_time_ = 0;
+}
+inline float GalleryCompactResponse::compact_time() const {
+  // @@protoc_insertion_point(field_get:GalleryCompactResponse.compact_time)
+  return compact_time_;
 }
+inline void GalleryCompactResponse::set_compact_time(float value) {
+  
+  compact_time_ = value;
+  // @@protoc_insertion_point(field_set:GalleryCompactResponse.compact_time)
+}
+
+// -------------------------------------------------------------------
 
-// .ExtractRequest extract_request = 2;
-inline bool DetectExtractSearchRequest::has_extract_request() const {
-  return this != internal_default_instance() && extract_request_ != nullptr;
+// GalleryExportRequest
+
+// string gallery_name = 1;
+inline void GalleryExportRequest::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void DetectExtractSearchRequest::clear_extract_request() {
-  if (GetArenaNoVirtual() == nullptr && extract_request_ != nullptr) {
-    delete extract_request_;
-  }
-  extract_request_ = nullptr;
+inline const std::string& GalleryExportRequest::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryExportRequest.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline const ::ExtractRequest& DetectExtractSearchRequest::extract_request() const {
-  const ::ExtractRequest* p = extract_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.extract_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::ExtractRequest*>(
-      &::_ExtractRequest_default_instance_);
+inline void GalleryExportRequest::set_gallery_name(const std::string& value) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryExportRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractSearchRequest::release_extract_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.extract_request)
+inline void GalleryExportRequest::set_gallery_name(std::string&& value) {
   
-  ::ExtractRequest* temp = extract_request_;
-  extract_request_ = nullptr;
-  return temp;
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryExportRequest.gallery_name)
 }
-inline ::ExtractRequest* DetectExtractSearchRequest::mutable_extract_request() {
+inline void GalleryExportRequest::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  if (extract_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::ExtractRequest>(GetArenaNoVirtual());
-    extract_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.extract_request)
-  return extract_request_;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryExportRequest.gallery_name)
 }
-inline void DetectExtractSearchRequest::set_allocated_extract_request(::ExtractRequest* extract_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete extract_request_;
-  }
-  if (extract_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      extract_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, extract_request, submessage_arena);
-    }
+inline void GalleryExportRequest::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryExportRequest.gallery_name)
+}
+inline std::string* GalleryExportRequest::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryExportRequest.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryExportRequest::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryExportRequest.gallery_name)
+  
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryExportRequest::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
     
   } else {
     
   }
-  extract_request_ = extract_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.extract_request)
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryExportRequest.gallery_name)
 }
 
-// .SearchRequest search_request = 3;
-inline bool DetectExtractSearchRequest::has_search_request() const {
-  return this != internal_default_instance() && search_request_ != nullptr;
+// int64 start_row = 2;
+inline void GalleryExportRequest::clear_start_row() {
+  start_row_ = PROTOBUF_LONGLONG(0);
 }
-inline void DetectExtractSearchRequest::clear_search_request() {
-  if (GetArenaNoVirtual() == nullptr && search_request_ != nullptr) {
-    delete search_request_;
-  }
-  search_request_ = nullptr;
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryExportRequest::start_row() const {
+  // @@protoc_insertion_point(field_get:GalleryExportRequest.start_row)
+  return start_row_;
 }
-inline const ::SearchRequest& DetectExtractSearchRequest::search_request() const {
-  const ::SearchRequest* p = search_request_;
-  // @@protoc_insertion_point(field_get:DetectExtractSearchRequest.search_request)
-  return p != nullptr ? *p : *reinterpret_cast<const ::SearchRequest*>(
-      &::_SearchRequest_default_instance_);
+inline void GalleryExportRequest::set_start_row(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  start_row_ = value;
+  // @@protoc_insertion_point(field_set:GalleryExportRequest.start_row)
 }
-inline ::SearchRequest* DetectExtractSearchRequest::release_search_request() {
-  // @@protoc_insertion_point(field_release:DetectExtractSearchRequest.search_request)
+
+// string file_id = 3;
+inline void GalleryExportRequest::clear_file_id() {
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& GalleryExportRequest::file_id() const {
+  // @@protoc_insertion_point(field_get:GalleryExportRequest.file_id)
+  return file_id_.GetNoArena();
+}
+inline void GalleryExportRequest::set_file_id(const std::string& value) {
   
-  ::SearchRequest* temp = search_request_;
-  search_request_ = nullptr;
-  return temp;
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryExportRequest.file_id)
 }
-inline ::SearchRequest* DetectExtractSearchRequest::mutable_search_request() {
+inline void GalleryExportRequest::set_file_id(std::string&& value) {
   
-  if (search_request_ == nullptr) {
-    auto* p = CreateMaybeMessage<::SearchRequest>(GetArenaNoVirtual());
-    search_request_ = p;
-  }
-  // @@protoc_insertion_point(field_mutable:DetectExtractSearchRequest.search_request)
-  return search_request_;
+  file_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryExportRequest.file_id)
 }
-inline void DetectExtractSearchRequest::set_allocated_search_request(::SearchRequest* search_request) {
-  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
-  if (message_arena == nullptr) {
-    delete search_request_;
-  }
-  if (search_request) {
-    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
-    if (message_arena != submessage_arena) {
-      search_request = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
-          message_arena, search_request, submessage_arena);
-    }
+inline void GalleryExportRequest::set_file_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryExportRequest.file_id)
+}
+inline void GalleryExportRequest::set_file_id(const char* value, size_t size) {
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryExportRequest.file_id)
+}
+inline std::string* GalleryExportRequest::mutable_file_id() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryExportRequest.file_id)
+  return file_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryExportRequest::release_file_id() {
+  // @@protoc_insertion_point(field_release:GalleryExportRequest.file_id)
+  
+  return file_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryExportRequest::set_allocated_file_id(std::string* file_id) {
+  if (file_id != nullptr) {
     
   } else {
     
   }
-  search_request_ = search_request;
-  // @@protoc_insertion_point(field_set_allocated:DetectExtractSearchRequest.search_request)
+  file_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), file_id);
+  // @@protoc_insertion_point(field_set_allocated:GalleryExportRequest.file_id)
 }
 
-// -------------------------------------------------------------------
+// int32 chunk_size = 4;
+inline void GalleryExportRequest::clear_chunk_size() {
+  chunk_size_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 GalleryExportRequest::chunk_size() const {
+  // @@protoc_insertion_point(field_get:GalleryExportRequest.chunk_size)
+  return chunk_size_;
+}
+inline void GalleryExportRequest::set_chunk_size(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  chunk_size_ = value;
+  // @@protoc_insertion_point(field_set:GalleryExportRequest.chunk_size)
+}
 
-// FaceStatusRequest
+// bool include_views = 5;
+inline void GalleryExportRequest::clear_include_views() {
+  include_views_ = false;
+}
+inline bool GalleryExportRequest::include_views() const {
+  // @@protoc_insertion_point(field_get:GalleryExportRequest.include_views)
+  return include_views_;
+}
+inline void GalleryExportRequest::set_include_views(bool value) {
+  
+  include_views_ = value;
+  // @@protoc_insertion_point(field_set:GalleryExportRequest.include_views)
+}
 
 // -------------------------------------------------------------------
 
-// FaceServiceInfo
+// GalleryChunk
 
-// .ServiceStatus status = 1;
-inline void FaceServiceInfo::clear_status() {
-  status_ = 0;
+// string gallery_name = 1;
+inline void GalleryChunk::clear_gallery_name() {
+  gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline ::ServiceStatus FaceServiceInfo::status() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.status)
-  return static_cast< ::ServiceStatus >(status_);
+inline const std::string& GalleryChunk::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.gallery_name)
+  return gallery_name_.GetNoArena();
 }
-inline void FaceServiceInfo::set_status(::ServiceStatus value) {
+inline void GalleryChunk::set_gallery_name(const std::string& value) {
   
-  status_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.status)
-}
-
-// int32 worker_count = 2;
-inline void FaceServiceInfo::clear_worker_count() {
-  worker_count_ = 0;
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryChunk.gallery_name)
 }
-inline ::PROTOBUF_NAMESPACE_ID::int32 FaceServiceInfo::worker_count() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.worker_count)
-  return worker_count_;
+inline void GalleryChunk::set_gallery_name(std::string&& value) {
+  
+  gallery_name_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryChunk.gallery_name)
 }
-inline void FaceServiceInfo::set_worker_count(::PROTOBUF_NAMESPACE_ID::int32 value) {
+inline void GalleryChunk::set_gallery_name(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
   
-  worker_count_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.worker_count)
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryChunk.gallery_name)
 }
-
-// bool detection_support = 3;
-inline void FaceServiceInfo::clear_detection_support() {
-  detection_support_ = false;
+inline void GalleryChunk::set_gallery_name(const char* value, size_t size) {
+  
+  gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryChunk.gallery_name)
 }
-inline bool FaceServiceInfo::detection_support() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.detection_support)
-  return detection_support_;
+inline std::string* GalleryChunk::mutable_gallery_name() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryChunk.gallery_name)
+  return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceServiceInfo::set_detection_support(bool value) {
+inline std::string* GalleryChunk::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryChunk.gallery_name)
   
-  detection_support_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.detection_support)
+  return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryChunk::set_allocated_gallery_name(std::string* gallery_name) {
+  if (gallery_name != nullptr) {
+    
+  } else {
+    
+  }
+  gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
+  // @@protoc_insertion_point(field_set_allocated:GalleryChunk.gallery_name)
 }
 
-// bool extract_support = 4;
-inline void FaceServiceInfo::clear_extract_support() {
-  extract_support_ = false;
+// string file_id = 2;
+inline void GalleryChunk::clear_file_id() {
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline bool FaceServiceInfo::extract_support() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.extract_support)
-  return extract_support_;
+inline const std::string& GalleryChunk::file_id() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.file_id)
+  return file_id_.GetNoArena();
 }
-inline void FaceServiceInfo::set_extract_support(bool value) {
+inline void GalleryChunk::set_file_id(const std::string& value) {
   
-  extract_support_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.extract_support)
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryChunk.file_id)
 }
-
-// bool score_support = 5;
-inline void FaceServiceInfo::clear_score_support() {
-  score_support_ = false;
+inline void GalleryChunk::set_file_id(std::string&& value) {
+  
+  file_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryChunk.file_id)
 }
-inline bool FaceServiceInfo::score_support() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.score_support)
-  return score_support_;
+inline void GalleryChunk::set_file_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryChunk.file_id)
 }
-inline void FaceServiceInfo::set_score_support(bool value) {
+inline void GalleryChunk::set_file_id(const char* value, size_t size) {
   
-  score_support_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.score_support)
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryChunk.file_id)
+}
+inline std::string* GalleryChunk::mutable_file_id() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryChunk.file_id)
+  return file_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryChunk::release_file_id() {
+  // @@protoc_insertion_point(field_release:GalleryChunk.file_id)
+  
+  return file_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryChunk::set_allocated_file_id(std::string* file_id) {
+  if (file_id != nullptr) {
+    
+  } else {
+    
+  }
+  file_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), file_id);
+  // @@protoc_insertion_point(field_set_allocated:GalleryChunk.file_id)
 }
 
-// bool attribute_support = 6;
-inline void FaceServiceInfo::clear_attribute_support() {
-  attribute_support_ = false;
+// int64 start_row = 3;
+inline void GalleryChunk::clear_start_row() {
+  start_row_ = PROTOBUF_LONGLONG(0);
 }
-inline bool FaceServiceInfo::attribute_support() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.attribute_support)
-  return attribute_support_;
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryChunk::start_row() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.start_row)
+  return start_row_;
 }
-inline void FaceServiceInfo::set_attribute_support(bool value) {
+inline void GalleryChunk::set_start_row(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  attribute_support_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.attribute_support)
+  start_row_ = value;
+  // @@protoc_insertion_point(field_set:GalleryChunk.start_row)
 }
 
-// .ScoreType score_type = 7;
-inline void FaceServiceInfo::clear_score_type() {
-  score_type_ = 0;
+// int64 next_row = 4;
+inline void GalleryChunk::clear_next_row() {
+  next_row_ = PROTOBUF_LONGLONG(0);
 }
-inline ::ScoreType FaceServiceInfo::score_type() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.score_type)
-  return static_cast< ::ScoreType >(score_type_);
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryChunk::next_row() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.next_row)
+  return next_row_;
 }
-inline void FaceServiceInfo::set_score_type(::ScoreType value) {
+inline void GalleryChunk::set_next_row(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  score_type_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.score_type)
+  next_row_ = value;
+  // @@protoc_insertion_point(field_set:GalleryChunk.next_row)
 }
 
-// float detection_threshold = 8;
-inline void FaceServiceInfo::clear_detection_threshold() {
-  detection_threshold_ = 0;
+// int64 row_count = 5;
+inline void GalleryChunk::clear_row_count() {
+  row_count_ = PROTOBUF_LONGLONG(0);
 }
-inline float FaceServiceInfo::detection_threshold() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.detection_threshold)
-  return detection_threshold_;
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryChunk::row_count() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.row_count)
+  return row_count_;
 }
-inline void FaceServiceInfo::set_detection_threshold(float value) {
+inline void GalleryChunk::set_row_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   
-  detection_threshold_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.detection_threshold)
+  row_count_ = value;
+  // @@protoc_insertion_point(field_set:GalleryChunk.row_count)
 }
 
-// float match_threshold = 9;
-inline void FaceServiceInfo::clear_match_threshold() {
-  match_threshold_ = 0;
+// int32 dim = 6;
+inline void GalleryChunk::clear_dim() {
+  dim_ = 0;
 }
-inline float FaceServiceInfo::match_threshold() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.match_threshold)
-  return match_threshold_;
+inline ::PROTOBUF_NAMESPACE_ID::int32 GalleryChunk::dim() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.dim)
+  return dim_;
 }
-inline void FaceServiceInfo::set_match_threshold(float value) {
+inline void GalleryChunk::set_dim(::PROTOBUF_NAMESPACE_ID::int32 value) {
   
-  match_threshold_ = value;
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.match_threshold)
+  dim_ = value;
+  // @@protoc_insertion_point(field_set:GalleryChunk.dim)
 }
 
-// string algorithm = 10;
-inline void FaceServiceInfo::clear_algorithm() {
-  algorithm_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+// bytes templates = 7;
+inline void GalleryChunk::clear_templates() {
+  templates_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& FaceServiceInfo::algorithm() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.algorithm)
-  return algorithm_.GetNoArena();
+inline const std::string& GalleryChunk::templates() const {
+  // @@protoc_insertion_point(field_get:GalleryChunk.templates)
+  return templates_.GetNoArena();
 }
-inline void FaceServiceInfo::set_algorithm(const std::string& value) {
+inline void GalleryChunk::set_templates(const std::string& value) {
   
-  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.algorithm)
+  templates_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryChunk.templates)
 }
-inline void FaceServiceInfo::set_algorithm(std::string&& value) {
+inline void GalleryChunk::set_templates(std::string&& value) {
   
-  algorithm_.SetNoArena(
+  templates_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.algorithm)
+  // @@protoc_insertion_point(field_set_rvalue:GalleryChunk.templates)
 }
-inline void FaceServiceInfo::set_algorithm(const char* value) {
+inline void GalleryChunk::set_templates(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
-  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.algorithm)
+  templates_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryChunk.templates)
 }
-inline void FaceServiceInfo::set_algorithm(const char* value, size_t size) {
+inline void GalleryChunk::set_templates(const void* value, size_t size) {
   
-  algorithm_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+  templates_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.algorithm)
+  // @@protoc_insertion_point(field_set_pointer:GalleryChunk.templates)
 }
-inline std::string* FaceServiceInfo::mutable_algorithm() {
+inline std::string* GalleryChunk::mutable_templates() {
   
-  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.algorithm)
-  return algorithm_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  // @@protoc_insertion_point(field_mutable:GalleryChunk.templates)
+  return templates_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* FaceServiceInfo::release_algorithm() {
-  // @@protoc_insertion_point(field_release:FaceServiceInfo.algorithm)
+inline std::string* GalleryChunk::release_templates() {
+  // @@protoc_insertion_point(field_release:GalleryChunk.templates)
   
-  return algorithm_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  return templates_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void FaceServiceInfo::set_allocated_algorithm(std::string* algorithm) {
-  if (algorithm != nullptr) {
+inline void GalleryChunk::set_allocated_templates(std::string* templates) {
+  if (templates != nullptr) {
     
   } else {
     
   }
-  algorithm_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), algorithm);
-  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.algorithm)
+  templates_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), templates);
+  // @@protoc_insertion_point(field_set_allocated:GalleryChunk.templates)
 }
 
-// string notes = 11;
-inline void FaceServiceInfo::clear_notes() {
-  notes_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
-}
-inline const std::string& FaceServiceInfo::notes() const {
-  // @@protoc_insertion_point(field_get:FaceServiceInfo.notes)
-  return notes_.GetNoArena();
-}
-inline void FaceServiceInfo::set_notes(const std::string& value) {
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:FaceServiceInfo.notes)
-}
-inline void FaceServiceInfo::set_notes(std::string&& value) {
-  
-  notes_.SetNoArena(
-    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:FaceServiceInfo.notes)
+// .FaceRecordList records = 8;
+inline bool GalleryChunk::has_records() const {
+  return this != internal_default_instance() && records_ != nullptr;
 }
-inline void FaceServiceInfo::set_notes(const char* value) {
-  GOOGLE_DCHECK(value != nullptr);
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:FaceServiceInfo.notes)
+inline void GalleryChunk::clear_records() {
+  if (GetArenaNoVirtual() == nullptr && records_ != nullptr) {
+    delete records_;
+  }
+  records_ = nullptr;
 }
-inline void FaceServiceInfo::set_notes(const char* value, size_t size) {
-  
-  notes_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
-      ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:FaceServiceInfo.notes)
+inline const ::FaceRecordList& GalleryChunk::records() const {
+  const ::FaceRecordList* p = records_;
+  // @@protoc_insertion_point(field_get:GalleryChunk.records)
+  return p != nullptr ? *p : *reinterpret_cast<const ::FaceRecordList*>(
+      &::_FaceRecordList_default_instance_);
 }
-inline std::string* FaceServiceInfo::mutable_notes() {
+inline ::FaceRecordList* GalleryChunk::release_records() {
+  // @@protoc_insertion_point(field_release:GalleryChunk.records)
   
-  // @@protoc_insertion_point(field_mutable:FaceServiceInfo.notes)
-  return notes_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  ::FaceRecordList* temp = records_;
+  records_ = nullptr;
+  return temp;
 }
-inline std::string* FaceServiceInfo::release_notes() {
-  // @@protoc_insertion_point(field_release:FaceServiceInfo.notes)
+inline ::FaceRecordList* GalleryChunk::mutable_records() {
   
-  return notes_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+  if (records_ == nullptr) {
+    auto* p = CreateMaybeMessage<::FaceRecordList>(GetArenaNoVirtual());
+    records_ = p;
+  }
+  // @@protoc_insertion_point(field_mutable:GalleryChunk.records)
+  return records_;
 }
-inline void FaceServiceInfo::set_allocated_notes(std::string* notes) {
-  if (notes != nullptr) {
+inline void GalleryChunk::set_allocated_records(::FaceRecordList* records) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaNoVirtual();
+  if (message_arena == nullptr) {
+    delete records_;
+  }
+  if (records) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena = nullptr;
+    if (message_arena != submessage_arena) {
+      records = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, records, submessage_arena);
+    }
     
   } else {
     
   }
-  notes_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), notes);
-  // @@protoc_insertion_point(field_set_allocated:FaceServiceInfo.notes)
+  records_ = records;
+  // @@protoc_insertion_point(field_set_allocated:GalleryChunk.records)
 }
 
 // -------------------------------------------------------------------
 
-// GalleryListRequest
-
-// -------------------------------------------------------------------
-
-// GalleryDeleteRequest
+// GalleryImportResponse
 
 // string gallery_name = 1;
-inline void GalleryDeleteRequest::clear_gallery_name() {
+inline void GalleryImportResponse::clear_gallery_name() {
   gallery_name_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline const std::string& GalleryDeleteRequest::gallery_name() const {
-  // @@protoc_insertion_point(field_get:GalleryDeleteRequest.gallery_name)
+inline const std::string& GalleryImportResponse::gallery_name() const {
+  // @@protoc_insertion_point(field_get:GalleryImportResponse.gallery_name)
   return gallery_name_.GetNoArena();
 }
-inline void GalleryDeleteRequest::set_gallery_name(const std::string& value) {
+inline void GalleryImportResponse::set_gallery_name(const std::string& value) {
   
   gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
-  // @@protoc_insertion_point(field_set:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_set:GalleryImportResponse.gallery_name)
 }
-inline void GalleryDeleteRequest::set_gallery_name(std::string&& value) {
+inline void GalleryImportResponse::set_gallery_name(std::string&& value) {
   
   gallery_name_.SetNoArena(
     &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
-  // @@protoc_insertion_point(field_set_rvalue:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_set_rvalue:GalleryImportResponse.gallery_name)
 }
-inline void GalleryDeleteRequest::set_gallery_name(const char* value) {
+inline void GalleryImportResponse::set_gallery_name(const char* value) {
   GOOGLE_DCHECK(value != nullptr);
   
   gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
-  // @@protoc_insertion_point(field_set_char:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_set_char:GalleryImportResponse.gallery_name)
 }
-inline void GalleryDeleteRequest::set_gallery_name(const char* value, size_t size) {
+inline void GalleryImportResponse::set_gallery_name(const char* value, size_t size) {
   
   gallery_name_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
       ::std::string(reinterpret_cast<const char*>(value), size));
-  // @@protoc_insertion_point(field_set_pointer:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_set_pointer:GalleryImportResponse.gallery_name)
 }
-inline std::string* GalleryDeleteRequest::mutable_gallery_name() {
+inline std::string* GalleryImportResponse::mutable_gallery_name() {
   
-  // @@protoc_insertion_point(field_mutable:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_mutable:GalleryImportResponse.gallery_name)
   return gallery_name_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline std::string* GalleryDeleteRequest::release_gallery_name() {
-  // @@protoc_insertion_point(field_release:GalleryDeleteRequest.gallery_name)
+inline std::string* GalleryImportResponse::release_gallery_name() {
+  // @@protoc_insertion_point(field_release:GalleryImportResponse.gallery_name)
   
   return gallery_name_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
 }
-inline void GalleryDeleteRequest::set_allocated_gallery_name(std::string* gallery_name) {
+inline void GalleryImportResponse::set_allocated_gallery_name(std::string* gallery_name) {
   if (gallery_name != nullptr) {
     
   } else {
     
   }
   gallery_name_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_name);
-  // @@protoc_insertion_point(field_set_allocated:GalleryDeleteRequest.gallery_name)
+  // @@protoc_insertion_point(field_set_allocated:GalleryImportResponse.gallery_name)
+}
+
+// string file_id = 2;
+inline void GalleryImportResponse::clear_file_id() {
+  file_id_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& GalleryImportResponse::file_id() const {
+  // @@protoc_insertion_point(field_get:GalleryImportResponse.file_id)
+  return file_id_.GetNoArena();
+}
+inline void GalleryImportResponse::set_file_id(const std::string& value) {
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryImportResponse.file_id)
+}
+inline void GalleryImportResponse::set_file_id(std::string&& value) {
+  
+  file_id_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryImportResponse.file_id)
+}
+inline void GalleryImportResponse::set_file_id(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryImportResponse.file_id)
+}
+inline void GalleryImportResponse::set_file_id(const char* value, size_t size) {
+  
+  file_id_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryImportResponse.file_id)
+}
+inline std::string* GalleryImportResponse::mutable_file_id() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryImportResponse.file_id)
+  return file_id_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryImportResponse::release_file_id() {
+  // @@protoc_insertion_point(field_release:GalleryImportResponse.file_id)
+  
+  return file_id_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryImportResponse::set_allocated_file_id(std::string* file_id) {
+  if (file_id != nullptr) {
+    
+  } else {
+    
+  }
+  file_id_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), file_id);
+  // @@protoc_insertion_point(field_set_allocated:GalleryImportResponse.file_id)
+}
+
+// int64 next_row = 3;
+inline void GalleryImportResponse::clear_next_row() {
+  next_row_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryImportResponse::next_row() const {
+  // @@protoc_insertion_point(field_get:GalleryImportResponse.next_row)
+  return next_row_;
+}
+inline void GalleryImportResponse::set_next_row(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  next_row_ = value;
+  // @@protoc_insertion_point(field_set:GalleryImportResponse.next_row)
+}
+
+// int64 enroll_count = 4;
+inline void GalleryImportResponse::clear_enroll_count() {
+  enroll_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryImportResponse::enroll_count() const {
+  // @@protoc_insertion_point(field_get:GalleryImportResponse.enroll_count)
+  return enroll_count_;
+}
+inline void GalleryImportResponse::set_enroll_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  enroll_count_ = value;
+  // @@protoc_insertion_point(field_set:GalleryImportResponse.enroll_count)
+}
+
+// int64 replace_count = 5;
+inline void GalleryImportResponse::clear_replace_count() {
+  replace_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryImportResponse::replace_count() const {
+  // @@protoc_insertion_point(field_get:GalleryImportResponse.replace_count)
+  return replace_count_;
+}
+inline void GalleryImportResponse::set_replace_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  replace_count_ = value;
+  // @@protoc_insertion_point(field_set:GalleryImportResponse.replace_count)
 }
 
 // -------------------------------------------------------------------
@@ -11532,6 +16602,75 @@ inline void EnrollmentDeleteRequest::set_allocated_subject_id(std::string* subje
   // @@protoc_insertion_point(field_set_allocated:EnrollmentDeleteRequest.subject_id)
 }
 
+// string gallery_key = 3;
+inline void EnrollmentDeleteRequest::clear_gallery_key() {
+  gallery_key_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& EnrollmentDeleteRequest::gallery_key() const {
+  // @@protoc_insertion_point(field_get:EnrollmentDeleteRequest.gallery_key)
+  return gallery_key_.GetNoArena();
+}
+inline void EnrollmentDeleteRequest::set_gallery_key(const std::string& value) {
+  
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:EnrollmentDeleteRequest.gallery_key)
+}
+inline void EnrollmentDeleteRequest::set_gallery_key(std::string&& value) {
+  
+  gallery_key_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:EnrollmentDeleteRequest.gallery_key)
+}
+inline void EnrollmentDeleteRequest::set_gallery_key(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:EnrollmentDeleteRequest.gallery_key)
+}
+inline void EnrollmentDeleteRequest::set_gallery_key(const char* value, size_t size) {
+  
+  gallery_key_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:EnrollmentDeleteRequest.gallery_key)
+}
+inline std::string* EnrollmentDeleteRequest::mutable_gallery_key() {
+  
+  // @@protoc_insertion_point(field_mutable:EnrollmentDeleteRequest.gallery_key)
+  return gallery_key_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* EnrollmentDeleteRequest::release_gallery_key() {
+  // @@protoc_insertion_point(field_release:EnrollmentDeleteRequest.gallery_key)
+  
+  return gallery_key_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void EnrollmentDeleteRequest::set_allocated_gallery_key(std::string* gallery_key) {
+  if (gallery_key != nullptr) {
+    
+  } else {
+    
+  }
+  gallery_key_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), gallery_key);
+  // @@protoc_insertion_point(field_set_allocated:EnrollmentDeleteRequest.gallery_key)
+}
+
+// -------------------------------------------------------------------
+
+// EnrollmentDeleteResponse
+
+// int64 delete_count = 1;
+inline void EnrollmentDeleteResponse::clear_delete_count() {
+  delete_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 EnrollmentDeleteResponse::delete_count() const {
+  // @@protoc_insertion_point(field_get:EnrollmentDeleteResponse.delete_count)
+  return delete_count_;
+}
+inline void EnrollmentDeleteResponse::set_delete_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  delete_count_ = value;
+  // @@protoc_insertion_point(field_set:EnrollmentDeleteResponse.delete_count)
+}
+
 // -------------------------------------------------------------------
 
 // GalleryInfo
@@ -11601,6 +16740,113 @@ inline void GalleryInfo::set_face_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
   // @@protoc_insertion_point(field_set:GalleryInfo.face_count)
 }
 
+// int64 subject_count = 3;
+inline void GalleryInfo::clear_subject_count() {
+  subject_count_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryInfo::subject_count() const {
+  // @@protoc_insertion_point(field_get:GalleryInfo.subject_count)
+  return subject_count_;
+}
+inline void GalleryInfo::set_subject_count(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  subject_count_ = value;
+  // @@protoc_insertion_point(field_set:GalleryInfo.subject_count)
+}
+
+// int32 template_dim = 4;
+inline void GalleryInfo::clear_template_dim() {
+  template_dim_ = 0;
+}
+inline ::PROTOBUF_NAMESPACE_ID::int32 GalleryInfo::template_dim() const {
+  // @@protoc_insertion_point(field_get:GalleryInfo.template_dim)
+  return template_dim_;
+}
+inline void GalleryInfo::set_template_dim(::PROTOBUF_NAMESPACE_ID::int32 value) {
+  
+  template_dim_ = value;
+  // @@protoc_insertion_point(field_set:GalleryInfo.template_dim)
+}
+
+// int64 file_bytes = 5;
+inline void GalleryInfo::clear_file_bytes() {
+  file_bytes_ = PROTOBUF_LONGLONG(0);
+}
+inline ::PROTOBUF_NAMESPACE_ID::int64 GalleryInfo::file_bytes() const {
+  // @@protoc_insertion_point(field_get:GalleryInfo.file_bytes)
+  return file_bytes_;
+}
+inline void GalleryInfo::set_file_bytes(::PROTOBUF_NAMESPACE_ID::int64 value) {
+  
+  file_bytes_ = value;
+  // @@protoc_insertion_point(field_set:GalleryInfo.file_bytes)
+}
+
+// string index_state = 6;
+inline void GalleryInfo::clear_index_state() {
+  index_state_.ClearToEmptyNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline const std::string& GalleryInfo::index_state() const {
+  // @@protoc_insertion_point(field_get:GalleryInfo.index_state)
+  return index_state_.GetNoArena();
+}
+inline void GalleryInfo::set_index_state(const std::string& value) {
+  
+  index_state_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), value);
+  // @@protoc_insertion_point(field_set:GalleryInfo.index_state)
+}
+inline void GalleryInfo::set_index_state(std::string&& value) {
+  
+  index_state_.SetNoArena(
+    &::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::move(value));
+  // @@protoc_insertion_point(field_set_rvalue:GalleryInfo.index_state)
+}
+inline void GalleryInfo::set_index_state(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  
+  index_state_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), ::std::string(value));
+  // @@protoc_insertion_point(field_set_char:GalleryInfo.index_state)
+}
+inline void GalleryInfo::set_index_state(const char* value, size_t size) {
+  
+  index_state_.SetNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(),
+      ::std::string(reinterpret_cast<const char*>(value), size));
+  // @@protoc_insertion_point(field_set_pointer:GalleryInfo.index_state)
+}
+inline std::string* GalleryInfo::mutable_index_state() {
+  
+  // @@protoc_insertion_point(field_mutable:GalleryInfo.index_state)
+  return index_state_.MutableNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline std::string* GalleryInfo::release_index_state() {
+  // @@protoc_insertion_point(field_release:GalleryInfo.index_state)
+  
+  return index_state_.ReleaseNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited());
+}
+inline void GalleryInfo::set_allocated_index_state(std::string* index_state) {
+  if (index_state != nullptr) {
+    
+  } else {
+    
+  }
+  index_state_.SetAllocatedNoArena(&::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited(), index_state);
+  // @@protoc_insertion_point(field_set_allocated:GalleryInfo.index_state)
+}
+
+// double modified = 7;
+inline void GalleryInfo::clear_modified() {
+  modified_ = 0;
+}
+inline double GalleryInfo::modified() const {
+  // @@protoc_insertion_point(field_get:GalleryInfo.modified)
+  return modified_;
+}
+inline void GalleryInfo::set_modified(double value) {
+  
+  modified_ = value;
+  // @@protoc_insertion_point(field_set:GalleryInfo.modified)
+}
+
 // -------------------------------------------------------------------
 
 // GalleryList
@@ -11716,6 +16962,36 @@ GalleryList::galleries() const {
 
 // -------------------------------------------------------------------
 
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
 
 // @@protoc_insertion_point(namespace_scope)
 
@@ -83,6 +83,7 @@ proto.DetectionOptions.toObject = function(includeInstance, msg) {
     minSize: jspb.Message.getFieldWithDefault(msg, 7, 0),
     saveRequest: jspb.Message.getBooleanFieldWithDefault(msg, 9, false),
     debug: jspb.Message.getBooleanFieldWithDefault(msg, 10, false),
+    downsample: jspb.Message.getFieldWithDefault(msg, 11, 0),
     attributesList: jspb.Message.toObjectList(msg.getAttributesList(),
     proto.Attribute.toObject, includeInstance)
   };
@@ -157,6 +158,10 @@ proto.DetectionOptions.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {boolean} */ (reader.readBool());
       msg.setDebug(value);
       break;
+    case 11:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setDownsample(value);
+      break;
     case 8:
       var value = new proto.Attribute;
       reader.readMessage(value,proto.Attribute.deserializeBinaryFromReader);
@@ -254,6 +259,13 @@ proto.DetectionOptions.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getDownsample();
+  if (f !== 0) {
+    writer.writeInt32(
+      11,
+      f
+    );
+  }
   f = message.getAttributesList();
   if (f.length > 0) {
     writer.writeRepeatedMessage(
@@ -400,6 +412,21 @@ proto.DetectionOptions.prototype.setDebug = function(value) {
 };
 
 
+/**
+ * optional int32 downsample = 11;
+ * @return {number}
+ */
+proto.DetectionOptions.prototype.getDownsample = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 11, 0));
+};
+
+
+/** @param {number} value */
+proto.DetectionOptions.prototype.setDownsample = function(value) {
+  jspb.Message.setProto3IntField(this, 11, value);
+};
+
+
 /**
  * repeated Attribute attributes = 8;
  * @return {!Array<!proto.Attribute>}
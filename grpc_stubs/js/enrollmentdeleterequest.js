@@ -67,7 +67,8 @@ proto.EnrollmentDeleteRequest.prototype.toObject = function(opt_includeInstance)
 proto.EnrollmentDeleteRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
     galleryName: jspb.Message.getFieldWithDefault(msg, 1, ""),
-    subjectId: jspb.Message.getFieldWithDefault(msg, 2, "")
+    subjectId: jspb.Message.getFieldWithDefault(msg, 2, ""),
+    galleryKey: jspb.Message.getFieldWithDefault(msg, 3, "")
   };
 
   if (includeInstance) {
@@ -112,6 +113,10 @@ proto.EnrollmentDeleteRequest.deserializeBinaryFromReader = function(msg, reader
       var value = /** @type {string} */ (reader.readString());
       msg.setSubjectId(value);
       break;
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGalleryKey(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -155,6 +160,13 @@ proto.EnrollmentDeleteRequest.serializeBinaryToWriter = function(message, writer
       f
     );
   }
+  f = message.getGalleryKey();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
 };
 
 
@@ -188,3 +200,18 @@ proto.EnrollmentDeleteRequest.prototype.setSubjectId = function(value) {
 };
 
 
+/**
+ * optional string gallery_key = 3;
+ * @return {string}
+ */
+proto.EnrollmentDeleteRequest.prototype.getGalleryKey = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/** @param {string} value */
+proto.EnrollmentDeleteRequest.prototype.setGalleryKey = function(value) {
+  jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
@@ -77,7 +77,9 @@ proto.EnrollOptions.toObject = function(includeInstance, msg) {
     saveRequest: jspb.Message.getBooleanFieldWithDefault(msg, 2, false),
     debug: jspb.Message.getBooleanFieldWithDefault(msg, 3, false),
     attributesList: jspb.Message.toObjectList(msg.getAttributesList(),
-    proto.Attribute.toObject, includeInstance)
+    proto.Attribute.toObject, includeInstance),
+    dedupDistance: jspb.Message.getFloatingPointFieldWithDefault(msg, 9, 0.0),
+    dedupMerge: jspb.Message.getBooleanFieldWithDefault(msg, 10, false)
   };
 
   if (includeInstance) {
@@ -127,6 +129,14 @@ proto.EnrollOptions.deserializeBinaryFromReader = function(msg, reader) {
       reader.readMessage(value,proto.Attribute.deserializeBinaryFromReader);
       msg.addAttributes(value);
       break;
+    case 9:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setDedupDistance(value);
+      break;
+    case 10:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setDedupMerge(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -178,6 +188,20 @@ proto.EnrollOptions.serializeBinaryToWriter = function(message, writer) {
       proto.Attribute.serializeBinaryToWriter
     );
   }
+  f = message.getDedupDistance();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      9,
+      f
+    );
+  }
+  f = message.getDedupMerge();
+  if (f) {
+    writer.writeBool(
+      10,
+      f
+    );
+  }
 };
 
 
@@ -245,3 +269,33 @@ proto.EnrollOptions.prototype.clearAttributesList = function() {
 };
 
 
+/**
+ * optional float dedup_distance = 9;
+ * @return {number}
+ */
+proto.EnrollOptions.prototype.getDedupDistance = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 9, 0.0));
+};
+
+
+/** @param {number} value */
+proto.EnrollOptions.prototype.setDedupDistance = function(value) {
+  jspb.Message.setProto3FloatField(this, 9, value);
+};
+
+
+/**
+ * optional bool dedup_merge = 10;
+ * @return {boolean}
+ */
+proto.EnrollOptions.prototype.getDedupMerge = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 10, false));
+};
+
+
+/** @param {boolean} value */
+proto.EnrollOptions.prototype.setDedupMerge = function(value) {
+  jspb.Message.setProto3BooleanField(this, 10, value);
+};
+
+
@@ -16,6 +16,7 @@ goog.require('jspb.Message');
 goog.require('proto.AccessRecord');
 goog.require('proto.Attribute');
 goog.require('proto.Detection');
+goog.require('proto.EnrollStats');
 goog.require('proto.FaceTemplate');
 goog.require('proto.Image');
 goog.require('proto.Landmark');
@@ -105,6 +106,7 @@ proto.FaceRecord.toObject = function(includeInstance, msg) {
     name: jspb.Message.getFieldWithDefault(msg, 5, ""),
     source: jspb.Message.getFieldWithDefault(msg, 4, ""),
     frame: jspb.Message.getFieldWithDefault(msg, 14, 0),
+    algorithm: jspb.Message.getFieldWithDefault(msg, 20, ""),
     notes: jspb.Message.getFieldWithDefault(msg, 6, ""),
     galleryKey: jspb.Message.getFieldWithDefault(msg, 15, ""),
     collectionDate: jspb.Message.getFloatingPointFieldWithDefault(msg, 16, 0.0),
@@ -177,6 +179,10 @@ proto.FaceRecord.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {number} */ (reader.readInt64());
       msg.setFrame(value);
       break;
+    case 20:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setAlgorithm(value);
+      break;
     case 6:
       var value = /** @type {string} */ (reader.readString());
       msg.setNotes(value);
@@ -304,6 +310,13 @@ proto.FaceRecord.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getAlgorithm();
+  if (f.length > 0) {
+    writer.writeString(
+      20,
+      f
+    );
+  }
   f = message.getNotes();
   if (f.length > 0) {
     writer.writeString(
@@ -482,6 +495,21 @@ proto.FaceRecord.prototype.setFrame = function(value) {
 };
 
 
+/**
+ * optional string algorithm = 20;
+ * @return {string}
+ */
+proto.FaceRecord.prototype.getAlgorithm = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 20, ""));
+};
+
+
+/** @param {string} value */
+proto.FaceRecord.prototype.setAlgorithm = function(value) {
+  jspb.Message.setProto3StringField(this, 20, value);
+};
+
+
 /**
  * optional string notes = 6;
  * @return {string}
@@ -932,7 +960,8 @@ proto.FaceRecordList.prototype.toObject = function(opt_includeInstance) {
 proto.FaceRecordList.toObject = function(includeInstance, msg) {
   var f, obj = {
     faceRecordsList: jspb.Message.toObjectList(msg.getFaceRecordsList(),
-    proto.FaceRecord.toObject, includeInstance)
+    proto.FaceRecord.toObject, includeInstance),
+    enrollStats: (f = msg.getEnrollStats()) && proto.EnrollStats.toObject(includeInstance, f)
   };
 
   if (includeInstance) {
@@ -974,6 +1003,11 @@ proto.FaceRecordList.deserializeBinaryFromReader = function(msg, reader) {
       reader.readMessage(value,proto.FaceRecord.deserializeBinaryFromReader);
       msg.addFaceRecords(value);
       break;
+    case 3:
+      var value = new proto.EnrollStats;
+      reader.readMessage(value,proto.EnrollStats.deserializeBinaryFromReader);
+      msg.setEnrollStats(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -1011,6 +1045,14 @@ proto.FaceRecordList.serializeBinaryToWriter = function(message, writer) {
       proto.FaceRecord.serializeBinaryToWriter
     );
   }
+  f = message.getEnrollStats();
+  if (f != null) {
+    writer.writeMessage(
+      3,
+      f,
+      proto.EnrollStats.serializeBinaryToWriter
+    );
+  }
 };
 
 
@@ -1048,3 +1090,36 @@ proto.FaceRecordList.prototype.clearFaceRecordsList = function() {
 };
 
 
+/**
+ * optional EnrollStats enroll_stats = 3;
+ * @return {?proto.EnrollStats}
+ */
+proto.FaceRecordList.prototype.getEnrollStats = function() {
+  return /** @type{?proto.EnrollStats} */ (
+    jspb.Message.getWrapperField(this, proto.EnrollStats, 3));
+};
+
+
+/** @param {?proto.EnrollStats|undefined} value */
+proto.FaceRecordList.prototype.setEnrollStats = function(value) {
+  jspb.Message.setWrapperField(this, 3, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ */
+proto.FaceRecordList.prototype.clearEnrollStats = function() {
+  this.setEnrollStats(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.FaceRecordList.prototype.hasEnrollStats = function() {
+  return jspb.Message.getField(this, 3) != null;
+};
+
+
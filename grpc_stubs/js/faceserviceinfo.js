@@ -12,6 +12,7 @@ goog.provide('proto.FaceServiceInfo');
 goog.require('jspb.BinaryReader');
 goog.require('jspb.BinaryWriter');
 goog.require('jspb.Message');
+goog.require('proto.GalleryCacheStats');
 
 goog.forwardDeclare('proto.ScoreType');
 goog.forwardDeclare('proto.ServiceStatus');
@@ -78,7 +79,10 @@ proto.FaceServiceInfo.toObject = function(includeInstance, msg) {
     detectionThreshold: jspb.Message.getFloatingPointFieldWithDefault(msg, 8, 0.0),
     matchThreshold: jspb.Message.getFloatingPointFieldWithDefault(msg, 9, 0.0),
     algorithm: jspb.Message.getFieldWithDefault(msg, 10, ""),
-    notes: jspb.Message.getFieldWithDefault(msg, 11, "")
+    notes: jspb.Message.getFieldWithDefault(msg, 11, ""),
+    faroVersion: jspb.Message.getFieldWithDefault(msg, 12, ""),
+    instanceName: jspb.Message.getFieldWithDefault(msg, 13, ""),
+    galleryCache: (f = msg.getGalleryCache()) && proto.GalleryCacheStats.toObject(includeInstance, f)
   };
 
   if (includeInstance) {
@@ -159,6 +163,19 @@ proto.FaceServiceInfo.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {string} */ (reader.readString());
       msg.setNotes(value);
       break;
+    case 12:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setFaroVersion(value);
+      break;
+    case 13:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setInstanceName(value);
+      break;
+    case 14:
+      var value = new proto.GalleryCacheStats;
+      reader.readMessage(value,proto.GalleryCacheStats.deserializeBinaryFromReader);
+      msg.setGalleryCache(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -265,6 +282,28 @@ proto.FaceServiceInfo.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getFaroVersion();
+  if (f.length > 0) {
+    writer.writeString(
+      12,
+      f
+    );
+  }
+  f = message.getInstanceName();
+  if (f.length > 0) {
+    writer.writeString(
+      13,
+      f
+    );
+  }
+  f = message.getGalleryCache();
+  if (f != null) {
+    writer.writeMessage(
+      14,
+      f,
+      proto.GalleryCacheStats.serializeBinaryToWriter
+    );
+  }
 };
 
 
@@ -433,3 +472,66 @@ proto.FaceServiceInfo.prototype.setNotes = function(value) {
 };
 
 
+/**
+ * optional string faro_version = 12;
+ * @return {string}
+ */
+proto.FaceServiceInfo.prototype.getFaroVersion = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 12, ""));
+};
+
+
+/** @param {string} value */
+proto.FaceServiceInfo.prototype.setFaroVersion = function(value) {
+  jspb.Message.setProto3StringField(this, 12, value);
+};
+
+
+/**
+ * optional string instance_name = 13;
+ * @return {string}
+ */
+proto.FaceServiceInfo.prototype.getInstanceName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 13, ""));
+};
+
+
+/** @param {string} value */
+proto.FaceServiceInfo.prototype.setInstanceName = function(value) {
+  jspb.Message.setProto3StringField(this, 13, value);
+};
+
+
+/**
+ * optional GalleryCacheStats gallery_cache = 14;
+ * @return {?proto.GalleryCacheStats}
+ */
+proto.FaceServiceInfo.prototype.getGalleryCache = function() {
+  return /** @type{?proto.GalleryCacheStats} */ (
+    jspb.Message.getWrapperField(this, proto.GalleryCacheStats, 14));
+};
+
+
+/** @param {?proto.GalleryCacheStats|undefined} value */
+proto.FaceServiceInfo.prototype.setGalleryCache = function(value) {
+  jspb.Message.setWrapperField(this, 14, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ */
+proto.FaceServiceInfo.prototype.clearGalleryCache = function() {
+  this.setGalleryCache(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.FaceServiceInfo.prototype.hasGalleryCache = function() {
+  return jspb.Message.getField(this, 14) != null;
+};
+
+
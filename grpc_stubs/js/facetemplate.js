@@ -68,7 +68,8 @@ proto.FaceTemplate.prototype.toObject = function(opt_includeInstance) {
 proto.FaceTemplate.toObject = function(includeInstance, msg) {
   var f, obj = {
     data: (f = msg.getData()) && proto.Vector.toObject(includeInstance, f),
-    buffer: msg.getBuffer_asB64()
+    buffer: msg.getBuffer_asB64(),
+    algorithm: jspb.Message.getFieldWithDefault(msg, 3, "")
   };
 
   if (includeInstance) {
@@ -114,6 +115,10 @@ proto.FaceTemplate.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {!Uint8Array} */ (reader.readBytes());
       msg.setBuffer(value);
       break;
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setAlgorithm(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -158,6 +163,13 @@ proto.FaceTemplate.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getAlgorithm();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
 };
 
 
@@ -233,3 +245,18 @@ proto.FaceTemplate.prototype.setBuffer = function(value) {
 };
 
 
+/**
+ * optional string algorithm = 3;
+ * @return {string}
+ */
+proto.FaceTemplate.prototype.getAlgorithm = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/** @param {string} value */
+proto.FaceTemplate.prototype.setAlgorithm = function(value) {
+  jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
@@ -30,6 +30,17 @@ var faro_proto_face_service_pb = require('../../faro/proto/face_service_pb.js');
 var faro_proto_image_pb = require('../../faro/proto/image_pb.js');
 var faro_proto_geometry_pb = require('../../faro/proto/geometry_pb.js');
 
+function serialize_BulkEnrollResponse(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.BulkEnrollResponse)) {
+    throw new Error('Expected argument of type BulkEnrollResponse');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_BulkEnrollResponse(buffer_arg) {
+  return faro_proto_face_service_pb.BulkEnrollResponse.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_DetectExtractEnrollRequest(arg) {
   if (!(arg instanceof faro_proto_face_service_pb.DetectExtractEnrollRequest)) {
     throw new Error('Expected argument of type DetectExtractEnrollRequest');
@@ -107,6 +118,17 @@ function deserialize_EnrollmentDeleteRequest(buffer_arg) {
   return faro_proto_face_service_pb.EnrollmentDeleteRequest.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_EnrollmentDeleteResponse(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.EnrollmentDeleteResponse)) {
+    throw new Error('Expected argument of type EnrollmentDeleteResponse');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_EnrollmentDeleteResponse(buffer_arg) {
+  return faro_proto_face_service_pb.EnrollmentDeleteResponse.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_EnrollmentListRequest(arg) {
   if (!(arg instanceof faro_proto_face_service_pb.EnrollmentListRequest)) {
     throw new Error('Expected argument of type EnrollmentListRequest');
@@ -162,6 +184,50 @@ function deserialize_FaceStatusRequest(buffer_arg) {
   return faro_proto_face_service_pb.FaceStatusRequest.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_GalleryChunk(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryChunk)) {
+    throw new Error('Expected argument of type GalleryChunk');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryChunk(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryChunk.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_GalleryCompactRequest(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryCompactRequest)) {
+    throw new Error('Expected argument of type GalleryCompactRequest');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryCompactRequest(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryCompactRequest.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_GalleryCompactResponse(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryCompactResponse)) {
+    throw new Error('Expected argument of type GalleryCompactResponse');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryCompactResponse(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryCompactResponse.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_GalleryConfigureRequest(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryConfigureRequest)) {
+    throw new Error('Expected argument of type GalleryConfigureRequest');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryConfigureRequest(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryConfigureRequest.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_GalleryDeleteRequest(arg) {
   if (!(arg instanceof faro_proto_face_service_pb.GalleryDeleteRequest)) {
     throw new Error('Expected argument of type GalleryDeleteRequest');
@@ -173,6 +239,28 @@ function deserialize_GalleryDeleteRequest(buffer_arg) {
   return faro_proto_face_service_pb.GalleryDeleteRequest.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_GalleryExportRequest(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryExportRequest)) {
+    throw new Error('Expected argument of type GalleryExportRequest');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryExportRequest(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryExportRequest.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_GalleryImportResponse(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.GalleryImportResponse)) {
+    throw new Error('Expected argument of type GalleryImportResponse');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_GalleryImportResponse(buffer_arg) {
+  return faro_proto_face_service_pb.GalleryImportResponse.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_GalleryList(arg) {
   if (!(arg instanceof faro_proto_face_service_pb.GalleryList)) {
     throw new Error('Expected argument of type GalleryList');
@@ -195,6 +283,28 @@ function deserialize_GalleryListRequest(buffer_arg) {
   return faro_proto_face_service_pb.GalleryListRequest.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_MatchDistribution(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.MatchDistribution)) {
+    throw new Error('Expected argument of type MatchDistribution');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_MatchDistribution(buffer_arg) {
+  return faro_proto_face_service_pb.MatchDistribution.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_MatchDistributionRequest(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.MatchDistributionRequest)) {
+    throw new Error('Expected argument of type MatchDistributionRequest');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_MatchDistributionRequest(buffer_arg) {
+  return faro_proto_face_service_pb.MatchDistributionRequest.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_Matrix(arg) {
   if (!(arg instanceof faro_proto_geometry_pb.Matrix)) {
     throw new Error('Expected argument of type Matrix');
@@ -206,6 +316,17 @@ function deserialize_Matrix(buffer_arg) {
   return faro_proto_geometry_pb.Matrix.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_ScoreBlock(arg) {
+  if (!(arg instanceof faro_proto_face_service_pb.ScoreBlock)) {
+    throw new Error('Expected argument of type ScoreBlock');
+  }
+  return new Buffer(arg.serializeBinary());
+}
+
+function deserialize_ScoreBlock(buffer_arg) {
+  return faro_proto_face_service_pb.ScoreBlock.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_ScoreRequest(arg) {
   if (!(arg instanceof faro_proto_face_service_pb.ScoreRequest)) {
     throw new Error('Expected argument of type ScoreRequest');
@@ -276,6 +397,17 @@ var FaceRecognitionService = exports.FaceRecognitionService = {
     responseSerialize: serialize_Matrix,
     responseDeserialize: deserialize_Matrix,
   },
+  scoreStream: {
+    path: '/FaceRecognition/scoreStream',
+    requestStream: false,
+    responseStream: true,
+    requestType: faro_proto_face_service_pb.ScoreRequest,
+    responseType: faro_proto_face_service_pb.ScoreBlock,
+    requestSerialize: serialize_ScoreRequest,
+    requestDeserialize: deserialize_ScoreRequest,
+    responseSerialize: serialize_ScoreBlock,
+    responseDeserialize: deserialize_ScoreBlock,
+  },
   enroll: {
     path: '/FaceRecognition/enroll',
     requestStream: false,
@@ -287,6 +419,17 @@ var FaceRecognitionService = exports.FaceRecognitionService = {
     responseSerialize: serialize_FaceRecordList,
     responseDeserialize: deserialize_FaceRecordList,
   },
+  bulkEnroll: {
+    path: '/FaceRecognition/bulkEnroll',
+    requestStream: true,
+    responseStream: false,
+    requestType: faro_proto_face_service_pb.EnrollRequest,
+    responseType: faro_proto_face_service_pb.BulkEnrollResponse,
+    requestSerialize: serialize_EnrollRequest,
+    requestDeserialize: deserialize_EnrollRequest,
+    responseSerialize: serialize_BulkEnrollResponse,
+    responseDeserialize: deserialize_BulkEnrollResponse,
+  },
   search: {
     path: '/FaceRecognition/search',
     requestStream: false,
@@ -355,6 +498,50 @@ var FaceRecognitionService = exports.FaceRecognitionService = {
     responseSerialize: serialize_Empty,
     responseDeserialize: deserialize_Empty,
   },
+  galleryConfigure: {
+    path: '/FaceRecognition/galleryConfigure',
+    requestStream: false,
+    responseStream: false,
+    requestType: faro_proto_face_service_pb.GalleryConfigureRequest,
+    responseType: faro_proto_face_service_pb.Empty,
+    requestSerialize: serialize_GalleryConfigureRequest,
+    requestDeserialize: deserialize_GalleryConfigureRequest,
+    responseSerialize: serialize_Empty,
+    responseDeserialize: deserialize_Empty,
+  },
+  galleryCompact: {
+    path: '/FaceRecognition/galleryCompact',
+    requestStream: false,
+    responseStream: false,
+    requestType: faro_proto_face_service_pb.GalleryCompactRequest,
+    responseType: faro_proto_face_service_pb.GalleryCompactResponse,
+    requestSerialize: serialize_GalleryCompactRequest,
+    requestDeserialize: deserialize_GalleryCompactRequest,
+    responseSerialize: serialize_GalleryCompactResponse,
+    responseDeserialize: deserialize_GalleryCompactResponse,
+  },
+  galleryExport: {
+    path: '/FaceRecognition/galleryExport',
+    requestStream: false,
+    responseStream: true,
+    requestType: faro_proto_face_service_pb.GalleryExportRequest,
+    responseType: faro_proto_face_service_pb.GalleryChunk,
+    requestSerialize: serialize_GalleryExportRequest,
+    requestDeserialize: deserialize_GalleryExportRequest,
+    responseSerialize: serialize_GalleryChunk,
+    responseDeserialize: deserialize_GalleryChunk,
+  },
+  galleryImport: {
+    path: '/FaceRecognition/galleryImport',
+    requestStream: true,
+    responseStream: true,
+    requestType: faro_proto_face_service_pb.GalleryChunk,
+    responseType: faro_proto_face_service_pb.GalleryImportResponse,
+    requestSerialize: serialize_GalleryChunk,
+    requestDeserialize: deserialize_GalleryChunk,
+    responseSerialize: serialize_GalleryImportResponse,
+    responseDeserialize: deserialize_GalleryImportResponse,
+  },
   enrollmentList: {
     path: '/FaceRecognition/enrollmentList',
     requestStream: false,
@@ -366,39 +553,56 @@ var FaceRecognitionService = exports.FaceRecognitionService = {
     responseSerialize: serialize_FaceRecordList,
     responseDeserialize: deserialize_FaceRecordList,
   },
-  enrollmentDelete: {
-    path: '/FaceRecognition/enrollmentDelete',
+  trainFromGallery: {
+    path: '/FaceRecognition/trainFromGallery',
     requestStream: false,
     responseStream: false,
-    requestType: faro_proto_face_service_pb.EnrollmentDeleteRequest,
-    responseType: faro_proto_face_service_pb.FaceRecordList,
-    requestSerialize: serialize_EnrollmentDeleteRequest,
-    requestDeserialize: deserialize_EnrollmentDeleteRequest,
-    responseSerialize: serialize_FaceRecordList,
-    responseDeserialize: deserialize_FaceRecordList,
+    requestType: faro_proto_face_service_pb.EnrollmentListRequest,
+    responseType: faro_proto_face_service_pb.Empty,
+    requestSerialize: serialize_EnrollmentListRequest,
+    requestDeserialize: deserialize_EnrollmentListRequest,
+    responseSerialize: serialize_Empty,
+    responseDeserialize: deserialize_Empty,
   },
-  enrollmentDeleteConditional: {
-    path: '/FaceRecognition/enrollmentDeleteConditional',
+  subjectDelete: {
+    path: '/FaceRecognition/subjectDelete',
     requestStream: false,
     responseStream: false,
     requestType: faro_proto_face_service_pb.EnrollmentDeleteRequest,
-    responseType: faro_proto_face_service_pb.FaceRecordList,
+    responseType: faro_proto_face_service_pb.EnrollmentDeleteResponse,
     requestSerialize: serialize_EnrollmentDeleteRequest,
     requestDeserialize: deserialize_EnrollmentDeleteRequest,
-    responseSerialize: serialize_FaceRecordList,
-    responseDeserialize: deserialize_FaceRecordList,
+    responseSerialize: serialize_EnrollmentDeleteResponse,
+    responseDeserialize: deserialize_EnrollmentDeleteResponse,
   },
-  enrollmentTransfer: {
-    path: '/FaceRecognition/enrollmentTransfer',
+  generateMatchDistribution: {
+    path: '/FaceRecognition/generateMatchDistribution',
     requestStream: false,
     responseStream: false,
-    requestType: faro_proto_face_service_pb.EnrollmentDeleteRequest,
-    responseType: faro_proto_face_service_pb.FaceRecordList,
-    requestSerialize: serialize_EnrollmentDeleteRequest,
-    requestDeserialize: deserialize_EnrollmentDeleteRequest,
-    responseSerialize: serialize_FaceRecordList,
-    responseDeserialize: deserialize_FaceRecordList,
+    requestType: faro_proto_face_service_pb.EnrollmentListRequest,
+    responseType: faro_proto_geometry_pb.Matrix,
+    requestSerialize: serialize_EnrollmentListRequest,
+    requestDeserialize: deserialize_EnrollmentListRequest,
+    responseSerialize: serialize_Matrix,
+    responseDeserialize: deserialize_Matrix,
+  },
+  matchDistribution: {
+    path: '/FaceRecognition/matchDistribution',
+    requestStream: false,
+    responseStream: true,
+    requestType: faro_proto_face_service_pb.MatchDistributionRequest,
+    responseType: faro_proto_face_service_pb.MatchDistribution,
+    requestSerialize: serialize_MatchDistributionRequest,
+    requestDeserialize: deserialize_MatchDistributionRequest,
+    responseSerialize: serialize_MatchDistribution,
+    responseDeserialize: deserialize_MatchDistribution,
   },
+  // Source Management
+  // rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+  //
+  // rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+  // rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+  //
   // Test
   echo: {
     path: '/FaceRecognition/echo',
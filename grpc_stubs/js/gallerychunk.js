@@ -0,0 +1,397 @@
+/**
+ * @fileoverview
+ * @enhanceable
+ * @suppress {messageConventions} JS Compiler reports an error if a variable or
+ *     field starts with 'MSG_' and isn't a translatable message.
+ * @public
+ */
+// GENERATED CODE -- DO NOT EDIT!
+
+goog.provide('proto.GalleryChunk');
+
+goog.require('jspb.BinaryReader');
+goog.require('jspb.BinaryWriter');
+goog.require('jspb.Message');
+goog.require('proto.FaceRecordList');
+
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.GalleryChunk = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.GalleryChunk, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.GalleryChunk.displayName = 'proto.GalleryChunk';
+}
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.GalleryChunk.prototype.toObject = function(opt_includeInstance) {
+  return proto.GalleryChunk.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.GalleryChunk} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.GalleryChunk.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    galleryName: jspb.Message.getFieldWithDefault(msg, 1, ""),
+    fileId: jspb.Message.getFieldWithDefault(msg, 2, ""),
+    startRow: jspb.Message.getFieldWithDefault(msg, 3, 0),
+    nextRow: jspb.Message.getFieldWithDefault(msg, 4, 0),
+    rowCount: jspb.Message.getFieldWithDefault(msg, 5, 0),
+    dim: jspb.Message.getFieldWithDefault(msg, 6, 0),
+    templates: msg.getTemplates_asB64(),
+    records: (f = msg.getRecords()) && proto.FaceRecordList.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.GalleryChunk}
+ */
+proto.GalleryChunk.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.GalleryChunk;
+  return proto.GalleryChunk.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.GalleryChunk} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.GalleryChunk}
+ */
+proto.GalleryChunk.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGalleryName(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setFileId(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setStartRow(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setNextRow(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setRowCount(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setDim(value);
+      break;
+    case 7:
+      var value = /** @type {!Uint8Array} */ (reader.readBytes());
+      msg.setTemplates(value);
+      break;
+    case 8:
+      var value = new proto.FaceRecordList;
+      reader.readMessage(value,proto.FaceRecordList.deserializeBinaryFromReader);
+      msg.setRecords(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.GalleryChunk.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.GalleryChunk.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.GalleryChunk} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.GalleryChunk.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getGalleryName();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getFileId();
+  if (f.length > 0) {
+    writer.writeString(
+      2,
+      f
+    );
+  }
+  f = message.getStartRow();
+  if (f !== 0) {
+    writer.writeInt64(
+      3,
+      f
+    );
+  }
+  f = message.getNextRow();
+  if (f !== 0) {
+    writer.writeInt64(
+      4,
+      f
+    );
+  }
+  f = message.getRowCount();
+  if (f !== 0) {
+    writer.writeInt64(
+      5,
+      f
+    );
+  }
+  f = message.getDim();
+  if (f !== 0) {
+    writer.writeInt32(
+      6,
+      f
+    );
+  }
+  f = message.getTemplates_asU8();
+  if (f.length > 0) {
+    writer.writeBytes(
+      7,
+      f
+    );
+  }
+  f = message.getRecords();
+  if (f != null) {
+    writer.writeMessage(
+      8,
+      f,
+      proto.FaceRecordList.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * optional string gallery_name = 1;
+ * @return {string}
+ */
+proto.GalleryChunk.prototype.getGalleryName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/** @param {string} value */
+proto.GalleryChunk.prototype.setGalleryName = function(value) {
+  jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional string file_id = 2;
+ * @return {string}
+ */
+proto.GalleryChunk.prototype.getFileId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
+};
+
+
+/** @param {string} value */
+proto.GalleryChunk.prototype.setFileId = function(value) {
+  jspb.Message.setProto3StringField(this, 2, value);
+};
+
+
+/**
+ * optional int64 start_row = 3;
+ * @return {number}
+ */
+proto.GalleryChunk.prototype.getStartRow = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryChunk.prototype.setStartRow = function(value) {
+  jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int64 next_row = 4;
+ * @return {number}
+ */
+proto.GalleryChunk.prototype.getNextRow = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryChunk.prototype.setNextRow = function(value) {
+  jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional int64 row_count = 5;
+ * @return {number}
+ */
+proto.GalleryChunk.prototype.getRowCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryChunk.prototype.setRowCount = function(value) {
+  jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * optional int32 dim = 6;
+ * @return {number}
+ */
+proto.GalleryChunk.prototype.getDim = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 6, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryChunk.prototype.setDim = function(value) {
+  jspb.Message.setProto3IntField(this, 6, value);
+};
+
+
+/**
+ * optional bytes templates = 7;
+ * @return {string}
+ */
+proto.GalleryChunk.prototype.getTemplates = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 7, ""));
+};
+
+
+/**
+ * optional bytes templates = 7;
+ * This is a type-conversion wrapper around `getTemplates()`
+ * @return {string}
+ */
+proto.GalleryChunk.prototype.getTemplates_asB64 = function() {
+  return /** @type {string} */ (jspb.Message.bytesAsB64(
+      this.getTemplates()));
+};
+
+
+/**
+ * optional bytes templates = 7;
+ * Note that Uint8Array is not supported on all browsers.
+ * @see http://caniuse.com/Uint8Array
+ * This is a type-conversion wrapper around `getTemplates()`
+ * @return {!Uint8Array}
+ */
+proto.GalleryChunk.prototype.getTemplates_asU8 = function() {
+  return /** @type {!Uint8Array} */ (jspb.Message.bytesAsU8(
+      this.getTemplates()));
+};
+
+
+/** @param {!(string|Uint8Array)} value */
+proto.GalleryChunk.prototype.setTemplates = function(value) {
+  jspb.Message.setProto3BytesField(this, 7, value);
+};
+
+
+/**
+ * optional FaceRecordList records = 8;
+ * @return {?proto.FaceRecordList}
+ */
+proto.GalleryChunk.prototype.getRecords = function() {
+  return /** @type{?proto.FaceRecordList} */ (
+    jspb.Message.getWrapperField(this, proto.FaceRecordList, 8));
+};
+
+
+/** @param {?proto.FaceRecordList|undefined} value */
+proto.GalleryChunk.prototype.setRecords = function(value) {
+  jspb.Message.setWrapperField(this, 8, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ */
+proto.GalleryChunk.prototype.clearRecords = function() {
+  this.setRecords(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.GalleryChunk.prototype.hasRecords = function() {
+  return jspb.Message.getField(this, 8) != null;
+};
+
+
@@ -67,7 +67,12 @@ proto.GalleryInfo.prototype.toObject = function(opt_includeInstance) {
 proto.GalleryInfo.toObject = function(includeInstance, msg) {
   var f, obj = {
     galleryName: jspb.Message.getFieldWithDefault(msg, 1, ""),
-    faceCount: jspb.Message.getFieldWithDefault(msg, 2, 0)
+    faceCount: jspb.Message.getFieldWithDefault(msg, 2, 0),
+    subjectCount: jspb.Message.getFieldWithDefault(msg, 3, 0),
+    templateDim: jspb.Message.getFieldWithDefault(msg, 4, 0),
+    fileBytes: jspb.Message.getFieldWithDefault(msg, 5, 0),
+    indexState: jspb.Message.getFieldWithDefault(msg, 6, ""),
+    modified: jspb.Message.getFloatingPointFieldWithDefault(msg, 7, 0.0)
   };
 
   if (includeInstance) {
@@ -112,6 +117,26 @@ proto.GalleryInfo.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {number} */ (reader.readInt64());
       msg.setFaceCount(value);
       break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setSubjectCount(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTemplateDim(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setFileBytes(value);
+      break;
+    case 6:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setIndexState(value);
+      break;
+    case 7:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setModified(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -155,6 +180,41 @@ proto.GalleryInfo.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getSubjectCount();
+  if (f !== 0) {
+    writer.writeInt64(
+      3,
+      f
+    );
+  }
+  f = message.getTemplateDim();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+  f = message.getFileBytes();
+  if (f !== 0) {
+    writer.writeInt64(
+      5,
+      f
+    );
+  }
+  f = message.getIndexState();
+  if (f.length > 0) {
+    writer.writeString(
+      6,
+      f
+    );
+  }
+  f = message.getModified();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      7,
+      f
+    );
+  }
 };
 
 
@@ -188,3 +248,78 @@ proto.GalleryInfo.prototype.setFaceCount = function(value) {
 };
 
 
+/**
+ * optional int64 subject_count = 3;
+ * @return {number}
+ */
+proto.GalleryInfo.prototype.getSubjectCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryInfo.prototype.setSubjectCount = function(value) {
+  jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int32 template_dim = 4;
+ * @return {number}
+ */
+proto.GalleryInfo.prototype.getTemplateDim = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryInfo.prototype.setTemplateDim = function(value) {
+  jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional int64 file_bytes = 5;
+ * @return {number}
+ */
+proto.GalleryInfo.prototype.getFileBytes = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/** @param {number} value */
+proto.GalleryInfo.prototype.setFileBytes = function(value) {
+  jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * optional string index_state = 6;
+ * @return {string}
+ */
+proto.GalleryInfo.prototype.getIndexState = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 6, ""));
+};
+
+
+/** @param {string} value */
+proto.GalleryInfo.prototype.setIndexState = function(value) {
+  jspb.Message.setProto3StringField(this, 6, value);
+};
+
+
+/**
+ * optional double modified = 7;
+ * @return {number}
+ */
+proto.GalleryInfo.prototype.getModified = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 7, 0.0));
+};
+
+
+/** @param {number} value */
+proto.GalleryInfo.prototype.setModified = function(value) {
+  jspb.Message.setProto3FloatField(this, 7, value);
+};
+
+
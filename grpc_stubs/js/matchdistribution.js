@@ -0,0 +1,536 @@
+/**
+ * @fileoverview
+ * @enhanceable
+ * @suppress {messageConventions} JS Compiler reports an error if a variable or
+ *     field starts with 'MSG_' and isn't a translatable message.
+ * @public
+ */
+// GENERATED CODE -- DO NOT EDIT!
+
+goog.provide('proto.MatchDistribution');
+
+goog.require('jspb.BinaryReader');
+goog.require('jspb.BinaryWriter');
+goog.require('jspb.Message');
+goog.require('proto.ScoreBlock');
+
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.MatchDistribution = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.MatchDistribution.repeatedFields_, null);
+};
+goog.inherits(proto.MatchDistribution, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.MatchDistribution.displayName = 'proto.MatchDistribution';
+}
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.MatchDistribution.repeatedFields_ = [5,6,7,8,9,10];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.MatchDistribution.prototype.toObject = function(opt_includeInstance) {
+  return proto.MatchDistribution.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.MatchDistribution} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.MatchDistribution.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    block: (f = msg.getBlock()) && proto.ScoreBlock.toObject(includeInstance, f),
+    faceCount: jspb.Message.getFieldWithDefault(msg, 2, 0),
+    genuineCount: jspb.Message.getFieldWithDefault(msg, 3, 0),
+    impostorCount: jspb.Message.getFieldWithDefault(msg, 4, 0),
+    binEdgesList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 5)) == null ? undefined : f,
+    genuineHistogramList: (f = jspb.Message.getRepeatedField(msg, 6)) == null ? undefined : f,
+    impostorHistogramList: (f = jspb.Message.getRepeatedField(msg, 7)) == null ? undefined : f,
+    thresholdsList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 8)) == null ? undefined : f,
+    farList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 9)) == null ? undefined : f,
+    frrList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 10)) == null ? undefined : f
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.MatchDistribution}
+ */
+proto.MatchDistribution.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.MatchDistribution;
+  return proto.MatchDistribution.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.MatchDistribution} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.MatchDistribution}
+ */
+proto.MatchDistribution.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.ScoreBlock;
+      reader.readMessage(value,proto.ScoreBlock.deserializeBinaryFromReader);
+      msg.setBlock(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setFaceCount(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setGenuineCount(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setImpostorCount(value);
+      break;
+    case 5:
+      var value = /** @type {!Array<number>} */ (reader.readPackedFloat());
+      msg.setBinEdgesList(value);
+      break;
+    case 6:
+      var value = /** @type {!Array<number>} */ (reader.readPackedInt64());
+      msg.setGenuineHistogramList(value);
+      break;
+    case 7:
+      var value = /** @type {!Array<number>} */ (reader.readPackedInt64());
+      msg.setImpostorHistogramList(value);
+      break;
+    case 8:
+      var value = /** @type {!Array<number>} */ (reader.readPackedFloat());
+      msg.setThresholdsList(value);
+      break;
+    case 9:
+      var value = /** @type {!Array<number>} */ (reader.readPackedFloat());
+      msg.setFarList(value);
+      break;
+    case 10:
+      var value = /** @type {!Array<number>} */ (reader.readPackedFloat());
+      msg.setFrrList(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.MatchDistribution.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.MatchDistribution.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.MatchDistribution} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.MatchDistribution.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getBlock();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.ScoreBlock.serializeBinaryToWriter
+    );
+  }
+  f = message.getFaceCount();
+  if (f !== 0) {
+    writer.writeInt64(
+      2,
+      f
+    );
+  }
+  f = message.getGenuineCount();
+  if (f !== 0) {
+    writer.writeInt64(
+      3,
+      f
+    );
+  }
+  f = message.getImpostorCount();
+  if (f !== 0) {
+    writer.writeInt64(
+      4,
+      f
+    );
+  }
+  f = message.getBinEdgesList();
+  if (f.length > 0) {
+    writer.writePackedFloat(
+      5,
+      f
+    );
+  }
+  f = message.getGenuineHistogramList();
+  if (f.length > 0) {
+    writer.writePackedInt64(
+      6,
+      f
+    );
+  }
+  f = message.getImpostorHistogramList();
+  if (f.length > 0) {
+    writer.writePackedInt64(
+      7,
+      f
+    );
+  }
+  f = message.getThresholdsList();
+  if (f.length > 0) {
+    writer.writePackedFloat(
+      8,
+      f
+    );
+  }
+  f = message.getFarList();
+  if (f.length > 0) {
+    writer.writePackedFloat(
+      9,
+      f
+    );
+  }
+  f = message.getFrrList();
+  if (f.length > 0) {
+    writer.writePackedFloat(
+      10,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional ScoreBlock block = 1;
+ * @return {?proto.ScoreBlock}
+ */
+proto.MatchDistribution.prototype.getBlock = function() {
+  return /** @type{?proto.ScoreBlock} */ (
+    jspb.Message.getWrapperField(this, proto.ScoreBlock, 1));
+};
+
+
+/** @param {?proto.ScoreBlock|undefined} value */
+proto.MatchDistribution.prototype.setBlock = function(value) {
+  jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ */
+proto.MatchDistribution.prototype.clearBlock = function() {
+  this.setBlock(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.MatchDistribution.prototype.hasBlock = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional int64 face_count = 2;
+ * @return {number}
+ */
+proto.MatchDistribution.prototype.getFaceCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/** @param {number} value */
+proto.MatchDistribution.prototype.setFaceCount = function(value) {
+  jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int64 genuine_count = 3;
+ * @return {number}
+ */
+proto.MatchDistribution.prototype.getGenuineCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/** @param {number} value */
+proto.MatchDistribution.prototype.setGenuineCount = function(value) {
+  jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int64 impostor_count = 4;
+ * @return {number}
+ */
+proto.MatchDistribution.prototype.getImpostorCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/** @param {number} value */
+proto.MatchDistribution.prototype.setImpostorCount = function(value) {
+  jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * repeated float bin_edges = 5;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getBinEdgesList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 5));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setBinEdgesList = function(value) {
+  jspb.Message.setField(this, 5, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addBinEdges = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 5, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearBinEdgesList = function() {
+  this.setBinEdgesList([]);
+};
+
+
+/**
+ * repeated int64 genuine_histogram = 6;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getGenuineHistogramList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedField(this, 6));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setGenuineHistogramList = function(value) {
+  jspb.Message.setField(this, 6, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addGenuineHistogram = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 6, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearGenuineHistogramList = function() {
+  this.setGenuineHistogramList([]);
+};
+
+
+/**
+ * repeated int64 impostor_histogram = 7;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getImpostorHistogramList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedField(this, 7));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setImpostorHistogramList = function(value) {
+  jspb.Message.setField(this, 7, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addImpostorHistogram = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 7, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearImpostorHistogramList = function() {
+  this.setImpostorHistogramList([]);
+};
+
+
+/**
+ * repeated float thresholds = 8;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getThresholdsList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 8));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setThresholdsList = function(value) {
+  jspb.Message.setField(this, 8, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addThresholds = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 8, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearThresholdsList = function() {
+  this.setThresholdsList([]);
+};
+
+
+/**
+ * repeated float far = 9;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getFarList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 9));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setFarList = function(value) {
+  jspb.Message.setField(this, 9, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addFar = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 9, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearFarList = function() {
+  this.setFarList([]);
+};
+
+
+/**
+ * repeated float frr = 10;
+ * @return {!Array<number>}
+ */
+proto.MatchDistribution.prototype.getFrrList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 10));
+};
+
+
+/** @param {!Array<number>} value */
+proto.MatchDistribution.prototype.setFrrList = function(value) {
+  jspb.Message.setField(this, 10, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ */
+proto.MatchDistribution.prototype.addFrr = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 10, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.MatchDistribution.prototype.clearFrrList = function() {
+  this.setFrrList([]);
+};
+
+
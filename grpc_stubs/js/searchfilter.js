@@ -0,0 +1,389 @@
+/**
+ * @fileoverview
+ * @enhanceable
+ * @suppress {messageConventions} JS Compiler reports an error if a variable or
+ *     field starts with 'MSG_' and isn't a translatable message.
+ * @public
+ */
+// GENERATED CODE -- DO NOT EDIT!
+
+goog.provide('proto.SearchFilter');
+
+goog.require('jspb.BinaryReader');
+goog.require('jspb.BinaryWriter');
+goog.require('jspb.Message');
+goog.require('proto.AttributeFilter');
+
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.SearchFilter = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.SearchFilter.repeatedFields_, null);
+};
+goog.inherits(proto.SearchFilter, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.SearchFilter.displayName = 'proto.SearchFilter';
+}
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.SearchFilter.repeatedFields_ = [1,2,7];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.SearchFilter.prototype.toObject = function(opt_includeInstance) {
+  return proto.SearchFilter.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.SearchFilter} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.SearchFilter.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    subjectIdsList: (f = jspb.Message.getRepeatedField(msg, 1)) == null ? undefined : f,
+    sourcesList: (f = jspb.Message.getRepeatedField(msg, 2)) == null ? undefined : f,
+    minCollectionDate: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0),
+    maxCollectionDate: jspb.Message.getFloatingPointFieldWithDefault(msg, 4, 0.0),
+    minEnrollmentDate: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0),
+    maxEnrollmentDate: jspb.Message.getFloatingPointFieldWithDefault(msg, 6, 0.0),
+    attributesList: jspb.Message.toObjectList(msg.getAttributesList(),
+    proto.AttributeFilter.toObject, includeInstance)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.SearchFilter}
+ */
+proto.SearchFilter.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.SearchFilter;
+  return proto.SearchFilter.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.SearchFilter} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.SearchFilter}
+ */
+proto.SearchFilter.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.addSubjectIds(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.addSources(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMinCollectionDate(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMaxCollectionDate(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMinEnrollmentDate(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMaxEnrollmentDate(value);
+      break;
+    case 7:
+      var value = new proto.AttributeFilter;
+      reader.readMessage(value,proto.AttributeFilter.deserializeBinaryFromReader);
+      msg.addAttributes(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.SearchFilter.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.SearchFilter.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.SearchFilter} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.SearchFilter.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getSubjectIdsList();
+  if (f.length > 0) {
+    writer.writeRepeatedString(
+      1,
+      f
+    );
+  }
+  f = message.getSourcesList();
+  if (f.length > 0) {
+    writer.writeRepeatedString(
+      2,
+      f
+    );
+  }
+  f = message.getMinCollectionDate();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      3,
+      f
+    );
+  }
+  f = message.getMaxCollectionDate();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      4,
+      f
+    );
+  }
+  f = message.getMinEnrollmentDate();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      5,
+      f
+    );
+  }
+  f = message.getMaxEnrollmentDate();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      6,
+      f
+    );
+  }
+  f = message.getAttributesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      7,
+      f,
+      proto.AttributeFilter.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * repeated string subject_ids = 1;
+ * @return {!Array<string>}
+ */
+proto.SearchFilter.prototype.getSubjectIdsList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 1));
+};
+
+
+/** @param {!Array<string>} value */
+proto.SearchFilter.prototype.setSubjectIdsList = function(value) {
+  jspb.Message.setField(this, 1, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ */
+proto.SearchFilter.prototype.addSubjectIds = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 1, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.SearchFilter.prototype.clearSubjectIdsList = function() {
+  this.setSubjectIdsList([]);
+};
+
+
+/**
+ * repeated string sources = 2;
+ * @return {!Array<string>}
+ */
+proto.SearchFilter.prototype.getSourcesList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 2));
+};
+
+
+/** @param {!Array<string>} value */
+proto.SearchFilter.prototype.setSourcesList = function(value) {
+  jspb.Message.setField(this, 2, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ */
+proto.SearchFilter.prototype.addSources = function(value, opt_index) {
+  jspb.Message.addToRepeatedField(this, 2, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.SearchFilter.prototype.clearSourcesList = function() {
+  this.setSourcesList([]);
+};
+
+
+/**
+ * optional float min_collection_date = 3;
+ * @return {number}
+ */
+proto.SearchFilter.prototype.getMinCollectionDate = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
+};
+
+
+/** @param {number} value */
+proto.SearchFilter.prototype.setMinCollectionDate = function(value) {
+  jspb.Message.setProto3FloatField(this, 3, value);
+};
+
+
+/**
+ * optional float max_collection_date = 4;
+ * @return {number}
+ */
+proto.SearchFilter.prototype.getMaxCollectionDate = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 4, 0.0));
+};
+
+
+/** @param {number} value */
+proto.SearchFilter.prototype.setMaxCollectionDate = function(value) {
+  jspb.Message.setProto3FloatField(this, 4, value);
+};
+
+
+/**
+ * optional float min_enrollment_date = 5;
+ * @return {number}
+ */
+proto.SearchFilter.prototype.getMinEnrollmentDate = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 5, 0.0));
+};
+
+
+/** @param {number} value */
+proto.SearchFilter.prototype.setMinEnrollmentDate = function(value) {
+  jspb.Message.setProto3FloatField(this, 5, value);
+};
+
+
+/**
+ * optional float max_enrollment_date = 6;
+ * @return {number}
+ */
+proto.SearchFilter.prototype.getMaxEnrollmentDate = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 6, 0.0));
+};
+
+
+/** @param {number} value */
+proto.SearchFilter.prototype.setMaxEnrollmentDate = function(value) {
+  jspb.Message.setProto3FloatField(this, 6, value);
+};
+
+
+/**
+ * repeated AttributeFilter attributes = 7;
+ * @return {!Array<!proto.AttributeFilter>}
+ */
+proto.SearchFilter.prototype.getAttributesList = function() {
+  return /** @type{!Array<!proto.AttributeFilter>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.AttributeFilter, 7));
+};
+
+
+/** @param {!Array<!proto.AttributeFilter>} value */
+proto.SearchFilter.prototype.setAttributesList = function(value) {
+  jspb.Message.setRepeatedWrapperField(this, 7, value);
+};
+
+
+/**
+ * @param {!proto.AttributeFilter=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.AttributeFilter}
+ */
+proto.SearchFilter.prototype.addAttributes = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 7, opt_value, proto.AttributeFilter, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ */
+proto.SearchFilter.prototype.clearAttributesList = function() {
+  this.setAttributesList([]);
+};
+
+
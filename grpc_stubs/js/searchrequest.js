@@ -13,6 +13,7 @@ goog.require('jspb.BinaryReader');
 goog.require('jspb.BinaryWriter');
 goog.require('jspb.Message');
 goog.require('proto.FaceRecordList');
+goog.require('proto.SearchFilter');
 
 /**
  * Generated by JsPbCodeGenerator.
@@ -70,7 +71,9 @@ proto.SearchRequest.toObject = function(includeInstance, msg) {
     searchGallery: jspb.Message.getFieldWithDefault(msg, 1, ""),
     probes: (f = msg.getProbes()) && proto.FaceRecordList.toObject(includeInstance, f),
     maxResults: jspb.Message.getFieldWithDefault(msg, 4, 0),
-    threshold: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0)
+    threshold: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0),
+    nprobe: jspb.Message.getFieldWithDefault(msg, 6, 0),
+    filter: (f = msg.getFilter()) && proto.SearchFilter.toObject(includeInstance, f)
   };
 
   if (includeInstance) {
@@ -124,6 +127,15 @@ proto.SearchRequest.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {number} */ (reader.readFloat());
       msg.setThreshold(value);
       break;
+    case 6:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setNprobe(value);
+      break;
+    case 7:
+      var value = new proto.SearchFilter;
+      reader.readMessage(value,proto.SearchFilter.deserializeBinaryFromReader);
+      msg.setFilter(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -182,6 +194,21 @@ proto.SearchRequest.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getNprobe();
+  if (f !== 0) {
+    writer.writeInt32(
+      6,
+      f
+    );
+  }
+  f = message.getFilter();
+  if (f != null) {
+    writer.writeMessage(
+      7,
+      f,
+      proto.SearchFilter.serializeBinaryToWriter
+    );
+  }
 };
 
 
@@ -263,3 +290,51 @@ proto.SearchRequest.prototype.setThreshold = function(value) {
 };
 
 
+/**
+ * optional int32 nprobe = 6;
+ * @return {number}
+ */
+proto.SearchRequest.prototype.getNprobe = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 6, 0));
+};
+
+
+/** @param {number} value */
+proto.SearchRequest.prototype.setNprobe = function(value) {
+  jspb.Message.setProto3IntField(this, 6, value);
+};
+
+
+/**
+ * optional SearchFilter filter = 7;
+ * @return {?proto.SearchFilter}
+ */
+proto.SearchRequest.prototype.getFilter = function() {
+  return /** @type{?proto.SearchFilter} */ (
+    jspb.Message.getWrapperField(this, proto.SearchFilter, 7));
+};
+
+
+/** @param {?proto.SearchFilter|undefined} value */
+proto.SearchRequest.prototype.setFilter = function(value) {
+  jspb.Message.setWrapperField(this, 7, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ */
+proto.SearchRequest.prototype.clearFilter = function() {
+  this.setFilter(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.SearchRequest.prototype.hasFilter = function() {
+  return jspb.Message.getField(this, 7) != null;
+};
+
+
@@ -29,11 +29,13 @@ CF_EXTERN_C_BEGIN
 
 @class AccessRecord;
 @class Attribute;
+@class AttributeFilter;
 @class DetectRequest;
 @class Detection;
 @class DetectionOptions;
 @class EnrollOptions;
 @class EnrollRequest;
+@class EnrollStats;
 @class EnrollmentInfo;
 @class ErrorMessage;
 @class ExtractOptions;
@@ -41,6 +43,7 @@ CF_EXTERN_C_BEGIN
 @class FaceRecord;
 @class FaceRecordList;
 @class FaceTemplate;
+@class GalleryCacheStats;
 @class GalleryInfo;
 @class Image;
 @class Landmark;
@@ -48,6 +51,8 @@ CF_EXTERN_C_BEGIN
 @class Matrix;
 @class Point2D;
 @class Rect_Class;
+@class ScoreBlock;
+@class SearchFilter;
 @class SearchRequest;
 @class TemplateList;
 @class Vector;
@@ -291,6 +296,7 @@ typedef GPB_ENUM(DetectionOptions_FieldNumber) {
   DetectionOptions_FieldNumber_AttributesArray = 8,
   DetectionOptions_FieldNumber_SaveRequest = 9,
   DetectionOptions_FieldNumber_Debug = 10,
+  DetectionOptions_FieldNumber_Downsample = 11,
 };
 
 @interface DetectionOptions : GPBMessage
@@ -318,6 +324,9 @@ typedef GPB_ENUM(DetectionOptions_FieldNumber) {
 /** Save or print more info on the server side */
 @property(nonatomic, readwrite) BOOL debug;
 
+/** downsample the images to improve speed during detection */
+@property(nonatomic, readwrite) int32_t downsample;
+
 /** Used for passing algorithm specific options */
 @property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<Attribute*> *attributesArray;
 /** The number of items in @c attributesArray without causing the array to be created. */
@@ -357,6 +366,8 @@ typedef GPB_ENUM(EnrollOptions_FieldNumber) {
   EnrollOptions_FieldNumber_SaveRequest = 2,
   EnrollOptions_FieldNumber_Debug = 3,
   EnrollOptions_FieldNumber_AttributesArray = 8,
+  EnrollOptions_FieldNumber_DedupDistance = 9,
+  EnrollOptions_FieldNumber_DedupMerge = 10,
 };
 
 @interface EnrollOptions : GPBMessage
@@ -372,6 +383,12 @@ typedef GPB_ENUM(EnrollOptions_FieldNumber) {
 /** The number of items in @c attributesArray without causing the array to be created. */
 @property(nonatomic, readonly) NSUInteger attributesArray_Count;
 
+/** Skip faces within this distance of a face of the same subject (0 disables) */
+@property(nonatomic, readwrite) float dedupDistance;
+
+/** Average near duplicates into the face they match instead of skipping them */
+@property(nonatomic, readwrite) BOOL dedupMerge;
+
 @end
 
 #pragma mark - DetectionList
@@ -472,6 +489,7 @@ typedef GPB_ENUM(TemplateInput_FieldNumber) {
 typedef GPB_ENUM(FaceTemplate_FieldNumber) {
   FaceTemplate_FieldNumber_Data_p = 1,
   FaceTemplate_FieldNumber_Buffer = 2,
+  FaceTemplate_FieldNumber_Algorithm = 3,
 };
 
 @interface FaceTemplate : GPBMessage
@@ -484,6 +502,8 @@ typedef GPB_ENUM(FaceTemplate_FieldNumber) {
 /** General storage.  Can be used for raw data templates from commercial systems. */
 @property(nonatomic, readwrite, copy, null_resettable) NSData *buffer;
 
+@property(nonatomic, readwrite, copy, null_resettable) NSString *algorithm;
+
 @end
 
 #pragma mark - TemplateList
@@ -545,6 +565,7 @@ typedef GPB_ENUM(FaceRecord_FieldNumber) {
   FaceRecord_FieldNumber_EnrollmentDate = 17,
   FaceRecord_FieldNumber_MetadataArray = 18,
   FaceRecord_FieldNumber_AccessRecordsArray = 19,
+  FaceRecord_FieldNumber_Algorithm = 20,
 };
 
 @interface FaceRecord : GPBMessage
@@ -558,6 +579,8 @@ typedef GPB_ENUM(FaceRecord_FieldNumber) {
 
 @property(nonatomic, readwrite) int64_t frame;
 
+@property(nonatomic, readwrite, copy, null_resettable) NSString *algorithm;
+
 @property(nonatomic, readwrite, copy, null_resettable) NSString *notes;
 
 @property(nonatomic, readwrite, copy, null_resettable) NSString *galleryKey;
@@ -623,15 +646,43 @@ typedef GPB_ENUM(FaceRecord_FieldNumber) {
 
 typedef GPB_ENUM(FaceRecordList_FieldNumber) {
   FaceRecordList_FieldNumber_FaceRecordsArray = 1,
+  FaceRecordList_FieldNumber_EnrollStats = 3,
 };
 
 @interface FaceRecordList : GPBMessage
 
-/** repeated float scores = 2; // Scores returned by gallery searches */
 @property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<FaceRecord*> *faceRecordsArray;
 /** The number of items in @c faceRecordsArray without causing the array to be created. */
 @property(nonatomic, readonly) NSUInteger faceRecordsArray_Count;
 
+/** repeated float scores = 2; // Scores returned by gallery searches */
+@property(nonatomic, readwrite, strong, null_resettable) EnrollStats *enrollStats;
+/** Test to see if @c enrollStats has been set. */
+@property(nonatomic, readwrite) BOOL hasEnrollStats;
+
+@end
+
+#pragma mark - EnrollStats
+
+typedef GPB_ENUM(EnrollStats_FieldNumber) {
+  EnrollStats_FieldNumber_EnrollCount = 1,
+  EnrollStats_FieldNumber_ReplaceCount = 2,
+  EnrollStats_FieldNumber_SkipCount = 3,
+  EnrollStats_FieldNumber_MergeCount = 4,
+};
+
+@interface EnrollStats : GPBMessage
+
+@property(nonatomic, readwrite) int64_t enrollCount;
+
+@property(nonatomic, readwrite) int64_t replaceCount;
+
+/** Near duplicates that were not enrolled */
+@property(nonatomic, readwrite) int64_t skipCount;
+
+/** Near duplicates averaged into an existing face */
+@property(nonatomic, readwrite) int64_t mergeCount;
+
 @end
 
 #pragma mark - VerificationRequest
@@ -687,6 +738,8 @@ typedef GPB_ENUM(SearchRequest_FieldNumber) {
   SearchRequest_FieldNumber_Probes = 3,
   SearchRequest_FieldNumber_MaxResults = 4,
   SearchRequest_FieldNumber_Threshold = 5,
+  SearchRequest_FieldNumber_Nprobe = 6,
+  SearchRequest_FieldNumber_Filter = 7,
 };
 
 @interface SearchRequest : GPBMessage
@@ -701,6 +754,79 @@ typedef GPB_ENUM(SearchRequest_FieldNumber) {
 
 @property(nonatomic, readwrite) float threshold;
 
+/** Lists searched by approximate gallery workers. 0 uses the server default. */
+@property(nonatomic, readwrite) int32_t nprobe;
+
+/** Only faces that pass the filter are searched. */
+@property(nonatomic, readwrite, strong, null_resettable) SearchFilter *filter;
+/** Test to see if @c filter has been set. */
+@property(nonatomic, readwrite) BOOL hasFilter;
+
+@end
+
+#pragma mark - AttributeFilter
+
+typedef GPB_ENUM(AttributeFilter_FieldNumber) {
+  AttributeFilter_FieldNumber_Key = 1,
+  AttributeFilter_FieldNumber_ValuesArray = 2,
+  AttributeFilter_FieldNumber_MinValue = 3,
+  AttributeFilter_FieldNumber_MaxValue = 4,
+};
+
+@interface AttributeFilter : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *key;
+
+/** Text or integer values that match.  Empty matches any value. */
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<NSString*> *valuesArray;
+/** The number of items in @c valuesArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger valuesArray_Count;
+
+/** fvalue must be above min_value and below max_value. */
+@property(nonatomic, readwrite) float minValue;
+
+/** The range is only checked if max_value is greater than min_value. */
+@property(nonatomic, readwrite) float maxValue;
+
+@end
+
+#pragma mark - SearchFilter
+
+typedef GPB_ENUM(SearchFilter_FieldNumber) {
+  SearchFilter_FieldNumber_SubjectIdsArray = 1,
+  SearchFilter_FieldNumber_SourcesArray = 2,
+  SearchFilter_FieldNumber_MinCollectionDate = 3,
+  SearchFilter_FieldNumber_MaxCollectionDate = 4,
+  SearchFilter_FieldNumber_MinEnrollmentDate = 5,
+  SearchFilter_FieldNumber_MaxEnrollmentDate = 6,
+  SearchFilter_FieldNumber_AttributesArray = 7,
+};
+
+@interface SearchFilter : GPBMessage
+
+/** Faces must pass every predicate that is set.  Empty lists match every face. */
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<NSString*> *subjectIdsArray;
+/** The number of items in @c subjectIdsArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger subjectIdsArray_Count;
+
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<NSString*> *sourcesArray;
+/** The number of items in @c sourcesArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger sourcesArray_Count;
+
+/** Dates are inclusive.  0 leaves that end of the range open. */
+@property(nonatomic, readwrite) float minCollectionDate;
+
+@property(nonatomic, readwrite) float maxCollectionDate;
+
+@property(nonatomic, readwrite) float minEnrollmentDate;
+
+@property(nonatomic, readwrite) float maxEnrollmentDate;
+
+/** Matched against the FaceRecord attributes. */
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<AttributeFilter*> *attributesArray;
+/** The number of items in @c attributesArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger attributesArray_Count;
+
 @end
 
 #pragma mark - SearchResponse
@@ -744,6 +870,25 @@ typedef GPB_ENUM(EnrollRequest_FieldNumber) {
 
 @end
 
+#pragma mark - BulkEnrollResponse
+
+typedef GPB_ENUM(BulkEnrollResponse_FieldNumber) {
+  BulkEnrollResponse_FieldNumber_RequestCount = 1,
+  BulkEnrollResponse_FieldNumber_EnrollCount = 2,
+  BulkEnrollResponse_FieldNumber_ReplaceCount = 3,
+};
+
+@interface BulkEnrollResponse : GPBMessage
+
+/** number of EnrollRequests received on the stream */
+@property(nonatomic, readwrite) int64_t requestCount;
+
+@property(nonatomic, readwrite) int64_t enrollCount;
+
+@property(nonatomic, readwrite) int64_t replaceCount;
+
+@end
+
 #pragma mark - DetectRequest
 
 typedef GPB_ENUM(DetectRequest_FieldNumber) {
@@ -835,6 +980,127 @@ typedef GPB_ENUM(ScoreRequest_FieldNumber) {
 
 @end
 
+#pragma mark - ScoreBlock
+
+typedef GPB_ENUM(ScoreBlock_FieldNumber) {
+  ScoreBlock_FieldNumber_ProbeStart = 1,
+  ScoreBlock_FieldNumber_GalleryStart = 2,
+  ScoreBlock_FieldNumber_ProbeCount = 3,
+  ScoreBlock_FieldNumber_GalleryCount = 4,
+  ScoreBlock_FieldNumber_Scores = 5,
+};
+
+@interface ScoreBlock : GPBMessage
+
+/** First probe row of the block */
+@property(nonatomic, readwrite) int64_t probeStart;
+
+/** First gallery column of the block */
+@property(nonatomic, readwrite) int64_t galleryStart;
+
+@property(nonatomic, readwrite) int32_t probeCount;
+
+@property(nonatomic, readwrite) int32_t galleryCount;
+
+/** (probe_count, gallery_count) little endian float32 matrix in row order */
+@property(nonatomic, readwrite, copy, null_resettable) NSData *scores;
+
+@end
+
+#pragma mark - MatchDistributionRequest
+
+typedef GPB_ENUM(MatchDistributionRequest_FieldNumber) {
+  MatchDistributionRequest_FieldNumber_GalleryName = 1,
+  MatchDistributionRequest_FieldNumber_Bins = 2,
+  MatchDistributionRequest_FieldNumber_MinScore = 3,
+  MatchDistributionRequest_FieldNumber_MaxScore = 4,
+  MatchDistributionRequest_FieldNumber_IncludeScores = 5,
+};
+
+@interface MatchDistributionRequest : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+/** Histogram bins.  DEFAULT=100 */
+@property(nonatomic, readwrite) int32_t bins;
+
+/** Histogram range.  Estimated to cover every score if both are zero. */
+@property(nonatomic, readwrite) float minScore;
+
+@property(nonatomic, readwrite) float maxScore;
+
+/** Also stream the upper triangle of the distance matrix in blocks */
+@property(nonatomic, readwrite) BOOL includeScores;
+
+@end
+
+#pragma mark - MatchDistribution
+
+typedef GPB_ENUM(MatchDistribution_FieldNumber) {
+  MatchDistribution_FieldNumber_Block = 1,
+  MatchDistribution_FieldNumber_FaceCount = 2,
+  MatchDistribution_FieldNumber_GenuineCount = 3,
+  MatchDistribution_FieldNumber_ImpostorCount = 4,
+  MatchDistribution_FieldNumber_BinEdgesArray = 5,
+  MatchDistribution_FieldNumber_GenuineHistogramArray = 6,
+  MatchDistribution_FieldNumber_ImpostorHistogramArray = 7,
+  MatchDistribution_FieldNumber_ThresholdsArray = 8,
+  MatchDistribution_FieldNumber_FarArray = 9,
+  MatchDistribution_FieldNumber_FrrArray = 10,
+};
+
+@interface MatchDistribution : GPBMessage
+
+/**
+ * Blocks of the distance matrix are streamed first when include_scores
+ * is set.  The blocks cover the tiles on and above the diagonal.
+ **/
+@property(nonatomic, readwrite, strong, null_resettable) ScoreBlock *block;
+/** Test to see if @c block has been set. */
+@property(nonatomic, readwrite) BOOL hasBlock;
+
+/**
+ * The summaries are set in the last message of the stream.  Pairs of
+ * faces are counted once and faces are not compared to themselves.
+ **/
+@property(nonatomic, readwrite) int64_t faceCount;
+
+/** Pairs with the same subject id */
+@property(nonatomic, readwrite) int64_t genuineCount;
+
+/** Pairs with different or missing subject ids */
+@property(nonatomic, readwrite) int64_t impostorCount;
+
+/** bins + 1 edges.  Distances outside a requested range are counted in the first or last bin. */
+@property(nonatomic, readwrite, strong, null_resettable) GPBFloatArray *binEdgesArray;
+/** The number of items in @c binEdgesArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger binEdgesArray_Count;
+
+@property(nonatomic, readwrite, strong, null_resettable) GPBInt64Array *genuineHistogramArray;
+/** The number of items in @c genuineHistogramArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger genuineHistogramArray_Count;
+
+@property(nonatomic, readwrite, strong, null_resettable) GPBInt64Array *impostorHistogramArray;
+/** The number of items in @c impostorHistogramArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger impostorHistogramArray_Count;
+
+/** The interior bin edges */
+@property(nonatomic, readwrite, strong, null_resettable) GPBFloatArray *thresholdsArray;
+/** The number of items in @c thresholdsArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger thresholdsArray_Count;
+
+/** Fraction of impostor pairs with a distance below each threshold */
+@property(nonatomic, readwrite, strong, null_resettable) GPBFloatArray *farArray;
+/** The number of items in @c farArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger farArray_Count;
+
+/** Fraction of genuine pairs with a distance at or above each threshold */
+@property(nonatomic, readwrite, strong, null_resettable) GPBFloatArray *frrArray;
+/** The number of items in @c frrArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger frrArray_Count;
+
+@end
+
 #pragma mark - DetectExtractRequest
 
 typedef GPB_ENUM(DetectExtractRequest_FieldNumber) {
@@ -939,6 +1205,9 @@ typedef GPB_ENUM(FaceServiceInfo_FieldNumber) {
   FaceServiceInfo_FieldNumber_MatchThreshold = 9,
   FaceServiceInfo_FieldNumber_Algorithm = 10,
   FaceServiceInfo_FieldNumber_Notes = 11,
+  FaceServiceInfo_FieldNumber_FaroVersion = 12,
+  FaceServiceInfo_FieldNumber_InstanceName = 13,
+  FaceServiceInfo_FieldNumber_GalleryCache = 14,
 };
 
 @interface FaceServiceInfo : GPBMessage
@@ -965,6 +1234,14 @@ typedef GPB_ENUM(FaceServiceInfo_FieldNumber) {
 
 @property(nonatomic, readwrite, copy, null_resettable) NSString *notes;
 
+@property(nonatomic, readwrite, copy, null_resettable) NSString *faroVersion;
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *instanceName;
+
+@property(nonatomic, readwrite, strong, null_resettable) GalleryCacheStats *galleryCache;
+/** Test to see if @c galleryCache has been set. */
+@property(nonatomic, readwrite) BOOL hasGalleryCache;
+
 @end
 
 /**
@@ -991,6 +1268,40 @@ int32_t FaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message);
  **/
 void SetFaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message, int32_t value);
 
+#pragma mark - GalleryCacheStats
+
+typedef GPB_ENUM(GalleryCacheStats_FieldNumber) {
+  GalleryCacheStats_FieldNumber_OpenGalleries = 1,
+  GalleryCacheStats_FieldNumber_PinnedGalleries = 2,
+  GalleryCacheStats_FieldNumber_OpenBytes = 3,
+  GalleryCacheStats_FieldNumber_MaxOpen = 4,
+  GalleryCacheStats_FieldNumber_MaxBytes = 5,
+  GalleryCacheStats_FieldNumber_Hits = 6,
+  GalleryCacheStats_FieldNumber_Misses = 7,
+  GalleryCacheStats_FieldNumber_Evictions = 8,
+};
+
+@interface GalleryCacheStats : GPBMessage
+
+@property(nonatomic, readwrite) int64_t openGalleries;
+
+@property(nonatomic, readwrite) int64_t pinnedGalleries;
+
+/** Estimated memory used by the open galleries */
+@property(nonatomic, readwrite) int64_t openBytes;
+
+@property(nonatomic, readwrite) int64_t maxOpen;
+
+@property(nonatomic, readwrite) int64_t maxBytes;
+
+@property(nonatomic, readwrite) int64_t hits;
+
+@property(nonatomic, readwrite) int64_t misses;
+
+@property(nonatomic, readwrite) int64_t evictions;
+
+@end
+
 #pragma mark - GalleryListRequest
 
 /**
@@ -1012,6 +1323,160 @@ typedef GPB_ENUM(GalleryDeleteRequest_FieldNumber) {
 
 @end
 
+#pragma mark - GalleryConfigureRequest
+
+typedef GPB_ENUM(GalleryConfigureRequest_FieldNumber) {
+  GalleryConfigureRequest_FieldNumber_GalleryName = 1,
+  GalleryConfigureRequest_FieldNumber_IndexQuantization = 2,
+};
+
+@interface GalleryConfigureRequest : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+/** none, float16, or int8.  Empty leaves the setting unchanged. */
+@property(nonatomic, readwrite, copy, null_resettable) NSString *indexQuantization;
+
+@end
+
+#pragma mark - GalleryCompactRequest
+
+typedef GPB_ENUM(GalleryCompactRequest_FieldNumber) {
+  GalleryCompactRequest_FieldNumber_GalleryName = 1,
+};
+
+@interface GalleryCompactRequest : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+@end
+
+#pragma mark - GalleryCompactResponse
+
+typedef GPB_ENUM(GalleryCompactResponse_FieldNumber) {
+  GalleryCompactResponse_FieldNumber_GalleryName = 1,
+  GalleryCompactResponse_FieldNumber_FaceCount = 2,
+  GalleryCompactResponse_FieldNumber_RowsRemoved = 3,
+  GalleryCompactResponse_FieldNumber_BytesBefore = 4,
+  GalleryCompactResponse_FieldNumber_BytesAfter = 5,
+  GalleryCompactResponse_FieldNumber_BytesReclaimed = 6,
+  GalleryCompactResponse_FieldNumber_CompactTime = 7,
+};
+
+@interface GalleryCompactResponse : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+@property(nonatomic, readwrite) int64_t faceCount;
+
+/** Deleted and replaced rows dropped from the file */
+@property(nonatomic, readwrite) int64_t rowsRemoved;
+
+/** Gallery file and view blobs before compaction */
+@property(nonatomic, readwrite) int64_t bytesBefore;
+
+@property(nonatomic, readwrite) int64_t bytesAfter;
+
+@property(nonatomic, readwrite) int64_t bytesReclaimed;
+
+/** Seconds */
+@property(nonatomic, readwrite) float compactTime;
+
+@end
+
+#pragma mark - GalleryExportRequest
+
+typedef GPB_ENUM(GalleryExportRequest_FieldNumber) {
+  GalleryExportRequest_FieldNumber_GalleryName = 1,
+  GalleryExportRequest_FieldNumber_StartRow = 2,
+  GalleryExportRequest_FieldNumber_FileId = 3,
+  GalleryExportRequest_FieldNumber_ChunkSize = 4,
+  GalleryExportRequest_FieldNumber_IncludeViews = 5,
+};
+
+@interface GalleryExportRequest : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+/** Resume after a chunk by passing its next_row */
+@property(nonatomic, readwrite) int64_t startRow;
+
+/** The file_id of the chunks already received when resuming */
+@property(nonatomic, readwrite, copy, null_resettable) NSString *fileId;
+
+/** Gallery rows per chunk, 0 for the default */
+@property(nonatomic, readwrite) int32_t chunkSize;
+
+@property(nonatomic, readwrite) BOOL includeViews;
+
+@end
+
+#pragma mark - GalleryChunk
+
+typedef GPB_ENUM(GalleryChunk_FieldNumber) {
+  GalleryChunk_FieldNumber_GalleryName = 1,
+  GalleryChunk_FieldNumber_FileId = 2,
+  GalleryChunk_FieldNumber_StartRow = 3,
+  GalleryChunk_FieldNumber_NextRow = 4,
+  GalleryChunk_FieldNumber_RowCount = 5,
+  GalleryChunk_FieldNumber_Dim = 6,
+  GalleryChunk_FieldNumber_Templates = 7,
+  GalleryChunk_FieldNumber_Records = 8,
+};
+
+@interface GalleryChunk : GPBMessage
+
+/** Source gallery on export and target gallery on import */
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+/** Identifies the gallery file.  Changes when the gallery is compacted. */
+@property(nonatomic, readwrite, copy, null_resettable) NSString *fileId;
+
+@property(nonatomic, readwrite) int64_t startRow;
+
+@property(nonatomic, readwrite) int64_t nextRow;
+
+/** Rows in the gallery when the export started */
+@property(nonatomic, readwrite) int64_t rowCount;
+
+@property(nonatomic, readwrite) int32_t dim;
+
+/** (faces, dim) little endian float32 matrix in row order */
+@property(nonatomic, readwrite, copy, null_resettable) NSData *templates;
+
+/** Faces without template data */
+@property(nonatomic, readwrite, strong, null_resettable) FaceRecordList *records;
+/** Test to see if @c records has been set. */
+@property(nonatomic, readwrite) BOOL hasRecords;
+
+@end
+
+#pragma mark - GalleryImportResponse
+
+typedef GPB_ENUM(GalleryImportResponse_FieldNumber) {
+  GalleryImportResponse_FieldNumber_GalleryName = 1,
+  GalleryImportResponse_FieldNumber_FileId = 2,
+  GalleryImportResponse_FieldNumber_NextRow = 3,
+  GalleryImportResponse_FieldNumber_EnrollCount = 4,
+  GalleryImportResponse_FieldNumber_ReplaceCount = 5,
+};
+
+@interface GalleryImportResponse : GPBMessage
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryName;
+
+@property(nonatomic, readwrite, copy, null_resettable) NSString *fileId;
+
+/** Export start_row to resume the transfer after this chunk */
+@property(nonatomic, readwrite) int64_t nextRow;
+
+/** Totals for the stream so far */
+@property(nonatomic, readwrite) int64_t enrollCount;
+
+@property(nonatomic, readwrite) int64_t replaceCount;
+
+@end
+
 #pragma mark - EnrollmentListRequest
 
 typedef GPB_ENUM(EnrollmentListRequest_FieldNumber) {
@@ -1067,6 +1532,7 @@ typedef GPB_ENUM(EnrollmentListResponse_FieldNumber) {
 typedef GPB_ENUM(EnrollmentDeleteRequest_FieldNumber) {
   EnrollmentDeleteRequest_FieldNumber_GalleryName = 1,
   EnrollmentDeleteRequest_FieldNumber_SubjectId = 2,
+  EnrollmentDeleteRequest_FieldNumber_GalleryKey = 3,
 };
 
 @interface EnrollmentDeleteRequest : GPBMessage
@@ -1075,6 +1541,20 @@ typedef GPB_ENUM(EnrollmentDeleteRequest_FieldNumber) {
 
 @property(nonatomic, readwrite, copy, null_resettable) NSString *subjectId;
 
+@property(nonatomic, readwrite, copy, null_resettable) NSString *galleryKey;
+
+@end
+
+#pragma mark - EnrollmentDeleteResponse
+
+typedef GPB_ENUM(EnrollmentDeleteResponse_FieldNumber) {
+  EnrollmentDeleteResponse_FieldNumber_DeleteCount = 1,
+};
+
+@interface EnrollmentDeleteResponse : GPBMessage
+
+@property(nonatomic, readwrite) int64_t deleteCount;
+
 @end
 
 #pragma mark - GalleryInfo
@@ -1082,6 +1562,11 @@ typedef GPB_ENUM(EnrollmentDeleteRequest_FieldNumber) {
 typedef GPB_ENUM(GalleryInfo_FieldNumber) {
   GalleryInfo_FieldNumber_GalleryName = 1,
   GalleryInfo_FieldNumber_FaceCount = 2,
+  GalleryInfo_FieldNumber_SubjectCount = 3,
+  GalleryInfo_FieldNumber_TemplateDim = 4,
+  GalleryInfo_FieldNumber_FileBytes = 5,
+  GalleryInfo_FieldNumber_IndexState = 6,
+  GalleryInfo_FieldNumber_Modified = 7,
 };
 
 @interface GalleryInfo : GPBMessage
@@ -1090,6 +1575,19 @@ typedef GPB_ENUM(GalleryInfo_FieldNumber) {
 
 @property(nonatomic, readwrite) int64_t faceCount;
 
+@property(nonatomic, readwrite) int64_t subjectCount;
+
+@property(nonatomic, readwrite) int32_t templateDim;
+
+/** Gallery file and view blobs on disk */
+@property(nonatomic, readwrite) int64_t fileBytes;
+
+/** none, current, or stale */
+@property(nonatomic, readwrite, copy, null_resettable) NSString *indexState;
+
+/** Time of the last change in seconds since the epoch */
+@property(nonatomic, readwrite) double modified;
+
 @end
 
 #pragma mark - GalleryList
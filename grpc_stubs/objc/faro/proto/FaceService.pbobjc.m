@@ -576,6 +576,7 @@ typedef struct Landmark__storage_ {
 @dynamic minSize;
 @dynamic saveRequest;
 @dynamic debug;
+@dynamic downsample;
 @dynamic attributesArray, attributesArray_Count;
 
 typedef struct DetectionOptions__storage_ {
@@ -585,6 +586,7 @@ typedef struct DetectionOptions__storage_ {
   int32_t scanLevels;
   float scanOverlap;
   int32_t minSize;
+  int32_t downsample;
   NSString *algorithmId;
   NSMutableArray *attributesArray;
 } DetectionOptions__storage_;
@@ -685,6 +687,15 @@ typedef struct DetectionOptions__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeBool,
       },
+      {
+        .name = "downsample",
+        .dataTypeSpecific.className = NULL,
+        .number = DetectionOptions_FieldNumber_Downsample,
+        .hasIndex = 12,
+        .offset = (uint32_t)offsetof(DetectionOptions__storage_, downsample),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[DetectionOptions class]
@@ -787,9 +798,12 @@ typedef struct ExtractOptions__storage_ {
 @dynamic saveRequest;
 @dynamic debug;
 @dynamic attributesArray, attributesArray_Count;
+@dynamic dedupDistance;
+@dynamic dedupMerge;
 
 typedef struct EnrollOptions__storage_ {
   uint32_t _has_storage_[1];
+  float dedupDistance;
   NSMutableArray *attributesArray;
 } EnrollOptions__storage_;
 
@@ -826,6 +840,24 @@ typedef struct EnrollOptions__storage_ {
         .flags = GPBFieldRepeated,
         .dataType = GPBDataTypeMessage,
       },
+      {
+        .name = "dedupDistance",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollOptions_FieldNumber_DedupDistance,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(EnrollOptions__storage_, dedupDistance),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "dedupMerge",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollOptions_FieldNumber_DedupMerge,
+        .hasIndex = 5,
+        .offset = 6,  // Stored in _has_storage_ to save space.
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBool,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[EnrollOptions class]
@@ -1152,11 +1184,13 @@ typedef struct TemplateInput__storage_ {
 
 @dynamic hasData_p, data_p;
 @dynamic buffer;
+@dynamic algorithm;
 
 typedef struct FaceTemplate__storage_ {
   uint32_t _has_storage_[1];
   Vector *data_p;
   NSData *buffer;
+  NSString *algorithm;
 } FaceTemplate__storage_;
 
 // This method is threadsafe because it is initially called
@@ -1183,6 +1217,15 @@ typedef struct FaceTemplate__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeBytes,
       },
+      {
+        .name = "algorithm",
+        .dataTypeSpecific.className = NULL,
+        .number = FaceTemplate_FieldNumber_Algorithm,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(FaceTemplate__storage_, algorithm),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[FaceTemplate class]
@@ -1333,6 +1376,7 @@ typedef struct AccessRecord__storage_ {
 @dynamic name;
 @dynamic source;
 @dynamic frame;
+@dynamic algorithm;
 @dynamic notes;
 @dynamic galleryKey;
 @dynamic collectionDate;
@@ -1369,6 +1413,7 @@ typedef struct FaceRecord__storage_ {
   NSString *galleryKey;
   NSMutableArray *metadataArray;
   NSMutableArray *accessRecordsArray;
+  NSString *algorithm;
   int64_t frame;
 } FaceRecord__storage_;
 
@@ -1391,7 +1436,7 @@ typedef struct FaceRecord__storage_ {
         .name = "detection",
         .dataTypeSpecific.className = GPBStringifySymbol(Detection),
         .number = FaceRecord_FieldNumber_Detection,
-        .hasIndex = 10,
+        .hasIndex = 11,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, detection),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
@@ -1400,7 +1445,7 @@ typedef struct FaceRecord__storage_ {
         .name = "template_p",
         .dataTypeSpecific.className = GPBStringifySymbol(FaceTemplate),
         .number = FaceRecord_FieldNumber_Template_p,
-        .hasIndex = 11,
+        .hasIndex = 12,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, template_p),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
@@ -1427,7 +1472,7 @@ typedef struct FaceRecord__storage_ {
         .name = "notes",
         .dataTypeSpecific.className = NULL,
         .number = FaceRecord_FieldNumber_Notes,
-        .hasIndex = 4,
+        .hasIndex = 5,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, notes),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
@@ -1436,7 +1481,7 @@ typedef struct FaceRecord__storage_ {
         .name = "view",
         .dataTypeSpecific.className = GPBStringifySymbol(Image),
         .number = FaceRecord_FieldNumber_View,
-        .hasIndex = 8,
+        .hasIndex = 9,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, view),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
@@ -1454,7 +1499,7 @@ typedef struct FaceRecord__storage_ {
         .name = "aligned",
         .dataTypeSpecific.className = GPBStringifySymbol(Image),
         .number = FaceRecord_FieldNumber_Aligned,
-        .hasIndex = 9,
+        .hasIndex = 10,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, aligned),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
@@ -1481,7 +1526,7 @@ typedef struct FaceRecord__storage_ {
         .name = "score",
         .dataTypeSpecific.className = NULL,
         .number = FaceRecord_FieldNumber_Score,
-        .hasIndex = 12,
+        .hasIndex = 13,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, score),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeFloat,
@@ -1490,7 +1535,7 @@ typedef struct FaceRecord__storage_ {
         .name = "searchResults",
         .dataTypeSpecific.className = GPBStringifySymbol(FaceRecordList),
         .number = FaceRecord_FieldNumber_SearchResults,
-        .hasIndex = 13,
+        .hasIndex = 14,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, searchResults),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
@@ -1508,7 +1553,7 @@ typedef struct FaceRecord__storage_ {
         .name = "galleryKey",
         .dataTypeSpecific.className = NULL,
         .number = FaceRecord_FieldNumber_GalleryKey,
-        .hasIndex = 5,
+        .hasIndex = 6,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, galleryKey),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
@@ -1517,7 +1562,7 @@ typedef struct FaceRecord__storage_ {
         .name = "collectionDate",
         .dataTypeSpecific.className = NULL,
         .number = FaceRecord_FieldNumber_CollectionDate,
-        .hasIndex = 6,
+        .hasIndex = 7,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, collectionDate),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeFloat,
@@ -1526,7 +1571,7 @@ typedef struct FaceRecord__storage_ {
         .name = "enrollmentDate",
         .dataTypeSpecific.className = NULL,
         .number = FaceRecord_FieldNumber_EnrollmentDate,
-        .hasIndex = 7,
+        .hasIndex = 8,
         .offset = (uint32_t)offsetof(FaceRecord__storage_, enrollmentDate),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeFloat,
@@ -1549,6 +1594,15 @@ typedef struct FaceRecord__storage_ {
         .flags = GPBFieldRepeated,
         .dataType = GPBDataTypeMessage,
       },
+      {
+        .name = "algorithm",
+        .dataTypeSpecific.className = NULL,
+        .number = FaceRecord_FieldNumber_Algorithm,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(FaceRecord__storage_, algorithm),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[FaceRecord class]
@@ -1573,10 +1627,12 @@ typedef struct FaceRecord__storage_ {
 @implementation FaceRecordList
 
 @dynamic faceRecordsArray, faceRecordsArray_Count;
+@dynamic hasEnrollStats, enrollStats;
 
 typedef struct FaceRecordList__storage_ {
   uint32_t _has_storage_[1];
   NSMutableArray *faceRecordsArray;
+  EnrollStats *enrollStats;
 } FaceRecordList__storage_;
 
 // This method is threadsafe because it is initially called
@@ -1594,6 +1650,15 @@ typedef struct FaceRecordList__storage_ {
         .flags = GPBFieldRepeated,
         .dataType = GPBDataTypeMessage,
       },
+      {
+        .name = "enrollStats",
+        .dataTypeSpecific.className = GPBStringifySymbol(EnrollStats),
+        .number = FaceRecordList_FieldNumber_EnrollStats,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(FaceRecordList__storage_, enrollStats),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeMessage,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[FaceRecordList class]
@@ -1613,6 +1678,84 @@ typedef struct FaceRecordList__storage_ {
 
 @end
 
+#pragma mark - EnrollStats
+
+@implementation EnrollStats
+
+@dynamic enrollCount;
+@dynamic replaceCount;
+@dynamic skipCount;
+@dynamic mergeCount;
+
+typedef struct EnrollStats__storage_ {
+  uint32_t _has_storage_[1];
+  int64_t enrollCount;
+  int64_t replaceCount;
+  int64_t skipCount;
+  int64_t mergeCount;
+} EnrollStats__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "enrollCount",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollStats_FieldNumber_EnrollCount,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(EnrollStats__storage_, enrollCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "replaceCount",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollStats_FieldNumber_ReplaceCount,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(EnrollStats__storage_, replaceCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "skipCount",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollStats_FieldNumber_SkipCount,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(EnrollStats__storage_, skipCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "mergeCount",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollStats_FieldNumber_MergeCount,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(EnrollStats__storage_, mergeCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[EnrollStats class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(EnrollStats__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
 #pragma mark - VerificationRequest
 
 @implementation VerificationRequest
@@ -1776,13 +1919,17 @@ typedef struct VerificationResponse__storage_ {
 @dynamic hasProbes, probes;
 @dynamic maxResults;
 @dynamic threshold;
+@dynamic nprobe;
+@dynamic hasFilter, filter;
 
 typedef struct SearchRequest__storage_ {
   uint32_t _has_storage_[1];
   int32_t maxResults;
   float threshold;
+  int32_t nprobe;
   NSString *searchGallery;
   FaceRecordList *probes;
+  SearchFilter *filter;
 } SearchRequest__storage_;
 
 // This method is threadsafe because it is initially called
@@ -1827,6 +1974,24 @@ typedef struct SearchRequest__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeFloat,
       },
+      {
+        .name = "nprobe",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchRequest_FieldNumber_Nprobe,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(SearchRequest__storage_, nprobe),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "filter",
+        .dataTypeSpecific.className = GPBStringifySymbol(SearchFilter),
+        .number = SearchRequest_FieldNumber_Filter,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(SearchRequest__storage_, filter),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeMessage,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[SearchRequest class]
@@ -1846,6 +2011,195 @@ typedef struct SearchRequest__storage_ {
 
 @end
 
+#pragma mark - AttributeFilter
+
+@implementation AttributeFilter
+
+@dynamic key;
+@dynamic valuesArray, valuesArray_Count;
+@dynamic minValue;
+@dynamic maxValue;
+
+typedef struct AttributeFilter__storage_ {
+  uint32_t _has_storage_[1];
+  float minValue;
+  float maxValue;
+  NSString *key;
+  NSMutableArray *valuesArray;
+} AttributeFilter__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "key",
+        .dataTypeSpecific.className = NULL,
+        .number = AttributeFilter_FieldNumber_Key,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(AttributeFilter__storage_, key),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "valuesArray",
+        .dataTypeSpecific.className = NULL,
+        .number = AttributeFilter_FieldNumber_ValuesArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(AttributeFilter__storage_, valuesArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "minValue",
+        .dataTypeSpecific.className = NULL,
+        .number = AttributeFilter_FieldNumber_MinValue,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(AttributeFilter__storage_, minValue),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "maxValue",
+        .dataTypeSpecific.className = NULL,
+        .number = AttributeFilter_FieldNumber_MaxValue,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(AttributeFilter__storage_, maxValue),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[AttributeFilter class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(AttributeFilter__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - SearchFilter
+
+@implementation SearchFilter
+
+@dynamic subjectIdsArray, subjectIdsArray_Count;
+@dynamic sourcesArray, sourcesArray_Count;
+@dynamic minCollectionDate;
+@dynamic maxCollectionDate;
+@dynamic minEnrollmentDate;
+@dynamic maxEnrollmentDate;
+@dynamic attributesArray, attributesArray_Count;
+
+typedef struct SearchFilter__storage_ {
+  uint32_t _has_storage_[1];
+  float minCollectionDate;
+  float maxCollectionDate;
+  float minEnrollmentDate;
+  float maxEnrollmentDate;
+  NSMutableArray *subjectIdsArray;
+  NSMutableArray *sourcesArray;
+  NSMutableArray *attributesArray;
+} SearchFilter__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "subjectIdsArray",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_SubjectIdsArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, subjectIdsArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "sourcesArray",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_SourcesArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, sourcesArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "minCollectionDate",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_MinCollectionDate,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, minCollectionDate),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "maxCollectionDate",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_MaxCollectionDate,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, maxCollectionDate),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "minEnrollmentDate",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_MinEnrollmentDate,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, minEnrollmentDate),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "maxEnrollmentDate",
+        .dataTypeSpecific.className = NULL,
+        .number = SearchFilter_FieldNumber_MaxEnrollmentDate,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, maxEnrollmentDate),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "attributesArray",
+        .dataTypeSpecific.className = GPBStringifySymbol(AttributeFilter),
+        .number = SearchFilter_FieldNumber_AttributesArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(SearchFilter__storage_, attributesArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeMessage,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[SearchFilter class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(SearchFilter__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
 #pragma mark - SearchResponse
 
 @implementation SearchResponse
@@ -1969,13 +2323,80 @@ typedef struct EnrollRequest__storage_ {
 
 @end
 
-#pragma mark - DetectRequest
+#pragma mark - BulkEnrollResponse
 
-@implementation DetectRequest
+@implementation BulkEnrollResponse
 
-@dynamic hasImage, image;
-@dynamic source;
-@dynamic frame;
+@dynamic requestCount;
+@dynamic enrollCount;
+@dynamic replaceCount;
+
+typedef struct BulkEnrollResponse__storage_ {
+  uint32_t _has_storage_[1];
+  int64_t requestCount;
+  int64_t enrollCount;
+  int64_t replaceCount;
+} BulkEnrollResponse__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "requestCount",
+        .dataTypeSpecific.className = NULL,
+        .number = BulkEnrollResponse_FieldNumber_RequestCount,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(BulkEnrollResponse__storage_, requestCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "enrollCount",
+        .dataTypeSpecific.className = NULL,
+        .number = BulkEnrollResponse_FieldNumber_EnrollCount,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(BulkEnrollResponse__storage_, enrollCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "replaceCount",
+        .dataTypeSpecific.className = NULL,
+        .number = BulkEnrollResponse_FieldNumber_ReplaceCount,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(BulkEnrollResponse__storage_, replaceCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[BulkEnrollResponse class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(BulkEnrollResponse__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - DetectRequest
+
+@implementation DetectRequest
+
+@dynamic hasImage, image;
+@dynamic source;
+@dynamic frame;
 @dynamic subjectId;
 @dynamic subjectName;
 @dynamic hasDetectOptions, detectOptions;
@@ -2214,6 +2635,327 @@ typedef struct ScoreRequest__storage_ {
 
 @end
 
+#pragma mark - ScoreBlock
+
+@implementation ScoreBlock
+
+@dynamic probeStart;
+@dynamic galleryStart;
+@dynamic probeCount;
+@dynamic galleryCount;
+@dynamic scores;
+
+typedef struct ScoreBlock__storage_ {
+  uint32_t _has_storage_[1];
+  int32_t probeCount;
+  int32_t galleryCount;
+  NSData *scores;
+  int64_t probeStart;
+  int64_t galleryStart;
+} ScoreBlock__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "probeStart",
+        .dataTypeSpecific.className = NULL,
+        .number = ScoreBlock_FieldNumber_ProbeStart,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(ScoreBlock__storage_, probeStart),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "galleryStart",
+        .dataTypeSpecific.className = NULL,
+        .number = ScoreBlock_FieldNumber_GalleryStart,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(ScoreBlock__storage_, galleryStart),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "probeCount",
+        .dataTypeSpecific.className = NULL,
+        .number = ScoreBlock_FieldNumber_ProbeCount,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(ScoreBlock__storage_, probeCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "galleryCount",
+        .dataTypeSpecific.className = NULL,
+        .number = ScoreBlock_FieldNumber_GalleryCount,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(ScoreBlock__storage_, galleryCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "scores",
+        .dataTypeSpecific.className = NULL,
+        .number = ScoreBlock_FieldNumber_Scores,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(ScoreBlock__storage_, scores),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBytes,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[ScoreBlock class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(ScoreBlock__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - MatchDistributionRequest
+
+@implementation MatchDistributionRequest
+
+@dynamic galleryName;
+@dynamic bins;
+@dynamic minScore;
+@dynamic maxScore;
+@dynamic includeScores;
+
+typedef struct MatchDistributionRequest__storage_ {
+  uint32_t _has_storage_[1];
+  int32_t bins;
+  float minScore;
+  float maxScore;
+  NSString *galleryName;
+} MatchDistributionRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistributionRequest_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(MatchDistributionRequest__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "bins",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistributionRequest_FieldNumber_Bins,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(MatchDistributionRequest__storage_, bins),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "minScore",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistributionRequest_FieldNumber_MinScore,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(MatchDistributionRequest__storage_, minScore),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "maxScore",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistributionRequest_FieldNumber_MaxScore,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(MatchDistributionRequest__storage_, maxScore),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "includeScores",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistributionRequest_FieldNumber_IncludeScores,
+        .hasIndex = 4,
+        .offset = 5,  // Stored in _has_storage_ to save space.
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBool,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[MatchDistributionRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(MatchDistributionRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - MatchDistribution
+
+@implementation MatchDistribution
+
+@dynamic hasBlock, block;
+@dynamic faceCount;
+@dynamic genuineCount;
+@dynamic impostorCount;
+@dynamic binEdgesArray, binEdgesArray_Count;
+@dynamic genuineHistogramArray, genuineHistogramArray_Count;
+@dynamic impostorHistogramArray, impostorHistogramArray_Count;
+@dynamic thresholdsArray, thresholdsArray_Count;
+@dynamic farArray, farArray_Count;
+@dynamic frrArray, frrArray_Count;
+
+typedef struct MatchDistribution__storage_ {
+  uint32_t _has_storage_[1];
+  ScoreBlock *block;
+  GPBFloatArray *binEdgesArray;
+  GPBInt64Array *genuineHistogramArray;
+  GPBInt64Array *impostorHistogramArray;
+  GPBFloatArray *thresholdsArray;
+  GPBFloatArray *farArray;
+  GPBFloatArray *frrArray;
+  int64_t faceCount;
+  int64_t genuineCount;
+  int64_t impostorCount;
+} MatchDistribution__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "block",
+        .dataTypeSpecific.className = GPBStringifySymbol(ScoreBlock),
+        .number = MatchDistribution_FieldNumber_Block,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, block),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeMessage,
+      },
+      {
+        .name = "faceCount",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_FaceCount,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, faceCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "genuineCount",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_GenuineCount,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, genuineCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "impostorCount",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_ImpostorCount,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, impostorCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "binEdgesArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_BinEdgesArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, binEdgesArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "genuineHistogramArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_GenuineHistogramArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, genuineHistogramArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "impostorHistogramArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_ImpostorHistogramArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, impostorHistogramArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "thresholdsArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_ThresholdsArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, thresholdsArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "farArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_FarArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, farArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeFloat,
+      },
+      {
+        .name = "frrArray",
+        .dataTypeSpecific.className = NULL,
+        .number = MatchDistribution_FieldNumber_FrrArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(MatchDistribution__storage_, frrArray),
+        .flags = (GPBFieldFlags)(GPBFieldRepeated | GPBFieldPacked),
+        .dataType = GPBDataTypeFloat,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[MatchDistribution class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(MatchDistribution__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
 #pragma mark - DetectExtractRequest
 
 @implementation DetectExtractRequest
@@ -2451,6 +3193,9 @@ typedef struct FaceStatusRequest__storage_ {
 @dynamic matchThreshold;
 @dynamic algorithm;
 @dynamic notes;
+@dynamic faroVersion;
+@dynamic instanceName;
+@dynamic hasGalleryCache, galleryCache;
 
 typedef struct FaceServiceInfo__storage_ {
   uint32_t _has_storage_[1];
@@ -2461,6 +3206,9 @@ typedef struct FaceServiceInfo__storage_ {
   float matchThreshold;
   NSString *algorithm;
   NSString *notes;
+  NSString *faroVersion;
+  NSString *instanceName;
+  GalleryCacheStats *galleryCache;
 } FaceServiceInfo__storage_;
 
 // This method is threadsafe because it is initially called
@@ -2568,14 +3316,476 @@ typedef struct FaceServiceInfo__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
       },
-    };
-    GPBDescriptor *localDescriptor =
+      {
+        .name = "faroVersion",
+        .dataTypeSpecific.className = NULL,
+        .number = FaceServiceInfo_FieldNumber_FaroVersion,
+        .hasIndex = 15,
+        .offset = (uint32_t)offsetof(FaceServiceInfo__storage_, faroVersion),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "instanceName",
+        .dataTypeSpecific.className = NULL,
+        .number = FaceServiceInfo_FieldNumber_InstanceName,
+        .hasIndex = 16,
+        .offset = (uint32_t)offsetof(FaceServiceInfo__storage_, instanceName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "galleryCache",
+        .dataTypeSpecific.className = GPBStringifySymbol(GalleryCacheStats),
+        .number = FaceServiceInfo_FieldNumber_GalleryCache,
+        .hasIndex = 17,
+        .offset = (uint32_t)offsetof(FaceServiceInfo__storage_, galleryCache),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeMessage,
+      },
+    };
+    GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[FaceServiceInfo class]
                                      rootClass:[FaceServiceRoot class]
                                           file:FaceServiceRoot_FileDescriptor()
                                         fields:fields
                                     fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
-                                   storageSize:sizeof(FaceServiceInfo__storage_)
+                                   storageSize:sizeof(FaceServiceInfo__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+int32_t FaceServiceInfo_Status_RawValue(FaceServiceInfo *message) {
+  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
+  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_Status];
+  return GPBGetMessageInt32Field(message, field);
+}
+
+void SetFaceServiceInfo_Status_RawValue(FaceServiceInfo *message, int32_t value) {
+  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
+  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_Status];
+  GPBSetInt32IvarWithFieldInternal(message, field, value, descriptor.file.syntax);
+}
+
+int32_t FaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message) {
+  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
+  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_ScoreType];
+  return GPBGetMessageInt32Field(message, field);
+}
+
+void SetFaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message, int32_t value) {
+  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
+  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_ScoreType];
+  GPBSetInt32IvarWithFieldInternal(message, field, value, descriptor.file.syntax);
+}
+
+#pragma mark - GalleryCacheStats
+
+@implementation GalleryCacheStats
+
+@dynamic openGalleries;
+@dynamic pinnedGalleries;
+@dynamic openBytes;
+@dynamic maxOpen;
+@dynamic maxBytes;
+@dynamic hits;
+@dynamic misses;
+@dynamic evictions;
+
+typedef struct GalleryCacheStats__storage_ {
+  uint32_t _has_storage_[1];
+  int64_t openGalleries;
+  int64_t pinnedGalleries;
+  int64_t openBytes;
+  int64_t maxOpen;
+  int64_t maxBytes;
+  int64_t hits;
+  int64_t misses;
+  int64_t evictions;
+} GalleryCacheStats__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "openGalleries",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_OpenGalleries,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, openGalleries),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "pinnedGalleries",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_PinnedGalleries,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, pinnedGalleries),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "openBytes",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_OpenBytes,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, openBytes),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "maxOpen",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_MaxOpen,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, maxOpen),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "maxBytes",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_MaxBytes,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, maxBytes),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "hits",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_Hits,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, hits),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "misses",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_Misses,
+        .hasIndex = 6,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, misses),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "evictions",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCacheStats_FieldNumber_Evictions,
+        .hasIndex = 7,
+        .offset = (uint32_t)offsetof(GalleryCacheStats__storage_, evictions),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryCacheStats class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryCacheStats__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - GalleryListRequest
+
+@implementation GalleryListRequest
+
+
+typedef struct GalleryListRequest__storage_ {
+  uint32_t _has_storage_[1];
+} GalleryListRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryListRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:NULL
+                                    fieldCount:0
+                                   storageSize:sizeof(GalleryListRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - GalleryDeleteRequest
+
+@implementation GalleryDeleteRequest
+
+@dynamic galleryName;
+
+typedef struct GalleryDeleteRequest__storage_ {
+  uint32_t _has_storage_[1];
+  NSString *galleryName;
+} GalleryDeleteRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryDeleteRequest_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryDeleteRequest__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryDeleteRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryDeleteRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - GalleryConfigureRequest
+
+@implementation GalleryConfigureRequest
+
+@dynamic galleryName;
+@dynamic indexQuantization;
+
+typedef struct GalleryConfigureRequest__storage_ {
+  uint32_t _has_storage_[1];
+  NSString *galleryName;
+  NSString *indexQuantization;
+} GalleryConfigureRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryConfigureRequest_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryConfigureRequest__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "indexQuantization",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryConfigureRequest_FieldNumber_IndexQuantization,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryConfigureRequest__storage_, indexQuantization),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryConfigureRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryConfigureRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - GalleryCompactRequest
+
+@implementation GalleryCompactRequest
+
+@dynamic galleryName;
+
+typedef struct GalleryCompactRequest__storage_ {
+  uint32_t _has_storage_[1];
+  NSString *galleryName;
+} GalleryCompactRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactRequest_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryCompactRequest__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryCompactRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryCompactRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - GalleryCompactResponse
+
+@implementation GalleryCompactResponse
+
+@dynamic galleryName;
+@dynamic faceCount;
+@dynamic rowsRemoved;
+@dynamic bytesBefore;
+@dynamic bytesAfter;
+@dynamic bytesReclaimed;
+@dynamic compactTime;
+
+typedef struct GalleryCompactResponse__storage_ {
+  uint32_t _has_storage_[1];
+  float compactTime;
+  NSString *galleryName;
+  int64_t faceCount;
+  int64_t rowsRemoved;
+  int64_t bytesBefore;
+  int64_t bytesAfter;
+  int64_t bytesReclaimed;
+} GalleryCompactResponse__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "faceCount",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_FaceCount,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, faceCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "rowsRemoved",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_RowsRemoved,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, rowsRemoved),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "bytesBefore",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_BytesBefore,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, bytesBefore),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "bytesAfter",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_BytesAfter,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, bytesAfter),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "bytesReclaimed",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_BytesReclaimed,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, bytesReclaimed),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "compactTime",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryCompactResponse_FieldNumber_CompactTime,
+        .hasIndex = 6,
+        .offset = (uint32_t)offsetof(GalleryCompactResponse__storage_, compactTime),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeFloat,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryCompactResponse class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryCompactResponse__storage_)
                                          flags:GPBDescriptorInitializationFlag_None];
     #if defined(DEBUG) && DEBUG
       NSAssert(descriptor == nil, @"Startup recursed!");
@@ -2587,51 +3797,205 @@ typedef struct FaceServiceInfo__storage_ {
 
 @end
 
-int32_t FaceServiceInfo_Status_RawValue(FaceServiceInfo *message) {
-  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
-  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_Status];
-  return GPBGetMessageInt32Field(message, field);
-}
+#pragma mark - GalleryExportRequest
 
-void SetFaceServiceInfo_Status_RawValue(FaceServiceInfo *message, int32_t value) {
-  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
-  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_Status];
-  GPBSetInt32IvarWithFieldInternal(message, field, value, descriptor.file.syntax);
-}
+@implementation GalleryExportRequest
 
-int32_t FaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message) {
-  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
-  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_ScoreType];
-  return GPBGetMessageInt32Field(message, field);
-}
+@dynamic galleryName;
+@dynamic startRow;
+@dynamic fileId;
+@dynamic chunkSize;
+@dynamic includeViews;
 
-void SetFaceServiceInfo_ScoreType_RawValue(FaceServiceInfo *message, int32_t value) {
-  GPBDescriptor *descriptor = [FaceServiceInfo descriptor];
-  GPBFieldDescriptor *field = [descriptor fieldWithNumber:FaceServiceInfo_FieldNumber_ScoreType];
-  GPBSetInt32IvarWithFieldInternal(message, field, value, descriptor.file.syntax);
+typedef struct GalleryExportRequest__storage_ {
+  uint32_t _has_storage_[1];
+  int32_t chunkSize;
+  NSString *galleryName;
+  NSString *fileId;
+  int64_t startRow;
+} GalleryExportRequest__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryExportRequest_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryExportRequest__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "startRow",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryExportRequest_FieldNumber_StartRow,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryExportRequest__storage_, startRow),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "fileId",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryExportRequest_FieldNumber_FileId,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryExportRequest__storage_, fileId),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "chunkSize",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryExportRequest_FieldNumber_ChunkSize,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryExportRequest__storage_, chunkSize),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "includeViews",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryExportRequest_FieldNumber_IncludeViews,
+        .hasIndex = 4,
+        .offset = 5,  // Stored in _has_storage_ to save space.
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBool,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[GalleryExportRequest class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryExportRequest__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
 }
 
-#pragma mark - GalleryListRequest
+@end
 
-@implementation GalleryListRequest
+#pragma mark - GalleryChunk
 
+@implementation GalleryChunk
 
-typedef struct GalleryListRequest__storage_ {
+@dynamic galleryName;
+@dynamic fileId;
+@dynamic startRow;
+@dynamic nextRow;
+@dynamic rowCount;
+@dynamic dim;
+@dynamic templates;
+@dynamic hasRecords, records;
+
+typedef struct GalleryChunk__storage_ {
   uint32_t _has_storage_[1];
-} GalleryListRequest__storage_;
+  int32_t dim;
+  NSString *galleryName;
+  NSString *fileId;
+  NSData *templates;
+  FaceRecordList *records;
+  int64_t startRow;
+  int64_t nextRow;
+  int64_t rowCount;
+} GalleryChunk__storage_;
 
 // This method is threadsafe because it is initially called
 // in +initialize for each subclass.
 + (GPBDescriptor *)descriptor {
   static GPBDescriptor *descriptor = nil;
   if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "galleryName",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_GalleryName,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "fileId",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_FileId,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, fileId),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "startRow",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_StartRow,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, startRow),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "nextRow",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_NextRow,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, nextRow),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "rowCount",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_RowCount,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, rowCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "dim",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_Dim,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, dim),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "templates",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryChunk_FieldNumber_Templates,
+        .hasIndex = 6,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, templates),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBytes,
+      },
+      {
+        .name = "records",
+        .dataTypeSpecific.className = GPBStringifySymbol(FaceRecordList),
+        .number = GalleryChunk_FieldNumber_Records,
+        .hasIndex = 7,
+        .offset = (uint32_t)offsetof(GalleryChunk__storage_, records),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeMessage,
+      },
+    };
     GPBDescriptor *localDescriptor =
-        [GPBDescriptor allocDescriptorForClass:[GalleryListRequest class]
+        [GPBDescriptor allocDescriptorForClass:[GalleryChunk class]
                                      rootClass:[FaceServiceRoot class]
                                           file:FaceServiceRoot_FileDescriptor()
-                                        fields:NULL
-                                    fieldCount:0
-                                   storageSize:sizeof(GalleryListRequest__storage_)
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(GalleryChunk__storage_)
                                          flags:GPBDescriptorInitializationFlag_None];
     #if defined(DEBUG) && DEBUG
       NSAssert(descriptor == nil, @"Startup recursed!");
@@ -2643,16 +4007,24 @@ typedef struct GalleryListRequest__storage_ {
 
 @end
 
-#pragma mark - GalleryDeleteRequest
+#pragma mark - GalleryImportResponse
 
-@implementation GalleryDeleteRequest
+@implementation GalleryImportResponse
 
 @dynamic galleryName;
+@dynamic fileId;
+@dynamic nextRow;
+@dynamic enrollCount;
+@dynamic replaceCount;
 
-typedef struct GalleryDeleteRequest__storage_ {
+typedef struct GalleryImportResponse__storage_ {
   uint32_t _has_storage_[1];
   NSString *galleryName;
-} GalleryDeleteRequest__storage_;
+  NSString *fileId;
+  int64_t nextRow;
+  int64_t enrollCount;
+  int64_t replaceCount;
+} GalleryImportResponse__storage_;
 
 // This method is threadsafe because it is initially called
 // in +initialize for each subclass.
@@ -2663,20 +4035,56 @@ typedef struct GalleryDeleteRequest__storage_ {
       {
         .name = "galleryName",
         .dataTypeSpecific.className = NULL,
-        .number = GalleryDeleteRequest_FieldNumber_GalleryName,
+        .number = GalleryImportResponse_FieldNumber_GalleryName,
         .hasIndex = 0,
-        .offset = (uint32_t)offsetof(GalleryDeleteRequest__storage_, galleryName),
+        .offset = (uint32_t)offsetof(GalleryImportResponse__storage_, galleryName),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "fileId",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryImportResponse_FieldNumber_FileId,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(GalleryImportResponse__storage_, fileId),
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
       },
+      {
+        .name = "nextRow",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryImportResponse_FieldNumber_NextRow,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryImportResponse__storage_, nextRow),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "enrollCount",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryImportResponse_FieldNumber_EnrollCount,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryImportResponse__storage_, enrollCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "replaceCount",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryImportResponse_FieldNumber_ReplaceCount,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(GalleryImportResponse__storage_, replaceCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
     };
     GPBDescriptor *localDescriptor =
-        [GPBDescriptor allocDescriptorForClass:[GalleryDeleteRequest class]
+        [GPBDescriptor allocDescriptorForClass:[GalleryImportResponse class]
                                      rootClass:[FaceServiceRoot class]
                                           file:FaceServiceRoot_FileDescriptor()
                                         fields:fields
                                     fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
-                                   storageSize:sizeof(GalleryDeleteRequest__storage_)
+                                   storageSize:sizeof(GalleryImportResponse__storage_)
                                          flags:GPBDescriptorInitializationFlag_None];
     #if defined(DEBUG) && DEBUG
       NSAssert(descriptor == nil, @"Startup recursed!");
@@ -2862,11 +4270,13 @@ typedef struct EnrollmentListResponse__storage_ {
 
 @dynamic galleryName;
 @dynamic subjectId;
+@dynamic galleryKey;
 
 typedef struct EnrollmentDeleteRequest__storage_ {
   uint32_t _has_storage_[1];
   NSString *galleryName;
   NSString *subjectId;
+  NSString *galleryKey;
 } EnrollmentDeleteRequest__storage_;
 
 // This method is threadsafe because it is initially called
@@ -2893,6 +4303,15 @@ typedef struct EnrollmentDeleteRequest__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
       },
+      {
+        .name = "galleryKey",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollmentDeleteRequest_FieldNumber_GalleryKey,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(EnrollmentDeleteRequest__storage_, galleryKey),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[EnrollmentDeleteRequest class]
@@ -2912,17 +4331,72 @@ typedef struct EnrollmentDeleteRequest__storage_ {
 
 @end
 
+#pragma mark - EnrollmentDeleteResponse
+
+@implementation EnrollmentDeleteResponse
+
+@dynamic deleteCount;
+
+typedef struct EnrollmentDeleteResponse__storage_ {
+  uint32_t _has_storage_[1];
+  int64_t deleteCount;
+} EnrollmentDeleteResponse__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "deleteCount",
+        .dataTypeSpecific.className = NULL,
+        .number = EnrollmentDeleteResponse_FieldNumber_DeleteCount,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(EnrollmentDeleteResponse__storage_, deleteCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[EnrollmentDeleteResponse class]
+                                     rootClass:[FaceServiceRoot class]
+                                          file:FaceServiceRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(EnrollmentDeleteResponse__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    #if defined(DEBUG) && DEBUG
+      NSAssert(descriptor == nil, @"Startup recursed!");
+    #endif  // DEBUG
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
 #pragma mark - GalleryInfo
 
 @implementation GalleryInfo
 
 @dynamic galleryName;
 @dynamic faceCount;
+@dynamic subjectCount;
+@dynamic templateDim;
+@dynamic fileBytes;
+@dynamic indexState;
+@dynamic modified;
 
 typedef struct GalleryInfo__storage_ {
   uint32_t _has_storage_[1];
+  int32_t templateDim;
   NSString *galleryName;
+  NSString *indexState;
   int64_t faceCount;
+  int64_t subjectCount;
+  int64_t fileBytes;
+  double modified;
 } GalleryInfo__storage_;
 
 // This method is threadsafe because it is initially called
@@ -2949,6 +4423,51 @@ typedef struct GalleryInfo__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeInt64,
       },
+      {
+        .name = "subjectCount",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryInfo_FieldNumber_SubjectCount,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(GalleryInfo__storage_, subjectCount),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "templateDim",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryInfo_FieldNumber_TemplateDim,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(GalleryInfo__storage_, templateDim),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+      {
+        .name = "fileBytes",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryInfo_FieldNumber_FileBytes,
+        .hasIndex = 4,
+        .offset = (uint32_t)offsetof(GalleryInfo__storage_, fileBytes),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "indexState",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryInfo_FieldNumber_IndexState,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(GalleryInfo__storage_, indexState),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeString,
+      },
+      {
+        .name = "modified",
+        .dataTypeSpecific.className = NULL,
+        .number = GalleryInfo_FieldNumber_Modified,
+        .hasIndex = 6,
+        .offset = (uint32_t)offsetof(GalleryInfo__storage_, modified),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeDouble,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[GalleryInfo class]
@@ -9,6 +9,7 @@
 #import <RxLibrary/GRXWriter.h>
 #endif
 
+@class BulkEnrollResponse;
 @class DetectExtractEnrollRequest;
 @class DetectExtractRequest;
 @class DetectExtractSearchRequest;
@@ -16,15 +17,25 @@
 @class Empty;
 @class EnrollRequest;
 @class EnrollmentDeleteRequest;
+@class EnrollmentDeleteResponse;
 @class EnrollmentListRequest;
 @class ExtractRequest;
 @class FaceRecordList;
 @class FaceServiceInfo;
 @class FaceStatusRequest;
+@class GalleryChunk;
+@class GalleryCompactRequest;
+@class GalleryCompactResponse;
+@class GalleryConfigureRequest;
 @class GalleryDeleteRequest;
+@class GalleryExportRequest;
+@class GalleryImportResponse;
 @class GalleryList;
 @class GalleryListRequest;
+@class MatchDistribution;
+@class MatchDistributionRequest;
 @class Matrix;
+@class ScoreBlock;
 @class ScoreRequest;
 @class SearchRequest;
 
@@ -66,10 +77,18 @@ NS_ASSUME_NONNULL_BEGIN
 
 - (GRPCUnaryProtoCall *)scoreWithMessage:(ScoreRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
+#pragma mark scoreStream(ScoreRequest) returns (stream ScoreBlock)
+
+- (GRPCUnaryProtoCall *)scoreStreamWithMessage:(ScoreRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
 #pragma mark enroll(EnrollRequest) returns (FaceRecordList)
 
 - (GRPCUnaryProtoCall *)enrollWithMessage:(EnrollRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
+#pragma mark bulkEnroll(stream EnrollRequest) returns (BulkEnrollResponse)
+
+- (GRPCStreamingProtoCall *)bulkEnrollWithResponseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
 #pragma mark search(SearchRequest) returns (FaceRecordList)
 
 - (GRPCUnaryProtoCall *)searchWithMessage:(SearchRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
@@ -100,25 +119,51 @@ NS_ASSUME_NONNULL_BEGIN
 
 - (GRPCUnaryProtoCall *)galleryDeleteWithMessage:(GalleryDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
+#pragma mark galleryConfigure(GalleryConfigureRequest) returns (Empty)
+
+- (GRPCUnaryProtoCall *)galleryConfigureWithMessage:(GalleryConfigureRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
+#pragma mark galleryCompact(GalleryCompactRequest) returns (GalleryCompactResponse)
+
+- (GRPCUnaryProtoCall *)galleryCompactWithMessage:(GalleryCompactRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
+#pragma mark galleryExport(GalleryExportRequest) returns (stream GalleryChunk)
+
+- (GRPCUnaryProtoCall *)galleryExportWithMessage:(GalleryExportRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
+#pragma mark galleryImport(stream GalleryChunk) returns (stream GalleryImportResponse)
+
+- (GRPCStreamingProtoCall *)galleryImportWithResponseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
 #pragma mark enrollmentList(EnrollmentListRequest) returns (FaceRecordList)
 
 - (GRPCUnaryProtoCall *)enrollmentListWithMessage:(EnrollmentListRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
-#pragma mark enrollmentDelete(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark trainFromGallery(EnrollmentListRequest) returns (Empty)
+
+- (GRPCUnaryProtoCall *)trainFromGalleryWithMessage:(EnrollmentListRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+
+#pragma mark subjectDelete(EnrollmentDeleteRequest) returns (EnrollmentDeleteResponse)
 
-- (GRPCUnaryProtoCall *)enrollmentDeleteWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+- (GRPCUnaryProtoCall *)subjectDeleteWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
-#pragma mark enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark generateMatchDistribution(EnrollmentListRequest) returns (Matrix)
 
-- (GRPCUnaryProtoCall *)enrollmentDeleteConditionalWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+- (GRPCUnaryProtoCall *)generateMatchDistributionWithMessage:(EnrollmentListRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
-#pragma mark enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark matchDistribution(MatchDistributionRequest) returns (stream MatchDistribution)
 
-- (GRPCUnaryProtoCall *)enrollmentTransferWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
+- (GRPCUnaryProtoCall *)matchDistributionWithMessage:(MatchDistributionRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
 
 #pragma mark echo(Matrix) returns (Matrix)
 
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  */
 - (GRPCUnaryProtoCall *)echoWithMessage:(Matrix *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions;
@@ -179,6 +224,13 @@ NS_ASSUME_NONNULL_BEGIN
 - (GRPCProtoCall *)RPCToscoreWithRequest:(ScoreRequest *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler;
 
 
+#pragma mark scoreStream(ScoreRequest) returns (stream ScoreBlock)
+
+- (void)scoreStreamWithRequest:(ScoreRequest *)request eventHandler:(void(^)(BOOL done, ScoreBlock *_Nullable response, NSError *_Nullable error))eventHandler;
+
+- (GRPCProtoCall *)RPCToscoreStreamWithRequest:(ScoreRequest *)request eventHandler:(void(^)(BOOL done, ScoreBlock *_Nullable response, NSError *_Nullable error))eventHandler;
+
+
 #pragma mark enroll(EnrollRequest) returns (FaceRecordList)
 
 - (void)enrollWithRequest:(EnrollRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
@@ -186,6 +238,13 @@ NS_ASSUME_NONNULL_BEGIN
 - (GRPCProtoCall *)RPCToenrollWithRequest:(EnrollRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
 
 
+#pragma mark bulkEnroll(stream EnrollRequest) returns (BulkEnrollResponse)
+
+- (void)bulkEnrollWithRequestsWriter:(GRXWriter *)requestWriter handler:(void(^)(BulkEnrollResponse *_Nullable response, NSError *_Nullable error))handler;
+
+- (GRPCProtoCall *)RPCTobulkEnrollWithRequestsWriter:(GRXWriter *)requestWriter handler:(void(^)(BulkEnrollResponse *_Nullable response, NSError *_Nullable error))handler;
+
+
 #pragma mark search(SearchRequest) returns (FaceRecordList)
 
 - (void)searchWithRequest:(SearchRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
@@ -248,6 +307,34 @@ NS_ASSUME_NONNULL_BEGIN
 - (GRPCProtoCall *)RPCTogalleryDeleteWithRequest:(GalleryDeleteRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler;
 
 
+#pragma mark galleryConfigure(GalleryConfigureRequest) returns (Empty)
+
+- (void)galleryConfigureWithRequest:(GalleryConfigureRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler;
+
+- (GRPCProtoCall *)RPCTogalleryConfigureWithRequest:(GalleryConfigureRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler;
+
+
+#pragma mark galleryCompact(GalleryCompactRequest) returns (GalleryCompactResponse)
+
+- (void)galleryCompactWithRequest:(GalleryCompactRequest *)request handler:(void(^)(GalleryCompactResponse *_Nullable response, NSError *_Nullable error))handler;
+
+- (GRPCProtoCall *)RPCTogalleryCompactWithRequest:(GalleryCompactRequest *)request handler:(void(^)(GalleryCompactResponse *_Nullable response, NSError *_Nullable error))handler;
+
+
+#pragma mark galleryExport(GalleryExportRequest) returns (stream GalleryChunk)
+
+- (void)galleryExportWithRequest:(GalleryExportRequest *)request eventHandler:(void(^)(BOOL done, GalleryChunk *_Nullable response, NSError *_Nullable error))eventHandler;
+
+- (GRPCProtoCall *)RPCTogalleryExportWithRequest:(GalleryExportRequest *)request eventHandler:(void(^)(BOOL done, GalleryChunk *_Nullable response, NSError *_Nullable error))eventHandler;
+
+
+#pragma mark galleryImport(stream GalleryChunk) returns (stream GalleryImportResponse)
+
+- (void)galleryImportWithRequestsWriter:(GRXWriter *)requestWriter eventHandler:(void(^)(BOOL done, GalleryImportResponse *_Nullable response, NSError *_Nullable error))eventHandler;
+
+- (GRPCProtoCall *)RPCTogalleryImportWithRequestsWriter:(GRXWriter *)requestWriter eventHandler:(void(^)(BOOL done, GalleryImportResponse *_Nullable response, NSError *_Nullable error))eventHandler;
+
+
 #pragma mark enrollmentList(EnrollmentListRequest) returns (FaceRecordList)
 
 - (void)enrollmentListWithRequest:(EnrollmentListRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
@@ -255,30 +342,43 @@ NS_ASSUME_NONNULL_BEGIN
 - (GRPCProtoCall *)RPCToenrollmentListWithRequest:(EnrollmentListRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
 
 
-#pragma mark enrollmentDelete(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark trainFromGallery(EnrollmentListRequest) returns (Empty)
+
+- (void)trainFromGalleryWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler;
+
+- (GRPCProtoCall *)RPCTotrainFromGalleryWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler;
+
+
+#pragma mark subjectDelete(EnrollmentDeleteRequest) returns (EnrollmentDeleteResponse)
 
-- (void)enrollmentDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (void)subjectDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(EnrollmentDeleteResponse *_Nullable response, NSError *_Nullable error))handler;
 
-- (GRPCProtoCall *)RPCToenrollmentDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (GRPCProtoCall *)RPCTosubjectDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(EnrollmentDeleteResponse *_Nullable response, NSError *_Nullable error))handler;
 
 
-#pragma mark enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark generateMatchDistribution(EnrollmentListRequest) returns (Matrix)
 
-- (void)enrollmentDeleteConditionalWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (void)generateMatchDistributionWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler;
 
-- (GRPCProtoCall *)RPCToenrollmentDeleteConditionalWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (GRPCProtoCall *)RPCTogenerateMatchDistributionWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler;
 
 
-#pragma mark enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark matchDistribution(MatchDistributionRequest) returns (stream MatchDistribution)
 
-- (void)enrollmentTransferWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (void)matchDistributionWithRequest:(MatchDistributionRequest *)request eventHandler:(void(^)(BOOL done, MatchDistribution *_Nullable response, NSError *_Nullable error))eventHandler;
 
-- (GRPCProtoCall *)RPCToenrollmentTransferWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler;
+- (GRPCProtoCall *)RPCTomatchDistributionWithRequest:(MatchDistributionRequest *)request eventHandler:(void(^)(BOOL done, MatchDistribution *_Nullable response, NSError *_Nullable error))eventHandler;
 
 
 #pragma mark echo(Matrix) returns (Matrix)
 
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  *
  * This method belongs to a set of APIs that have been deprecated. Using the v2 API is recommended.
@@ -286,6 +386,12 @@ NS_ASSUME_NONNULL_BEGIN
 - (void)echoWithRequest:(Matrix *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler;
 
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  *
  * This method belongs to a set of APIs that have been deprecated. Using the v2 API is recommended.
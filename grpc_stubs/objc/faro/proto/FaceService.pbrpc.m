@@ -160,6 +160,26 @@
              responseClass:[Matrix class]];
 }
 
+#pragma mark scoreStream(ScoreRequest) returns (stream ScoreBlock)
+
+- (void)scoreStreamWithRequest:(ScoreRequest *)request eventHandler:(void(^)(BOOL done, ScoreBlock *_Nullable response, NSError *_Nullable error))eventHandler{
+  [[self RPCToscoreStreamWithRequest:request eventHandler:eventHandler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCToscoreStreamWithRequest:(ScoreRequest *)request eventHandler:(void(^)(BOOL done, ScoreBlock *_Nullable response, NSError *_Nullable error))eventHandler{
+  return [self RPCToMethod:@"scoreStream"
+            requestsWriter:[GRXWriter writerWithValue:request]
+             responseClass:[ScoreBlock class]
+        responsesWriteable:[GRXWriteable writeableWithEventHandler:eventHandler]];
+}
+- (GRPCUnaryProtoCall *)scoreStreamWithMessage:(ScoreRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"scoreStream"
+                   message:message
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[ScoreBlock class]];
+}
+
 #pragma mark enroll(EnrollRequest) returns (FaceRecordList)
 
 - (void)enrollWithRequest:(EnrollRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
@@ -180,6 +200,25 @@
              responseClass:[FaceRecordList class]];
 }
 
+#pragma mark bulkEnroll(stream EnrollRequest) returns (BulkEnrollResponse)
+
+- (void)bulkEnrollWithRequestsWriter:(GRXWriter *)requestWriter handler:(void(^)(BulkEnrollResponse *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTobulkEnrollWithRequestsWriter:requestWriter handler:handler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTobulkEnrollWithRequestsWriter:(GRXWriter *)requestWriter handler:(void(^)(BulkEnrollResponse *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"bulkEnroll"
+            requestsWriter:requestWriter
+             responseClass:[BulkEnrollResponse class]
+        responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
+}
+- (GRPCStreamingProtoCall *)bulkEnrollWithResponseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"bulkEnroll"
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[BulkEnrollResponse class]];
+}
+
 #pragma mark search(SearchRequest) returns (FaceRecordList)
 
 - (void)searchWithRequest:(SearchRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
@@ -326,6 +365,85 @@
              responseClass:[Empty class]];
 }
 
+#pragma mark galleryConfigure(GalleryConfigureRequest) returns (Empty)
+
+- (void)galleryConfigureWithRequest:(GalleryConfigureRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTogalleryConfigureWithRequest:request handler:handler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTogalleryConfigureWithRequest:(GalleryConfigureRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"galleryConfigure"
+            requestsWriter:[GRXWriter writerWithValue:request]
+             responseClass:[Empty class]
+        responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
+}
+- (GRPCUnaryProtoCall *)galleryConfigureWithMessage:(GalleryConfigureRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"galleryConfigure"
+                   message:message
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[Empty class]];
+}
+
+#pragma mark galleryCompact(GalleryCompactRequest) returns (GalleryCompactResponse)
+
+- (void)galleryCompactWithRequest:(GalleryCompactRequest *)request handler:(void(^)(GalleryCompactResponse *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTogalleryCompactWithRequest:request handler:handler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTogalleryCompactWithRequest:(GalleryCompactRequest *)request handler:(void(^)(GalleryCompactResponse *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"galleryCompact"
+            requestsWriter:[GRXWriter writerWithValue:request]
+             responseClass:[GalleryCompactResponse class]
+        responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
+}
+- (GRPCUnaryProtoCall *)galleryCompactWithMessage:(GalleryCompactRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"galleryCompact"
+                   message:message
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[GalleryCompactResponse class]];
+}
+
+#pragma mark galleryExport(GalleryExportRequest) returns (stream GalleryChunk)
+
+- (void)galleryExportWithRequest:(GalleryExportRequest *)request eventHandler:(void(^)(BOOL done, GalleryChunk *_Nullable response, NSError *_Nullable error))eventHandler{
+  [[self RPCTogalleryExportWithRequest:request eventHandler:eventHandler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTogalleryExportWithRequest:(GalleryExportRequest *)request eventHandler:(void(^)(BOOL done, GalleryChunk *_Nullable response, NSError *_Nullable error))eventHandler{
+  return [self RPCToMethod:@"galleryExport"
+            requestsWriter:[GRXWriter writerWithValue:request]
+             responseClass:[GalleryChunk class]
+        responsesWriteable:[GRXWriteable writeableWithEventHandler:eventHandler]];
+}
+- (GRPCUnaryProtoCall *)galleryExportWithMessage:(GalleryExportRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"galleryExport"
+                   message:message
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[GalleryChunk class]];
+}
+
+#pragma mark galleryImport(stream GalleryChunk) returns (stream GalleryImportResponse)
+
+- (void)galleryImportWithRequestsWriter:(GRXWriter *)requestWriter eventHandler:(void(^)(BOOL done, GalleryImportResponse *_Nullable response, NSError *_Nullable error))eventHandler{
+  [[self RPCTogalleryImportWithRequestsWriter:requestWriter eventHandler:eventHandler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTogalleryImportWithRequestsWriter:(GRXWriter *)requestWriter eventHandler:(void(^)(BOOL done, GalleryImportResponse *_Nullable response, NSError *_Nullable error))eventHandler{
+  return [self RPCToMethod:@"galleryImport"
+            requestsWriter:requestWriter
+             responseClass:[GalleryImportResponse class]
+        responsesWriteable:[GRXWriteable writeableWithEventHandler:eventHandler]];
+}
+- (GRPCStreamingProtoCall *)galleryImportWithResponseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"galleryImport"
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[GalleryImportResponse class]];
+}
+
 #pragma mark enrollmentList(EnrollmentListRequest) returns (FaceRecordList)
 
 - (void)enrollmentListWithRequest:(EnrollmentListRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
@@ -346,69 +464,95 @@
              responseClass:[FaceRecordList class]];
 }
 
-#pragma mark enrollmentDelete(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark trainFromGallery(EnrollmentListRequest) returns (Empty)
 
-- (void)enrollmentDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  [[self RPCToenrollmentDeleteWithRequest:request handler:handler] start];
+- (void)trainFromGalleryWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTotrainFromGalleryWithRequest:request handler:handler] start];
 }
 // Returns a not-yet-started RPC object.
-- (GRPCProtoCall *)RPCToenrollmentDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  return [self RPCToMethod:@"enrollmentDelete"
+- (GRPCProtoCall *)RPCTotrainFromGalleryWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Empty *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"trainFromGallery"
             requestsWriter:[GRXWriter writerWithValue:request]
-             responseClass:[FaceRecordList class]
+             responseClass:[Empty class]
         responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
 }
-- (GRPCUnaryProtoCall *)enrollmentDeleteWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
-  return [self RPCToMethod:@"enrollmentDelete"
+- (GRPCUnaryProtoCall *)trainFromGalleryWithMessage:(EnrollmentListRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"trainFromGallery"
                    message:message
            responseHandler:handler
                callOptions:callOptions
-             responseClass:[FaceRecordList class]];
+             responseClass:[Empty class]];
 }
 
-#pragma mark enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark subjectDelete(EnrollmentDeleteRequest) returns (EnrollmentDeleteResponse)
 
-- (void)enrollmentDeleteConditionalWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  [[self RPCToenrollmentDeleteConditionalWithRequest:request handler:handler] start];
+- (void)subjectDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(EnrollmentDeleteResponse *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTosubjectDeleteWithRequest:request handler:handler] start];
 }
 // Returns a not-yet-started RPC object.
-- (GRPCProtoCall *)RPCToenrollmentDeleteConditionalWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  return [self RPCToMethod:@"enrollmentDeleteConditional"
+- (GRPCProtoCall *)RPCTosubjectDeleteWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(EnrollmentDeleteResponse *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"subjectDelete"
             requestsWriter:[GRXWriter writerWithValue:request]
-             responseClass:[FaceRecordList class]
+             responseClass:[EnrollmentDeleteResponse class]
         responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
 }
-- (GRPCUnaryProtoCall *)enrollmentDeleteConditionalWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
-  return [self RPCToMethod:@"enrollmentDeleteConditional"
+- (GRPCUnaryProtoCall *)subjectDeleteWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"subjectDelete"
                    message:message
            responseHandler:handler
                callOptions:callOptions
-             responseClass:[FaceRecordList class]];
+             responseClass:[EnrollmentDeleteResponse class]];
 }
 
-#pragma mark enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList)
+#pragma mark generateMatchDistribution(EnrollmentListRequest) returns (Matrix)
 
-- (void)enrollmentTransferWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  [[self RPCToenrollmentTransferWithRequest:request handler:handler] start];
+- (void)generateMatchDistributionWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler{
+  [[self RPCTogenerateMatchDistributionWithRequest:request handler:handler] start];
 }
 // Returns a not-yet-started RPC object.
-- (GRPCProtoCall *)RPCToenrollmentTransferWithRequest:(EnrollmentDeleteRequest *)request handler:(void(^)(FaceRecordList *_Nullable response, NSError *_Nullable error))handler{
-  return [self RPCToMethod:@"enrollmentTransfer"
+- (GRPCProtoCall *)RPCTogenerateMatchDistributionWithRequest:(EnrollmentListRequest *)request handler:(void(^)(Matrix *_Nullable response, NSError *_Nullable error))handler{
+  return [self RPCToMethod:@"generateMatchDistribution"
             requestsWriter:[GRXWriter writerWithValue:request]
-             responseClass:[FaceRecordList class]
+             responseClass:[Matrix class]
         responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
 }
-- (GRPCUnaryProtoCall *)enrollmentTransferWithMessage:(EnrollmentDeleteRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
-  return [self RPCToMethod:@"enrollmentTransfer"
+- (GRPCUnaryProtoCall *)generateMatchDistributionWithMessage:(EnrollmentListRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"generateMatchDistribution"
                    message:message
            responseHandler:handler
                callOptions:callOptions
-             responseClass:[FaceRecordList class]];
+             responseClass:[Matrix class]];
+}
+
+#pragma mark matchDistribution(MatchDistributionRequest) returns (stream MatchDistribution)
+
+- (void)matchDistributionWithRequest:(MatchDistributionRequest *)request eventHandler:(void(^)(BOOL done, MatchDistribution *_Nullable response, NSError *_Nullable error))eventHandler{
+  [[self RPCTomatchDistributionWithRequest:request eventHandler:eventHandler] start];
+}
+// Returns a not-yet-started RPC object.
+- (GRPCProtoCall *)RPCTomatchDistributionWithRequest:(MatchDistributionRequest *)request eventHandler:(void(^)(BOOL done, MatchDistribution *_Nullable response, NSError *_Nullable error))eventHandler{
+  return [self RPCToMethod:@"matchDistribution"
+            requestsWriter:[GRXWriter writerWithValue:request]
+             responseClass:[MatchDistribution class]
+        responsesWriteable:[GRXWriteable writeableWithEventHandler:eventHandler]];
+}
+- (GRPCUnaryProtoCall *)matchDistributionWithMessage:(MatchDistributionRequest *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
+  return [self RPCToMethod:@"matchDistribution"
+                   message:message
+           responseHandler:handler
+               callOptions:callOptions
+             responseClass:[MatchDistribution class]];
 }
 
 #pragma mark echo(Matrix) returns (Matrix)
 
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  *
  * This method belongs to a set of APIs that have been deprecated. Using the v2 API is recommended.
@@ -418,6 +562,12 @@
 }
 // Returns a not-yet-started RPC object.
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  *
  * This method belongs to a set of APIs that have been deprecated. Using the v2 API is recommended.
@@ -429,6 +579,12 @@
         responsesWriteable:[GRXWriteable writeableWithSingleHandler:handler]];
 }
 /**
+ * Source Management
+ * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+ * 
+ * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+ * 
  * Test
  */
 - (GRPCUnaryProtoCall *)echoWithMessage:(Matrix *)message responseHandler:(id<GRPCProtoResponseHandler>)handler callOptions:(GRPCCallOptions *_Nullable)callOptions {
@@ -0,0 +1,158 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>AttributeFilter</code>
+ */
+class AttributeFilter extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>string key = 1;</code>
+     */
+    private $key = '';
+    /**
+     * Text or integer values that match.  Empty matches any value.
+     *
+     * Generated from protobuf field <code>repeated string values = 2;</code>
+     */
+    private $values;
+    /**
+     * fvalue must be above min_value and below max_value.
+     *
+     * Generated from protobuf field <code>float min_value = 3;</code>
+     */
+    private $min_value = 0.0;
+    /**
+     * The range is only checked if max_value is greater than min_value.
+     *
+     * Generated from protobuf field <code>float max_value = 4;</code>
+     */
+    private $max_value = 0.0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $key
+     *     @type string[]|\Google\Protobuf\Internal\RepeatedField $values
+     *           Text or integer values that match.  Empty matches any value.
+     *     @type float $min_value
+     *           fvalue must be above min_value and below max_value.
+     *     @type float $max_value
+     *           The range is only checked if max_value is greater than min_value.
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>string key = 1;</code>
+     * @return string
+     */
+    public function getKey()
+    {
+        return $this->key;
+    }
+
+    /**
+     * Generated from protobuf field <code>string key = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setKey($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->key = $var;
+
+        return $this;
+    }
+
+    /**
+     * Text or integer values that match.  Empty matches any value.
+     *
+     * Generated from protobuf field <code>repeated string values = 2;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getValues()
+    {
+        return $this->values;
+    }
+
+    /**
+     * Text or integer values that match.  Empty matches any value.
+     *
+     * Generated from protobuf field <code>repeated string values = 2;</code>
+     * @param string[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setValues($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::STRING);
+        $this->values = $arr;
+
+        return $this;
+    }
+
+    /**
+     * fvalue must be above min_value and below max_value.
+     *
+     * Generated from protobuf field <code>float min_value = 3;</code>
+     * @return float
+     */
+    public function getMinValue()
+    {
+        return $this->min_value;
+    }
+
+    /**
+     * fvalue must be above min_value and below max_value.
+     *
+     * Generated from protobuf field <code>float min_value = 3;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMinValue($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->min_value = $var;
+
+        return $this;
+    }
+
+    /**
+     * The range is only checked if max_value is greater than min_value.
+     *
+     * Generated from protobuf field <code>float max_value = 4;</code>
+     * @return float
+     */
+    public function getMaxValue()
+    {
+        return $this->max_value;
+    }
+
+    /**
+     * The range is only checked if max_value is greater than min_value.
+     *
+     * Generated from protobuf field <code>float max_value = 4;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMaxValue($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->max_value = $var;
+
+        return $this;
+    }
+
+}
+
@@ -0,0 +1,117 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>BulkEnrollResponse</code>
+ */
+class BulkEnrollResponse extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * number of EnrollRequests received on the stream
+     *
+     * Generated from protobuf field <code>int64 request_count = 1;</code>
+     */
+    private $request_count = 0;
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 2;</code>
+     */
+    private $enroll_count = 0;
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 3;</code>
+     */
+    private $replace_count = 0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type int|string $request_count
+     *           number of EnrollRequests received on the stream
+     *     @type int|string $enroll_count
+     *     @type int|string $replace_count
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * number of EnrollRequests received on the stream
+     *
+     * Generated from protobuf field <code>int64 request_count = 1;</code>
+     * @return int|string
+     */
+    public function getRequestCount()
+    {
+        return $this->request_count;
+    }
+
+    /**
+     * number of EnrollRequests received on the stream
+     *
+     * Generated from protobuf field <code>int64 request_count = 1;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setRequestCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->request_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 2;</code>
+     * @return int|string
+     */
+    public function getEnrollCount()
+    {
+        return $this->enroll_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setEnrollCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->enroll_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 3;</code>
+     * @return int|string
+     */
+    public function getReplaceCount()
+    {
+        return $this->replace_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setReplaceCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->replace_count = $var;
+
+        return $this;
+    }
+
+}
+
@@ -57,6 +57,12 @@ class DetectionOptions extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>bool debug = 10;</code>
      */
     private $debug = false;
+    /**
+     * downsample the images to improve speed during detection
+     *
+     * Generated from protobuf field <code>int32 downsample = 11;</code>
+     */
+    private $downsample = 0;
     /**
      * Used for passing algorithm specific options
      *
@@ -84,6 +90,8 @@ class DetectionOptions extends \Google\Protobuf\Internal\Message
      *           log the image on the server - Useful for debugging and record keeping
      *     @type bool $debug
      *           Save or print more info on the server side
+     *     @type int $downsample
+     *           downsample the images to improve speed during detection
      *     @type \Attribute[]|\Google\Protobuf\Internal\RepeatedField $attributes
      *           Used for passing algorithm specific options
      * }
@@ -311,6 +319,32 @@ class DetectionOptions extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * downsample the images to improve speed during detection
+     *
+     * Generated from protobuf field <code>int32 downsample = 11;</code>
+     * @return int
+     */
+    public function getDownsample()
+    {
+        return $this->downsample;
+    }
+
+    /**
+     * downsample the images to improve speed during detection
+     *
+     * Generated from protobuf field <code>int32 downsample = 11;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setDownsample($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->downsample = $var;
+
+        return $this;
+    }
+
     /**
      * Used for passing algorithm specific options
      *
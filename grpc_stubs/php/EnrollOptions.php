@@ -29,6 +29,18 @@ class EnrollOptions extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>repeated .Attribute attributes = 8;</code>
      */
     private $attributes;
+    /**
+     * Skip faces within this distance of a face of the same subject (0 disables)
+     *
+     * Generated from protobuf field <code>float dedup_distance = 9;</code>
+     */
+    private $dedup_distance = 0.0;
+    /**
+     * Average near duplicates into the face they match instead of skipping them
+     *
+     * Generated from protobuf field <code>bool dedup_merge = 10;</code>
+     */
+    private $dedup_merge = false;
 
     /**
      * Constructor.
@@ -42,6 +54,10 @@ class EnrollOptions extends \Google\Protobuf\Internal\Message
      *           Save or print more info on the server side
      *     @type \Attribute[]|\Google\Protobuf\Internal\RepeatedField $attributes
      *           Used for passing algorithm specific options
+     *     @type float $dedup_distance
+     *           Skip faces within this distance of a face of the same subject (0 disables)
+     *     @type bool $dedup_merge
+     *           Average near duplicates into the face they match instead of skipping them
      * }
      */
     public function __construct($data = NULL) {
@@ -127,5 +143,57 @@ class EnrollOptions extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Skip faces within this distance of a face of the same subject (0 disables)
+     *
+     * Generated from protobuf field <code>float dedup_distance = 9;</code>
+     * @return float
+     */
+    public function getDedupDistance()
+    {
+        return $this->dedup_distance;
+    }
+
+    /**
+     * Skip faces within this distance of a face of the same subject (0 disables)
+     *
+     * Generated from protobuf field <code>float dedup_distance = 9;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setDedupDistance($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->dedup_distance = $var;
+
+        return $this;
+    }
+
+    /**
+     * Average near duplicates into the face they match instead of skipping them
+     *
+     * Generated from protobuf field <code>bool dedup_merge = 10;</code>
+     * @return bool
+     */
+    public function getDedupMerge()
+    {
+        return $this->dedup_merge;
+    }
+
+    /**
+     * Average near duplicates into the face they match instead of skipping them
+     *
+     * Generated from protobuf field <code>bool dedup_merge = 10;</code>
+     * @param bool $var
+     * @return $this
+     */
+    public function setDedupMerge($var)
+    {
+        GPBUtil::checkBool($var);
+        $this->dedup_merge = $var;
+
+        return $this;
+    }
+
 }
 
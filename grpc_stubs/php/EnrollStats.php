@@ -0,0 +1,151 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>EnrollStats</code>
+ */
+class EnrollStats extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 1;</code>
+     */
+    private $enroll_count = 0;
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 2;</code>
+     */
+    private $replace_count = 0;
+    /**
+     * Near duplicates that were not enrolled
+     *
+     * Generated from protobuf field <code>int64 skip_count = 3;</code>
+     */
+    private $skip_count = 0;
+    /**
+     * Near duplicates averaged into an existing face
+     *
+     * Generated from protobuf field <code>int64 merge_count = 4;</code>
+     */
+    private $merge_count = 0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type int|string $enroll_count
+     *     @type int|string $replace_count
+     *     @type int|string $skip_count
+     *           Near duplicates that were not enrolled
+     *     @type int|string $merge_count
+     *           Near duplicates averaged into an existing face
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 1;</code>
+     * @return int|string
+     */
+    public function getEnrollCount()
+    {
+        return $this->enroll_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 enroll_count = 1;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setEnrollCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->enroll_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 2;</code>
+     * @return int|string
+     */
+    public function getReplaceCount()
+    {
+        return $this->replace_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setReplaceCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->replace_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Near duplicates that were not enrolled
+     *
+     * Generated from protobuf field <code>int64 skip_count = 3;</code>
+     * @return int|string
+     */
+    public function getSkipCount()
+    {
+        return $this->skip_count;
+    }
+
+    /**
+     * Near duplicates that were not enrolled
+     *
+     * Generated from protobuf field <code>int64 skip_count = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setSkipCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->skip_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Near duplicates averaged into an existing face
+     *
+     * Generated from protobuf field <code>int64 merge_count = 4;</code>
+     * @return int|string
+     */
+    public function getMergeCount()
+    {
+        return $this->merge_count;
+    }
+
+    /**
+     * Near duplicates averaged into an existing face
+     *
+     * Generated from protobuf field <code>int64 merge_count = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setMergeCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->merge_count = $var;
+
+        return $this;
+    }
+
+}
+
@@ -19,6 +19,10 @@ class EnrollmentDeleteRequest extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>string subject_id = 2;</code>
      */
     private $subject_id = '';
+    /**
+     * Generated from protobuf field <code>string gallery_key = 3;</code>
+     */
+    private $gallery_key = '';
 
     /**
      * Constructor.
@@ -28,6 +32,7 @@ class EnrollmentDeleteRequest extends \Google\Protobuf\Internal\Message
      *
      *     @type string $gallery_name
      *     @type string $subject_id
+     *     @type string $gallery_key
      * }
      */
     public function __construct($data = NULL) {
@@ -79,5 +84,27 @@ class EnrollmentDeleteRequest extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Generated from protobuf field <code>string gallery_key = 3;</code>
+     * @return string
+     */
+    public function getGalleryKey()
+    {
+        return $this->gallery_key;
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_key = 3;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryKey($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_key = $var;
+
+        return $this;
+    }
+
 }
 
@@ -0,0 +1,56 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>EnrollmentDeleteResponse</code>
+ */
+class EnrollmentDeleteResponse extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>int64 delete_count = 1;</code>
+     */
+    private $delete_count = 0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type int|string $delete_count
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 delete_count = 1;</code>
+     * @return int|string
+     */
+    public function getDeleteCount()
+    {
+        return $this->delete_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 delete_count = 1;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setDeleteCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->delete_count = $var;
+
+        return $this;
+    }
+
+}
+
@@ -94,6 +94,19 @@ class FaceRecognitionClient extends \Grpc\BaseStub {
         $metadata, $options);
     }
 
+    /**
+     * @param \ScoreRequest $argument input argument
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function scoreStream(\ScoreRequest $argument,
+      $metadata = [], $options = []) {
+        return $this->_serverStreamRequest('/FaceRecognition/scoreStream',
+        $argument,
+        ['\ScoreBlock', 'decode'],
+        $metadata, $options);
+    }
+
     /**
      * @param \EnrollRequest $argument input argument
      * @param array $metadata metadata
@@ -107,6 +120,16 @@ class FaceRecognitionClient extends \Grpc\BaseStub {
         $metadata, $options);
     }
 
+    /**
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function bulkEnroll($metadata = [], $options = []) {
+        return $this->_clientStreamRequest('/FaceRecognition/bulkEnroll',
+        ['\BulkEnrollResponse','decode'],
+        $metadata, $options);
+    }
+
     /**
      * @param \SearchRequest $argument input argument
      * @param array $metadata metadata
@@ -187,6 +210,55 @@ class FaceRecognitionClient extends \Grpc\BaseStub {
         $metadata, $options);
     }
 
+    /**
+     * @param \GalleryConfigureRequest $argument input argument
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function galleryConfigure(\GalleryConfigureRequest $argument,
+      $metadata = [], $options = []) {
+        return $this->_simpleRequest('/FaceRecognition/galleryConfigure',
+        $argument,
+        ['\PBEmpty', 'decode'],
+        $metadata, $options);
+    }
+
+    /**
+     * @param \GalleryCompactRequest $argument input argument
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function galleryCompact(\GalleryCompactRequest $argument,
+      $metadata = [], $options = []) {
+        return $this->_simpleRequest('/FaceRecognition/galleryCompact',
+        $argument,
+        ['\GalleryCompactResponse', 'decode'],
+        $metadata, $options);
+    }
+
+    /**
+     * @param \GalleryExportRequest $argument input argument
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function galleryExport(\GalleryExportRequest $argument,
+      $metadata = [], $options = []) {
+        return $this->_serverStreamRequest('/FaceRecognition/galleryExport',
+        $argument,
+        ['\GalleryChunk', 'decode'],
+        $metadata, $options);
+    }
+
+    /**
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function galleryImport($metadata = [], $options = []) {
+        return $this->_bidiRequest('/FaceRecognition/galleryImport',
+        ['\GalleryImportResponse','decode'],
+        $metadata, $options);
+    }
+
     /**
      * @param \EnrollmentListRequest $argument input argument
      * @param array $metadata metadata
@@ -201,15 +273,15 @@ class FaceRecognitionClient extends \Grpc\BaseStub {
     }
 
     /**
-     * @param \EnrollmentDeleteRequest $argument input argument
+     * @param \EnrollmentListRequest $argument input argument
      * @param array $metadata metadata
      * @param array $options call options
      */
-    public function enrollmentDelete(\EnrollmentDeleteRequest $argument,
+    public function trainFromGallery(\EnrollmentListRequest $argument,
       $metadata = [], $options = []) {
-        return $this->_simpleRequest('/FaceRecognition/enrollmentDelete',
+        return $this->_simpleRequest('/FaceRecognition/trainFromGallery',
         $argument,
-        ['\FaceRecordList', 'decode'],
+        ['\PBEmpty', 'decode'],
         $metadata, $options);
     }
 
@@ -218,28 +290,47 @@ class FaceRecognitionClient extends \Grpc\BaseStub {
      * @param array $metadata metadata
      * @param array $options call options
      */
-    public function enrollmentDeleteConditional(\EnrollmentDeleteRequest $argument,
+    public function subjectDelete(\EnrollmentDeleteRequest $argument,
       $metadata = [], $options = []) {
-        return $this->_simpleRequest('/FaceRecognition/enrollmentDeleteConditional',
+        return $this->_simpleRequest('/FaceRecognition/subjectDelete',
         $argument,
-        ['\FaceRecordList', 'decode'],
+        ['\EnrollmentDeleteResponse', 'decode'],
         $metadata, $options);
     }
 
     /**
-     * @param \EnrollmentDeleteRequest $argument input argument
+     * @param \EnrollmentListRequest $argument input argument
      * @param array $metadata metadata
      * @param array $options call options
      */
-    public function enrollmentTransfer(\EnrollmentDeleteRequest $argument,
+    public function generateMatchDistribution(\EnrollmentListRequest $argument,
       $metadata = [], $options = []) {
-        return $this->_simpleRequest('/FaceRecognition/enrollmentTransfer',
+        return $this->_simpleRequest('/FaceRecognition/generateMatchDistribution',
         $argument,
-        ['\FaceRecordList', 'decode'],
+        ['\Matrix', 'decode'],
+        $metadata, $options);
+    }
+
+    /**
+     * @param \MatchDistributionRequest $argument input argument
+     * @param array $metadata metadata
+     * @param array $options call options
+     */
+    public function matchDistribution(\MatchDistributionRequest $argument,
+      $metadata = [], $options = []) {
+        return $this->_serverStreamRequest('/FaceRecognition/matchDistribution',
+        $argument,
+        ['\MatchDistribution', 'decode'],
         $metadata, $options);
     }
 
     /**
+     * Source Management
+     * rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+     *
+     * rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+     * rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+     *
      * Test
      * @param \Matrix $argument input argument
      * @param array $metadata metadata
@@ -29,6 +29,10 @@ class FaceRecord extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>int64 frame = 14;</code>
      */
     private $frame = 0;
+    /**
+     * Generated from protobuf field <code>string algorithm = 20;</code>
+     */
+    private $algorithm = '';
     /**
      * Generated from protobuf field <code>string notes = 6;</code>
      */
@@ -119,6 +123,7 @@ class FaceRecord extends \Google\Protobuf\Internal\Message
      *     @type string $name
      *     @type string $source
      *     @type int|string $frame
+     *     @type string $algorithm
      *     @type string $notes
      *     @type string $gallery_key
      *     @type float $collection_date
@@ -242,6 +247,28 @@ class FaceRecord extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Generated from protobuf field <code>string algorithm = 20;</code>
+     * @return string
+     */
+    public function getAlgorithm()
+    {
+        return $this->algorithm;
+    }
+
+    /**
+     * Generated from protobuf field <code>string algorithm = 20;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setAlgorithm($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->algorithm = $var;
+
+        return $this;
+    }
+
     /**
      * Generated from protobuf field <code>string notes = 6;</code>
      * @return string
@@ -12,11 +12,15 @@ use Google\Protobuf\Internal\GPBUtil;
 class FaceRecordList extends \Google\Protobuf\Internal\Message
 {
     /**
-     *repeated float scores = 2; // Scores returned by gallery searches
-     *
      * Generated from protobuf field <code>repeated .FaceRecord face_records = 1;</code>
      */
     private $face_records;
+    /**
+     *repeated float scores = 2; // Scores returned by gallery searches
+     *
+     * Generated from protobuf field <code>.EnrollStats enroll_stats = 3;</code>
+     */
+    private $enroll_stats = null;
 
     /**
      * Constructor.
@@ -25,6 +29,7 @@ class FaceRecordList extends \Google\Protobuf\Internal\Message
      *     Optional. Data for populating the Message object.
      *
      *     @type \FaceRecord[]|\Google\Protobuf\Internal\RepeatedField $face_records
+     *     @type \EnrollStats $enroll_stats
      *          repeated float scores = 2; // Scores returned by gallery searches
      * }
      */
@@ -34,8 +39,6 @@ class FaceRecordList extends \Google\Protobuf\Internal\Message
     }
 
     /**
-     *repeated float scores = 2; // Scores returned by gallery searches
-     *
      * Generated from protobuf field <code>repeated .FaceRecord face_records = 1;</code>
      * @return \Google\Protobuf\Internal\RepeatedField
      */
@@ -45,8 +48,6 @@ class FaceRecordList extends \Google\Protobuf\Internal\Message
     }
 
     /**
-     *repeated float scores = 2; // Scores returned by gallery searches
-     *
      * Generated from protobuf field <code>repeated .FaceRecord face_records = 1;</code>
      * @param \FaceRecord[]|\Google\Protobuf\Internal\RepeatedField $var
      * @return $this
@@ -59,5 +60,31 @@ class FaceRecordList extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     *repeated float scores = 2; // Scores returned by gallery searches
+     *
+     * Generated from protobuf field <code>.EnrollStats enroll_stats = 3;</code>
+     * @return \EnrollStats
+     */
+    public function getEnrollStats()
+    {
+        return $this->enroll_stats;
+    }
+
+    /**
+     *repeated float scores = 2; // Scores returned by gallery searches
+     *
+     * Generated from protobuf field <code>.EnrollStats enroll_stats = 3;</code>
+     * @param \EnrollStats $var
+     * @return $this
+     */
+    public function setEnrollStats($var)
+    {
+        GPBUtil::checkMessage($var, \EnrollStats::class);
+        $this->enroll_stats = $var;
+
+        return $this;
+    }
+
 }
 
@@ -55,6 +55,18 @@ class FaceServiceInfo extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>string notes = 11;</code>
      */
     private $notes = '';
+    /**
+     * Generated from protobuf field <code>string faro_version = 12;</code>
+     */
+    private $faro_version = '';
+    /**
+     * Generated from protobuf field <code>string instance_name = 13;</code>
+     */
+    private $instance_name = '';
+    /**
+     * Generated from protobuf field <code>.GalleryCacheStats gallery_cache = 14;</code>
+     */
+    private $gallery_cache = null;
 
     /**
      * Constructor.
@@ -73,6 +85,9 @@ class FaceServiceInfo extends \Google\Protobuf\Internal\Message
      *     @type float $match_threshold
      *     @type string $algorithm
      *     @type string $notes
+     *     @type string $faro_version
+     *     @type string $instance_name
+     *     @type \GalleryCacheStats $gallery_cache
      * }
      */
     public function __construct($data = NULL) {
@@ -322,5 +337,71 @@ class FaceServiceInfo extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Generated from protobuf field <code>string faro_version = 12;</code>
+     * @return string
+     */
+    public function getFaroVersion()
+    {
+        return $this->faro_version;
+    }
+
+    /**
+     * Generated from protobuf field <code>string faro_version = 12;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setFaroVersion($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->faro_version = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>string instance_name = 13;</code>
+     * @return string
+     */
+    public function getInstanceName()
+    {
+        return $this->instance_name;
+    }
+
+    /**
+     * Generated from protobuf field <code>string instance_name = 13;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setInstanceName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->instance_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>.GalleryCacheStats gallery_cache = 14;</code>
+     * @return \GalleryCacheStats
+     */
+    public function getGalleryCache()
+    {
+        return $this->gallery_cache;
+    }
+
+    /**
+     * Generated from protobuf field <code>.GalleryCacheStats gallery_cache = 14;</code>
+     * @param \GalleryCacheStats $var
+     * @return $this
+     */
+    public function setGalleryCache($var)
+    {
+        GPBUtil::checkMessage($var, \GalleryCacheStats::class);
+        $this->gallery_cache = $var;
+
+        return $this;
+    }
+
 }
 
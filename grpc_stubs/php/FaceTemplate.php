@@ -23,6 +23,10 @@ class FaceTemplate extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>bytes buffer = 2;</code>
      */
     private $buffer = '';
+    /**
+     * Generated from protobuf field <code>string algorithm = 3;</code>
+     */
+    private $algorithm = '';
 
     /**
      * Constructor.
@@ -34,6 +38,7 @@ class FaceTemplate extends \Google\Protobuf\Internal\Message
      *           Typically just populate one of these fields.
      *     @type string $buffer
      *           General storage.  Can be used for raw data templates from commercial systems.
+     *     @type string $algorithm
      * }
      */
     public function __construct($data = NULL) {
@@ -93,5 +98,27 @@ class FaceTemplate extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Generated from protobuf field <code>string algorithm = 3;</code>
+     * @return string
+     */
+    public function getAlgorithm()
+    {
+        return $this->algorithm;
+    }
+
+    /**
+     * Generated from protobuf field <code>string algorithm = 3;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setAlgorithm($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->algorithm = $var;
+
+        return $this;
+    }
+
 }
 
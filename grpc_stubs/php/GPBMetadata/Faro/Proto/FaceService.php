@@ -17,7 +17,7 @@ class FaceService
         \GPBMetadata\Faro\Proto\Image::initOnce();
         \GPBMetadata\Faro\Proto\Geometry::initOnce();
         $pool->internalAddGeneratedFile(hex2bin(
-            "0af42a0a1d6661726f2f70726f746f2f666163655f736572766963652e70" .
+            "0aa2400a1d6661726f2f70726f746f2f666163655f736572766963652e70" .
             "726f746f1a196661726f2f70726f746f2f67656f6d657472792e70726f74" .
             "6f228d020a09417474726962757465120b0a036b65791801200128091213" .
             "0a0b6465736372697074696f6e180220012809120e0a0662756666657218" .
@@ -36,171 +36,262 @@ class FaceService
             "6e5f636c617373180420012809121e0a0a61747472696275746573180520" .
             "03280b320a2e417474726962757465223b0a084c616e646d61726b12130a" .
             "0b6c616e646d61726b5f6964180120012809121a0a086c6f636174696f6e" .
-            "18022001280b32082e506f696e74324422e1010a10446574656374696f6e" .
+            "18022001280b32082e506f696e74324422f5010a10446574656374696f6e" .
             "4f7074696f6e7312140a0c616c676f726974686d5f696418012001280912" .
             "0c0a046265737418022001280812110a097468726573686f6c6418032001" .
             "280212140a0c7363616c655f6c6576656c7318042001280512130a0b7363" .
             "616e5f6c6576656c7318052001280512140a0c7363616e5f6f7665726c61" .
             "7018062001280212100a086d696e5f73697a6518072001280512140a0c73" .
             "6176655f72657175657374180920012808120d0a056465627567180a2001" .
-            "2808121e0a0a6174747269627574657318082003280b320a2e4174747269" .
-            "62757465226b0a0e457874726163744f7074696f6e7312140a0c616c676f" .
-            "726974686d5f696418012001280912140a0c736176655f72657175657374" .
-            "180220012808120d0a056465627567180320012808121e0a0a6174747269" .
-            "627574657318082003280b320a2e41747472696275746522540a0d456e72" .
-            "6f6c6c4f7074696f6e7312140a0c736176655f7265717565737418022001" .
-            "2808120d0a056465627567180320012808121e0a0a617474726962757465" .
-            "7318082003280b320a2e41747472696275746522af010a0d446574656374" .
-            "696f6e4c697374121e0a0a646574656374696f6e7318012003280b320a2e" .
-            "446574656374696f6e12160a0e646574656374696f6e5f74696d65180220" .
-            "01280212130a0b696d6167655f776964746818032001280512140a0c696d" .
-            "6167655f68656967687418042001280512170a0f646574656374696f6e5f" .
-            "636f756e7418052001280512220a076f7074696f6e7318062001280b3211" .
-            "2e446574656374696f6e4f7074696f6e73222b0a094d617463684c697374" .
-            "121e0a0a6d617463685f6c69737418012003280b320a2e4d61746368496e" .
-            "666f2282010a094d61746368496e666f120d0a0573636f72651801200128" .
-            "0212100a08696d6167655f696418022001280912140a0c64657465637469" .
-            "6f6e5f696418032001280912120a0a7375626a6563745f69641804200128" .
-            "0912140a0c7375626a6563745f6e616d6518052001280912140a04666163" .
-            "6518062001280b32062e496d616765223e0a0d54656d706c617465496e70" .
-            "757412120a02696d18012001280b32062e496d61676512190a0a64657465" .
-            "6374696f6e7318022003280b32052e5265637422350a0c4661636554656d" .
-            "706c61746512150a046461746118012001280b32072e566563746f72120e" .
-            "0a0662756666657218022001280c22300a0c54656d706c6174654c697374" .
-            "12200a0974656d706c6174657318012003280b320d2e4661636554656d70" .
-            "6c61746522610a0c4163636573735265636f726412100a08646174657469" .
-            "6d65180120012802120d0a056e6f74657318022001280912120a0a637265" .
-            "64656e7469616c180320012809121c0a086d657461646174611804200328" .
-            "0b320a2e41747472696275746522f0030a0a466163655265636f72641212" .
-            "0a0a7375626a6563745f6964180120012809120c0a046e616d6518052001" .
-            "2809120e0a06736f75726365180420012809120d0a056672616d65180e20" .
-            "012803120d0a056e6f74657318062001280912130a0b67616c6c6572795f" .
-            "6b6579180f2001280912170a0f636f6c6c656374696f6e5f646174651810" .
-            "2001280212170a0f656e726f6c6c6d656e745f6461746518112001280212" .
-            "1c0a086d6574616461746118122003280b320a2e41747472696275746512" .
-            "250a0e6163636573735f7265636f72647318132003280b320d2e41636365" .
-            "73735265636f726412140a047669657718072001280b32062e496d616765" .
-            "12170a07616c69676e656418092001280b32062e496d616765121d0a0964" .
-            "6574656374696f6e18022001280b320a2e446574656374696f6e121c0a09" .
-            "6c616e646d61726b7318082003280b32092e4c616e646d61726b121e0a0a" .
-            "61747472696275746573180a2003280b320a2e4174747269627574651221" .
-            "0a0d696e7465726e616c5f64617461180b2003280b320a2e417474726962" .
-            "757465121f0a0874656d706c61746518032001280b320d2e466163655465" .
-            "6d706c617465120d0a0573636f7265180c2001280212270a0e7365617263" .
-            "685f726573756c7473180d2001280b320f2e466163655265636f72644c69" .
-            "737422330a0e466163655265636f72644c69737412210a0c666163655f72" .
-            "65636f72647318012003280b320b2e466163655265636f7264225c0a1356" .
-            "6572696669636174696f6e52657175657374120f0a0767616c6c65727918" .
-            "012001280912120a0a7375626a6563745f696418022001280912200a0b66" .
-            "6163655f7265636f726418032003280b320b2e466163655265636f726422" .
-            "84010a14566572696669636174696f6e526573706f6e736512120a0a6572" .
-            "726f725f636f646518042001280512150a0d6572726f725f6d6573736167" .
-            "65180520012809120f0a077375636365737318012001280812120a0a636f" .
-            "6e666964656e6365180220012802121c0a076d6174636865731803200328" .
-            "0b320b2e466163655265636f726422700a0d536561726368526571756573" .
-            "7412160a0e7365617263685f67616c6c657279180120012809121f0a0670" .
-            "726f62657318032001280b320f2e466163655265636f72644c6973741213" .
-            "0a0b6d61785f726573756c747318042001280512110a097468726573686f" .
-            "6c6418052001280222510a0e536561726368526573706f6e7365121e0a07" .
-            "6d65737361676518012001280b320d2e4572726f724d657373616765121f" .
-            "0a0670726f62657318022001280b320f2e466163655265636f72644c6973" .
-            "7422710a0d456e726f6c6c5265717565737412160a0e656e726f6c6c5f67" .
-            "616c6c65727918012001280912200a077265636f72647318022001280b32" .
-            "0f2e466163655265636f72644c69737412260a0e656e726f6c6c5f6f7074" .
-            "696f6e73180a2001280b320e2e456e726f6c6c4f7074696f6e73229a010a" .
-            "0d4465746563745265717565737412150a05696d61676518012001280b32" .
-            "062e496d616765120e0a06736f75726365180220012809120d0a05667261" .
-            "6d6518032001280312120a0a7375626a6563745f69641804200128091214" .
-            "0a0c7375626a6563745f6e616d6518052001280912290a0e646574656374" .
-            "5f6f7074696f6e7318082001280b32112e446574656374696f6e4f707469" .
-            "6f6e7322730a0e457874726163745265717565737412150a05696d616765" .
-            "18012001280b32062e496d61676512200a077265636f7264731804200128" .
-            "0b320f2e466163655265636f72644c69737412280a0f657874726163745f" .
-            "6f7074696f6e7318092001280b320f2e457874726163744f7074696f6e73" .
-            "22ac010a0c53636f72655265717565737412240a0b666163655f70726f62" .
-            "657318012001280b320f2e466163655265636f72644c69737412250a0c66" .
-            "6163655f67616c6c65727918022001280b320f2e466163655265636f7264" .
-            "4c69737412260a0f74656d706c6174655f70726f62657318032001280b32" .
-            "0d2e54656d706c6174654c69737412270a1074656d706c6174655f67616c" .
-            "6c65727918042001280b320d2e54656d706c6174654c69737422680a1444" .
-            "6574656374457874726163745265717565737412260a0e6465746563745f" .
-            "7265717565737418012001280b320e2e4465746563745265717565737412" .
-            "280a0f657874726163745f7265717565737418022001280b320f2e457874" .
-            "72616374526571756573742296010a1a4465746563744578747261637445" .
-            "6e726f6c6c5265717565737412260a0e6465746563745f72657175657374" .
-            "18012001280b320e2e4465746563745265717565737412280a0f65787472" .
-            "6163745f7265717565737418022001280b320f2e45787472616374526571" .
-            "7565737412260a0e656e726f6c6c5f7265717565737418032001280b320e" .
-            "2e456e726f6c6c526571756573742296010a1a4465746563744578747261" .
-            "63745365617263685265717565737412260a0e6465746563745f72657175" .
-            "65737418012001280b320e2e4465746563745265717565737412280a0f65" .
-            "7874726163745f7265717565737418022001280b320f2e45787472616374" .
-            "5265717565737412260a0e7365617263685f726571756573741803200128" .
-            "0b320e2e5365617263685265717565737422130a11466163655374617475" .
-            "735265717565737422a5020a0f4661636553657276696365496e666f121e" .
-            "0a0673746174757318012001280e320e2e53657276696365537461747573" .
-            "12140a0c776f726b65725f636f756e7418022001280512190a1164657465" .
-            "6374696f6e5f737570706f727418032001280812170a0f65787472616374" .
-            "5f737570706f727418042001280812150a0d73636f72655f737570706f72" .
-            "7418052001280812190a116174747269627574655f737570706f72741806" .
-            "20012808121e0a0a73636f72655f7479706518072001280e320a2e53636f" .
-            "726554797065121b0a13646574656374696f6e5f7468726573686f6c6418" .
-            "082001280212170a0f6d617463685f7468726573686f6c64180920012802" .
-            "12110a09616c676f726974686d180a20012809120d0a056e6f746573180b" .
-            "2001280922140a1247616c6c6572794c69737452657175657374222c0a14" .
-            "47616c6c65727944656c6574655265717565737412140a0c67616c6c6572" .
-            "795f6e616d65180120012809222d0a15456e726f6c6c6d656e744c697374" .
-            "5265717565737412140a0c67616c6c6572795f6e616d6518012001280922" .
-            "460a0e456e726f6c6c6d656e74496e666f12120a0a7375626a6563745f69" .
-            "64180120012809120c0a046e616d6518022001280912120a0a666163655f" .
-            "636f756e7418032001280522540a16456e726f6c6c6d656e744c69737452" .
-            "6573706f6e736512140a0c67616c6c6572795f6e616d6518012001280912" .
-            "240a0b656e726f6c6c6d656e747318022003280b320f2e456e726f6c6c6d" .
-            "656e74496e666f22430a17456e726f6c6c6d656e7444656c657465526571" .
-            "7565737412140a0c67616c6c6572795f6e616d6518012001280912120a0a" .
-            "7375626a6563745f696418022001280922370a0b47616c6c657279496e66" .
-            "6f12140a0c67616c6c6572795f6e616d6518012001280912120a0a666163" .
-            "655f636f756e74180220012803222e0a0b47616c6c6572794c697374121f" .
-            "0a0967616c6c657269657318012003280b320c2e47616c6c657279496e66" .
-            "6f22070a05456d7074792a3c0a0d53657276696365537461747573120b0a" .
-            "07554e4b4e4f574e100012090a055245414459100112090a054552524f52" .
-            "100212080a044255535910032a6b0a08446174615479706512090a05454d" .
-            "5054591000120a0a06535452494e47100112070a03494e54100212090a05" .
-            "464c4f4154100312090a0542595445531004120a0a06564543544f521005" .
-            "120a0a065049434b4c45100612070a03584d4c100712080a044a534f4e10" .
-            "082a340a0953636f726554797065120a0a06534552564552100012060a02" .
-            "4c31100112060a024c321002120b0a074e45475f444f54100332f4060a0f" .
-            "466163655265636f676e6974696f6e12300a0673746174757312122e4661" .
-            "6365537461747573526571756573741a102e466163655365727669636549" .
-            "6e666f2200122b0a06646574656374120e2e446574656374526571756573" .
-            "741a0f2e466163655265636f72644c6973742200122d0a07657874726163" .
-            "74120f2e45787472616374526571756573741a0f2e466163655265636f72" .
-            "644c697374220012210a0573636f7265120d2e53636f7265526571756573" .
-            "741a072e4d61747269782200122b0a06656e726f6c6c120e2e456e726f6c" .
-            "6c526571756573741a0f2e466163655265636f72644c6973742200122b0a" .
-            "06736561726368120e2e536561726368526571756573741a0f2e46616365" .
-            "5265636f72644c697374220012390a0d6465746563744578747261637412" .
-            "152e44657465637445787472616374526571756573741a0f2e4661636552" .
-            "65636f72644c697374220012450a1364657465637445787472616374456e" .
-            "726f6c6c121b2e44657465637445787472616374456e726f6c6c52657175" .
-            "6573741a0f2e466163655265636f72644c697374220012450a1364657465" .
-            "637445787472616374536561726368121b2e446574656374457874726163" .
-            "74536561726368526571756573741a0f2e466163655265636f72644c6973" .
-            "74220012320a0b67616c6c6572794c69737412132e47616c6c6572794c69" .
-            "7374526571756573741a0c2e47616c6c6572794c697374220012300a0d67" .
-            "616c6c65727944656c65746512152e47616c6c65727944656c6574655265" .
-            "71756573741a062e456d7074792200123b0a0e656e726f6c6c6d656e744c" .
-            "69737412162e456e726f6c6c6d656e744c697374526571756573741a0f2e" .
-            "466163655265636f72644c6973742200123f0a10656e726f6c6c6d656e74" .
-            "44656c65746512182e456e726f6c6c6d656e7444656c6574655265717565" .
-            "73741a0f2e466163655265636f72644c6973742200124a0a1b656e726f6c" .
-            "6c6d656e7444656c657465436f6e646974696f6e616c12182e456e726f6c" .
-            "6c6d656e7444656c657465526571756573741a0f2e466163655265636f72" .
-            "644c697374220012410a12656e726f6c6c6d656e745472616e7366657212" .
-            "182e456e726f6c6c6d656e7444656c657465526571756573741a0f2e4661" .
-            "63655265636f72644c6973742200121a0a046563686f12072e4d61747269" .
-            "781a072e4d61747269782200420daa020a4661726f2e50726f746f620670" .
-            "726f746f33"
+            "280812120a0a646f776e73616d706c65180b20012805121e0a0a61747472" .
+            "69627574657318082003280b320a2e417474726962757465226b0a0e4578" .
+            "74726163744f7074696f6e7312140a0c616c676f726974686d5f69641801" .
+            "2001280912140a0c736176655f72657175657374180220012808120d0a05" .
+            "6465627567180320012808121e0a0a617474726962757465731808200328" .
+            "0b320a2e4174747269627574652281010a0d456e726f6c6c4f7074696f6e" .
+            "7312140a0c736176655f72657175657374180220012808120d0a05646562" .
+            "7567180320012808121e0a0a6174747269627574657318082003280b320a" .
+            "2e41747472696275746512160a0e64656475705f64697374616e63651809" .
+            "2001280212130a0b64656475705f6d65726765180a2001280822af010a0d" .
+            "446574656374696f6e4c697374121e0a0a646574656374696f6e73180120" .
+            "03280b320a2e446574656374696f6e12160a0e646574656374696f6e5f74" .
+            "696d6518022001280212130a0b696d6167655f7769647468180320012805" .
+            "12140a0c696d6167655f68656967687418042001280512170a0f64657465" .
+            "6374696f6e5f636f756e7418052001280512220a076f7074696f6e731806" .
+            "2001280b32112e446574656374696f6e4f7074696f6e73222b0a094d6174" .
+            "63684c697374121e0a0a6d617463685f6c69737418012003280b320a2e4d" .
+            "61746368496e666f2282010a094d61746368496e666f120d0a0573636f72" .
+            "6518012001280212100a08696d6167655f696418022001280912140a0c64" .
+            "6574656374696f6e5f696418032001280912120a0a7375626a6563745f69" .
+            "6418042001280912140a0c7375626a6563745f6e616d6518052001280912" .
+            "140a046661636518062001280b32062e496d616765223e0a0d54656d706c" .
+            "617465496e70757412120a02696d18012001280b32062e496d6167651219" .
+            "0a0a646574656374696f6e7318022003280b32052e5265637422480a0c46" .
+            "61636554656d706c61746512150a046461746118012001280b32072e5665" .
+            "63746f72120e0a0662756666657218022001280c12110a09616c676f7269" .
+            "74686d18032001280922300a0c54656d706c6174654c69737412200a0974" .
+            "656d706c6174657318012003280b320d2e4661636554656d706c61746522" .
+            "610a0c4163636573735265636f726412100a086461746574696d65180120" .
+            "012802120d0a056e6f74657318022001280912120a0a63726564656e7469" .
+            "616c180320012809121c0a086d6574616461746118042003280b320a2e41" .
+            "74747269627574652283040a0a466163655265636f726412120a0a737562" .
+            "6a6563745f6964180120012809120c0a046e616d65180520012809120e0a" .
+            "06736f75726365180420012809120d0a056672616d65180e200128031211" .
+            "0a09616c676f726974686d181420012809120d0a056e6f74657318062001" .
+            "280912130a0b67616c6c6572795f6b6579180f2001280912170a0f636f6c" .
+            "6c656374696f6e5f6461746518102001280212170a0f656e726f6c6c6d65" .
+            "6e745f64617465181120012802121c0a086d657461646174611812200328" .
+            "0b320a2e41747472696275746512250a0e6163636573735f7265636f7264" .
+            "7318132003280b320d2e4163636573735265636f726412140a0476696577" .
+            "18072001280b32062e496d61676512170a07616c69676e65641809200128" .
+            "0b32062e496d616765121d0a09646574656374696f6e18022001280b320a" .
+            "2e446574656374696f6e121c0a096c616e646d61726b7318082003280b32" .
+            "092e4c616e646d61726b121e0a0a61747472696275746573180a2003280b" .
+            "320a2e41747472696275746512210a0d696e7465726e616c5f6461746118" .
+            "0b2003280b320a2e417474726962757465121f0a0874656d706c61746518" .
+            "032001280b320d2e4661636554656d706c617465120d0a0573636f726518" .
+            "0c2001280212270a0e7365617263685f726573756c7473180d2001280b32" .
+            "0f2e466163655265636f72644c69737422570a0e466163655265636f7264" .
+            "4c69737412210a0c666163655f7265636f72647318012003280b320b2e46" .
+            "6163655265636f726412220a0c656e726f6c6c5f73746174731803200128" .
+            "0b320c2e456e726f6c6c537461747322630a0b456e726f6c6c5374617473" .
+            "12140a0c656e726f6c6c5f636f756e7418012001280312150a0d7265706c" .
+            "6163655f636f756e7418022001280312120a0a736b69705f636f756e7418" .
+            "032001280312130a0b6d657267655f636f756e74180420012803225c0a13" .
+            "566572696669636174696f6e52657175657374120f0a0767616c6c657279" .
+            "18012001280912120a0a7375626a6563745f696418022001280912200a0b" .
+            "666163655f7265636f726418032003280b320b2e466163655265636f7264" .
+            "2284010a14566572696669636174696f6e526573706f6e736512120a0a65" .
+            "72726f725f636f646518042001280512150a0d6572726f725f6d65737361" .
+            "6765180520012809120f0a077375636365737318012001280812120a0a63" .
+            "6f6e666964656e6365180220012802121c0a076d61746368657318032003" .
+            "280b320b2e466163655265636f7264229f010a0d53656172636852657175" .
+            "65737412160a0e7365617263685f67616c6c657279180120012809121f0a" .
+            "0670726f62657318032001280b320f2e466163655265636f72644c697374" .
+            "12130a0b6d61785f726573756c747318042001280512110a097468726573" .
+            "686f6c64180520012802120e0a066e70726f6265180620012805121d0a06" .
+            "66696c74657218072001280b320d2e53656172636846696c74657222540a" .
+            "0f41747472696275746546696c746572120b0a036b657918012001280912" .
+            "0e0a0676616c75657318022003280912110a096d696e5f76616c75651803" .
+            "2001280212110a096d61785f76616c756518042001280222ce010a0c5365" .
+            "6172636846696c74657212130a0b7375626a6563745f6964731801200328" .
+            "09120f0a07736f7572636573180220032809121b0a136d696e5f636f6c6c" .
+            "656374696f6e5f64617465180320012802121b0a136d61785f636f6c6c65" .
+            "6374696f6e5f64617465180420012802121b0a136d696e5f656e726f6c6c" .
+            "6d656e745f64617465180520012802121b0a136d61785f656e726f6c6c6d" .
+            "656e745f6461746518062001280212240a0a617474726962757465731807" .
+            "2003280b32102e41747472696275746546696c74657222510a0e53656172" .
+            "6368526573706f6e7365121e0a076d65737361676518012001280b320d2e" .
+            "4572726f724d657373616765121f0a0670726f62657318022001280b320f" .
+            "2e466163655265636f72644c69737422710a0d456e726f6c6c5265717565" .
+            "737412160a0e656e726f6c6c5f67616c6c65727918012001280912200a07" .
+            "7265636f72647318022001280b320f2e466163655265636f72644c697374" .
+            "12260a0e656e726f6c6c5f6f7074696f6e73180a2001280b320e2e456e72" .
+            "6f6c6c4f7074696f6e7322580a1242756c6b456e726f6c6c526573706f6e" .
+            "736512150a0d726571756573745f636f756e7418012001280312140a0c65" .
+            "6e726f6c6c5f636f756e7418022001280312150a0d7265706c6163655f63" .
+            "6f756e74180320012803229a010a0d446574656374526571756573741215" .
+            "0a05696d61676518012001280b32062e496d616765120e0a06736f757263" .
+            "65180220012809120d0a056672616d6518032001280312120a0a7375626a" .
+            "6563745f696418042001280912140a0c7375626a6563745f6e616d651805" .
+            "2001280912290a0e6465746563745f6f7074696f6e7318082001280b3211" .
+            "2e446574656374696f6e4f7074696f6e7322730a0e457874726163745265" .
+            "717565737412150a05696d61676518012001280b32062e496d6167651220" .
+            "0a077265636f72647318042001280b320f2e466163655265636f72644c69" .
+            "737412280a0f657874726163745f6f7074696f6e7318092001280b320f2e" .
+            "457874726163744f7074696f6e7322ac010a0c53636f7265526571756573" .
+            "7412240a0b666163655f70726f62657318012001280b320f2e4661636552" .
+            "65636f72644c69737412250a0c666163655f67616c6c6572791802200128" .
+            "0b320f2e466163655265636f72644c69737412260a0f74656d706c617465" .
+            "5f70726f62657318032001280b320d2e54656d706c6174654c6973741227" .
+            "0a1074656d706c6174655f67616c6c65727918042001280b320d2e54656d" .
+            "706c6174654c69737422740a0a53636f7265426c6f636b12130a0b70726f" .
+            "62655f737461727418012001280312150a0d67616c6c6572795f73746172" .
+            "7418022001280312130a0b70726f62655f636f756e741803200128051215" .
+            "0a0d67616c6c6572795f636f756e74180420012805120e0a0673636f7265" .
+            "7318052001280c227c0a184d61746368446973747269627574696f6e5265" .
+            "717565737412140a0c67616c6c6572795f6e616d65180120012809120c0a" .
+            "0462696e7318022001280512110a096d696e5f73636f7265180320012802" .
+            "12110a096d61785f73636f726518042001280212160a0e696e636c756465" .
+            "5f73636f72657318052001280822ea010a114d6174636844697374726962" .
+            "7574696f6e121a0a05626c6f636b18012001280b320b2e53636f7265426c" .
+            "6f636b12120a0a666163655f636f756e7418022001280312150a0d67656e" .
+            "75696e655f636f756e7418032001280312160a0e696d706f73746f725f63" .
+            "6f756e7418042001280312110a0962696e5f656467657318052003280212" .
+            "190a1167656e75696e655f686973746f6772616d180620032803121a0a12" .
+            "696d706f73746f725f686973746f6772616d18072003280312120a0a7468" .
+            "726573686f6c6473180820032802120b0a03666172180920032802120b0a" .
+            "03667272180a2003280222680a1444657465637445787472616374526571" .
+            "7565737412260a0e6465746563745f7265717565737418012001280b320e" .
+            "2e4465746563745265717565737412280a0f657874726163745f72657175" .
+            "65737418022001280b320f2e45787472616374526571756573742296010a" .
+            "1a44657465637445787472616374456e726f6c6c5265717565737412260a" .
+            "0e6465746563745f7265717565737418012001280b320e2e446574656374" .
+            "5265717565737412280a0f657874726163745f7265717565737418022001" .
+            "280b320f2e457874726163745265717565737412260a0e656e726f6c6c5f" .
+            "7265717565737418032001280b320e2e456e726f6c6c5265717565737422" .
+            "96010a1a4465746563744578747261637453656172636852657175657374" .
+            "12260a0e6465746563745f7265717565737418012001280b320e2e446574" .
+            "6563745265717565737412280a0f657874726163745f7265717565737418" .
+            "022001280b320f2e457874726163745265717565737412260a0e73656172" .
+            "63685f7265717565737418032001280b320e2e5365617263685265717565" .
+            "737422130a11466163655374617475735265717565737422fd020a0f4661" .
+            "636553657276696365496e666f121e0a0673746174757318012001280e32" .
+            "0e2e5365727669636553746174757312140a0c776f726b65725f636f756e" .
+            "7418022001280512190a11646574656374696f6e5f737570706f72741803" .
+            "2001280812170a0f657874726163745f737570706f727418042001280812" .
+            "150a0d73636f72655f737570706f727418052001280812190a1161747472" .
+            "69627574655f737570706f7274180620012808121e0a0a73636f72655f74" .
+            "79706518072001280e320a2e53636f726554797065121b0a136465746563" .
+            "74696f6e5f7468726573686f6c6418082001280212170a0f6d617463685f" .
+            "7468726573686f6c6418092001280212110a09616c676f726974686d180a" .
+            "20012809120d0a056e6f746573180b2001280912140a0c6661726f5f7665" .
+            "7273696f6e180c2001280912150a0d696e7374616e63655f6e616d65180d" .
+            "2001280912290a0d67616c6c6572795f6361636865180e2001280b32122e" .
+            "47616c6c6572794361636865537461747322af010a1147616c6c65727943" .
+            "61636865537461747312160a0e6f70656e5f67616c6c6572696573180120" .
+            "01280312180a1070696e6e65645f67616c6c657269657318022001280312" .
+            "120a0a6f70656e5f627974657318032001280312100a086d61785f6f7065" .
+            "6e18042001280312110a096d61785f6279746573180520012803120c0a04" .
+            "68697473180620012803120e0a066d697373657318072001280312110a09" .
+            "6576696374696f6e7318082001280322140a1247616c6c6572794c697374" .
+            "52657175657374222c0a1447616c6c65727944656c657465526571756573" .
+            "7412140a0c67616c6c6572795f6e616d65180120012809224b0a1747616c" .
+            "6c657279436f6e6669677572655265717565737412140a0c67616c6c6572" .
+            "795f6e616d65180120012809121a0a12696e6465785f7175616e74697a61" .
+            "74696f6e180220012809222d0a1547616c6c657279436f6d706163745265" .
+            "717565737412140a0c67616c6c6572795f6e616d6518012001280922b201" .
+            "0a1647616c6c657279436f6d70616374526573706f6e736512140a0c6761" .
+            "6c6c6572795f6e616d6518012001280912120a0a666163655f636f756e74" .
+            "18022001280312140a0c726f77735f72656d6f7665641803200128031214" .
+            "0a0c62797465735f6265666f726518042001280312130a0b62797465735f" .
+            "616674657218052001280312170a0f62797465735f7265636c61696d6564" .
+            "18062001280312140a0c636f6d706163745f74696d65180720012802227b" .
+            "0a1447616c6c6572794578706f72745265717565737412140a0c67616c6c" .
+            "6572795f6e616d6518012001280912110a0973746172745f726f77180220" .
+            "012803120f0a0766696c655f696418032001280912120a0a6368756e6b5f" .
+            "73697a6518042001280512150a0d696e636c7564655f7669657773180520" .
+            "01280822af010a0c47616c6c6572794368756e6b12140a0c67616c6c6572" .
+            "795f6e616d65180120012809120f0a0766696c655f696418022001280912" .
+            "110a0973746172745f726f7718032001280312100a086e6578745f726f77" .
+            "18042001280312110a09726f775f636f756e74180520012803120b0a0364" .
+            "696d18062001280512110a0974656d706c6174657318072001280c12200a" .
+            "077265636f72647318082001280b320f2e466163655265636f72644c6973" .
+            "74227d0a1547616c6c657279496d706f7274526573706f6e736512140a0c" .
+            "67616c6c6572795f6e616d65180120012809120f0a0766696c655f696418" .
+            "022001280912100a086e6578745f726f7718032001280312140a0c656e72" .
+            "6f6c6c5f636f756e7418042001280312150a0d7265706c6163655f636f75" .
+            "6e74180520012803222d0a15456e726f6c6c6d656e744c69737452657175" .
+            "65737412140a0c67616c6c6572795f6e616d6518012001280922460a0e45" .
+            "6e726f6c6c6d656e74496e666f12120a0a7375626a6563745f6964180120" .
+            "012809120c0a046e616d6518022001280912120a0a666163655f636f756e" .
+            "7418032001280522540a16456e726f6c6c6d656e744c697374526573706f" .
+            "6e736512140a0c67616c6c6572795f6e616d6518012001280912240a0b65" .
+            "6e726f6c6c6d656e747318022003280b320f2e456e726f6c6c6d656e7449" .
+            "6e666f22580a17456e726f6c6c6d656e7444656c65746552657175657374" .
+            "12140a0c67616c6c6572795f6e616d6518012001280912120a0a7375626a" .
+            "6563745f696418022001280912130a0b67616c6c6572795f6b6579180320" .
+            "01280922300a18456e726f6c6c6d656e7444656c657465526573706f6e73" .
+            "6512140a0c64656c6574655f636f756e74180120012803229f010a0b4761" .
+            "6c6c657279496e666f12140a0c67616c6c6572795f6e616d651801200128" .
+            "0912120a0a666163655f636f756e7418022001280312150a0d7375626a65" .
+            "63745f636f756e7418032001280312140a0c74656d706c6174655f64696d" .
+            "18042001280512120a0a66696c655f627974657318052001280312130a0b" .
+            "696e6465785f737461746518062001280912100a086d6f64696669656418" .
+            "0720012801222e0a0b47616c6c6572794c697374121f0a0967616c6c6572" .
+            "69657318012003280b320c2e47616c6c657279496e666f22070a05456d70" .
+            "74792a3c0a0d53657276696365537461747573120b0a07554e4b4e4f574e" .
+            "100012090a055245414459100112090a054552524f52100212080a044255" .
+            "535910032a6b0a08446174615479706512090a05454d5054591000120a0a" .
+            "06535452494e47100112070a03494e54100212090a05464c4f4154100312" .
+            "090a0542595445531004120a0a06564543544f521005120a0a065049434b" .
+            "4c45100612070a03584d4c100712080a044a534f4e10082a340a0953636f" .
+            "726554797065120a0a06534552564552100012060a024c31100112060a02" .
+            "4c321002120b0a074e45475f444f54100332860a0a0f466163655265636f" .
+            "676e6974696f6e12300a0673746174757312122e46616365537461747573" .
+            "526571756573741a102e4661636553657276696365496e666f2200122b0a" .
+            "06646574656374120e2e446574656374526571756573741a0f2e46616365" .
+            "5265636f72644c6973742200122d0a0765787472616374120f2e45787472" .
+            "616374526571756573741a0f2e466163655265636f72644c697374220012" .
+            "210a0573636f7265120d2e53636f7265526571756573741a072e4d617472" .
+            "69782200122d0a0b73636f726553747265616d120d2e53636f7265526571" .
+            "756573741a0b2e53636f7265426c6f636b22003001122b0a06656e726f6c" .
+            "6c120e2e456e726f6c6c526571756573741a0f2e466163655265636f7264" .
+            "4c697374220012350a0a62756c6b456e726f6c6c120e2e456e726f6c6c52" .
+            "6571756573741a132e42756c6b456e726f6c6c526573706f6e7365220028" .
+            "01122b0a06736561726368120e2e536561726368526571756573741a0f2e" .
+            "466163655265636f72644c697374220012390a0d64657465637445787472" .
+            "61637412152e44657465637445787472616374526571756573741a0f2e46" .
+            "6163655265636f72644c697374220012450a136465746563744578747261" .
+            "6374456e726f6c6c121b2e44657465637445787472616374456e726f6c6c" .
+            "526571756573741a0f2e466163655265636f72644c697374220012450a13" .
+            "64657465637445787472616374536561726368121b2e4465746563744578" .
+            "7472616374536561726368526571756573741a0f2e466163655265636f72" .
+            "644c697374220012320a0b67616c6c6572794c69737412132e47616c6c65" .
+            "72794c697374526571756573741a0c2e47616c6c6572794c697374220012" .
+            "300a0d67616c6c65727944656c65746512152e47616c6c65727944656c65" .
+            "7465526571756573741a062e456d707479220012360a1067616c6c657279" .
+            "436f6e66696775726512182e47616c6c657279436f6e6669677572655265" .
+            "71756573741a062e456d707479220012430a0e67616c6c657279436f6d70" .
+            "61637412162e47616c6c657279436f6d70616374526571756573741a172e" .
+            "47616c6c657279436f6d70616374526573706f6e7365220012390a0d6761" .
+            "6c6c6572794578706f727412152e47616c6c6572794578706f7274526571" .
+            "756573741a0d2e47616c6c6572794368756e6b22003001123c0a0d67616c" .
+            "6c657279496d706f7274120d2e47616c6c6572794368756e6b1a162e4761" .
+            "6c6c657279496d706f7274526573706f6e7365220028013001123b0a0e65" .
+            "6e726f6c6c6d656e744c69737412162e456e726f6c6c6d656e744c697374" .
+            "526571756573741a0f2e466163655265636f72644c697374220012340a10" .
+            "747261696e46726f6d47616c6c65727912162e456e726f6c6c6d656e744c" .
+            "697374526571756573741a062e456d707479220012460a0d7375626a6563" .
+            "7444656c65746512182e456e726f6c6c6d656e7444656c65746552657175" .
+            "6573741a192e456e726f6c6c6d656e7444656c657465526573706f6e7365" .
+            "2200123e0a1967656e65726174654d61746368446973747269627574696f" .
+            "6e12162e456e726f6c6c6d656e744c697374526571756573741a072e4d61" .
+            "74726978220012460a116d61746368446973747269627574696f6e12192e" .
+            "4d61746368446973747269627574696f6e526571756573741a122e4d6174" .
+            "6368446973747269627574696f6e22003001121a0a046563686f12072e4d" .
+            "61747269781a072e4d61747269782200420daa020a4661726f2e50726f74" .
+            "6f620670726f746f33"
         ), true);
 
         static::$is_initialized = true;
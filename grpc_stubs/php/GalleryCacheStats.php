@@ -0,0 +1,252 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>GalleryCacheStats</code>
+ */
+class GalleryCacheStats extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>int64 open_galleries = 1;</code>
+     */
+    private $open_galleries = 0;
+    /**
+     * Generated from protobuf field <code>int64 pinned_galleries = 2;</code>
+     */
+    private $pinned_galleries = 0;
+    /**
+     * Estimated memory used by the open galleries
+     *
+     * Generated from protobuf field <code>int64 open_bytes = 3;</code>
+     */
+    private $open_bytes = 0;
+    /**
+     * Generated from protobuf field <code>int64 max_open = 4;</code>
+     */
+    private $max_open = 0;
+    /**
+     * Generated from protobuf field <code>int64 max_bytes = 5;</code>
+     */
+    private $max_bytes = 0;
+    /**
+     * Generated from protobuf field <code>int64 hits = 6;</code>
+     */
+    private $hits = 0;
+    /**
+     * Generated from protobuf field <code>int64 misses = 7;</code>
+     */
+    private $misses = 0;
+    /**
+     * Generated from protobuf field <code>int64 evictions = 8;</code>
+     */
+    private $evictions = 0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type int|string $open_galleries
+     *     @type int|string $pinned_galleries
+     *     @type int|string $open_bytes
+     *           Estimated memory used by the open galleries
+     *     @type int|string $max_open
+     *     @type int|string $max_bytes
+     *     @type int|string $hits
+     *     @type int|string $misses
+     *     @type int|string $evictions
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 open_galleries = 1;</code>
+     * @return int|string
+     */
+    public function getOpenGalleries()
+    {
+        return $this->open_galleries;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 open_galleries = 1;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setOpenGalleries($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->open_galleries = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 pinned_galleries = 2;</code>
+     * @return int|string
+     */
+    public function getPinnedGalleries()
+    {
+        return $this->pinned_galleries;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 pinned_galleries = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setPinnedGalleries($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->pinned_galleries = $var;
+
+        return $this;
+    }
+
+    /**
+     * Estimated memory used by the open galleries
+     *
+     * Generated from protobuf field <code>int64 open_bytes = 3;</code>
+     * @return int|string
+     */
+    public function getOpenBytes()
+    {
+        return $this->open_bytes;
+    }
+
+    /**
+     * Estimated memory used by the open galleries
+     *
+     * Generated from protobuf field <code>int64 open_bytes = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setOpenBytes($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->open_bytes = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 max_open = 4;</code>
+     * @return int|string
+     */
+    public function getMaxOpen()
+    {
+        return $this->max_open;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 max_open = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setMaxOpen($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->max_open = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 max_bytes = 5;</code>
+     * @return int|string
+     */
+    public function getMaxBytes()
+    {
+        return $this->max_bytes;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 max_bytes = 5;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setMaxBytes($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->max_bytes = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 hits = 6;</code>
+     * @return int|string
+     */
+    public function getHits()
+    {
+        return $this->hits;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 hits = 6;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setHits($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->hits = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 misses = 7;</code>
+     * @return int|string
+     */
+    public function getMisses()
+    {
+        return $this->misses;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 misses = 7;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setMisses($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->misses = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 evictions = 8;</code>
+     * @return int|string
+     */
+    public function getEvictions()
+    {
+        return $this->evictions;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 evictions = 8;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setEvictions($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->evictions = $var;
+
+        return $this;
+    }
+
+}
+
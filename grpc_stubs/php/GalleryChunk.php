@@ -0,0 +1,280 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>GalleryChunk</code>
+ */
+class GalleryChunk extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Source gallery on export and target gallery on import
+     *
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     */
+    private $gallery_name = '';
+    /**
+     * Identifies the gallery file.  Changes when the gallery is compacted.
+     *
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     */
+    private $file_id = '';
+    /**
+     * Generated from protobuf field <code>int64 start_row = 3;</code>
+     */
+    private $start_row = 0;
+    /**
+     * Generated from protobuf field <code>int64 next_row = 4;</code>
+     */
+    private $next_row = 0;
+    /**
+     * Rows in the gallery when the export started
+     *
+     * Generated from protobuf field <code>int64 row_count = 5;</code>
+     */
+    private $row_count = 0;
+    /**
+     * Generated from protobuf field <code>int32 dim = 6;</code>
+     */
+    private $dim = 0;
+    /**
+     * (faces, dim) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes templates = 7;</code>
+     */
+    private $templates = '';
+    /**
+     * Faces without template data
+     *
+     * Generated from protobuf field <code>.FaceRecordList records = 8;</code>
+     */
+    private $records = null;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $gallery_name
+     *           Source gallery on export and target gallery on import
+     *     @type string $file_id
+     *           Identifies the gallery file.  Changes when the gallery is compacted.
+     *     @type int|string $start_row
+     *     @type int|string $next_row
+     *     @type int|string $row_count
+     *           Rows in the gallery when the export started
+     *     @type int $dim
+     *     @type string $templates
+     *           (faces, dim) little endian float32 matrix in row order
+     *     @type \FaceRecordList $records
+     *           Faces without template data
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Source gallery on export and target gallery on import
+     *
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @return string
+     */
+    public function getGalleryName()
+    {
+        return $this->gallery_name;
+    }
+
+    /**
+     * Source gallery on export and target gallery on import
+     *
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Identifies the gallery file.  Changes when the gallery is compacted.
+     *
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     * @return string
+     */
+    public function getFileId()
+    {
+        return $this->file_id;
+    }
+
+    /**
+     * Identifies the gallery file.  Changes when the gallery is compacted.
+     *
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setFileId($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->file_id = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 start_row = 3;</code>
+     * @return int|string
+     */
+    public function getStartRow()
+    {
+        return $this->start_row;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 start_row = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setStartRow($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->start_row = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 next_row = 4;</code>
+     * @return int|string
+     */
+    public function getNextRow()
+    {
+        return $this->next_row;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 next_row = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setNextRow($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->next_row = $var;
+
+        return $this;
+    }
+
+    /**
+     * Rows in the gallery when the export started
+     *
+     * Generated from protobuf field <code>int64 row_count = 5;</code>
+     * @return int|string
+     */
+    public function getRowCount()
+    {
+        return $this->row_count;
+    }
+
+    /**
+     * Rows in the gallery when the export started
+     *
+     * Generated from protobuf field <code>int64 row_count = 5;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setRowCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->row_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 dim = 6;</code>
+     * @return int
+     */
+    public function getDim()
+    {
+        return $this->dim;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 dim = 6;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setDim($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->dim = $var;
+
+        return $this;
+    }
+
+    /**
+     * (faces, dim) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes templates = 7;</code>
+     * @return string
+     */
+    public function getTemplates()
+    {
+        return $this->templates;
+    }
+
+    /**
+     * (faces, dim) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes templates = 7;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setTemplates($var)
+    {
+        GPBUtil::checkString($var, False);
+        $this->templates = $var;
+
+        return $this;
+    }
+
+    /**
+     * Faces without template data
+     *
+     * Generated from protobuf field <code>.FaceRecordList records = 8;</code>
+     * @return \FaceRecordList
+     */
+    public function getRecords()
+    {
+        return $this->records;
+    }
+
+    /**
+     * Faces without template data
+     *
+     * Generated from protobuf field <code>.FaceRecordList records = 8;</code>
+     * @param \FaceRecordList $var
+     * @return $this
+     */
+    public function setRecords($var)
+    {
+        GPBUtil::checkMessage($var, \FaceRecordList::class);
+        $this->records = $var;
+
+        return $this;
+    }
+
+}
+
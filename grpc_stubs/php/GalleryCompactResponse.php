@@ -0,0 +1,239 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>GalleryCompactResponse</code>
+ */
+class GalleryCompactResponse extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     */
+    private $gallery_name = '';
+    /**
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     */
+    private $face_count = 0;
+    /**
+     * Deleted and replaced rows dropped from the file
+     *
+     * Generated from protobuf field <code>int64 rows_removed = 3;</code>
+     */
+    private $rows_removed = 0;
+    /**
+     * Gallery file and view blobs before compaction
+     *
+     * Generated from protobuf field <code>int64 bytes_before = 4;</code>
+     */
+    private $bytes_before = 0;
+    /**
+     * Generated from protobuf field <code>int64 bytes_after = 5;</code>
+     */
+    private $bytes_after = 0;
+    /**
+     * Generated from protobuf field <code>int64 bytes_reclaimed = 6;</code>
+     */
+    private $bytes_reclaimed = 0;
+    /**
+     * Seconds
+     *
+     * Generated from protobuf field <code>float compact_time = 7;</code>
+     */
+    private $compact_time = 0.0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $gallery_name
+     *     @type int|string $face_count
+     *     @type int|string $rows_removed
+     *           Deleted and replaced rows dropped from the file
+     *     @type int|string $bytes_before
+     *           Gallery file and view blobs before compaction
+     *     @type int|string $bytes_after
+     *     @type int|string $bytes_reclaimed
+     *     @type float $compact_time
+     *           Seconds
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @return string
+     */
+    public function getGalleryName()
+    {
+        return $this->gallery_name;
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     * @return int|string
+     */
+    public function getFaceCount()
+    {
+        return $this->face_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setFaceCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->face_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Deleted and replaced rows dropped from the file
+     *
+     * Generated from protobuf field <code>int64 rows_removed = 3;</code>
+     * @return int|string
+     */
+    public function getRowsRemoved()
+    {
+        return $this->rows_removed;
+    }
+
+    /**
+     * Deleted and replaced rows dropped from the file
+     *
+     * Generated from protobuf field <code>int64 rows_removed = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setRowsRemoved($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->rows_removed = $var;
+
+        return $this;
+    }
+
+    /**
+     * Gallery file and view blobs before compaction
+     *
+     * Generated from protobuf field <code>int64 bytes_before = 4;</code>
+     * @return int|string
+     */
+    public function getBytesBefore()
+    {
+        return $this->bytes_before;
+    }
+
+    /**
+     * Gallery file and view blobs before compaction
+     *
+     * Generated from protobuf field <code>int64 bytes_before = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setBytesBefore($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->bytes_before = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 bytes_after = 5;</code>
+     * @return int|string
+     */
+    public function getBytesAfter()
+    {
+        return $this->bytes_after;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 bytes_after = 5;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setBytesAfter($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->bytes_after = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 bytes_reclaimed = 6;</code>
+     * @return int|string
+     */
+    public function getBytesReclaimed()
+    {
+        return $this->bytes_reclaimed;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 bytes_reclaimed = 6;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setBytesReclaimed($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->bytes_reclaimed = $var;
+
+        return $this;
+    }
+
+    /**
+     * Seconds
+     *
+     * Generated from protobuf field <code>float compact_time = 7;</code>
+     * @return float
+     */
+    public function getCompactTime()
+    {
+        return $this->compact_time;
+    }
+
+    /**
+     * Seconds
+     *
+     * Generated from protobuf field <code>float compact_time = 7;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setCompactTime($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->compact_time = $var;
+
+        return $this;
+    }
+
+}
+
@@ -0,0 +1,185 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>GalleryExportRequest</code>
+ */
+class GalleryExportRequest extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     */
+    private $gallery_name = '';
+    /**
+     * Resume after a chunk by passing its next_row
+     *
+     * Generated from protobuf field <code>int64 start_row = 2;</code>
+     */
+    private $start_row = 0;
+    /**
+     * The file_id of the chunks already received when resuming
+     *
+     * Generated from protobuf field <code>string file_id = 3;</code>
+     */
+    private $file_id = '';
+    /**
+     * Gallery rows per chunk, 0 for the default
+     *
+     * Generated from protobuf field <code>int32 chunk_size = 4;</code>
+     */
+    private $chunk_size = 0;
+    /**
+     * Generated from protobuf field <code>bool include_views = 5;</code>
+     */
+    private $include_views = false;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $gallery_name
+     *     @type int|string $start_row
+     *           Resume after a chunk by passing its next_row
+     *     @type string $file_id
+     *           The file_id of the chunks already received when resuming
+     *     @type int $chunk_size
+     *           Gallery rows per chunk, 0 for the default
+     *     @type bool $include_views
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @return string
+     */
+    public function getGalleryName()
+    {
+        return $this->gallery_name;
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Resume after a chunk by passing its next_row
+     *
+     * Generated from protobuf field <code>int64 start_row = 2;</code>
+     * @return int|string
+     */
+    public function getStartRow()
+    {
+        return $this->start_row;
+    }
+
+    /**
+     * Resume after a chunk by passing its next_row
+     *
+     * Generated from protobuf field <code>int64 start_row = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setStartRow($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->start_row = $var;
+
+        return $this;
+    }
+
+    /**
+     * The file_id of the chunks already received when resuming
+     *
+     * Generated from protobuf field <code>string file_id = 3;</code>
+     * @return string
+     */
+    public function getFileId()
+    {
+        return $this->file_id;
+    }
+
+    /**
+     * The file_id of the chunks already received when resuming
+     *
+     * Generated from protobuf field <code>string file_id = 3;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setFileId($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->file_id = $var;
+
+        return $this;
+    }
+
+    /**
+     * Gallery rows per chunk, 0 for the default
+     *
+     * Generated from protobuf field <code>int32 chunk_size = 4;</code>
+     * @return int
+     */
+    public function getChunkSize()
+    {
+        return $this->chunk_size;
+    }
+
+    /**
+     * Gallery rows per chunk, 0 for the default
+     *
+     * Generated from protobuf field <code>int32 chunk_size = 4;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setChunkSize($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->chunk_size = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>bool include_views = 5;</code>
+     * @return bool
+     */
+    public function getIncludeViews()
+    {
+        return $this->include_views;
+    }
+
+    /**
+     * Generated from protobuf field <code>bool include_views = 5;</code>
+     * @param bool $var
+     * @return $this
+     */
+    public function setIncludeViews($var)
+    {
+        GPBUtil::checkBool($var);
+        $this->include_views = $var;
+
+        return $this;
+    }
+
+}
+
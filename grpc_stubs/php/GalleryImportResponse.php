@@ -0,0 +1,178 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>GalleryImportResponse</code>
+ */
+class GalleryImportResponse extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     */
+    private $gallery_name = '';
+    /**
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     */
+    private $file_id = '';
+    /**
+     * Export start_row to resume the transfer after this chunk
+     *
+     * Generated from protobuf field <code>int64 next_row = 3;</code>
+     */
+    private $next_row = 0;
+    /**
+     * Totals for the stream so far
+     *
+     * Generated from protobuf field <code>int64 enroll_count = 4;</code>
+     */
+    private $enroll_count = 0;
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 5;</code>
+     */
+    private $replace_count = 0;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $gallery_name
+     *     @type string $file_id
+     *     @type int|string $next_row
+     *           Export start_row to resume the transfer after this chunk
+     *     @type int|string $enroll_count
+     *           Totals for the stream so far
+     *     @type int|string $replace_count
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @return string
+     */
+    public function getGalleryName()
+    {
+        return $this->gallery_name;
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     * @return string
+     */
+    public function getFileId()
+    {
+        return $this->file_id;
+    }
+
+    /**
+     * Generated from protobuf field <code>string file_id = 2;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setFileId($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->file_id = $var;
+
+        return $this;
+    }
+
+    /**
+     * Export start_row to resume the transfer after this chunk
+     *
+     * Generated from protobuf field <code>int64 next_row = 3;</code>
+     * @return int|string
+     */
+    public function getNextRow()
+    {
+        return $this->next_row;
+    }
+
+    /**
+     * Export start_row to resume the transfer after this chunk
+     *
+     * Generated from protobuf field <code>int64 next_row = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setNextRow($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->next_row = $var;
+
+        return $this;
+    }
+
+    /**
+     * Totals for the stream so far
+     *
+     * Generated from protobuf field <code>int64 enroll_count = 4;</code>
+     * @return int|string
+     */
+    public function getEnrollCount()
+    {
+        return $this->enroll_count;
+    }
+
+    /**
+     * Totals for the stream so far
+     *
+     * Generated from protobuf field <code>int64 enroll_count = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setEnrollCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->enroll_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 5;</code>
+     * @return int|string
+     */
+    public function getReplaceCount()
+    {
+        return $this->replace_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 replace_count = 5;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setReplaceCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->replace_count = $var;
+
+        return $this;
+    }
+
+}
+
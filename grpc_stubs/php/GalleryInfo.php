@@ -19,6 +19,32 @@ class GalleryInfo extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>int64 face_count = 2;</code>
      */
     private $face_count = 0;
+    /**
+     * Generated from protobuf field <code>int64 subject_count = 3;</code>
+     */
+    private $subject_count = 0;
+    /**
+     * Generated from protobuf field <code>int32 template_dim = 4;</code>
+     */
+    private $template_dim = 0;
+    /**
+     * Gallery file and view blobs on disk
+     *
+     * Generated from protobuf field <code>int64 file_bytes = 5;</code>
+     */
+    private $file_bytes = 0;
+    /**
+     * none, current, or stale
+     *
+     * Generated from protobuf field <code>string index_state = 6;</code>
+     */
+    private $index_state = '';
+    /**
+     * Time of the last change in seconds since the epoch
+     *
+     * Generated from protobuf field <code>double modified = 7;</code>
+     */
+    private $modified = 0.0;
 
     /**
      * Constructor.
@@ -28,6 +54,14 @@ class GalleryInfo extends \Google\Protobuf\Internal\Message
      *
      *     @type string $gallery_name
      *     @type int|string $face_count
+     *     @type int|string $subject_count
+     *     @type int $template_dim
+     *     @type int|string $file_bytes
+     *           Gallery file and view blobs on disk
+     *     @type string $index_state
+     *           none, current, or stale
+     *     @type float $modified
+     *           Time of the last change in seconds since the epoch
      * }
      */
     public function __construct($data = NULL) {
@@ -79,5 +113,127 @@ class GalleryInfo extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Generated from protobuf field <code>int64 subject_count = 3;</code>
+     * @return int|string
+     */
+    public function getSubjectCount()
+    {
+        return $this->subject_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int64 subject_count = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setSubjectCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->subject_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 template_dim = 4;</code>
+     * @return int
+     */
+    public function getTemplateDim()
+    {
+        return $this->template_dim;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 template_dim = 4;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setTemplateDim($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->template_dim = $var;
+
+        return $this;
+    }
+
+    /**
+     * Gallery file and view blobs on disk
+     *
+     * Generated from protobuf field <code>int64 file_bytes = 5;</code>
+     * @return int|string
+     */
+    public function getFileBytes()
+    {
+        return $this->file_bytes;
+    }
+
+    /**
+     * Gallery file and view blobs on disk
+     *
+     * Generated from protobuf field <code>int64 file_bytes = 5;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setFileBytes($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->file_bytes = $var;
+
+        return $this;
+    }
+
+    /**
+     * none, current, or stale
+     *
+     * Generated from protobuf field <code>string index_state = 6;</code>
+     * @return string
+     */
+    public function getIndexState()
+    {
+        return $this->index_state;
+    }
+
+    /**
+     * none, current, or stale
+     *
+     * Generated from protobuf field <code>string index_state = 6;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setIndexState($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->index_state = $var;
+
+        return $this;
+    }
+
+    /**
+     * Time of the last change in seconds since the epoch
+     *
+     * Generated from protobuf field <code>double modified = 7;</code>
+     * @return float
+     */
+    public function getModified()
+    {
+        return $this->modified;
+    }
+
+    /**
+     * Time of the last change in seconds since the epoch
+     *
+     * Generated from protobuf field <code>double modified = 7;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setModified($var)
+    {
+        GPBUtil::checkDouble($var);
+        $this->modified = $var;
+
+        return $this;
+    }
+
 }
 
@@ -0,0 +1,363 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>MatchDistribution</code>
+ */
+class MatchDistribution extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Blocks of the distance matrix are streamed first when include_scores
+     * is set.  The blocks cover the tiles on and above the diagonal.
+     *
+     * Generated from protobuf field <code>.ScoreBlock block = 1;</code>
+     */
+    private $block = null;
+    /**
+     * The summaries are set in the last message of the stream.  Pairs of
+     * faces are counted once and faces are not compared to themselves.
+     *
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     */
+    private $face_count = 0;
+    /**
+     * Pairs with the same subject id
+     *
+     * Generated from protobuf field <code>int64 genuine_count = 3;</code>
+     */
+    private $genuine_count = 0;
+    /**
+     * Pairs with different or missing subject ids
+     *
+     * Generated from protobuf field <code>int64 impostor_count = 4;</code>
+     */
+    private $impostor_count = 0;
+    /**
+     * bins + 1 edges.  Distances outside a requested range are counted in the first or last bin.
+     *
+     * Generated from protobuf field <code>repeated float bin_edges = 5;</code>
+     */
+    private $bin_edges;
+    /**
+     * Generated from protobuf field <code>repeated int64 genuine_histogram = 6;</code>
+     */
+    private $genuine_histogram;
+    /**
+     * Generated from protobuf field <code>repeated int64 impostor_histogram = 7;</code>
+     */
+    private $impostor_histogram;
+    /**
+     * The interior bin edges
+     *
+     * Generated from protobuf field <code>repeated float thresholds = 8;</code>
+     */
+    private $thresholds;
+    /**
+     * Fraction of impostor pairs with a distance below each threshold
+     *
+     * Generated from protobuf field <code>repeated float far = 9;</code>
+     */
+    private $far;
+    /**
+     * Fraction of genuine pairs with a distance at or above each threshold
+     *
+     * Generated from protobuf field <code>repeated float frr = 10;</code>
+     */
+    private $frr;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type \ScoreBlock $block
+     *           Blocks of the distance matrix are streamed first when include_scores
+     *           is set.  The blocks cover the tiles on and above the diagonal.
+     *     @type int|string $face_count
+     *           The summaries are set in the last message of the stream.  Pairs of
+     *           faces are counted once and faces are not compared to themselves.
+     *     @type int|string $genuine_count
+     *           Pairs with the same subject id
+     *     @type int|string $impostor_count
+     *           Pairs with different or missing subject ids
+     *     @type float[]|\Google\Protobuf\Internal\RepeatedField $bin_edges
+     *           bins + 1 edges.  Distances outside a requested range are counted in the first or last bin.
+     *     @type int[]|string[]|\Google\Protobuf\Internal\RepeatedField $genuine_histogram
+     *     @type int[]|string[]|\Google\Protobuf\Internal\RepeatedField $impostor_histogram
+     *     @type float[]|\Google\Protobuf\Internal\RepeatedField $thresholds
+     *           The interior bin edges
+     *     @type float[]|\Google\Protobuf\Internal\RepeatedField $far
+     *           Fraction of impostor pairs with a distance below each threshold
+     *     @type float[]|\Google\Protobuf\Internal\RepeatedField $frr
+     *           Fraction of genuine pairs with a distance at or above each threshold
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Blocks of the distance matrix are streamed first when include_scores
+     * is set.  The blocks cover the tiles on and above the diagonal.
+     *
+     * Generated from protobuf field <code>.ScoreBlock block = 1;</code>
+     * @return \ScoreBlock
+     */
+    public function getBlock()
+    {
+        return $this->block;
+    }
+
+    /**
+     * Blocks of the distance matrix are streamed first when include_scores
+     * is set.  The blocks cover the tiles on and above the diagonal.
+     *
+     * Generated from protobuf field <code>.ScoreBlock block = 1;</code>
+     * @param \ScoreBlock $var
+     * @return $this
+     */
+    public function setBlock($var)
+    {
+        GPBUtil::checkMessage($var, \ScoreBlock::class);
+        $this->block = $var;
+
+        return $this;
+    }
+
+    /**
+     * The summaries are set in the last message of the stream.  Pairs of
+     * faces are counted once and faces are not compared to themselves.
+     *
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     * @return int|string
+     */
+    public function getFaceCount()
+    {
+        return $this->face_count;
+    }
+
+    /**
+     * The summaries are set in the last message of the stream.  Pairs of
+     * faces are counted once and faces are not compared to themselves.
+     *
+     * Generated from protobuf field <code>int64 face_count = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setFaceCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->face_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Pairs with the same subject id
+     *
+     * Generated from protobuf field <code>int64 genuine_count = 3;</code>
+     * @return int|string
+     */
+    public function getGenuineCount()
+    {
+        return $this->genuine_count;
+    }
+
+    /**
+     * Pairs with the same subject id
+     *
+     * Generated from protobuf field <code>int64 genuine_count = 3;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setGenuineCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->genuine_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Pairs with different or missing subject ids
+     *
+     * Generated from protobuf field <code>int64 impostor_count = 4;</code>
+     * @return int|string
+     */
+    public function getImpostorCount()
+    {
+        return $this->impostor_count;
+    }
+
+    /**
+     * Pairs with different or missing subject ids
+     *
+     * Generated from protobuf field <code>int64 impostor_count = 4;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setImpostorCount($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->impostor_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * bins + 1 edges.  Distances outside a requested range are counted in the first or last bin.
+     *
+     * Generated from protobuf field <code>repeated float bin_edges = 5;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getBinEdges()
+    {
+        return $this->bin_edges;
+    }
+
+    /**
+     * bins + 1 edges.  Distances outside a requested range are counted in the first or last bin.
+     *
+     * Generated from protobuf field <code>repeated float bin_edges = 5;</code>
+     * @param float[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setBinEdges($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::FLOAT);
+        $this->bin_edges = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated int64 genuine_histogram = 6;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getGenuineHistogram()
+    {
+        return $this->genuine_histogram;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated int64 genuine_histogram = 6;</code>
+     * @param int[]|string[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setGenuineHistogram($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::INT64);
+        $this->genuine_histogram = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated int64 impostor_histogram = 7;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getImpostorHistogram()
+    {
+        return $this->impostor_histogram;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated int64 impostor_histogram = 7;</code>
+     * @param int[]|string[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setImpostorHistogram($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::INT64);
+        $this->impostor_histogram = $arr;
+
+        return $this;
+    }
+
+    /**
+     * The interior bin edges
+     *
+     * Generated from protobuf field <code>repeated float thresholds = 8;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getThresholds()
+    {
+        return $this->thresholds;
+    }
+
+    /**
+     * The interior bin edges
+     *
+     * Generated from protobuf field <code>repeated float thresholds = 8;</code>
+     * @param float[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setThresholds($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::FLOAT);
+        $this->thresholds = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Fraction of impostor pairs with a distance below each threshold
+     *
+     * Generated from protobuf field <code>repeated float far = 9;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getFar()
+    {
+        return $this->far;
+    }
+
+    /**
+     * Fraction of impostor pairs with a distance below each threshold
+     *
+     * Generated from protobuf field <code>repeated float far = 9;</code>
+     * @param float[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setFar($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::FLOAT);
+        $this->far = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Fraction of genuine pairs with a distance at or above each threshold
+     *
+     * Generated from protobuf field <code>repeated float frr = 10;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getFrr()
+    {
+        return $this->frr;
+    }
+
+    /**
+     * Fraction of genuine pairs with a distance at or above each threshold
+     *
+     * Generated from protobuf field <code>repeated float frr = 10;</code>
+     * @param float[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setFrr($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::FLOAT);
+        $this->frr = $arr;
+
+        return $this;
+    }
+
+}
+
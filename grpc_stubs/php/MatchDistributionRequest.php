@@ -0,0 +1,185 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>MatchDistributionRequest</code>
+ */
+class MatchDistributionRequest extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     */
+    private $gallery_name = '';
+    /**
+     * Histogram bins.  DEFAULT=100
+     *
+     * Generated from protobuf field <code>int32 bins = 2;</code>
+     */
+    private $bins = 0;
+    /**
+     * Histogram range.  Estimated to cover every score if both are zero.
+     *
+     * Generated from protobuf field <code>float min_score = 3;</code>
+     */
+    private $min_score = 0.0;
+    /**
+     * Generated from protobuf field <code>float max_score = 4;</code>
+     */
+    private $max_score = 0.0;
+    /**
+     * Also stream the upper triangle of the distance matrix in blocks
+     *
+     * Generated from protobuf field <code>bool include_scores = 5;</code>
+     */
+    private $include_scores = false;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string $gallery_name
+     *     @type int $bins
+     *           Histogram bins.  DEFAULT=100
+     *     @type float $min_score
+     *           Histogram range.  Estimated to cover every score if both are zero.
+     *     @type float $max_score
+     *     @type bool $include_scores
+     *           Also stream the upper triangle of the distance matrix in blocks
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @return string
+     */
+    public function getGalleryName()
+    {
+        return $this->gallery_name;
+    }
+
+    /**
+     * Generated from protobuf field <code>string gallery_name = 1;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setGalleryName($var)
+    {
+        GPBUtil::checkString($var, True);
+        $this->gallery_name = $var;
+
+        return $this;
+    }
+
+    /**
+     * Histogram bins.  DEFAULT=100
+     *
+     * Generated from protobuf field <code>int32 bins = 2;</code>
+     * @return int
+     */
+    public function getBins()
+    {
+        return $this->bins;
+    }
+
+    /**
+     * Histogram bins.  DEFAULT=100
+     *
+     * Generated from protobuf field <code>int32 bins = 2;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setBins($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->bins = $var;
+
+        return $this;
+    }
+
+    /**
+     * Histogram range.  Estimated to cover every score if both are zero.
+     *
+     * Generated from protobuf field <code>float min_score = 3;</code>
+     * @return float
+     */
+    public function getMinScore()
+    {
+        return $this->min_score;
+    }
+
+    /**
+     * Histogram range.  Estimated to cover every score if both are zero.
+     *
+     * Generated from protobuf field <code>float min_score = 3;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMinScore($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->min_score = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_score = 4;</code>
+     * @return float
+     */
+    public function getMaxScore()
+    {
+        return $this->max_score;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_score = 4;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMaxScore($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->max_score = $var;
+
+        return $this;
+    }
+
+    /**
+     * Also stream the upper triangle of the distance matrix in blocks
+     *
+     * Generated from protobuf field <code>bool include_scores = 5;</code>
+     * @return bool
+     */
+    public function getIncludeScores()
+    {
+        return $this->include_scores;
+    }
+
+    /**
+     * Also stream the upper triangle of the distance matrix in blocks
+     *
+     * Generated from protobuf field <code>bool include_scores = 5;</code>
+     * @param bool $var
+     * @return $this
+     */
+    public function setIncludeScores($var)
+    {
+        GPBUtil::checkBool($var);
+        $this->include_scores = $var;
+
+        return $this;
+    }
+
+}
+
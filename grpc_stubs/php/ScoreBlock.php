@@ -0,0 +1,185 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>ScoreBlock</code>
+ */
+class ScoreBlock extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * First probe row of the block
+     *
+     * Generated from protobuf field <code>int64 probe_start = 1;</code>
+     */
+    private $probe_start = 0;
+    /**
+     * First gallery column of the block
+     *
+     * Generated from protobuf field <code>int64 gallery_start = 2;</code>
+     */
+    private $gallery_start = 0;
+    /**
+     * Generated from protobuf field <code>int32 probe_count = 3;</code>
+     */
+    private $probe_count = 0;
+    /**
+     * Generated from protobuf field <code>int32 gallery_count = 4;</code>
+     */
+    private $gallery_count = 0;
+    /**
+     * (probe_count, gallery_count) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes scores = 5;</code>
+     */
+    private $scores = '';
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type int|string $probe_start
+     *           First probe row of the block
+     *     @type int|string $gallery_start
+     *           First gallery column of the block
+     *     @type int $probe_count
+     *     @type int $gallery_count
+     *     @type string $scores
+     *           (probe_count, gallery_count) little endian float32 matrix in row order
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * First probe row of the block
+     *
+     * Generated from protobuf field <code>int64 probe_start = 1;</code>
+     * @return int|string
+     */
+    public function getProbeStart()
+    {
+        return $this->probe_start;
+    }
+
+    /**
+     * First probe row of the block
+     *
+     * Generated from protobuf field <code>int64 probe_start = 1;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setProbeStart($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->probe_start = $var;
+
+        return $this;
+    }
+
+    /**
+     * First gallery column of the block
+     *
+     * Generated from protobuf field <code>int64 gallery_start = 2;</code>
+     * @return int|string
+     */
+    public function getGalleryStart()
+    {
+        return $this->gallery_start;
+    }
+
+    /**
+     * First gallery column of the block
+     *
+     * Generated from protobuf field <code>int64 gallery_start = 2;</code>
+     * @param int|string $var
+     * @return $this
+     */
+    public function setGalleryStart($var)
+    {
+        GPBUtil::checkInt64($var);
+        $this->gallery_start = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 probe_count = 3;</code>
+     * @return int
+     */
+    public function getProbeCount()
+    {
+        return $this->probe_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 probe_count = 3;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setProbeCount($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->probe_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 gallery_count = 4;</code>
+     * @return int
+     */
+    public function getGalleryCount()
+    {
+        return $this->gallery_count;
+    }
+
+    /**
+     * Generated from protobuf field <code>int32 gallery_count = 4;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setGalleryCount($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->gallery_count = $var;
+
+        return $this;
+    }
+
+    /**
+     * (probe_count, gallery_count) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes scores = 5;</code>
+     * @return string
+     */
+    public function getScores()
+    {
+        return $this->scores;
+    }
+
+    /**
+     * (probe_count, gallery_count) little endian float32 matrix in row order
+     *
+     * Generated from protobuf field <code>bytes scores = 5;</code>
+     * @param string $var
+     * @return $this
+     */
+    public function setScores($var)
+    {
+        GPBUtil::checkString($var, False);
+        $this->scores = $var;
+
+        return $this;
+    }
+
+}
+
@@ -0,0 +1,239 @@
+<?php
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: faro/proto/face_service.proto
+
+use Google\Protobuf\Internal\GPBType;
+use Google\Protobuf\Internal\RepeatedField;
+use Google\Protobuf\Internal\GPBUtil;
+
+/**
+ * Generated from protobuf message <code>SearchFilter</code>
+ */
+class SearchFilter extends \Google\Protobuf\Internal\Message
+{
+    /**
+     * Faces must pass every predicate that is set.  Empty lists match every face.
+     *
+     * Generated from protobuf field <code>repeated string subject_ids = 1;</code>
+     */
+    private $subject_ids;
+    /**
+     * Generated from protobuf field <code>repeated string sources = 2;</code>
+     */
+    private $sources;
+    /**
+     * Dates are inclusive.  0 leaves that end of the range open.
+     *
+     * Generated from protobuf field <code>float min_collection_date = 3;</code>
+     */
+    private $min_collection_date = 0.0;
+    /**
+     * Generated from protobuf field <code>float max_collection_date = 4;</code>
+     */
+    private $max_collection_date = 0.0;
+    /**
+     * Generated from protobuf field <code>float min_enrollment_date = 5;</code>
+     */
+    private $min_enrollment_date = 0.0;
+    /**
+     * Generated from protobuf field <code>float max_enrollment_date = 6;</code>
+     */
+    private $max_enrollment_date = 0.0;
+    /**
+     * Matched against the FaceRecord attributes.
+     *
+     * Generated from protobuf field <code>repeated .AttributeFilter attributes = 7;</code>
+     */
+    private $attributes;
+
+    /**
+     * Constructor.
+     *
+     * @param array $data {
+     *     Optional. Data for populating the Message object.
+     *
+     *     @type string[]|\Google\Protobuf\Internal\RepeatedField $subject_ids
+     *           Faces must pass every predicate that is set.  Empty lists match every face.
+     *     @type string[]|\Google\Protobuf\Internal\RepeatedField $sources
+     *     @type float $min_collection_date
+     *           Dates are inclusive.  0 leaves that end of the range open.
+     *     @type float $max_collection_date
+     *     @type float $min_enrollment_date
+     *     @type float $max_enrollment_date
+     *     @type \AttributeFilter[]|\Google\Protobuf\Internal\RepeatedField $attributes
+     *           Matched against the FaceRecord attributes.
+     * }
+     */
+    public function __construct($data = NULL) {
+        \GPBMetadata\Faro\Proto\FaceService::initOnce();
+        parent::__construct($data);
+    }
+
+    /**
+     * Faces must pass every predicate that is set.  Empty lists match every face.
+     *
+     * Generated from protobuf field <code>repeated string subject_ids = 1;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getSubjectIds()
+    {
+        return $this->subject_ids;
+    }
+
+    /**
+     * Faces must pass every predicate that is set.  Empty lists match every face.
+     *
+     * Generated from protobuf field <code>repeated string subject_ids = 1;</code>
+     * @param string[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setSubjectIds($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::STRING);
+        $this->subject_ids = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated string sources = 2;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getSources()
+    {
+        return $this->sources;
+    }
+
+    /**
+     * Generated from protobuf field <code>repeated string sources = 2;</code>
+     * @param string[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setSources($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::STRING);
+        $this->sources = $arr;
+
+        return $this;
+    }
+
+    /**
+     * Dates are inclusive.  0 leaves that end of the range open.
+     *
+     * Generated from protobuf field <code>float min_collection_date = 3;</code>
+     * @return float
+     */
+    public function getMinCollectionDate()
+    {
+        return $this->min_collection_date;
+    }
+
+    /**
+     * Dates are inclusive.  0 leaves that end of the range open.
+     *
+     * Generated from protobuf field <code>float min_collection_date = 3;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMinCollectionDate($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->min_collection_date = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_collection_date = 4;</code>
+     * @return float
+     */
+    public function getMaxCollectionDate()
+    {
+        return $this->max_collection_date;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_collection_date = 4;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMaxCollectionDate($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->max_collection_date = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>float min_enrollment_date = 5;</code>
+     * @return float
+     */
+    public function getMinEnrollmentDate()
+    {
+        return $this->min_enrollment_date;
+    }
+
+    /**
+     * Generated from protobuf field <code>float min_enrollment_date = 5;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMinEnrollmentDate($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->min_enrollment_date = $var;
+
+        return $this;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_enrollment_date = 6;</code>
+     * @return float
+     */
+    public function getMaxEnrollmentDate()
+    {
+        return $this->max_enrollment_date;
+    }
+
+    /**
+     * Generated from protobuf field <code>float max_enrollment_date = 6;</code>
+     * @param float $var
+     * @return $this
+     */
+    public function setMaxEnrollmentDate($var)
+    {
+        GPBUtil::checkFloat($var);
+        $this->max_enrollment_date = $var;
+
+        return $this;
+    }
+
+    /**
+     * Matched against the FaceRecord attributes.
+     *
+     * Generated from protobuf field <code>repeated .AttributeFilter attributes = 7;</code>
+     * @return \Google\Protobuf\Internal\RepeatedField
+     */
+    public function getAttributes()
+    {
+        return $this->attributes;
+    }
+
+    /**
+     * Matched against the FaceRecord attributes.
+     *
+     * Generated from protobuf field <code>repeated .AttributeFilter attributes = 7;</code>
+     * @param \AttributeFilter[]|\Google\Protobuf\Internal\RepeatedField $var
+     * @return $this
+     */
+    public function setAttributes($var)
+    {
+        $arr = GPBUtil::checkRepeatedField($var, \Google\Protobuf\Internal\GPBType::MESSAGE, \AttributeFilter::class);
+        $this->attributes = $arr;
+
+        return $this;
+    }
+
+}
+
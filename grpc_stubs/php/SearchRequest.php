@@ -27,6 +27,18 @@ class SearchRequest extends \Google\Protobuf\Internal\Message
      * Generated from protobuf field <code>float threshold = 5;</code>
      */
     private $threshold = 0.0;
+    /**
+     * Lists searched by approximate gallery workers. 0 uses the server default.
+     *
+     * Generated from protobuf field <code>int32 nprobe = 6;</code>
+     */
+    private $nprobe = 0;
+    /**
+     * Only faces that pass the filter are searched.
+     *
+     * Generated from protobuf field <code>.SearchFilter filter = 7;</code>
+     */
+    private $filter = null;
 
     /**
      * Constructor.
@@ -38,6 +50,10 @@ class SearchRequest extends \Google\Protobuf\Internal\Message
      *     @type \FaceRecordList $probes
      *     @type int $max_results
      *     @type float $threshold
+     *     @type int $nprobe
+     *           Lists searched by approximate gallery workers. 0 uses the server default.
+     *     @type \SearchFilter $filter
+     *           Only faces that pass the filter are searched.
      * }
      */
     public function __construct($data = NULL) {
@@ -133,5 +149,57 @@ class SearchRequest extends \Google\Protobuf\Internal\Message
         return $this;
     }
 
+    /**
+     * Lists searched by approximate gallery workers. 0 uses the server default.
+     *
+     * Generated from protobuf field <code>int32 nprobe = 6;</code>
+     * @return int
+     */
+    public function getNprobe()
+    {
+        return $this->nprobe;
+    }
+
+    /**
+     * Lists searched by approximate gallery workers. 0 uses the server default.
+     *
+     * Generated from protobuf field <code>int32 nprobe = 6;</code>
+     * @param int $var
+     * @return $this
+     */
+    public function setNprobe($var)
+    {
+        GPBUtil::checkInt32($var);
+        $this->nprobe = $var;
+
+        return $this;
+    }
+
+    /**
+     * Only faces that pass the filter are searched.
+     *
+     * Generated from protobuf field <code>.SearchFilter filter = 7;</code>
+     * @return \SearchFilter
+     */
+    public function getFilter()
+    {
+        return $this->filter;
+    }
+
+    /**
+     * Only faces that pass the filter are searched.
+     *
+     * Generated from protobuf field <code>.SearchFilter filter = 7;</code>
+     * @param \SearchFilter $var
+     * @return $this
+     */
+    public function setFilter($var)
+    {
+        GPBUtil::checkMessage($var, \SearchFilter::class);
+        $this->filter = $var;
+
+        return $this;
+    }
+
 }
 
@@ -48,6 +48,7 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :min_size, :int32, 7
       optional :save_request, :bool, 9
       optional :debug, :bool, 10
+      optional :downsample, :int32, 11
       repeated :attributes, :message, 8, "Attribute"
     end
     add_message "ExtractOptions" do
@@ -60,6 +61,8 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :save_request, :bool, 2
       optional :debug, :bool, 3
       repeated :attributes, :message, 8, "Attribute"
+      optional :dedup_distance, :float, 9
+      optional :dedup_merge, :bool, 10
     end
     add_message "DetectionList" do
       repeated :detections, :message, 1, "Detection"
@@ -87,6 +90,7 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
     add_message "FaceTemplate" do
       optional :data, :message, 1, "Vector"
       optional :buffer, :bytes, 2
+      optional :algorithm, :string, 3
     end
     add_message "TemplateList" do
       repeated :templates, :message, 1, "FaceTemplate"
@@ -102,6 +106,7 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :name, :string, 5
       optional :source, :string, 4
       optional :frame, :int64, 14
+      optional :algorithm, :string, 20
       optional :notes, :string, 6
       optional :gallery_key, :string, 15
       optional :collection_date, :float, 16
@@ -120,6 +125,13 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
     end
     add_message "FaceRecordList" do
       repeated :face_records, :message, 1, "FaceRecord"
+      optional :enroll_stats, :message, 3, "EnrollStats"
+    end
+    add_message "EnrollStats" do
+      optional :enroll_count, :int64, 1
+      optional :replace_count, :int64, 2
+      optional :skip_count, :int64, 3
+      optional :merge_count, :int64, 4
     end
     add_message "VerificationRequest" do
       optional :gallery, :string, 1
@@ -138,6 +150,23 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :probes, :message, 3, "FaceRecordList"
       optional :max_results, :int32, 4
       optional :threshold, :float, 5
+      optional :nprobe, :int32, 6
+      optional :filter, :message, 7, "SearchFilter"
+    end
+    add_message "AttributeFilter" do
+      optional :key, :string, 1
+      repeated :values, :string, 2
+      optional :min_value, :float, 3
+      optional :max_value, :float, 4
+    end
+    add_message "SearchFilter" do
+      repeated :subject_ids, :string, 1
+      repeated :sources, :string, 2
+      optional :min_collection_date, :float, 3
+      optional :max_collection_date, :float, 4
+      optional :min_enrollment_date, :float, 5
+      optional :max_enrollment_date, :float, 6
+      repeated :attributes, :message, 7, "AttributeFilter"
     end
     add_message "SearchResponse" do
       optional :message, :message, 1, "ErrorMessage"
@@ -148,6 +177,11 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :records, :message, 2, "FaceRecordList"
       optional :enroll_options, :message, 10, "EnrollOptions"
     end
+    add_message "BulkEnrollResponse" do
+      optional :request_count, :int64, 1
+      optional :enroll_count, :int64, 2
+      optional :replace_count, :int64, 3
+    end
     add_message "DetectRequest" do
       optional :image, :message, 1, "Image"
       optional :source, :string, 2
@@ -167,6 +201,32 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :template_probes, :message, 3, "TemplateList"
       optional :template_gallery, :message, 4, "TemplateList"
     end
+    add_message "ScoreBlock" do
+      optional :probe_start, :int64, 1
+      optional :gallery_start, :int64, 2
+      optional :probe_count, :int32, 3
+      optional :gallery_count, :int32, 4
+      optional :scores, :bytes, 5
+    end
+    add_message "MatchDistributionRequest" do
+      optional :gallery_name, :string, 1
+      optional :bins, :int32, 2
+      optional :min_score, :float, 3
+      optional :max_score, :float, 4
+      optional :include_scores, :bool, 5
+    end
+    add_message "MatchDistribution" do
+      optional :block, :message, 1, "ScoreBlock"
+      optional :face_count, :int64, 2
+      optional :genuine_count, :int64, 3
+      optional :impostor_count, :int64, 4
+      repeated :bin_edges, :float, 5
+      repeated :genuine_histogram, :int64, 6
+      repeated :impostor_histogram, :int64, 7
+      repeated :thresholds, :float, 8
+      repeated :far, :float, 9
+      repeated :frr, :float, 10
+    end
     add_message "DetectExtractRequest" do
       optional :detect_request, :message, 1, "DetectRequest"
       optional :extract_request, :message, 2, "ExtractRequest"
@@ -195,12 +255,65 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
       optional :match_threshold, :float, 9
       optional :algorithm, :string, 10
       optional :notes, :string, 11
+      optional :faro_version, :string, 12
+      optional :instance_name, :string, 13
+      optional :gallery_cache, :message, 14, "GalleryCacheStats"
+    end
+    add_message "GalleryCacheStats" do
+      optional :open_galleries, :int64, 1
+      optional :pinned_galleries, :int64, 2
+      optional :open_bytes, :int64, 3
+      optional :max_open, :int64, 4
+      optional :max_bytes, :int64, 5
+      optional :hits, :int64, 6
+      optional :misses, :int64, 7
+      optional :evictions, :int64, 8
     end
     add_message "GalleryListRequest" do
     end
     add_message "GalleryDeleteRequest" do
       optional :gallery_name, :string, 1
     end
+    add_message "GalleryConfigureRequest" do
+      optional :gallery_name, :string, 1
+      optional :index_quantization, :string, 2
+    end
+    add_message "GalleryCompactRequest" do
+      optional :gallery_name, :string, 1
+    end
+    add_message "GalleryCompactResponse" do
+      optional :gallery_name, :string, 1
+      optional :face_count, :int64, 2
+      optional :rows_removed, :int64, 3
+      optional :bytes_before, :int64, 4
+      optional :bytes_after, :int64, 5
+      optional :bytes_reclaimed, :int64, 6
+      optional :compact_time, :float, 7
+    end
+    add_message "GalleryExportRequest" do
+      optional :gallery_name, :string, 1
+      optional :start_row, :int64, 2
+      optional :file_id, :string, 3
+      optional :chunk_size, :int32, 4
+      optional :include_views, :bool, 5
+    end
+    add_message "GalleryChunk" do
+      optional :gallery_name, :string, 1
+      optional :file_id, :string, 2
+      optional :start_row, :int64, 3
+      optional :next_row, :int64, 4
+      optional :row_count, :int64, 5
+      optional :dim, :int32, 6
+      optional :templates, :bytes, 7
+      optional :records, :message, 8, "FaceRecordList"
+    end
+    add_message "GalleryImportResponse" do
+      optional :gallery_name, :string, 1
+      optional :file_id, :string, 2
+      optional :next_row, :int64, 3
+      optional :enroll_count, :int64, 4
+      optional :replace_count, :int64, 5
+    end
     add_message "EnrollmentListRequest" do
       optional :gallery_name, :string, 1
     end
@@ -216,10 +329,19 @@ Google::Protobuf::DescriptorPool.generated_pool.build do
     add_message "EnrollmentDeleteRequest" do
       optional :gallery_name, :string, 1
       optional :subject_id, :string, 2
+      optional :gallery_key, :string, 3
+    end
+    add_message "EnrollmentDeleteResponse" do
+      optional :delete_count, :int64, 1
     end
     add_message "GalleryInfo" do
       optional :gallery_name, :string, 1
       optional :face_count, :int64, 2
+      optional :subject_count, :int64, 3
+      optional :template_dim, :int32, 4
+      optional :file_bytes, :int64, 5
+      optional :index_state, :string, 6
+      optional :modified, :double, 7
     end
     add_message "GalleryList" do
       repeated :galleries, :message, 1, "GalleryInfo"
@@ -268,25 +390,40 @@ TemplateList = Google::Protobuf::DescriptorPool.generated_pool.lookup("TemplateL
 AccessRecord = Google::Protobuf::DescriptorPool.generated_pool.lookup("AccessRecord").msgclass
 FaceRecord = Google::Protobuf::DescriptorPool.generated_pool.lookup("FaceRecord").msgclass
 FaceRecordList = Google::Protobuf::DescriptorPool.generated_pool.lookup("FaceRecordList").msgclass
+EnrollStats = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollStats").msgclass
 VerificationRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("VerificationRequest").msgclass
 VerificationResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("VerificationResponse").msgclass
 SearchRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("SearchRequest").msgclass
+AttributeFilter = Google::Protobuf::DescriptorPool.generated_pool.lookup("AttributeFilter").msgclass
+SearchFilter = Google::Protobuf::DescriptorPool.generated_pool.lookup("SearchFilter").msgclass
 SearchResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("SearchResponse").msgclass
 EnrollRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollRequest").msgclass
+BulkEnrollResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("BulkEnrollResponse").msgclass
 DetectRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("DetectRequest").msgclass
 ExtractRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("ExtractRequest").msgclass
 ScoreRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("ScoreRequest").msgclass
+ScoreBlock = Google::Protobuf::DescriptorPool.generated_pool.lookup("ScoreBlock").msgclass
+MatchDistributionRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("MatchDistributionRequest").msgclass
+MatchDistribution = Google::Protobuf::DescriptorPool.generated_pool.lookup("MatchDistribution").msgclass
 DetectExtractRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("DetectExtractRequest").msgclass
 DetectExtractEnrollRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("DetectExtractEnrollRequest").msgclass
 DetectExtractSearchRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("DetectExtractSearchRequest").msgclass
 FaceStatusRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("FaceStatusRequest").msgclass
 FaceServiceInfo = Google::Protobuf::DescriptorPool.generated_pool.lookup("FaceServiceInfo").msgclass
+GalleryCacheStats = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryCacheStats").msgclass
 GalleryListRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryListRequest").msgclass
 GalleryDeleteRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryDeleteRequest").msgclass
+GalleryConfigureRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryConfigureRequest").msgclass
+GalleryCompactRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryCompactRequest").msgclass
+GalleryCompactResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryCompactResponse").msgclass
+GalleryExportRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryExportRequest").msgclass
+GalleryChunk = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryChunk").msgclass
+GalleryImportResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryImportResponse").msgclass
 EnrollmentListRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollmentListRequest").msgclass
 EnrollmentInfo = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollmentInfo").msgclass
 EnrollmentListResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollmentListResponse").msgclass
 EnrollmentDeleteRequest = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollmentDeleteRequest").msgclass
+EnrollmentDeleteResponse = Google::Protobuf::DescriptorPool.generated_pool.lookup("EnrollmentDeleteResponse").msgclass
 GalleryInfo = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryInfo").msgclass
 GalleryList = Google::Protobuf::DescriptorPool.generated_pool.lookup("GalleryList").msgclass
 Empty = Google::Protobuf::DescriptorPool.generated_pool.lookup("Empty").msgclass
@@ -43,7 +43,9 @@ module FaceRecognition
     rpc :detect, DetectRequest, FaceRecordList
     rpc :extract, ExtractRequest, FaceRecordList
     rpc :score, ScoreRequest, Matrix
+    rpc :scoreStream, ScoreRequest, stream(ScoreBlock)
     rpc :enroll, EnrollRequest, FaceRecordList
+    rpc :bulkEnroll, stream(EnrollRequest), BulkEnrollResponse
     rpc :search, SearchRequest, FaceRecordList
     # Combined opperations
     rpc :detectExtract, DetectExtractRequest, FaceRecordList
@@ -52,10 +54,21 @@ module FaceRecognition
     # Gallery Management
     rpc :galleryList, GalleryListRequest, GalleryList
     rpc :galleryDelete, GalleryDeleteRequest, Empty
+    rpc :galleryConfigure, GalleryConfigureRequest, Empty
+    rpc :galleryCompact, GalleryCompactRequest, GalleryCompactResponse
+    rpc :galleryExport, GalleryExportRequest, stream(GalleryChunk)
+    rpc :galleryImport, stream(GalleryChunk), stream(GalleryImportResponse)
     rpc :enrollmentList, EnrollmentListRequest, FaceRecordList
-    rpc :enrollmentDelete, EnrollmentDeleteRequest, FaceRecordList
-    rpc :enrollmentDeleteConditional, EnrollmentDeleteRequest, FaceRecordList
-    rpc :enrollmentTransfer, EnrollmentDeleteRequest, FaceRecordList
+    rpc :trainFromGallery, EnrollmentListRequest, Empty
+    rpc :subjectDelete, EnrollmentDeleteRequest, EnrollmentDeleteResponse
+    rpc :generateMatchDistribution, EnrollmentListRequest, Matrix
+    rpc :matchDistribution, MatchDistributionRequest, stream(MatchDistribution)
+    # Source Management
+    # rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+    #
+    # rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    # rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
+    #
     # Test
     rpc :echo, Matrix, Matrix
   end
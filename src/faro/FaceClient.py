@@ -31,6 +31,7 @@ Created on Jul 18, 2018
 import faro.proto.face_service_pb2_grpc as fs
 import grpc
 import faro.proto.proto_types as pt
+import numpy as np
 import faro.proto.face_service_pb2 as fsd
 import time
 import faro
@@ -222,7 +223,7 @@ class FaceClient(object):
     
     
     def detectExtractEnroll(self,im,enroll_gallery='default',best=False,threshold=None,min_size=None, run_async=False,source=None,
-                            subject_id=None,subject_name=None,frame=None,downsample=0):
+                            subject_id=None,subject_name=None,frame=None,downsample=0,dedup_distance=0.0,dedup_merge=False):
         request = fsd.DetectExtractEnrollRequest()
         request.detect_request.CopyFrom( fsd.DetectRequest() )
         request.extract_request.CopyFrom( fsd.ExtractRequest() )
@@ -234,6 +235,8 @@ class FaceClient(object):
             request.detect_request.image.CopyFrom( pt.image_np2proto(im.asOpenCV2()[:,:,::-1], compression=self.options.compression, quality=self.options.quality))
             
         request.enroll_request.enroll_gallery = enroll_gallery
+        request.enroll_request.enroll_options.dedup_distance = dedup_distance
+        request.enroll_request.enroll_options.dedup_merge = dedup_merge
 
         # Setup the source and subject information.
         request.detect_request.source='UNKNOWN_SOURCE'
@@ -272,7 +275,7 @@ class FaceClient(object):
     
     def detectExtractSearch(self,im,search_gallery='default',max_results=3,search_threshold=None,best=False,
                                 threshold=None,min_size=None, run_async=False,source=None,subject_id=None,
-                                frame=None,downsample=0):
+                                frame=None,downsample=0,nprobe=0,search_filter=None):
         request = fsd.DetectExtractSearchRequest()
         request.detect_request.CopyFrom( fsd.DetectRequest() )
         request.extract_request.CopyFrom( fsd.ExtractRequest() )
@@ -285,6 +288,9 @@ class FaceClient(object):
             
         request.search_request.search_gallery = search_gallery
         request.search_request.max_results=max_results
+        request.search_request.nprobe=nprobe
+        if search_filter is not None:
+            request.search_request.filter.CopyFrom(search_filter)
         
         if search_threshold is None:
             search_threshold = self.match_threshold
@@ -325,9 +331,11 @@ class FaceClient(object):
         return face_records
     
     
-    def enroll(self,faces, enroll_gallery, subject_id=None, subject_name=None, run_async=False,**kwargs):
+    def enroll(self,faces, enroll_gallery, subject_id=None, subject_name=None, run_async=False, dedup_distance=0.0, dedup_merge=False,**kwargs):
         request = fsd.EnrollRequest()
         request.enroll_gallery = enroll_gallery  
+        request.enroll_options.dedup_distance = dedup_distance
+        request.enroll_options.dedup_merge = dedup_merge
         if subject_id is not None:
             for face in faces.face_records:
                 face.subject_id = subject_id
@@ -349,6 +357,28 @@ class FaceClient(object):
         return error
         
         
+    def bulkEnroll(self, faces, enroll_gallery, batch_size=1000):
+        '''
+        Enroll an iterable of face records using a single streaming call.
+
+        The faces are sent in EnrollRequests of batch_size records and the
+        server writes them to the gallery in large batches.
+        '''
+        def requests():
+            request = fsd.EnrollRequest()
+            request.enroll_gallery = enroll_gallery
+            for face in faces:
+                request.records.face_records.add().CopyFrom(face)
+                if len(request.records.face_records) >= batch_size:
+                    yield request
+                    request = fsd.EnrollRequest()
+                    request.enroll_gallery = enroll_gallery
+            if len(request.records.face_records) > 0:
+                yield request
+
+        return self.service_stub.bulkEnroll(requests())
+        
+        
     def galleryList(self):
         '''Get a list of the galleries'''
         
@@ -371,6 +401,62 @@ class FaceClient(object):
         return result
     
 
+    def galleryConfigure(self, gallery_name, index_quantization=''):
+        '''Change the settings of a gallery'''
+        
+        request = fsd.GalleryConfigureRequest()
+        
+        request.gallery_name = gallery_name
+        request.index_quantization = index_quantization
+
+        result = self.service_stub.galleryConfigure(request)
+        
+        return result
+    
+
+    def galleryCompact(self, gallery_name):
+        '''Rewrite a gallery to reclaim the space used by deleted faces'''
+        
+        request = fsd.GalleryCompactRequest()
+        
+        request.gallery_name = gallery_name
+
+        result = self.service_stub.galleryCompact(request)
+        
+        return result
+    
+
+    def galleryExport(self, gallery_name, start_row=0, file_id='', include_views=False, chunk_size=0):
+        '''
+        Return an iterator over the GalleryChunks of a gallery.  To resume an
+        interrupted export pass the file_id and next_row of the last chunk.
+        '''
+        request = fsd.GalleryExportRequest()
+        request.gallery_name = gallery_name
+        request.start_row = start_row
+        request.file_id = file_id
+        request.chunk_size = chunk_size
+        request.include_views = include_views
+
+        return self.service_stub.galleryExport(request)
+
+
+    def galleryImport(self, chunks, gallery_name=None):
+        '''
+        Import an iterable of GalleryChunks, for example from galleryExport on
+        another service.  Returns an iterator over the acknowledgement of each
+        chunk.  If gallery_name is given the faces are enrolled in that gallery
+        instead of the gallery named in the chunks.
+        '''
+        def requests():
+            for chunk in chunks:
+                if gallery_name is not None:
+                    chunk.gallery_name = gallery_name
+                yield chunk
+
+        return self.service_stub.galleryImport(requests())
+
+
     def faceList(self,gallery_name):
         '''Get a list faces in a gallery'''
         
@@ -392,12 +478,15 @@ class FaceClient(object):
         return result
 
 
-    def search(self, faces, search_gallery, max_results=3, search_threshold=None, run_async=False, **kwargs):
+    def search(self, faces, search_gallery, max_results=3, search_threshold=None, run_async=False, nprobe=0, search_filter=None, **kwargs):
         request = fsd.SearchRequest()
         
         request.probes.CopyFrom(faces)
         request.search_gallery = search_gallery
         request.max_results=max_results
+        request.nprobe=nprobe
+        if search_filter is not None:
+            request.filter.CopyFrom(search_filter)
         
         if search_threshold is not None:
             request.threshold=search_threshold
@@ -429,11 +518,63 @@ class FaceClient(object):
         dist_mat = self.service_stub.score(request,None)
         return pt.matrix_proto2np(dist_mat)
 
+    def scoreStream(self,probe,gallery):
+        '''
+        Score the probes against the gallery on the server and yield
+        (probe_start, gallery_start, scores) for each block of the distance
+        matrix as it arrives.
+        '''
+        request = fsd.ScoreRequest()
+        for face_rec in probe:
+            request.template_probes.templates.add().CopyFrom(face_rec.template)
+        for face_rec in gallery:
+            request.template_gallery.templates.add().CopyFrom(face_rec.template)
+
+        for block in self.service_stub.scoreStream(request,None):
+            scores = np.frombuffer(block.scores,dtype='<f4').reshape(block.probe_count,block.gallery_count)
+            yield block.probe_start, block.gallery_start, scores
+
     def generateMatchDistribution(self,gallery_name):
         request = fsd.EnrollmentListRequest()
         request.gallery_name = gallery_name
         dist_mat = self.service_stub.generateMatchDistribution(request)
         return pt.matrix_proto2np(dist_mat)
+
+    def matchDistribution(self,gallery_name,bins=0,min_score=0.0,max_score=0.0,include_scores=False):
+        '''
+        Compare every pair of faces in a gallery and return a MatchDistribution
+        with the genuine and impostor histograms and the false accept and
+        false reject rates.  The histogram range is estimated by the server
+        unless min_score and max_score are given.
+
+        Returns (distribution, dist_mat).  dist_mat is the symmetric
+        (faces, faces) distance matrix assembled from the streamed blocks if
+        include_scores is true and None otherwise.
+        '''
+        request = fsd.MatchDistributionRequest()
+        request.gallery_name = gallery_name
+        request.bins = bins
+        request.min_score = min_score
+        request.max_score = max_score
+        request.include_scores = include_scores
+
+        blocks = []
+        for message in self.service_stub.matchDistribution(request,None):
+            if message.HasField('block'):
+                block = message.block
+                scores = np.frombuffer(block.scores,dtype='<f4').reshape(block.probe_count,block.gallery_count)
+                blocks.append((block.probe_start,block.gallery_start,scores))
+            else:
+                distribution = message
+
+        dist_mat = None
+        if include_scores:
+            dist_mat = np.zeros((distribution.face_count,distribution.face_count),dtype=np.float32)
+            for probe_start,gallery_start,scores in blocks:
+                dist_mat[probe_start:probe_start+scores.shape[0],gallery_start:gallery_start+scores.shape[1]] = scores
+                dist_mat[gallery_start:gallery_start+scores.shape[1],probe_start:probe_start+scores.shape[0]] = scores.T
+
+        return distribution, dist_mat
         
     def echo(self,mat):
         '''
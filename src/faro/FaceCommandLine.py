@@ -12,7 +12,7 @@ import pyvision as pv
 import cv2
 import faro.proto.proto_types as pt
 import csv
-from faro.proto.face_service_pb2 import FaceRecordList,GalleryListRequest
+from faro.proto.face_service_pb2 import FaceRecordList,GalleryListRequest,SearchFilter
 import time
 import traceback
 from faro.command_line import addConnectionOptions, connectToFaroClient
@@ -116,6 +116,12 @@ def addEnrollOptions(parser):
     enroll_group.add_option("--subject-id", type="str", dest="subject_id", default='unknown',
                             help="Enroll detected faces into a gallery.")
 
+    enroll_group.add_option("--dedup-distance", type="float", dest="dedup_distance", default=0.0,
+                            help="Skip faces within this distance of a face already enrolled for the subject. 0 disables. default=0.0")
+
+    enroll_group.add_option("--dedup-merge", action="store_true", dest="dedup_merge", default=False,
+                            help="Average near duplicates into the face they match instead of skipping them.")
+
     parser.add_option_group(enroll_group)
 
 
@@ -168,6 +174,24 @@ def addSearchOptions(parser):
     search_group.add_option("--max-results", type="int", dest="max_results", default=3,
                             help="Set the maximum number of search results returned for each face.")
 
+    search_group.add_option("--nprobe", type="int", dest="nprobe", default=0,
+                            help="Inverted lists searched for galleries with approximate search. 0 uses the server default.")
+
+    search_group.add_option("--filter-subject", type="str", action="append", dest="filter_subjects", default=[],
+                            help="Only match gallery faces of this subject.  May be repeated.")
+
+    search_group.add_option("--filter-source", type="str", action="append", dest="filter_sources", default=[],
+                            help="Only match gallery faces from this source.  May be repeated.")
+
+    search_group.add_option("--filter-attribute", type="str", dest="filter_attributes", default=None,
+                            help="A comma seperated list of attributes the gallery faces must have example: 'Male>0.5,glasses=none'")
+
+    search_group.add_option("--min-collection-date", type="float", dest="min_collection_date", default=0.0,
+                            help="Only match gallery faces collected at or after this time. 0 disables.")
+
+    search_group.add_option("--max-collection-date", type="float", dest="max_collection_date", default=0.0,
+                            help="Only match gallery faces collected at or before this time. 0 disables.")
+
     parser.add_option_group(search_group)
 
 
@@ -784,6 +808,45 @@ def processAttributeFilter(face, options):
     return satisfied == len(terms)
 
 
+def searchFilter(options):
+    ''' Build the SearchFilter for the search options or return None if no filter is set. '''
+    search_filter = SearchFilter()
+    search_filter.subject_ids.extend(options.filter_subjects)
+    search_filter.sources.extend(options.filter_sources)
+    search_filter.min_collection_date = options.min_collection_date
+    search_filter.max_collection_date = options.max_collection_date
+
+    # Terms for the same key are combined into one AttributeFilter
+    attributes = {}
+    terms = [] if options.filter_attributes is None else options.filter_attributes.split(',')
+    for each in terms:
+        for op in '=<>':
+            if op in each:
+                key, value = each.split(op,1)
+                break
+        else:
+            raise ValueError("Could not parse term '%s'." % each)
+
+        values, low, high = attributes.get(key,([],None,None))
+        if op == '=':
+            values.append(value)
+        elif op == '>':
+            low = float(value)
+        else:
+            high = float(value)
+        attributes[key] = values, low, high
+
+    for key,(values,low,high) in attributes.items():
+        attribute = search_filter.attributes.add(key=key,values=values)
+        if low is not None or high is not None:
+            attribute.min_value = float('-inf') if low is None else low
+            attribute.max_value = float('inf') if high is None else high
+
+    if search_filter.ByteSize() == 0:
+        return None
+    return search_filter
+
+
 DETECTIONS_FILE = None
 DETECTIONS_CSV = None
 ATTRIBUTES_FILE = None
@@ -1519,7 +1582,8 @@ def enroll():
         results = face_client.detectExtractEnroll(im, enroll_gallery=options.enroll_gallery, best=options.best,
                                                   threshold=options.detect_thresh, min_size=options.min_size,
                                                   run_async=True, source=filename, frame=-1,
-                                                  subject_name=options.subject_name, subject_id=options.subject_id)
+                                                  subject_name=options.subject_name, subject_id=options.subject_id,
+                                                  dedup_distance=options.dedup_distance, dedup_merge=options.dedup_merge)
 
         detect_queue.append([filename, im, results, options])
         enroll_queue.append([im, results, options])
@@ -1589,7 +1653,8 @@ def enroll_csv():
         results = face_client.detectExtractEnroll(im, enroll_gallery=options.enroll_gallery, best=options.best,
                                                   threshold=options.detect_thresh, min_size=options.min_size,
                                                   run_async=True, source=filename, frame=-1,
-                                                  subject_name=name, subject_id=subject_id)
+                                                  subject_name=name, subject_id=subject_id,
+                                                  dedup_distance=options.dedup_distance, dedup_merge=options.dedup_merge)
 
         detect_queue.append([filename, im, results, options])
         enroll_queue.append([im, results, options])
@@ -1671,7 +1736,8 @@ def search():
         results = face_client.detectExtractSearch(im, search_gallery=options.search_gallery, best=options.best,
                                                   threshold=options.detect_thresh, min_size=options.min_size,
                                                   run_async=True, source=filename, frame=-1,
-                                                  search_threshold=options.search_threshold, max_results=options.max_results)
+                                                  search_threshold=options.search_threshold, max_results=options.max_results,
+                                                  nprobe=options.nprobe, search_filter=searchFilter(options))
 
         detect_queue.append([filename,im, results, options])
         search_queue.append([filename,im, results, options])
@@ -1899,6 +1965,11 @@ COMMANDS = {
     'sdelete' : ['Delete a subjects in a gallery.',sdelete],
     'glist' : ['List the galleries on the service.',command_line.glist],
     'gdelete' : ['Delete a gallery.',command_line.gdelete],
+    'gconfig' : ['Change the settings of a gallery such as the index quantization.',command_line.gconfig],
+    'gcompact' : ['Reclaim the disk space used by deleted faces in a gallery.',command_line.gcompact],
+    'gexport' : ['Export a gallery to a file for transfer to another service.',command_line.gexport],
+    'gimport' : ['Import a gallery export file.',command_line.gimport],
+    'gmigrate' : ['Convert legacy gallery files to the columnar layout.',command_line.gmigrate],
     'search' : ['Search images for faces in a gallery.',search],
     'test' : ['Process a probe and gallery directory and produce a distance matrix.',test],
     'fuse' : ['Fuse scored results from different algorithms',fuse],
@@ -26,21 +26,97 @@ Created on Feb 14, 2019
 @author: bolme
 '''
 
-import numpy as np
-import multiprocessing as mp
 import numpy as np
 import faro
 import time
 import faro.proto.face_service_pb2 as fsd
-import scipy.spatial as spat 
-import os         
+import os
+import threading
+import atexit
+import contextlib
+import shutil
+import itertools
 
 
 import faro.proto.proto_types as pt
-from faro.proto.face_service_pb2 import DetectRequest,DetectExtractRequest,ExtractRequest,FaceRecordList,GalleryList,GalleryInfo,TemplateList,Empty,FaceRecord
+from faro.proto.face_service_pb2 import FaceRecordList,TemplateList,FaceRecord,GalleryChunk
+from faro.GalleryStore import isLegacyGallery, migrateGallery
+from faro.GalleryBackend import BACKEND_EXTENSIONS, backendClass, backendOf
+from faro.GalleryIndex import SearchIndex, readIndexMeta, deleteIndex, dequantize, QUANTIZATIONS
+from faro.GalleryLog import GalleryLog, ENROLL, DELETE, IMPORT
+from faro.GalleryManifest import readManifest, writeManifest, fileStamp
+from faro.GalleryCache import GalleryCache
+from faro.GalleryFilters import FilterColumns, isFiltered
+from faro.FaceScoring import scoreMatrix
 
 # TODO: Remove this and make it a local variable
-STORAGE = {}
+STORAGE = GalleryCache() # Open gallery stores in LRU order
+LOGS = {}       # Write-ahead logs of the open galleries
+MANIFEST = {}   # Manifest entries for every gallery, open or not
+MANIFEST_LOCK = threading.RLock() # Guards MANIFEST and the manifest file
+OPEN_LOCK = threading.RLock()     # Guards opening, creating and deleting galleries
+TEMPLATES = {}  # Parsed (version, stamp, face ids, subject ids, templates, filters) of galleries scored without an index
+TEMPLATE_STAMPS = itertools.count(1) # Source of the stamps that identify each parse of a gallery
+
+CHECKPOINT_INTERVAL = 10.0 # Seconds between syncing galleries and truncating their logs
+
+# Manifest fields returned by galleryStats and their defaults for galleries that have not been opened yet
+GALLERY_STATS = (('faces',0),('subjects',0),('dim',0),('bytes',0),('index','none'),('modified',0.0))
+
+OPEN_GALLERY_BYTES = 8*1024*1024 # Estimated fixed memory cost of an open gallery for the cache budget
+FACE_KEY_BYTES = 200             # Estimated memory used by the key mappings for each face
+
+GALLERY_COMPACT_BLOCK_ROWS = 65536 # Rows copied per block when a gallery file is compacted
+
+TEMPLATE_BLOCK_ROWS = 16384 # Gallery rows read at a time when the templates are parsed for a search without an index
+
+EXPORT_CHUNK_ROWS = 4096     # Gallery rows per exported chunk
+EXPORT_VIEW_CHUNK_ROWS = 256 # Gallery rows per exported chunk when the views are included
+
+INDEX_COMPACT_INTERVAL = 60.0 # Seconds between checks for indexes that need compaction
+INDEX_COMPACT_RATIO = 0.25    # Compact an index when this fraction of its rows are deleted
+
+RESCORE_FACTOR = 4       # Candidates rescored with float32 templates for each requested result
+RESCORE_MIN = 100        # Minimum number of candidates rescored for each probe
+COARSE_BLOCK_ROWS = 16384 # Quantized index rows converted to float32 at a time
+FILTER_SUBSET_RATIO = 0.5 # Copy out and score only the filtered rows when at most this fraction of the index passes
+
+def selectMatches(scores, max_results, threshold, live=None):
+    '''
+    Select the best matches in each row of a (probes, gallery) score matrix.
+
+    Returns an array of gallery columns for each probe in increasing score
+    order.  Scores above the threshold and columns where live is false are
+    dropped, and at most max_results columns are kept if max_results is
+    positive.
+    '''
+    scores = np.asarray(scores)
+    valid = scores <= threshold
+    if live is not None:
+        valid &= live
+
+    n_probes, n_gallery = scores.shape
+    if max_results <= 0 or max_results >= n_gallery:
+        return [columns[np.argsort(row[columns],kind='stable')] for row,columns in zip(scores,(np.flatnonzero(each) for each in valid))]
+
+    # Partition out the best k columns of every probe at once and only sort those
+    masked = np.where(valid,scores,np.inf)
+    top = np.argpartition(masked,max_results-1,axis=1)[:,:max_results]
+    order = np.argsort(np.take_along_axis(masked,top,axis=1),axis=1,kind='stable')
+    top = np.take_along_axis(top,order,axis=1)
+    return [columns[keep[columns]] for columns,keep in zip(top,valid)]
+
+
+def _setMergedFaces(face, template, count):
+    ''' Store a merged template and the number of faces averaged into it. '''
+    face.template.data.CopyFrom(pt.vector_np2proto(template.astype(np.float32)))
+    for each in face.metadata:
+        if each.key == 'merged_faces':
+            each.ivalue = count
+            return
+    face.metadata.add(key='merged_faces',ivalue=count)
+
+
 class GalleryWorker(object):
 
     def __init__(self,options):
@@ -48,127 +124,537 @@ class GalleryWorker(object):
         if not os.path.isdir(self.gallery_storage):
             print( 'GALLERY WORKER: Creating directory for gallery storage:',self.gallery_storage)
             os.makedirs(self.gallery_storage)
+
+        STORAGE.configure(options.gallery_cache_size,options.gallery_cache_mb)
+        self.gallery_backend = options.gallery_backend # Backend for new galleries
+        self.commit_interval = options.log_commit_ms/1000.0 # Group commit window of the logs
+        self.commit_records = options.log_commit_records
+        self.stopping = threading.Event() # Stops the background threads when the worker is closed
             
         self.loadGalleries()
+        atexit.register(self.close)
+
+        self.checkpoint_thread = threading.Thread(target=self._checkpointGalleries,daemon=True)
+        self.checkpoint_thread.start()
 
 
     def loadGalleries(self):
-        '''Load gallery information into memory on startup.'''
-        import h5py
-        global STORAGE
+        '''
+        Load gallery information into memory on startup.  Galleries are read
+        from the manifest and the files are opened on first use.  Galleries
+        that are missing from the manifest, were not closed cleanly, or have
+        changed since the manifest was written are opened now to refresh
+        their entries and closed again.
+        '''
+        global MANIFEST
         
         galleries = os.listdir(self.gallery_storage)
         
-        galleries = list(filter(lambda x: x.endswith('.h5'), galleries))
+        galleries = [each for each in sorted(galleries) if backendOf(each) is not None]
+
+        manifest = readManifest(self.manifestPath())
         
-        print("Loading %d galleries: %s"%(len(galleries),galleries))
+        print("Loading %d galleries."%(len(galleries),))
+        refreshed = 0
         for each in galleries:
-            gallery_name = each[:-3]
-            path = os.path.join(self.gallery_storage,gallery_name+'.h5')
-            STORAGE[gallery_name] = h5py.File(path,'a') # Open in read/write mode
-            face_count = len(STORAGE[gallery_name]['faces'])
-
-            print("   * Loaded %s with %d faces."%(gallery_name,face_count))
+            backend = backendOf(each)
+            gallery_name = each[:-len(BACKEND_EXTENSIONS[backend])]
+            if gallery_name in MANIFEST:
+                print("Warning: skipping %s because gallery '%s' is already stored in another file."%(each,gallery_name))
+                continue
+            entry = manifest.get(gallery_name)
+
+            wal_path = self.galleryPath(gallery_name,'.wal')
+            if entry is None or entry.get('open',True) or entry.get('stamp') != fileStamp(os.path.join(self.gallery_storage,each)) or \
+               (os.path.exists(wal_path) and os.path.getsize(wal_path) > 0) or 'subjects' not in entry or \
+               entry.get('backend','hdf5') != backend:
+                # Keep the gallery settings from the old entry
+                MANIFEST[gallery_name] = dict(entry or {})
+                MANIFEST[gallery_name]['backend'] = backend
+                self.getStore(gallery_name)
+                self.closeGallery(gallery_name)
+                refreshed += 1
+                print("   * Loaded %s with %d faces."%(gallery_name,self.size(gallery_name)))
+            else:
+                MANIFEST[gallery_name] = entry
+                entry['backend'] = backend
             
-        print('Done Loading Galleries.')
+        self.saveManifest()
+        print('Done Loading Galleries. %d from the manifest and %d refreshed.'%(len(galleries)-refreshed,refreshed))
+
+
+    def manifestPath(self):
+        return os.path.join(self.gallery_storage,'manifest.json')
+
+
+    def updateManifest(self, gallery_name):
+        ''' Refresh the manifest entry of an open gallery. '''
+        store = STORAGE[gallery_name]
+        with MANIFEST_LOCK:
+            entry = dict(MANIFEST.get(gallery_name,{}))
+            if 'modified' not in entry:
+                entry['modified'] = os.path.getmtime(store.path)
+            elif entry.get('version') != store.version:
+                entry['modified'] = time.time()
+            entry['faces'] = store.size()
+            entry['subjects'] = store.subjectCount()
+            entry['dim'] = store.dim
+            entry['bytes'] = store.fileBytes()
+            entry['version'] = store.version
+            entry['index'] = self.indexState(gallery_name)
+            entry['open'] = True
+            MANIFEST[gallery_name] = entry
+        STORAGE.setSize(gallery_name,self.galleryBytes(gallery_name))
+
+
+    def saveManifest(self):
+        with MANIFEST_LOCK:
+            writeManifest(self.manifestPath(),MANIFEST)
+
+
+
+    def galleryBackend(self, gallery_name):
+        ''' Return the name of the storage backend of a gallery. '''
+        return MANIFEST.get(gallery_name,{}).get('backend','hdf5')
+
+
+    def galleryPath(self, gallery_name, extension=None):
+        ''' Return the path of a gallery file in the storage directory.  The default is the gallery file of its backend. '''
+        if extension is None:
+            extension = BACKEND_EXTENSIONS[self.galleryBackend(gallery_name)]
+        return os.path.join(self.gallery_storage,gallery_name+extension)
 
 
 
     def galleryNames(self):
-        return list(STORAGE)
+        return list(MANIFEST)
 
 
 
     def size(self, gallery_name):
         ''' Return the size a gallery. '''
-        return len(STORAGE[gallery_name]['faces'])
+        if gallery_name in STORAGE:
+            return STORAGE[gallery_name].size()
+        return MANIFEST[gallery_name]['faces']
+
+
+    def galleryStats(self):
+        '''
+        Return the face count, subject count, template length, bytes on disk,
+        index state and modification time of every gallery.  The statistics
+        are kept in the manifest as the galleries change so no gallery files
+        are read.
+        '''
+        with MANIFEST_LOCK:
+            return {gallery_name : {key : entry.get(key,default) for key,default in GALLERY_STATS}
+                    for gallery_name,entry in MANIFEST.items()}
+
+
+    def getStore(self, gallery_name):
+        ''' Return the store for an existing gallery, opening the gallery file on first use. '''
+        global STORAGE
 
+        store = STORAGE.hit(gallery_name)
+        if store is not None:
+            return store
+
+        with OPEN_LOCK:
+            if gallery_name not in MANIFEST:
+                raise ValueError("Unknown gallery: "+gallery_name)
+            if gallery_name not in STORAGE:
+                STORAGE.miss()
+                path = self.galleryPath(gallery_name)
+                backend = self.galleryBackend(gallery_name)
+                if backend == 'hdf5' and isLegacyGallery(path):
+                    print("   * Converting %s to the columnar gallery layout."%(gallery_name,))
+                    migrateGallery(path,blob_dir=self.galleryPath(gallery_name,'.blobs'))
+                STORAGE.add(gallery_name,backendClass(backend)(path,blob_dir=self.galleryPath(gallery_name,'.blobs'))) # Open in read/write mode
+                self.openLog(gallery_name)
+                if self.isSearchable():
+                    self.generateIndex(gallery_name)
+
+                # Mark the entry as open so it is refreshed if the server stops
+                # without closing the gallery.
+                self.updateManifest(gallery_name)
+                self.saveManifest()
+                STORAGE.opened(gallery_name)
+
+                self.evictGalleries(keep=[gallery_name])
+
+            return STORAGE[gallery_name]
+
+
+    @contextlib.contextmanager
+    def useGallery(self, gallery_name, create=False):
+        ''' Open a gallery and pin it in the cache while the block runs. '''
+        # Open galleries are pinned without taking the open lock
+        store = STORAGE.acquire(gallery_name)
+        while store is None:
+            # Wait while the gallery file is being replaced by compactGallery
+            STORAGE.waitWhileDraining(gallery_name)
+            with OPEN_LOCK:
+                if STORAGE.isDraining(gallery_name):
+                    continue
+                if create:
+                    store = self.openGallery(gallery_name)
+                else:
+                    store = self.getStore(gallery_name)
+                STORAGE.pin(gallery_name)
+        try:
+            yield store
+        finally:
+            STORAGE.unpin(gallery_name)
+
+
+    def galleryBytes(self, gallery_name):
+        ''' Estimate the memory used by an open gallery. '''
+        store = STORAGE[gallery_name]
+        return OPEN_GALLERY_BYTES + 4*store.count*store.dim + FACE_KEY_BYTES*store.size()
 
 
+    def evictGalleries(self, keep=()):
+        ''' Close the least recently used galleries until the cache is within its budget. '''
+        with OPEN_LOCK:
+            for gallery_name in STORAGE.evictionCandidates(keep):
+                # Skip galleries pinned by a request since the candidates were chosen
+                if not STORAGE.tryDrain(gallery_name):
+                    continue
+                try:
+                    self.closeGallery(gallery_name)
+                    STORAGE.evicted(gallery_name)
+                finally:
+                    STORAGE.release(gallery_name)
+
+
+    def cacheStats(self):
+        ''' Return the hit, miss, and eviction counters of the gallery cache. '''
+        return STORAGE.stats()
+
+
+    def closeGallery(self, gallery_name):
+        ''' Write all changes to a gallery file and close it.  The gallery can be reopened with getStore. '''
+        global STORAGE, LOGS
+
+        with OPEN_LOCK:
+            if gallery_name not in STORAGE:
+                return
+            store = STORAGE[gallery_name]
+            # The commit thread needs the store lock to finish applying
+            LOGS.pop(gallery_name).close(store.sync)
+            with store.lock:
+                self.updateManifest(gallery_name)
+                self.clearIndex(gallery_name)
+                TEMPLATES.pop(gallery_name,None)
+                store.close()
+                del STORAGE[gallery_name]
+
+            with MANIFEST_LOCK:
+                MANIFEST[gallery_name]['open'] = False
+                MANIFEST[gallery_name]['stamp'] = fileStamp(store.path)
+
+
+    def close(self):
+        ''' Close every open gallery and save the manifest. '''
+        self.stopping.set()
+        for gallery_name in list(STORAGE):
+            self.closeGallery(gallery_name)
+        self.saveManifest()
+
+
+    def openGallery(self, gallery_name):
+        ''' Return the store for a gallery, creating the gallery if needed. '''
+
+        with OPEN_LOCK:
+            if gallery_name not in MANIFEST:
+                MANIFEST[gallery_name] = {'backend' : self.gallery_backend}
+                path = self.galleryPath(gallery_name)
+                print('adding new gallery at ', path)
+                backendClass(self.gallery_backend)(path).close()
+
+        return self.getStore(gallery_name)
+
+
+    def openLog(self, gallery_name):
+        ''' Open the write-ahead log for a gallery and apply any entries missing from the gallery file. '''
+        global LOGS
+
+        store = STORAGE[gallery_name]
+        log = GalleryLog(self.galleryPath(gallery_name,'.wal'),
+                         lambda entries: self.applyLogEntries(gallery_name,entries),
+                         store.log_seq,self.commit_interval,self.commit_records)
+
+        replayed = log.recover(store.log_seq)
+        if replayed > 0:
+            print("   * Replayed %d log entries for %s."%(replayed,gallery_name))
+
+        LOGS[gallery_name] = log
+
+
+    def applyLogEntries(self, gallery_name, entries):
+        ''' Apply a group of logged mutations to the gallery with a single flush. '''
+        store = STORAGE[gallery_name]
+
+        results = []
+        with store.lock:
+            for seq,op,faces,templates in entries:
+                try:
+                    previous_version = store.version
+                    if op in (ENROLL,IMPORT):
+                        rows, replaced_rows = store.append(faces,templates)
+                        self.updateIndex(gallery_name, rows, replaced_rows, previous_version, faces)
+                        results.append((len(rows),len(replaced_rows)))
+                    elif op == DELETE:
+                        rows = [store.row(face.gallery_key) for face in faces if face.gallery_key in store.keys]
+                        delete_count = store.delete(rows)
+                        self.updateIndex(gallery_name, [], rows, previous_version)
+                        results.append(delete_count)
+                    else:
+                        raise ValueError("Unknown log operation: %s"%(op,))
+                except Exception as e:
+                    results.append(e)
+
+            store.flush(entries[-1][0])
+
+            self.updateManifest(gallery_name)
+
+        return results
+
+
+    def checkpoint(self, gallery_name):
+        ''' Sync the gallery file to disk and discard the log entries it now contains. '''
+        with OPEN_LOCK:
+            store = STORAGE.get(gallery_name)
+            log = LOGS.get(gallery_name)
+        if store is None or log is None:
+            return
+
+        # The log takes its file lock before the store lock when it applies
+        # entries, so the store lock can not be held here.
+        if not log.truncate(store.sync):
+            # The gallery was closed
+            return
+
+        with store.lock:
+            if LOGS.get(gallery_name) is log:
+                self.updateManifest(gallery_name)
+
+
+    def _checkpointGalleries(self):
+        ''' Periodically truncate the logs and save the manifest in the background. '''
+        while not self.stopping.wait(CHECKPOINT_INTERVAL):
+            for gallery_name in list(LOGS):
+                try:
+                    self.checkpoint(gallery_name)
+                except Exception as e:
+                    print("   Checkpoint Failed: %s %s"%(gallery_name,e))
+            try:
+                self.saveManifest()
+            except Exception as e:
+                print("   Manifest Save Failed: %s"%(e,))
 
 
     def addFaceToGallery(self, gallery_name, gallery_key, face):
         ''' Enrolls the faces in the gallery. '''
-        import h5py
+        return self.addFacesToGallery(gallery_name, [face])
 
-        global STORAGE
 
+    def addFacesToGallery(self, gallery_name, faces):
+        ''' Enrolls a batch of faces in the gallery with a single log entry. '''
+        for face in faces:
+            face.gallery_key = faro.generateFaceId(face)
 
-        replaced = 0
-        print('Gallery name:' , gallery_name)
-        print(list(STORAGE.keys()))
-        if gallery_name not in STORAGE:
-            path = os.path.join(self.gallery_storage,gallery_name+'.h5')
-            print('adding new gallery at ', path)
-            STORAGE[gallery_name] = h5py.File(path,'a')
-            STORAGE[gallery_name].create_group('faces')
-            STORAGE[gallery_name].create_group('sources')
-            STORAGE[gallery_name].create_group('detections')
-            STORAGE[gallery_name].create_group('tags')
-            STORAGE[gallery_name].create_group('logs')
-
-        enrolled = 0
-
-        face_id = faro.generateFaceId(face)
-        face.gallery_key = face_id
-
-        enrolled += 1 
-
-        if face_id in STORAGE[gallery_name]['faces']:
-            del STORAGE[gallery_name]['faces'][face_id] # delete so it can be replaced.
-            replaced += 1
-        STORAGE[gallery_name]['faces'][face_id] = np.bytes_(face.SerializeToString())
-
-        template = pt.vector_proto2np(face.template.data)
-        temp_length = template.shape[0]
-        print('template shape: ', template.shape)
-        if 'templates' not in STORAGE[gallery_name]:
-            # Create an empty dataset
-            f = STORAGE[gallery_name]
-            dset = f.create_dataset('templates',data=np.zeros((0,temp_length)), maxshape=(None,temp_length),dtype=np.float32)
-
-        if 'facelist' not in STORAGE[gallery_name]:
-            # Create an empty dataset
-            f = STORAGE[gallery_name]
-            dt = h5py.special_dtype(vlen=str)
-            dset = f.create_dataset('facelist',(0,), maxshape=(None,),dtype=dt)
-
-        # Append to the end
-        dset = STORAGE[gallery_name]['templates']
-        size = dset.shape
-        print('dataset size 2:', size)
-        dset.resize((size[0]+1,size[1]))
-        dset[-1,:] = template
-
-        dset = STORAGE[gallery_name]['facelist']
-        size = dset.shape
-        dset.resize((size[0]+1,))
-        dset[-1] = face_id
-
-        STORAGE[gallery_name].flush()
-        
-        self.clearIndex(gallery_name)
+        with self.useGallery(gallery_name, create=True):
+            log = LOGS[gallery_name]
 
+            # Blocks until the faces are durable and applied.  Concurrent
+            # enrolls share the same sync and flush.
+            seq = log.append(ENROLL, faces)
+            enrolled, replaced = log.wait(seq)
 
         return enrolled, replaced
 
 
 
-    def deleteGallery(self, gallery_name):
-        ''' Delete a gallery. '''
+    def compactGallery(self, gallery_name):
+        '''
+        Rewrite a gallery into a new densely packed file and swap it in.
+
+        The live rows are copied while the gallery continues to serve
+        requests.  Then new requests are held back, the rows that changed
+        during the copy are applied to the new file, and the new file
+        atomically replaces the old one.  View blobs that are no longer used
+        are removed.  Returns a dict with the face count, rows removed, bytes
+        before and after, and the time taken.
+        '''
+        start = time.time()
+
+        with self.useGallery(gallery_name) as store:
+            tmp_path = self.galleryPath(gallery_name,'.compacting')
+            if os.path.exists(tmp_path):
+                store.removeFiles(tmp_path)
+
+            bytes_before = store.fileBytes()
+
+            with store.lock:
+                count = store.count
+                rows = store.liveRows()
+
+            # Copy without holding the lock so enrolls and searches continue
+            compacted = backendClass(self.galleryBackend(gallery_name))(tmp_path,'w')
+            try:
+                for i in range(0,len(rows),GALLERY_COMPACT_BLOCK_ROWS):
+                    compacted.copyRows(store,rows[i:i+GALLERY_COMPACT_BLOCK_ROWS])
+
+                STORAGE.drain(gallery_name,pins=1)
+                try:
+                    with store.lock:
+                        # Apply the deletes and enrolls that happened during the copy
+                        live = store.isLive(rows)
+                        compacted.delete([i for i in range(len(rows)) if not live[i]])
+                        tail = store.liveRows()
+                        compacted.copyRows(store,tail[tail >= count])
+
+                        rows_removed = store.count - compacted.count
+                        compacted.setVersion(store.version + 1)
+                        compacted.flush(store.log_seq)
+                        compacted.sync()
+                        compacted.close()
+
+                        store.replaceFile(tmp_path)
+                        if store.blobs is not None:
+                            store.blobs.collect(set(store.viewKeys(store.liveRows())))
+
+                        # Row ids changed so the index is rebuilt
+                        self.clearIndex(gallery_name)
+                        if self.isSearchable():
+                            self.generateIndex(gallery_name)
+                        self.updateManifest(gallery_name)
+                finally:
+                    STORAGE.release(gallery_name)
+            finally:
+                if os.path.exists(tmp_path):
+                    compacted.close()
+                    store.removeFiles(tmp_path)
+
+            self.saveManifest()
+            bytes_after = store.fileBytes()
+            face_count = store.size()
+
+        stop = time.time()
+        print("   Gallery Compacted: %s removed %d rows and %d bytes in %0.3fs"%(gallery_name,rows_removed,bytes_before-bytes_after,stop-start))
+
+        return {
+            'face_count' : face_count,
+            'rows_removed' : rows_removed,
+            'bytes_before' : bytes_before,
+            'bytes_after' : bytes_after,
+            'compact_time' : stop-start,
+            }
+
+
+    def exportGallery(self, gallery_name, start_row=0, file_id='', chunk_rows=0, views=False):
+        '''
+        Generate GalleryChunks holding the live faces of a gallery.
+
+        Each chunk covers a range of gallery rows and holds the templates as
+        one float32 matrix and the rest of the faces as records without
+        template data.  An interrupted export can be resumed by passing the
+        file_id and next_row of the last chunk that was received.  Faces
+        enrolled after the export starts are not included.
+        '''
+        if chunk_rows <= 0:
+            chunk_rows = EXPORT_VIEW_CHUNK_ROWS if views else EXPORT_CHUNK_ROWS
+
+        with self.useGallery(gallery_name) as store:
+            if file_id and file_id != store.file_id:
+                raise ValueError("Gallery '%s' was compacted since the export started. Restart the export from the beginning."%(gallery_name,))
+            file_id = store.file_id
+            row_count = store.count
+
+        row = start_row
+        while row < row_count:
+            # The gallery is only pinned while a chunk is read
+            with self.useGallery(gallery_name) as store:
+                if store.file_id != file_id:
+                    raise ValueError("Gallery '%s' was compacted during the export."%(gallery_name,))
+                next_row = min(row+chunk_rows,row_count)
+                rows, faces, templates = store.readBlock(row,next_row,views)
+
+            chunk = GalleryChunk()
+            chunk.gallery_name = gallery_name
+            chunk.file_id = file_id
+            chunk.start_row = row
+            chunk.next_row = next_row
+            chunk.row_count = row_count
+            chunk.dim = templates.shape[1]
+            chunk.templates = np.ascontiguousarray(templates,dtype='<f4').tobytes()
+            chunk.records.face_records.extend(faces)
+            yield chunk
+
+            row = next_row
+
+
+    def importChunk(self, gallery_name, chunk):
+        ''' Enroll the faces in an exported GalleryChunk.  Returns the number of faces enrolled and replaced. '''
+        faces = list(chunk.records.face_records)
+        if len(faces) == 0:
+            return 0, 0
+
+        for face in faces:
+            face.gallery_key = faro.generateFaceId(face)
+        templates = np.frombuffer(chunk.templates,dtype='<f4').reshape(len(faces),chunk.dim)
+
+        with self.useGallery(gallery_name, create=True):
+            # The templates are logged and stored as a matrix without
+            # converting them to and from the records.
+            log = LOGS[gallery_name]
+            seq = log.append(IMPORT, faces, templates)
+            enrolled, replaced = log.wait(seq)
 
-        if gallery_name not in STORAGE:
-            raise ValueError("Gallery '" + gallery_name +"' not found.")
+        return enrolled, replaced
 
-        deleted_faces = len(STORAGE[gallery_name]['faces'])
 
-        # Close and remove the file
-        STORAGE[gallery_name].close()
-        del STORAGE[gallery_name]
+    def deleteGallery(self, gallery_name):
+        '''
+        Delete a gallery.  New requests for the gallery are held back and the
+        running ones finish before the file is closed and removed.
+        '''
+
+        if gallery_name not in MANIFEST:
+            raise ValueError("Gallery '" + gallery_name +"' not found.")
 
-        # Delete the file from disk
-        path = os.path.join(self.gallery_storage,gallery_name+'.h5')
-        os.remove(path)
+        STORAGE.drain(gallery_name)
+        try:
+            # Close the file.  Holding OPEN_LOCK keeps the gallery from being
+            # evicted or reopened in the meantime.
+            with OPEN_LOCK:
+                if gallery_name not in MANIFEST:
+                    raise ValueError("Gallery '" + gallery_name +"' not found.")
+                deleted_faces = self.size(gallery_name)
+                path = self.galleryPath(gallery_name)
+                backend = self.galleryBackend(gallery_name)
+
+                self.clearIndex(gallery_name)
+                store = STORAGE.get(gallery_name)
+                if store is not None:
+                    LOGS.pop(gallery_name).close()
+                    with store.lock:
+                        TEMPLATES.pop(gallery_name,None)
+                        store.close()
+                        del STORAGE[gallery_name]
+                with MANIFEST_LOCK:
+                    del MANIFEST[gallery_name]
+                self.saveManifest()
+        finally:
+            # Waiting requests find that the gallery no longer exists
+            STORAGE.release(gallery_name)
+
+        # Delete the files from disk
+        backendClass(backend).removeFiles(path)
+        wal_path = self.galleryPath(gallery_name,'.wal')
+        if os.path.exists(wal_path):
+            os.remove(wal_path)
+        shutil.rmtree(self.galleryPath(gallery_name,'.blobs'),ignore_errors=True)
 
         return deleted_faces
 
@@ -176,46 +662,37 @@ class GalleryWorker(object):
         ''' List the faces enrolled in this gallery. '''
         result = FaceRecordList()
            
-        global STORAGE
-        count = 0
-        for face_id in STORAGE[gallery_name]['faces']:
-               
-            data = STORAGE[gallery_name]['faces'][face_id]
-            face_record = FaceRecord()
-            face_record.ParseFromString(np.array(data).tobytes())
+        with self.useGallery(gallery_name) as store:
+            rows = store.liveRows()
+            metadata = store.metadata(rows)
+            gallery_keys = store.faceIds(rows)
 
+        for i in range(len(rows)):
+               
             face = result.face_records.add()
-            face.gallery_key = face_id
-            face.name = face_record.name
-            face.subject_id = face_record.subject_id
-            face.source = face_record.source
-            face.frame = face_record.frame
+            face.gallery_key = gallery_keys[i]
+            face.name = metadata['name'][i]
+            face.subject_id = metadata['subject_id'][i]
+            face.source = metadata['source'][i]
+            face.frame = metadata['frame'][i]
             
-            count += 1
         return result
 
     def subjectDelete(self, gallery_name, subject_id):
-        ''' List the galleries for this service. '''
-        self.clearIndex(gallery_name)
-
-        if gallery_name not in STORAGE:
+        ''' Delete all the faces for a subject from the gallery. '''
+        if gallery_name not in MANIFEST:
             raise ValueError("No gallery named '%s'"%(gallery_name,))
 
-        delete_count = 0 
+        with self.useGallery(gallery_name) as store:
+            log = LOGS[gallery_name]
 
-        keys = list(STORAGE[gallery_name]['faces'])
-        for gallery_key in keys:
-            tmp = STORAGE[gallery_name]['faces'][gallery_key]
-            face = FaceRecord()
-            face.ParseFromString(np.array(tmp).tobytes())
+            rows = store.subjectRows(subject_id)
 
-            if face.subject_id == subject_id:
-                del STORAGE[gallery_name]['faces'][gallery_key]
-                delete_count += 1
+            if len(rows) == 0:
+                return 0
 
-        self.clearIndex()
-
-        STORAGE[gallery_name].flush()
+            seq = log.append(DELETE, [FaceRecord(gallery_key=face_id) for face_id in store.faceIds(rows)])
+            delete_count = log.wait(seq)
         
         return delete_count
 
@@ -224,64 +701,124 @@ class GalleryWorker(object):
         return False
 
 
+    def setIndexQuantization(self, gallery_name, quantization):
+        ''' Choose the index quantization of a gallery. '''
+        raise ValueError("This gallery worker does not use search indexes.")
+
+
+    def dedupFaces(self, gallery_name, faces, distance, merge=False):
+        ''' Find the near duplicate faces in an enroll.  Requires a search index. '''
+        raise ValueError("Near duplicate suppression requires a searchable gallery.")
+
+
     def clearIndex(self, gallery_name):
         ''' Remove the index to free space and allow it to be regenerated when needed. '''
         pass
 
 
+    def indexState(self, gallery_name):
+        ''' Return 'none', 'current' or 'stale' for the manifest. '''
+        return 'none'
+
+
+    def updateIndex(self, gallery_name, added_rows, deleted_rows, previous_version, faces=()):
+        '''
+        Apply an enroll or delete to the index.  previous_version is the
+        gallery version before the change and faces are the records of the
+        added rows.
+        '''
+        pass
+
+
     def generateIndex(self, gallery_name):
         ''' Process the gallery to generate a fast index. '''
         raise NotImplementedError()
 
 
-    def getAllFaceRecords(self, gallery_name):
-        ''' Get all the face records in the gallery. '''
-        if gallery_name not in STORAGE:
-            raise ValueError("Unknown gallery: "+gallery_name)
-
+    def getAllFaceRecords(self, gallery_name, views=True):
+        ''' Get all the face records in the gallery.  The view images are skipped if views is false. '''
         gallery = FaceRecordList()
-        for key in STORAGE[gallery_name]['faces']:
-            tmp = STORAGE[gallery_name]['faces'][key]
-            face = FaceRecord()
-            face.ParseFromString(np.array(tmp).tobytes())
-            gallery.face_records.add().CopyFrom(face)
+        with self.useGallery(gallery_name) as store:
+            for row in store.liveRows():
+                gallery.face_records.add().CopyFrom(store.getRecord(row,views))
             
         return gallery
     
     def getAllTemplates(self, gallery_name):
         ''' Get all the face records in the gallery. '''
-        if gallery_name not in STORAGE:
-            raise ValueError("Unknown gallery: "+gallery_name)
-
         gallery = TemplateList()
-        for key in STORAGE[gallery_name]['faces']:
-            tmp = STORAGE[gallery_name]['faces'][key]
-            face = FaceRecord()
-            face.ParseFromString(np.array(tmp).tobytes())
-            gallery.templates.add().CopyFrom(face.template)
+        with self.useGallery(gallery_name) as store:
+            for row in store.liveRows():
+                gallery.templates.add().CopyFrom(store.getRecord(row,view=False).template)
+            
+        return gallery
+
+    def galleryTemplates(self, gallery_name, stamp=None):
+        '''
+        Return (stamp, face_ids, subject_ids, templates, filters) for the
+        live faces of a gallery.  templates is a (faces, dim) float32 matrix
+        if the gallery stores vector templates and a TemplateList otherwise,
+        and filters holds the FilterColumns of the faces, both in the order of
+        face_ids.  The gallery is read once per version and the result is
+        shared by later calls, so it must not be modified.  A new stamp is
+        issued for each read.  If stamp is still current everything else is
+        returned as None because the caller already holds it.
+        '''
+        with self.useGallery(gallery_name) as store:
+            with store.lock:
+                entry = TEMPLATES.get(gallery_name)
+                if entry is None or entry[0] != store.version:
+                    face_ids = []
+                    subject_ids = []
+                    blocks = []
+                    filters = []
+                    templates = TemplateList()
+                    for start in range(0,store.count,TEMPLATE_BLOCK_ROWS):
+                        rows, faces, mat = store.readBlock(start,start+TEMPLATE_BLOCK_ROWS)
+                        face_ids.extend(store.faceIds(rows))
+                        subject_ids.extend(store.subjectIds(rows))
+                        filters.append(FilterColumns.fromFaces(faces))
+                        if store.dim > 0:
+                            blocks.append(mat)
+                        else:
+                            templates.templates.extend(face.template for face in faces)
+                    if store.dim > 0:
+                        templates = np.concatenate(blocks) if len(blocks) > 0 else np.zeros((0,store.dim),dtype=np.float32)
+                    entry = (store.version,next(TEMPLATE_STAMPS),face_ids,subject_ids,templates,FilterColumns.concatenate(filters))
+                    TEMPLATES[gallery_name] = entry
+
+        _, current, face_ids, subject_ids, templates, filters = entry
+        if stamp == current:
+            return current, None, None, None, None
+        return current, face_ids, subject_ids, templates, filters
+
+    def getSubjectFaceRecords(self, gallery_name, subject_id):
+        ''' Get the face records enrolled for a subject. '''
+        gallery = FaceRecordList()
+        with self.useGallery(gallery_name) as store:
+            for row in store.subjectRows(subject_id):
+                gallery.face_records.add().CopyFrom(store.getRecord(row))
             
         return gallery
 
     def getFaceRecord(self, gallery_name, face_id):
         ''' Get all the face records in the gallery. '''
-        if gallery_name not in STORAGE:
-            raise ValueError("Unknown gallery: "+gallery_name)
-
-        tmp = STORAGE[gallery_name]['faces'][face_id]
-        face = FaceRecord()
-        face.ParseFromString(np.array(tmp).tobytes())
-
-        return face
+        with self.useGallery(gallery_name) as store:
+            return store.getRecord(store.row(face_id))
 
 class SearchableGalleryWorker(GalleryWorker):
     ''' Implements a fast gallery to speed up searches. Requires templates to be simple vectors.'''
 
     def __init__(self,options,score_type):
-        GalleryWorker.__init__(self,options)
-
         self.score_type = score_type
         self.indexes = {}
-        self.face_ids = {}
+        self.index_quantization = options.index_quantization # Default for galleries without a setting
+
+        # Indexes are loaded as the galleries are opened
+        GalleryWorker.__init__(self,options)
+
+        self.compact_thread = threading.Thread(target=self._compactIndexes,daemon=True)
+        self.compact_thread.start()
 
 
     def isSearchable(self):
@@ -292,151 +829,342 @@ class SearchableGalleryWorker(GalleryWorker):
     def clearIndex(self, gallery_name):
         ''' Remove the index to free space and allow it to be regenerated when needed. '''
 
-        if gallery_name not in STORAGE:
+        if gallery_name not in MANIFEST:
             raise ValueError("Unknown gallery: "+gallery_name)
 
+        # The files on disk are left in place.  They are reused by the next
+        # generateIndex if the gallery has not changed in the meantime.
         try:
-            del STORAGE[gallery_name]['index']
+            del self.indexes[gallery_name]
         except:
             pass
 
-        try:
-            del STORAGE[gallery_name]['face_ids']
-        except:
-            pass
 
-        try:
-            del self.indexes[gallery_name]
-        except:
-            pass
+    def indexQuantization(self, gallery_name):
+        ''' Return the index quantization chosen for a gallery. '''
+        return MANIFEST.get(gallery_name,{}).get('quantization',self.index_quantization)
 
-        try:
-            del self.face_ids[gallery_name]
-        except:
-            pass
 
+    def setIndexQuantization(self, gallery_name, quantization):
+        ''' Choose the index quantization of a gallery and rebuild its index. '''
+        if quantization not in QUANTIZATIONS:
+            raise ValueError("Unknown index quantization '%s'. Choose from %s."%(quantization,', '.join(QUANTIZATIONS)))
 
+        with self.useGallery(gallery_name):
+            with MANIFEST_LOCK:
+                MANIFEST[gallery_name]['quantization'] = quantization
+            self.generateIndex(gallery_name)
+            self.updateManifest(gallery_name)
+        self.saveManifest()
 
-    def generateIndex(self, gallery_name):
-        ''' Process the gallery to generate a fast index. '''
-        import h5py
 
+    def _indexCurrent(self, gallery_name, gallery_version, quantization):
+        return gallery_version == STORAGE[gallery_name].version and quantization == self.indexQuantization(gallery_name)
 
-        #try:
-        #    print("Gallery Names:",list(STORAGE[gallery_name]))
-        #    self.clearIndex(gallery_name)
-        #except:
-        #    print("Problem clearing index.")
 
-        if gallery_name not in STORAGE:
-            raise ValueError("Unknown gallery: "+gallery_name)
+    def indexState(self, gallery_name):
+        ''' Return 'none', 'current' or 'stale' for the manifest. '''
+        index = self.indexes.get(gallery_name)
+        if index is not None:
+            version, quantization = index.gallery_version, index.quantization
+        else:
+            meta = readIndexMeta(self.galleryPath(gallery_name,''))
+            if meta is None:
+                return 'none'
+            version, quantization = meta['gallery_version'], meta.get('quantization','none')
+        return 'current' if self._indexCurrent(gallery_name,version,quantization) else 'stale'
 
-        if gallery_name in self.indexes:
-            # This seems to exist and be loaded into memory so just continue
-            return 
 
-        if 'index' in STORAGE[gallery_name]:
-            # Use the existing index
-            self.indexes[gallery_name] = np.array(STORAGE[gallery_name]['index'],dtype=np.float32)
-            self.face_ids[gallery_name] = list(STORAGE[gallery_name]['face_ids']) 
+    def updateIndex(self, gallery_name, added_rows, deleted_rows, previous_version, faces=()):
+        ''' Append new templates and their filter columns to the index and tombstone deleted rows. '''
+
+        store = STORAGE[gallery_name]
+
+        index = self.indexes.get(gallery_name)
+        if index is None:
+            index = SearchIndex.open(self.galleryPath(gallery_name,''))
+
+        if index is None or index.gallery_version != previous_version or \
+           index.quantization != self.indexQuantization(gallery_name):
+            # The index missed earlier changes so it can not be patched
+            self.clearIndex(gallery_name)
+            self.generateIndex(gallery_name)
             return
 
+        if len(added_rows) > 0:
+            # Appended rows are always contiguous
+            templates = store.templates(added_rows[0],added_rows[-1]+1)
         else:
-            # Generate the index
-            start = time.time()
+            templates = np.zeros((0,store.dim),dtype=np.float32)
 
-            gsize = self.size(gallery_name)
-            
-            dset = None
-
-            print("Building Gallery Index...")
-            i = 0
-            for key in STORAGE[gallery_name]['faces']:
-                i += 1
-                if i % 1000 == 0: print("Scanning ",i," of ",gsize)
-                tmp = STORAGE[gallery_name]['faces'][key]
-                face = FaceRecord()
-                face.ParseFromString(np.array(tmp).tobytes())
-                vec = pt.vector_proto2np(face.template.data)
-                
-                # Figure out the size of the vectors
-                assert len(vec.shape) == 1
-                cols = vec.shape[0]
-
-                # Store into an h5 datasets to keep memory requirements low
-                if dset is None:
-                    try:
-                        del STORAGE[gallery_name]['index']
-                    except:
-                        pass
-                    dset = STORAGE[gallery_name].create_dataset("index", (0,cols), maxshape=(None, cols),dtype='f4')
-                    dt = None
-                    try:
-                        dt = h5py.string_dtype() # h5py > 2.10.0
-                    except:
-                        dt = h5py.special_dtype(vlen=str) # h5py==2.9.0
-                    try:
-                        del STORAGE[gallery_name]['face_ids']
-                    except:
-                        pass
-                    fset = STORAGE[gallery_name].create_dataset("face_ids", (0,), maxshape=(None,),dtype=dt)
-
-                r,c = dset.shape
-                dset.resize((r+1,cols))
-                dset[r,:] = vec
-                fset.resize((r+1,))
-                fset[r] = key
-
-            stop = time.time()
-
-            # save the index in memory
-            self.indexes[gallery_name] = np.array(STORAGE[gallery_name]['index'],dtype=np.float32)
-            self.face_ids[gallery_name] = list(STORAGE[gallery_name]['face_ids']) 
-            print("   Index Complete: %d faces in %0.3fs  Total Size: %s"%(self.size(gallery_name),stop-start, STORAGE[gallery_name]['index'].shape))
-
-
-    def search(self, gallery_name, probes, max_results, threshold):
-        ''' search the gallery using the index. '''
-
-        score_type = self.score_type
+        index.update(templates,added_rows,deleted_rows,store.version,faces)
+        self.indexes[gallery_name] = index
 
-        probe_mat = [pt.vector_proto2np(face_rec.template.data) for face_rec in probes.face_records]
-        probe_mat = np.array(probe_mat,dtype=np.float32)
 
-        gal_mat = self.indexes[gallery_name]
-                
-        # Compute the distance
-        if score_type == fsd.L1:
-            scores = spat.distance_matrix(probe_mat,gal_mat,1)
-        elif score_type == fsd.L2:
-            scores = spat.distance_matrix(probe_mat,gal_mat,2)
-        elif score_type == fsd.NEG_DOT:
-            scores = -np.dot(probe_mat,gal_mat.T)
-        else:
-            NotImplementedError("ScoreType %s is not implemented."%(score_type,))
+    def deleteGallery(self, gallery_name):
+        ''' Delete a gallery and its index files. '''
+        deleted_faces = GalleryWorker.deleteGallery(self, gallery_name)
+        deleteIndex(self.galleryPath(gallery_name,''))
+        return deleted_faces
 
-        
-        face_ids = self.face_ids[gallery_name]
-
-        for p in range(scores.shape[0]):
-            #probe = probes.face_records[p]
-            #out = result.probes.face_records[p].search_results
-            matches = []
-            for g in range(scores.shape[1]):
-                score = scores[p,g]
-                if score > threshold:
+
+    def generateIndex(self, gallery_name):
+        ''' Load the memory mapped index for the gallery, building it if it is out of date. '''
+
+        store = self.getStore(gallery_name)
+
+        index = self.indexes.get(gallery_name)
+        if index is not None and self._indexCurrent(gallery_name,index.gallery_version,index.quantization):
+            # This seems to exist and be loaded into memory so just continue
+            return 
+
+        prefix = self.galleryPath(gallery_name,'')
+
+        # The commit thread bumps the gallery version and patches the index
+        # under the store lock.  Holding it here keeps a search from seeing
+        # the index as stale mid-update and building a competing generation.
+        with store.lock:
+            index = self.indexes.get(gallery_name)
+            if index is not None and self._indexCurrent(gallery_name,index.gallery_version,index.quantization):
+                return
+
+            index = SearchIndex.open(prefix)
+            if index is None or not self._indexCurrent(gallery_name,index.gallery_version,index.quantization):
+                # Generate the index
+                start = time.time()
+
+                # The template matrix in the store is already laid out as an index
+                # so only the live rows need to be copied.
+                index = SearchIndex.build(prefix,store,quantization=self.indexQuantization(gallery_name))
+
+                stop = time.time()
+                print("   Index Complete: %d faces in %0.3fs (%0.0f faces/sec)  Total Size: %s"%(len(index),stop-start,len(index)/max(stop-start,1e-6),(len(index),index.meta['dim'])))
+
+            self.indexes[gallery_name] = index
+
+
+    def _compactIndexes(self):
+        ''' Periodically drop deleted rows from the indexes in the background. '''
+        while not self.stopping.wait(INDEX_COMPACT_INTERVAL):
+            for gallery_name,index in list(self.indexes.items()):
+                if len(index) == 0 or index.deleted < INDEX_COMPACT_RATIO*len(index):
                     continue
-                face = self.getFaceRecord(gallery_name,face_ids[g])
-                matches.append( [ score, face ] )
-            
-            matches.sort(key=lambda x: x[0])
-            
-            if max_results > 0:
-                matches = matches[:max_results]
-            
-            for score,face in matches:
-                probes.face_records[p].search_results.face_records.add().CopyFrom(face)
-                probes.face_records[p].search_results.face_records[-1].score=score
+                try:
+                    start = time.time()
+                    removed = index.compact()
+                    stop = time.time()
+                    print("   Index Compacted: %s removed %d rows in %0.3fs"%(gallery_name,removed,stop-start))
+                except Exception as e:
+                    print("   Index Compaction Failed: %s %s"%(gallery_name,e))
+
+
+    def _subjectCandidates(self, store, gal_mat, rows, live, subject_id):
+        ''' Look up the index templates of the faces already enrolled for a subject. '''
+        subject_rows = np.array(store.subjectRows(subject_id),dtype=np.int64)
+        positions = np.searchsorted(rows,subject_rows)
+
+        # Rows enrolled since the index snapshot are not found
+        found = positions < len(rows)
+        found[found] = rows[positions[found]] == subject_rows[found]
+        if live is not None:
+            found[found] = live[positions[found]]
+
+        return [{'template':np.array(gal_mat[pos],dtype=np.float32),'row':int(row),'face':None,'count':None}
+                for pos,row in zip(positions[found],subject_rows[found])]
+
+
+    def dedupFaces(self, gallery_name, faces, distance, merge=False):
+        '''
+        Find the faces of an enroll that are within distance of a face already
+        enrolled for the same subject or of an earlier face in the same batch.
+
+        Near duplicates are skipped, or averaged into the face they match if
+        merge is true.  Returns the faces to enroll, the gallery key that each
+        face ended up in and the numbers of faces skipped and merged.
+        '''
+        enroll = []
+        keys = []
+        skipped = merged = 0
+        subjects = {} # Candidate faces of each subject in the batch
+
+        with self.useGallery(gallery_name, create=True) as store:
+            self.generateIndex(gallery_name)
+            gal_mat, rows, live = self.indexes[gallery_name].snapshot()
+
+            for face in faces:
+                face.gallery_key = faro.generateFaceId(face)
+                if not face.subject_id or len(face.template.data.data) == 0:
+                    enroll.append(face)
+                    keys.append(face.gallery_key)
+                    continue
+
+                if face.subject_id not in subjects:
+                    subjects[face.subject_id] = self._subjectCandidates(store,gal_mat,rows,live,face.subject_id)
+                candidates = subjects[face.subject_id]
+
+                template = pt.vector_proto2np(face.template.data)
+                if len(candidates) > 0:
+                    scores = self.scoreTemplates(template.reshape(1,-1),np.array([each['template'] for each in candidates]))[0]
+                    best = int(np.argmin(scores))
+                else:
+                    best = None
+
+                if best is None or scores[best] > distance:
+                    candidates.append({'template':template,'row':None,'face':face,'count':1})
+                    enroll.append(face)
+                    keys.append(face.gallery_key)
+                    continue
+
+                match = candidates[best]
+                if not merge:
+                    skipped += 1
+                    if match['face'] is None:
+                        keys.append(store.faceIds([match['row']])[0])
+                    else:
+                        keys.append(match['face'].gallery_key)
+                    continue
+
+                if match['face'] is None:
+                    # The merged face replaces the enrolled one
+                    match['face'] = store.getRecord(match['row'])
+                    match['count'] = 1
+                    for each in match['face'].metadata:
+                        if each.key == 'merged_faces':
+                            match['count'] = each.ivalue
+                    enroll.append(match['face'])
+
+                count = match['count']
+                merged_template = (count*match['template'] + template)/(count+1)
+                if self.score_type == fsd.NEG_DOT:
+                    # Keep the scale of the templates for dot product scores
+                    merged_template *= np.linalg.norm(match['template'])/max(np.linalg.norm(merged_template),1e-12)
+
+                match['template'] = merged_template
+                match['count'] = count + 1
+                _setMergedFaces(match['face'],merged_template,count+1)
+                merged += 1
+                keys.append(match['face'].gallery_key)
+
+        return enroll, keys, skipped, merged
+
+
+    def scoreTemplates(self, probe_mat, gal_mat, gallery_norms=None):
+        '''
+        Compute the (probes, gallery) distance matrix for the score type of
+        this worker.  gallery_norms are the squared norms cached by the index.
+        '''
+        return scoreMatrix(probe_mat,gal_mat,self.score_type,gallery_norms=gallery_norms)
+
+
+    def coarseCandidates(self, probe_mat, coarse, scale, live, quantization, k, subset=None):
+        '''
+        Score the probes against a quantized index one block at a time and
+        return the positions of the k best index rows for each probe in
+        increasing order.  If subset is given only those index positions are
+        scored.
+        '''
+        n_probes = probe_mat.shape[0]
+        best_scores = np.zeros((n_probes,0),dtype=np.float32)
+        best = np.zeros((n_probes,0),dtype=np.int64)
+        n = coarse.shape[0] if subset is None else len(subset)
+        for start in range(0,n,COARSE_BLOCK_ROWS):
+            if subset is None:
+                block_positions = np.arange(start,min(start+COARSE_BLOCK_ROWS,n),dtype=np.int64)
+                block = dequantize(coarse[start:start+COARSE_BLOCK_ROWS],quantization,scale)
+            else:
+                block_positions = subset[start:start+COARSE_BLOCK_ROWS]
+                block = dequantize(coarse[block_positions],quantization,scale)
+            scores = self.scoreTemplates(probe_mat,block)
+            if live is not None:
+                scores[:,~live[block_positions]] = np.inf
+
+            positions = np.broadcast_to(block_positions,scores.shape)
+            best_scores = np.concatenate([best_scores,scores],axis=1)
+            best = np.concatenate([best,positions],axis=1)
+            if best.shape[1] > k:
+                keep = np.argpartition(best_scores,k-1,axis=1)[:,:k]
+                best_scores = np.take_along_axis(best_scores,keep,axis=1)
+                best = np.take_along_axis(best,keep,axis=1)
+
+        # Sorted positions read the float32 pages in file order
+        return [np.sort(each) for each in best]
+
+
+    def addSearchResults(self, store, probe, rows, positions, scores):
+        ''' Read the faces at the given index positions into the search results of a probe. '''
+        results = probe.search_results.face_records
+        for score,g in zip(scores,positions):
+            face = results.add()
+            face.CopyFrom(store.getRecord(rows[g]))
+            face.score = score
+
+
+    def filterPositions(self, index, rows, live, search_filter):
+        '''
+        Combine the live mask of an index snapshot with a SearchFilter.
+        Returns the new live mask and, if few enough rows pass the filter,
+        their index positions so that only those rows are scored.
+        '''
+        if not isFiltered(search_filter):
+            return live, None
+
+        allowed = index.filterMask(search_filter,rows)
+        if live is not None:
+            allowed &= live
+        if np.count_nonzero(allowed) > FILTER_SUBSET_RATIO*len(allowed):
+            return allowed, None
+        return allowed, np.flatnonzero(allowed)
+
+
+    def search(self, gallery_name, probes, max_results, threshold, nprobe=0, search_filter=None):
+        '''
+        search the gallery using the index.  nprobe is only used by approximate
+        workers.  Only the faces that pass search_filter are scored.
+        '''
+
+        probe_mat = [pt.vector_proto2np(face_rec.template.data) for face_rec in probes.face_records]
+        probe_mat = np.array(probe_mat,dtype=np.float32)
+
+        with self.useGallery(gallery_name) as store:
+            # The gallery may have been evicted since the index was generated
+            self.generateIndex(gallery_name)
+            index = self.indexes[gallery_name]
+
+            coarse, scale, gal_mat, norms, rows, live = index.coarseSnapshot()
+            live, subset = self.filterPositions(index,rows,live,search_filter)
+
+            candidates = None
+            if index.quantization != 'none' and max_results > 0:
+                # Select candidates with the compact templates and rescore
+                # only those with the float32 templates.
+                k = max(RESCORE_FACTOR*max_results,RESCORE_MIN)
+                if subset is not None and len(subset) <= k:
+                    candidates = [subset]*probe_mat.shape[0]
+                else:
+                    candidates = self.coarseCandidates(probe_mat,coarse,scale,live,index.quantization,k,subset)
+            elif subset is not None:
+                scores = self.scoreTemplates(probe_mat,gal_mat[subset],norms[subset])
+                matches = selectMatches(scores,max_results,threshold)
+            else:
+                # Compute the distance
+                scores = self.scoreTemplates(probe_mat,gal_mat,norms)
+                matches = selectMatches(scores,max_results,threshold,live)
+
+            for p in range(probe_mat.shape[0]):
+                if candidates is None:
+                    positions = matches[p]
+                    probe_scores = scores[p,positions]
+                    if subset is not None:
+                        positions = subset[positions]
+                else:
+                    positions = candidates[p]
+                    probe_scores = self.scoreTemplates(probe_mat[p:p+1],gal_mat[positions],norms[positions])
+                    selected = selectMatches(probe_scores,max_results,threshold,None if live is None else live[positions])[0]
+                    positions = positions[selected]
+                    probe_scores = probe_scores[0,selected]
+
+                # Only the returned faces are read from the gallery
+                self.addSearchResults(store,probes.face_records[p],rows,positions,probe_scores)
 
 
         return probes
@@ -0,0 +1,287 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Blocked scoring of probe templates against gallery templates.
+
+The probes and the gallery are split into tiles so the temporary arrays of a
+score stay within a memory budget no matter how large the request is.  Each
+tile is scored with a single matrix product where the score type allows it:
+
+    L2       sqrt(|p|^2 + |g|^2 - 2 p.g) using one float32 GEMM per tile
+    NEG_DOT  -p.g
+    L1       sum(|p - g|) computed by broadcasting, in smaller tiles
+
+The tiles are produced by a generator so large score matrices can be
+streamed to the client one block at a time instead of being held in memory.
+
+The squared norms of gallery templates can be computed once and passed in.
+Search indexes store them next to the templates, so an L2 search is one
+matrix product plus two rank-1 updates.
+
+The matrix products run in the BLAS library linked with numpy.  It starts one
+thread per core by default, which oversubscribes the machine when several
+processes or request threads score at once.  setBlasThreads limits the
+threads of the current process when threadpoolctl is installed.
+
+bin/faro_score_benchmark compares the throughput with
+scipy.spatial.distance_matrix.
+'''
+
+import numpy as np
+
+import faro.proto.face_service_pb2 as fsd
+
+try:
+    import threadpoolctl
+except ImportError:
+    threadpoolctl = None
+
+SCORE_MEMORY_MB = 256 # Memory budget for the temporary arrays of a blocked score
+SCORE_TYPES = (fsd.L1,fsd.L2,fsd.NEG_DOT)
+
+MATCH_HISTOGRAM_BINS = 100 # Default bins of the histograms of a match distribution
+MATCH_RANGE_PADDING = 0.1  # Fraction of the score span added to each side of an estimated histogram range
+
+BLAS_LIMITS = None # The thread limits set by setBlasThreads
+
+
+def setScoreMemory(memory_mb):
+    ''' Set the default memory budget of this process in megabytes. '''
+    global SCORE_MEMORY_MB
+    SCORE_MEMORY_MB = memory_mb
+
+
+def setBlasThreads(threads):
+    ''' Limit the threads used by BLAS in this process.  0 keeps the library default. '''
+    global BLAS_LIMITS
+    if threads <= 0:
+        return
+    if threadpoolctl is None:
+        print("Warning: could not limit the BLAS threads. Perform `pip install threadpoolctl`")
+        return
+    BLAS_LIMITS = threadpoolctl.threadpool_limits(limits=threads,user_api='blas')
+
+
+def squaredNorms(mat):
+    ''' Return the float32 squared norm of each row of a matrix. '''
+    mat = np.asarray(mat,dtype=np.float32)
+    return np.einsum('ij,ij->i',mat,mat)
+
+
+def scoreTileShape(n_probes, n_gallery, dim, score_type, memory_mb=None):
+    '''
+    Return the (probe rows, gallery rows) of the largest tile that fits in
+    the memory budget.  The gallery is kept whole if possible so each
+    matrix product is as wide as it can be.
+    '''
+    if memory_mb is None:
+        memory_mb = SCORE_MEMORY_MB
+
+    if score_type == fsd.L1:
+        cell_bytes = 4*max(dim,1) # The broadcast differences
+    else:
+        cell_bytes = 8            # The tile and one temporary
+    cells = max(1,int(memory_mb*1024*1024)//cell_bytes)
+
+    gallery_rows = max(1,min(n_gallery,cells))
+    probe_rows = max(1,min(n_probes,cells//gallery_rows))
+    return probe_rows, gallery_rows
+
+
+def scoreTile(probe_mat, gal_mat, score_type, gallery_norms=None):
+    '''
+    Score a tile of probes against a tile of the gallery and return a float32
+    matrix.  gallery_norms are the squared norms of the gallery templates.
+    '''
+    if score_type == fsd.L2:
+        if gallery_norms is None:
+            gallery_norms = squaredNorms(gal_mat)
+        scores = np.dot(probe_mat,gal_mat.T)
+        scores *= -2.0
+        scores += squaredNorms(probe_mat)[:,np.newaxis]
+        scores += gallery_norms[np.newaxis,:]
+        # Rounding can make the distance of near identical templates negative
+        np.maximum(scores,0.0,out=scores)
+        return np.sqrt(scores,out=scores)
+    elif score_type == fsd.NEG_DOT:
+        scores = np.dot(probe_mat,gal_mat.T)
+        return np.negative(scores,out=scores)
+    elif score_type == fsd.L1:
+        return np.abs(probe_mat[:,np.newaxis,:] - gal_mat[np.newaxis,:,:]).sum(axis=2,dtype=np.float32)
+    else:
+        raise NotImplementedError("ScoreType %s is not implemented."%(score_type,))
+
+
+def scoreBlocks(probe_mat, gal_mat, score_type, memory_mb=None, gallery_norms=None):
+    '''
+    Score the probes against the gallery one tile at a time.  Yields
+    (probe_start, gallery_start, scores) for each tile in row order.
+    '''
+    if score_type not in SCORE_TYPES:
+        raise NotImplementedError("ScoreType %s is not implemented."%(score_type,))
+
+    probe_mat = np.asarray(probe_mat,dtype=np.float32)
+    gal_mat = np.asarray(gal_mat,dtype=np.float32)
+    n_probes, n_gallery = probe_mat.shape[0], gal_mat.shape[0]
+    probe_rows, gallery_rows = scoreTileShape(n_probes,n_gallery,probe_mat.shape[1],score_type,memory_mb)
+    if score_type == fsd.L2 and gallery_norms is None:
+        gallery_norms = squaredNorms(gal_mat)
+
+    for probe_start in range(0,n_probes,probe_rows):
+        probe_block = probe_mat[probe_start:probe_start+probe_rows]
+        for gallery_start in range(0,n_gallery,gallery_rows):
+            gallery_block = slice(gallery_start,gallery_start+gallery_rows)
+            norms = None if gallery_norms is None else gallery_norms[gallery_block]
+            yield probe_start, gallery_start, scoreTile(probe_block,gal_mat[gallery_block],score_type,norms)
+
+
+def scoreMatrix(probe_mat, gal_mat, score_type, memory_mb=None, gallery_norms=None):
+    ''' Compute the full (probes, gallery) float32 score matrix tile by tile. '''
+    probe_mat = np.asarray(probe_mat,dtype=np.float32)
+    gal_mat = np.asarray(gal_mat,dtype=np.float32)
+    scores = np.empty((probe_mat.shape[0],gal_mat.shape[0]),dtype=np.float32)
+    for probe_start, gallery_start, block in scoreBlocks(probe_mat,gal_mat,score_type,memory_mb,gallery_norms):
+        scores[probe_start:probe_start+block.shape[0],gallery_start:gallery_start+block.shape[1]] = block
+    return scores
+
+
+def pairTiles(n, tile_rows):
+    '''
+    Yield (probe_start, probe_stop, gallery_start, gallery_stop) for the
+    square tiles on and above the diagonal of an (n, n) matrix in row order.
+    '''
+    for probe_start in range(0,n,tile_rows):
+        probe_stop = min(probe_start+tile_rows,n)
+        for gallery_start in range(probe_start,n,tile_rows):
+            yield probe_start, probe_stop, gallery_start, min(gallery_start+tile_rows,n)
+
+
+def subjectCodes(subject_ids):
+    '''
+    Return an integer code for each face.  Two faces are a genuine pair if
+    their codes are equal.  Faces without a subject id get codes of their own.
+    '''
+    subject_ids = np.array(subject_ids,dtype=object)
+    if len(subject_ids) == 0:
+        return np.zeros((0,),dtype=np.int64)
+    _, codes = np.unique(subject_ids,return_inverse=True)
+    codes = codes.astype(np.int64)
+    missing = np.flatnonzero(subject_ids == '')
+    codes[missing] = codes.max() + 1 + np.arange(len(missing))
+    return codes
+
+
+def tilePairs(scores, codes, probe_start, gallery_start):
+    '''
+    Return the distances of the pairs in a tile of a symmetric score matrix
+    and a mask of the genuine pairs.  Only the pairs above the diagonal are
+    kept from a tile that is on the diagonal.
+    '''
+    probe_codes = codes[probe_start:probe_start+scores.shape[0]]
+    gallery_codes = codes[gallery_start:gallery_start+scores.shape[1]]
+    genuine = probe_codes[:,np.newaxis] == gallery_codes[np.newaxis,:]
+    if probe_start == gallery_start:
+        upper = np.triu(np.ones(scores.shape,dtype=bool),k=1)
+        return scores[upper], genuine[upper]
+    return scores.ravel(), genuine.ravel()
+
+
+def estimateRange(scores):
+    ''' Choose a histogram range that covers a sample of scores with some padding. '''
+    scores = np.asarray(scores)
+    scores = scores[np.isfinite(scores)]
+    if len(scores) == 0:
+        return 0.0, 1.0
+    low, high = float(scores.min()), float(scores.max())
+    padding = MATCH_RANGE_PADDING*max(high-low,1e-6)
+    return low-padding, high+padding
+
+
+class ScoreDistribution(object):
+    '''
+    Histograms of genuine and impostor distances accumulated one tile at a
+    time.  The bins are uniform over a range.  With a fixed range, distances
+    outside it are counted in the first or last bin, so the error rates are
+    exact at every interior bin edge.
+
+    If grow is true the range is widened whenever distances fall outside it.
+    The new bins are whole multiples of the old ones, so the counts so far
+    are merged into the new bins exactly and no distance is clipped.
+    '''
+
+    def __init__(self, bins, min_score, max_score, grow=False):
+        if max_score <= min_score:
+            max_score = min_score + 1.0
+        self.edges = np.linspace(min_score,max_score,bins+1)
+        self.genuine = np.zeros((bins,),dtype=np.int64)
+        self.impostor = np.zeros((bins,),dtype=np.int64)
+        self.grow = grow
+
+    def _cover(self, scores):
+        ''' Widen the range to include the finite scores by merging bins. '''
+        scores = scores[np.isfinite(scores)]
+        low, high = self.edges[0], self.edges[-1]
+        if len(scores) == 0 or (scores.min() >= low and scores.max() < high):
+            return
+
+        bins = len(self.genuine)
+        width = (high-low)/bins
+        padding = MATCH_RANGE_PADDING*(max(high,scores.max())-min(low,scores.min()))
+
+        # Whole old bins are added below the range so the old edges stay edges
+        shift = int(np.ceil((low-min(low,scores.min()-padding))/width))
+        needed = (max(high,scores.max()+padding)-low)/width + shift
+        factor = 1
+        while factor*bins < needed:
+            factor *= 2
+
+        merged = (np.arange(bins)+shift)//factor
+        for counts in (self.genuine,self.impostor):
+            old = counts.copy()
+            counts[:] = 0
+            np.add.at(counts,merged,old)
+        low = low - shift*width
+        self.edges = low + factor*width*np.arange(bins+1)
+
+    def add(self, scores, genuine):
+        ''' Count the distances of a set of pairs.  genuine is a boolean mask of the genuine pairs. '''
+        scores = np.asarray(scores,dtype=np.float64)
+        if self.grow:
+            self._cover(scores)
+        bins = len(self.genuine)
+        low, high = self.edges[0], self.edges[-1]
+        index = np.floor((scores-low)*(bins/(high-low)))
+        index = np.clip(np.nan_to_num(index,nan=bins-1),0,bins-1).astype(np.int64)
+        self.genuine += np.bincount(index[genuine],minlength=bins)
+        self.impostor += np.bincount(index[~genuine],minlength=bins)
+
+    def errorRates(self):
+        '''
+        Return the interior bin edges with the false accept rate and the false
+        reject rate of a match threshold at each one.
+        '''
+        genuine_count, impostor_count = self.genuine.sum(), self.impostor.sum()
+        thresholds = self.edges[1:-1]
+        far = np.cumsum(self.impostor)[:-1]/max(impostor_count,1)
+        frr = (genuine_count - np.cumsum(self.genuine)[:-1])/max(genuine_count,1)
+        return thresholds, far, frr
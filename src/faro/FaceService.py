@@ -34,8 +34,9 @@ from concurrent import futures
 import traceback
 import time
 import faro.proto.proto_types as pt
-from faro.proto.face_service_pb2 import DetectRequest,DetectExtractRequest,ExtractRequest,FaceRecordList,GalleryList,GalleryInfo,ScoreRequest,Empty
+from faro.proto.face_service_pb2 import DetectRequest,DetectExtractRequest,ExtractRequest,FaceRecordList,GalleryList,GalleryInfo,ScoreRequest,TemplateList,Empty
 import csv
+import collections
 import multiprocessing as mp
 import optparse
 import sys
@@ -46,8 +47,17 @@ import h5py
 import skimage.io
 import cv2
 import inspect
+import threading
 import urllib.request
-from faro.FaceGallery import GalleryWorker
+from faro.FaceGallery import GalleryWorker, selectMatches
+from faro.GalleryCache import DEFAULT_MAX_OPEN, DEFAULT_MAX_MB
+from faro.GalleryIndex import QUANTIZATIONS
+from faro.GalleryBackend import GALLERY_BACKENDS
+from faro.GalleryLog import COMMIT_INTERVAL, COMMIT_RECORDS
+from faro.GalleryShards import ShardedGalleryWorker
+from faro.FaceScoring import SCORE_MEMORY_MB, MATCH_HISTOGRAM_BINS, ScoreDistribution, estimateRange, pairTiles, setScoreMemory, setBlasThreads, subjectCodes, tilePairs
+from faro.GalleryIVF import IVF_DEFAULT_NPROBE
+from faro.GalleryFilters import isFiltered
 try:
     from random_word import RandomWords
 except:
@@ -79,6 +89,14 @@ FACE_ALG = None
 
 GALLERY_WORKER = None
 
+BULK_ENROLL_BATCH_SIZE = 10000 # Faces collected from a bulkEnroll stream before writing to the gallery
+
+WORKER_GALLERIES = collections.OrderedDict() # Gallery score requests kept by each pool worker in LRU order
+WORKER_GALLERY_COUNT = 4 # Galleries that each pool worker keeps for searches without an index
+WORKER_GALLERIES_LOCK = threading.Lock() # Guards WORKER_GALLERIES when the pool workers are threads
+
+SCORE_BLOCK_OVERHEAD = 1024 # Bytes of a streamed ScoreBlock message reserved for fields other than the scores
+
 
 WORKER_GPU_MAPPING = {}
 
@@ -140,6 +158,8 @@ def worker_init(options):
     WORKER_INDEX = (int(proc.name.split('-')[-1])-1)%options.worker_count
 
     OPTIONS = options
+    setScoreMemory(options.score_memory_mb)
+    setBlasThreads(options.blas_threads)
  
     assert WORKER_INDEX >= 0
     if options.gpus is not "":
@@ -248,6 +268,66 @@ def worker_score(request):
         traceback.print_exc()
         raise
 
+def _workerGallery(gallery_name, stamp, templates):
+    '''
+    Return the prepared gallery kept by this worker for a stamp from
+    galleryTemplates, preparing it if the templates are given.  Returns None
+    if the worker does not hold the gallery and needs the templates.
+    '''
+    global FACE_ALG, WORKER_GALLERIES
+    prepared = None
+    if templates is not None:
+        prepared = FACE_ALG.prepareGallery(templates)
+
+    with WORKER_GALLERIES_LOCK:
+        if prepared is not None:
+            WORKER_GALLERIES[gallery_name] = (stamp,prepared)
+            while len(WORKER_GALLERIES) > WORKER_GALLERY_COUNT:
+                WORKER_GALLERIES.popitem(last=False)
+
+        entry = WORKER_GALLERIES.get(gallery_name)
+        if entry is None or entry[0] != stamp:
+            return None
+        WORKER_GALLERIES.move_to_end(gallery_name)
+        return entry[1]
+
+def worker_searchScore(probes, gallery_name, stamp, templates=None):
+    '''
+    Score a TemplateList of probes against a gallery kept by this worker.
+    The gallery is only sent with templates when the worker does not hold
+    it.  Returns None if the worker needs the templates.
+    '''
+    global FACE_ALG
+    assert FACE_ALG is not None
+
+    try:
+        gallery = _workerGallery(gallery_name,stamp,templates)
+        if gallery is None:
+            return None
+        return FACE_ALG.scoreGallery(probes,gallery)
+    except:
+        print("ERROR in worker executing search score method.")
+        traceback.print_exc()
+        raise
+
+def worker_scoreTile(gallery_name, stamp, tile, templates=None):
+    '''
+    Score a (probe_start, probe_stop, gallery_start, gallery_stop) tile of a
+    gallery against itself.  Returns None if the worker needs the templates.
+    '''
+    global FACE_ALG
+    assert FACE_ALG is not None
+
+    try:
+        gallery = _workerGallery(gallery_name,stamp,templates)
+        if gallery is None:
+            return None
+        return FACE_ALG.scoreGalleryTile(gallery,*tile)
+    except:
+        print("ERROR in worker executing score tile method.")
+        traceback.print_exc()
+        raise
+
 def worker_extractTile(mat):
     global FACE_ALG
     assert FACE_ALG is not None
@@ -275,6 +355,9 @@ class FaceService(fs.FaceRecognitionServicer):
         self.worker_init_semaphore = self.manager.Value('c',options.worker_count)
         self.wsInfo = None
         self.name = options.algorithm
+        self.worker_count = options.worker_count
+        self.score_memory_mb = options.score_memory_mb
+        self.max_message_size = options.max_message_size
         options.functiondict = self.worker_functionality_dict
         options.queue_semaphore = self.worker_init_semaphore
         self.workers = mp.Pool(options.worker_count, worker_init, [options])
@@ -305,10 +388,17 @@ class FaceService(fs.FaceRecognitionServicer):
             print('started worker for enrollment purposes')
         if FACE_WORKER_LIST[options.algorithm][2] is not None:
             print( "GALLERY WORKER: Using custom gallery worker.")
-            self.gallery_worker = FACE_WORKER_LIST[options.algorithm][2](options)
+            create_gallery_worker = FACE_WORKER_LIST[options.algorithm][2]
         else:
             print( "GALLERY WORKER: Using standard gallery worker.")
-            self.gallery_worker = GalleryWorker(options)
+            create_gallery_worker = GalleryWorker
+        # Gallery searches run in this process or in the shard processes
+        setBlasThreads(options.blas_threads)
+        if options.gallery_shards > 0:
+            print( "GALLERY WORKER: Splitting galleries into %d shards."%(options.gallery_shards,))
+            self.gallery_worker = ShardedGalleryWorker(options,create_gallery_worker)
+        else:
+            self.gallery_worker = create_gallery_worker(options)
 
 
         
@@ -385,6 +475,16 @@ class FaceService(fs.FaceRecognitionServicer):
             status_message.worker_count = len(self.workers._pool);
             status_message.faro_version = str(faro.__version__)
             status_message.instance_name = self.name
+            stats = self.gallery_worker.cacheStats()
+            cache = status_message.gallery_cache
+            cache.open_galleries = stats['open']
+            cache.pinned_galleries = stats['pinned']
+            cache.open_bytes = stats['bytes']
+            cache.max_open = stats['max_open']
+            cache.max_bytes = stats['max_bytes']
+            cache.hits = stats['hits']
+            cache.misses = stats['misses']
+            cache.evictions = stats['evictions']
             # print('Status Request', '<',status_message,'>')
             # print(context.peer())
             notes = None
@@ -489,22 +589,25 @@ class FaceService(fs.FaceRecognitionServicer):
                 start = time.time()
                 
                 gallery_name = request.enroll_gallery
-            
-
-                replacements = 0
-                count = 0
+                faces = request.records.face_records
+                stats = request.records.enroll_stats
 
-                for face in request.records.face_records:
-                    face_id = faro.generateFaceId(face)
-                    face.gallery_key = face_id
+                dedup_distance = request.enroll_options.dedup_distance
+                if dedup_distance > 0:
+                    # Near duplicates of faces already enrolled for the same
+                    # subject are skipped or merged before the enroll.
+                    faces,keys,stats.skip_count,stats.merge_count = self.gallery_worker.dedupFaces(gallery_name, faces, dedup_distance, request.enroll_options.dedup_merge)
+                    for face,key in zip(request.records.face_records,keys):
+                        face.gallery_key = key
 
-                    enrolled,replaced = self.gallery_worker.addFaceToGallery(gallery_name, face_id, face)
-
-                    count += enrolled
-                    replacements += replaced
+                count,replacements = self.gallery_worker.addFacesToGallery(gallery_name, faces)
+                stats.enroll_count = count
+                stats.replace_count = replacements
 
                 stop = time.time()
                 notes = "Enrolled %d faces into gallery '%s' with %d replacements.  Gallery size = %d." % (count, gallery_name, replacements, self.gallery_worker.size(gallery_name))
+                if dedup_distance > 0:
+                    notes += "  Skipped %d and merged %d near duplicates." % (stats.skip_count, stats.merge_count)
                 global LOG_FORMAT
                 print(( LOG_FORMAT%(pv.timestamp(),stop-start,"enroll()",notes,context.peer())))
 
@@ -514,23 +617,158 @@ class FaceService(fs.FaceRecognitionServicer):
                 raise
 
 
+    def bulkEnroll(self,request_iterator,context):
+        ''' Enrolls a stream of faces, writing them to the galleries in large batches. '''
+        try:
+            start = time.time()
+
+            response = fsd.BulkEnrollResponse()
+
+            pending = {}
+            pending_count = 0
+            for request in request_iterator:
+                response.request_count += 1
+                pending.setdefault(request.enroll_gallery,[]).extend(request.records.face_records)
+                pending_count += len(request.records.face_records)
+
+                if pending_count >= BULK_ENROLL_BATCH_SIZE:
+                    self._enrollPending(pending,response)
+                    pending = {}
+                    pending_count = 0
+
+            self._enrollPending(pending,response)
+
+            stop = time.time()
+            notes = "Enrolled %d faces from %d requests with %d replacements. %0.1f faces per second." % (response.enroll_count, response.request_count, response.replace_count, response.enroll_count/(stop-start))
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"bulkEnroll()",notes,context.peer())))
+
+            return response
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def _enrollPending(self,pending,response):
+        ''' Write the faces collected by bulkEnroll to their galleries. '''
+        for gallery_name,faces in pending.items():
+            enrolled,replaced = self.gallery_worker.addFacesToGallery(gallery_name, faces)
+            response.enroll_count += enrolled
+            response.replace_count += replaced
+
+
     def generateMatchDistribution(self,request,context):
         ''' Create a NxN square match matrix of a given gallery'''
         try:
             start = time.time()
             gallery_name = request.gallery_name
-            gallery_records = self.gallery_worker.getAllTemplates(gallery_name)
-            score_request = ScoreRequest()
-            score_request.template_probes.CopyFrom(gallery_records)
-            score_request.template_gallery.CopyFrom(gallery_records)
-            worker_result = self.workers.apply_async(worker_score,[score_request])
-            score_mat = worker_result.get()
-        
+            stamp, face_ids, _, gallery, _ = self.gallery_worker.galleryTemplates(gallery_name)
+            n_faces = len(face_ids)
+
+            # The matrix is filled in from the same tiles as matchDistribution
+            dist_mat = np.zeros((n_faces,n_faces),dtype=np.float32)
+            for probe_start, gallery_start, scores in self._pairScores(gallery_name,stamp,gallery,n_faces):
+                dist_mat[probe_start:probe_start+scores.shape[0],gallery_start:gallery_start+scores.shape[1]] = scores
+                dist_mat[gallery_start:gallery_start+scores.shape[1],probe_start:probe_start+scores.shape[0]] = scores.T
+            score_mat = pt.matrix_np2proto(dist_mat)
+
+            stop = time.time()
+            notes = "Matrix %dX%d"%(n_faces,n_faces)
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"generateMatchDistribution()",notes,context.peer())))
+
             return score_mat
         except:
             traceback.print_exc()
             raise
-        
+
+
+    def matchDistribution(self,request,context):
+        '''
+        Score every pair of faces in a gallery and stream the genuine and
+        impostor distance histograms with the false accept and false reject
+        rates at each bin edge.  The upper triangle of the distance matrix is
+        scored in square tiles by the workers and summarized as the tiles
+        arrive, so memory use does not grow with the square of the gallery.
+        The tiles are also streamed if include_scores is set.
+        '''
+        try:
+            start = time.time()
+            gallery_name = request.gallery_name
+            stamp, face_ids, subject_ids, gallery, _ = self.gallery_worker.galleryTemplates(gallery_name)
+            n_faces = len(face_ids)
+            codes = subjectCodes(subject_ids)
+
+            bins = request.bins if request.bins > 0 else MATCH_HISTOGRAM_BINS
+            distribution = None
+            if request.min_score != 0.0 or request.max_score != 0.0:
+                distribution = ScoreDistribution(bins,request.min_score,request.max_score)
+
+            tile_count = 0
+            for probe_start, gallery_start, scores in self._pairScores(gallery_name,stamp,gallery,n_faces):
+                tile_count += 1
+                if request.include_scores:
+                    for block in self._scoreBlocks(probe_start,gallery_start,scores):
+                        yield fsd.MatchDistribution(block=block)
+
+                pair_scores, genuine = tilePairs(scores,codes,probe_start,gallery_start)
+                if distribution is None:
+                    # The range is estimated from the first tile and widened by later ones
+                    distribution = ScoreDistribution(bins,*estimateRange(pair_scores),grow=True)
+                distribution.add(pair_scores,genuine)
+
+            if distribution is None:
+                distribution = ScoreDistribution(bins,0.0,1.0)
+
+            result = fsd.MatchDistribution()
+            result.face_count = n_faces
+            result.genuine_count = int(distribution.genuine.sum())
+            result.impostor_count = int(distribution.impostor.sum())
+            result.bin_edges.extend(distribution.edges.tolist())
+            result.genuine_histogram.extend(distribution.genuine.tolist())
+            result.impostor_histogram.extend(distribution.impostor.tolist())
+            thresholds, far, frr = distribution.errorRates()
+            result.thresholds.extend(thresholds.tolist())
+            result.far.extend(far.tolist())
+            result.frr.extend(frr.tolist())
+            yield result
+
+            stop = time.time()
+            pairs = result.genuine_count + result.impostor_count
+            notes = "Scored %d pairs of %d faces in %d tiles - %0.1f per second"%(pairs,n_faces,tile_count,pairs/max(stop-start,1e-6))
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"matchDistribution()",notes,context.peer())))
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def _pairScores(self, gallery_name, stamp, gallery, n_faces):
+        '''
+        Score the square tiles on and above the diagonal of the distance
+        matrix of a gallery in the workers.  Yields (probe_start,
+        gallery_start, scores) for each tile in order.
+        '''
+        # Each tile and one temporary copy fit in the memory budget
+        tile_rows = max(1,int(np.sqrt(self.score_memory_mb*1024*1024/8)))
+
+        # Keep one tile in flight for each worker
+        jobs = []
+        tiles = list(pairTiles(n_faces,tile_rows))
+        for i,tile in enumerate(tiles):
+            jobs.append((tile,self.workers.apply_async(worker_scoreTile,[gallery_name,stamp,tile])))
+            while len(jobs) >= self.worker_count or (i+1 == len(tiles) and len(jobs) > 0):
+                done, job = jobs.pop(0)
+                yield done[0], done[2], self._tileScores(gallery_name,stamp,gallery,done,job)
+
+
+    def _tileScores(self, gallery_name, stamp, gallery, tile, job):
+        ''' Wait for a tile scored by a worker, sending the gallery if the worker does not hold it. '''
+        scores = job.get()
+        if scores is None:
+            scores = self.workers.apply_async(worker_scoreTile,[gallery_name,stamp,tile,gallery]).get()
+        return scores
+
     def score(self,request,context):
         try:
             start = time.time()
@@ -560,6 +798,71 @@ class FaceService(fs.FaceRecognitionServicer):
             traceback.print_exc()
             raise
 
+
+    def scoreStream(self,request,context):
+        '''
+        Score the probes against the gallery and stream the distance matrix
+        in blocks of probe rows.  Each block is scored by a worker so only a
+        few blocks are in memory at a time.  The scored blocks are sized by
+        the memory budget and split again into messages that fit the maximum
+        message size.
+        '''
+        try:
+            start = time.time()
+
+            face_probes = request.face_probes.face_records
+            template_probes = request.template_probes.templates
+            n_probes = max(len(face_probes),len(template_probes))
+            n_gallery = max(len(request.face_gallery.face_records),len(request.template_gallery.templates))
+            block_rows = max(1,int(self.score_memory_mb*1024*1024)//(4*max(n_gallery,1)))
+
+            # Keep one block in flight for each worker
+            jobs = []
+            for probe_start in range(0,n_probes,block_rows):
+                block = fsd.ScoreRequest()
+                block.face_probes.face_records.extend(face_probes[probe_start:probe_start+block_rows])
+                block.template_probes.templates.extend(template_probes[probe_start:probe_start+block_rows])
+                block.face_gallery.CopyFrom(request.face_gallery)
+                block.template_gallery.CopyFrom(request.template_gallery)
+                jobs.append((probe_start,self.workers.apply_async(worker_score,[block])))
+                if len(jobs) >= self.worker_count:
+                    probe_start, job = jobs.pop(0)
+                    for block in self._scoreBlocks(probe_start,0,pt.matrix_proto2np(job.get())):
+                        yield block
+            while len(jobs) > 0:
+                probe_start, job = jobs.pop(0)
+                for block in self._scoreBlocks(probe_start,0,pt.matrix_proto2np(job.get())):
+                    yield block
+
+            stop = time.time()
+            notes = "Matrix %dX%d in blocks of %d probes - %0.1f per second"%(n_probes,n_gallery,block_rows,n_probes*n_gallery/max(stop-start,1e-6))
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"scoreStream()",notes,context.peer())))
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def _scoreBlocks(self, probe_start, gallery_start, dist_mat):
+        '''
+        Pack a block of the distance matrix into ScoreBlocks that each fit in
+        one message.  Blocks are split by probe rows, and also by gallery
+        columns if a single row is too large.
+        '''
+        values = max(1,(self.max_message_size-SCORE_BLOCK_OVERHEAD)//4)
+        n_probes, n_gallery = dist_mat.shape
+        cols = max(1,min(n_gallery,values))
+        rows = max(1,values//cols)
+        for row in range(0,n_probes,rows):
+            for col in range(0,max(n_gallery,1),cols):
+                scores = dist_mat[row:row+rows,col:col+cols]
+                block = fsd.ScoreBlock()
+                block.probe_start = probe_start + row
+                block.gallery_start = gallery_start + col
+                block.probe_count, block.gallery_count = scores.shape
+                block.scores = np.ascontiguousarray(scores,dtype='<f4').tobytes()
+                yield block
+
             
     def galleryList(self, request, context):
         ''' List the galleries hosted by this service. '''
@@ -574,14 +877,18 @@ class FaceService(fs.FaceRecognitionServicer):
             #gallery_name = request.enroll_gallery
 
             count = 0
-            for gallery_name in self.gallery_worker.galleryNames():
+            # The statistics are kept up to date by the gallery worker so the
+            # gallery files are not read.
+            for gallery_name,stats in self.gallery_worker.galleryStats().items():
 
                 item = result.galleries.add()
                 item.gallery_name=gallery_name
-                item.face_count= self.gallery_worker.size(gallery_name)
-                #print("Name:",gallery_name)
-                #print("Size:",len(GALLERIES[gallery_name]))
-                #print()
+                item.face_count = stats['faces']
+                item.subject_count = stats['subjects']
+                item.template_dim = stats['dim']
+                item.file_bytes = stats['bytes']
+                item.index_state = stats['index']
+                item.modified = stats['modified']
                 count += 1
                 
             stop = time.time()
@@ -620,6 +927,108 @@ class FaceService(fs.FaceRecognitionServicer):
             raise
 
 
+    def galleryConfigure(self, request, context):
+        ''' Change the settings of a gallery. '''
+        try:
+            start = time.time()
+
+            gallery_name = request.gallery_name
+
+            notes = []
+            if request.index_quantization:
+                self.gallery_worker.setIndexQuantization(gallery_name,request.index_quantization)
+                notes.append("index_quantization=%s"%(request.index_quantization,))
+
+            stop = time.time()
+            notes = "%s: %s"%(gallery_name,' '.join(notes))
+
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"galleryConfigure()",notes,context.peer())))
+
+            return Empty()
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def galleryCompact(self, request, context):
+        ''' Rewrite a gallery file to reclaim the space used by deleted faces. '''
+        result = self.passthrough(inspect.currentframe().f_code.co_name,request)
+        if result:
+            return result
+        try:
+            start = time.time()
+
+            gallery_name = request.gallery_name
+
+            stats = self.gallery_worker.compactGallery(gallery_name)
+
+            result = fsd.GalleryCompactResponse()
+            result.gallery_name = gallery_name
+            result.face_count = stats['face_count']
+            result.rows_removed = stats['rows_removed']
+            result.bytes_before = stats['bytes_before']
+            result.bytes_after = stats['bytes_after']
+            result.bytes_reclaimed = stats['bytes_before'] - stats['bytes_after']
+            result.compact_time = stats['compact_time']
+
+            stop = time.time()
+            notes = "%d rows and %d bytes reclaimed."%(result.rows_removed,result.bytes_reclaimed)
+
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"galleryCompact()",notes,context.peer())))
+
+            return result
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def galleryExport(self, request, context):
+        ''' Stream the faces of a gallery as bulk chunks. '''
+        try:
+            start = time.time()
+
+            face_count = 0
+            for chunk in self.gallery_worker.exportGallery(request.gallery_name, request.start_row, request.file_id,
+                                                           request.chunk_size, request.include_views):
+                face_count += len(chunk.records.face_records)
+                yield chunk
+
+            stop = time.time()
+            notes = "%d faces exported from row %d. %0.1f faces per second."%(face_count,request.start_row,face_count/max(stop-start,1e-6))
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"galleryExport()",notes,context.peer())))
+        except:
+            traceback.print_exc()
+            raise
+
+
+    def galleryImport(self, request_iterator, context):
+        ''' Enroll a stream of exported chunks and acknowledge each chunk after it is stored. '''
+        try:
+            start = time.time()
+
+            response = fsd.GalleryImportResponse()
+            for chunk in request_iterator:
+                enrolled,replaced = self.gallery_worker.importChunk(chunk.gallery_name, chunk)
+
+                response.gallery_name = chunk.gallery_name
+                response.file_id = chunk.file_id
+                response.next_row = chunk.next_row
+                response.enroll_count += enrolled
+                response.replace_count += replaced
+                yield response
+
+            stop = time.time()
+            notes = "Imported %d faces with %d replacements. %0.1f faces per second."%(response.enroll_count,response.replace_count,response.enroll_count/max(stop-start,1e-6))
+            global LOG_FORMAT
+            print(( LOG_FORMAT%(pv.timestamp(),stop-start,"galleryImport()",notes,context.peer())))
+        except:
+            traceback.print_exc()
+            raise
+
+
     def enrollmentList(self, request, context):
         ''' List the faces enrolled in this '''
         start = time.time()
@@ -730,44 +1139,36 @@ class FaceService(fs.FaceRecognitionServicer):
             probes = request.probes
             max_results = request.max_results
             threshold = request.threshold
-            matched = 0
+            search_filter = request.filter if request.HasField('filter') else None
 
             if len(probes.face_records) > 0: # if there are no probes then skip the search
                 
                 if self.gallery_worker.isSearchable():
                     self.gallery_worker.generateIndex(search_gallery)
-                    probes = self.gallery_worker.search(search_gallery,probes,max_results,threshold)
+                    probes = self.gallery_worker.search(search_gallery,probes,max_results,threshold,request.nprobe,search_filter)
 
                 else:
-                    gallery = self.gallery_worker.getAllFaceRecords(search_gallery)
-                        
-                    score_request = fsd.ScoreRequest()
-                    score_request.face_probes.CopyFrom(probes)
-                    score_request.face_gallery.CopyFrom(gallery)
-
-                    # Compute the scores matrix
-                    scores = self.score(score_request,context)
-                    scores = pt.matrix_proto2np(scores)
+                    # The gallery templates are parsed once per gallery version
+                    stamp, face_ids, _, gallery, filters = self.gallery_worker.galleryTemplates(search_gallery)
+                    allowed = filters.mask(search_filter) if isFiltered(search_filter) else None
+
+                    scores = np.zeros((len(probes.face_records),0),dtype=np.float32)
+                    if len(face_ids) > 0 and (allowed is None or allowed.any()):
+                        scores = self._searchScores(probes,search_gallery,stamp,gallery)
+                    else:
+                        allowed = None
                     
+                    matches = selectMatches(scores,max_results,threshold,allowed)
                     for p in range(scores.shape[0]):
-                        #probe = probes.face_records[p]
-                        #out = result.probes.face_records[p].search_results
-                        matches = []
-                        for g in range(scores.shape[1]):
-                            score = scores[p,g]
-                            if score > threshold:
+                        # Only the returned faces are read with their views
+                        for g in matches[p]:
+                            try:
+                                face = self.gallery_worker.getFaceRecord(search_gallery,face_ids[g])
+                            except KeyError:
+                                # The face was deleted after the templates were read
                                 continue
-                            matches.append( [ score, gallery.face_records[g] ] )
-                        
-                        matches.sort(key=lambda x: x[0])
-                        
-                        if max_results > 0:
-                            matches = matches[:max_results]
-                            matched += 1
-                        
-                        for score,face in matches:
                             probes.face_records[p].search_results.face_records.add().CopyFrom(face)
-                            probes.face_records[p].search_results.face_records[-1].score=score
+                            probes.face_records[p].search_results.face_records[-1].score=scores[p,g]
           
             # Count the matches
             count = len(probes.face_records)
@@ -789,6 +1190,23 @@ class FaceService(fs.FaceRecognitionServicer):
 
 
     
+    def _searchScores(self, probes, gallery_name, stamp, gallery):
+        '''
+        Score the probe templates against a gallery in a pool worker and
+        return the scores matrix.  Only the probes are sent unless the worker
+        does not hold the gallery for this stamp, in which case the call is
+        repeated with the templates.
+        '''
+        probe_templates = TemplateList()
+        for face in probes.face_records:
+            probe_templates.templates.add().CopyFrom(face.template)
+
+        scores = self.workers.apply_async(worker_searchScore,[probe_templates,gallery_name,stamp]).get()
+        if scores is None:
+            scores = self.workers.apply_async(worker_searchScore,[probe_templates,gallery_name,stamp,gallery]).get()
+        return scores
+
+
     def verify(self,face_template,gallery_name):
         ''' Verify a that two face templates are the same person. '''
         
@@ -949,6 +1367,39 @@ def parseOptions(face_workers_list):
     parser.add_option( "--storage", type="str", dest="storage_dir", default=faro.DEFAULT_STORAGE_DIR,
                       help="A location to store persistant files. DEFAULT=%s"%faro.DEFAULT_STORAGE_DIR)
 
+    parser.add_option( "--gallery-cache-size", type="int", dest="gallery_cache_size", default=DEFAULT_MAX_OPEN,
+                      help="The maximum number of galleries kept open. 0 for no limit. DEFAULT=%d"%DEFAULT_MAX_OPEN)
+
+    parser.add_option( "--gallery-cache-mb", type="float", dest="gallery_cache_mb", default=DEFAULT_MAX_MB,
+                      help="The estimated memory budget in megabytes for open galleries. 0 for no limit. DEFAULT=%d"%DEFAULT_MAX_MB)
+
+    parser.add_option( "--gallery-backend", type="choice", choices=GALLERY_BACKENDS, dest="gallery_backend", default='hdf5',
+                      help="The storage backend for new galleries [%s]. sqlite lets searches read a gallery while faces are being enrolled. Existing galleries keep their backend. DEFAULT=hdf5"%(', '.join(GALLERY_BACKENDS),))
+
+    parser.add_option( "--index-quantization", type="choice", choices=QUANTIZATIONS, dest="index_quantization", default='none',
+                      help="The default search index quantization for galleries [%s]. Quantized indexes select candidates with compact templates and rescore them with float32 templates. DEFAULT=none"%(', '.join(QUANTIZATIONS),))
+
+    parser.add_option( "--log-commit-ms", type="float", dest="log_commit_ms", default=1000*COMMIT_INTERVAL,
+                      help="Maximum milliseconds an enroll or delete waits in the gallery log to be committed with others. DEFAULT=%g"%(1000*COMMIT_INTERVAL,))
+
+    parser.add_option( "--log-commit-records", type="int", dest="log_commit_records", default=COMMIT_RECORDS,
+                      help="Commit the gallery log as soon as this many faces are waiting. DEFAULT=%d"%(COMMIT_RECORDS,))
+
+    parser.add_option( "--gallery-shards", type="int", dest="gallery_shards", default=0,
+                      help="Split every gallery into N shards that are stored and searched by separate processes. 0 keeps the galleries in the server process. DEFAULT=0")
+
+    parser.add_option( "--blas-threads", type="int", dest="blas_threads", default=0,
+                      help="Limit the BLAS threads used for scoring in each process. Set it when several workers or concurrent searches share the cores. Requires threadpoolctl. 0 keeps the library default. DEFAULT=0")
+
+    parser.add_option( "--ivf-lists", type="int", dest="ivf_lists", default=0,
+                      help="Number of inverted lists for algorithms with approximate gallery search. 0 chooses from the gallery size. DEFAULT=0")
+
+    parser.add_option( "--ivf-nprobe", type="int", dest="ivf_nprobe", default=IVF_DEFAULT_NPROBE,
+                      help="Inverted lists scored for each probe by approximate gallery search unless the request sets nprobe. DEFAULT=%d"%(IVF_DEFAULT_NPROBE,))
+
+    parser.add_option( "--score-memory-mb", type="float", dest="score_memory_mb", default=SCORE_MEMORY_MB,
+                      help="Memory budget for the temporary arrays used to score a block of templates. Large score requests are computed in tiles that fit the budget. DEFAULT=%d"%(SCORE_MEMORY_MB,))
+
     model_options = parser.add_option_group("Options for machine learning models.")
     model_options.add_option( "--detect-model", type="str", dest="detect_model", default='default',
                       help="A model file to use for detection.")
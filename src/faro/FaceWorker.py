@@ -34,6 +34,7 @@ import scipy as sp
 import socket
 import scipy.spatial as spat          
 from faro.FaceGallery import GalleryWorker
+from faro.FaceScoring import scoreMatrix
 
 # Standard scores can be computed by the client which may offer 
 # performance benefits.  In some cases scores can only be computed 
@@ -119,19 +120,59 @@ class FaceWorker(object):
             gal_mat = [pt.vector_proto2np(template.data) for template in score_request.template_gallery.templates]
         gal_mat = np.array(gal_mat,dtype=np.float32)
                 
-        # Compute the distance
-        if score_type == fsd.L1:
-            dist_mat = spat.distance_matrix(probe_mat,gal_mat,1)
-        elif score_type == fsd.L2:
-            dist_mat = spat.distance_matrix(probe_mat,gal_mat,2)
-        elif score_type == fsd.NEG_DOT:
-            dist_mat = -np.dot(probe_mat,gal_mat.T)
-        else:
-            NotImplementedError("ScoreType %s is not implemented."%(score_type,))
+        # Compute the distance in tiles that fit in the memory budget
+        dist_mat = scoreMatrix(probe_mat,gal_mat,score_type)
         
         # Return the result
         return pt.matrix_np2proto(dist_mat)
-        
+
+    def prepareGallery(self, templates):
+        '''Convert gallery templates to the form used by scoreGallery.
+
+        templates is a TemplateList or a (faces, dim) float32 matrix.  The
+        result is kept by the worker process and reused for every search of
+        the gallery until it changes.
+        '''
+        if self.scoreType() in [fsd.L1,fsd.L2,fsd.NEG_DOT]:
+            if isinstance(templates,np.ndarray):
+                return templates
+            return np.array([pt.vector_proto2np(template.data) for template in templates.templates],dtype=np.float32)
+
+        # Other score types are computed by score
+        request = fsd.ScoreRequest()
+        if isinstance(templates,np.ndarray):
+            for vec in templates:
+                request.template_gallery.templates.add().data.data.extend(vec.tolist())
+        else:
+            request.template_gallery.CopyFrom(templates)
+        return request
+
+    def scoreGallery(self, probes, gallery):
+        '''Score a TemplateList of probes against a gallery from prepareGallery.
+
+        Returns a (probes, gallery) numpy matrix.
+        '''
+        if isinstance(gallery,np.ndarray):
+            probe_mat = np.array([pt.vector_proto2np(template.data) for template in probes.templates],dtype=np.float32)
+            return scoreMatrix(probe_mat,gallery,self.scoreType())
+
+        gallery.template_probes.CopyFrom(probes)
+        return pt.matrix_proto2np(self.score(gallery))
+
+    def scoreGalleryTile(self, gallery, probe_start, probe_stop, gallery_start, gallery_stop):
+        '''Score a block of gallery rows against another block of the same gallery.
+
+        gallery comes from prepareGallery.  Returns a (probe rows, gallery rows)
+        numpy matrix.
+        '''
+        if isinstance(gallery,np.ndarray):
+            return scoreMatrix(gallery[probe_start:probe_stop],gallery[gallery_start:gallery_stop],self.scoreType())
+
+        request = fsd.ScoreRequest()
+        request.template_probes.templates.extend(gallery.template_gallery.templates[probe_start:probe_stop])
+        request.template_gallery.templates.extend(gallery.template_gallery.templates[gallery_start:gallery_stop])
+        return pt.matrix_proto2np(self.score(request))
+
     def version(self):
         '''Returns a three item tuple of algorithm name, version number, 
         configuration notes. '''
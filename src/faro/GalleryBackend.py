@@ -0,0 +1,404 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+The storage backend interface for gallery files.
+
+A backend stores the faces of one gallery in rows.  Row ids start at zero
+and increase as faces are appended, and a deleted row keeps its id until the
+gallery is compacted into a new file.  The gallery worker, the write-ahead
+log and the search indexes only use the methods of GalleryBackend so the
+file format is chosen per gallery:
+
+    hdf5   - GalleryStore, a columnar HDF5 file.  Reads are serialized with
+             the writer by the h5py library lock.
+    sqlite - SQLiteGalleryStore, a SQLite database in WAL mode.  Each reading
+             thread has its own connection and reads a consistent snapshot
+             while faces are being enrolled.
+
+Changes are only made by one writer at a time while holding the store lock.
+'''
+
+import os
+import threading
+
+import numpy as np
+
+from faro.proto.face_service_pb2 import FaceRecord
+from faro.proto.image_pb2 import Image
+from faro.GalleryBlobs import BlobStore
+
+GALLERY_BACKENDS = ('hdf5','sqlite')
+
+BACKEND_EXTENSIONS = {
+    'hdf5' : '.h5',
+    'sqlite' : '.sqlite',
+    }
+
+# Metadata columns and the FaceRecord field stored in each
+STRING_COLUMNS = (('subject_ids','subject_id'),('names','name'),('sources','source'))
+
+
+def backendClass(backend):
+    ''' Return the store class for a backend name. '''
+    if backend == 'hdf5':
+        from faro.GalleryStore import GalleryStore
+        return GalleryStore
+    if backend == 'sqlite':
+        from faro.GallerySQLite import SQLiteGalleryStore
+        return SQLiteGalleryStore
+    raise ValueError("Unknown gallery backend '%s'. Choose from %s."%(backend,', '.join(GALLERY_BACKENDS)))
+
+
+def backendOf(filename):
+    ''' Return the backend name for a gallery file name or None if it is not a gallery file. '''
+    for backend,extension in BACKEND_EXTENSIONS.items():
+        if filename.endswith(extension):
+            return backend
+    return None
+
+
+class GalleryBackend(object):
+    '''
+    The interface of a single gallery file.
+
+    Subclasses store the columns of the rows.  This class keeps the in memory
+    mappings from gallery keys and subject ids to the live rows and the
+    parts of appending and deleting that do not depend on the file format.
+    A gallery is read and written through these attributes and methods:
+
+        path, lock, blobs, keys
+        count, version, file_id, log_seq, dim, setVersion
+        size, row, subjectRows, subjectCount, liveRows, isLive
+        append, copyRows, delete
+        faceIds, subjectIds, metadata, viewKeys, templates, readColumns
+        readBlock, getRecord, getRecords, loadView
+        flush, sync, fileBytes, replaceFile, close
+
+    If blob_dir is given the view images of new faces are moved to a blob
+    store in that directory.  Otherwise they are kept in the records.
+    '''
+
+    def __init__(self, path, blob_dir=None):
+        self.path = path
+        self.lock = threading.RLock()
+        self.blobs = BlobStore(blob_dir) if blob_dir is not None else None
+        self.keys = {}
+        self.subjects = {}
+
+    @classmethod
+    def removeFiles(cls, path):
+        ''' Delete a closed gallery file. '''
+        os.remove(path)
+
+    @property
+    def count(self):
+        ''' The number of rows in use, including deleted rows. '''
+        raise NotImplementedError()
+
+    @property
+    def version(self):
+        ''' A counter that changes every time the gallery is modified. '''
+        raise NotImplementedError()
+
+    @property
+    def file_id(self):
+        ''' A random id for this copy of the gallery file. '''
+        raise NotImplementedError()
+
+    @property
+    def log_seq(self):
+        ''' The sequence number of the last write-ahead log entry saved in this file. '''
+        raise NotImplementedError()
+
+    @property
+    def dim(self):
+        ''' The template length or 0 if the gallery does not store vectors. '''
+        raise NotImplementedError()
+
+    def setVersion(self, version):
+        raise NotImplementedError()
+
+    def _writeRows(self, start, columns, valid):
+        '''
+        Write rows start to start+len(valid) from a dict of columns in the
+        format returned by readColumns, set the row count, and increment the
+        version.
+        '''
+        raise NotImplementedError()
+
+    def _clearValid(self, rows):
+        ''' Mark rows in increasing order as deleted and increment the version. '''
+        raise NotImplementedError()
+
+    def liveRows(self):
+        ''' Return the row ids of all live faces in row order. '''
+        raise NotImplementedError()
+
+    def isLive(self, rows):
+        ''' Return a boolean array that is true for the rows that have not been deleted. '''
+        raise NotImplementedError()
+
+    def faceIds(self, rows):
+        raise NotImplementedError()
+
+    def subjectIds(self, rows):
+        raise NotImplementedError()
+
+    def metadata(self, rows):
+        '''
+        Return a dict of name, subject_id, source and frame lists for rows in
+        increasing order without parsing the face records.
+        '''
+        raise NotImplementedError()
+
+    def viewKeys(self, rows):
+        raise NotImplementedError()
+
+    def templates(self, start=0, stop=None):
+        ''' Read a contiguous block of the template matrix. '''
+        raise NotImplementedError()
+
+    def readColumns(self, rows):
+        '''
+        Read every column of rows in increasing order without parsing the
+        records.  Returns a dict with lists of 'records' (bytes), 'face_ids',
+        'subject_ids', 'names', 'sources', 'frames' and 'view_keys', and the
+        (rows, dim) 'templates' matrix or None.
+        '''
+        raise NotImplementedError()
+
+    def readBlock(self, start, stop, view=False):
+        '''
+        Read the live faces in rows start to stop with a few large reads.
+        Returns the row ids, the face records without template data, and the
+        (faces, dim) template matrix.
+        '''
+        raise NotImplementedError()
+
+    def _readRecord(self, row, view):
+        ''' Return the record bytes, template vector or None, and view key ('' unless view is true) of a row. '''
+        raise NotImplementedError()
+
+    def flush(self, log_seq=None):
+        ''' Write changes to disk.  log_seq records the last log entry included in the file. '''
+        raise NotImplementedError()
+
+    def sync(self):
+        ''' Flush the file and wait for the operating system to write it and any new view blobs to disk. '''
+        raise NotImplementedError()
+
+    def replaceFile(self, new_path):
+        '''
+        Atomically replace the gallery file with the file at new_path and
+        reopen it.  The new file must already be synced to disk.
+        '''
+        raise NotImplementedError()
+
+    def close(self):
+        raise NotImplementedError()
+
+    def _addRow(self, face_id, subject_id, row):
+        self.keys[face_id] = row
+        self.subjects.setdefault(subject_id,set()).add(row)
+
+    def _removeRow(self, face_id, subject_id, row):
+        if self.keys.get(face_id) == row:
+            del self.keys[face_id]
+        subject_rows = self.subjects.get(subject_id,set())
+        subject_rows.discard(row)
+        if len(subject_rows) == 0:
+            self.subjects.pop(subject_id,None)
+
+    def size(self):
+        ''' The number of live faces. '''
+        return len(self.keys)
+
+    def row(self, face_id):
+        ''' Look up the row for a gallery key. '''
+        return self.keys[face_id]
+
+    def subjectRows(self, subject_id):
+        ''' Return the live rows enrolled for a subject in row order. '''
+        return sorted(self.subjects.get(subject_id,()))
+
+    def subjectCount(self):
+        return len(self.subjects)
+
+    def append(self, faces, templates=None):
+        '''
+        Append face records to the end of the gallery.
+
+        Faces that already exist in the gallery are replaced.  Returns the
+        row ids of the new faces and the row ids that were deleted because
+        they were replaced, including earlier copies of a key repeated in the
+        batch.  If templates is given it is a (faces, dim) matrix that is
+        used instead of the template data in the records.
+        '''
+        with self.lock:
+            faces = list(faces)
+            n = len(faces)
+            if n == 0:
+                return [], []
+
+            if templates is None:
+                vectors = [np.array(face.template.data.data,dtype=np.float32) for face in faces]
+                dim = vectors[0].shape[0]
+                for vec in vectors:
+                    if vec.shape[0] != dim:
+                        raise ValueError("All templates in a gallery must have the same length.")
+            else:
+                vectors = templates
+                dim = templates.shape[1]
+            if dim > 0 and self.dim not in (0,dim):
+                raise ValueError("Template length %d does not match the gallery template length %d."%(dim,self.dim))
+            if dim == 0 and self.dim > 0:
+                raise ValueError("Face records must contain a template vector for this gallery.")
+
+            # Replace existing faces by deleting the old rows.
+            replaced_rows = []
+            seen = {}
+            for i,face in enumerate(faces):
+                if face.gallery_key in self.keys:
+                    replaced_rows.append(self.keys[face.gallery_key])
+                seen[face.gallery_key] = i
+            self.delete(replaced_rows)
+
+            columns = {
+                'records' : [],
+                'face_ids' : [face.gallery_key for face in faces],
+                'frames' : [face.frame for face in faces],
+                'view_keys' : [],
+                'templates' : np.array(vectors,dtype=np.float32) if dim > 0 else None,
+                }
+            for name,field in STRING_COLUMNS:
+                columns[name] = [getattr(face,field) for face in faces]
+            for face in faces:
+                record = FaceRecord()
+                record.CopyFrom(face)
+                if dim > 0:
+                    record.template.ClearField('data')
+                view_key = ''
+                if self.blobs is not None and record.HasField('view') and record.view.type != Image.URL:
+                    view_key = self.blobs.put(record.view)
+                    record.ClearField('view')
+                columns['records'].append(record.SerializeToString())
+                columns['view_keys'].append(view_key)
+
+            # Only the last copy of a duplicated key in the batch stays live.
+            valid = np.zeros((n,),dtype=np.uint8)
+            for i in seen.values():
+                valid[i] = 1
+
+            start = self.count
+            self._writeRows(start,columns,valid)
+
+            rows = list(range(start,start+n))
+            for key,i in seen.items():
+                self._addRow(key,faces[i].subject_id,rows[i])
+            replaced_rows += [rows[i] for i in range(n) if not valid[i]]
+
+            return rows, replaced_rows
+
+    def copyRows(self, source, rows):
+        '''
+        Append live rows of another store in increasing order without parsing
+        the records.  Used to write a compacted copy of a gallery.  The source
+        may use a different backend.  Returns the new row ids.
+        '''
+        with self.lock:
+            rows = np.asarray(rows,dtype=np.int64)
+            n = len(rows)
+            if n == 0:
+                return []
+
+            dim = source.dim
+            if dim > 0 and self.dim not in (0,dim):
+                raise ValueError("Template length %d does not match the gallery template length %d."%(dim,self.dim))
+
+            columns = source.readColumns(rows)
+            start = self.count
+            self._writeRows(start,columns,np.ones((n,),dtype=np.uint8))
+
+            new_rows = list(range(start,start+n))
+            for i,row in enumerate(new_rows):
+                self._addRow(columns['face_ids'][i],columns['subject_ids'][i],row)
+
+            return new_rows
+
+    def delete(self, rows):
+        ''' Mark rows as deleted.  The space is reclaimed when the gallery is compacted. '''
+        with self.lock:
+            if len(rows) == 0:
+                return 0
+            rows = np.unique(np.asarray(rows,dtype=np.int64))
+            face_ids = self.faceIds(rows)
+            subject_ids = self.subjectIds(rows)
+
+            self._clearValid(rows)
+
+            for row,face_id,subject_id in zip(rows.tolist(),face_ids,subject_ids):
+                self._removeRow(face_id,subject_id,row)
+            return len(rows)
+
+    def _parseRecords(self, records, view_keys=None):
+        ''' Parse stored records and load their views if view_keys is given. '''
+        faces = []
+        for i,data in enumerate(records):
+            face = FaceRecord()
+            face.ParseFromString(data)
+            if view_keys is not None:
+                self.loadView(face,view_keys[i])
+            faces.append(face)
+        return faces
+
+    def getRecord(self, row, view=True):
+        '''
+        Read the face record stored in a row.  The view image is only read
+        from the blob store if view is true.
+        '''
+        data, template, view_key = self._readRecord(row,view)
+        face = FaceRecord()
+        face.ParseFromString(data)
+        if template is not None:
+            face.template.data.data.extend(template)
+        if view:
+            self.loadView(face,view_key)
+        return face
+
+    def getRecords(self, rows, view=True):
+        return [self.getRecord(row,view) for row in rows]
+
+    def loadView(self, face, view_key):
+        ''' Copy the view stored under view_key into a face record. '''
+        if not view_key:
+            return
+        if self.blobs is None:
+            raise ValueError("Gallery '%s' stores views in a blob store that was not opened."%(self.path,))
+        face.view.CopyFrom(self.blobs.get(view_key))
+
+    def fileBytes(self):
+        ''' The number of bytes used on disk by the gallery file and its view blobs. '''
+        nbytes = os.path.getsize(self.path)
+        if self.blobs is not None:
+            nbytes += self.blobs.size()
+        return nbytes
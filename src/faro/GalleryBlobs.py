@@ -0,0 +1,139 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Content addressed storage for face view images.
+
+Face workers attach an uncompressed view image to every face record.  The
+view is much larger than the rest of the record, so galleries keep it out of
+the gallery file.  Each view is compressed as a jpeg and written to its own
+file in a blob directory next to the gallery:
+
+    <gallery>.blobs/<first two hex digits>/<sha1 of the blob>
+
+The blob is a serialized Image message so the size and capture information
+are kept with the pixels.  The gallery only stores the sha1 key and the view
+is read back when a record is requested.  Identical views are only stored
+once.  Blobs are not removed when a face is deleted because other faces may
+share them.  Unreferenced blobs are removed when the gallery is compacted.
+'''
+
+import hashlib
+import os
+
+import cv2
+import numpy as np
+
+from faro.proto.image_pb2 import Image
+
+VIEW_JPEG_QUALITY = 95
+
+
+def compressView(view):
+    ''' Return a jpeg copy of an uncompressed view.  Views that are already compressed are returned as is. '''
+    if view.type != Image.UINT8 or view.channels != 3:
+        return view
+    im = np.frombuffer(view.data,dtype=np.uint8).reshape(view.height,view.width,view.channels)
+    # Uncompressed views are stored in the reverse channel order of decoded jpegs.  See proto_types.
+    im = np.ascontiguousarray(im[:,:,::-1])
+    result = Image()
+    result.CopyFrom(view)
+    result.type = Image.JPG
+    result.data = cv2.imencode('.jpg',im,[int(cv2.IMWRITE_JPEG_QUALITY),VIEW_JPEG_QUALITY])[1].tobytes()
+    return result
+
+
+class BlobStore(object):
+    ''' A directory of immutable blobs named by their sha1 hash. '''
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.unsynced = []
+        self.nbytes = None # Counted on first use and then kept up to date
+
+    def path(self, key):
+        return os.path.join(self.directory,key[:2],key)
+
+    def put(self, view):
+        ''' Compress and store a view image and return its key. '''
+        data = compressView(view).SerializeToString()
+        key = hashlib.sha1(data).hexdigest()
+        path = self.path(key)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path),exist_ok=True)
+            with open(path+'.tmp','wb') as f:
+                f.write(data)
+            os.rename(path+'.tmp',path)
+            self.unsynced.append(path)
+            if self.nbytes is not None:
+                self.nbytes += len(data)
+        return key
+
+    def get(self, key):
+        ''' Read the view image stored under a key. '''
+        view = Image()
+        with open(self.path(key),'rb') as f:
+            view.ParseFromString(f.read())
+        return view
+
+    def keys(self):
+        ''' Iterate over the keys of the stored blobs. '''
+        if not os.path.isdir(self.directory):
+            return
+        for prefix in sorted(os.listdir(self.directory)):
+            for name in sorted(os.listdir(os.path.join(self.directory,prefix))):
+                if not name.endswith('.tmp'):
+                    yield name
+
+    def size(self):
+        ''' The number of bytes used by the blobs. '''
+        if self.nbytes is None:
+            self.nbytes = sum(os.path.getsize(self.path(key)) for key in self.keys())
+        return self.nbytes
+
+    def collect(self, keep):
+        ''' Remove the blobs that are not in keep and return the number of bytes freed. '''
+        freed = 0
+        removed = set()
+        for key in list(self.keys()):
+            if key not in keep:
+                path = self.path(key)
+                freed += os.path.getsize(path)
+                os.remove(path)
+                removed.add(path)
+        self.unsynced = [path for path in self.unsynced if path not in removed]
+        if self.nbytes is not None:
+            self.nbytes -= freed
+        return freed
+
+    def sync(self):
+        ''' Wait for the operating system to write the new blobs and their directories to disk. '''
+        paths = self.unsynced
+        self.unsynced = []
+        if len(paths) > 0:
+            paths += sorted(set(os.path.dirname(path) for path in paths)) + [self.directory]
+        for path in paths:
+            fd = os.open(path,os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
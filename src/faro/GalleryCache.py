@@ -0,0 +1,234 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+A bounded cache of open gallery stores.
+
+The cache keeps the open galleries in least recently used order.  When the
+number of open galleries or their estimated memory use goes over the budget
+the least recently used galleries are reported as eviction candidates.
+Galleries that are pinned by a running request are never evicted.
+
+A gallery can also be drained.  New requests for a draining gallery wait
+until it is released, so the caller can wait for the running requests to
+finish and then safely replace the gallery file.
+'''
+
+import collections
+import threading
+
+DEFAULT_MAX_OPEN = 256  # Maximum number of open galleries
+DEFAULT_MAX_MB = 0      # Memory budget in megabytes, 0 for no limit
+
+
+class GalleryCache(object):
+    ''' An LRU mapping from gallery name to an open GalleryStore. '''
+
+    def __init__(self, max_open=DEFAULT_MAX_OPEN, max_mb=DEFAULT_MAX_MB):
+        self.lock = threading.RLock()
+        self.cond = threading.Condition(self.lock)
+        self.stores = collections.OrderedDict()
+        self.pins = {}
+        self.sizes = {}
+        self.draining = set()
+        self.opening = set()
+        self.configure(max_open,max_mb)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_open, max_mb):
+        self.max_open = max_open
+        self.max_bytes = int(max_mb*1024*1024)
+
+    def __contains__(self, gallery_name):
+        return gallery_name in self.stores
+
+    def __getitem__(self, gallery_name):
+        return self.stores[gallery_name]
+
+    def __setitem__(self, gallery_name, store):
+        with self.lock:
+            self.stores[gallery_name] = store
+            self.stores.move_to_end(gallery_name)
+
+    def __delitem__(self, gallery_name):
+        with self.lock:
+            del self.stores[gallery_name]
+            self.sizes.pop(gallery_name,None)
+            self.opening.discard(gallery_name)
+
+    def __iter__(self):
+        return iter(list(self.stores))
+
+    def __len__(self):
+        return len(self.stores)
+
+    def get(self, gallery_name, default=None):
+        return self.stores.get(gallery_name,default)
+
+    def add(self, gallery_name, store):
+        '''
+        Add a gallery that is still being opened.  hit and acquire treat it
+        as a miss until opened is called, so callers that do not hold the open
+        lock never see a half opened gallery.
+        '''
+        with self.lock:
+            self.opening.add(gallery_name)
+            self[gallery_name] = store
+
+    def opened(self, gallery_name):
+        ''' Mark a gallery added with add as ready for use. '''
+        with self.lock:
+            self.opening.discard(gallery_name)
+
+    def hit(self, gallery_name):
+        ''' Record a use of an open gallery and return its store, or None if it is not open. '''
+        with self.lock:
+            store = self.stores.get(gallery_name)
+            if store is None or gallery_name in self.opening:
+                return None
+            self.hits += 1
+            self.stores.move_to_end(gallery_name)
+            return store
+
+    def acquire(self, gallery_name):
+        '''
+        Pin an open gallery and return its store.  Returns None if the gallery
+        is not open, is still being opened or is being drained.  The lookup,
+        the use and the pin are made under one lock so the gallery can not be
+        closed in between.
+        '''
+        with self.lock:
+            store = self.stores.get(gallery_name)
+            if store is None or gallery_name in self.draining or gallery_name in self.opening:
+                return None
+            self.hits += 1
+            self.stores.move_to_end(gallery_name)
+            self.pins[gallery_name] = self.pins.get(gallery_name,0) + 1
+            return store
+
+    def miss(self):
+        ''' Record that a gallery had to be opened. '''
+        with self.lock:
+            self.misses += 1
+
+    def pin(self, gallery_name):
+        with self.lock:
+            self.pins[gallery_name] = self.pins.get(gallery_name,0) + 1
+
+    def unpin(self, gallery_name):
+        with self.lock:
+            count = self.pins.get(gallery_name,0) - 1
+            if count > 0:
+                self.pins[gallery_name] = count
+            else:
+                self.pins.pop(gallery_name,None)
+            self.cond.notify_all()
+
+    def isDraining(self, gallery_name):
+        return gallery_name in self.draining
+
+    def waitWhileDraining(self, gallery_name):
+        ''' Block until the gallery is not being drained. '''
+        with self.cond:
+            while gallery_name in self.draining:
+                self.cond.wait()
+
+    def drain(self, gallery_name, pins=0):
+        '''
+        Stop new requests from pinning a gallery and wait for the running
+        requests to finish.  pins is the number of pins held by the caller.
+        '''
+        with self.cond:
+            if gallery_name in self.draining:
+                raise ValueError("Gallery '%s' is already being drained."%(gallery_name,))
+            self.draining.add(gallery_name)
+            while self.pins.get(gallery_name,0) > pins:
+                self.cond.wait()
+
+    def tryDrain(self, gallery_name):
+        ''' Start draining a gallery if no request has it pinned.  Returns True if the gallery is now drained. '''
+        with self.lock:
+            if gallery_name in self.pins or gallery_name in self.draining:
+                return False
+            self.draining.add(gallery_name)
+            return True
+
+    def release(self, gallery_name):
+        ''' Allow requests for a drained gallery to continue. '''
+        with self.cond:
+            self.draining.discard(gallery_name)
+            self.cond.notify_all()
+
+    def setSize(self, gallery_name, nbytes):
+        ''' Set the estimated memory used by an open gallery. '''
+        with self.lock:
+            self.sizes[gallery_name] = nbytes
+
+    def totalBytes(self):
+        return sum(self.sizes.values())
+
+    def _overBudget(self, open_count, nbytes):
+        if self.max_open > 0 and open_count > self.max_open:
+            return True
+        if self.max_bytes > 0 and nbytes > self.max_bytes:
+            return True
+        return False
+
+    def evictionCandidates(self, keep=()):
+        '''
+        Return the least recently used galleries that should be closed to get
+        back under budget.  Pinned galleries and the names in keep are skipped.
+        '''
+        with self.lock:
+            open_count = len(self.stores)
+            nbytes = self.totalBytes()
+            candidates = []
+            for gallery_name in self.stores:
+                if not self._overBudget(open_count,nbytes):
+                    break
+                if gallery_name in self.pins or gallery_name in keep:
+                    continue
+                candidates.append(gallery_name)
+                open_count -= 1
+                nbytes -= self.sizes.get(gallery_name,0)
+            return candidates
+
+    def evicted(self, gallery_name):
+        with self.lock:
+            self.evictions += 1
+
+    def stats(self):
+        ''' Return the cache counters. '''
+        with self.lock:
+            return {
+                'open' : len(self.stores),
+                'pinned' : len(self.pins),
+                'bytes' : self.totalBytes(),
+                'max_open' : self.max_open,
+                'max_bytes' : self.max_bytes,
+                'hits' : self.hits,
+                'misses' : self.misses,
+                'evictions' : self.evictions,
+                }
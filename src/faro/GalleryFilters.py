@@ -0,0 +1,172 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Metadata columns used to filter searches.
+
+A SearchFilter restricts a search to faces of some subjects or sources,
+collection or enrollment date ranges, and attribute values.  The predicates
+are evaluated as numpy masks over columns with one entry per face, so a
+filter costs a few vectorized comparisons instead of parsing face records.
+
+Subject ids, sources, attribute keys and attribute values are stored as
+64 bit hashes of the strings.  Integer and float attribute values are hashed
+as text.  The chance that two different strings share a
+hash is negligible for any realistic gallery.  Attributes are kept in a
+separate table with one entry for each attribute of each face because faces
+have different numbers of attributes.
+'''
+
+import hashlib
+
+import numpy as np
+
+COLUMN_DTYPE = np.dtype([('subject','<i8'),('source','<i8'),('collection_date','<f4'),('enrollment_date','<f4')])
+ATTRIBUTE_DTYPE = np.dtype([('row','<i8'),('key','<i8'),('value','<i8'),('fvalue','<f4')])
+
+DATE_RANGES = (('collection_date','min_collection_date','max_collection_date'),
+               ('enrollment_date','min_enrollment_date','max_enrollment_date'))
+
+
+def filterKey(value):
+    ''' Return the 64 bit hash stored in the columns for a string. '''
+    digest = hashlib.blake2b(value.encode('utf-8'),digest_size=8).digest()
+    return int.from_bytes(digest,'little',signed=True)
+
+
+def _attributeValue(attribute):
+    '''
+    The value of an attribute as the string that filter values are compared
+    to, or None if the attribute holds bytes that can not be filtered on.
+    Floats use the shortest text that reads back as the same float32, so
+    35.2 matches '35.2'.  An attribute with no value set matches '0'.
+    '''
+    if attribute.text:
+        return attribute.text
+    if attribute.buffer or attribute.pickle:
+        return None
+    if attribute.ivalue != 0:
+        return str(attribute.ivalue)
+    if attribute.fvalue != 0.0:
+        return str(np.float32(attribute.fvalue))
+    return '0'
+
+
+def _valueKey(attribute):
+    ''' The hash stored for the value of an attribute.  Byte values are stored as 0 and match no filter value. '''
+    value = _attributeValue(attribute)
+    if value is None:
+        return 0
+    return filterKey(value)
+
+
+def isFiltered(search_filter):
+    ''' Return true if a SearchFilter has any predicate set. '''
+    return search_filter is not None and search_filter.ByteSize() > 0
+
+
+def faceColumns(faces, rows, start, stop):
+    '''
+    Return the filter columns of rows start to stop and the attribute entries
+    of faces, which are the records of the given rows.  Rows without a face
+    are left empty.
+    '''
+    faces = list(faces)
+    positions = np.asarray(rows,dtype=np.int64) - start
+    columns = np.zeros((stop-start,),dtype=COLUMN_DTYPE)
+    columns['subject'][positions] = [filterKey(face.subject_id) for face in faces]
+    columns['source'][positions] = [filterKey(face.source) for face in faces]
+    columns['collection_date'][positions] = [face.collection_date for face in faces]
+    columns['enrollment_date'][positions] = [face.enrollment_date for face in faces]
+
+    attributes = [(row,filterKey(attribute.key),_valueKey(attribute),attribute.fvalue)
+                  for row,face in zip(rows,faces) for attribute in face.attributes]
+    return columns, np.array(attributes,dtype=ATTRIBUTE_DTYPE)
+
+
+class FilterColumns(object):
+    '''
+    The filter columns of a set of faces and the attribute entries that refer
+    to them by row.
+    '''
+
+    def __init__(self, columns, attributes):
+        self.columns = columns
+        self.attributes = attributes
+
+    @classmethod
+    def fromFaces(cls, faces):
+        ''' Build the columns for a list of face records in order. '''
+        faces = list(faces)
+        return cls(*faceColumns(faces,range(len(faces)),0,len(faces)))
+
+    @classmethod
+    def concatenate(cls, parts):
+        ''' Join the columns of several sets of faces in order. '''
+        columns = [part.columns for part in parts]
+        attributes = []
+        offset = 0
+        for part in parts:
+            entries = np.array(part.attributes)
+            entries['row'] += offset
+            attributes.append(entries)
+            offset += len(part)
+        if len(parts) == 0:
+            return cls(np.zeros((0,),dtype=COLUMN_DTYPE),np.zeros((0,),dtype=ATTRIBUTE_DTYPE))
+        return cls(np.concatenate(columns),np.concatenate(attributes))
+
+    def __len__(self):
+        return len(self.columns)
+
+    def _attributeMask(self, attribute_filter):
+        ''' Mark the rows with an attribute that passes an AttributeFilter. '''
+        entries = self.attributes[self.attributes['key'] == filterKey(attribute_filter.key)]
+        if len(attribute_filter.values) > 0:
+            entries = entries[np.isin(entries['value'],[filterKey(value) for value in attribute_filter.values])]
+        if attribute_filter.max_value > attribute_filter.min_value:
+            entries = entries[(entries['fvalue'] > attribute_filter.min_value) & (entries['fvalue'] < attribute_filter.max_value)]
+
+        mask = np.zeros((len(self.columns),),dtype=bool)
+        mask[entries['row']] = True
+        return mask
+
+    def mask(self, search_filter):
+        ''' Return a boolean mask of the rows that pass every predicate of a SearchFilter. '''
+        columns = self.columns
+        mask = np.ones((len(columns),),dtype=bool)
+
+        if len(search_filter.subject_ids) > 0:
+            mask &= np.isin(columns['subject'],[filterKey(subject_id) for subject_id in search_filter.subject_ids])
+        if len(search_filter.sources) > 0:
+            mask &= np.isin(columns['source'],[filterKey(source) for source in search_filter.sources])
+
+        for column,low,high in DATE_RANGES:
+            low, high = getattr(search_filter,low), getattr(search_filter,high)
+            if low != 0:
+                mask &= columns[column] >= low
+            if high != 0:
+                mask &= columns[column] <= high
+
+        for attribute_filter in search_filter.attributes:
+            mask &= self._attributeMask(attribute_filter)
+
+        return mask
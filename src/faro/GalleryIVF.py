@@ -0,0 +1,377 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Approximate nearest neighbour search with an inverted file index.
+
+IVFGalleryWorker is a searchable gallery worker that only scores part of the
+gallery for each probe.  The templates are clustered with k-means and each
+template is placed in the list of its nearest centroid.  A search ranks the
+centroids for each probe and only scores the templates in the nprobe closest
+lists, so the cost of a search grows with nprobe instead of the gallery size.
+Probing more lists gives better recall at a higher cost.  The default nprobe
+can be overridden by each SearchRequest.
+
+The lists are kept next to the search index of the gallery:
+
+    <gallery>.index.ivf.json       - list count, training size and index generation
+    <gallery>.index.ivf.centroids  - raw (lists, dim) float32 centroids
+    <gallery>.index.ivf.assign     - raw int32 list of each index row
+
+New templates are assigned to their lists by the next search and appended to
+the assign file.  Deleted templates are skipped with the live mask of the
+index.  When the index is rebuilt or compacted its rows are renumbered, so
+every row is assigned again to the existing centroids.  The centroids are
+retrained when the gallery grows by IVF_RETRAIN_GROWTH since they were
+trained.  Training and large assignments run in a background thread, and
+the rows that are not in a list yet are scored exactly by every search.
+Galleries smaller than IVF_MIN_ROWS are always searched exactly.
+
+The centroids are ranked by euclidean distance for every score type.  This
+gives the same order as the dot product for normalized templates.
+'''
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+import faro.proto.face_service_pb2 as fsd
+import faro.proto.proto_types as pt
+from faro.FaceGallery import SearchableGalleryWorker, selectMatches
+from faro.FaceScoring import scoreMatrix
+
+IVF_VERSION = 1
+
+IVF_MIN_ROWS = 20000          # Galleries smaller than this are searched exactly
+IVF_DEFAULT_NPROBE = 16       # Lists scored for each probe when the request does not choose
+IVF_TRAIN_ROWS_PER_LIST = 64  # Templates sampled for each list when the centroids are trained
+IVF_TRAIN_ITERATIONS = 10     # k-means iterations
+IVF_RETRAIN_GROWTH = 4.0      # Retrain when the gallery grows by this factor
+IVF_ASSIGN_BLOCK_ROWS = 16384 # Templates assigned at a time, and the most assigned during a search
+IVF_TAIL_ROWS = 65536         # Appended rows kept unsorted before the lists are sorted again
+
+
+def ivfListCount(n):
+    ''' Choose the number of lists for a gallery of n templates. '''
+    return int(np.clip(np.sqrt(n),16,65536))
+
+
+def assignLists(templates, centroids):
+    ''' Return the int32 list of the nearest centroid for each template. '''
+    assign = np.empty((templates.shape[0],),dtype=np.int32)
+    for start in range(0,templates.shape[0],IVF_ASSIGN_BLOCK_ROWS):
+        block = np.asarray(templates[start:start+IVF_ASSIGN_BLOCK_ROWS],dtype=np.float32)
+        assign[start:start+len(block)] = np.argmin(scoreMatrix(block,centroids,fsd.L2),axis=1)
+    return assign
+
+
+def trainCentroids(sample, list_count, iterations=IVF_TRAIN_ITERATIONS, seed=0):
+    ''' Cluster a sample of templates into list_count centroids with k-means. '''
+    rng = np.random.RandomState(seed)
+    sample = np.asarray(sample,dtype=np.float32)
+    centroids = sample[rng.choice(len(sample),list_count,replace=False)].copy()
+
+    for _ in range(iterations):
+        assign = assignLists(sample,centroids)
+        counts = np.bincount(assign,minlength=list_count)
+
+        # Sum the members of each list in one pass over the sorted sample
+        order = np.argsort(assign,kind='stable')
+        used = np.flatnonzero(counts)
+        starts = np.concatenate([[0],np.cumsum(counts[used])[:-1]])
+        centroids[used] = np.add.reduceat(sample[order],starts,axis=0)/counts[used,np.newaxis]
+
+        # Empty lists are moved to random templates
+        empty = np.flatnonzero(counts == 0)
+        if len(empty) > 0:
+            centroids[empty] = sample[rng.choice(len(sample),len(empty),replace=False)]
+
+    return centroids
+
+
+class IVFLists(object):
+    '''
+    The inverted lists of one generation of a search index.  The object is
+    not modified after it is created, so searches can use it without locks.
+    '''
+
+    def __init__(self, centroids, generation, assign, trained_rows, sorted_rows=None, order=None, offsets=None):
+        self.centroids = centroids
+        self.generation = generation
+        self.assign = assign
+        self.trained_rows = trained_rows
+
+        if order is None:
+            # Index positions grouped by list
+            sorted_rows = len(assign)
+            order = np.argsort(assign,kind='stable')
+            offsets = np.concatenate([[0],np.cumsum(np.bincount(assign,minlength=len(centroids)))])
+        self.sorted_rows, self.order, self.offsets = sorted_rows, order, offsets
+
+    def __len__(self):
+        return len(self.assign)
+
+    def extend(self, assign):
+        ''' Return the lists with new index rows appended. '''
+        assign = np.concatenate([self.assign,assign])
+        if len(assign) - self.sorted_rows > IVF_TAIL_ROWS:
+            return IVFLists(self.centroids,self.generation,assign,self.trained_rows)
+        return IVFLists(self.centroids,self.generation,assign,self.trained_rows,self.sorted_rows,self.order,self.offsets)
+
+    def candidates(self, lists, limit):
+        '''
+        Return the index positions below limit in the given lists in
+        increasing order.  limit is the row count of the index snapshot being
+        searched, which may be older than the lists.
+        '''
+        parts = [self.order[self.offsets[l]:self.offsets[l+1]] for l in lists]
+        tail = self.assign[self.sorted_rows:limit]
+        if len(tail) > 0:
+            parts.append(self.sorted_rows + np.flatnonzero(np.isin(tail,lists)))
+        positions = np.sort(np.concatenate(parts))
+        return positions[:np.searchsorted(positions,limit)]
+
+
+def _ivfPaths(prefix):
+    base = prefix+'.index.ivf'
+    return base+'.json', base+'.centroids', base+'.assign'
+
+
+def readLists(prefix):
+    ''' Load the lists stored for a gallery or return None if there are none. '''
+    meta_path, centroids_path, assign_path = _ivfPaths(prefix)
+    try:
+        with open(meta_path,'r') as f:
+            meta = json.load(f)
+        if meta.get('ivf_version') != IVF_VERSION:
+            return None
+        centroids = np.fromfile(centroids_path,dtype=np.float32).reshape(meta['lists'],meta['dim'])
+        assign = np.fromfile(assign_path,dtype=np.int32,count=meta['rows'])
+        if len(assign) != meta['rows']:
+            return None
+    except (OSError,ValueError,KeyError):
+        return None
+    return IVFLists(centroids,meta['generation'],assign,meta['trained_rows'])
+
+
+def _writeListMeta(prefix, lists):
+    meta_path = _ivfPaths(prefix)[0]
+    meta = {
+        'ivf_version' : IVF_VERSION,
+        'lists' : lists.centroids.shape[0],
+        'dim' : lists.centroids.shape[1],
+        'generation' : lists.generation,
+        'rows' : len(lists),
+        'trained_rows' : lists.trained_rows,
+        }
+    with open(meta_path+'.tmp','w') as f:
+        json.dump(meta,f)
+    os.rename(meta_path+'.tmp',meta_path)
+
+
+def writeLists(prefix, lists):
+    ''' Replace the stored lists.  The metadata is removed first so a partial write is never used. '''
+    meta_path, centroids_path, assign_path = _ivfPaths(prefix)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    for path,data in ((centroids_path,lists.centroids),(assign_path,lists.assign)):
+        with open(path+'.tmp','wb') as f:
+            f.write(np.ascontiguousarray(data).tobytes())
+        os.rename(path+'.tmp',path)
+    _writeListMeta(prefix,lists)
+
+
+def appendLists(prefix, lists, start):
+    ''' Write the assignments of the rows appended after start. '''
+    assign_path = _ivfPaths(prefix)[2]
+    with open(assign_path,'r+b') as f:
+        f.seek(4*start)
+        f.write(np.ascontiguousarray(lists.assign[start:]).tobytes())
+    _writeListMeta(prefix,lists)
+
+
+class IVFGalleryWorker(SearchableGalleryWorker):
+    '''
+    A gallery worker that searches large galleries approximately with an
+    inverted file index.  Algorithms return it from getGalleryWorker.
+    '''
+
+    def __init__(self, options, score_type):
+        self.list_count = options.ivf_lists # 0 chooses the count from the gallery size
+        self.nprobe = options.ivf_nprobe
+        self.ivf_lists = {}
+        self.ivf_building = set()
+        self.ivf_locks = {}
+        self.ivf_lock = threading.Lock() # Guards ivf_locks
+
+        SearchableGalleryWorker.__init__(self,options,score_type)
+
+
+    def ivfLock(self, gallery_name):
+        ''' Return the lock that guards the lists of one gallery. '''
+        with self.ivf_lock:
+            return self.ivf_locks.setdefault(gallery_name,threading.Lock())
+
+
+    def ivfPrefix(self, gallery_name):
+        return self.galleryPath(gallery_name,'')
+
+
+    def clearIndex(self, gallery_name):
+        ''' Drop the index and lists from memory.  Deleting a gallery removes the list files with the index. '''
+        SearchableGalleryWorker.clearIndex(self,gallery_name)
+        with self.ivfLock(gallery_name):
+            self.ivf_lists.pop(gallery_name,None)
+
+
+    def currentLists(self, gallery_name, index):
+        '''
+        Return the lists of the gallery along with the index scoreSnapshot()
+        they cover, or None if the gallery should be searched exactly.  Builds
+        that take a while are started in the background.
+        '''
+        with index.lock:
+            gal_mat, norms, rows, live = index.scoreSnapshot()
+            generation = index.generation
+        if index.size() < IVF_MIN_ROWS:
+            return None
+
+        prefix = self.ivfPrefix(gallery_name)
+        with self.ivfLock(gallery_name):
+            lists = self.ivf_lists.get(gallery_name)
+            if lists is None and gallery_name not in self.ivf_building:
+                lists = readLists(prefix)
+                if lists is not None:
+                    self.ivf_lists[gallery_name] = lists
+
+            if lists is None or lists.generation != generation:
+                # The existing centroids are kept if the rows were only renumbered
+                centroids = None if lists is None else lists.centroids
+                trained_rows = 0 if lists is None else lists.trained_rows
+                self._startBuild(gallery_name,prefix,gal_mat,live,generation,centroids,trained_rows)
+                return None
+
+            if index.size() >= IVF_RETRAIN_GROWTH*lists.trained_rows:
+                # Keep searching the current lists while new centroids are trained
+                self._startBuild(gallery_name,prefix,gal_mat,live,generation,None,0)
+
+            # Another search may have extended the lists past this snapshot
+            added = len(rows) - len(lists)
+            if added > IVF_ASSIGN_BLOCK_ROWS:
+                self._startBuild(gallery_name,prefix,gal_mat,live,generation,lists.centroids,lists.trained_rows)
+
+        if 0 < added <= IVF_ASSIGN_BLOCK_ROWS:
+            # Assign without the lock so other searches of the gallery continue
+            start = len(lists)
+            extended = lists.extend(assignLists(gal_mat[start:],lists.centroids))
+            with self.ivfLock(gallery_name):
+                if self.ivf_lists.get(gallery_name) is lists:
+                    appendLists(prefix,extended,start)
+                    self.ivf_lists[gallery_name] = extended
+            lists = extended
+
+        return lists, gal_mat, norms, rows, live
+
+
+    def _startBuild(self, gallery_name, prefix, gal_mat, live, generation, centroids, trained_rows):
+        ''' Train or assign the lists in a background thread.  Call with the ivfLock of the gallery held. '''
+        if gallery_name in self.ivf_building:
+            return
+        self.ivf_building.add(gallery_name)
+        thread = threading.Thread(target=self._buildLists,args=(gallery_name,prefix,gal_mat,live,generation,centroids,trained_rows),daemon=True)
+        thread.start()
+
+
+    def _buildLists(self, gallery_name, prefix, gal_mat, live, generation, centroids, trained_rows):
+        try:
+            start = time.time()
+            live_positions = np.arange(gal_mat.shape[0]) if live is None else np.flatnonzero(live)
+            if centroids is None:
+                list_count = self.list_count if self.list_count > 0 else ivfListCount(len(live_positions))
+                list_count = min(list_count,len(live_positions))
+                sample_count = min(len(live_positions),list_count*IVF_TRAIN_ROWS_PER_LIST)
+                sample = np.sort(np.random.RandomState(0).choice(live_positions,sample_count,replace=False))
+                centroids = trainCentroids(gal_mat[sample],list_count)
+                trained_rows = len(live_positions)
+
+            lists = IVFLists(centroids,generation,assignLists(gal_mat,centroids),trained_rows)
+
+            with self.ivfLock(gallery_name):
+                index = self.indexes.get(gallery_name)
+                if index is not None and index.generation == generation:
+                    writeLists(prefix,lists)
+                    self.ivf_lists[gallery_name] = lists
+
+            stop = time.time()
+            print("   IVF Complete: %s %d faces in %d lists in %0.3fs"%(gallery_name,len(lists),len(centroids),stop-start))
+        except Exception as e:
+            print("   IVF Build Failed: %s %s"%(gallery_name,e))
+        finally:
+            with self.ivfLock(gallery_name):
+                self.ivf_building.discard(gallery_name)
+
+
+    def search(self, gallery_name, probes, max_results, threshold, nprobe=0, search_filter=None):
+        '''
+        Search the lists nearest each probe, or the whole gallery if it has no
+        lists yet or the filter leaves fewer than IVF_MIN_ROWS faces.
+        '''
+        if max_results <= 0:
+            # Every match under the threshold is requested so no list can be skipped
+            return SearchableGalleryWorker.search(self,gallery_name,probes,max_results,threshold,search_filter=search_filter)
+
+        if nprobe <= 0:
+            nprobe = self.nprobe
+
+        probe_mat = [pt.vector_proto2np(face_rec.template.data) for face_rec in probes.face_records]
+        probe_mat = np.array(probe_mat,dtype=np.float32)
+
+        with self.useGallery(gallery_name) as store:
+            self.generateIndex(gallery_name)
+            index = self.indexes[gallery_name]
+            state = self.currentLists(gallery_name,index)
+            if state is not None:
+                lists, gal_mat, norms, rows, live = state
+                live, subset = self.filterPositions(index,rows,live,search_filter)
+                if subset is not None and len(subset) < IVF_MIN_ROWS:
+                    # The filtered rows are few enough to score exactly
+                    return SearchableGalleryWorker.search(self,gallery_name,probes,max_results,threshold,search_filter=search_filter)
+
+                nprobe = min(nprobe,len(lists.centroids))
+                coarse = scoreMatrix(probe_mat,lists.centroids,fsd.L2)
+                probed = np.argpartition(coarse,nprobe-1,axis=1)[:,:nprobe]
+
+                # Rows that are not in a list yet are always scored
+                unassigned = np.arange(len(lists),len(rows))
+
+                for p in range(probe_mat.shape[0]):
+                    positions = np.concatenate([lists.candidates(probed[p],len(rows)),unassigned])
+                    scores = self.scoreTemplates(probe_mat[p:p+1],gal_mat[positions],norms[positions])
+                    selected = selectMatches(scores,max_results,threshold,None if live is None else live[positions])[0]
+                    self.addSearchResults(store,probes.face_records[p],rows,positions[selected],scores[0,selected])
+
+                return probes
+
+        return SearchableGalleryWorker.search(self,gallery_name,probes,max_results,threshold,search_filter=search_filter)
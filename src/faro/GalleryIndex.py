@@ -0,0 +1,599 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+On disk search indexes for searchable galleries.
+
+An index is stored as a metadata file and three data files next to the
+gallery:
+
+    <gallery>.index.json       - shape, generation, and gallery version
+    <gallery>.index.<gen>.f32  - raw row major float32 matrix of templates
+    <gallery>.index.<gen>.rows - raw int64 gallery row id for each index row
+    <gallery>.index.<gen>.live - raw uint8 tombstone mask, 0 for deleted rows
+    <gallery>.index.<gen>.norms - raw float32 squared norm of each template
+
+The squared norms are computed once when a template is added so L2 searches
+only need one matrix product with the probes.
+
+The metadata used to filter searches is kept next to the templates:
+
+    <gallery>.index.<gen>.columns    - GalleryFilters.COLUMN_DTYPE records for each gallery row
+    <gallery>.index.<gen>.attributes - GalleryFilters.ATTRIBUTE_DTYPE entries for the attributes
+
+The filter columns are indexed by gallery row instead of index row, so they
+are only appended to and any snapshot of the index is covered by them.
+
+A quantized index also has a compact copy of the matrix:
+
+    <gallery>.index.<gen>.f16  - float16 templates, or
+    <gallery>.index.<gen>.i8   - int8 templates scaled per dimension
+
+Searches score the compact copy first and rescore the best candidates with
+the float32 matrix, so only the pages of the candidates are read from the
+float32 file.  The int8 scales are chosen from the largest value of each
+dimension when the index is built.  Later values outside that range are
+clipped, which only affects the coarse scores.
+
+The raw files start at offset zero so they are page aligned and can be
+memory mapped read only.  Every process that searches the gallery shares the
+same pages in the operating system page cache instead of holding a private
+copy of the index.
+
+The data files are preallocated and new templates are appended in place.
+Deleted rows are only marked in the live mask and are dropped when the index
+is compacted.  Compaction writes a new generation of data files and the
+metadata file is replaced last, so readers always see a complete index.
+Rebuilds and compactions reserve distinct generation numbers, and a
+compaction that finishes after a rebuild of the same index is discarded.
+'''
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from faro.FaceScoring import squaredNorms
+from faro.GalleryFilters import COLUMN_DTYPE, ATTRIBUTE_DTYPE, FilterColumns, faceColumns
+
+INDEX_VERSION = 5
+
+INITIAL_CAPACITY = 1024
+GROWTH_FACTOR = 2
+
+COMPACT_BLOCK_ROWS = 65536 # Rows copied at a time during compaction
+BUILD_BLOCK_ROWS = 65536   # Gallery rows read at a time when an index is rebuilt
+
+QUANTIZATIONS = ('none','float16','int8')
+_QUANT_DTYPES = {'float16' : np.float16, 'int8' : np.int8}
+_QUANT_EXTENSIONS = {'float16' : '.f16', 'int8' : '.i8'}
+
+_GENERATION_LOCK = threading.Lock() # Guards handing out and switching index generations
+_GENERATIONS = {} # The last generation handed out for each index prefix
+
+
+def _metaPath(prefix):
+    return prefix+'.index.json'
+
+
+def _dataPaths(prefix, generation):
+    ''' Return the paths of the matrix, row id, and live mask files. '''
+    base = '%s.index.%d'%(prefix,generation)
+    return base+'.f32', base+'.rows', base+'.live'
+
+
+def _normsPath(prefix, generation):
+    return '%s.index.%d.norms'%(prefix,generation)
+
+
+def _columnPaths(prefix, generation):
+    ''' Return the paths of the filter column and attribute files. '''
+    base = '%s.index.%d'%(prefix,generation)
+    return base+'.columns', base+'.attributes'
+
+
+def _quantPath(prefix, generation, quantization):
+    return '%s.index.%d%s'%(prefix,generation,_QUANT_EXTENSIONS[quantization])
+
+
+def computeScale(max_abs):
+    ''' Return the int8 scale for each dimension given the largest absolute value of each dimension. '''
+    scale = np.asarray(max_abs,dtype=np.float32)/127.0
+    scale[scale == 0] = 1.0
+    return scale
+
+
+def quantize(templates, quantization, scale=None):
+    ''' Convert float32 templates to the compact representation. '''
+    if quantization == 'float16':
+        return templates.astype(np.float16)
+    if quantization == 'int8':
+        return np.clip(np.rint(templates/scale),-127,127).astype(np.int8)
+    raise ValueError("Unknown index quantization: %s"%(quantization,))
+
+
+def dequantize(block, quantization, scale=None):
+    ''' Convert compact templates back to approximate float32 templates. '''
+    if quantization == 'int8':
+        return block.astype(np.float32)*scale
+    return block.astype(np.float32)
+
+
+def _writeMeta(prefix, meta):
+    path = _metaPath(prefix)
+    with open(path+'.tmp','w') as f:
+        json.dump(meta,f)
+    os.rename(path+'.tmp',path)
+
+
+def _writeAt(path, offset, data):
+    with open(path,'r+b') as f:
+        f.seek(offset)
+        f.write(np.ascontiguousarray(data).tobytes())
+
+
+def _allocate(path, nbytes):
+    ''' Create or grow a file to nbytes.  The new space is sparse on most file systems. '''
+    mode = 'r+b' if os.path.exists(path) else 'w+b'
+    with open(path,mode) as f:
+        f.truncate(nbytes)
+
+
+def readIndexMeta(prefix):
+    ''' Return the index metadata or None if there is no usable index. '''
+    path = _metaPath(prefix)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path,'r') as f:
+            meta = json.load(f)
+    except:
+        return None
+    if meta.get('index_version') != INDEX_VERSION:
+        return None
+    return meta
+
+
+def _reserveGeneration(prefix):
+    '''
+    Return a generation number for new index files that no other build or
+    compaction of the index is writing.
+    '''
+    with _GENERATION_LOCK:
+        meta = readIndexMeta(prefix)
+        generation = max(-1 if meta is None else meta['generation'],_GENERATIONS.get(prefix,-1)) + 1
+        _GENERATIONS[prefix] = generation
+        return generation
+
+
+def deleteIndex(prefix):
+    ''' Remove all the index files for a gallery. '''
+    directory, name = os.path.split(prefix)
+    for each in os.listdir(directory or '.'):
+        if each.startswith(name+'.index.'):
+            os.remove(os.path.join(directory,each))
+
+
+class SearchIndex(object):
+    '''
+    A memory mapped template index that supports appends and tombstone deletes.
+
+    Templates, row ids, and the live mask are exposed read only through
+    snapshot().  All modifications go through update() and compact().
+    '''
+
+    def __init__(self, prefix, meta):
+        self.prefix = prefix
+        self.lock = threading.RLock()
+        self._map(meta)
+
+    def _map(self, meta, live=None):
+        ''' Memory map the data files described by meta. '''
+        n, dim = meta['rows'], meta['dim']
+        quantization = meta.get('quantization','none')
+        mat_path, rows_path, live_path = _dataPaths(self.prefix,meta['generation'])
+        coarse = None
+        if n == 0:
+            templates = np.zeros((0,dim),dtype=np.float32)
+            norms = np.zeros((0,),dtype=np.float32)
+            rows = np.zeros((0,),dtype=np.int64)
+            live = np.zeros((0,),dtype=bool)
+            if quantization != 'none':
+                coarse = np.zeros((0,dim),dtype=_QUANT_DTYPES[quantization])
+        else:
+            templates = np.memmap(mat_path,dtype=np.float32,mode='r',shape=(n,dim))
+            norms = np.memmap(_normsPath(self.prefix,meta['generation']),dtype=np.float32,mode='r',shape=(n,))
+            rows = np.memmap(rows_path,dtype=np.int64,mode='r',shape=(n,))
+            if live is None:
+                live = np.fromfile(live_path,dtype=np.uint8,count=n).astype(bool)
+            if quantization != 'none':
+                coarse = np.memmap(_quantPath(self.prefix,meta['generation'],quantization),
+                                   dtype=_QUANT_DTYPES[quantization],mode='r',shape=(n,dim))
+        columns_path, attributes_path = _columnPaths(self.prefix,meta['generation'])
+        column_rows, attribute_rows = meta['column_rows'], meta['attribute_rows']
+        columns = np.zeros((0,),dtype=COLUMN_DTYPE)
+        attributes = np.zeros((0,),dtype=ATTRIBUTE_DTYPE)
+        if column_rows > 0:
+            columns = np.memmap(columns_path,dtype=COLUMN_DTYPE,mode='r',shape=(column_rows,))
+        if attribute_rows > 0:
+            attributes = np.memmap(attributes_path,dtype=ATTRIBUTE_DTYPE,mode='r',shape=(attribute_rows,))
+        self.meta, self.templates, self.rows, self.live = meta, templates, rows, live
+        self.norms = norms
+        self.filters = FilterColumns(columns,attributes)
+        self.coarse = coarse
+        self.scale = None if meta.get('scale') is None else np.array(meta['scale'],dtype=np.float32)
+
+    @staticmethod
+    def _allocateGeneration(prefix, generation, capacity, dim, quantization):
+        mat_path, rows_path, live_path = _dataPaths(prefix,generation)
+        _allocate(mat_path,4*capacity*dim)
+        _allocate(_normsPath(prefix,generation),4*capacity)
+        _allocate(rows_path,8*capacity)
+        _allocate(live_path,capacity)
+        if quantization != 'none':
+            itemsize = np.dtype(_QUANT_DTYPES[quantization]).itemsize
+            _allocate(_quantPath(prefix,generation,quantization),itemsize*capacity*dim)
+        for path in _columnPaths(prefix,generation):
+            # The filter files grow as they are written
+            if not os.path.exists(path):
+                _allocate(path,0)
+
+    @classmethod
+    def _newGeneration(cls, prefix, n, dim, quantization='none'):
+        ''' Allocate the data files for the next generation of an index. '''
+        generation = _reserveGeneration(prefix)
+        capacity = max(n,INITIAL_CAPACITY)
+
+        cls._allocateGeneration(prefix,generation,capacity,dim,quantization)
+
+        return generation, capacity
+
+    @classmethod
+    def _commit(cls, prefix, generation, capacity, n, dim, gallery_version, quantization='none', scale=None,
+                column_rows=0, attribute_rows=0):
+        '''
+        Write the metadata for a new generation and remove the generation it
+        replaces, which may have been written by a compaction that finished
+        during the build.
+        '''
+        meta = {
+            'index_version' : INDEX_VERSION,
+            'generation' : generation,
+            'rows' : n,
+            'capacity' : capacity,
+            'dim' : dim,
+            'deleted' : 0,
+            'gallery_version' : int(gallery_version),
+            'quantization' : quantization,
+            'scale' : None if scale is None else [float(x) for x in scale],
+            'column_rows' : int(column_rows),
+            'attribute_rows' : int(attribute_rows),
+            }
+        with _GENERATION_LOCK:
+            old = readIndexMeta(prefix)
+            _writeMeta(prefix,meta)
+
+        if old is not None and old['generation'] != generation:
+            cls._removeGeneration(prefix,old['generation'])
+
+        return cls(prefix,meta)
+
+    @classmethod
+    def build(cls, prefix, store, block_rows=BUILD_BLOCK_ROWS, quantization='none'):
+        '''
+        Rebuild the index from the live rows of a GalleryStore.
+
+        The gallery is read in large blocks and the live rows of each block
+        are written straight into the preallocated index files, so memory use
+        is bounded by the block size rather than the gallery size.  The face
+        records are parsed once here for the filter columns.  An int8 index
+        makes an extra pass over the templates to choose the scale of each
+        dimension.
+        '''
+        start_time = time.time()
+
+        rows = store.liveRows()
+        n, dim, count = len(rows), store.dim, store.count
+        assert dim > 0 or n == 0, "Searchable galleries require vector templates."
+
+        def blocks():
+            for start in range(0,count,block_rows):
+                stop = min(start+block_rows,count)
+                block = rows[np.searchsorted(rows,start):np.searchsorted(rows,stop)]
+                if len(block) > 0:
+                    yield store.templates(start,stop)[block-start]
+
+        scale = None
+        if quantization == 'int8' and n > 0:
+            max_abs = np.zeros((dim,),dtype=np.float32)
+            for templates in blocks():
+                max_abs = np.maximum(max_abs,np.abs(templates).max(axis=0))
+            scale = computeScale(max_abs)
+
+        generation, capacity = cls._newGeneration(prefix,n,dim,quantization)
+        mat_path, rows_path, live_path = _dataPaths(prefix,generation)
+        columns_path, attributes_path = _columnPaths(prefix,generation)
+
+        written = 0
+        attribute_rows = 0
+        for start in range(0,count,block_rows):
+            stop = min(start+block_rows,count)
+            block, faces, templates = store.readBlock(start,stop)
+            columns, attributes = faceColumns(faces,block,start,stop)
+            _writeAt(columns_path,COLUMN_DTYPE.itemsize*start,columns)
+            _writeAt(attributes_path,ATTRIBUTE_DTYPE.itemsize*attribute_rows,attributes)
+            attribute_rows += len(attributes)
+            if len(block) == 0:
+                continue
+
+            _writeAt(rows_path,8*written,block)
+            _writeAt(mat_path,4*written*dim,templates)
+            _writeAt(_normsPath(prefix,generation),4*written,squaredNorms(templates))
+            if quantization != 'none':
+                coarse = quantize(templates,quantization,scale)
+                _writeAt(_quantPath(prefix,generation,quantization),coarse.itemsize*written*dim,coarse)
+            written += len(templates)
+
+            if count > block_rows:
+                elapsed = time.time() - start_time
+                print("   Indexed %d of %d faces (%0.0f faces/sec)."%(written,n,written/max(elapsed,1e-6)))
+
+        assert written == n
+        _writeAt(live_path,0,np.ones((n,),dtype=np.uint8))
+
+        return cls._commit(prefix,generation,capacity,n,dim,store.version,quantization,scale,
+                           count,attribute_rows)
+
+    @classmethod
+    def open(cls, prefix):
+        ''' Map an existing index or return None if there is not one. '''
+        meta = readIndexMeta(prefix)
+        if meta is None:
+            return None
+        return cls(prefix,meta)
+
+    @staticmethod
+    def _removeGeneration(prefix, generation):
+        paths = list(_dataPaths(prefix,generation)) + [_normsPath(prefix,generation)] + list(_columnPaths(prefix,generation))
+        paths += [_quantPath(prefix,generation,quantization) for quantization in _QUANT_EXTENSIONS]
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    @property
+    def gallery_version(self):
+        return self.meta['gallery_version']
+
+    @property
+    def generation(self):
+        ''' Changes whenever the index rows are renumbered by a rebuild or compaction. '''
+        return self.meta['generation']
+
+    @property
+    def quantization(self):
+        return self.meta.get('quantization','none')
+
+    @property
+    def deleted(self):
+        return self.meta['deleted']
+
+    def __len__(self):
+        ''' The number of rows in the index, including deleted rows. '''
+        return self.meta['rows']
+
+    def size(self):
+        ''' The number of live rows in the index. '''
+        return self.meta['rows'] - self.meta['deleted']
+
+    def snapshot(self):
+        '''
+        Return a consistent view of the templates, gallery row ids and live
+        mask.  The live mask is None when no rows have been deleted.
+        '''
+        with self.lock:
+            if self.meta['deleted'] == 0:
+                return self.templates, self.rows, None
+            return self.templates, self.rows, self.live
+
+    def scoreSnapshot(self):
+        ''' Return a snapshot() with the squared norms of the templates after the templates. '''
+        with self.lock:
+            templates, rows, live = self.snapshot()
+            return templates, self.norms, rows, live
+
+    def coarseSnapshot(self):
+        '''
+        Return the compact templates and int8 scale of a quantized index along
+        with a scoreSnapshot() taken at the same time.
+        '''
+        with self.lock:
+            return (self.coarse, self.scale) + self.scoreSnapshot()
+
+    def filterMask(self, search_filter, rows):
+        '''
+        Return a mask of the index positions that pass a SearchFilter, where
+        rows are the gallery rows of a snapshot of this index.
+        '''
+        with self.lock:
+            filters = self.filters
+        return filters.mask(search_filter)[rows]
+
+    def update(self, templates, rows, deleted_rows, gallery_version, faces=None):
+        '''
+        Append new templates and mark deleted gallery rows as tombstones.
+        faces are the records of the new rows used for the filter columns.
+
+        New rows are appended before the deletes are applied so a row can be
+        added and deleted by the same update.
+        '''
+        with self.lock:
+            meta = dict(self.meta)
+            mat_path, rows_path, live_path = _dataPaths(self.prefix,meta['generation'])
+            quantization = self.quantization
+            live = self.live
+
+            n = len(rows)
+            if n > 0:
+                templates = np.asarray(templates,dtype=np.float32)
+                if meta['rows'] == 0:
+                    meta['dim'] = templates.shape[1]
+                    if quantization == 'int8':
+                        meta['scale'] = [float(x) for x in computeScale(np.abs(templates).max(axis=0))]
+                assert templates.shape == (n,meta['dim'])
+
+                start, dim = meta['rows'], meta['dim']
+                capacity = meta['capacity']
+                while capacity < start + n:
+                    capacity *= GROWTH_FACTOR
+                _allocate(mat_path,4*capacity*dim)
+                norms_path = _normsPath(self.prefix,meta['generation'])
+                if capacity != meta['capacity']:
+                    _allocate(norms_path,4*capacity)
+                    _allocate(rows_path,8*capacity)
+                    _allocate(live_path,capacity)
+                    meta['capacity'] = capacity
+
+                _writeAt(mat_path,4*start*dim,templates)
+                _writeAt(norms_path,4*start,squaredNorms(templates))
+                if quantization != 'none':
+                    scale = None if meta['scale'] is None else np.array(meta['scale'],dtype=np.float32)
+                    coarse = quantize(templates,quantization,scale)
+                    quant_path = _quantPath(self.prefix,meta['generation'],quantization)
+                    _allocate(quant_path,coarse.itemsize*capacity*dim)
+                    _writeAt(quant_path,coarse.itemsize*start*dim,coarse)
+                _writeAt(rows_path,8*start,np.asarray(rows,dtype=np.int64))
+                _writeAt(live_path,start,np.ones((n,),dtype=np.uint8))
+                meta['rows'] = start + n
+
+                # New gallery rows are always contiguous
+                columns, attributes = faceColumns(faces or [],rows if faces else [],rows[0],rows[-1]+1)
+                columns_path, attributes_path = _columnPaths(self.prefix,meta['generation'])
+                _writeAt(columns_path,COLUMN_DTYPE.itemsize*rows[0],columns)
+                _writeAt(attributes_path,ATTRIBUTE_DTYPE.itemsize*meta['attribute_rows'],attributes)
+                meta['column_rows'] = max(meta['column_rows'],int(rows[-1])+1)
+                meta['attribute_rows'] += len(attributes)
+                live = np.concatenate([live,np.ones((n,),dtype=bool)])
+
+            # Remap before looking up deleted rows so the new rows are included
+            self._map(meta,live)
+
+            if len(deleted_rows) > 0 and meta['rows'] > 0:
+                positions = np.nonzero(np.isin(self.rows,np.asarray(deleted_rows,dtype=np.int64)) & live)[0]
+                if len(positions) > 0:
+                    with open(live_path,'r+b') as f:
+                        for pos in positions:
+                            f.seek(int(pos))
+                            f.write(b'\x00')
+                    # Copy so snapshots held by running searches do not change
+                    live = live.copy()
+                    live[positions] = False
+                    meta['deleted'] += len(positions)
+
+            meta['gallery_version'] = int(gallery_version)
+            _writeMeta(self.prefix,meta)
+            self._map(meta,live)
+
+    def compact(self):
+        '''
+        Rewrite the index without the deleted rows and return the number of
+        rows removed.
+
+        The bulk of the copy is done without holding the lock so searches and
+        updates can continue.  Changes made during the copy are applied to
+        the new generation before it is swapped in.  If the index is rebuilt
+        while the copy is running the copy is discarded and 0 is returned.
+        '''
+        with self.lock:
+            meta = dict(self.meta)
+            templates, norms, rows, live, coarse = self.templates, self.norms, self.rows, self.live, self.coarse
+            filters = self.filters
+        n0, dim = meta['rows'], meta['dim']
+
+        generation = _reserveGeneration(self.prefix)
+        keep = np.nonzero(live)[0]
+        mat_path, rows_path, live_path = _dataPaths(self.prefix,generation)
+        norms_path = _normsPath(self.prefix,generation)
+        quantization = meta.get('quantization','none')
+        if quantization != 'none':
+            quant_path = _quantPath(self.prefix,generation,quantization)
+            itemsize = coarse.itemsize
+
+        capacity = max(len(keep),INITIAL_CAPACITY)
+        self._allocateGeneration(self.prefix,generation,capacity,dim,quantization)
+        for start in range(0,len(keep),COMPACT_BLOCK_ROWS):
+            block = keep[start:start+COMPACT_BLOCK_ROWS]
+            _writeAt(mat_path,4*start*dim,templates[block])
+            _writeAt(norms_path,4*start,norms[block])
+            _writeAt(rows_path,8*start,rows[block])
+            if quantization != 'none':
+                _writeAt(quant_path,itemsize*start*dim,coarse[block])
+
+        # The attributes of the dropped rows are removed with them
+        columns_path, attributes_path = _columnPaths(self.prefix,generation)
+        attributes = filters.attributes[np.isin(filters.attributes['row'],rows[keep])]
+        _writeAt(columns_path,0,filters.columns)
+        _writeAt(attributes_path,0,attributes)
+
+        with self.lock, _GENERATION_LOCK:
+            current = self.meta
+            replaced = readIndexMeta(self.prefix)
+            if replaced is None or replaced['generation'] != current['generation']:
+                # A rebuild committed a new generation during the copy
+                self._removeGeneration(self.prefix,generation)
+                return 0
+
+            # Rows appended or deleted while the copy was running
+            tail = slice(n0,current['rows'])
+            tail_n = current['rows'] - n0
+            n = len(keep) + tail_n
+            if n > capacity:
+                while capacity < n:
+                    capacity *= GROWTH_FACTOR
+                self._allocateGeneration(self.prefix,generation,capacity,dim,quantization)
+            _writeAt(mat_path,4*len(keep)*dim,self.templates[tail])
+            _writeAt(norms_path,4*len(keep),self.norms[tail])
+            _writeAt(rows_path,8*len(keep),self.rows[tail])
+            if quantization != 'none':
+                _writeAt(quant_path,itemsize*len(keep)*dim,self.coarse[tail])
+            new_live = np.concatenate([self.live[keep],self.live[tail]])
+            _writeAt(live_path,0,new_live.astype(np.uint8))
+
+            column_rows = len(filters.columns)
+            _writeAt(columns_path,COLUMN_DTYPE.itemsize*column_rows,self.filters.columns[column_rows:])
+            _writeAt(attributes_path,ATTRIBUTE_DTYPE.itemsize*len(attributes),self.filters.attributes[len(filters.attributes):])
+
+            new_meta = dict(current)
+            new_meta['generation'] = generation
+            new_meta['rows'] = n
+            new_meta['capacity'] = capacity
+            new_meta['deleted'] = int(n - new_live.sum())
+            new_meta['attribute_rows'] = len(attributes) + current['attribute_rows'] - len(filters.attributes)
+            _writeMeta(self.prefix,new_meta)
+
+            old_generation = current['generation']
+            self._map(new_meta,new_live)
+
+        # Open memory maps keep the old data readable until they are released.
+        self._removeGeneration(self.prefix,old_generation)
+        return n0 - len(keep)
@@ -0,0 +1,259 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Write-ahead log for gallery mutations.
+
+Every enroll and delete is appended to a sequential log file next to the
+gallery before it is applied.  A commit thread collects the pending entries
+for up to commit_interval seconds or until commit_records faces are waiting,
+writes them with a single fsync, and then applies the whole group to the
+gallery file with one flush.  Concurrent enrollments share the cost of the
+sync and the flush, and the gallery file is only written by the commit
+thread.  Entries that were logged but not flushed to the gallery are
+applied again by recover() when the gallery is opened.
+
+Each entry is stored as:
+
+    seq (uint64) | op (uint8) | length (uint32) | crc32 (uint32) | payload
+
+where the payload is a serialized FaceRecordList.  Enroll entries hold the
+full face records and delete entries hold records with only gallery_key set.
+Import entries are enrolls where the payload is a GalleryChunk so that the
+templates are stored as one float32 matrix instead of in every record.  A
+torn or corrupt entry at the end of the log is discarded during recovery.
+'''
+
+import os
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from faro.proto.face_service_pb2 import FaceRecordList, GalleryChunk
+
+ENROLL = 1
+DELETE = 2
+IMPORT = 3
+
+COMMIT_INTERVAL = 0.005  # Default maximum seconds an entry waits for a group commit
+COMMIT_RECORDS = 1000    # Default number of waiting faces that triggers a commit
+
+_HEADER = struct.Struct('<QBII')
+
+
+class GalleryLog(object):
+    '''
+    A group commit write-ahead log for a single gallery.
+
+    apply is called by the commit thread with a list of (seq, op, faces,
+    templates) entries and must return a list with one result per entry.
+    templates is None except for import entries.  The result
+    for an entry is returned by wait().  If a result is an exception it is
+    raised by wait() instead.
+    '''
+
+    def __init__(self, path, apply, seq=0, commit_interval=COMMIT_INTERVAL, commit_records=COMMIT_RECORDS):
+        self.path = path
+        self.apply = apply
+        self.commit_interval = commit_interval
+        self.commit_records = commit_records
+        self.cond = threading.Condition()
+        self.file_lock = threading.Lock()
+
+        self.buffer = []
+        self.pending_records = 0
+        self.results = {}
+        self.seq = max(seq,self._lastSeq())
+        self.committed = self.seq
+        self.closed = False
+        self.stopped = False # Set when the commit thread exits
+
+        self.f = open(path,'ab')
+
+        self.commit_thread = threading.Thread(target=self._commitLoop,daemon=True)
+        self.commit_thread.start()
+
+    def _entries(self):
+        ''' Iterate over the valid entries in the log file and the offset after each one. '''
+        if not os.path.exists(self.path):
+            return
+        with open(self.path,'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset + _HEADER.size <= len(data):
+            seq, op, length, crc = _HEADER.unpack_from(data,offset)
+            start = offset + _HEADER.size
+            payload = data[start:start+length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            offset = start + length
+            yield seq, op, payload, offset
+
+    def _lastSeq(self):
+        seq = 0
+        for seq, _, _, _ in self._entries():
+            pass
+        return seq
+
+    def recover(self, after_seq):
+        ''' Apply the entries that were logged after after_seq and return how many there were. '''
+        entries = []
+        end = 0
+        for seq, op, payload, offset in self._entries():
+            end = offset
+            if seq <= after_seq:
+                continue
+            if op == IMPORT:
+                chunk = GalleryChunk()
+                chunk.ParseFromString(payload)
+                faces = list(chunk.records.face_records)
+                templates = np.frombuffer(chunk.templates,dtype='<f4').reshape(len(faces),chunk.dim)
+            else:
+                records = FaceRecordList()
+                records.ParseFromString(payload)
+                faces = list(records.face_records)
+                templates = None
+            entries.append((seq,op,faces,templates))
+
+        with self.file_lock:
+            # Drop a partially written entry so new entries follow valid data
+            if os.path.getsize(self.path) > end:
+                self.f.truncate(end)
+            if len(entries) > 0:
+                self.apply(entries)
+
+        return len(entries)
+
+    def append(self, op, faces, templates=None):
+        '''
+        Queue a mutation and return its sequence number.  Call wait() with the
+        sequence number to block until the mutation has been applied.  Import
+        entries pass the templates of the faces as a (faces, dim) matrix.
+        '''
+        if op == IMPORT:
+            records = GalleryChunk()
+            records.records.face_records.extend(faces)
+            records.dim = templates.shape[1]
+            records.templates = np.ascontiguousarray(templates,dtype='<f4').tobytes()
+        else:
+            records = FaceRecordList()
+            records.face_records.extend(faces)
+        payload = records.SerializeToString()
+
+        with self.cond:
+            if self.closed:
+                raise ValueError("The log for '%s' is closed."%(self.path,))
+            self.seq += 1
+            self.buffer.append((self.seq,op,faces,templates,_HEADER.pack(self.seq,op,len(payload),zlib.crc32(payload)) + payload))
+            self.pending_records += max(len(faces),1)
+            self.cond.notify_all()
+            return self.seq
+
+    def wait(self, seq):
+        '''
+        Block until the entry is on disk and applied, and return its result.
+        Raises ValueError if the log stops before the entry is committed.
+        '''
+        with self.cond:
+            while self.committed < seq and not self.stopped:
+                self.cond.wait()
+            if self.committed < seq:
+                raise ValueError("gallery log closed")
+            result = self.results.pop(seq,None)
+        if isinstance(result,Exception):
+            raise result
+        return result
+
+    def _commitLoop(self):
+        try:
+            self._commitGroups()
+        finally:
+            with self.cond:
+                self.stopped = True
+                self.cond.notify_all()
+
+    def _commitGroups(self):
+        while True:
+            with self.cond:
+                while not self.buffer and not self.closed:
+                    self.cond.wait()
+                if self.closed and not self.buffer:
+                    return
+
+                # Give other writers a chance to join this group
+                deadline = time.time() + self.commit_interval
+                while self.pending_records < self.commit_records and not self.closed:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self.cond.wait(remaining)
+
+                group = self.buffer
+                self.buffer = []
+                self.pending_records = 0
+
+            with self.file_lock:
+                self.f.write(b''.join([data for _,_,_,_,data in group]))
+                self.f.flush()
+                os.fsync(self.f.fileno())
+
+                try:
+                    results = self.apply([(seq,op,faces,templates) for seq,op,faces,templates,_ in group])
+                except Exception as e:
+                    results = [e]*len(group)
+
+            with self.cond:
+                for (seq,_,_,_,_),result in zip(group,results):
+                    self.results[seq] = result
+                self.committed = group[-1][0]
+                self.cond.notify_all()
+
+    def truncate(self, sync):
+        '''
+        Discard the entries that have already been applied to the gallery
+        file.  sync is called first and must make the gallery file durable.
+        Returns false if the log has been closed.
+        '''
+        with self.file_lock:
+            if self.f.closed:
+                return False
+            # Entries are applied while the file lock is held so everything
+            # in the file has been applied.
+            if self.f.tell() > 0:
+                sync()
+                self.f.truncate(0)
+                self.f.seek(0)
+            return True
+
+    def close(self, sync=None):
+        ''' Commit the pending entries and close the log.  If sync is given the log is also truncated. '''
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.commit_thread.join()
+        if sync is not None:
+            self.truncate(sync)
+        with self.file_lock:
+            self.f.close()
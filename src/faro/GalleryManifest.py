@@ -0,0 +1,70 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+A manifest of the galleries in a storage directory.
+
+The manifest is a small json file that caches the face count, subject
+count, template length, bytes on disk, version, index state, and time of
+the last change of every gallery so that a server can start and list the
+galleries without opening the gallery files.  Each entry also stores the size
+and modification time of the gallery file when the entry was written.  If
+the file on disk no longer matches, the entry is out of date and the
+gallery has to be opened to refresh it.
+'''
+
+import json
+import os
+
+MANIFEST_VERSION = 1
+
+
+def fileStamp(path):
+    ''' Return the size and modification time used to detect changed gallery files. '''
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def readManifest(path):
+    ''' Return the gallery entries in the manifest or an empty dict if it is missing or unreadable. '''
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path,'r') as f:
+            manifest = json.load(f)
+    except:
+        print("Warning: could not read gallery manifest %s. The galleries will be scanned."%(path,))
+        return {}
+    if manifest.get('manifest_version') != MANIFEST_VERSION:
+        return {}
+    return manifest['galleries']
+
+
+def writeManifest(path, galleries):
+    ''' Replace the manifest with the gallery entries. '''
+    manifest = {
+        'manifest_version' : MANIFEST_VERSION,
+        'galleries' : galleries,
+        }
+    with open(path+'.tmp','w') as f:
+        json.dump(manifest,f,indent=1,sort_keys=True)
+    os.rename(path+'.tmp',path)
@@ -0,0 +1,384 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+SQLite storage for face galleries.  This is the 'sqlite' gallery backend.
+See GalleryBackend for the interface.
+
+The gallery is a single table with one row per face, keyed by the row id:
+
+    faces(row, face_id, valid, subject_id, name, source, frame, view_key,
+          record, template)
+
+where record is the serialized FaceRecord without template.data or the view
+and template is the float32 template vector.  A small meta table holds the
+same 'count', 'version', 'log_seq' and 'file_id' values as the attributes of
+an HDF5 gallery.
+
+The database uses write-ahead logging.  Every append or delete is one
+transaction on the writer connection, and every thread that reads the
+gallery has its own connection that reads the last committed snapshot.
+Searches and listings therefore run at the same time as enrolls instead of
+waiting for them.  Commits are not synced to disk individually because the
+gallery write-ahead log already holds the changes; sync() checkpoints the
+database instead.
+'''
+
+import contextlib
+import os
+import sqlite3
+import threading
+import uuid
+
+import numpy as np
+
+from faro.GalleryBackend import GalleryBackend, STRING_COLUMNS
+
+SQLITE_LAYOUT_VERSION = 1
+
+SQLITE_BUSY_TIMEOUT = 30.0 # Seconds a connection waits for a lock held by another connection
+SQLITE_READ_BATCH = 500    # Rows per query when reading scattered rows
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)',
+    'CREATE TABLE IF NOT EXISTS faces (row INTEGER PRIMARY KEY, face_id TEXT NOT NULL, valid INTEGER NOT NULL, '
+    'subject_id TEXT, name TEXT, source TEXT, frame INTEGER, view_key TEXT, record BLOB, template BLOB)',
+    )
+
+# Column names of the faces table for the readColumns names
+_COLUMNS = {
+    'face_ids' : 'face_id',
+    'subject_ids' : 'subject_id',
+    'names' : 'name',
+    'sources' : 'source',
+    'frames' : 'frame',
+    'view_keys' : 'view_key',
+    'records' : 'record',
+    'templates' : 'template',
+    'valid' : 'valid',
+    }
+
+
+def _templateMatrix(values, dim):
+    ''' Convert template blobs to a (rows, dim) float32 matrix. '''
+    if dim == 0:
+        return np.zeros((len(values),0),dtype=np.float32)
+    return np.frombuffer(b''.join(values),dtype='<f4').reshape(len(values),dim).astype(np.float32)
+
+
+class SQLiteGalleryStore(GalleryBackend):
+    '''
+    Read and write a gallery stored in a SQLite database.
+
+    If blob_dir is given the view images of new faces are moved to a blob
+    store in that directory.  Otherwise they are kept in the records.
+    '''
+
+    def __init__(self, path, mode='a', blob_dir=None):
+        GalleryBackend.__init__(self,path,blob_dir)
+        self.read_only = mode == 'r'
+        if mode == 'w' and os.path.exists(path):
+            self.removeFiles(path)
+
+        self.local = threading.local()
+        self.readers = {}
+        self.readers_lock = threading.Lock()
+        self.generation = 0 # Changes when the file is replaced so readers reconnect
+
+        self._open()
+
+    @classmethod
+    def removeFiles(cls, path):
+        ''' Delete a closed gallery database and its write-ahead log. '''
+        os.remove(path)
+        for suffix in ('-wal','-shm'):
+            if os.path.exists(path+suffix):
+                os.remove(path+suffix)
+
+    def _connect(self):
+        if self.read_only:
+            db = sqlite3.connect('file:%s?mode=ro'%(os.path.abspath(self.path),),uri=True,timeout=SQLITE_BUSY_TIMEOUT,
+                                 isolation_level=None,check_same_thread=False)
+        else:
+            db = sqlite3.connect(self.path,timeout=SQLITE_BUSY_TIMEOUT,isolation_level=None,check_same_thread=False)
+        return db
+
+    def _open(self):
+        self.db = self._connect()
+        if not self.read_only:
+            self.db.execute('PRAGMA journal_mode=WAL')
+            self.db.execute('PRAGMA synchronous=NORMAL')
+            with self._transaction() as meta:
+                for statement in _SCHEMA:
+                    self.db.execute(statement)
+                if self.db.execute('SELECT COUNT(*) FROM meta').fetchone()[0] == 0:
+                    meta.update({'layout_version' : SQLITE_LAYOUT_VERSION, 'count' : 0, 'version' : 0,
+                                 'log_seq' : 0, 'dim' : 0, 'file_id' : uuid.uuid4().hex})
+
+        self.meta = dict(self.db.execute('SELECT key, value FROM meta').fetchall())
+        if self.meta.get('layout_version') != SQLITE_LAYOUT_VERSION:
+            self.db.close()
+            raise ValueError("Gallery '%s' has unsupported layout version %s."%(self.path,self.meta.get('layout_version')))
+
+        self._loadKeys()
+
+    def _loadKeys(self):
+        ''' Build the face_id to row and subject_id to rows mappings for the live rows. '''
+        self.keys = {}
+        self.subjects = {}
+        for row,face_id,subject_id in self.db.execute('SELECT row, face_id, subject_id FROM faces WHERE valid = 1'):
+            self._addRow(face_id,subject_id,row)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        '''
+        Run a write transaction on the writer connection.  The block can put
+        new meta values in the yielded dict.  They are written with the
+        transaction and only become visible to readers after it commits.
+        '''
+        meta = {}
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            yield meta
+            self.db.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?,?)',list(meta.items()))
+            self.db.execute('COMMIT')
+        except:
+            self.db.execute('ROLLBACK')
+            raise
+        if hasattr(self,'meta'):
+            self.meta.update(meta)
+
+    def _reader(self):
+        ''' Return the connection the calling thread uses to read the gallery. '''
+        local = self.local
+        if getattr(local,'generation',None) != self.generation:
+            db = self._connect()
+            with self.readers_lock:
+                # Close the connections of threads that have finished
+                alive = set(thread.ident for thread in threading.enumerate())
+                for ident in list(self.readers):
+                    if ident not in alive or ident == threading.get_ident():
+                        self.readers.pop(ident).close()
+                self.readers[threading.get_ident()] = db
+            local.db = db
+            local.generation = self.generation
+        return local.db
+
+    def _closeReaders(self):
+        with self.readers_lock:
+            for db in self.readers.values():
+                db.close()
+            self.readers = {}
+
+    @property
+    def count(self):
+        ''' The number of rows in use, including deleted rows. '''
+        return int(self.meta['count'])
+
+    @property
+    def version(self):
+        ''' A counter that changes every time the gallery is modified. '''
+        return int(self.meta['version'])
+
+    @property
+    def file_id(self):
+        ''' A random id for this copy of the gallery file. '''
+        return self.meta['file_id']
+
+    @property
+    def log_seq(self):
+        ''' The sequence number of the last write-ahead log entry saved in this file. '''
+        return int(self.meta['log_seq'])
+
+    @property
+    def dim(self):
+        ''' The template length or 0 if the gallery does not store vectors. '''
+        return int(self.meta['dim'])
+
+    def setVersion(self, version):
+        with self.lock:
+            with self._transaction() as meta:
+                meta['version'] = version
+
+    def _writeRows(self, start, columns, valid):
+        n = len(valid)
+        templates = columns['templates']
+        dim = 0
+        if templates is not None:
+            templates = np.ascontiguousarray(templates,dtype='<f4')
+            dim = templates.shape[1]
+
+        values = []
+        for i in range(n):
+            values.append((start+i,columns['face_ids'][i],int(valid[i]),columns['subject_ids'][i],columns['names'][i],
+                           columns['sources'][i],int(columns['frames'][i]),columns['view_keys'][i],
+                           columns['records'][i],templates[i].tobytes() if dim > 0 else None))
+
+        with self._transaction() as meta:
+            self.db.executemany('INSERT INTO faces (row, face_id, valid, subject_id, name, source, frame, view_key, record, template) '
+                                'VALUES (?,?,?,?,?,?,?,?,?,?)',values)
+            if dim > 0 and self.dim == 0:
+                meta['dim'] = dim
+            meta['count'] = start + n
+            meta['version'] = self.version + 1
+
+    def _clearValid(self, rows):
+        with self._transaction() as meta:
+            self.db.executemany('UPDATE faces SET valid = 0 WHERE row = ?',[(row,) for row in rows.tolist()])
+            meta['version'] = self.version + 1
+
+    def _readRows(self, names, rows):
+        ''' Read columns for unique rows in increasing order.  Returns a list of tuples. '''
+        rows = np.asarray(rows,dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        db = self._reader()
+        columns = ', '.join(['row'] + [_COLUMNS[name] for name in names])
+
+        start, stop = int(rows[0]), int(rows[-1])+1
+        if stop - start <= 4*len(rows):
+            # Dense rows are cheaper to read as one range
+            wanted = set(rows.tolist())
+            result = db.execute('SELECT %s FROM faces WHERE row >= ? AND row < ? ORDER BY row'%(columns,),(start,stop)).fetchall()
+            return [values[1:] for values in result if values[0] in wanted]
+
+        result = []
+        for i in range(0,len(rows),SQLITE_READ_BATCH):
+            batch = rows[i:i+SQLITE_READ_BATCH].tolist()
+            result += db.execute('SELECT %s FROM faces WHERE row IN (%s) ORDER BY row'%(columns,','.join('?'*len(batch))),batch).fetchall()
+        return [values[1:] for values in result]
+
+    def _readColumn(self, name, rows):
+        return [values[0] for values in self._readRows((name,),rows)]
+
+    def liveRows(self):
+        ''' Return the row ids of all live faces in row order. '''
+        cursor = self._reader().execute('SELECT row FROM faces WHERE valid = 1 ORDER BY row')
+        return np.array([row for row, in cursor],dtype=np.int64)
+
+    def isLive(self, rows):
+        ''' Return a boolean array that is true for the rows that have not been deleted. '''
+        return np.array(self._readColumn('valid',rows),dtype=np.uint8) != 0
+
+    def faceIds(self, rows):
+        return self._readColumn('face_ids',rows)
+
+    def subjectIds(self, rows):
+        return self._readColumn('subject_ids',rows)
+
+    def metadata(self, rows):
+        '''
+        Return a dict of name, subject_id, source and frame lists for rows in
+        increasing order without parsing the face records.
+        '''
+        names = [name for name,_ in STRING_COLUMNS] + ['frames']
+        values = self._readRows(names,rows)
+        result = {}
+        for i,(_,field) in enumerate(STRING_COLUMNS):
+            result[field] = [each[i] for each in values]
+        result['frame'] = [each[-1] for each in values]
+        return result
+
+    def viewKeys(self, rows):
+        return self._readColumn('view_keys',rows)
+
+    def templates(self, start=0, stop=None):
+        ''' Read a contiguous block of the template matrix. '''
+        if stop is None:
+            stop = self.count
+        cursor = self._reader().execute('SELECT template FROM faces WHERE row >= ? AND row < ? ORDER BY row',(start,stop))
+        return _templateMatrix([template for template, in cursor],self.dim)
+
+    def readColumns(self, rows):
+        names = ('records','face_ids','subject_ids','names','sources','frames','view_keys','templates')
+        values = self._readRows(names,rows)
+        columns = {}
+        for i,name in enumerate(names[:-1]):
+            columns[name] = [each[i] for each in values]
+        columns['templates'] = _templateMatrix([each[-1] for each in values],self.dim) if self.dim > 0 else None
+        return columns
+
+    def readBlock(self, start, stop, view=False):
+        stop = min(stop,self.count)
+        if stop <= start:
+            return np.zeros((0,),dtype=np.int64), [], np.zeros((0,self.dim),dtype=np.float32)
+        values = self._reader().execute('SELECT row, record, template, view_key FROM faces '
+                                        'WHERE row >= ? AND row < ? AND valid = 1 ORDER BY row',(start,stop)).fetchall()
+        rows = np.array([each[0] for each in values],dtype=np.int64)
+        templates = _templateMatrix([each[2] for each in values],self.dim)
+        view_keys = [each[3] for each in values] if view else None
+        return rows, self._parseRecords([each[1] for each in values],view_keys), templates
+
+    def _readRecord(self, row, view):
+        record, template, view_key = self._reader().execute('SELECT record, template, view_key FROM faces WHERE row = ?',(int(row),)).fetchone()
+        if template is not None:
+            template = np.frombuffer(template,dtype='<f4')
+        return record, template, view_key if view else ''
+
+    def flush(self, log_seq=None):
+        ''' Record the last log entry included in the database.  The rows are already committed. '''
+        with self.lock:
+            if log_seq is not None:
+                with self._transaction() as meta:
+                    meta['log_seq'] = log_seq
+
+    def sync(self):
+        ''' Checkpoint the database so that it and any new view blobs are on disk. '''
+        with self.lock:
+            if self.blobs is not None:
+                self.blobs.sync()
+            # The write-ahead log is synced before the checkpoint and the
+            # database file after it.
+            self.db.execute('PRAGMA wal_checkpoint(FULL)')
+
+    def fileBytes(self):
+        ''' The number of bytes used on disk by the database, its write-ahead log, and the view blobs. '''
+        nbytes = GalleryBackend.fileBytes(self)
+        if os.path.exists(self.path+'-wal'):
+            nbytes += os.path.getsize(self.path+'-wal')
+        return nbytes
+
+    def replaceFile(self, new_path):
+        '''
+        Atomically replace the database with the closed database at new_path
+        and reopen it.  The new file must already be synced to disk.
+        '''
+        with self.lock:
+            self._closeReaders()
+            self.db.close()
+            # A write-ahead log left by the old database must not be applied to the new one
+            for suffix in ('-wal','-shm'):
+                if os.path.exists(self.path+suffix):
+                    os.remove(self.path+suffix)
+            os.rename(new_path,self.path)
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)),os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self.generation += 1
+            self._open()
+
+    def close(self):
+        with self.lock:
+            self._closeReaders()
+            self.db.close()
@@ -0,0 +1,538 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Galleries split into shards that are served by separate processes.
+
+Every gallery is partitioned into the same number of shards.  A face is
+placed in a shard by hashing its subject id so all the faces of a subject
+are in the same shard.  Each shard is owned by a process that runs an
+ordinary gallery worker on its own storage directory.
+The server process only routes requests: enrolls are split by shard, and
+searches are sent to every shard at once and the best results of each shard
+are merged.  The templates are scored in the shard processes so a search
+uses one core per shard and does not compete for the server process GIL.
+
+The shard count is recorded in the shard storage directory and can not be
+changed while galleries exist because the faces are placed by their subjects.
+'''
+
+import atexit
+import copy
+import itertools
+import json
+import multiprocessing as mp
+import os
+import queue
+import signal
+import threading
+import time
+import zlib
+from concurrent import futures
+
+import numpy as np
+
+import faro
+from faro.proto.face_service_pb2 import FaceRecordList, TemplateList, GalleryChunk
+from faro.FaceScoring import setBlasThreads
+from faro.GalleryBackend import backendOf
+from faro.GalleryFilters import FilterColumns
+
+SHARD_CONNECTIONS = 4 # Requests that each shard process serves at the same time
+
+
+def shardOf(subject_id, shard_count):
+    ''' Return the shard that holds the faces of a subject. '''
+    return zlib.crc32(subject_id.encode('utf-8')) % shard_count
+
+
+def _createGallery(worker, gallery_name):
+    ''' Create an empty gallery in a shard if it does not exist. '''
+    with worker.useGallery(gallery_name, create=True):
+        pass
+
+
+def _deleteGallery(worker, gallery_name):
+    ''' Delete a gallery from a shard.  Returns None if the shard does not have the gallery. '''
+    if gallery_name not in worker.galleryNames():
+        return None
+    return worker.deleteGallery(gallery_name)
+
+
+def _findFaceRecord(worker, gallery_name, face_id):
+    ''' Return a face record or None if the shard does not hold the face. '''
+    try:
+        return worker.getFaceRecord(gallery_name,face_id)
+    except KeyError:
+        return None
+
+
+def _exportChunk(worker, gallery_name, start_row, file_id, chunk_rows, views):
+    ''' Return the next chunk of a shard export or None after the last row. '''
+    return next(worker.exportGallery(gallery_name,start_row,file_id,chunk_rows,views),None)
+
+
+# Requests handled by a function in the shard process instead of a worker method
+SHARD_FUNCTIONS = {
+    'createGallery' : _createGallery,
+    'deleteGallery' : _deleteGallery,
+    'exportChunk' : _exportChunk,
+    'findFaceRecord' : _findFaceRecord,
+    }
+
+
+def _serveConnection(worker, conn):
+    ''' Run the requests received on one connection until the server process stops it. '''
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        method, args = request
+        try:
+            if method in SHARD_FUNCTIONS:
+                result = SHARD_FUNCTIONS[method](worker,*args)
+            else:
+                result = getattr(worker,method)(*args)
+            conn.send((True,result))
+        except Exception as e:
+            try:
+                conn.send((False,e))
+            except Exception:
+                # The exception could not be pickled
+                conn.send((False,RuntimeError(str(e))))
+
+
+def shardMain(shard_index, options, create_worker, connections):
+    ''' The entry point of a shard process. '''
+    # The server process handles interrupts and stops the shards
+    signal.signal(signal.SIGINT,signal.SIG_IGN)
+    setBlasThreads(options.blas_threads)
+
+    try:
+        worker = create_worker(options)
+    except Exception as e:
+        connections[0].send((False,RuntimeError("Gallery shard %d could not be started: %s"%(shard_index,e))))
+        return
+    connections[0].send((True,None))
+
+    threads = [threading.Thread(target=_serveConnection,args=(worker,conn),daemon=True) for conn in connections]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Process targets exit without running the atexit handlers
+    worker.close()
+
+
+class ShardedGalleryWorker(object):
+    '''
+    A gallery worker that splits every gallery across shard processes.
+
+    create_worker is called with the options in each shard process to create
+    the gallery worker for that shard.
+    '''
+
+    def __init__(self, options, create_worker):
+        self.shard_count = options.gallery_shards
+        self.shard_storage = os.path.join(options.storage_dir,'shards')
+        self.checkLayout(options.algorithm)
+
+        unsharded = os.path.join(options.storage_dir,'galleries',str(options.algorithm))
+        if os.path.isdir(unsharded) and any(backendOf(name) is not None for name in os.listdir(unsharded)):
+            print("Warning: the galleries in %s are not served when the galleries are sharded. Use gexport and gimport to move them."%(unsharded,))
+
+        self.processes = []
+        self.free = []
+        self.closed = False
+        self.templates = {} # Merged (shard stamps, shard parts, stamp, face ids, subject ids, templates) of each gallery
+        self.template_lock = threading.Lock()
+        self.template_stamps = itertools.count(1)
+        for shard in range(self.shard_count):
+            shard_options = copy.copy(options)
+            shard_options.storage_dir = os.path.join(self.shard_storage,'%02d'%shard)
+
+            pipes = [mp.Pipe() for _ in range(SHARD_CONNECTIONS)]
+            process = mp.Process(target=shardMain,name='GalleryShard-%d'%shard,daemon=True,
+                                 args=(shard,shard_options,create_worker,[child for _,child in pipes]))
+            process.start()
+            for _,child in pipes:
+                child.close()
+
+            free = queue.Queue()
+            for conn,_ in pipes:
+                free.put(conn)
+            self.processes.append(process)
+            self.free.append(free)
+
+        # The shards load their galleries in parallel
+        for shard in range(self.shard_count):
+            conn = self.free[shard].get()
+            try:
+                ok, result = conn.recv()
+            finally:
+                self.free[shard].put(conn)
+            if not ok:
+                self.closed = True
+                for process in self.processes:
+                    process.terminate()
+                raise result
+
+        self.pool = futures.ThreadPoolExecutor(max_workers=self.shard_count*SHARD_CONNECTIONS)
+        self.searchable = self.call(0,'isSearchable')
+        atexit.register(self.close)
+
+        print("GALLERY WORKER: Started %d gallery shards."%(self.shard_count,))
+
+
+    def checkLayout(self, algorithm):
+        ''' Record the shard count for new shard storage or check that it matches the existing storage. '''
+        path = os.path.join(self.shard_storage,str(algorithm)+'.json')
+        if os.path.exists(path):
+            with open(path,'r') as f:
+                layout = json.load(f)
+            if layout['shard_count'] != self.shard_count:
+                raise ValueError("The galleries in %s were created with %d shards. Use --gallery-shards %d or export the galleries and import them into new shards."%(self.shard_storage,layout['shard_count'],layout['shard_count']))
+        else:
+            if not os.path.isdir(self.shard_storage):
+                os.makedirs(self.shard_storage)
+            with open(path,'w') as f:
+                json.dump({'shard_count' : self.shard_count},f)
+
+
+    def call(self, shard, method, *args):
+        ''' Run a gallery worker method in a shard process and return the result. '''
+        free = self.free[shard]
+        conn = free.get()
+        try:
+            conn.send((method,args))
+            ok, result = conn.recv()
+        except (EOFError,OSError):
+            raise RuntimeError("Gallery shard %d has stopped."%(shard,))
+        finally:
+            free.put(conn)
+        if not ok:
+            raise result
+        return result
+
+
+    def scatter(self, calls):
+        ''' Run a (method, args) call on each shard at the same time and return the results in shard order. '''
+        jobs = [self.pool.submit(self.call,shard,method,*args) for shard,(method,args) in enumerate(calls)]
+        return [job.result() for job in jobs]
+
+
+    def callAll(self, method, *args):
+        ''' Run the same call on every shard. '''
+        return self.scatter([(method,args)]*self.shard_count)
+
+
+    def close(self):
+        ''' Close the galleries in every shard and stop the shard processes. '''
+        if self.closed:
+            return
+        self.closed = True
+
+        for shard,process in enumerate(self.processes):
+            if not process.is_alive():
+                continue
+            try:
+                self.call(shard,'close')
+            except Exception as e:
+                print("Warning: could not close gallery shard %d: %s"%(shard,e))
+            while not self.free[shard].empty():
+                conn = self.free[shard].get()
+                try:
+                    conn.send(None)
+                except (EOFError,OSError):
+                    pass
+        for process in self.processes:
+            process.join()
+
+
+    def isSearchable(self):
+        ''' Return true if the shards implement fast search. '''
+        return self.searchable
+
+
+    def galleryNames(self):
+        names = {}
+        for shard_names in self.callAll('galleryNames'):
+            for gallery_name in shard_names:
+                names[gallery_name] = True
+        return list(names)
+
+
+    def size(self, gallery_name):
+        ''' Return the size a gallery. '''
+        return sum(self.callAll('size',gallery_name))
+
+
+    def galleryStats(self):
+        ''' Return the statistics of every gallery added over the shards. '''
+        stats = {}
+        for shard_stats in self.callAll('galleryStats'):
+            for gallery_name,shard_entry in shard_stats.items():
+                entry = stats.get(gallery_name)
+                if entry is None:
+                    stats[gallery_name] = dict(shard_entry)
+                    continue
+                for key in ('faces','subjects','bytes'):
+                    entry[key] += shard_entry[key]
+                entry['dim'] = max(entry['dim'],shard_entry['dim'])
+                entry['modified'] = max(entry['modified'],shard_entry['modified'])
+                if entry['index'] != shard_entry['index']:
+                    entry['index'] = 'stale'
+        return stats
+
+
+    def cacheStats(self):
+        ''' Return the gallery cache counters added over the shards. '''
+        stats = {}
+        for shard_stats in self.callAll('cacheStats'):
+            for key,value in shard_stats.items():
+                stats[key] = stats.get(key,0) + value
+        return stats
+
+
+    def addFaceToGallery(self, gallery_name, gallery_key, face):
+        ''' Enrolls the faces in the gallery. '''
+        return self.addFacesToGallery(gallery_name, [face])
+
+
+    def addFacesToGallery(self, gallery_name, faces):
+        ''' Enroll a batch of faces, sending each face to its shard. '''
+        parts = [[] for _ in range(self.shard_count)]
+        for face in faces:
+            face.gallery_key = faro.generateFaceId(face)
+            parts[shardOf(face.subject_id,self.shard_count)].append(face)
+
+        # Shards without faces in this batch still get the gallery
+        calls = [('addFacesToGallery',(gallery_name,part)) if part else ('createGallery',(gallery_name,)) for part in parts]
+        results = self.scatter(calls)
+
+        enrolled = sum(result[0] for part,result in zip(parts,results) if part)
+        replaced = sum(result[1] for part,result in zip(parts,results) if part)
+        return enrolled, replaced
+
+
+    def dedupFaces(self, gallery_name, faces, distance, merge=False):
+        ''' Find the near duplicates in an enroll.  A subject's faces are all in one shard. '''
+        faces = list(faces)
+        positions = [[] for _ in range(self.shard_count)]
+        for i,face in enumerate(faces):
+            positions[shardOf(face.subject_id,self.shard_count)].append(i)
+
+        results = self.scatter([('dedupFaces',(gallery_name,[faces[i] for i in part],distance,merge)) for part in positions])
+
+        enroll = []
+        keys = [None]*len(faces)
+        skipped = merged = 0
+        for part,(shard_enroll,shard_keys,shard_skipped,shard_merged) in zip(positions,results):
+            enroll.extend(shard_enroll)
+            for i,key in zip(part,shard_keys):
+                keys[i] = key
+            skipped += shard_skipped
+            merged += shard_merged
+
+        return enroll, keys, skipped, merged
+
+
+    def importChunk(self, gallery_name, chunk):
+        ''' Enroll the faces in an exported GalleryChunk, splitting the chunk by shard. '''
+        faces = list(chunk.records.face_records)
+        if len(faces) == 0:
+            return 0, 0
+
+        templates = np.frombuffer(chunk.templates,dtype='<f4').reshape(len(faces),chunk.dim)
+        shards = np.array([shardOf(face.subject_id,self.shard_count) for face in faces])
+
+        calls = []
+        for shard in range(self.shard_count):
+            selected = np.nonzero(shards == shard)[0]
+            if len(selected) == 0:
+                calls.append(('createGallery',(gallery_name,)))
+                continue
+            part = GalleryChunk()
+            part.gallery_name = gallery_name
+            part.dim = chunk.dim
+            part.templates = templates[selected].tobytes()
+            part.records.face_records.extend([faces[i] for i in selected])
+            calls.append(('importChunk',(gallery_name,part)))
+        results = self.scatter(calls)
+
+        enrolled = sum(result[0] for result in results if result is not None)
+        replaced = sum(result[1] for result in results if result is not None)
+        return enrolled, replaced
+
+
+    def deleteGallery(self, gallery_name):
+        ''' Delete a gallery from every shard. '''
+        with self.template_lock:
+            self.templates.pop(gallery_name,None)
+        results = [result for result in self.callAll('deleteGallery',gallery_name) if result is not None]
+        if len(results) == 0:
+            raise ValueError("Gallery '" + gallery_name +"' not found.")
+        return sum(results)
+
+
+    def subjectDelete(self, gallery_name, subject_id):
+        ''' Delete all the faces for a subject from the gallery. '''
+        return self.call(shardOf(subject_id,self.shard_count),'subjectDelete',gallery_name,subject_id)
+
+
+    def compactGallery(self, gallery_name):
+        ''' Compact the gallery files of all the shards at the same time. '''
+        start = time.time()
+        stats = {}
+        for shard_stats in self.callAll('compactGallery',gallery_name):
+            for key,value in shard_stats.items():
+                stats[key] = stats.get(key,0) + value
+        stats['compact_time'] = time.time()-start
+        return stats
+
+
+    def exportGallery(self, gallery_name, start_row=0, file_id='', chunk_rows=0, views=False):
+        '''
+        Generate the GalleryChunks of each shard in turn.  The file_id of a
+        chunk is prefixed with its shard so the export can be resumed.
+        '''
+        shard = 0
+        if file_id:
+            try:
+                shard, file_id = file_id.split(':',1)
+                shard = int(shard)
+            except ValueError:
+                raise ValueError("The export of '%s' can not be resumed from an unsharded file id."%(gallery_name,))
+
+        while shard < self.shard_count:
+            chunk = self.call(shard,'exportChunk',gallery_name,start_row,file_id,chunk_rows,views)
+            if chunk is None:
+                shard += 1
+                start_row, file_id = 0, ''
+                continue
+            start_row, file_id = chunk.next_row, chunk.file_id
+            chunk.file_id = '%d:%s'%(shard,chunk.file_id)
+            yield chunk
+
+
+    def enrollmentList(self, gallery_name):
+        ''' List the faces enrolled in this gallery. '''
+        result = FaceRecordList()
+        for shard_result in self.callAll('enrollmentList',gallery_name):
+            result.face_records.extend(shard_result.face_records)
+        return result
+
+
+    def setIndexQuantization(self, gallery_name, quantization):
+        ''' Choose the index quantization of a gallery in every shard. '''
+        self.callAll('setIndexQuantization',gallery_name,quantization)
+
+
+    def generateIndex(self, gallery_name):
+        ''' Generate the index of every shard. '''
+        self.callAll('generateIndex',gallery_name)
+
+
+    def search(self, gallery_name, probes, max_results, threshold, nprobe=0, search_filter=None):
+        ''' Search every shard at the same time and merge the best results. '''
+        results = self.callAll('search',gallery_name,probes,max_results,threshold,nprobe,search_filter)
+
+        for p,probe in enumerate(probes.face_records):
+            matches = []
+            for result in results:
+                matches.extend(result.face_records[p].search_results.face_records)
+            matches.sort(key=lambda face: face.score)
+
+            if max_results > 0:
+                matches = matches[:max_results]
+
+            probe.search_results.face_records.extend(matches)
+
+        return probes
+
+
+    def getAllFaceRecords(self, gallery_name, views=True):
+        ''' Get all the face records in the gallery.  The view images are skipped if views is false. '''
+        gallery = FaceRecordList()
+        for shard_gallery in self.callAll('getAllFaceRecords',gallery_name,views):
+            gallery.face_records.extend(shard_gallery.face_records)
+        return gallery
+
+
+    def getAllTemplates(self, gallery_name):
+        ''' Get all the templates in the gallery. '''
+        gallery = TemplateList()
+        for shard_gallery in self.callAll('getAllTemplates',gallery_name):
+            gallery.templates.extend(shard_gallery.templates)
+        return gallery
+
+
+    def galleryTemplates(self, gallery_name, stamp=None):
+        '''
+        Return (stamp, face_ids, subject_ids, templates, filters) for the whole gallery
+        as in GalleryWorker.galleryTemplates.  Each shard keeps its own parsed
+        templates, so only the shards that changed since the last call send
+        their templates back.
+        '''
+        with self.template_lock:
+            entry = self.templates.get(gallery_name)
+            shard_stamps = entry[0] if entry is not None else [None]*self.shard_count
+            results = self.scatter([('galleryTemplates',(gallery_name,shard_stamp)) for shard_stamp in shard_stamps])
+
+            if entry is None or any(result[1] is not None for result in results):
+                parts = [entry[1][shard] if result[1] is None else result[1:] for shard,result in enumerate(results)]
+                face_ids = [face_id for part in parts for face_id in part[0]]
+                subject_ids = [subject_id for part in parts for subject_id in part[1]]
+                matrices = [part[2] for part in parts if isinstance(part[2],np.ndarray)]
+                if len(matrices) > 0:
+                    # Empty shards that have not seen a template yet return an empty TemplateList
+                    templates = np.concatenate(matrices)
+                else:
+                    templates = TemplateList()
+                    for part in parts:
+                        templates.templates.extend(part[2].templates)
+                filters = FilterColumns.concatenate([part[3] for part in parts])
+                entry = ([result[0] for result in results],parts,next(self.template_stamps),face_ids,subject_ids,templates,filters)
+                self.templates[gallery_name] = entry
+
+        _, _, current, face_ids, subject_ids, templates, filters = entry
+        if stamp == current:
+            return current, None, None, None, None
+        return current, face_ids, subject_ids, templates, filters
+
+
+    def getSubjectFaceRecords(self, gallery_name, subject_id):
+        ''' Get the face records enrolled for a subject. '''
+        return self.call(shardOf(subject_id,self.shard_count),'getSubjectFaceRecords',gallery_name,subject_id)
+
+
+    def getFaceRecord(self, gallery_name, face_id):
+        ''' Get a face record from the shard that holds it. '''
+        for face in self.callAll('findFaceRecord',gallery_name,face_id):
+            if face is not None:
+                return face
+        raise KeyError(face_id)
@@ -0,0 +1,410 @@
+'''
+MIT License
+
+Copyright 2019 Oak Ridge National Laboratory
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Columnar HDF5 storage for face galleries.  This is the 'hdf5' gallery
+backend.  See GalleryBackend for the interface.
+
+A gallery file holds one row per enrolled face.  Templates are stored in a
+single chunked float32 matrix and the rest of the face record is stored in
+side columns that share the same integer row id:
+
+    templates   - (capacity, dim) float32 template vectors
+    records     - serialized FaceRecords with template.data and the view removed
+    face_ids    - the gallery key for each row
+    valid       - 1 for live rows and 0 for deleted rows
+    subject_ids - metadata copied out of the records so that listing and
+    names         subject lookups do not need to parse any records
+    sources
+    frames
+    view_keys   - the blob store key of the view image or '' if the view is
+                  kept in the record
+
+All columns are preallocated and grown geometrically so that enrolling a face
+does not resize the file on every call.  The number of rows in use is stored
+in the 'count' attribute of the file and the 'version' attribute is
+incremented on every change so that derived data such as search indexes can
+tell when they are out of date.  The 'log_seq' attribute records the last
+write-ahead log entry that has been flushed to the file.  The 'file_id'
+attribute is a random id that changes when the file is rewritten by
+compaction so that row ids from an older file can be detected.
+
+View images are kept out of the gallery file when the store is opened with a
+blob directory.  See GalleryBlobs.
+'''
+
+import os
+import time
+import uuid
+
+import numpy as np
+
+from faro.proto.face_service_pb2 import FaceRecord
+from faro.GalleryBackend import GalleryBackend, STRING_COLUMNS
+
+LAYOUT_VERSION = 4
+
+CHUNK_ROWS = 1024       # Rows per hdf5 chunk for every column
+INITIAL_CAPACITY = 1024 # Rows allocated when a gallery is created
+GROWTH_FACTOR = 2       # Capacity multiplier when the gallery runs out of rows
+
+MIGRATE_BATCH_SIZE = 10000
+
+
+def _stringDtype():
+    import h5py
+    try:
+        return h5py.string_dtype() # h5py > 2.10.0
+    except:
+        return h5py.special_dtype(vlen=str) # h5py==2.9.0
+
+
+def _bytesDtype():
+    import h5py
+    return h5py.special_dtype(vlen=np.dtype('uint8'))
+
+
+def _decodeString(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+def isLegacyGallery(path):
+    ''' Return true if the file uses the original one-dataset-per-face layout. '''
+    import h5py
+    with h5py.File(path,'r') as f:
+        return 'layout_version' not in f.attrs and 'faces' in f
+
+
+class GalleryStore(GalleryBackend):
+    '''
+    Read and write the columnar layout of a single HDF5 gallery file.
+
+    If blob_dir is given the view images of new faces are moved to a blob
+    store in that directory.  Otherwise they are kept in the records.
+    '''
+
+    def __init__(self, path, mode='a', blob_dir=None):
+        import h5py
+
+        GalleryBackend.__init__(self,path,blob_dir)
+        self.h5 = h5py.File(path,mode)
+
+        if 'layout_version' not in self.h5.attrs:
+            if 'faces' in self.h5:
+                self.h5.close()
+                raise ValueError("Gallery '%s' uses the legacy layout. Run 'python -m faro gmigrate' to convert it."%(path,))
+            self._create()
+
+        if self.h5.attrs['layout_version'] != LAYOUT_VERSION:
+            raise ValueError("Gallery '%s' has unsupported layout version %s."%(path,self.h5.attrs['layout_version']))
+
+        self._loadKeys()
+
+    def _create(self):
+        ''' Initialize the columns of an empty gallery. '''
+        f = self.h5
+        f.attrs['layout_version'] = LAYOUT_VERSION
+        f.attrs['count'] = 0
+        f.attrs['version'] = 0
+        f.attrs['file_id'] = uuid.uuid4().hex
+        f.create_dataset('records',(0,),maxshape=(None,),chunks=(CHUNK_ROWS,),dtype=_bytesDtype())
+        f.create_dataset('face_ids',(0,),maxshape=(None,),chunks=(CHUNK_ROWS,),dtype=_stringDtype())
+        f.create_dataset('valid',(0,),maxshape=(None,),chunks=(CHUNK_ROWS,),dtype=np.uint8)
+        for name in [name for name,_ in STRING_COLUMNS] + ['view_keys']:
+            f.create_dataset(name,(0,),maxshape=(None,),chunks=(CHUNK_ROWS,),dtype=_stringDtype())
+        f.create_dataset('frames',(0,),maxshape=(None,),chunks=(CHUNK_ROWS,),dtype=np.int64)
+        f.flush()
+
+    def _writeMetadata(self, start, columns):
+        stop = start + len(columns['frames'])
+        for name,_ in STRING_COLUMNS:
+            values = np.empty((stop-start,),dtype=object)
+            values[:] = columns[name]
+            self.h5[name][start:stop] = values
+        self.h5['frames'][start:stop] = np.array(columns['frames'],dtype=np.int64)
+
+    def _loadKeys(self):
+        ''' Build the face_id to row and subject_id to rows mappings for the live rows. '''
+        count = self.count
+        self.keys = {}
+        self.subjects = {}
+        if count == 0:
+            return
+        valid = self.h5['valid'][:count]
+        face_ids = self.h5['face_ids'][:count]
+        subject_ids = self.h5['subject_ids'][:count]
+        for row in np.nonzero(valid)[0]:
+            row = int(row)
+            self._addRow(_decodeString(face_ids[row]),_decodeString(subject_ids[row]),row)
+
+    @property
+    def count(self):
+        ''' The number of rows in use, including deleted rows. '''
+        return int(self.h5.attrs['count'])
+
+    @property
+    def version(self):
+        ''' A counter that changes every time the gallery is modified. '''
+        return int(self.h5.attrs.get('version',0))
+
+    @property
+    def file_id(self):
+        ''' A random id for this copy of the gallery file. '''
+        return _decodeString(self.h5.attrs.get('file_id',''))
+
+    @property
+    def log_seq(self):
+        ''' The sequence number of the last write-ahead log entry saved in this file. '''
+        return int(self.h5.attrs.get('log_seq',0))
+
+    def _touch(self):
+        self.h5.attrs['version'] = self.version + 1
+
+    def setVersion(self, version):
+        with self.lock:
+            self.h5.attrs['version'] = version
+
+    @property
+    def capacity(self):
+        return self.h5['valid'].shape[0]
+
+    @property
+    def dim(self):
+        ''' The template length or 0 if the gallery does not store vectors. '''
+        if 'templates' not in self.h5:
+            return 0
+        return self.h5['templates'].shape[1]
+
+    def reserve(self, n):
+        ''' Make sure there is room to append n more rows. '''
+        needed = self.count + n
+        capacity = self.capacity
+        if needed <= capacity:
+            return
+
+        new_capacity = max(capacity,INITIAL_CAPACITY)
+        while new_capacity < needed:
+            new_capacity *= GROWTH_FACTOR
+
+        for name in ('records','face_ids','valid','subject_ids','names','sources','frames','view_keys'):
+            self.h5[name].resize((new_capacity,))
+        if 'templates' in self.h5:
+            self.h5['templates'].resize((new_capacity,self.dim))
+
+    def _createTemplates(self, dim):
+        self.h5.create_dataset('templates',(self.capacity,dim),maxshape=(None,dim),
+                               chunks=(CHUNK_ROWS,dim),dtype=np.float32)
+
+    def _writeRows(self, start, columns, valid):
+        n = len(valid)
+        templates = columns['templates']
+        self.reserve(n)
+        if templates is not None and 'templates' not in self.h5:
+            self._createTemplates(templates.shape[1])
+
+        records = np.empty((n,),dtype=_bytesDtype())
+        for i,data in enumerate(columns['records']):
+            records[i] = np.frombuffer(data,dtype=np.uint8)
+        stop = start + n
+        # write_direct keeps h5py from broadcasting equal length records into a 2D array
+        self.h5['records'].write_direct(records,dest_sel=np.s_[start:stop])
+        for name in ('face_ids','view_keys'):
+            values = np.empty((n,),dtype=object)
+            values[:] = columns[name]
+            self.h5[name][start:stop] = values
+        self.h5['valid'][start:stop] = valid
+        self._writeMetadata(start,columns)
+        if templates is not None:
+            self.h5['templates'][start:stop,:] = templates
+        self.h5.attrs['count'] = stop
+        self._touch()
+
+    def _clearValid(self, rows):
+        # Clear the valid flags with one read and write of the block
+        start, stop = int(rows[0]), int(rows[-1])+1
+        valid = self.h5['valid'][start:stop]
+        valid[rows-start] = 0
+        self.h5['valid'][start:stop] = valid
+        self._touch()
+
+    def liveRows(self):
+        ''' Return the row ids of all live faces in row order. '''
+        count = self.count
+        if count == 0:
+            return np.zeros((0,),dtype=np.int64)
+        return np.nonzero(self.h5['valid'][:count])[0].astype(np.int64)
+
+    def isLive(self, rows):
+        ''' Return a boolean array that is true for the rows that have not been deleted. '''
+        return self._readRows('valid',rows) != 0
+
+    def _readRows(self, name, rows):
+        ''' Read a column for rows in increasing order. '''
+        rows = np.asarray(rows,dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        start, stop = int(rows[0]), int(rows[-1])+1
+        if stop - start <= 4*len(rows):
+            # Dense rows are cheaper to read as one block
+            return self.h5[name][start:stop][rows-start]
+        return self.h5[name][rows.tolist()]
+
+    def faceIds(self, rows):
+        return [_decodeString(value) for value in self._readRows('face_ids',rows)]
+
+    def subjectIds(self, rows):
+        return [_decodeString(value) for value in self._readRows('subject_ids',rows)]
+
+    def metadata(self, rows):
+        '''
+        Return a dict of name, subject_id, source and frame lists for rows in
+        increasing order without parsing the face records.
+        '''
+        result = {}
+        for name,field in STRING_COLUMNS:
+            result[field] = [_decodeString(value) for value in self._readRows(name,rows)]
+        result['frame'] = [int(value) for value in self._readRows('frames',rows)]
+        return result
+
+    def viewKeys(self, rows):
+        return [_decodeString(value) for value in self._readRows('view_keys',rows)]
+
+    def templates(self, start=0, stop=None):
+        ''' Read a contiguous block of the template matrix. '''
+        if stop is None:
+            stop = self.count
+        if 'templates' not in self.h5:
+            return np.zeros((stop-start,0),dtype=np.float32)
+        return self.h5['templates'][start:stop,:]
+
+    def readColumns(self, rows):
+        columns = {'records' : [data.tobytes() for data in self._readRows('records',rows)]}
+        for name in ('face_ids','subject_ids','names','sources','view_keys'):
+            columns[name] = [_decodeString(value) for value in self._readRows(name,rows)]
+        columns['frames'] = [int(value) for value in self._readRows('frames',rows)]
+        columns['templates'] = self._readRows('templates',rows) if 'templates' in self.h5 else None
+        return columns
+
+    def readBlock(self, start, stop, view=False):
+        with self.lock:
+            stop = min(stop,self.count)
+            if stop <= start:
+                return np.zeros((0,),dtype=np.int64), [], np.zeros((0,self.dim),dtype=np.float32)
+            live = self.h5['valid'][start:stop] != 0
+            rows = np.nonzero(live)[0].astype(np.int64) + start
+            records = [data.tobytes() for data in self.h5['records'][start:stop][live]]
+            templates = self.templates(start,stop)[live]
+            view_keys = None
+            if view:
+                view_keys = [_decodeString(value) for value in self.h5['view_keys'][start:stop][live]]
+
+        return rows, self._parseRecords(records,view_keys), templates
+
+    def _readRecord(self, row, view):
+        template = None
+        if 'templates' in self.h5:
+            template = self.h5['templates'][row,:]
+        view_key = _decodeString(self.h5['view_keys'][row]) if view else ''
+        return self.h5['records'][row].tobytes(), template, view_key
+
+    def flush(self, log_seq=None):
+        ''' Write changes to disk.  log_seq records the last log entry included in the file. '''
+        with self.lock:
+            if log_seq is not None:
+                self.h5.attrs['log_seq'] = log_seq
+            self.h5.flush()
+
+    def sync(self):
+        ''' Flush the file and wait for the operating system to write it and any new view blobs to disk. '''
+        with self.lock:
+            if self.blobs is not None:
+                self.blobs.sync()
+            self.h5.flush()
+            # Sync the descriptor that HDF5 wrote through.  Syncing another
+            # descriptor of the file is not guaranteed to cover those writes.
+            os.fsync(self.h5.id.get_vfd_handle())
+
+    def replaceFile(self, new_path):
+        '''
+        Atomically replace the gallery file with the file at new_path and
+        reopen it.  The new file must already be synced to disk.
+        '''
+        import h5py
+        with self.lock:
+            self.h5.close()
+            os.rename(new_path,self.path)
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)),os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self.h5 = h5py.File(self.path,'a')
+            self._loadKeys()
+
+    def close(self):
+        with self.lock:
+            self.h5.close()
+
+
+def migrateGallery(path, backup_suffix='.v1', blob_dir=None):
+    '''
+    Convert a legacy gallery file to the columnar layout.
+
+    The converted gallery replaces the original file and the original is kept
+    next to it with the backup suffix appended.  If blob_dir is given the
+    views are moved to a blob store in that directory.
+    '''
+    import h5py
+
+    tmp_path = path + '.migrating'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    start = time.time()
+    legacy = h5py.File(path,'r')
+    store = GalleryStore(tmp_path,'w',blob_dir)
+    try:
+        keys = list(legacy['faces'])
+        total = len(keys)
+        print("Migrating %d faces from %s"%(total,path))
+        for i in range(0,total,MIGRATE_BATCH_SIZE):
+            batch = []
+            for key in keys[i:i+MIGRATE_BATCH_SIZE]:
+                face = FaceRecord()
+                face.ParseFromString(np.array(legacy['faces'][key]).tobytes())
+                face.gallery_key = key
+                batch.append(face)
+            store.append(batch)
+            print("   Migrated %d of %d faces."%(min(i+MIGRATE_BATCH_SIZE,total),total))
+        store.sync()
+    finally:
+        store.close()
+        legacy.close()
+
+    os.rename(path,path+backup_suffix)
+    os.rename(tmp_path,path)
+
+    stop = time.time()
+    print("   Migration Complete: %d faces in %0.3fs"%(total,stop-start))
+    return total
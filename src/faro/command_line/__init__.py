@@ -23,7 +23,7 @@ SOFTWARE.
 '''
 
 from faro.command_line.cl_common import addConnectionOptions, connectToFaroClient
-from faro.command_line.cl_gallery import glist, gdelete
+from faro.command_line.cl_gallery import glist, gdelete, gconfig, gcompact, gexport, gimport, gmigrate
 from faro.command_line.cl_status import *
 from faro.command_line.cl_startup import *
 
@@ -22,10 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
+import os
 import sys
+import struct
+import time
 import optparse
 
 import faro
+import faro.proto.face_service_pb2 as fsd
 from faro.command_line import addConnectionOptions, connectToFaroClient
 
 def galleryListOptions():
@@ -103,6 +107,195 @@ def galleryDeleteOptions():
     return options,args
 
 
+def galleryConfigureOptions():
+    '''
+    Parse command line arguments.
+    '''
+    args = ['gallery_name'] # Add the names of arguments here.
+    n_args = len(args)
+    args = " ".join(args)
+    description = '''Change the settings of a gallery.'''
+    epilog = '''Created by David Bolme - bolmeds@ornl.gov'''
+    
+    version = faro.__version__
+    
+    
+    
+    # Setup the parser
+    parser = optparse.OptionParser(usage='%s command [OPTIONS] %s'%(sys.argv[0],args),version=version,description=description,epilog=epilog)
+
+    parser.add_option( "-v", "--verbose", action="store_true", dest="verbose", default=False,
+                      help="Print out more program information.")
+    
+    parser.add_option( "--index-quantization", type="choice", choices=['none','float16','int8'], dest="index_quantization", default='',
+                      help="Search the gallery with a quantized index [none, float16, int8]. The index is rebuilt when this changes.")
+    
+    addConnectionOptions(parser)
+
+    # Parse the arguments and return the results.
+    (options, args) = parser.parse_args()
+    
+    if len(args) != n_args + 1:
+        parser.print_help()
+        print()
+        print(( "Error: Please supply a gallery name."))
+        print()
+        exit(-1)
+        
+        
+    return options,args
+
+
+def galleryCompactOptions():
+    '''
+    Parse command line arguments.
+    '''
+    args = ['gallery_name ...'] # Add the names of arguments here.
+    n_args = len(args)
+    args = " ".join(args)
+    description = '''Rewrite galleries to reclaim the disk space used by deleted and replaced faces. The galleries remain available while they are compacted.'''
+    epilog = '''Created by David Bolme - bolmeds@ornl.gov'''
+    
+    version = faro.__version__
+    
+    
+    
+    # Setup the parser
+    parser = optparse.OptionParser(usage='%s command [OPTIONS] %s'%(sys.argv[0],args),version=version,description=description,epilog=epilog)
+
+    parser.add_option( "-v", "--verbose", action="store_true", dest="verbose", default=False,
+                      help="Print out more program information.")
+    
+    addConnectionOptions(parser)
+
+    # Parse the arguments and return the results.
+    (options, args) = parser.parse_args()
+    
+    if len(args) < 2:
+        parser.print_help()
+        print()
+        print(( "Error: Please supply at least one gallery name."))
+        print()
+        exit(-1)
+        
+        
+    return options,args
+
+
+def galleryExportOptions():
+    '''
+    Parse command line arguments.
+    '''
+    args = ['gallery_name','export_file'] # Add the names of arguments here.
+    n_args = len(args)
+    args = " ".join(args)
+    description = '''Export a gallery to a file of bulk chunks that can be loaded on another service with gimport.'''
+    epilog = '''Created by David Bolme - bolmeds@ornl.gov'''
+    
+    version = faro.__version__
+    
+    
+    
+    # Setup the parser
+    parser = optparse.OptionParser(usage='%s command [OPTIONS] %s'%(sys.argv[0],args),version=version,description=description,epilog=epilog)
+
+    parser.add_option( "-v", "--verbose", action="store_true", dest="verbose", default=False,
+                      help="Print out more program information.")
+    
+    parser.add_option( "--views", action="store_true", dest="views", default=False,
+                      help="Include the face view images in the export.")
+    
+    parser.add_option( "--resume", action="store_true", dest="resume", default=False,
+                      help="Continue an interrupted export by appending to the export file.")
+    
+    addConnectionOptions(parser)
+
+    # Parse the arguments and return the results.
+    (options, args) = parser.parse_args()
+    
+    if len(args) != n_args + 1:
+        parser.print_help()
+        print()
+        print(( "Error: Please supply a gallery name and an export file."))
+        print()
+        exit(-1)
+        
+        
+    return options,args
+
+
+def galleryImportOptions():
+    '''
+    Parse command line arguments.
+    '''
+    args = ['export_file','gallery_name'] # Add the names of arguments here.
+    n_args = len(args)
+    args = " ".join(args)
+    description = '''Enroll the faces in a gallery export file.'''
+    epilog = '''Created by David Bolme - bolmeds@ornl.gov'''
+    
+    version = faro.__version__
+    
+    
+    
+    # Setup the parser
+    parser = optparse.OptionParser(usage='%s command [OPTIONS] %s'%(sys.argv[0],args),version=version,description=description,epilog=epilog)
+
+    parser.add_option( "-v", "--verbose", action="store_true", dest="verbose", default=False,
+                      help="Print out more program information.")
+    
+    parser.add_option( "--start-row", type="int", dest="start_row", default=0,
+                      help="Skip the chunks before this row to resume an interrupted import. Default=0")
+    
+    addConnectionOptions(parser)
+
+    # Parse the arguments and return the results.
+    (options, args) = parser.parse_args()
+    
+    if len(args) != n_args + 1:
+        parser.print_help()
+        print()
+        print(( "Error: Please supply an export file and a gallery name."))
+        print()
+        exit(-1)
+        
+        
+    return options,args
+
+
+def galleryMigrateOptions():
+    '''
+    Parse command line arguments.
+    '''
+    args = ['gallery_file_or_dir ...'] # Add the names of arguments here.
+    n_args = len(args)
+    args = " ".join(args)
+    description = '''Convert galleries in the legacy one-dataset-per-face layout to the columnar gallery layout. This runs directly on the gallery files and the FaRO service should be stopped first.'''
+    epilog = '''Created by David Bolme - bolmeds@ornl.gov'''
+    
+    version = faro.__version__
+    
+    
+    
+    # Setup the parser
+    parser = optparse.OptionParser(usage='%s command [OPTIONS] %s'%(sys.argv[0],args),version=version,description=description,epilog=epilog)
+
+    parser.add_option( "-v", "--verbose", action="store_true", dest="verbose", default=False,
+                      help="Print out more program information.")
+    
+    # Parse the arguments and return the results.
+    (options, args) = parser.parse_args()
+    
+    if len(args) < 2:
+        parser.print_help()
+        print()
+        print(( "Error: Please supply at least one gallery file or directory."))
+        print()
+        exit(-1)
+        
+        
+    return options,args
+
 
 def glist():
     options,args = galleryListOptions()
@@ -112,10 +305,12 @@ def glist():
     result = face_client.galleryList()
     
     print()
-    print("%-24s | %10s"%('GALLERY NAME','FACE_COUNT'))
-    print('-'*37)
+    print("%-24s | %10s | %10s | %5s | %10s | %7s | %19s"%('GALLERY NAME','FACE_COUNT','SUBJECTS','DIM','MB','INDEX','MODIFIED'))
+    print('-'*104)
     for gallery in result.galleries:
-        print("%-24s | %10d"%(gallery.gallery_name,gallery.face_count))
+        modified = time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(gallery.modified)) if gallery.modified > 0 else ''
+        print("%-24s | %10d | %10d | %5d | %10.1f | %7s | %19s"%(gallery.gallery_name,gallery.face_count,gallery.subject_count,
+                                                                 gallery.template_dim,gallery.file_bytes/(1024*1024),gallery.index_state,modified))
     print()
     
 
@@ -136,4 +331,134 @@ def gdelete():
     if confirm.upper() in ('Y','YES'):
         result = face_client.galleryDelete(gallery_name)
     
-    print(result)
\ No newline at end of file
+    print(result)
+
+
+def gconfig():
+    options,args = galleryConfigureOptions()
+
+    gallery_name = args[1]
+
+    face_client = connectToFaroClient(options)
+
+    face_client.galleryConfigure(gallery_name,index_quantization=options.index_quantization)
+
+    print("Updated the settings of '%s'."%(gallery_name,))
+
+
+def gcompact():
+    options,args = galleryCompactOptions()
+
+    face_client = connectToFaroClient(options)
+
+    print()
+    print("%-24s | %10s | %10s | %14s | %8s"%('GALLERY NAME','FACE_COUNT','ROWS_FREED','BYTES_FREED','TIME'))
+    print('-'*78)
+    for gallery_name in args[1:]:
+        result = face_client.galleryCompact(gallery_name)
+        print("%-24s | %10d | %10d | %14d | %7.2fs"%(result.gallery_name,result.face_count,result.rows_removed,result.bytes_reclaimed,result.compact_time))
+    print()
+
+
+_CHUNK_HEADER = struct.Struct('<Q')
+
+
+def _readChunks(path):
+    ''' Iterate over the chunks in an export file and the file offset after each one. '''
+    with open(path,'rb') as f:
+        offset = 0
+        while True:
+            header = f.read(_CHUNK_HEADER.size)
+            if len(header) < _CHUNK_HEADER.size:
+                return
+            length, = _CHUNK_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                return # An interrupted write
+            chunk = fsd.GalleryChunk()
+            chunk.ParseFromString(data)
+            offset += _CHUNK_HEADER.size + length
+            yield chunk, offset
+
+
+def gexport():
+    options,args = galleryExportOptions()
+
+    gallery_name, path = args[1], args[2]
+
+    start_row = 0
+    file_id = ''
+    mode = 'wb'
+    if options.resume and os.path.exists(path):
+        end = 0
+        for chunk,end in _readChunks(path):
+            start_row = chunk.next_row
+            file_id = chunk.file_id
+        with open(path,'r+b') as f:
+            f.truncate(end)
+        mode = 'ab'
+        print("Resuming the export of '%s' at row %d."%(gallery_name,start_row))
+
+    face_client = connectToFaroClient(options)
+
+    face_count = 0
+    with open(path,mode) as f:
+        for chunk in face_client.galleryExport(gallery_name,start_row,file_id,options.views):
+            data = chunk.SerializeToString()
+            f.write(_CHUNK_HEADER.pack(len(data)))
+            f.write(data)
+            face_count += len(chunk.records.face_records)
+            if options.verbose:
+                print("   Exported rows %d of %d."%(chunk.next_row,chunk.row_count))
+
+    print("Exported %d faces from '%s' to %s."%(face_count,gallery_name,path))
+
+
+def gimport():
+    options,args = galleryImportOptions()
+
+    path, gallery_name = args[1], args[2]
+
+    face_client = connectToFaroClient(options)
+
+    chunks = (chunk for chunk,_ in _readChunks(path) if chunk.next_row > options.start_row)
+
+    response = None
+    try:
+        for response in face_client.galleryImport(chunks,gallery_name):
+            if options.verbose:
+                print("   Imported through row %d: %d faces."%(response.next_row,response.enroll_count))
+    except:
+        if response is not None:
+            print("Import interrupted. Resume with --start-row=%d."%(response.next_row,))
+        raise
+
+    if response is None:
+        print("No faces to import from %s."%(path,))
+    else:
+        print("Imported %d faces into '%s' with %d replacements."%(response.enroll_count,gallery_name,response.replace_count))
+
+
+def gmigrate():
+    from faro.GalleryStore import isLegacyGallery, migrateGallery
+
+    options,args = galleryMigrateOptions()
+
+    paths = []
+    for each in args[1:]:
+        if os.path.isdir(each):
+            paths += [os.path.join(each,name) for name in sorted(os.listdir(each)) if name.endswith('.h5')]
+        else:
+            paths.append(each)
+
+    migrated = 0
+    for path in paths:
+        if not isLegacyGallery(path):
+            if options.verbose:
+                print("Skipping %s: already uses the columnar layout."%(path,))
+            continue
+        # Views are moved to the blob directory the server uses for the gallery
+        migrateGallery(path,blob_dir=os.path.splitext(path)[0]+'.blobs')
+        migrated += 1
+
+    print("Migrated %d of %d galleries."%(migrated,len(paths)))
@@ -26,6 +26,30 @@ def getOptionsGroup(parser):
     rankone_options.add_option("--min-face-size", dest="min_face_size", default='recommended')
 
 
+class RocGallery(object):
+    '''
+    The unflattened roc templates of a gallery.  The native templates are
+    freed when the last reference to the gallery is dropped.
+    '''
+
+    def __init__(self, worker, templates):
+        self.templates = []
+        for template in templates.templates:
+            native = roc.roc_template()
+            worker._rocUnFlatten(template.buffer,native)
+            self.templates.append(native)
+
+    def __len__(self):
+        return len(self.templates)
+
+    def __del__(self):
+        if roc is None:
+            return
+        for native in self.templates:
+            roc.roc_free_template(native)
+        self.templates = []
+
+
 class RankOneFaceWorker(faro.FaceWorker):
     '''
     classdocs
@@ -355,53 +379,63 @@ class RankOneFaceWorker(faro.FaceWorker):
             raise ValueError("no gallery templates were found in the arguments.")
         '''
 
-        #This is the first attempt at computing similarity scores. This is definitely not the fastest approach.
-        #Also , this is going to be restricted by  memory. The whole similarity matrix be be held in memory.
-        #So for large datasets this might pose a problem
-
-        
-        if score_type == fsd.SERVER:
-            #rows = probe images
-            #cols = gallery images
-            sim_mat = np.zeros((len(score_request.template_probes.templates),len(score_request.template_gallery.templates)),dtype=np.float32)
-           
-            roc_probe_template = roc.roc_template() 
-            roc_gallery_template = roc.roc_template()
-            #roc_gallery_template_array = roc.new_roc_template_array(len(score_request.template_gallery.templates))
-            sm_metric = roc.new_roc_similarity()
-            for p in range(0,len(score_request.template_probes.templates)):
-                self._rocUnFlatten(score_request.template_probes.templates[p].buffer,roc_probe_template)
-                #print roc_probe_template
-                for g in range(0,len(score_request.template_gallery.templates)):
-                    #print(p,g)
-                    #if p == 0:
-                    #    roc_gallery_template = roc.roc_template()
-                    #    self._rocUnFlatten(score_request.template_gallery.templates[g].buffer,roc_gallery_template)
-                    #    roc.roc_template_array_setitem(roc_gallery_template_array,g,roc_gallery_template)
-                    #roc_gallery_template = roc.roc_template()
-                    self._rocUnFlatten(score_request.template_gallery.templates[g].buffer,roc_gallery_template)   
-                    #roc.roc_compare_templates(roc_probe_template, roc.roc_template_array_getitem(roc_gallery_template_array,g), sm_metric)
+        # Each gallery template is unflattened once for all of the probes
+        gallery = RocGallery(self,score_request.template_gallery)
+
+        # Return the result
+        return pt.matrix_np2proto(self._compare(score_request.template_probes,gallery))
+
+    def prepareGallery(self, templates):
+        '''Unflatten the gallery templates for scoreGallery.'''
+        if isinstance(templates,np.ndarray):
+            raise ValueError("RankOne galleries require flattened roc templates.")
+        return RocGallery(self,templates)
+
+    def scoreGallery(self, probes, gallery):
+        '''Score a TemplateList of probes against a RocGallery.'''
+        return self._compare(probes,gallery)
+
+    def scoreGalleryTile(self, gallery, probe_start, probe_stop, gallery_start, gallery_stop):
+        '''Compare a block of a RocGallery to another block without unflattening any template.'''
+        return self._compareNative(gallery.templates[probe_start:probe_stop],gallery.templates[gallery_start:gallery_stop])
+
+    def _compare(self, probes, gallery):
+        '''
+        Compare every probe to the native gallery templates and return the
+        (probes, gallery) distance matrix.  Each probe is unflattened once.
+        '''
+        roc_probe_templates = []
+        try:
+            for template in probes.templates:
+                roc_probe_templates.append(roc.roc_template())
+                self._rocUnFlatten(template.buffer,roc_probe_templates[-1])
+            return self._compareNative(roc_probe_templates,gallery.templates)
+        finally:
+            for roc_probe_template in roc_probe_templates:
+                roc.roc_free_template(roc_probe_template)
+
+    def _compareNative(self, roc_probe_templates, roc_gallery_templates):
+        ''' Return the distance matrix of two lists of native templates. '''
+        #rows = probe images
+        #cols = gallery images
+        sim_mat = np.zeros((len(roc_probe_templates),len(roc_gallery_templates)),dtype=np.float32)
+
+        sm_metric = roc.new_roc_similarity()
+        try:
+            for p,roc_probe_template in enumerate(roc_probe_templates):
+                row = sim_mat[p]
+                for g,roc_gallery_template in enumerate(roc_gallery_templates):
                     roc.roc_compare_templates(roc_probe_template, roc_gallery_template, sm_metric)
-                    sim_mat[p,g] = roc.roc_similarity_value(sm_metric)
-                    #roc.roc_free_template(roc_gallery_template)
-            roc.delete_roc_similarity(sm_metric)        
-            roc.roc_free_template(roc_probe_template)
-            roc.roc_free_template(roc_gallery_template)
-            #for i in range(len(score_request.template_gallery.templates)):
-                #print(i)
-            #    roc.roc_ensure(roc.roc_free_template(roc.roc_template_array_getitem(roc_gallery_template_array, i)))
-    
-        else:
-            NotImplementedError("ScoreType %s is not implemented."%(score_type,))
+                    row[g] = roc.roc_similarity_value(sm_metric)
+        finally:
+            roc.delete_roc_similarity(sm_metric)
 
         #RankOne returns a similarity score of -1 if it compares with an invalid template
         #Threfore find all -1's in the matrix and replace it with a 0
 
         sim_mat[sim_mat == -1.0] = 0.0
         #converting the simialrity matrix to distance matrix by subtracting with 1
-        dist_mat = 1.0 - sim_mat
-        # Return the result
-        return pt.matrix_np2proto(dist_mat)
+        return 1.0 - sim_mat
      
     def status(self):
         '''Return a simple status message.'''
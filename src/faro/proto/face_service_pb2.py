@@ -22,7 +22,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=b'\252\002\nFaro.Proto',
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x1d\x66\x61ro/proto/face_service.proto\x1a\x16\x66\x61ro/proto/image.proto\x1a\x19\x66\x61ro/proto/geometry.proto\"\x8d\x02\n\tAttribute\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0e\n\x06\x62uffer\x18\x03 \x01(\x0c\x12\x0e\n\x06\x66value\x18\x04 \x01(\x02\x12\x0e\n\x06ivalue\x18\x05 \x01(\x05\x12\x0c\n\x04text\x18\x06 \x01(\t\x12\x0e\n\x06pickle\x18\x07 \x01(\x0c\x12\x0c\n\x04json\x18\x08 \x01(\x0c\x12\x17\n\x06matrix\x18\t \x01(\x0b\x32\x07.Matrix\x12\x17\n\x06vector\x18\n \x01(\x0b\x32\x07.Vector\x12\x15\n\x05image\x18\x0b \x01(\x0b\x32\x06.Image\x12\x17\n\x05point\x18\x0c \x01(\x0b\x32\x08.Point2D\x12\x13\n\x04rect\x18\r \x01(\x0b\x32\x05.Rect\x12\x0b\n\x03xml\x18\x0e \x01(\x0c\"9\n\x0c\x45rrorMessage\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x15\n\rerror_message\x18\x04 \x01(\t\"\x82\x01\n\tDetection\x12\r\n\x05score\x18\x01 \x01(\x02\x12\x17\n\x08location\x18\x02 \x01(\x0b\x32\x05.Rect\x12\x14\n\x0c\x64\x65tection_id\x18\x03 \x01(\x05\x12\x17\n\x0f\x64\x65tection_class\x18\x04 \x01(\t\x12\x1e\n\nattributes\x18\x05 \x03(\x0b\x32\n.Attribute\";\n\x08Landmark\x12\x13\n\x0blandmark_id\x18\x01 \x01(\t\x12\x1a\n\x08location\x18\x02 \x01(\x0b\x32\x08.Point2D\"\xf5\x01\n\x10\x44\x65tectionOptions\x12\x14\n\x0c\x61lgorithm_id\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x65st\x18\x02 \x01(\x08\x12\x11\n\tthreshold\x18\x03 \x01(\x02\x12\x14\n\x0cscale_levels\x18\x04 \x01(\x05\x12\x13\n\x0bscan_levels\x18\x05 \x01(\x05\x12\x14\n\x0cscan_overlap\x18\x06 \x01(\x02\x12\x10\n\x08min_size\x18\x07 \x01(\x05\x12\x14\n\x0csave_request\x18\t \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\n \x01(\x08\x12\x12\n\ndownsample\x18\x0b \x01(\x05\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\"k\n\x0e\x45xtractOptions\x12\x14\n\x0c\x61lgorithm_id\x18\x01 \x01(\t\x12\x14\n\x0csave_request\x18\x02 \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\x03 \x01(\x08\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\"T\n\rEnrollOptions\x12\x14\n\x0csave_request\x18\x02 \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\x03 \x01(\x08\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\"\xaf\x01\n\rDetectionList\x12\x1e\n\ndetections\x18\x01 \x03(\x0b\x32\n.Detection\x12\x16\n\x0e\x64\x65tection_time\x18\x02 \x01(\x02\x12\x13\n\x0bimage_width\x18\x03 \x01(\x05\x12\x14\n\x0cimage_height\x18\x04 \x01(\x05\x12\x17\n\x0f\x64\x65tection_count\x18\x05 \x01(\x05\x12\"\n\x07options\x18\x06 \x01(\x0b\x32\x11.DetectionOptions\"+\n\tMatchList\x12\x1e\n\nmatch_list\x18\x01 \x03(\x0b\x32\n.MatchInfo\"\x82\x01\n\tMatchInfo\x12\r\n\x05score\x18\x01 \x01(\x02\x12\x10\n\x08image_id\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x65tection_id\x18\x03 \x01(\t\x12\x12\n\nsubject_id\x18\x04 \x01(\t\x12\x14\n\x0csubject_name\x18\x05 \x01(\t\x12\x14\n\x04\x66\x61\x63\x65\x18\x06 \x01(\x0b\x32\x06.Image\">\n\rTemplateInput\x12\x12\n\x02im\x18\x01 \x01(\x0b\x32\x06.Image\x12\x19\n\ndetections\x18\x02 \x03(\x0b\x32\x05.Rect\"H\n\x0c\x46\x61\x63\x65Template\x12\x15\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x07.Vector\x12\x0e\n\x06\x62uffer\x18\x02 \x01(\x0c\x12\x11\n\talgorithm\x18\x03 \x01(\t\"0\n\x0cTemplateList\x12 \n\ttemplates\x18\x01 \x03(\x0b\x32\r.FaceTemplate\"a\n\x0c\x41\x63\x63\x65ssRecord\x12\x10\n\x08\x64\x61tetime\x18\x01 \x01(\x02\x12\r\n\x05notes\x18\x02 \x01(\t\x12\x12\n\ncredential\x18\x03 \x01(\t\x12\x1c\n\x08metadata\x18\x04 \x03(\x0b\x32\n.Attribute\"\x83\x04\n\nFaceRecord\x12\x12\n\nsubject_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x0e\n\x06source\x18\x04 \x01(\t\x12\r\n\x05\x66rame\x18\x0e \x01(\x03\x12\x11\n\talgorithm\x18\x14 \x01(\t\x12\r\n\x05notes\x18\x06 \x01(\t\x12\x13\n\x0bgallery_key\x18\x0f \x01(\t\x12\x17\n\x0f\x63ollection_date\x18\x10 \x01(\x02\x12\x17\n\x0f\x65nrollment_date\x18\x11 \x01(\x02\x12\x1c\n\x08metadata\x18\x12 \x03(\x0b\x32\n.Attribute\x12%\n\x0e\x61\x63\x63\x65ss_records\x18\x13 \x03(\x0b\x32\r.AccessRecord\x12\x14\n\x04view\x18\x07 \x01(\x0b\x32\x06.Image\x12\x17\n\x07\x61ligned\x18\t \x01(\x0b\x32\x06.Image\x12\x1d\n\tdetection\x18\x02 \x01(\x0b\x32\n.Detection\x12\x1c\n\tlandmarks\x18\x08 \x03(\x0b\x32\t.Landmark\x12\x1e\n\nattributes\x18\n \x03(\x0b\x32\n.Attribute\x12!\n\rinternal_data\x18\x0b \x03(\x0b\x32\n.Attribute\x12\x1f\n\x08template\x18\x03 \x01(\x0b\x32\r.FaceTemplate\x12\r\n\x05score\x18\x0c \x01(\x02\x12\'\n\x0esearch_results\x18\r \x01(\x0b\x32\x0f.FaceRecordList\"3\n\x0e\x46\x61\x63\x65RecordList\x12!\n\x0c\x66\x61\x63\x65_records\x18\x01 \x03(\x0b\x32\x0b.FaceRecord\"\\\n\x13VerificationRequest\x12\x0f\n\x07gallery\x18\x01 \x01(\t\x12\x12\n\nsubject_id\x18\x02 \x01(\t\x12 \n\x0b\x66\x61\x63\x65_record\x18\x03 \x03(\x0b\x32\x0b.FaceRecord\"\x84\x01\n\x14VerificationResponse\x12\x12\n\nerror_code\x18\x04 \x01(\x05\x12\x15\n\rerror_message\x18\x05 \x01(\t\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x1c\n\x07matches\x18\x03 \x03(\x0b\x32\x0b.FaceRecord\"p\n\rSearchRequest\x12\x16\n\x0esearch_gallery\x18\x01 \x01(\t\x12\x1f\n\x06probes\x18\x03 \x01(\x0b\x32\x0f.FaceRecordList\x12\x13\n\x0bmax_results\x18\x04 \x01(\x05\x12\x11\n\tthreshold\x18\x05 \x01(\x02\"Q\n\x0eSearchResponse\x12\x1e\n\x07message\x18\x01 \x01(\x0b\x32\r.ErrorMessage\x12\x1f\n\x06probes\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\"q\n\rEnrollRequest\x12\x16\n\x0e\x65nroll_gallery\x18\x01 \x01(\t\x12 \n\x07records\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\x12&\n\x0e\x65nroll_options\x18\n \x01(\x0b\x32\x0e.EnrollOptions\"\x9a\x01\n\rDetectRequest\x12\x15\n\x05image\x18\x01 \x01(\x0b\x32\x06.Image\x12\x0e\n\x06source\x18\x02 \x01(\t\x12\r\n\x05\x66rame\x18\x03 \x01(\x03\x12\x12\n\nsubject_id\x18\x04 \x01(\t\x12\x14\n\x0csubject_name\x18\x05 \x01(\t\x12)\n\x0e\x64\x65tect_options\x18\x08 \x01(\x0b\x32\x11.DetectionOptions\"s\n\x0e\x45xtractRequest\x12\x15\n\x05image\x18\x01 \x01(\x0b\x32\x06.Image\x12 \n\x07records\x18\x04 \x01(\x0b\x32\x0f.FaceRecordList\x12(\n\x0f\x65xtract_options\x18\t \x01(\x0b\x32\x0f.ExtractOptions\"\xac\x01\n\x0cScoreRequest\x12$\n\x0b\x66\x61\x63\x65_probes\x18\x01 \x01(\x0b\x32\x0f.FaceRecordList\x12%\n\x0c\x66\x61\x63\x65_gallery\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\x12&\n\x0ftemplate_probes\x18\x03 \x01(\x0b\x32\r.TemplateList\x12\'\n\x10template_gallery\x18\x04 \x01(\x0b\x32\r.TemplateList\"h\n\x14\x44\x65tectExtractRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\"\x96\x01\n\x1a\x44\x65tectExtractEnrollRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\x12&\n\x0e\x65nroll_request\x18\x03 \x01(\x0b\x32\x0e.EnrollRequest\"\x96\x01\n\x1a\x44\x65tectExtractSearchRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\x12&\n\x0esearch_request\x18\x03 \x01(\x0b\x32\x0e.SearchRequest\"\x13\n\x11\x46\x61\x63\x65StatusRequest\"\xd2\x02\n\x0f\x46\x61\x63\x65ServiceInfo\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.ServiceStatus\x12\x14\n\x0cworker_count\x18\x02 \x01(\x05\x12\x19\n\x11\x64\x65tection_support\x18\x03 \x01(\x08\x12\x17\n\x0f\x65xtract_support\x18\x04 \x01(\x08\x12\x15\n\rscore_support\x18\x05 \x01(\x08\x12\x19\n\x11\x61ttribute_support\x18\x06 \x01(\x08\x12\x1e\n\nscore_type\x18\x07 \x01(\x0e\x32\n.ScoreType\x12\x1b\n\x13\x64\x65tection_threshold\x18\x08 \x01(\x02\x12\x17\n\x0fmatch_threshold\x18\t \x01(\x02\x12\x11\n\talgorithm\x18\n \x01(\t\x12\r\n\x05notes\x18\x0b \x01(\t\x12\x14\n\x0c\x66\x61ro_version\x18\x0c \x01(\t\x12\x15\n\rinstance_name\x18\r \x01(\t\"\x14\n\x12GalleryListRequest\",\n\x14GalleryDeleteRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\"-\n\x15\x45nrollmentListRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\"F\n\x0e\x45nrollmentInfo\x12\x12\n\nsubject_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nface_count\x18\x03 \x01(\x05\"T\n\x16\x45nrollmentListResponse\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12$\n\x0b\x65nrollments\x18\x02 \x03(\x0b\x32\x0f.EnrollmentInfo\"X\n\x17\x45nrollmentDeleteRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x12\n\nsubject_id\x18\x02 \x01(\t\x12\x13\n\x0bgallery_key\x18\x03 \x01(\t\"0\n\x18\x45nrollmentDeleteResponse\x12\x14\n\x0c\x64\x65lete_count\x18\x01 \x01(\x03\"7\n\x0bGalleryInfo\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x12\n\nface_count\x18\x02 \x01(\x03\".\n\x0bGalleryList\x12\x1f\n\tgalleries\x18\x01 \x03(\x0b\x32\x0c.GalleryInfo\"\x07\n\x05\x45mpty*<\n\rServiceStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05READY\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\x08\n\x04\x42USY\x10\x03*k\n\x08\x44\x61taType\x12\t\n\x05\x45MPTY\x10\x00\x12\n\n\x06STRING\x10\x01\x12\x07\n\x03INT\x10\x02\x12\t\n\x05\x46LOAT\x10\x03\x12\t\n\x05\x42YTES\x10\x04\x12\n\n\x06VECTOR\x10\x05\x12\n\n\x06PICKLE\x10\x06\x12\x07\n\x03XML\x10\x07\x12\x08\n\x04JSON\x10\x08*4\n\tScoreType\x12\n\n\x06SERVER\x10\x00\x12\x06\n\x02L1\x10\x01\x12\x06\n\x02L2\x10\x02\x12\x0b\n\x07NEG_DOT\x10\x03\x32\xe2\x06\n\x0f\x46\x61\x63\x65Recognition\x12\x30\n\x06status\x12\x12.FaceStatusRequest\x1a\x10.FaceServiceInfo\"\x00\x12+\n\x06\x64\x65tect\x12\x0e.DetectRequest\x1a\x0f.FaceRecordList\"\x00\x12-\n\x07\x65xtract\x12\x0f.ExtractRequest\x1a\x0f.FaceRecordList\"\x00\x12!\n\x05score\x12\r.ScoreRequest\x1a\x07.Matrix\"\x00\x12+\n\x06\x65nroll\x12\x0e.EnrollRequest\x1a\x0f.FaceRecordList\"\x00\x12+\n\x06search\x12\x0e.SearchRequest\x1a\x0f.FaceRecordList\"\x00\x12\x39\n\rdetectExtract\x12\x15.DetectExtractRequest\x1a\x0f.FaceRecordList\"\x00\x12\x45\n\x13\x64\x65tectExtractEnroll\x12\x1b.DetectExtractEnrollRequest\x1a\x0f.FaceRecordList\"\x00\x12\x45\n\x13\x64\x65tectExtractSearch\x12\x1b.DetectExtractSearchRequest\x1a\x0f.FaceRecordList\"\x00\x12\x32\n\x0bgalleryList\x12\x13.GalleryListRequest\x1a\x0c.GalleryList\"\x00\x12\x30\n\rgalleryDelete\x12\x15.GalleryDeleteRequest\x1a\x06.Empty\"\x00\x12;\n\x0e\x65nrollmentList\x12\x16.EnrollmentListRequest\x1a\x0f.FaceRecordList\"\x00\x12\x34\n\x10trainFromGallery\x12\x16.EnrollmentListRequest\x1a\x06.Empty\"\x00\x12\x46\n\rsubjectDelete\x12\x18.EnrollmentDeleteRequest\x1a\x19.EnrollmentDeleteResponse\"\x00\x12>\n\x19generateMatchDistribution\x12\x16.EnrollmentListRequest\x1a\x07.Matrix\"\x00\x12\x1a\n\x04\x65\x63ho\x12\x07.Matrix\x1a\x07.Matrix\"\x00\x42\r\xaa\x02\nFaro.Protob\x06proto3'
+  serialized_pb=b'\n\x1d\x66\x61ro/proto/face_service.proto\x1a\x16\x66\x61ro/proto/image.proto\x1a\x19\x66\x61ro/proto/geometry.proto\"\x8d\x02\n\tAttribute\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0e\n\x06\x62uffer\x18\x03 \x01(\x0c\x12\x0e\n\x06\x66value\x18\x04 \x01(\x02\x12\x0e\n\x06ivalue\x18\x05 \x01(\x05\x12\x0c\n\x04text\x18\x06 \x01(\t\x12\x0e\n\x06pickle\x18\x07 \x01(\x0c\x12\x0c\n\x04json\x18\x08 \x01(\x0c\x12\x17\n\x06matrix\x18\t \x01(\x0b\x32\x07.Matrix\x12\x17\n\x06vector\x18\n \x01(\x0b\x32\x07.Vector\x12\x15\n\x05image\x18\x0b \x01(\x0b\x32\x06.Image\x12\x17\n\x05point\x18\x0c \x01(\x0b\x32\x08.Point2D\x12\x13\n\x04rect\x18\r \x01(\x0b\x32\x05.Rect\x12\x0b\n\x03xml\x18\x0e \x01(\x0c\"9\n\x0c\x45rrorMessage\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x15\n\rerror_message\x18\x04 \x01(\t\"\x82\x01\n\tDetection\x12\r\n\x05score\x18\x01 \x01(\x02\x12\x17\n\x08location\x18\x02 \x01(\x0b\x32\x05.Rect\x12\x14\n\x0c\x64\x65tection_id\x18\x03 \x01(\x05\x12\x17\n\x0f\x64\x65tection_class\x18\x04 \x01(\t\x12\x1e\n\nattributes\x18\x05 \x03(\x0b\x32\n.Attribute\";\n\x08Landmark\x12\x13\n\x0blandmark_id\x18\x01 \x01(\t\x12\x1a\n\x08location\x18\x02 \x01(\x0b\x32\x08.Point2D\"\xf5\x01\n\x10\x44\x65tectionOptions\x12\x14\n\x0c\x61lgorithm_id\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x65st\x18\x02 \x01(\x08\x12\x11\n\tthreshold\x18\x03 \x01(\x02\x12\x14\n\x0cscale_levels\x18\x04 \x01(\x05\x12\x13\n\x0bscan_levels\x18\x05 \x01(\x05\x12\x14\n\x0cscan_overlap\x18\x06 \x01(\x02\x12\x10\n\x08min_size\x18\x07 \x01(\x05\x12\x14\n\x0csave_request\x18\t \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\n \x01(\x08\x12\x12\n\ndownsample\x18\x0b \x01(\x05\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\"k\n\x0e\x45xtractOptions\x12\x14\n\x0c\x61lgorithm_id\x18\x01 \x01(\t\x12\x14\n\x0csave_request\x18\x02 \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\x03 \x01(\x08\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\"\x81\x01\n\rEnrollOptions\x12\x14\n\x0csave_request\x18\x02 \x01(\x08\x12\r\n\x05\x64\x65\x62ug\x18\x03 \x01(\x08\x12\x1e\n\nattributes\x18\x08 \x03(\x0b\x32\n.Attribute\x12\x16\n\x0e\x64\x65\x64up_distance\x18\t \x01(\x02\x12\x13\n\x0b\x64\x65\x64up_merge\x18\n \x01(\x08\"\xaf\x01\n\rDetectionList\x12\x1e\n\ndetections\x18\x01 \x03(\x0b\x32\n.Detection\x12\x16\n\x0e\x64\x65tection_time\x18\x02 \x01(\x02\x12\x13\n\x0bimage_width\x18\x03 \x01(\x05\x12\x14\n\x0cimage_height\x18\x04 \x01(\x05\x12\x17\n\x0f\x64\x65tection_count\x18\x05 \x01(\x05\x12\"\n\x07options\x18\x06 \x01(\x0b\x32\x11.DetectionOptions\"+\n\tMatchList\x12\x1e\n\nmatch_list\x18\x01 \x03(\x0b\x32\n.MatchInfo\"\x82\x01\n\tMatchInfo\x12\r\n\x05score\x18\x01 \x01(\x02\x12\x10\n\x08image_id\x18\x02 \x01(\t\x12\x14\n\x0c\x64\x65tection_id\x18\x03 \x01(\t\x12\x12\n\nsubject_id\x18\x04 \x01(\t\x12\x14\n\x0csubject_name\x18\x05 \x01(\t\x12\x14\n\x04\x66\x61\x63\x65\x18\x06 \x01(\x0b\x32\x06.Image\">\n\rTemplateInput\x12\x12\n\x02im\x18\x01 \x01(\x0b\x32\x06.Image\x12\x19\n\ndetections\x18\x02 \x03(\x0b\x32\x05.Rect\"H\n\x0c\x46\x61\x63\x65Template\x12\x15\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x07.Vector\x12\x0e\n\x06\x62uffer\x18\x02 \x01(\x0c\x12\x11\n\talgorithm\x18\x03 \x01(\t\"0\n\x0cTemplateList\x12 \n\ttemplates\x18\x01 \x03(\x0b\x32\r.FaceTemplate\"a\n\x0c\x41\x63\x63\x65ssRecord\x12\x10\n\x08\x64\x61tetime\x18\x01 \x01(\x02\x12\r\n\x05notes\x18\x02 \x01(\t\x12\x12\n\ncredential\x18\x03 \x01(\t\x12\x1c\n\x08metadata\x18\x04 \x03(\x0b\x32\n.Attribute\"\x83\x04\n\nFaceRecord\x12\x12\n\nsubject_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x0e\n\x06source\x18\x04 \x01(\t\x12\r\n\x05\x66rame\x18\x0e \x01(\x03\x12\x11\n\talgorithm\x18\x14 \x01(\t\x12\r\n\x05notes\x18\x06 \x01(\t\x12\x13\n\x0bgallery_key\x18\x0f \x01(\t\x12\x17\n\x0f\x63ollection_date\x18\x10 \x01(\x02\x12\x17\n\x0f\x65nrollment_date\x18\x11 \x01(\x02\x12\x1c\n\x08metadata\x18\x12 \x03(\x0b\x32\n.Attribute\x12%\n\x0e\x61\x63\x63\x65ss_records\x18\x13 \x03(\x0b\x32\r.AccessRecord\x12\x14\n\x04view\x18\x07 \x01(\x0b\x32\x06.Image\x12\x17\n\x07\x61ligned\x18\t \x01(\x0b\x32\x06.Image\x12\x1d\n\tdetection\x18\x02 \x01(\x0b\x32\n.Detection\x12\x1c\n\tlandmarks\x18\x08 \x03(\x0b\x32\t.Landmark\x12\x1e\n\nattributes\x18\n \x03(\x0b\x32\n.Attribute\x12!\n\rinternal_data\x18\x0b \x03(\x0b\x32\n.Attribute\x12\x1f\n\x08template\x18\x03 \x01(\x0b\x32\r.FaceTemplate\x12\r\n\x05score\x18\x0c \x01(\x02\x12\'\n\x0esearch_results\x18\r \x01(\x0b\x32\x0f.FaceRecordList\"W\n\x0e\x46\x61\x63\x65RecordList\x12!\n\x0c\x66\x61\x63\x65_records\x18\x01 \x03(\x0b\x32\x0b.FaceRecord\x12\"\n\x0c\x65nroll_stats\x18\x03 \x01(\x0b\x32\x0c.EnrollStats\"c\n\x0b\x45nrollStats\x12\x14\n\x0c\x65nroll_count\x18\x01 \x01(\x03\x12\x15\n\rreplace_count\x18\x02 \x01(\x03\x12\x12\n\nskip_count\x18\x03 \x01(\x03\x12\x13\n\x0bmerge_count\x18\x04 \x01(\x03\"\\\n\x13VerificationRequest\x12\x0f\n\x07gallery\x18\x01 \x01(\t\x12\x12\n\nsubject_id\x18\x02 \x01(\t\x12 \n\x0b\x66\x61\x63\x65_record\x18\x03 \x03(\x0b\x32\x0b.FaceRecord\"\x84\x01\n\x14VerificationResponse\x12\x12\n\nerror_code\x18\x04 \x01(\x05\x12\x15\n\rerror_message\x18\x05 \x01(\t\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x1c\n\x07matches\x18\x03 \x03(\x0b\x32\x0b.FaceRecord\"\x9f\x01\n\rSearchRequest\x12\x16\n\x0esearch_gallery\x18\x01 \x01(\t\x12\x1f\n\x06probes\x18\x03 \x01(\x0b\x32\x0f.FaceRecordList\x12\x13\n\x0bmax_results\x18\x04 \x01(\x05\x12\x11\n\tthreshold\x18\x05 \x01(\x02\x12\x0e\n\x06nprobe\x18\x06 \x01(\x05\x12\x1d\n\x06\x66ilter\x18\x07 \x01(\x0b\x32\r.SearchFilter\"T\n\x0f\x41ttributeFilter\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x02 \x03(\t\x12\x11\n\tmin_value\x18\x03 \x01(\x02\x12\x11\n\tmax_value\x18\x04 \x01(\x02\"\xce\x01\n\x0cSearchFilter\x12\x13\n\x0bsubject_ids\x18\x01 \x03(\t\x12\x0f\n\x07sources\x18\x02 \x03(\t\x12\x1b\n\x13min_collection_date\x18\x03 \x01(\x02\x12\x1b\n\x13max_collection_date\x18\x04 \x01(\x02\x12\x1b\n\x13min_enrollment_date\x18\x05 \x01(\x02\x12\x1b\n\x13max_enrollment_date\x18\x06 \x01(\x02\x12$\n\nattributes\x18\x07 \x03(\x0b\x32\x10.AttributeFilter\"Q\n\x0eSearchResponse\x12\x1e\n\x07message\x18\x01 \x01(\x0b\x32\r.ErrorMessage\x12\x1f\n\x06probes\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\"q\n\rEnrollRequest\x12\x16\n\x0e\x65nroll_gallery\x18\x01 \x01(\t\x12 \n\x07records\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\x12&\n\x0e\x65nroll_options\x18\n \x01(\x0b\x32\x0e.EnrollOptions\"X\n\x12\x42ulkEnrollResponse\x12\x15\n\rrequest_count\x18\x01 \x01(\x03\x12\x14\n\x0c\x65nroll_count\x18\x02 \x01(\x03\x12\x15\n\rreplace_count\x18\x03 \x01(\x03\"\x9a\x01\n\rDetectRequest\x12\x15\n\x05image\x18\x01 \x01(\x0b\x32\x06.Image\x12\x0e\n\x06source\x18\x02 \x01(\t\x12\r\n\x05\x66rame\x18\x03 \x01(\x03\x12\x12\n\nsubject_id\x18\x04 \x01(\t\x12\x14\n\x0csubject_name\x18\x05 \x01(\t\x12)\n\x0e\x64\x65tect_options\x18\x08 \x01(\x0b\x32\x11.DetectionOptions\"s\n\x0e\x45xtractRequest\x12\x15\n\x05image\x18\x01 \x01(\x0b\x32\x06.Image\x12 \n\x07records\x18\x04 \x01(\x0b\x32\x0f.FaceRecordList\x12(\n\x0f\x65xtract_options\x18\t \x01(\x0b\x32\x0f.ExtractOptions\"\xac\x01\n\x0cScoreRequest\x12$\n\x0b\x66\x61\x63\x65_probes\x18\x01 \x01(\x0b\x32\x0f.FaceRecordList\x12%\n\x0c\x66\x61\x63\x65_gallery\x18\x02 \x01(\x0b\x32\x0f.FaceRecordList\x12&\n\x0ftemplate_probes\x18\x03 \x01(\x0b\x32\r.TemplateList\x12\'\n\x10template_gallery\x18\x04 \x01(\x0b\x32\r.TemplateList\"t\n\nScoreBlock\x12\x13\n\x0bprobe_start\x18\x01 \x01(\x03\x12\x15\n\rgallery_start\x18\x02 \x01(\x03\x12\x13\n\x0bprobe_count\x18\x03 \x01(\x05\x12\x15\n\rgallery_count\x18\x04 \x01(\x05\x12\x0e\n\x06scores\x18\x05 \x01(\x0c\"|\n\x18MatchDistributionRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x0c\n\x04\x62ins\x18\x02 \x01(\x05\x12\x11\n\tmin_score\x18\x03 \x01(\x02\x12\x11\n\tmax_score\x18\x04 \x01(\x02\x12\x16\n\x0einclude_scores\x18\x05 \x01(\x08\"\xea\x01\n\x11MatchDistribution\x12\x1a\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0b.ScoreBlock\x12\x12\n\nface_count\x18\x02 \x01(\x03\x12\x15\n\rgenuine_count\x18\x03 \x01(\x03\x12\x16\n\x0eimpostor_count\x18\x04 \x01(\x03\x12\x11\n\tbin_edges\x18\x05 \x03(\x02\x12\x19\n\x11genuine_histogram\x18\x06 \x03(\x03\x12\x1a\n\x12impostor_histogram\x18\x07 \x03(\x03\x12\x12\n\nthresholds\x18\x08 \x03(\x02\x12\x0b\n\x03\x66\x61r\x18\t \x03(\x02\x12\x0b\n\x03\x66rr\x18\n \x03(\x02\"h\n\x14\x44\x65tectExtractRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\"\x96\x01\n\x1a\x44\x65tectExtractEnrollRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\x12&\n\x0e\x65nroll_request\x18\x03 \x01(\x0b\x32\x0e.EnrollRequest\"\x96\x01\n\x1a\x44\x65tectExtractSearchRequest\x12&\n\x0e\x64\x65tect_request\x18\x01 \x01(\x0b\x32\x0e.DetectRequest\x12(\n\x0f\x65xtract_request\x18\x02 \x01(\x0b\x32\x0f.ExtractRequest\x12&\n\x0esearch_request\x18\x03 \x01(\x0b\x32\x0e.SearchRequest\"\x13\n\x11\x46\x61\x63\x65StatusRequest\"\xfd\x02\n\x0f\x46\x61\x63\x65ServiceInfo\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.ServiceStatus\x12\x14\n\x0cworker_count\x18\x02 \x01(\x05\x12\x19\n\x11\x64\x65tection_support\x18\x03 \x01(\x08\x12\x17\n\x0f\x65xtract_support\x18\x04 \x01(\x08\x12\x15\n\rscore_support\x18\x05 \x01(\x08\x12\x19\n\x11\x61ttribute_support\x18\x06 \x01(\x08\x12\x1e\n\nscore_type\x18\x07 \x01(\x0e\x32\n.ScoreType\x12\x1b\n\x13\x64\x65tection_threshold\x18\x08 \x01(\x02\x12\x17\n\x0fmatch_threshold\x18\t \x01(\x02\x12\x11\n\talgorithm\x18\n \x01(\t\x12\r\n\x05notes\x18\x0b \x01(\t\x12\x14\n\x0c\x66\x61ro_version\x18\x0c \x01(\t\x12\x15\n\rinstance_name\x18\r \x01(\t\x12)\n\rgallery_cache\x18\x0e \x01(\x0b\x32\x12.GalleryCacheStats\"\xaf\x01\n\x11GalleryCacheStats\x12\x16\n\x0eopen_galleries\x18\x01 \x01(\x03\x12\x18\n\x10pinned_galleries\x18\x02 \x01(\x03\x12\x12\n\nopen_bytes\x18\x03 \x01(\x03\x12\x10\n\x08max_open\x18\x04 \x01(\x03\x12\x11\n\tmax_bytes\x18\x05 \x01(\x03\x12\x0c\n\x04hits\x18\x06 \x01(\x03\x12\x0e\n\x06misses\x18\x07 \x01(\x03\x12\x11\n\tevictions\x18\x08 \x01(\x03\"\x14\n\x12GalleryListRequest\",\n\x14GalleryDeleteRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\"K\n\x17GalleryConfigureRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x1a\n\x12index_quantization\x18\x02 \x01(\t\"-\n\x15GalleryCompactRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\"\xb2\x01\n\x16GalleryCompactResponse\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x12\n\nface_count\x18\x02 \x01(\x03\x12\x14\n\x0crows_removed\x18\x03 \x01(\x03\x12\x14\n\x0c\x62ytes_before\x18\x04 \x01(\x03\x12\x13\n\x0b\x62ytes_after\x18\x05 \x01(\x03\x12\x17\n\x0f\x62ytes_reclaimed\x18\x06 \x01(\x03\x12\x14\n\x0c\x63ompact_time\x18\x07 \x01(\x02\"{\n\x14GalleryExportRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x11\n\tstart_row\x18\x02 \x01(\x03\x12\x0f\n\x07\x66ile_id\x18\x03 \x01(\t\x12\x12\n\nchunk_size\x18\x04 \x01(\x05\x12\x15\n\rinclude_views\x18\x05 \x01(\x08\"\xaf\x01\n\x0cGalleryChunk\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x11\n\tstart_row\x18\x03 \x01(\x03\x12\x10\n\x08next_row\x18\x04 \x01(\x03\x12\x11\n\trow_count\x18\x05 \x01(\x03\x12\x0b\n\x03\x64im\x18\x06 \x01(\x05\x12\x11\n\ttemplates\x18\x07 \x01(\x0c\x12 \n\x07records\x18\x08 \x01(\x0b\x32\x0f.FaceRecordList\"}\n\x15GalleryImportResponse\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x10\n\x08next_row\x18\x03 \x01(\x03\x12\x14\n\x0c\x65nroll_count\x18\x04 \x01(\x03\x12\x15\n\rreplace_count\x18\x05 \x01(\x03\"-\n\x15\x45nrollmentListRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\"F\n\x0e\x45nrollmentInfo\x12\x12\n\nsubject_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nface_count\x18\x03 \x01(\x05\"T\n\x16\x45nrollmentListResponse\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12$\n\x0b\x65nrollments\x18\x02 \x03(\x0b\x32\x0f.EnrollmentInfo\"X\n\x17\x45nrollmentDeleteRequest\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x12\n\nsubject_id\x18\x02 \x01(\t\x12\x13\n\x0bgallery_key\x18\x03 \x01(\t\"0\n\x18\x45nrollmentDeleteResponse\x12\x14\n\x0c\x64\x65lete_count\x18\x01 \x01(\x03\"\x9f\x01\n\x0bGalleryInfo\x12\x14\n\x0cgallery_name\x18\x01 \x01(\t\x12\x12\n\nface_count\x18\x02 \x01(\x03\x12\x15\n\rsubject_count\x18\x03 \x01(\x03\x12\x14\n\x0ctemplate_dim\x18\x04 \x01(\x05\x12\x12\n\nfile_bytes\x18\x05 \x01(\x03\x12\x13\n\x0bindex_state\x18\x06 \x01(\t\x12\x10\n\x08modified\x18\x07 \x01(\x01\".\n\x0bGalleryList\x12\x1f\n\tgalleries\x18\x01 \x03(\x0b\x32\x0c.GalleryInfo\"\x07\n\x05\x45mpty*<\n\rServiceStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05READY\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\x08\n\x04\x42USY\x10\x03*k\n\x08\x44\x61taType\x12\t\n\x05\x45MPTY\x10\x00\x12\n\n\x06STRING\x10\x01\x12\x07\n\x03INT\x10\x02\x12\t\n\x05\x46LOAT\x10\x03\x12\t\n\x05\x42YTES\x10\x04\x12\n\n\x06VECTOR\x10\x05\x12\n\n\x06PICKLE\x10\x06\x12\x07\n\x03XML\x10\x07\x12\x08\n\x04JSON\x10\x08*4\n\tScoreType\x12\n\n\x06SERVER\x10\x00\x12\x06\n\x02L1\x10\x01\x12\x06\n\x02L2\x10\x02\x12\x0b\n\x07NEG_DOT\x10\x03\x32\x86\n\n\x0f\x46\x61\x63\x65Recognition\x12\x30\n\x06status\x12\x12.FaceStatusRequest\x1a\x10.FaceServiceInfo\"\x00\x12+\n\x06\x64\x65tect\x12\x0e.DetectRequest\x1a\x0f.FaceRecordList\"\x00\x12-\n\x07\x65xtract\x12\x0f.ExtractRequest\x1a\x0f.FaceRecordList\"\x00\x12!\n\x05score\x12\r.ScoreRequest\x1a\x07.Matrix\"\x00\x12-\n\x0bscoreStream\x12\r.ScoreRequest\x1a\x0b.ScoreBlock\"\x00\x30\x01\x12+\n\x06\x65nroll\x12\x0e.EnrollRequest\x1a\x0f.FaceRecordList\"\x00\x12\x35\n\nbulkEnroll\x12\x0e.EnrollRequest\x1a\x13.BulkEnrollResponse\"\x00(\x01\x12+\n\x06search\x12\x0e.SearchRequest\x1a\x0f.FaceRecordList\"\x00\x12\x39\n\rdetectExtract\x12\x15.DetectExtractRequest\x1a\x0f.FaceRecordList\"\x00\x12\x45\n\x13\x64\x65tectExtractEnroll\x12\x1b.DetectExtractEnrollRequest\x1a\x0f.FaceRecordList\"\x00\x12\x45\n\x13\x64\x65tectExtractSearch\x12\x1b.DetectExtractSearchRequest\x1a\x0f.FaceRecordList\"\x00\x12\x32\n\x0bgalleryList\x12\x13.GalleryListRequest\x1a\x0c.GalleryList\"\x00\x12\x30\n\rgalleryDelete\x12\x15.GalleryDeleteRequest\x1a\x06.Empty\"\x00\x12\x36\n\x10galleryConfigure\x12\x18.GalleryConfigureRequest\x1a\x06.Empty\"\x00\x12\x43\n\x0egalleryCompact\x12\x16.GalleryCompactRequest\x1a\x17.GalleryCompactResponse\"\x00\x12\x39\n\rgalleryExport\x12\x15.GalleryExportRequest\x1a\r.GalleryChunk\"\x00\x30\x01\x12<\n\rgalleryImport\x12\r.GalleryChunk\x1a\x16.GalleryImportResponse\"\x00(\x01\x30\x01\x12;\n\x0e\x65nrollmentList\x12\x16.EnrollmentListRequest\x1a\x0f.FaceRecordList\"\x00\x12\x34\n\x10trainFromGallery\x12\x16.EnrollmentListRequest\x1a\x06.Empty\"\x00\x12\x46\n\rsubjectDelete\x12\x18.EnrollmentDeleteRequest\x1a\x19.EnrollmentDeleteResponse\"\x00\x12>\n\x19generateMatchDistribution\x12\x16.EnrollmentListRequest\x1a\x07.Matrix\"\x00\x12\x46\n\x11matchDistribution\x12\x19.MatchDistributionRequest\x1a\x12.MatchDistribution\"\x00\x30\x01\x12\x1a\n\x04\x65\x63ho\x12\x07.Matrix\x1a\x07.Matrix\"\x00\x42\r\xaa\x02\nFaro.Protob\x06proto3'
   ,
   dependencies=[faro_dot_proto_dot_image__pb2.DESCRIPTOR,faro_dot_proto_dot_geometry__pb2.DESCRIPTOR,])
 
@@ -56,8 +56,8 @@ _SERVICESTATUS = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=4557,
-  serialized_end=4617,
+  serialized_start=6715,
+  serialized_end=6775,
 )
 _sym_db.RegisterEnumDescriptor(_SERVICESTATUS)
 
@@ -117,8 +117,8 @@ _DATATYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=4619,
-  serialized_end=4726,
+  serialized_start=6777,
+  serialized_end=6884,
 )
 _sym_db.RegisterEnumDescriptor(_DATATYPE)
 
@@ -153,8 +153,8 @@ _SCORETYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=4728,
-  serialized_end=4780,
+  serialized_start=6886,
+  serialized_end=6938,
 )
 _sym_db.RegisterEnumDescriptor(_SCORETYPE)
 
@@ -624,6 +624,20 @@ _ENROLLOPTIONS = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dedup_distance', full_name='EnrollOptions.dedup_distance', index=3,
+      number=9, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dedup_merge', full_name='EnrollOptions.dedup_merge', index=4,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -636,8 +650,8 @@ _ENROLLOPTIONS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=966,
-  serialized_end=1050,
+  serialized_start=967,
+  serialized_end=1096,
 )
 
 
@@ -703,8 +717,8 @@ _DETECTIONLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1053,
-  serialized_end=1228,
+  serialized_start=1099,
+  serialized_end=1274,
 )
 
 
@@ -735,8 +749,8 @@ _MATCHLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1230,
-  serialized_end=1273,
+  serialized_start=1276,
+  serialized_end=1319,
 )
 
 
@@ -802,8 +816,8 @@ _MATCHINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1276,
-  serialized_end=1406,
+  serialized_start=1322,
+  serialized_end=1452,
 )
 
 
@@ -841,8 +855,8 @@ _TEMPLATEINPUT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1408,
-  serialized_end=1470,
+  serialized_start=1454,
+  serialized_end=1516,
 )
 
 
@@ -887,8 +901,8 @@ _FACETEMPLATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1472,
-  serialized_end=1544,
+  serialized_start=1518,
+  serialized_end=1590,
 )
 
 
@@ -919,8 +933,8 @@ _TEMPLATELIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1546,
-  serialized_end=1594,
+  serialized_start=1592,
+  serialized_end=1640,
 )
 
 
@@ -972,8 +986,8 @@ _ACCESSRECORD = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1596,
-  serialized_end=1693,
+  serialized_start=1642,
+  serialized_end=1739,
 )
 
 
@@ -1137,8 +1151,8 @@ _FACERECORD = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1696,
-  serialized_end=2211,
+  serialized_start=1742,
+  serialized_end=2257,
 )
 
 
@@ -1157,6 +1171,66 @@ _FACERECORDLIST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='enroll_stats', full_name='FaceRecordList.enroll_stats', index=1,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2259,
+  serialized_end=2346,
+)
+
+
+_ENROLLSTATS = _descriptor.Descriptor(
+  name='EnrollStats',
+  full_name='EnrollStats',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='enroll_count', full_name='EnrollStats.enroll_count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='replace_count', full_name='EnrollStats.replace_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='skip_count', full_name='EnrollStats.skip_count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='merge_count', full_name='EnrollStats.merge_count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1169,8 +1243,8 @@ _FACERECORDLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2213,
-  serialized_end=2264,
+  serialized_start=2348,
+  serialized_end=2447,
 )
 
 
@@ -1215,8 +1289,8 @@ _VERIFICATIONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2266,
-  serialized_end=2358,
+  serialized_start=2449,
+  serialized_end=2541,
 )
 
 
@@ -1275,8 +1349,8 @@ _VERIFICATIONRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2361,
-  serialized_end=2493,
+  serialized_start=2544,
+  serialized_end=2676,
 )
 
 
@@ -1316,6 +1390,147 @@ _SEARCHREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='nprobe', full_name='SearchRequest.nprobe', index=4,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='SearchRequest.filter', index=5,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2679,
+  serialized_end=2838,
+)
+
+
+_ATTRIBUTEFILTER = _descriptor.Descriptor(
+  name='AttributeFilter',
+  full_name='AttributeFilter',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='AttributeFilter.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='values', full_name='AttributeFilter.values', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min_value', full_name='AttributeFilter.min_value', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_value', full_name='AttributeFilter.max_value', index=3,
+      number=4, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2840,
+  serialized_end=2924,
+)
+
+
+_SEARCHFILTER = _descriptor.Descriptor(
+  name='SearchFilter',
+  full_name='SearchFilter',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='subject_ids', full_name='SearchFilter.subject_ids', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sources', full_name='SearchFilter.sources', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min_collection_date', full_name='SearchFilter.min_collection_date', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_collection_date', full_name='SearchFilter.max_collection_date', index=3,
+      number=4, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min_enrollment_date', full_name='SearchFilter.min_enrollment_date', index=4,
+      number=5, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_enrollment_date', full_name='SearchFilter.max_enrollment_date', index=5,
+      number=6, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='attributes', full_name='SearchFilter.attributes', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1328,8 +1543,8 @@ _SEARCHREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2495,
-  serialized_end=2607,
+  serialized_start=2927,
+  serialized_end=3133,
 )
 
 
@@ -1367,8 +1582,8 @@ _SEARCHRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2609,
-  serialized_end=2690,
+  serialized_start=3135,
+  serialized_end=3216,
 )
 
 
@@ -1413,8 +1628,54 @@ _ENROLLREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2692,
-  serialized_end=2805,
+  serialized_start=3218,
+  serialized_end=3331,
+)
+
+
+_BULKENROLLRESPONSE = _descriptor.Descriptor(
+  name='BulkEnrollResponse',
+  full_name='BulkEnrollResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_count', full_name='BulkEnrollResponse.request_count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='enroll_count', full_name='BulkEnrollResponse.enroll_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='replace_count', full_name='BulkEnrollResponse.replace_count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3333,
+  serialized_end=3421,
 )
 
 
@@ -1480,8 +1741,8 @@ _DETECTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2808,
-  serialized_end=2962,
+  serialized_start=3424,
+  serialized_end=3578,
 )
 
 
@@ -1526,8 +1787,8 @@ _EXTRACTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2964,
-  serialized_end=3079,
+  serialized_start=3580,
+  serialized_end=3695,
 )
 
 
@@ -1579,30 +1840,51 @@ _SCOREREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3082,
-  serialized_end=3254,
+  serialized_start=3698,
+  serialized_end=3870,
 )
 
 
-_DETECTEXTRACTREQUEST = _descriptor.Descriptor(
-  name='DetectExtractRequest',
-  full_name='DetectExtractRequest',
+_SCOREBLOCK = _descriptor.Descriptor(
+  name='ScoreBlock',
+  full_name='ScoreBlock',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='detect_request', full_name='DetectExtractRequest.detect_request', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='probe_start', full_name='ScoreBlock.probe_start', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='extract_request', full_name='DetectExtractRequest.extract_request', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='gallery_start', full_name='ScoreBlock.gallery_start', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='probe_count', full_name='ScoreBlock.probe_count', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='gallery_count', full_name='ScoreBlock.gallery_count', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='scores', full_name='ScoreBlock.scores', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1618,31 +1900,225 @@ _DETECTEXTRACTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3256,
-  serialized_end=3360,
+  serialized_start=3872,
+  serialized_end=3988,
 )
 
 
-_DETECTEXTRACTENROLLREQUEST = _descriptor.Descriptor(
-  name='DetectExtractEnrollRequest',
-  full_name='DetectExtractEnrollRequest',
+_MATCHDISTRIBUTIONREQUEST = _descriptor.Descriptor(
+  name='MatchDistributionRequest',
+  full_name='MatchDistributionRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='detect_request', full_name='DetectExtractEnrollRequest.detect_request', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='gallery_name', full_name='MatchDistributionRequest.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='extract_request', full_name='DetectExtractEnrollRequest.extract_request', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
+      name='bins', full_name='MatchDistributionRequest.bins', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min_score', full_name='MatchDistributionRequest.min_score', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_score', full_name='MatchDistributionRequest.max_score', index=3,
+      number=4, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='include_scores', full_name='MatchDistributionRequest.include_scores', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3990,
+  serialized_end=4114,
+)
+
+
+_MATCHDISTRIBUTION = _descriptor.Descriptor(
+  name='MatchDistribution',
+  full_name='MatchDistribution',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='block', full_name='MatchDistribution.block', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='face_count', full_name='MatchDistribution.face_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='genuine_count', full_name='MatchDistribution.genuine_count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='impostor_count', full_name='MatchDistribution.impostor_count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bin_edges', full_name='MatchDistribution.bin_edges', index=4,
+      number=5, type=2, cpp_type=6, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='genuine_histogram', full_name='MatchDistribution.genuine_histogram', index=5,
+      number=6, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='impostor_histogram', full_name='MatchDistribution.impostor_histogram', index=6,
+      number=7, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='thresholds', full_name='MatchDistribution.thresholds', index=7,
+      number=8, type=2, cpp_type=6, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='far', full_name='MatchDistribution.far', index=8,
+      number=9, type=2, cpp_type=6, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='frr', full_name='MatchDistribution.frr', index=9,
+      number=10, type=2, cpp_type=6, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4117,
+  serialized_end=4351,
+)
+
+
+_DETECTEXTRACTREQUEST = _descriptor.Descriptor(
+  name='DetectExtractRequest',
+  full_name='DetectExtractRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='detect_request', full_name='DetectExtractRequest.detect_request', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='extract_request', full_name='DetectExtractRequest.extract_request', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4353,
+  serialized_end=4457,
+)
+
+
+_DETECTEXTRACTENROLLREQUEST = _descriptor.Descriptor(
+  name='DetectExtractEnrollRequest',
+  full_name='DetectExtractEnrollRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='detect_request', full_name='DetectExtractEnrollRequest.detect_request', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='extract_request', full_name='DetectExtractEnrollRequest.extract_request', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
@@ -1664,8 +2140,8 @@ _DETECTEXTRACTENROLLREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3363,
-  serialized_end=3513,
+  serialized_start=4460,
+  serialized_end=4610,
 )
 
 
@@ -1710,8 +2186,8 @@ _DETECTEXTRACTSEARCHREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3516,
-  serialized_end=3666,
+  serialized_start=4613,
+  serialized_end=4763,
 )
 
 
@@ -1735,8 +2211,8 @@ _FACESTATUSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3668,
-  serialized_end=3687,
+  serialized_start=4765,
+  serialized_end=4784,
 )
 
 
@@ -1791,51 +2267,401 @@ _FACESERVICEINFO = _descriptor.Descriptor(
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='score_type', full_name='FaceServiceInfo.score_type', index=6,
-      number=7, type=14, cpp_type=8, label=1,
+      name='score_type', full_name='FaceServiceInfo.score_type', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='detection_threshold', full_name='FaceServiceInfo.detection_threshold', index=7,
+      number=8, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='match_threshold', full_name='FaceServiceInfo.match_threshold', index=8,
+      number=9, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='algorithm', full_name='FaceServiceInfo.algorithm', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='notes', full_name='FaceServiceInfo.notes', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='faro_version', full_name='FaceServiceInfo.faro_version', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='instance_name', full_name='FaceServiceInfo.instance_name', index=12,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='gallery_cache', full_name='FaceServiceInfo.gallery_cache', index=13,
+      number=14, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4787,
+  serialized_end=5168,
+)
+
+
+_GALLERYCACHESTATS = _descriptor.Descriptor(
+  name='GalleryCacheStats',
+  full_name='GalleryCacheStats',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='open_galleries', full_name='GalleryCacheStats.open_galleries', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pinned_galleries', full_name='GalleryCacheStats.pinned_galleries', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='open_bytes', full_name='GalleryCacheStats.open_bytes', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_open', full_name='GalleryCacheStats.max_open', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_bytes', full_name='GalleryCacheStats.max_bytes', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hits', full_name='GalleryCacheStats.hits', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='misses', full_name='GalleryCacheStats.misses', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='evictions', full_name='GalleryCacheStats.evictions', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5171,
+  serialized_end=5346,
+)
+
+
+_GALLERYLISTREQUEST = _descriptor.Descriptor(
+  name='GalleryListRequest',
+  full_name='GalleryListRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5348,
+  serialized_end=5368,
+)
+
+
+_GALLERYDELETEREQUEST = _descriptor.Descriptor(
+  name='GalleryDeleteRequest',
+  full_name='GalleryDeleteRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='gallery_name', full_name='GalleryDeleteRequest.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5370,
+  serialized_end=5414,
+)
+
+
+_GALLERYCONFIGUREREQUEST = _descriptor.Descriptor(
+  name='GalleryConfigureRequest',
+  full_name='GalleryConfigureRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='gallery_name', full_name='GalleryConfigureRequest.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='index_quantization', full_name='GalleryConfigureRequest.index_quantization', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5416,
+  serialized_end=5491,
+)
+
+
+_GALLERYCOMPACTREQUEST = _descriptor.Descriptor(
+  name='GalleryCompactRequest',
+  full_name='GalleryCompactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='gallery_name', full_name='GalleryCompactRequest.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5493,
+  serialized_end=5538,
+)
+
+
+_GALLERYCOMPACTRESPONSE = _descriptor.Descriptor(
+  name='GalleryCompactResponse',
+  full_name='GalleryCompactResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='gallery_name', full_name='GalleryCompactResponse.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='face_count', full_name='GalleryCompactResponse.face_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rows_removed', full_name='GalleryCompactResponse.rows_removed', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bytes_before', full_name='GalleryCompactResponse.bytes_before', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bytes_after', full_name='GalleryCompactResponse.bytes_after', index=4,
+      number=5, type=3, cpp_type=2, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='detection_threshold', full_name='FaceServiceInfo.detection_threshold', index=7,
-      number=8, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
+      name='bytes_reclaimed', full_name='GalleryCompactResponse.bytes_reclaimed', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='match_threshold', full_name='FaceServiceInfo.match_threshold', index=8,
-      number=9, type=2, cpp_type=6, label=1,
+      name='compact_time', full_name='GalleryCompactResponse.compact_time', index=6,
+      number=7, type=2, cpp_type=6, label=1,
       has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5541,
+  serialized_end=5719,
+)
+
+
+_GALLERYEXPORTREQUEST = _descriptor.Descriptor(
+  name='GalleryExportRequest',
+  full_name='GalleryExportRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
     _descriptor.FieldDescriptor(
-      name='algorithm', full_name='FaceServiceInfo.algorithm', index=9,
-      number=10, type=9, cpp_type=9, label=1,
+      name='gallery_name', full_name='GalleryExportRequest.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='notes', full_name='FaceServiceInfo.notes', index=10,
-      number=11, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='start_row', full_name='GalleryExportRequest.start_row', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='faro_version', full_name='FaceServiceInfo.faro_version', index=11,
-      number=12, type=9, cpp_type=9, label=1,
+      name='file_id', full_name='GalleryExportRequest.file_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='instance_name', full_name='FaceServiceInfo.instance_name', index=12,
-      number=13, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='chunk_size', full_name='GalleryExportRequest.chunk_size', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='include_views', full_name='GalleryExportRequest.include_views', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1851,19 +2677,75 @@ _FACESERVICEINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3690,
-  serialized_end=4028,
+  serialized_start=5721,
+  serialized_end=5844,
 )
 
 
-_GALLERYLISTREQUEST = _descriptor.Descriptor(
-  name='GalleryListRequest',
-  full_name='GalleryListRequest',
+_GALLERYCHUNK = _descriptor.Descriptor(
+  name='GalleryChunk',
+  full_name='GalleryChunk',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
+    _descriptor.FieldDescriptor(
+      name='gallery_name', full_name='GalleryChunk.gallery_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='file_id', full_name='GalleryChunk.file_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='start_row', full_name='GalleryChunk.start_row', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='next_row', full_name='GalleryChunk.next_row', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='row_count', full_name='GalleryChunk.row_count', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dim', full_name='GalleryChunk.dim', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='templates', full_name='GalleryChunk.templates', index=6,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='records', full_name='GalleryChunk.records', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1876,26 +2758,54 @@ _GALLERYLISTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4030,
-  serialized_end=4050,
+  serialized_start=5847,
+  serialized_end=6022,
 )
 
 
-_GALLERYDELETEREQUEST = _descriptor.Descriptor(
-  name='GalleryDeleteRequest',
-  full_name='GalleryDeleteRequest',
+_GALLERYIMPORTRESPONSE = _descriptor.Descriptor(
+  name='GalleryImportResponse',
+  full_name='GalleryImportResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='gallery_name', full_name='GalleryDeleteRequest.gallery_name', index=0,
+      name='gallery_name', full_name='GalleryImportResponse.gallery_name', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='file_id', full_name='GalleryImportResponse.file_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='next_row', full_name='GalleryImportResponse.next_row', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='enroll_count', full_name='GalleryImportResponse.enroll_count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='replace_count', full_name='GalleryImportResponse.replace_count', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1908,8 +2818,8 @@ _GALLERYDELETEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4052,
-  serialized_end=4096,
+  serialized_start=6024,
+  serialized_end=6149,
 )
 
 
@@ -1940,8 +2850,8 @@ _ENROLLMENTLISTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4098,
-  serialized_end=4143,
+  serialized_start=6151,
+  serialized_end=6196,
 )
 
 
@@ -1986,8 +2896,8 @@ _ENROLLMENTINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4145,
-  serialized_end=4215,
+  serialized_start=6198,
+  serialized_end=6268,
 )
 
 
@@ -2025,8 +2935,8 @@ _ENROLLMENTLISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4217,
-  serialized_end=4301,
+  serialized_start=6270,
+  serialized_end=6354,
 )
 
 
@@ -2071,8 +2981,8 @@ _ENROLLMENTDELETEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4303,
-  serialized_end=4391,
+  serialized_start=6356,
+  serialized_end=6444,
 )
 
 
@@ -2103,8 +3013,8 @@ _ENROLLMENTDELETERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4393,
-  serialized_end=4441,
+  serialized_start=6446,
+  serialized_end=6494,
 )
 
 
@@ -2130,6 +3040,41 @@ _GALLERYINFO = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='subject_count', full_name='GalleryInfo.subject_count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='template_dim', full_name='GalleryInfo.template_dim', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='file_bytes', full_name='GalleryInfo.file_bytes', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='index_state', full_name='GalleryInfo.index_state', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='modified', full_name='GalleryInfo.modified', index=6,
+      number=7, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -2142,8 +3087,8 @@ _GALLERYINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4443,
-  serialized_end=4498,
+  serialized_start=6497,
+  serialized_end=6656,
 )
 
 
@@ -2174,8 +3119,8 @@ _GALLERYLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4500,
-  serialized_end=4546,
+  serialized_start=6658,
+  serialized_end=6704,
 )
 
 
@@ -2199,8 +3144,8 @@ _EMPTY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4548,
-  serialized_end=4555,
+  serialized_start=6706,
+  serialized_end=6713,
 )
 
 _ATTRIBUTE.fields_by_name['matrix'].message_type = faro_dot_proto_dot_geometry__pb2._MATRIX
@@ -2234,9 +3179,12 @@ _FACERECORD.fields_by_name['internal_data'].message_type = _ATTRIBUTE
 _FACERECORD.fields_by_name['template'].message_type = _FACETEMPLATE
 _FACERECORD.fields_by_name['search_results'].message_type = _FACERECORDLIST
 _FACERECORDLIST.fields_by_name['face_records'].message_type = _FACERECORD
+_FACERECORDLIST.fields_by_name['enroll_stats'].message_type = _ENROLLSTATS
 _VERIFICATIONREQUEST.fields_by_name['face_record'].message_type = _FACERECORD
 _VERIFICATIONRESPONSE.fields_by_name['matches'].message_type = _FACERECORD
 _SEARCHREQUEST.fields_by_name['probes'].message_type = _FACERECORDLIST
+_SEARCHREQUEST.fields_by_name['filter'].message_type = _SEARCHFILTER
+_SEARCHFILTER.fields_by_name['attributes'].message_type = _ATTRIBUTEFILTER
 _SEARCHRESPONSE.fields_by_name['message'].message_type = _ERRORMESSAGE
 _SEARCHRESPONSE.fields_by_name['probes'].message_type = _FACERECORDLIST
 _ENROLLREQUEST.fields_by_name['records'].message_type = _FACERECORDLIST
@@ -2250,6 +3198,7 @@ _SCOREREQUEST.fields_by_name['face_probes'].message_type = _FACERECORDLIST
 _SCOREREQUEST.fields_by_name['face_gallery'].message_type = _FACERECORDLIST
 _SCOREREQUEST.fields_by_name['template_probes'].message_type = _TEMPLATELIST
 _SCOREREQUEST.fields_by_name['template_gallery'].message_type = _TEMPLATELIST
+_MATCHDISTRIBUTION.fields_by_name['block'].message_type = _SCOREBLOCK
 _DETECTEXTRACTREQUEST.fields_by_name['detect_request'].message_type = _DETECTREQUEST
 _DETECTEXTRACTREQUEST.fields_by_name['extract_request'].message_type = _EXTRACTREQUEST
 _DETECTEXTRACTENROLLREQUEST.fields_by_name['detect_request'].message_type = _DETECTREQUEST
@@ -2260,6 +3209,8 @@ _DETECTEXTRACTSEARCHREQUEST.fields_by_name['extract_request'].message_type = _EX
 _DETECTEXTRACTSEARCHREQUEST.fields_by_name['search_request'].message_type = _SEARCHREQUEST
 _FACESERVICEINFO.fields_by_name['status'].enum_type = _SERVICESTATUS
 _FACESERVICEINFO.fields_by_name['score_type'].enum_type = _SCORETYPE
+_FACESERVICEINFO.fields_by_name['gallery_cache'].message_type = _GALLERYCACHESTATS
+_GALLERYCHUNK.fields_by_name['records'].message_type = _FACERECORDLIST
 _ENROLLMENTLISTRESPONSE.fields_by_name['enrollments'].message_type = _ENROLLMENTINFO
 _GALLERYLIST.fields_by_name['galleries'].message_type = _GALLERYINFO
 DESCRIPTOR.message_types_by_name['Attribute'] = _ATTRIBUTE
@@ -2278,21 +3229,35 @@ DESCRIPTOR.message_types_by_name['TemplateList'] = _TEMPLATELIST
 DESCRIPTOR.message_types_by_name['AccessRecord'] = _ACCESSRECORD
 DESCRIPTOR.message_types_by_name['FaceRecord'] = _FACERECORD
 DESCRIPTOR.message_types_by_name['FaceRecordList'] = _FACERECORDLIST
+DESCRIPTOR.message_types_by_name['EnrollStats'] = _ENROLLSTATS
 DESCRIPTOR.message_types_by_name['VerificationRequest'] = _VERIFICATIONREQUEST
 DESCRIPTOR.message_types_by_name['VerificationResponse'] = _VERIFICATIONRESPONSE
 DESCRIPTOR.message_types_by_name['SearchRequest'] = _SEARCHREQUEST
+DESCRIPTOR.message_types_by_name['AttributeFilter'] = _ATTRIBUTEFILTER
+DESCRIPTOR.message_types_by_name['SearchFilter'] = _SEARCHFILTER
 DESCRIPTOR.message_types_by_name['SearchResponse'] = _SEARCHRESPONSE
 DESCRIPTOR.message_types_by_name['EnrollRequest'] = _ENROLLREQUEST
+DESCRIPTOR.message_types_by_name['BulkEnrollResponse'] = _BULKENROLLRESPONSE
 DESCRIPTOR.message_types_by_name['DetectRequest'] = _DETECTREQUEST
 DESCRIPTOR.message_types_by_name['ExtractRequest'] = _EXTRACTREQUEST
 DESCRIPTOR.message_types_by_name['ScoreRequest'] = _SCOREREQUEST
+DESCRIPTOR.message_types_by_name['ScoreBlock'] = _SCOREBLOCK
+DESCRIPTOR.message_types_by_name['MatchDistributionRequest'] = _MATCHDISTRIBUTIONREQUEST
+DESCRIPTOR.message_types_by_name['MatchDistribution'] = _MATCHDISTRIBUTION
 DESCRIPTOR.message_types_by_name['DetectExtractRequest'] = _DETECTEXTRACTREQUEST
 DESCRIPTOR.message_types_by_name['DetectExtractEnrollRequest'] = _DETECTEXTRACTENROLLREQUEST
 DESCRIPTOR.message_types_by_name['DetectExtractSearchRequest'] = _DETECTEXTRACTSEARCHREQUEST
 DESCRIPTOR.message_types_by_name['FaceStatusRequest'] = _FACESTATUSREQUEST
 DESCRIPTOR.message_types_by_name['FaceServiceInfo'] = _FACESERVICEINFO
+DESCRIPTOR.message_types_by_name['GalleryCacheStats'] = _GALLERYCACHESTATS
 DESCRIPTOR.message_types_by_name['GalleryListRequest'] = _GALLERYLISTREQUEST
 DESCRIPTOR.message_types_by_name['GalleryDeleteRequest'] = _GALLERYDELETEREQUEST
+DESCRIPTOR.message_types_by_name['GalleryConfigureRequest'] = _GALLERYCONFIGUREREQUEST
+DESCRIPTOR.message_types_by_name['GalleryCompactRequest'] = _GALLERYCOMPACTREQUEST
+DESCRIPTOR.message_types_by_name['GalleryCompactResponse'] = _GALLERYCOMPACTRESPONSE
+DESCRIPTOR.message_types_by_name['GalleryExportRequest'] = _GALLERYEXPORTREQUEST
+DESCRIPTOR.message_types_by_name['GalleryChunk'] = _GALLERYCHUNK
+DESCRIPTOR.message_types_by_name['GalleryImportResponse'] = _GALLERYIMPORTRESPONSE
 DESCRIPTOR.message_types_by_name['EnrollmentListRequest'] = _ENROLLMENTLISTREQUEST
 DESCRIPTOR.message_types_by_name['EnrollmentInfo'] = _ENROLLMENTINFO
 DESCRIPTOR.message_types_by_name['EnrollmentListResponse'] = _ENROLLMENTLISTRESPONSE
@@ -2418,6 +3383,13 @@ FaceRecordList = _reflection.GeneratedProtocolMessageType('FaceRecordList', (_me
   })
 _sym_db.RegisterMessage(FaceRecordList)
 
+EnrollStats = _reflection.GeneratedProtocolMessageType('EnrollStats', (_message.Message,), {
+  'DESCRIPTOR' : _ENROLLSTATS,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:EnrollStats)
+  })
+_sym_db.RegisterMessage(EnrollStats)
+
 VerificationRequest = _reflection.GeneratedProtocolMessageType('VerificationRequest', (_message.Message,), {
   'DESCRIPTOR' : _VERIFICATIONREQUEST,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2439,6 +3411,20 @@ SearchRequest = _reflection.GeneratedProtocolMessageType('SearchRequest', (_mess
   })
 _sym_db.RegisterMessage(SearchRequest)
 
+AttributeFilter = _reflection.GeneratedProtocolMessageType('AttributeFilter', (_message.Message,), {
+  'DESCRIPTOR' : _ATTRIBUTEFILTER,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:AttributeFilter)
+  })
+_sym_db.RegisterMessage(AttributeFilter)
+
+SearchFilter = _reflection.GeneratedProtocolMessageType('SearchFilter', (_message.Message,), {
+  'DESCRIPTOR' : _SEARCHFILTER,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:SearchFilter)
+  })
+_sym_db.RegisterMessage(SearchFilter)
+
 SearchResponse = _reflection.GeneratedProtocolMessageType('SearchResponse', (_message.Message,), {
   'DESCRIPTOR' : _SEARCHRESPONSE,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2453,6 +3439,13 @@ EnrollRequest = _reflection.GeneratedProtocolMessageType('EnrollRequest', (_mess
   })
 _sym_db.RegisterMessage(EnrollRequest)
 
+BulkEnrollResponse = _reflection.GeneratedProtocolMessageType('BulkEnrollResponse', (_message.Message,), {
+  'DESCRIPTOR' : _BULKENROLLRESPONSE,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:BulkEnrollResponse)
+  })
+_sym_db.RegisterMessage(BulkEnrollResponse)
+
 DetectRequest = _reflection.GeneratedProtocolMessageType('DetectRequest', (_message.Message,), {
   'DESCRIPTOR' : _DETECTREQUEST,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2474,6 +3467,27 @@ ScoreRequest = _reflection.GeneratedProtocolMessageType('ScoreRequest', (_messag
   })
 _sym_db.RegisterMessage(ScoreRequest)
 
+ScoreBlock = _reflection.GeneratedProtocolMessageType('ScoreBlock', (_message.Message,), {
+  'DESCRIPTOR' : _SCOREBLOCK,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:ScoreBlock)
+  })
+_sym_db.RegisterMessage(ScoreBlock)
+
+MatchDistributionRequest = _reflection.GeneratedProtocolMessageType('MatchDistributionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MATCHDISTRIBUTIONREQUEST,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:MatchDistributionRequest)
+  })
+_sym_db.RegisterMessage(MatchDistributionRequest)
+
+MatchDistribution = _reflection.GeneratedProtocolMessageType('MatchDistribution', (_message.Message,), {
+  'DESCRIPTOR' : _MATCHDISTRIBUTION,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:MatchDistribution)
+  })
+_sym_db.RegisterMessage(MatchDistribution)
+
 DetectExtractRequest = _reflection.GeneratedProtocolMessageType('DetectExtractRequest', (_message.Message,), {
   'DESCRIPTOR' : _DETECTEXTRACTREQUEST,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2509,6 +3523,13 @@ FaceServiceInfo = _reflection.GeneratedProtocolMessageType('FaceServiceInfo', (_
   })
 _sym_db.RegisterMessage(FaceServiceInfo)
 
+GalleryCacheStats = _reflection.GeneratedProtocolMessageType('GalleryCacheStats', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYCACHESTATS,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryCacheStats)
+  })
+_sym_db.RegisterMessage(GalleryCacheStats)
+
 GalleryListRequest = _reflection.GeneratedProtocolMessageType('GalleryListRequest', (_message.Message,), {
   'DESCRIPTOR' : _GALLERYLISTREQUEST,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2523,6 +3544,48 @@ GalleryDeleteRequest = _reflection.GeneratedProtocolMessageType('GalleryDeleteRe
   })
 _sym_db.RegisterMessage(GalleryDeleteRequest)
 
+GalleryConfigureRequest = _reflection.GeneratedProtocolMessageType('GalleryConfigureRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYCONFIGUREREQUEST,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryConfigureRequest)
+  })
+_sym_db.RegisterMessage(GalleryConfigureRequest)
+
+GalleryCompactRequest = _reflection.GeneratedProtocolMessageType('GalleryCompactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYCOMPACTREQUEST,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryCompactRequest)
+  })
+_sym_db.RegisterMessage(GalleryCompactRequest)
+
+GalleryCompactResponse = _reflection.GeneratedProtocolMessageType('GalleryCompactResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYCOMPACTRESPONSE,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryCompactResponse)
+  })
+_sym_db.RegisterMessage(GalleryCompactResponse)
+
+GalleryExportRequest = _reflection.GeneratedProtocolMessageType('GalleryExportRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYEXPORTREQUEST,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryExportRequest)
+  })
+_sym_db.RegisterMessage(GalleryExportRequest)
+
+GalleryChunk = _reflection.GeneratedProtocolMessageType('GalleryChunk', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYCHUNK,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryChunk)
+  })
+_sym_db.RegisterMessage(GalleryChunk)
+
+GalleryImportResponse = _reflection.GeneratedProtocolMessageType('GalleryImportResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GALLERYIMPORTRESPONSE,
+  '__module__' : 'faro.proto.face_service_pb2'
+  # @@protoc_insertion_point(class_scope:GalleryImportResponse)
+  })
+_sym_db.RegisterMessage(GalleryImportResponse)
+
 EnrollmentListRequest = _reflection.GeneratedProtocolMessageType('EnrollmentListRequest', (_message.Message,), {
   'DESCRIPTOR' : _ENROLLMENTLISTREQUEST,
   '__module__' : 'faro.proto.face_service_pb2'
@@ -2589,8 +3652,8 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=4783,
-  serialized_end=5649,
+  serialized_start=6941,
+  serialized_end=8227,
   methods=[
   _descriptor.MethodDescriptor(
     name='status',
@@ -2632,20 +3695,40 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='scoreStream',
+    full_name='FaceRecognition.scoreStream',
+    index=4,
+    containing_service=None,
+    input_type=_SCOREREQUEST,
+    output_type=_SCOREBLOCK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='enroll',
     full_name='FaceRecognition.enroll',
-    index=4,
+    index=5,
     containing_service=None,
     input_type=_ENROLLREQUEST,
     output_type=_FACERECORDLIST,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='bulkEnroll',
+    full_name='FaceRecognition.bulkEnroll',
+    index=6,
+    containing_service=None,
+    input_type=_ENROLLREQUEST,
+    output_type=_BULKENROLLRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='search',
     full_name='FaceRecognition.search',
-    index=5,
+    index=7,
     containing_service=None,
     input_type=_SEARCHREQUEST,
     output_type=_FACERECORDLIST,
@@ -2655,7 +3738,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='detectExtract',
     full_name='FaceRecognition.detectExtract',
-    index=6,
+    index=8,
     containing_service=None,
     input_type=_DETECTEXTRACTREQUEST,
     output_type=_FACERECORDLIST,
@@ -2665,7 +3748,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='detectExtractEnroll',
     full_name='FaceRecognition.detectExtractEnroll',
-    index=7,
+    index=9,
     containing_service=None,
     input_type=_DETECTEXTRACTENROLLREQUEST,
     output_type=_FACERECORDLIST,
@@ -2675,7 +3758,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='detectExtractSearch',
     full_name='FaceRecognition.detectExtractSearch',
-    index=8,
+    index=10,
     containing_service=None,
     input_type=_DETECTEXTRACTSEARCHREQUEST,
     output_type=_FACERECORDLIST,
@@ -2685,7 +3768,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='galleryList',
     full_name='FaceRecognition.galleryList',
-    index=9,
+    index=11,
     containing_service=None,
     input_type=_GALLERYLISTREQUEST,
     output_type=_GALLERYLIST,
@@ -2695,17 +3778,57 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='galleryDelete',
     full_name='FaceRecognition.galleryDelete',
-    index=10,
+    index=12,
     containing_service=None,
     input_type=_GALLERYDELETEREQUEST,
     output_type=_EMPTY,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='galleryConfigure',
+    full_name='FaceRecognition.galleryConfigure',
+    index=13,
+    containing_service=None,
+    input_type=_GALLERYCONFIGUREREQUEST,
+    output_type=_EMPTY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='galleryCompact',
+    full_name='FaceRecognition.galleryCompact',
+    index=14,
+    containing_service=None,
+    input_type=_GALLERYCOMPACTREQUEST,
+    output_type=_GALLERYCOMPACTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='galleryExport',
+    full_name='FaceRecognition.galleryExport',
+    index=15,
+    containing_service=None,
+    input_type=_GALLERYEXPORTREQUEST,
+    output_type=_GALLERYCHUNK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='galleryImport',
+    full_name='FaceRecognition.galleryImport',
+    index=16,
+    containing_service=None,
+    input_type=_GALLERYCHUNK,
+    output_type=_GALLERYIMPORTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='enrollmentList',
     full_name='FaceRecognition.enrollmentList',
-    index=11,
+    index=17,
     containing_service=None,
     input_type=_ENROLLMENTLISTREQUEST,
     output_type=_FACERECORDLIST,
@@ -2715,7 +3838,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='trainFromGallery',
     full_name='FaceRecognition.trainFromGallery',
-    index=12,
+    index=18,
     containing_service=None,
     input_type=_ENROLLMENTLISTREQUEST,
     output_type=_EMPTY,
@@ -2725,7 +3848,7 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='subjectDelete',
     full_name='FaceRecognition.subjectDelete',
-    index=13,
+    index=19,
     containing_service=None,
     input_type=_ENROLLMENTDELETEREQUEST,
     output_type=_ENROLLMENTDELETERESPONSE,
@@ -2735,17 +3858,27 @@ _FACERECOGNITION = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='generateMatchDistribution',
     full_name='FaceRecognition.generateMatchDistribution',
-    index=14,
+    index=20,
     containing_service=None,
     input_type=_ENROLLMENTLISTREQUEST,
     output_type=faro_dot_proto_dot_geometry__pb2._MATRIX,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='matchDistribution',
+    full_name='FaceRecognition.matchDistribution',
+    index=21,
+    containing_service=None,
+    input_type=_MATCHDISTRIBUTIONREQUEST,
+    output_type=_MATCHDISTRIBUTION,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='echo',
     full_name='FaceRecognition.echo',
-    index=15,
+    index=22,
     containing_service=None,
     input_type=faro_dot_proto_dot_geometry__pb2._MATRIX,
     output_type=faro_dot_proto_dot_geometry__pb2._MATRIX,
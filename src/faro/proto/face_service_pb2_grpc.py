@@ -35,11 +35,21 @@ class FaceRecognitionStub(object):
                 request_serializer=faro_dot_proto_dot_face__service__pb2.ScoreRequest.SerializeToString,
                 response_deserializer=faro_dot_proto_dot_geometry__pb2.Matrix.FromString,
                 )
+        self.scoreStream = channel.unary_stream(
+                '/FaceRecognition/scoreStream',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.ScoreRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.ScoreBlock.FromString,
+                )
         self.enroll = channel.unary_unary(
                 '/FaceRecognition/enroll',
                 request_serializer=faro_dot_proto_dot_face__service__pb2.EnrollRequest.SerializeToString,
                 response_deserializer=faro_dot_proto_dot_face__service__pb2.FaceRecordList.FromString,
                 )
+        self.bulkEnroll = channel.stream_unary(
+                '/FaceRecognition/bulkEnroll',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.EnrollRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.BulkEnrollResponse.FromString,
+                )
         self.search = channel.unary_unary(
                 '/FaceRecognition/search',
                 request_serializer=faro_dot_proto_dot_face__service__pb2.SearchRequest.SerializeToString,
@@ -70,6 +80,26 @@ class FaceRecognitionStub(object):
                 request_serializer=faro_dot_proto_dot_face__service__pb2.GalleryDeleteRequest.SerializeToString,
                 response_deserializer=faro_dot_proto_dot_face__service__pb2.Empty.FromString,
                 )
+        self.galleryConfigure = channel.unary_unary(
+                '/FaceRecognition/galleryConfigure',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.GalleryConfigureRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.Empty.FromString,
+                )
+        self.galleryCompact = channel.unary_unary(
+                '/FaceRecognition/galleryCompact',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.GalleryCompactRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryCompactResponse.FromString,
+                )
+        self.galleryExport = channel.unary_stream(
+                '/FaceRecognition/galleryExport',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.GalleryExportRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryChunk.FromString,
+                )
+        self.galleryImport = channel.stream_stream(
+                '/FaceRecognition/galleryImport',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.GalleryChunk.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryImportResponse.FromString,
+                )
         self.enrollmentList = channel.unary_unary(
                 '/FaceRecognition/enrollmentList',
                 request_serializer=faro_dot_proto_dot_face__service__pb2.EnrollmentListRequest.SerializeToString,
@@ -90,6 +120,11 @@ class FaceRecognitionStub(object):
                 request_serializer=faro_dot_proto_dot_face__service__pb2.EnrollmentListRequest.SerializeToString,
                 response_deserializer=faro_dot_proto_dot_geometry__pb2.Matrix.FromString,
                 )
+        self.matchDistribution = channel.unary_stream(
+                '/FaceRecognition/matchDistribution',
+                request_serializer=faro_dot_proto_dot_face__service__pb2.MatchDistributionRequest.SerializeToString,
+                response_deserializer=faro_dot_proto_dot_face__service__pb2.MatchDistribution.FromString,
+                )
         self.echo = channel.unary_unary(
                 '/FaceRecognition/echo',
                 request_serializer=faro_dot_proto_dot_geometry__pb2.Matrix.SerializeToString,
@@ -126,12 +161,24 @@ class FaceRecognitionServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def scoreStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def enroll(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def bulkEnroll(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def search(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -170,6 +217,30 @@ class FaceRecognitionServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def galleryConfigure(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def galleryCompact(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def galleryExport(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def galleryImport(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def enrollmentList(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -194,8 +265,17 @@ class FaceRecognitionServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def matchDistribution(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def echo(self, request, context):
-        """rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
+        """Source Management
+        rpc retrieveSourceImage(SourceImageRequest) returns (Image){};
+
+        rpc enrollmentDeleteConditional(EnrollmentDeleteRequest) returns (FaceRecordList){};
         rpc enrollmentTransfer(EnrollmentDeleteRequest) returns (FaceRecordList){};
 
         Test
@@ -227,11 +307,21 @@ def add_FaceRecognitionServicer_to_server(servicer, server):
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.ScoreRequest.FromString,
                     response_serializer=faro_dot_proto_dot_geometry__pb2.Matrix.SerializeToString,
             ),
+            'scoreStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.scoreStream,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.ScoreRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.ScoreBlock.SerializeToString,
+            ),
             'enroll': grpc.unary_unary_rpc_method_handler(
                     servicer.enroll,
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.EnrollRequest.FromString,
                     response_serializer=faro_dot_proto_dot_face__service__pb2.FaceRecordList.SerializeToString,
             ),
+            'bulkEnroll': grpc.stream_unary_rpc_method_handler(
+                    servicer.bulkEnroll,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.EnrollRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.BulkEnrollResponse.SerializeToString,
+            ),
             'search': grpc.unary_unary_rpc_method_handler(
                     servicer.search,
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.SearchRequest.FromString,
@@ -262,6 +352,26 @@ def add_FaceRecognitionServicer_to_server(servicer, server):
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryDeleteRequest.FromString,
                     response_serializer=faro_dot_proto_dot_face__service__pb2.Empty.SerializeToString,
             ),
+            'galleryConfigure': grpc.unary_unary_rpc_method_handler(
+                    servicer.galleryConfigure,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryConfigureRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.Empty.SerializeToString,
+            ),
+            'galleryCompact': grpc.unary_unary_rpc_method_handler(
+                    servicer.galleryCompact,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryCompactRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.GalleryCompactResponse.SerializeToString,
+            ),
+            'galleryExport': grpc.unary_stream_rpc_method_handler(
+                    servicer.galleryExport,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryExportRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.GalleryChunk.SerializeToString,
+            ),
+            'galleryImport': grpc.stream_stream_rpc_method_handler(
+                    servicer.galleryImport,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.GalleryChunk.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.GalleryImportResponse.SerializeToString,
+            ),
             'enrollmentList': grpc.unary_unary_rpc_method_handler(
                     servicer.enrollmentList,
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.EnrollmentListRequest.FromString,
@@ -282,6 +392,11 @@ def add_FaceRecognitionServicer_to_server(servicer, server):
                     request_deserializer=faro_dot_proto_dot_face__service__pb2.EnrollmentListRequest.FromString,
                     response_serializer=faro_dot_proto_dot_geometry__pb2.Matrix.SerializeToString,
             ),
+            'matchDistribution': grpc.unary_stream_rpc_method_handler(
+                    servicer.matchDistribution,
+                    request_deserializer=faro_dot_proto_dot_face__service__pb2.MatchDistributionRequest.FromString,
+                    response_serializer=faro_dot_proto_dot_face__service__pb2.MatchDistribution.SerializeToString,
+            ),
             'echo': grpc.unary_unary_rpc_method_handler(
                     servicer.echo,
                     request_deserializer=faro_dot_proto_dot_geometry__pb2.Matrix.FromString,
@@ -365,6 +480,23 @@ class FaceRecognition(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def scoreStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/FaceRecognition/scoreStream',
+            faro_dot_proto_dot_face__service__pb2.ScoreRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.ScoreBlock.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def enroll(request,
             target,
@@ -382,6 +514,23 @@ class FaceRecognition(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def bulkEnroll(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/FaceRecognition/bulkEnroll',
+            faro_dot_proto_dot_face__service__pb2.EnrollRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.BulkEnrollResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def search(request,
             target,
@@ -484,6 +633,74 @@ class FaceRecognition(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def galleryConfigure(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/FaceRecognition/galleryConfigure',
+            faro_dot_proto_dot_face__service__pb2.GalleryConfigureRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def galleryCompact(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/FaceRecognition/galleryCompact',
+            faro_dot_proto_dot_face__service__pb2.GalleryCompactRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.GalleryCompactResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def galleryExport(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/FaceRecognition/galleryExport',
+            faro_dot_proto_dot_face__service__pb2.GalleryExportRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.GalleryChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def galleryImport(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/FaceRecognition/galleryImport',
+            faro_dot_proto_dot_face__service__pb2.GalleryChunk.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.GalleryImportResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def enrollmentList(request,
             target,
@@ -552,6 +769,23 @@ class FaceRecognition(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def matchDistribution(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/FaceRecognition/matchDistribution',
+            faro_dot_proto_dot_face__service__pb2.MatchDistributionRequest.SerializeToString,
+            faro_dot_proto_dot_face__service__pb2.MatchDistribution.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def echo(request,
             target,
@@ -0,0 +1,136 @@
+'''
+Shared fixtures for the gallery tests.
+
+The tests use random templates and run without the face recognition models.
+Run them from the top of the repository with the package installed:
+
+    pip install -e .
+    pytest tests
+'''
+
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+import faro.proto.proto_types as pt
+from faro import FaceGallery
+from faro import FaceService as FS
+from faro.FaceWorker import FaceWorker
+
+
+class Options(object):
+    ''' The service options used by the gallery workers. '''
+    gallery_cache_size = 256
+    gallery_cache_mb = 0
+    algorithm = 'test'
+    index_quantization = 'none'
+    gallery_backend = 'hdf5'
+    gallery_shards = 3
+    blas_threads = 0
+    ivf_lists = 0
+    ivf_nprobe = 1000
+    log_commit_ms = 5.0
+    log_commit_records = 1000
+
+    def __init__(self, storage_dir, **kwargs):
+        self.storage_dir = storage_dir
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class L2Worker(FaceWorker):
+    ''' A face worker that only scores templates. '''
+
+    def __init__(self):
+        pass
+
+    def scoreType(self):
+        return fsd.L2
+
+
+class Context(object):
+    ''' The gRPC context passed to the service methods. '''
+
+    def peer(self):
+        return 'test'
+
+
+def makeFaces(templates, start=0, subjects=10):
+    ''' Return a face record for each row of a template matrix. '''
+    faces = []
+    for i, template in enumerate(templates, start):
+        face = fsd.FaceRecord(name='n%d'%i, source='cam%d'%(i%7), subject_id='s%d'%(i%subjects),
+                              collection_date=1000+i, enrollment_date=i%5)
+        face.detection.detection_id = i
+        face.template.data.CopyFrom(pt.vector_np2proto(template))
+        face.attributes.add(key='glasses', text='yes' if i%3 == 0 else 'no')
+        face.attributes.add(key='age', ivalue=i%50)
+        faces.append(face)
+    return faces
+
+
+def makeProbes(templates):
+    ''' Return a FaceRecordList with a probe for each row of a template matrix. '''
+    probes = fsd.FaceRecordList()
+    for template in templates:
+        probes.face_records.add().template.data.CopyFrom(pt.vector_np2proto(template))
+    return probes
+
+
+def resultNames(results):
+    ''' The names of the matches of each probe in a search response. '''
+    return [[face.name for face in probe.search_results.face_records] for probe in results.face_records]
+
+
+def nearest(probes, gallery, k, positions=None):
+    ''' The names of the k nearest gallery templates of each probe, optionally among some positions only. '''
+    if positions is None:
+        positions = np.arange(len(gallery))
+    distances = ((probes[:,np.newaxis,:]-gallery[np.newaxis,positions,:])**2).sum(axis=2)
+    return [['n%d'%positions[i] for i in order] for order in np.argsort(distances,axis=1)[:,:k]]
+
+
+def closeWorker(worker):
+    ''' Close the galleries of a worker and forget them so the next test starts clean. '''
+    worker.close()
+    FaceGallery.MANIFEST.clear()
+    FaceGallery.TEMPLATES.clear()
+
+
+@pytest.fixture
+def templates():
+    return np.random.RandomState(0).randn(600, 32).astype(np.float32)
+
+
+@pytest.fixture(params=['hdf5', 'sqlite'])
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def options(tmp_path, backend):
+    return Options(str(tmp_path), gallery_backend=backend)
+
+
+@pytest.fixture
+def worker(options):
+    worker = FaceGallery.SearchableGalleryWorker(options, fsd.L2)
+    yield worker
+    closeWorker(worker)
+
+
+@pytest.fixture
+def service(options, monkeypatch):
+    ''' A face service with a gallery worker that is not searchable and a small score budget. '''
+    monkeypatch.setattr(FS,'FACE_ALG',L2Worker())
+    service = FS.FaceService.__new__(FS.FaceService)
+    service.gallery_worker = FaceGallery.GalleryWorker(options)
+    service.workers = ThreadPool(2)
+    service.worker_count = 2
+    service.score_memory_mb = 0.05
+    service.max_message_size = 4096
+    yield service
+    service.workers.close()
+    closeWorker(service.gallery_worker)
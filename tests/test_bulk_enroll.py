@@ -0,0 +1,24 @@
+'''
+Tests for the bulk enroll stream of the service.
+'''
+
+import faro.proto.face_service_pb2 as fsd
+from faro import FaceService as FS
+
+from conftest import makeFaces, Context
+
+
+def test_bulk_enroll_writes_batches(service, templates, monkeypatch):
+    monkeypatch.setattr(FS,'BULK_ENROLL_BATCH_SIZE',64)
+    faces = makeFaces(templates)
+
+    def requests():
+        for i in range(0,len(faces),25):
+            request = fsd.EnrollRequest(enroll_gallery='g' if i%50 == 0 else 'h')
+            request.records.face_records.extend(faces[i:i+25])
+            yield request
+
+    response = service.bulkEnroll(requests(),Context())
+    assert (response.request_count, response.enroll_count, response.replace_count) == (24,600,0)
+    assert service.gallery_worker.size('g') == 300
+    assert service.gallery_worker.size('h') == 300
@@ -0,0 +1,67 @@
+'''
+Tests for the blocked scoring kernels.
+'''
+
+import numpy as np
+import pytest
+import scipy.spatial as spat
+
+import faro.proto.face_service_pb2 as fsd
+from faro.FaceScoring import scoreMatrix, scoreBlocks, scoreTileShape, squaredNorms, pairTiles, subjectCodes, tilePairs
+
+
+def exactScores(probe_mat, gal_mat, score_type):
+    ''' The scores computed in float64 by scipy. '''
+    probe_mat, gal_mat = probe_mat.astype(np.float64), gal_mat.astype(np.float64)
+    if score_type == fsd.L2:
+        return spat.distance_matrix(probe_mat,gal_mat,2)
+    if score_type == fsd.L1:
+        return spat.distance_matrix(probe_mat,gal_mat,1)
+    return -np.dot(probe_mat,gal_mat.T)
+
+
+@pytest.mark.parametrize('score_type',[fsd.L1,fsd.L2,fsd.NEG_DOT])
+@pytest.mark.parametrize('memory_mb',[None,0.01])
+def test_blocked_scores_match_scipy(templates, score_type, memory_mb):
+    probe_mat, gal_mat = templates[:70], templates[70:]
+    scores = scoreMatrix(probe_mat,gal_mat,score_type,memory_mb)
+    assert scores.dtype == np.float32
+    assert np.allclose(scores,exactScores(probe_mat,gal_mat,score_type),rtol=1e-4,atol=1e-3)
+
+
+def test_cached_norms_give_the_same_scores(templates):
+    gallery_norms = squaredNorms(templates)
+    assert np.allclose(gallery_norms,(templates.astype(np.float64)**2).sum(axis=1),rtol=1e-5)
+    assert np.array_equal(scoreMatrix(templates[:20],templates,fsd.L2,gallery_norms=gallery_norms),
+                          scoreMatrix(templates[:20],templates,fsd.L2))
+    # Identical templates are at distance zero rather than nan
+    assert np.all(np.isfinite(np.diag(scoreMatrix(templates[:20],templates[:20],fsd.L2))))
+
+
+def test_tiles_cover_the_matrix_within_the_budget(templates):
+    probe_rows, gallery_rows = scoreTileShape(100,600,32,fsd.L1,0.01)
+    assert probe_rows*gallery_rows*4*32 <= 0.01*1024*1024
+    covered = np.zeros((100,600),dtype=int)
+    for probe_start, gallery_start, block in scoreBlocks(templates[:100],templates,fsd.L1,0.01):
+        assert block.shape[0] <= probe_rows and block.shape[1] <= gallery_rows
+        covered[probe_start:probe_start+block.shape[0],gallery_start:gallery_start+block.shape[1]] += 1
+    assert np.all(covered == 1)
+
+
+def test_unknown_score_types_are_refused(templates):
+    with pytest.raises(NotImplementedError):
+        scoreMatrix(templates[:2],templates[:2],fsd.SERVER)
+
+
+def test_pair_tiles_count_each_pair_once():
+    n = 23
+    codes = subjectCodes(['s%d'%(i%4) if i%5 else '' for i in range(n)])
+    scores = np.arange(n*n,dtype=np.float32).reshape(n,n)
+    seen, genuine_count = [], 0
+    for probe_start, probe_stop, gallery_start, gallery_stop in pairTiles(n,6):
+        pairs, genuine = tilePairs(scores[probe_start:probe_stop,gallery_start:gallery_stop],codes,probe_start,gallery_start)
+        seen.extend(pairs)
+        genuine_count += genuine.sum()
+    upper = np.triu_indices(n,1)
+    assert sorted(seen) == sorted(scores[upper])
+    assert genuine_count == (codes[upper[0]] == codes[upper[1]]).sum()
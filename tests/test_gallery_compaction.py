@@ -0,0 +1,24 @@
+'''
+Tests for compacting a gallery after deletes.
+'''
+
+import numpy as np
+
+from conftest import makeFaces, makeProbes, resultNames, nearest
+
+
+def test_compaction_keeps_the_live_faces(worker, templates):
+    worker.addFacesToGallery('g',makeFaces(templates))
+    for subject in ['s1','s3','s5']:
+        worker.subjectDelete('g',subject)
+
+    result = worker.compactGallery('g')
+    assert result['rows_removed'] == 180
+    assert worker.size('g') == 420
+    live = np.array([i for i in range(len(templates)) if i%10 not in (1,3,5)])
+    probes = templates[::50] + 0.01
+    assert resultNames(worker.search('g',makeProbes(probes),3,np.inf)) == nearest(probes,templates,3,live)
+
+    # New faces are enrolled after the compacted rows
+    worker.addFacesToGallery('g',makeFaces(templates[:5]+10,1000))
+    assert worker.size('g') == 425
@@ -0,0 +1,23 @@
+'''
+Tests for skipping or merging near-duplicate faces at enrollment.
+'''
+
+from conftest import makeFaces
+
+
+def test_near_duplicates_are_skipped_or_merged(worker, templates):
+    worker.addFacesToGallery('g',makeFaces(templates[:20]))
+    duplicates = makeFaces(templates[:3]+0.001,100)
+    for face, subject in zip(duplicates,['s0','s1','s9']):
+        face.subject_id = subject
+
+    enroll, keys, skipped, merged = worker.dedupFaces('g',duplicates,0.1)
+    # The third face belongs to another subject than the face it is close to
+    assert (skipped, merged) == (2,0)
+    assert [face.name for face in enroll] == ['n102']
+    assert keys[0] == worker.getSubjectFaceRecords('g','s0').face_records[0].gallery_key
+
+    enroll, keys, skipped, merged = worker.dedupFaces('g',makeFaces(templates[:1]+0.002,200)*2,0.1,merge=True)
+    assert (skipped, merged) == (0,2)
+    assert len(enroll) == 1 and enroll[0].name == 'n0'
+    assert [(each.key,each.ivalue) for each in enroll[0].metadata] == [('merged_faces',3)]
@@ -0,0 +1,53 @@
+'''
+Tests for exporting and importing galleries in chunks.
+'''
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+
+from conftest import makeFaces, Context
+
+
+def test_export_and_import_a_gallery(worker, templates):
+    faces = makeFaces(templates[:300])
+    worker.addFacesToGallery('g',faces)
+    worker.subjectDelete('g','s0')
+
+    chunks = list(worker.exportGallery('g',chunk_rows=64))
+    assert [chunk.start_row for chunk in chunks] == list(range(0,300,64))
+    assert sum(len(chunk.records.face_records) for chunk in chunks) == 270
+    for chunk in chunks:
+        worker.importChunk('h',chunk)
+
+    source = {face.name : face for face in worker.getAllFaceRecords('g').face_records}
+    copied = {face.name : face for face in worker.getAllFaceRecords('h').face_records}
+    assert sorted(copied) == sorted(source)
+    for name, face in copied.items():
+        assert face.subject_id == source[name].subject_id
+        assert np.array_equal(face.template.data.data,source[name].template.data.data)
+
+    # An export resumes from the last chunk received until the file is compacted
+    resumed = list(worker.exportGallery('g',chunks[1].next_row,chunks[1].file_id,64))
+    assert [chunk.start_row for chunk in resumed] == [chunk.start_row for chunk in chunks[2:]]
+    worker.compactGallery('g')
+    with pytest.raises(ValueError):
+        list(worker.exportGallery('g',chunks[1].next_row,chunks[1].file_id,64))
+
+
+def test_export_stream_imports_into_another_gallery(service, templates):
+    worker = service.gallery_worker
+    worker.addFacesToGallery('g',makeFaces(templates[:200]))
+
+    chunks = list(service.galleryExport(fsd.GalleryExportRequest(gallery_name='g',chunk_size=50),Context()))
+    for chunk in chunks:
+        chunk.gallery_name = 'copy'
+    # gRPC serializes each response before the next one is produced
+    acks = [fsd.GalleryImportResponse.FromString(ack.SerializeToString()) for ack in service.galleryImport(iter(chunks),Context())]
+
+    assert [ack.next_row for ack in acks] == [50,100,150,200]
+    assert acks[-1].enroll_count == 200 and acks[-1].file_id == chunks[0].file_id
+    _, _, _, copied, _ = worker.galleryTemplates('copy')
+    _, _, _, source, _ = worker.galleryTemplates('g')
+    assert np.array_equal(copied,source)
@@ -0,0 +1,50 @@
+'''
+Tests for filtering searches by face metadata.
+'''
+
+import numpy as np
+
+import faro.proto.face_service_pb2 as fsd
+from faro.GalleryFilters import FilterColumns
+
+from conftest import makeFaces, makeProbes, resultNames, nearest
+
+
+def test_filtered_search_only_scores_matching_faces(worker, templates):
+    worker.addFacesToGallery('g',makeFaces(templates))
+    search_filter = fsd.SearchFilter(sources=['cam1','cam2'],min_collection_date=1100,max_collection_date=1500)
+    search_filter.attributes.add(key='glasses',values=['yes'])
+
+    index = np.arange(len(templates))
+    allowed = index[(index%7 >= 1) & (index%7 <= 2) & (index >= 100) & (index <= 500) & (index%3 == 0)]
+    probes = templates[:5]
+    results = worker.search('g',makeProbes(probes),4,np.inf,search_filter=search_filter)
+    assert resultNames(results) == nearest(probes,templates,4,allowed)
+
+    # Integer attributes match their values as text
+    search_filter = fsd.SearchFilter()
+    search_filter.attributes.add(key='age',values=['11','12'])
+    results = worker.search('g',makeProbes(probes),1000,np.inf,search_filter=search_filter)
+    assert all(int(name[1:])%50 in (11,12) for names in resultNames(results) for name in names)
+    assert len(resultNames(results)[0]) == 24
+
+
+def test_attribute_values_of_every_type():
+    faces = [fsd.FaceRecord(name='n%d'%i) for i in range(5)]
+    faces[0].attributes.add(key='score',fvalue=35.2)
+    faces[1].attributes.add(key='score',ivalue=35)
+    faces[2].attributes.add(key='score',buffer=b'35.2')
+    faces[3].attributes.add(key='score',text='35.2')
+    faces[4].attributes.add(key='score')
+    columns = FilterColumns.fromFaces(faces)
+
+    def matching(*values):
+        search_filter = fsd.SearchFilter()
+        search_filter.attributes.add(key='score',values=values)
+        return list(np.flatnonzero(columns.mask(search_filter)))
+
+    # Floats match their shortest float32 text and bytes match no value
+    assert matching('35.2') == [0,3]
+    assert matching('35') == [1]
+    assert matching('0') == [4]
+    assert matching() == [0,1,2,3,4]
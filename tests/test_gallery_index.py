@@ -0,0 +1,164 @@
+'''
+Tests for the memory mapped search index.
+'''
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from faro import GalleryIndex as GI
+from faro.GalleryIndex import SearchIndex, readIndexMeta
+from faro.GalleryStore import GalleryStore
+
+from conftest import makeFaces
+
+
+@pytest.fixture
+def prefix(tmp_path):
+    return str(tmp_path/'g')
+
+
+def galleryStore(path, templates):
+    ''' A gallery store with a face for each template in rows 0 to n-1. '''
+    store = GalleryStore(path)
+    faces = makeFaces(templates)
+    for face in faces:
+        face.gallery_key = face.name
+    store.append(faces)
+    return store
+
+
+def buildIndex(prefix, templates, quantization='none'):
+    ''' Build an index of the templates from a gallery store next to it. '''
+    store = galleryStore(prefix+'.h5',templates)
+    try:
+        return SearchIndex.build(prefix,store,quantization=quantization)
+    finally:
+        store.close()
+
+
+def liveTemplates(index):
+    ''' The live gallery rows of an index and their templates. '''
+    templates, rows, live = index.snapshot()
+    keep = np.ones((len(rows),),dtype=bool) if live is None else np.array(live,dtype=bool)
+    return np.array(rows[keep]), np.array(templates[keep])
+
+
+def test_build_and_open_round_trip(prefix, templates):
+    store = galleryStore(prefix+'.h5',templates)
+    store.delete(np.arange(1,len(templates),2))
+    SearchIndex.build(prefix,store,block_rows=64)
+    version = store.version
+    store.close()
+
+    reopened = SearchIndex.open(prefix)
+    assert reopened.gallery_version == version
+    assert reopened.size() == len(templates)//2
+    got_rows, got_templates = liveTemplates(reopened)
+    assert np.array_equal(got_rows,np.arange(0,len(templates),2))
+    assert np.array_equal(got_templates,templates[::2])
+    norms = np.array(reopened.scoreSnapshot()[1])
+    assert np.allclose(norms,(templates[::2]**2).sum(axis=1),rtol=1e-5)
+
+
+def test_updates_append_and_tombstone(prefix, templates):
+    index = buildIndex(prefix,templates[:100])
+    # Grow past the initial capacity and delete rows old and new
+    index.update(templates[100:],np.arange(100,len(templates)),[3,5,150],2)
+    index.update(templates[:0],np.zeros((0,),dtype=np.int64),[7],3)
+
+    assert index.deleted == 4
+    assert index.size() == len(templates) - 4
+    expected = np.setdiff1d(np.arange(len(templates)),[3,5,7,150])
+    for each in [index, SearchIndex.open(prefix)]:
+        rows, mat = liveTemplates(each)
+        assert np.array_equal(rows,expected)
+        assert np.array_equal(mat,templates[expected])
+    assert SearchIndex.open(prefix).gallery_version == 3
+
+
+def test_compact_drops_tombstones(prefix, templates):
+    index = buildIndex(prefix,templates)
+    deleted = np.arange(0,len(templates),3)
+    index.update(templates[:0],np.zeros((0,),dtype=np.int64),deleted,2)
+    generation = index.generation
+
+    assert index.compact() == len(deleted)
+    assert index.deleted == 0
+    assert index.generation > generation
+    expected = np.setdiff1d(np.arange(len(templates)),deleted)
+    rows, mat = liveTemplates(SearchIndex.open(prefix))
+    assert np.array_equal(rows,expected)
+    assert np.array_equal(mat,templates[expected])
+    assert not os.path.exists(GI._dataPaths(prefix,generation)[0])
+
+
+def test_updates_during_compaction_are_kept(prefix, templates, monkeypatch):
+    index = buildIndex(prefix,templates[:300])
+    index.update(templates[:0],np.zeros((0,),dtype=np.int64),np.arange(0,300,2),2)
+    monkeypatch.setattr(GI,'COMPACT_BLOCK_ROWS',16)
+
+    # Append and delete rows while the unlocked copy is running
+    write = GI._writeAt
+    updated = []
+    def writeAt(path, offset, data):
+        if not updated and path.endswith('.f32'):
+            updated.append(True)
+            thread = threading.Thread(target=index.update,args=(templates[300:],np.arange(300,len(templates)),[1,301],3))
+            thread.start()
+            thread.join()
+        write(path,offset,data)
+    monkeypatch.setattr(GI,'_writeAt',writeAt)
+
+    index.compact()
+    expected = np.setdiff1d(np.arange(len(templates)),np.concatenate([np.arange(0,300,2),[1,301]]))
+    for each in [index, SearchIndex.open(prefix)]:
+        rows, mat = liveTemplates(each)
+        assert np.array_equal(rows,expected)
+        assert np.array_equal(mat,templates[expected])
+
+
+def test_compaction_during_a_rebuild_is_discarded(prefix, templates, monkeypatch):
+    index = buildIndex(prefix,templates)
+    index.update(templates[:0],np.zeros((0,),dtype=np.int64),np.arange(100),2)
+    rebuild_store = galleryStore(prefix+'-rebuild.h5',templates[:50])
+
+    # Rebuild the index after the compaction has chosen its generation
+    allocate = SearchIndex._allocateGeneration
+    rebuilt = []
+    def allocateGeneration(prefix, generation, capacity, dim, quantization):
+        allocate(prefix,generation,capacity,dim,quantization)
+        if not rebuilt:
+            rebuilt.append(generation)
+            rebuilt.append(SearchIndex.build(prefix,rebuild_store))
+    monkeypatch.setattr(SearchIndex,'_allocateGeneration',staticmethod(allocateGeneration))
+
+    assert index.compact() == 0
+    rebuild_store.close()
+    compact_generation, rebuild = rebuilt
+    assert rebuild.generation != compact_generation
+    assert readIndexMeta(prefix)['generation'] == rebuild.generation
+    assert not os.path.exists(GI._dataPaths(prefix,compact_generation)[0])
+    rows, mat = liveTemplates(SearchIndex.open(prefix))
+    assert np.array_equal(rows,np.arange(50))
+    assert np.array_equal(mat,templates[:50])
+
+
+def test_builds_and_compactions_reserve_distinct_generations(prefix, templates):
+    buildIndex(prefix,templates)
+    generations = [GI._reserveGeneration(prefix) for _ in range(3)]
+    assert len(set(generations)) == 3
+    assert buildIndex(prefix,templates).generation > max(generations)
+
+
+@pytest.mark.parametrize('quantization',['float16','int8'])
+def test_quantized_index_round_trip(prefix, templates, quantization):
+    index = buildIndex(prefix,templates[:500],quantization)
+    index.update(templates[500:],np.arange(500,len(templates)),[2],2)
+    coarse, scale = index.coarseSnapshot()[:2]
+    restored = GI.dequantize(np.array(coarse[:len(index)]),quantization,scale)
+    # The int8 scale is chosen when the index is built, so later rows may be clipped
+    assert np.allclose(restored[:500],templates[:500],atol=0.01*np.abs(templates).max())
+    assert SearchIndex.open(prefix).quantization == quantization
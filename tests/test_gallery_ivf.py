@@ -0,0 +1,94 @@
+'''
+Tests for approximate search with inverted lists.
+'''
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+from faro import GalleryIVF
+from faro.GalleryIVF import IVFGalleryWorker, IVFLists, assignLists, trainCentroids
+
+from conftest import makeFaces, makeProbes, resultNames, closeWorker
+
+
+@pytest.fixture
+def ivf_worker(options, monkeypatch):
+    monkeypatch.setattr(GalleryIVF,'IVF_MIN_ROWS',200)
+    options.ivf_lists = 8
+    worker = IVFGalleryWorker(options,fsd.L2)
+    yield worker
+    closeWorker(worker)
+
+
+def waitForLists(worker, gallery_name):
+    ''' Search until the background build has produced lists for the current index. '''
+    for _ in range(300):
+        worker.search(gallery_name,makeProbes(np.zeros((1,32),dtype=np.float32)),1,np.inf)
+        lists = worker.ivf_lists.get(gallery_name)
+        if lists is not None and not worker.ivf_building and lists.generation == worker.indexes[gallery_name].generation:
+            return lists
+        time.sleep(0.05)
+    raise AssertionError("The lists were not built.")
+
+
+def test_candidates_are_limited_to_the_snapshot():
+    centroids = np.eye(4,dtype=np.float32)
+    lists = IVFLists(centroids,0,np.array([0,1,2,3,0,1],dtype=np.int32),6)
+    lists = lists.extend(np.array([0,0,1],dtype=np.int32))
+    assert list(lists.candidates([0],len(lists))) == [0,4,6,7]
+    # A snapshot taken before the lists were extended
+    assert list(lists.candidates([0],7)) == [0,4,6]
+    assert list(lists.candidates([0,1],4)) == [0,1]
+
+
+def test_assignments_use_the_nearest_centroid(templates):
+    centroids = trainCentroids(templates,8)
+    assign = assignLists(templates,centroids)
+    distances = ((templates[:,np.newaxis,:]-centroids[np.newaxis,:,:])**2).sum(axis=2)
+    assert np.array_equal(assign,np.argmin(distances,axis=1))
+
+
+def test_probing_every_list_matches_exact_search(ivf_worker, templates):
+    ivf_worker.addFacesToGallery('g',makeFaces(templates))
+    lists = waitForLists(ivf_worker,'g')
+    # Rows enrolled after the lists were built are scored as well
+    added = templates[:20] + 0.05
+    ivf_worker.addFacesToGallery('g',makeFaces(added,len(templates)))
+    gallery = np.concatenate([templates,added])
+
+    probes = templates[::50] + 0.1
+    expected = np.argsort(((probes[:,np.newaxis,:]-gallery[np.newaxis,:,:])**2).sum(axis=2),axis=1)[:,:5]
+    results = ivf_worker.search('g',makeProbes(probes),5,np.inf,len(lists.centroids))
+    for names, order in zip(resultNames(results),expected):
+        assert names == ['n%d'%i for i in order]
+
+
+def test_concurrent_searches_and_enrollments(ivf_worker, templates):
+    ivf_worker.addFacesToGallery('g',makeFaces(templates))
+    waitForLists(ivf_worker,'g')
+
+    errors = []
+    done = threading.Event()
+
+    def search():
+        while not done.is_set():
+            try:
+                results = ivf_worker.search('g',makeProbes(templates[:4]),3,np.inf,2)
+                assert all(len(names) == 3 for names in resultNames(results))
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=search) for _ in range(4)]
+    [thread.start() for thread in threads]
+    rng = np.random.RandomState(1)
+    for k in range(30):
+        ivf_worker.addFacesToGallery('g',makeFaces(rng.randn(3,32).astype(np.float32),1000+3*k))
+    done.set()
+    [thread.join() for thread in threads]
+
+    assert errors == []
+    assert len(ivf_worker.ivf_lists['g']) <= len(ivf_worker.indexes['g'])
@@ -0,0 +1,199 @@
+'''
+Tests for the group commit write-ahead log.
+'''
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+from faro import FaceGallery
+from faro import GalleryLog as GL
+from faro.GalleryLog import GalleryLog, ENROLL, DELETE, IMPORT
+
+from conftest import makeFaces, closeWorker
+
+
+class Recorder(object):
+    ''' An apply callback that records the entries of each group. '''
+
+    def __init__(self):
+        self.groups = []
+
+    def __call__(self, entries):
+        self.groups.append(entries)
+        return [seq for seq,_,_,_ in entries]
+
+
+def test_wait_returns_the_apply_result(tmp_path):
+    applied = Recorder()
+    log = GalleryLog(str(tmp_path/'g.wal'), applied)
+    seq = log.append(ENROLL, makeFaces(np.zeros((2,4),dtype=np.float32)))
+    assert log.wait(seq) == seq
+    log.close()
+    assert applied.groups[0][0][1] == ENROLL
+
+
+def test_recover_replays_entries_after_the_applied_seq(tmp_path):
+    path = str(tmp_path/'g.wal')
+    templates = np.arange(12,dtype=np.float32).reshape(3,4)
+    log = GalleryLog(path, Recorder())
+    for seq in [log.append(ENROLL, makeFaces(templates[:1])),
+                log.append(DELETE, makeFaces(templates[1:2])),
+                log.append(IMPORT, makeFaces(templates[2:]), templates[2:])]:
+        log.wait(seq)
+    log.close()
+
+    # Append a torn entry that recovery must discard
+    with open(path,'ab') as f:
+        f.write(b'\x07\x00\x00')
+
+    applied = Recorder()
+    log = GalleryLog(path, applied)
+    assert log.seq == 3
+    assert log.recover(1) == 2
+    entries = applied.groups[0]
+    assert [(seq,op) for seq,op,_,_ in entries] == [(2,DELETE),(3,IMPORT)]
+    assert np.array_equal(entries[1][3], templates[2:])
+    assert entries[1][2][0].name == 'n0'
+
+    # New entries follow the valid data
+    log.wait(log.append(ENROLL, makeFaces(templates[:1])))
+    log.close()
+    assert GalleryLog(path, Recorder())._lastSeq() == 4
+
+
+def test_concurrent_appends_share_commits(tmp_path):
+    applied = Recorder()
+    log = GalleryLog(str(tmp_path/'g.wal'), applied, commit_interval=0.05, commit_records=1000)
+    results = {}
+
+    def enroll(k):
+        seq = log.append(ENROLL, makeFaces(np.zeros((1,4),dtype=np.float32), k))
+        results[seq] = log.wait(seq)
+
+    threads = [threading.Thread(target=enroll,args=(k,)) for k in range(16)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    log.close()
+
+    assert sorted(results) == list(range(1,17))
+    assert all(seq == result for seq,result in results.items())
+    assert len(applied.groups) < 16
+    assert sum(len(group) for group in applied.groups) == 16
+
+
+def test_commit_records_triggers_a_commit(tmp_path):
+    log = GalleryLog(str(tmp_path/'g.wal'), Recorder(), commit_interval=30.0, commit_records=1)
+    start = time.time()
+    log.wait(log.append(ENROLL, makeFaces(np.zeros((1,4),dtype=np.float32))))
+    assert time.time() - start < 10.0
+    log.close()
+
+
+def test_apply_errors_are_raised_by_wait(tmp_path):
+    def apply(entries):
+        raise KeyError('bad entry')
+    log = GalleryLog(str(tmp_path/'g.wal'), apply)
+    with pytest.raises(KeyError):
+        log.wait(log.append(ENROLL, makeFaces(np.zeros((1,4),dtype=np.float32))))
+    log.close()
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_wait_raises_when_the_log_stops(tmp_path, monkeypatch):
+    def fail(fileno):
+        raise OSError('disk failure')
+    monkeypatch.setattr(GL.os, 'fsync', fail)
+
+    log = GalleryLog(str(tmp_path/'g.wal'), Recorder())
+    seq = log.append(ENROLL, makeFaces(np.zeros((1,4),dtype=np.float32)))
+    with pytest.raises(ValueError, match="gallery log closed"):
+        log.wait(seq)
+    monkeypatch.undo()
+    log.close()
+
+
+def test_append_after_close_raises(tmp_path):
+    log = GalleryLog(str(tmp_path/'g.wal'), Recorder())
+    log.close()
+    with pytest.raises(ValueError):
+        log.append(ENROLL, makeFaces(np.zeros((1,4),dtype=np.float32)))
+
+
+def test_worker_uses_the_commit_options(worker, templates):
+    assert worker.commit_interval == 0.005
+    assert worker.commit_records == 1000
+    worker.addFacesToGallery('g', makeFaces(templates[:10]))
+    log = FaceGallery.LOGS['g']
+    assert (log.commit_interval, log.commit_records) == (0.005, 1000)
+
+
+def test_worker_enrollments_survive_a_reopen(options, templates):
+    worker = FaceGallery.SearchableGalleryWorker(options, fsd.L2)
+    threads = [threading.Thread(target=worker.addFacesToGallery,args=('g',makeFaces(templates[k:k+1],k)))
+               for k in range(40)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    worker.subjectDelete('g','s3')
+    closeWorker(worker)
+
+    worker = FaceGallery.SearchableGalleryWorker(options, fsd.L2)
+    try:
+        names = sorted(face.name for face in worker.getAllFaceRecords('g').face_records)
+        assert names == sorted('n%d'%k for k in range(40) if k%10 != 3)
+    finally:
+        closeWorker(worker)
+
+
+def crashWorker(worker):
+    ''' Drop the open galleries of a worker the way a crash would, without syncing them or truncating their logs. '''
+    worker.stopping.set()
+    for gallery_name in list(FaceGallery.LOGS):
+        FaceGallery.LOGS.pop(gallery_name).close()
+    for gallery_name in list(FaceGallery.STORAGE):
+        store = FaceGallery.STORAGE[gallery_name]
+        del FaceGallery.STORAGE[gallery_name]
+        store.close()
+    FaceGallery.MANIFEST.clear()
+    FaceGallery.TEMPLATES.clear()
+
+
+def test_the_log_is_replayed_over_an_unsynced_store(options, templates):
+    worker = FaceGallery.SearchableGalleryWorker(options, fsd.L2)
+    worker.addFacesToGallery('g',makeFaces(templates[:20]))
+    worker.checkpoint('g')
+    path = worker.galleryPath('g')
+    with open(path,'rb') as f:
+        synced = f.read()
+
+    # Writes to the store after the checkpoint are lost in the crash but
+    # their log entries are on disk
+    worker.addFacesToGallery('g',makeFaces(templates[20:40],20))
+    worker.subjectDelete('g','s3')
+    crashWorker(worker)
+    with open(path,'wb') as f:
+        f.write(synced)
+
+    worker = FaceGallery.SearchableGalleryWorker(options, fsd.L2)
+    try:
+        names = sorted(face.name for face in worker.getAllFaceRecords('g').face_records)
+        assert names == sorted('n%d'%k for k in range(40) if k%10 != 3)
+    finally:
+        closeWorker(worker)
+
+
+def test_checkpoint_keeps_the_log_if_the_store_is_not_synced(worker, templates, monkeypatch):
+    worker.addFacesToGallery('g', makeFaces(templates[:10]))
+    wal_path = worker.galleryPath('g','.wal')
+    size = os.path.getsize(wal_path)
+
+    def sync():
+        raise OSError("sync failed")
+    monkeypatch.setattr(FaceGallery.STORAGE['g'],'sync',sync)
+    with pytest.raises(OSError):
+        worker.checkpoint('g')
+    assert os.path.getsize(wal_path) == size > 0
@@ -0,0 +1,26 @@
+'''
+Tests for listing galleries from the manifest at startup.
+'''
+
+import faro.proto.face_service_pb2 as fsd
+from faro import FaceGallery
+
+from conftest import makeFaces, closeWorker
+
+
+def test_galleries_are_listed_from_the_manifest(options, templates):
+    worker = FaceGallery.SearchableGalleryWorker(options,fsd.L2)
+    worker.addFacesToGallery('g',makeFaces(templates[:40]))
+    closeWorker(worker)
+
+    worker = FaceGallery.SearchableGalleryWorker(options,fsd.L2)
+    try:
+        # The gallery file is not opened until it is used
+        assert 'g' not in FaceGallery.STORAGE
+        stats = worker.galleryStats()['g']
+        assert (stats['faces'],stats['subjects'],stats['dim']) == (40,10,32)
+        assert worker.size('g') == 40
+        assert len(worker.enrollmentList('g').face_records) == 40
+        assert 'g' in FaceGallery.STORAGE
+    finally:
+        closeWorker(worker)
@@ -0,0 +1,18 @@
+'''
+Tests for searching quantized gallery indexes.
+'''
+
+import numpy as np
+import pytest
+
+from conftest import makeFaces, makeProbes, resultNames, nearest
+
+
+@pytest.mark.parametrize('quantization',['float16','int8'])
+def test_quantized_search_is_rescored_exactly(worker, templates, quantization):
+    worker.addFacesToGallery('g',makeFaces(templates))
+    worker.setIndexQuantization('g',quantization)
+    assert worker.indexes['g'].quantization == quantization
+
+    probes = templates[::40] + 0.05
+    assert resultNames(worker.search('g',makeProbes(probes),5,np.inf)) == nearest(probes,templates,5)
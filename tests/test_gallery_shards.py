@@ -0,0 +1,69 @@
+'''
+Tests for galleries split across shard processes.
+'''
+
+import os
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+from faro.FaceGallery import SearchableGalleryWorker
+from faro.GalleryShards import ShardedGalleryWorker, shardOf
+
+from conftest import makeFaces, makeProbes, resultNames
+
+
+def createWorker(options):
+    return SearchableGalleryWorker(options,fsd.L2)
+
+
+@pytest.fixture
+def sharded(options):
+    worker = ShardedGalleryWorker(options,createWorker)
+    yield worker
+    worker.close()
+
+
+def test_search_merges_the_shards(sharded, templates):
+    sharded.addFacesToGallery('g',makeFaces(templates))
+    assert sharded.size('g') == len(templates)
+    sizes = [sharded.call(shard,'size','g') for shard in range(sharded.shard_count)]
+    expected = [sum(1 for i in range(len(templates)) if shardOf('s%d'%(i%10),sharded.shard_count) == shard) for shard in range(sharded.shard_count)]
+    assert sizes == expected
+
+    probes = templates[::75] + 0.01
+    results = sharded.search('g',makeProbes(probes),5,np.inf)
+    distances = ((probes[:,np.newaxis,:]-templates[np.newaxis,:,:])**2).sum(axis=2)
+    for names, order in zip(resultNames(results),np.argsort(distances,axis=1)[:,:5]):
+        assert names == ['n%d'%i for i in order]
+
+
+def test_records_and_deletes_reach_the_right_shard(sharded, templates):
+    faces = makeFaces(templates[:100])
+    sharded.addFacesToGallery('g',faces)
+    assert sharded.getFaceRecord('g',faces[42].gallery_key).name == 'n42'
+    assert sorted(face.name for face in sharded.getSubjectFaceRecords('g','s4').face_records) == sorted('n%d'%i for i in range(4,100,10))
+
+    sharded.subjectDelete('g','s4')
+    assert sharded.size('g') == 90
+    with pytest.raises(KeyError):
+        sharded.getFaceRecord('g',faces[44].gallery_key)
+
+    assert sharded.deleteGallery('g') == 90
+    assert 'g' not in sharded.galleryNames()
+
+
+def test_warn_about_galleries_that_are_not_sharded(options, capsys):
+    unsharded = os.path.join(options.storage_dir,'galleries',options.algorithm)
+    os.makedirs(unsharded)
+    open(os.path.join(unsharded,'old.sqlite'),'w').close()
+    ShardedGalleryWorker(options,createWorker).close()
+    assert 'are not served when the galleries are sharded' in capsys.readouterr().out
+
+
+def test_the_shard_count_cannot_change(options):
+    ShardedGalleryWorker(options,createWorker).close()
+    options.gallery_shards = 2
+    with pytest.raises(ValueError):
+        ShardedGalleryWorker(options,createWorker)
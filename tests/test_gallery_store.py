@@ -0,0 +1,148 @@
+'''
+Tests for the gallery file backends and the migration from the original layout.
+'''
+
+import threading
+
+import h5py
+import numpy as np
+import pytest
+
+from faro.GalleryBackend import backendClass, BACKEND_EXTENSIONS
+from faro.GalleryStore import GalleryStore, LAYOUT_VERSION, isLegacyGallery, migrateGallery
+
+from conftest import makeFaces
+
+
+@pytest.fixture
+def store_path(tmp_path, backend):
+    return str(tmp_path/('g'+BACKEND_EXTENSIONS[backend]))
+
+
+def keyedFaces(templates, start=0):
+    faces = makeFaces(templates,start)
+    for face in faces:
+        face.gallery_key = face.name
+        face.view.width = 10 + face.detection.detection_id
+        face.view.data = b'pixels%d'%(face.detection.detection_id,)
+    return faces
+
+
+def test_append_and_reopen_round_trip(tmp_path, backend, store_path, templates):
+    blob_dir = str(tmp_path/'g.blobs')
+    store = backendClass(backend)(store_path,blob_dir=blob_dir)
+    faces = keyedFaces(templates[:100])
+    rows, replaced = store.append(faces)
+    assert rows == list(range(100)) and replaced == []
+    # Replacing a key deletes its old row
+    rows, replaced = store.append(keyedFaces(templates[5:6]+1,5))
+    assert rows == [100] and replaced == [5]
+    store.delete([store.row('n7')])
+    store.flush(12)
+    version = store.version
+    store.close()
+
+    store = backendClass(backend)(store_path,blob_dir=blob_dir)
+    try:
+        assert store.log_seq == 12
+        assert store.version == version
+        assert store.size() == 99
+        assert store.row('n5') == 100 and 'n7' not in store.keys
+        assert store.subjectRows('s5') == [15,25,35,45,55,65,75,85,95,100]
+        assert np.array_equal(store.templates(0,100)[8],templates[8])
+        face = store.getRecord(store.row('n9'))
+        assert face.view.data == b'pixels9' and face.view.width == 19
+        assert np.allclose(face.template.data.data,templates[9])
+        assert store.getRecord(store.row('n9'),view=False).view.data == b''
+        assert store.metadata([3])['name'] == ['n3']
+    finally:
+        store.close()
+
+
+def test_templates_must_have_one_length(backend, store_path, templates):
+    store = backendClass(backend)(store_path)
+    try:
+        store.append(keyedFaces(templates[:2]))
+        with pytest.raises(ValueError):
+            store.append(keyedFaces(templates[:1,:16],5))
+    finally:
+        store.close()
+
+
+def test_new_hdf5_galleries_use_the_current_layout(tmp_path, templates):
+    path = str(tmp_path/'g.h5')
+    GalleryStore(path).close()
+    with h5py.File(path,'r') as f:
+        assert f.attrs['layout_version'] == LAYOUT_VERSION
+        assert 'view_keys' in f and 'subject_ids' in f and 'file_id' in f.attrs
+
+    # Layouts this version does not know are refused
+    with h5py.File(path,'a') as f:
+        f.attrs['layout_version'] = LAYOUT_VERSION + 1
+    with pytest.raises(ValueError):
+        GalleryStore(path)
+
+
+def test_migrate_the_original_layout(tmp_path, templates):
+    path = str(tmp_path/'g.h5')
+    faces = makeFaces(templates[:30])
+    with h5py.File(path,'w') as f:
+        group = f.create_group('faces')
+        for face in faces:
+            group[face.name] = np.bytes_(face.SerializeToString())
+    assert isLegacyGallery(path)
+    with pytest.raises(ValueError):
+        GalleryStore(path)
+
+    assert migrateGallery(path,blob_dir=str(tmp_path/'g.blobs')) == 30
+    assert not isLegacyGallery(path) and isLegacyGallery(path+'.v1')
+    store = GalleryStore(path,blob_dir=str(tmp_path/'g.blobs'))
+    try:
+        assert store.size() == 30
+        for face in faces:
+            record = store.getRecord(store.row(face.name))
+            assert record.subject_id == face.subject_id
+            assert np.allclose(record.template.data.data,face.template.data.data)
+    finally:
+        store.close()
+
+
+def test_copy_rows_between_backends(tmp_path, templates):
+    source = backendClass('hdf5')(str(tmp_path/'a.h5'))
+    target = backendClass('sqlite')(str(tmp_path/'b.sqlite'))
+    try:
+        source.append(keyedFaces(templates[:50]))
+        source.delete(list(range(0,50,2)))
+        assert target.copyRows(source,source.liveRows()) == list(range(25))
+        assert [target.row('n%d'%i) for i in range(1,50,2)] == list(range(25))
+        assert np.array_equal(target.templates(0,25),templates[1:50:2])
+        assert target.getRecord(3).name == 'n7'
+    finally:
+        source.close()
+        target.close()
+
+
+def test_concurrent_appends_and_reads(backend, store_path, templates):
+    store = backendClass(backend)(store_path)
+    errors = []
+
+    def append(k):
+        try:
+            for i in range(k*50,(k+1)*50,10):
+                store.append(keyedFaces(templates[i:i+10],i))
+                with store.lock:
+                    rows = store.liveRows()
+                    store.getRecords(rows[-3:])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=append,args=(k,)) for k in range(6)]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    try:
+        assert errors == []
+        assert store.size() == 300
+        for name, row in store.keys.items():
+            assert np.array_equal(store.templates(row,row+1)[0],templates[int(name[1:])])
+    finally:
+        store.close()
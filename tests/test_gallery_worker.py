@@ -0,0 +1,113 @@
+'''
+Tests for the gallery worker: enrollment, search, deletion and the gallery cache.
+'''
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import faro.proto.face_service_pb2 as fsd
+from faro import FaceGallery
+from faro.GalleryCache import GalleryCache
+
+from conftest import makeFaces, makeProbes, resultNames, closeWorker
+
+
+def galleryFiles(worker, gallery_name):
+    ''' The files and directories left in the storage directory for a gallery. '''
+    storage_dir = os.path.dirname(worker.galleryPath(gallery_name))
+    return [name for name in os.listdir(storage_dir) if name.split('.')[0].split('-')[0] == gallery_name]
+
+
+def test_delete_waits_for_running_requests(worker, templates):
+    worker.addFacesToGallery('g',makeFaces(templates[:50]))
+    started, finished = threading.Event(), []
+
+    def request():
+        with worker.useGallery('g'):
+            started.set()
+            time.sleep(0.2)
+            finished.append(time.time())
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    started.wait()
+    assert worker.deleteGallery('g') == 50
+    deleted = time.time()
+    thread.join()
+
+    assert finished[0] <= deleted
+    assert 'g' not in FaceGallery.MANIFEST
+    assert galleryFiles(worker,'g') == []
+    with pytest.raises(ValueError):
+        worker.getAllFaceRecords('g')
+
+
+def test_delete_an_evicted_gallery(options, templates):
+    options.gallery_cache_size = 1
+    worker = FaceGallery.SearchableGalleryWorker(options,fsd.L2)
+    try:
+        worker.addFacesToGallery('a',makeFaces(templates[:30]))
+        worker.addFacesToGallery('b',makeFaces(templates[30:40]))
+        assert 'a' not in FaceGallery.STORAGE
+        assert worker.deleteGallery('a') == 30
+        assert galleryFiles(worker,'a') == []
+        assert worker.size('b') == 10
+    finally:
+        closeWorker(worker)
+
+
+def test_search_returns_the_nearest_faces(worker, templates):
+    worker.addFacesToGallery('g',makeFaces(templates))
+    probes = templates[::60] + 0.01
+    results = worker.search('g',makeProbes(probes),3,np.inf)
+    distances = ((probes[:,np.newaxis,:]-templates[np.newaxis,:,:])**2).sum(axis=2)
+    for names, order in zip(resultNames(results),np.argsort(distances,axis=1)[:,:3]):
+        assert names == ['n%d'%i for i in order]
+
+
+def test_acquire_pins_open_galleries_only():
+    cache = GalleryCache()
+    assert cache.acquire('g') is None
+    store = object()
+    cache['g'] = store
+    assert cache.acquire('g') is store
+    assert cache.pins['g'] == 1 and cache.hits == 1
+
+    # A pinned gallery is not drained for eviction
+    assert not cache.tryDrain('g')
+    cache.unpin('g')
+    assert cache.tryDrain('g')
+    assert cache.acquire('g') is None
+    cache.release('g')
+    assert cache.acquire('g') is store
+
+
+def test_requests_race_evictions(options, templates):
+    options.gallery_cache_size = 1
+    worker = FaceGallery.SearchableGalleryWorker(options,fsd.L2)
+    errors = []
+
+    def request(gallery_name):
+        try:
+            for _ in range(20):
+                with worker.useGallery(gallery_name) as store:
+                    assert store.size() == 30
+        except Exception as error:
+            errors.append(error)
+
+    try:
+        for gallery_name in 'abc':
+            worker.addFacesToGallery(gallery_name,makeFaces(templates[:30]))
+        threads = [threading.Thread(target=request,args=(gallery_name,)) for gallery_name in 'abcabc']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert FaceGallery.STORAGE.stats()['evictions'] > 2
+    finally:
+        closeWorker(worker)
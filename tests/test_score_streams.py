@@ -0,0 +1,105 @@
+'''
+Tests for the streaming score RPCs of the service.
+'''
+
+import numpy as np
+import pytest
+import scipy.spatial as spat
+
+import faro.proto.face_service_pb2 as fsd
+import faro.proto.proto_types as pt
+from faro.FaceClient import FaceClient
+from faro.FaceScoring import ScoreDistribution, estimateRange
+
+from conftest import makeFaces, Context
+
+
+def assemble(blocks, shape):
+    ''' Put streamed ScoreBlocks back together into a matrix. '''
+    dist_mat = np.full(shape,np.nan,dtype=np.float32)
+    for block in blocks:
+        scores = np.frombuffer(block.scores,dtype='<f4').reshape(block.probe_count,block.gallery_count)
+        dist_mat[block.probe_start:block.probe_start+block.probe_count,
+                 block.gallery_start:block.gallery_start+block.gallery_count] = scores
+    return dist_mat
+
+
+@pytest.mark.parametrize('n_gallery',[50,1500])
+def test_score_stream_blocks_fit_in_a_message(service, templates, n_gallery):
+    rng = np.random.RandomState(2)
+    probes, gallery = templates[:120], rng.randn(n_gallery,32).astype(np.float32)
+    request = fsd.ScoreRequest()
+    for template in probes:
+        request.template_probes.templates.add().data.CopyFrom(pt.vector_np2proto(template))
+    for template in gallery:
+        request.template_gallery.templates.add().data.CopyFrom(pt.vector_np2proto(template))
+
+    blocks = list(service.scoreStream(request,Context()))
+    assert all(block.ByteSize() <= service.max_message_size for block in blocks)
+    dist_mat = assemble(blocks,(len(probes),n_gallery))
+    assert np.allclose(dist_mat,spat.distance_matrix(probes,gallery),atol=1e-3)
+
+
+def test_growing_distribution_matches_a_histogram_of_every_score():
+    rng = np.random.RandomState(3)
+    tiles = [rng.randn(200), 5+rng.randn(300), -8+rng.randn(100), rng.randn(50)*20]
+    masks = [rng.rand(len(scores)) < 0.3 for scores in tiles]
+    distribution = ScoreDistribution(20,*estimateRange(tiles[0]),grow=True)
+    for scores, genuine in zip(tiles,masks):
+        distribution.add(scores,genuine)
+
+    scores, genuine = np.concatenate(tiles), np.concatenate(masks)
+    assert distribution.edges[0] <= scores.min() and scores.max() < distribution.edges[-1]
+    assert np.array_equal(distribution.genuine,np.histogram(scores[genuine],distribution.edges)[0])
+    assert np.array_equal(distribution.impostor,np.histogram(scores[~genuine],distribution.edges)[0])
+
+
+def test_fixed_distribution_counts_outliers_in_the_end_bins():
+    distribution = ScoreDistribution(4,0.0,4.0)
+    distribution.add(np.array([-1.0,0.5,3.5,9.0]),np.array([True,False,True,False]))
+    assert list(distribution.edges) == [0.0,1.0,2.0,3.0,4.0]
+    assert list(distribution.genuine) == [1,0,0,1]
+    assert list(distribution.impostor) == [1,0,0,1]
+
+
+class Stub(object):
+    ''' Call the service in place of a gRPC stub. '''
+
+    def __init__(self, service):
+        self.service = service
+
+    def matchDistribution(self, request, timeout):
+        return self.service.matchDistribution(request,Context())
+
+    def generateMatchDistribution(self, request):
+        return self.service.generateMatchDistribution(request,Context())
+
+
+def test_match_distribution_counts_every_pair(service, templates):
+    faces = makeFaces(templates,subjects=40)
+    faces[7].subject_id = ''
+    service.gallery_worker.addFacesToGallery('g',faces)
+    client = FaceClient.__new__(FaceClient)
+    client.service_stub = Stub(service)
+
+    messages = list(service.matchDistribution(fsd.MatchDistributionRequest(gallery_name='g',bins=30,include_scores=True),Context()))
+    assert all(message.ByteSize() <= service.max_message_size + 16 for message in messages)
+
+    distribution, dist_mat = client.matchDistribution('g',bins=30,include_scores=True)
+    _, _, subject_ids, gallery, _ = service.gallery_worker.galleryTemplates('g')
+    expected = spat.distance_matrix(gallery,gallery)
+    assert np.allclose(dist_mat,expected,atol=1e-2)
+
+    upper = np.triu_indices(len(gallery),1)
+    subject_ids = np.array(subject_ids,dtype=object)
+    genuine = (subject_ids[upper[0]] == subject_ids[upper[1]]) & (subject_ids[upper[0]] != '')
+    scores = dist_mat[upper]
+    edges = np.array(distribution.bin_edges)
+    assert distribution.face_count == len(gallery)
+    assert distribution.genuine_count == genuine.sum()
+    assert distribution.impostor_count == (~genuine).sum()
+    assert np.array_equal(distribution.genuine_histogram,np.histogram(scores[genuine],edges)[0])
+    assert np.array_equal(distribution.impostor_histogram,np.histogram(scores[~genuine],edges)[0])
+
+    # The unary call returns the same distance matrix
+    assert np.allclose(client.generateMatchDistribution('g'),dist_mat)
@@ -0,0 +1,43 @@
+'''
+Tests for the search RPC of the service.
+'''
+
+import numpy as np
+
+import faro.proto.face_service_pb2 as fsd
+
+from conftest import makeFaces, makeProbes, resultNames, Context
+
+
+def searchRequest(templates, max_results):
+    request = fsd.SearchRequest(search_gallery='g',max_results=max_results,threshold=np.inf)
+    request.probes.CopyFrom(makeProbes(templates))
+    return request
+
+
+def test_search_without_an_index(service, templates):
+    service.gallery_worker.addFacesToGallery('g',makeFaces(templates[:200]))
+    probes = templates[:200:40] + 0.01
+    results = service.search(searchRequest(probes,4),Context())
+
+    distances = ((probes[:,np.newaxis,:]-templates[np.newaxis,:200,:])**2).sum(axis=2)
+    for names, order in zip(resultNames(results),np.argsort(distances,axis=1)[:,:4]):
+        assert names == ['n%d'%i for i in order]
+
+
+def test_faces_deleted_during_a_search_are_skipped(service, templates, monkeypatch):
+    worker = service.gallery_worker
+    worker.addFacesToGallery('g',makeFaces(templates[:200]))
+    galleryTemplates = worker.galleryTemplates
+
+    # Delete a subject after the templates have been read
+    def deleteAfterRead(gallery_name, stamp=None):
+        result = galleryTemplates(gallery_name,stamp)
+        worker.subjectDelete(gallery_name,'s0')
+        return result
+    monkeypatch.setattr(worker,'galleryTemplates',deleteAfterRead)
+
+    results = service.search(searchRequest(templates[:1],5),Context())
+    # The faces that were matched but are gone are left out of the results
+    order = np.argsort(((templates[:1]-templates[:200])**2).sum(axis=1))[:5]
+    assert resultNames(results)[0] == ['n%d'%i for i in order if i%10 != 0]